@@ -3,11 +3,11 @@ from __future__ import annotations
 from asyncio import CancelledError, run
 from sys import argv
 
-from src.application import TikTokDownloader
-from src.application.main_desktop import run_desktop
-
 
 async def main_cli():
+    # 按运行模式导入依赖，命令行模式无需加载 WebUI 与桌面窗口相关模块
+    from src.application import TikTokDownloader
+
     async with TikTokDownloader() as downloader:
         try:
             await downloader.run()
@@ -18,8 +18,34 @@ async def main_cli():
             return
 
 
+async def main_headless(args) -> int:
+    from src.application import TikTokDownloader
+    from src.application.main_headless import EXIT_INTERRUPTED
+
+    async with TikTokDownloader(interactive=False) as downloader:
+        try:
+            return await downloader.headless(args)
+        except (
+                KeyboardInterrupt,
+                CancelledError,
+        ):
+            return EXIT_INTERRUPTED
+
+
 if __name__ == "__main__":
-    if "--cli" in argv:
+    if len(argv) > 1 and not argv[1].startswith("-"):
+        # 无交互命令行模式，先解析参数，参数错误时不会读取配置
+        from src.application.main_headless import parse_args
+
+        arguments = parse_args(argv[1:])
+        try:
+            code = run(main_headless(arguments))
+        except KeyboardInterrupt:
+            code = 130
+        raise SystemExit(code)
+    elif "--cli" in argv:
         run(main_cli())
     else:
+        from src.application.main_desktop import run_desktop
+
         run_desktop()
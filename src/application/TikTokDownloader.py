@@ -1,12 +1,10 @@
-from asyncio import CancelledError, run
-from threading import Event, Thread
-from time import sleep
+from asyncio import CancelledError, to_thread
+from typing import TYPE_CHECKING
 
 from httpx import RequestError, get
 
 from src.config import Parameter, Settings
 from src.custom import (
-    COOKIE_UPDATE_INTERVAL,
     DISCLAIMER_TEXT,
     DOCUMENTATION_URL,
     LICENCE,
@@ -24,6 +22,7 @@ from src.custom import (
     VERSION_PATCH,
     parse_release_version,
 )
+from src.downloader.resume import ResumeIndex
 from src.manager import Database, DownloadRecorder
 from src.module import Cookie, MigrateFolder
 from src.record import BaseLogger, LoggerManager
@@ -38,10 +37,8 @@ from src.tools import (
 )
 from src.translation import _, switch_language
 
-from .main_monitor import ClipboardMonitor
-from .main_server import APIServer
-from .main_terminal import TikTok
-from .main_webui import WebUIServer
+if TYPE_CHECKING:
+    from argparse import Namespace
 
 # from typing import Type
 # from webbrowser import open
@@ -60,17 +57,19 @@ class TikTokDownloader:
 
     def __init__(
         self,
+        interactive: bool = True,
     ):
         self.rename_compatible()
+        # 非交互模式的日志输出至标准错误，标准输出仅用于输出进度事件
         self.console = ColorfulConsole(
             debug=self.VERSION_BETA,
+            interactive=interactive,
+            stderr=not interactive,
         )
         self.logger = None
         self.recorder = None
         self.settings = Settings(PROJECT_ROOT, self.console)
-        self.event_cookie = Event()
         self.cookie = Cookie(self.settings, self.console)
-        self.params_task = None
         self.parameter = None
         self.running = True
         self.run_command = None
@@ -102,6 +101,8 @@ class TikTokDownloader:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.parameter:
+            await self.parameter.sessions.save()
         await self.database.__aexit__(exc_type, exc_val, exc_tb)
         if self.parameter:
             await self.parameter.close_client()
@@ -147,6 +148,8 @@ class TikTokDownloader:
         )
 
     async def server(self):
+        from .main_server import APIServer
+
         try:
             self.console.print(
                 _(
@@ -165,6 +168,8 @@ class TikTokDownloader:
             self.running = False
 
     async def webui(self):
+        from .main_webui import WebUIServer
+
         try:
             self.console.print(
                 _("访问 http://127.0.0.1:5555/ui 打开 Web UI 界面"),
@@ -316,6 +321,8 @@ class TikTokDownloader:
 
     async def complete(self):
         """终端交互模式"""
+        from .main_terminal import TikTok
+
         example = TikTok(
             self.parameter,
             self.database,
@@ -330,6 +337,8 @@ class TikTokDownloader:
         await self.monitor_clipboard()
 
     async def monitor_clipboard(self):
+        from .main_monitor import ClipboardMonitor
+
         example = ClipboardMonitor(
             self.parameter,
             self.database,
@@ -410,9 +419,11 @@ class TikTokDownloader:
             "删除作品下载记录成功！",
         )
 
-    async def check_settings(self, restart=True):
+    async def check_settings(self, restart=True, clean=True):
         if restart:
+            await self.parameter.sessions.save()
             await self.parameter.close_client()
+            self.parameter.logger.close()
         self.parameter = Parameter(
             self.settings,
             self.cookie,
@@ -423,12 +434,17 @@ class TikTokDownloader:
         )
         MigrateFolder(self.parameter).compatible()
         self.parameter.set_headers_cookie()
-        self.restart_cycle_task(
-            restart,
-        )
+        await self.parameter.sessions.load()
+        # 在当前事件循环中定期刷新凭据
+        self.parameter.credentials.start()
         # await self.parameter.update_params_offline()
         if not restart:
             self.run_command = self.parameter.run_command.copy()
+        if not restart and clean:
+            await ResumeIndex(
+                self.parameter.logger,
+                **self.parameter.cache_cleanup,
+            ).clean(self.parameter.cache, self.parameter.cache_tiktok)
         self.parameter.CLEANER.set_rule(TEXT_REPLACEMENT, True)
 
     async def run(self):
@@ -440,35 +456,59 @@ class TikTokDownloader:
         if await self.disclaimer():
             await self.main_menu(safe_pop(self.run_command))
 
-    def periodic_update_params(self):
-        async def inner():
-            while not self.event_cookie.is_set():
-                await self.parameter.update_params()
-                self.event_cookie.wait(COOKIE_UPDATE_INTERVAL)
+    async def headless(self, args: "Namespace") -> int:
+        """无交互命令行模式，返回程序退出码"""
+        from .main_headless import EXIT_CONFIG, Headless
 
-        run(
-            inner(),
+        self.check_config()
+        await self.check_settings(
+            False,
         )
+        if not self.config["Disclaimer"]:
+            if not args.accept_disclaimer:
+                self.console.print(_(DISCLAIMER_TEXT), style=MASTER)
+                self.console.error(
+                    _("请阅读免责声明，同意后添加 --accept-disclaimer 参数重新运行！")
+                )
+                return EXIT_CONFIG
+            await self.database.update_config_data("Disclaimer", 1)
+        if args.function == "serve":
+            return await self.cluster(args)
+        return await Headless(
+            self.parameter,
+            self.database,
+        ).run(args)
 
-    def restart_cycle_task(
-        self,
-        restart=True,
-    ):
-        if restart:
-            self.event_cookie.set()
-            while self.params_task.is_alive():
-                # print("等待子线程结束！")  # 调试代码
-                sleep(1)
-        self.params_task = Thread(target=self.periodic_update_params)
-        self.event_cookie.clear()
-        self.params_task.start()
+    async def cluster(self, args: "Namespace") -> int:
+        """多进程 Web API 模式，主进程仅管理子进程"""
+        from .main_cluster import Cluster
+        from .main_headless import EXIT_FAILED, EXIT_SUCCESS
+
+        cluster = Cluster(
+            self.console,
+            args.host,
+            args.port,
+            args.workers,
+            args.job_workers,
+            args.concurrency,
+        )
+        self.console.print(
+            _("访问 http://{host}:{port}/docs 可以查阅 API 模式说明文档！").format(
+                host=args.host, port=args.port
+            ),
+            highlight=True,
+        )
+        try:
+            return EXIT_SUCCESS if await to_thread(cluster.run) else EXIT_FAILED
+        finally:
+            cluster.stop()
 
     def close(self):
-        self.event_cookie.set()
         if self.parameter.folder_mode:
             remove_empty_directories(self.parameter.ROOT)
             remove_empty_directories(self.parameter.root)
         self.parameter.logger.info(_("正在关闭程序"))
+        self.parameter.logger.close()
 
     async def browser_cookie(
         self,
@@ -1,3 +1,17 @@
-from .TikTokDownloader import TikTokDownloader
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .TikTokDownloader import TikTokDownloader
 
 __all__ = ["TikTokDownloader"]
+
+
+def __getattr__(name: str):
+    # 延迟导入，导入子模块时无需加载完整的程序依赖
+    if name == "TikTokDownloader":
+        from .TikTokDownloader import TikTokDownloader
+
+        # 导入子模块时包属性会被设置为同名模块，需要替换为类
+        globals()[name] = TikTokDownloader
+        return TikTokDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
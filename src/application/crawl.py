@@ -0,0 +1,249 @@
+from asyncio import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Task,
+    create_task,
+    gather,
+    sleep,
+    wait,
+)
+from datetime import date
+from time import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from uuid import uuid4
+
+from ..manager import CrawlTask, DistributedRecorder
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..manager import QueueBackend
+    from .main_headless import Headless
+
+__all__ = ["Coordinator", "CrawlWorker"]
+
+
+class Coordinator:
+    """将账号、合集与搜索关键词拆分为独立的采集任务写入任务队列"""
+
+    KINDS = ("account", "mix", "search")
+
+    def __init__(self, queue: "QueueBackend"):
+        self.queue = queue
+
+    @staticmethod
+    def key(kind: str, platform: str, item: str) -> str:
+        return f"{kind}:{platform}:{item}"
+
+    async def submit(
+        self,
+        kind: str,
+        items: list[str],
+        platform: str = "douyin",
+        **options,
+    ) -> int:
+        """每个对象作为一个任务，返回新增或重新排队的任务数量"""
+        if kind not in self.KINDS:
+            raise ValueError(kind)
+        return await self.queue.put(
+            [
+                (
+                    self.key(kind, platform, i),
+                    kind,
+                    {"item": i, "platform": platform, **options},
+                )
+                for i in dict.fromkeys(items)
+            ]
+        )
+
+    async def wait(
+        self,
+        interval: float = 5,
+        callback: Callable[[dict[str, int]], None] = None,
+    ) -> dict[str, int]:
+        """等待全部任务结束，返回各状态任务数量"""
+        while True:
+            stats = await self.queue.stats()
+            if callback:
+                callback(stats)
+            if not any(stats.get(i) for i in ("queued", "leased", "expired")):
+                return stats
+            await sleep(interval)
+
+
+class CrawlWorker:
+    """从任务队列领取采集任务并执行，执行期间定期发送心跳延长租约；
+    租约失效时停止执行，任务由其他工作节点重新领取"""
+
+    def __init__(
+        self,
+        handler: "Headless",
+        queue: "QueueBackend",
+        concurrency: int = 1,
+        cookie: str = None,
+        proxy: str = None,
+        interval: float = 5,
+    ):
+        self.handler = handler
+        self.queue = queue
+        self.concurrency = max(concurrency, 1)  # 同时执行的任务数量
+        self.cookie = cookie
+        self.proxy = proxy
+        self.interval = interval  # 没有可执行任务时查询队列的间隔，单位秒
+        self.id = uuid4().hex
+        self.lost: set[str] = set()  # 租约已失效的任务
+        self.handlers: dict[str, Callable[[CrawlTask], Awaitable[Any]]] = {
+            "account": self.account,
+            "mix": self.mix,
+            "search": self.search,
+        }
+        # 下载作品前检查其他工作节点是否已下载或正在下载
+        self.recorder = DistributedRecorder(
+            handler.downloader.recorder,
+            queue,
+            self.id,
+        )
+        handler.downloader.recorder = self.recorder
+
+    async def run(self, exit_when_empty=False) -> None:
+        running: set[Task] = set()
+        try:
+            while True:
+                if len(running) < self.concurrency and (
+                    task := await self.queue.lease(self.id)
+                ):
+                    running.add(create_task(self.execute(task)))
+                    continue
+                if not running:
+                    if exit_when_empty:
+                        return
+                    await sleep(self.interval)
+                    continue
+                done, running = await wait(
+                    running,
+                    timeout=self.interval,
+                    return_when=FIRST_COMPLETED,
+                )
+                for i in done:
+                    if not i.cancelled() and (error := i.exception()):
+                        self.handler.logger.error(
+                            _("更新采集任务状态失败：{error}").format(error=repr(error))
+                        )
+        finally:
+            for task in running:
+                task.cancel()
+            await gather(*running, return_exceptions=True)
+
+    async def execute(self, task: CrawlTask) -> None:
+        event = {"id": task.id, "kind": task.kind, "attempt": task.attempts}
+        self.handler.emit({"type": "task.start", **event})
+        start = time()
+        handle = create_task(self.handlers[task.kind](task))
+        heartbeat = create_task(self.heartbeat(task, handle))
+        try:
+            result = await handle
+        except CancelledError:
+            if task.id not in self.lost:
+                # 工作节点退出时任务立即重新排队
+                await self.queue.fail(task, "cancelled")
+                raise
+            self.lost.discard(task.id)
+            self.handler.emit({"type": "task.lost", **event})
+            return
+        except Exception as e:
+            self.handler.logger.error(
+                _("执行采集任务 {id} 发生错误：{error}").format(
+                    id=task.id, error=repr(e)
+                )
+            )
+            result, event["error"] = None, repr(e)
+        finally:
+            heartbeat.cancel()
+        if result is not None:
+            await self.queue.complete(task, result)
+            self.handler.count.success += 1
+        else:
+            await self.queue.fail(task, event.get("error") or "no data")
+            self.handler.count.failed += 1
+        self.handler.emit(
+            {
+                "type": "task.done",
+                **event,
+                "ok": result is not None,
+                "elapsed": round(time() - start, 3),
+            }
+        )
+
+    async def heartbeat(self, task: CrawlTask, handle: Task) -> None:
+        while True:
+            await sleep(self.queue.timeout / 3)
+            await self.recorder.renew()
+            if not await self.queue.heartbeat(task):
+                self.handler.logger.warning(
+                    _("采集任务 {id} 租约已失效，停止执行").format(id=task.id)
+                )
+                self.lost.add(task.id)
+                handle.cancel()
+                return
+
+    @staticmethod
+    def summarize(result) -> dict[str, Any]:
+        return {"count": len(result) if isinstance(result, list) else 0}
+
+    async def account(self, task: CrawlTask) -> dict[str, Any] | None:
+        payload, checkpoint = task.payload, task.checkpoint
+        tiktok = payload["platform"] == "tiktok"
+        if not (
+            sec_user_id := checkpoint.get("sec_user_id")
+            or await self.handler.check_sec_user_id(payload["item"], tiktok)
+        ):
+            raise ValueError(_("提取 sec_user_id 失败"))
+        await self.queue.checkpoint(task, checkpoint | {"sec_user_id": sec_user_id})
+        # 检查点记录上次成功采集的日期，重新提交的任务仅采集新发布的作品
+        earliest = checkpoint.get("earliest") or payload.get("earliest", "")
+        today = date.today().strftime("%Y/%m/%d")
+        result = await self.handler.deal_account_detail(
+            0,
+            sec_user_id,
+            mark=payload.get("mark", ""),
+            tab=payload.get("tab", "post"),
+            earliest=earliest,
+            latest=payload.get("latest", ""),
+            pages=payload.get("pages"),
+            cookie=self.cookie,
+            proxy=self.proxy,
+            tiktok=tiktok,
+        )
+        if not result and "earliest" not in checkpoint:
+            return None
+        await self.queue.checkpoint(task, task.checkpoint | {"earliest": today})
+        return {"sec_user_id": sec_user_id, **self.summarize(result)}
+
+    async def mix(self, task: CrawlTask) -> dict[str, Any] | None:
+        payload = task.payload
+        tiktok = payload["platform"] == "tiktok"
+        mix_id, id_, title = await self.handler._check_mix_id(payload["item"], tiktok)
+        if not id_:
+            raise ValueError(_("提取合集 ID 失败"))
+        if result := await self.handler.deal_mix_detail(
+            mix_id,
+            id_,
+            payload.get("mark", ""),
+            cookie=self.cookie,
+            proxy=self.proxy,
+            tiktok=tiktok,
+            mix_title=title,
+        ):
+            return self.summarize(result)
+        return None
+
+    async def search(self, task: CrawlTask) -> dict[str, Any] | None:
+        options = dict(task.payload)
+        keyword, __ = options.pop("item"), options.pop("platform")
+        if isinstance(
+            model := self.handler.generate_model(keyword=keyword, **options),
+            str,
+        ):
+            raise ValueError(model)
+        if result := await self.handler.deal_search_data(model):
+            return self.summarize(result)
+        return None
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    Event,
+    Queue,
+    Task,
+    create_task,
+    gather,
+    sleep,
+    wait_for,
+)
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from uuid import uuid4
+
+from ..tools import BANDWIDTH, BANDWIDTH_TASK, json_dumps, json_loads
+from ..tools.progress import PROGRESS_FACTORY, EventProgress
+
+if TYPE_CHECKING:
+    from ..manager import Database
+
+__all__ = ["Job", "JobManager", "JobQueue", "JobWorker"]
+
+
+@dataclass(slots=True)
+class Job:
+    """API 下载任务，记录任务状态、文件下载进度与事件"""
+
+    id: str
+    status: str = "queued"
+    created_at: float = field(default_factory=time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    meta: dict[str, Any] = field(default_factory=dict)
+    files: dict[str, dict[str, Any]] = field(default_factory=dict)
+    events: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=1000))
+    subscribers: set[Queue[dict[str, Any]]] = field(default_factory=set)
+    changed: Event = field(default_factory=Event)
+    sequence: int = 0
+    task: Task | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"success", "error", "cancelled"}
+
+    def snapshot(self, files=True) -> dict[str, Any]:
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "meta": self.meta,
+            "sequence": self.sequence,
+        }
+        if files:
+            data["files"] = list(self.files.values())
+        return data
+
+    def since(self, sequence: int) -> list[dict[str, Any]]:
+        return [i for i in self.events if i["seq"] > sequence]
+
+    def emit(self, event: dict[str, Any]) -> None:
+        self.sequence += 1
+        event = {"seq": self.sequence, "ts": time(), **event}
+        self.update_file(event)
+        self.events.append(event)
+        # 订阅队列不限制长度，推送客户端使用 since 按序号读取事件
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+        # 唤醒全部长轮询请求
+        self.changed.set()
+        self.changed = Event()
+
+    def update_file(self, event: dict[str, Any]) -> None:
+        match event["type"]:
+            case "progress.add":
+                self.files[event["task_id"]] = {
+                    "id": event["task_id"],
+                    "description": event["description"],
+                    "total": event["total"],
+                    "completed": event["completed"],
+                    "status": "downloading",
+                }
+            case "progress.update" if file := self.files.get(event["task_id"]):
+                for key in ("description", "total", "completed"):
+                    file[key] = event[key]
+            case "progress.remove" if file := self.files.get(event["task_id"]):
+                file["status"] = "finished"
+
+    def progress(self) -> EventProgress:
+        return EventProgress(
+            self.emit,
+            throttle_ms=200,
+            id_prefix=f"{uuid4().hex}:",
+        )
+
+    async def wait(self, sequence: int, timeout: float) -> list[dict[str, Any]]:
+        """长轮询，等待序号大于 sequence 的事件，超时返回空列表"""
+        if not (events := self.since(sequence)) and not self.finished:
+            try:
+                await wait_for(self.changed.wait(), timeout)
+            except TimeoutError:
+                return []
+            events = self.since(sequence)
+        return events
+
+
+class JobManager:
+    """管理 API 下载任务；任务并发执行，文件下载共用下载器的并发限制"""
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs  # 保留的已结束任务数量
+        self.jobs: dict[str, Job] = {}
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def list(self) -> list[dict[str, Any]]:
+        return [i.snapshot(False) for i in reversed(self.jobs.values())]
+
+    def create(self, meta: dict[str, Any] = None) -> Job:
+        self.prune()
+        job = Job(id=uuid4().hex, meta=meta or {})
+        self.jobs[job.id] = job
+        job.emit({"type": "job.created"})
+        return job
+
+    def prune(self) -> None:
+        finished = [i for i in self.jobs.values() if i.finished]
+        for job in finished[: max(len(finished) - self.max_jobs + 1, 0)]:
+            del self.jobs[job.id]
+
+    def run(
+        self,
+        job: Job,
+        function: Callable[[Job], Awaitable],
+    ) -> None:
+        async def runner():
+            # 下载协程继承任务 ID 与进度条，多个任务同时下载互不干扰
+            BANDWIDTH_TASK.set(job.id)
+            PROGRESS_FACTORY.set(job.progress)
+            job.status = "running"
+            job.started_at = time()
+            job.emit({"type": "job.started"})
+            try:
+                await function(job)
+                job.status = "success"
+            except CancelledError:
+                job.status = "cancelled"
+            except Exception as e:
+                job.status = "error"
+                job.error = repr(e)
+            finally:
+                BANDWIDTH.update(tasks={job.id: 0})
+                job.finished_at = time()
+                job.emit({"type": "job.finished", "status": job.status})
+
+        job.task = create_task(runner())
+
+    def cancel(self, job_id: str) -> bool:
+        if not (job := self.get(job_id)) or job.finished or not job.task:
+            return False
+        job.task.cancel()
+        return True
+
+
+class JobQueue:
+    """基于数据库的下载任务队列，多个进程共享任务状态与事件
+
+    任务进程以租约形式领取任务，租约过期的任务由其他进程重新领取"""
+
+    def __init__(
+        self,
+        database: "Database",
+        max_jobs: int = 100,
+        interval: float = 0.5,
+        timeout: float = 60,
+        attempts: int = 3,
+    ):
+        self.database = database
+        self.max_jobs = max_jobs  # 保留的已结束任务数量
+        self.interval = interval  # 等待新事件时查询数据库的间隔，单位秒
+        self.timeout = timeout  # 租约有效时间，单位秒
+        self.attempts = attempts  # 任务最大执行次数
+
+    @staticmethod
+    def __job(row) -> Job:
+        return Job(
+            id=row["ID"],
+            status=row["STATUS"],
+            created_at=row["CREATED"],
+            started_at=row["STARTED"],
+            finished_at=row["FINISHED"],
+            error=row["ERROR"],
+            meta=json_loads(row["META"]),
+            files={i["id"]: i for i in json_loads(row["FILES"])},
+            sequence=row["SEQUENCE"],
+        )
+
+    async def create(self, meta: dict[str, Any], payload: dict[str, Any]) -> Job:
+        await self.prune()
+        job = Job(id=uuid4().hex, meta=meta or {})
+        job.emit({"type": "job.created"})
+        await self.database.create_job_data(
+            (
+                job.id,
+                job.status,
+                json_dumps(payload),
+                json_dumps(job.meta),
+                "[]",
+                job.sequence,
+                job.created_at,
+            ),
+            (job.id, job.sequence, json_dumps(job.events[-1])),
+        )
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        if row := await self.database.read_job_data(job_id):
+            return self.__job(row)
+        return None
+
+    async def list(self) -> list[dict[str, Any]]:
+        return [
+            self.__job(i).snapshot(False)
+            for i in await self.database.read_all_job_data()
+        ]
+
+    async def since(self, job_id: str, sequence: int) -> list[dict[str, Any]]:
+        return [
+            json_loads(i["DATA"])
+            for i in await self.database.read_job_event(job_id, sequence)
+        ]
+
+    async def wait(
+        self,
+        job_id: str,
+        sequence: int,
+        timeout: float,
+    ) -> list[dict[str, Any]]:
+        """长轮询，定期查询序号大于 sequence 的事件，超时返回空列表"""
+        deadline = monotonic() + timeout
+        while not (events := await self.since(job_id, sequence)):
+            if not (job := await self.get(job_id)) or job.finished:
+                break
+            if (remaining := deadline - monotonic()) <= 0:
+                break
+            await sleep(min(self.interval, remaining))
+        return events
+
+    async def cancel(self, job_id: str) -> bool:
+        return await self.database.cancel_job_data(job_id, time())
+
+    async def cancelled(self, job_id: str) -> bool:
+        return bool(
+            (row := await self.database.read_job_data(job_id)) and row["CANCEL"]
+        )
+
+    async def claim(self, worker: str) -> tuple[Job, dict[str, Any]] | None:
+        now = time()
+        if row := await self.database.claim_job_data(
+            worker,
+            now,
+            now + self.timeout,
+            self.attempts,
+        ):
+            return self.__job(row), json_loads(row["PAYLOAD"])
+        return None
+
+    async def renew(self, job_id: str, worker: str) -> bool:
+        """延长租约，租约已失效时返回 False"""
+        return await self.database.renew_job_data(job_id, worker, time() + self.timeout)
+
+    async def save(self, job: Job, events: list[dict[str, Any]]) -> None:
+        await self.database.update_job_data(
+            (
+                job.status,
+                json_dumps(job.meta),
+                json_dumps(list(job.files.values())),
+                job.error,
+                job.sequence,
+                job.started_at,
+                job.finished_at,
+                job.id,
+            ),
+            [(job.id, i["seq"], json_dumps(i)) for i in events],
+        )
+
+    async def prune(self) -> None:
+        finished = [
+            i["ID"]
+            for i in await self.database.read_all_job_data()
+            if i["STATUS"] in {"success", "error", "cancelled"}
+        ]
+        if expired := finished[self.max_jobs - 1 :]:
+            await self.database.delete_job_data(expired)
+
+
+class JobWorker:
+    """从任务队列领取下载任务并执行，定期保存任务状态与事件，响应其他进程的取消请求"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        function: Callable[[Job, dict[str, Any]], Awaitable],
+        concurrency: int = 1,
+        interval: float = 0.5,
+    ):
+        self.queue = queue
+        self.function = function
+        self.concurrency = max(concurrency, 1)  # 同时执行的任务数量
+        self.interval = interval
+        self.id = uuid4().hex
+        self.manager = JobManager()
+        self.events: dict[str, Queue[dict[str, Any]]] = {}
+        self.renewed = 0.0  # 上次延长租约的时间
+
+    async def run(self) -> None:
+        while True:
+            await self.flush()
+            if len(self.events) < self.concurrency and (
+                claimed := await self.queue.claim(self.id)
+            ):
+                self.start(*claimed)
+                continue
+            await sleep(self.interval)
+
+    def start(self, job: Job, payload: dict[str, Any]) -> None:
+        job.subscribers.add(events := Queue())
+        self.events[job.id] = events
+        self.manager.jobs[job.id] = job
+        self.manager.run(job, lambda i: self.function(i, payload))
+
+    async def flush(self) -> None:
+        if renew := monotonic() - self.renewed >= self.queue.timeout / 3:
+            self.renewed = monotonic()
+        for id_, events in list(self.events.items()):
+            job = self.manager.jobs[id_]
+            if renew and not job.finished and not await self.queue.renew(id_, self.id):
+                # 租约已失效，任务已由其他进程领取，停止执行且不再保存状态
+                self.manager.cancel(id_)
+                del self.events[id_]
+                del self.manager.jobs[id_]
+                continue
+            data = [events.get_nowait() for __ in range(events.qsize())]
+            if data:
+                await self.queue.save(job, data)
+            if job.finished:
+                del self.events[id_]
+                del self.manager.jobs[id_]
+            elif await self.queue.cancelled(id_):
+                self.manager.cancel(id_)
+
+    async def close(self) -> None:
+        tasks = [i.task for i in self.manager.jobs.values() if i.task]
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        await self.flush()
@@ -0,0 +1,172 @@
+from asyncio import run
+from multiprocessing import get_context
+from signal import SIGTERM, default_int_handler, signal
+from socket import AF_INET, AF_INET6, SO_REUSEADDR, SOL_SOCKET, socket
+from threading import Event
+from time import monotonic
+from typing import TYPE_CHECKING, Callable
+
+from ..custom import SERVER_HOST, SERVER_PORT
+from ..translation import _
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from ..tools import ColorfulConsole
+    from .TikTokDownloader import TikTokDownloader
+
+__all__ = ["Cluster"]
+
+
+async def prepare(downloader: "TikTokDownloader"):
+    """读取配置并共享限速与会话状态，缓存清理仅由主进程执行"""
+    from ..manager import SharedState
+
+    downloader.check_config()
+    await downloader.check_settings(False, clean=False)
+    parameter = downloader.parameter
+    state = SharedState(downloader.database, parameter.sessions, parameter.logger)
+    state.share()
+    state.start()
+    return parameter, state
+
+
+async def serve_http(sockets: list[socket], host: str, port: int) -> None:
+    from .jobs import JobQueue
+    from .main_server import APIServer
+    from .TikTokDownloader import TikTokDownloader
+
+    async with TikTokDownloader(interactive=False) as downloader:
+        parameter, state = await prepare(downloader)
+        try:
+            await APIServer(
+                parameter,
+                downloader.database,
+                queue=JobQueue(downloader.database),
+            ).run_server(host, port, sockets=sockets)
+        finally:
+            await state.close()
+
+
+async def serve_jobs(concurrency: int) -> None:
+    from ..models import DownloadJob
+    from .jobs import JobQueue, JobWorker
+    from .main_server import APIServer
+    from .TikTokDownloader import TikTokDownloader
+
+    async with TikTokDownloader(interactive=False) as downloader:
+        parameter, state = await prepare(downloader)
+        server = APIServer(parameter, downloader.database)
+        worker = JobWorker(
+            JobQueue(downloader.database),
+            lambda job, payload: server.run_download_job(job, DownloadJob(**payload)),
+            concurrency,
+        )
+        try:
+            await worker.run()
+        finally:
+            await worker.close()
+            await state.close()
+
+
+def http_worker(sockets: list[socket], host: str, port: int) -> None:
+    # 主进程结束子进程时执行清理操作
+    signal(SIGTERM, default_int_handler)
+    try:
+        run(serve_http(sockets, host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+def job_worker(concurrency: int) -> None:
+    signal(SIGTERM, default_int_handler)
+    try:
+        run(serve_jobs(concurrency))
+    except KeyboardInterrupt:
+        pass
+
+
+class Cluster:
+    """多进程部署，HTTP 进程共用监听端口处理请求并提交下载任务，任务进程从共享任务队列领取任务执行"""
+
+    STARTUP = 5  # 进程启动后在该时间内退出视为启动失败，单位秒
+
+    def __init__(
+        self,
+        console: "ColorfulConsole",
+        host: str = SERVER_HOST,
+        port: int = SERVER_PORT,
+        workers: int = 2,
+        job_workers: int = 1,
+        concurrency: int = 1,
+    ):
+        self.console = console
+        self.host = host
+        self.port = port
+        self.workers = max(workers, 1)  # HTTP 进程数量
+        self.job_workers = max(job_workers, 1)  # 任务进程数量
+        self.concurrency = max(concurrency, 1)  # 每个任务进程同时执行的任务数量
+        # 使用 spawn 方式创建进程，与 Windows 平台行为一致
+        self.context = get_context("spawn")
+        self.processes: list[tuple[Callable, tuple, "BaseProcess", float]] = []
+        self.stopped = Event()
+
+    def bind(self) -> socket:
+        sock = socket(AF_INET6 if ":" in self.host else AF_INET)
+        sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.set_inheritable(True)
+        return sock
+
+    def spawn(self, target: Callable, args: tuple):
+        process = self.context.Process(target=target, args=args)
+        process.start()
+        return target, args, process, monotonic()
+
+    def run(self) -> bool:
+        """启动全部进程，进程异常退出时重新启动，调用 stop 后结束全部进程；进程启动失败时返回 False"""
+        sockets = [self.bind()]
+        targets = [(http_worker, (sockets, self.host, self.port))] * self.workers
+        targets += [(job_worker, (self.concurrency,))] * self.job_workers
+        self.processes = [self.spawn(i, j) for i, j in targets]
+        self.console.info(
+            _("已启动 {workers} 个 HTTP 进程与 {jobs} 个任务进程").format(
+                workers=self.workers, jobs=self.job_workers
+            )
+        )
+        try:
+            while not self.stopped.wait(1):
+                for index, (target, args, process, started) in enumerate(
+                    self.processes
+                ):
+                    if process.is_alive():
+                        continue
+                    # 启动后立即退出通常代表配置错误，重新启动无法恢复
+                    if monotonic() - started < self.STARTUP:
+                        self.console.error(
+                            _("进程 {pid} 启动失败，退出码 {code}").format(
+                                pid=process.pid, code=process.exitcode
+                            )
+                        )
+                        return False
+                    self.console.warning(
+                        _("进程 {pid} 已退出，退出码 {code}，正在重新启动").format(
+                            pid=process.pid, code=process.exitcode
+                        )
+                    )
+                    self.processes[index] = self.spawn(target, args)
+            return True
+        finally:
+            self.terminate()
+            for sock in sockets:
+                sock.close()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def terminate(self) -> None:
+        for __, __, process, __ in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for __, __, process, __ in self.processes:
+            process.join()
@@ -0,0 +1,571 @@
+from argparse import ArgumentParser, Namespace
+from asyncio import CancelledError, Semaphore, gather
+from contextlib import asynccontextmanager
+from datetime import date
+from pathlib import Path
+from sys import stdout
+from time import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, TextIO
+from uuid import uuid4
+
+from ..custom import SERVER_HOST, SERVER_PORT
+from ..interface import API, Detail, DetailTikTok
+from ..tools import json_dumps
+from ..tools.progress import PROGRESS_FACTORY, EventProgress
+from ..translation import _
+from .main_terminal import TikTok
+
+if TYPE_CHECKING:
+    from ..config import Parameter
+    from ..manager import Database, SQLiteQueue
+
+__all__ = [
+    "Headless",
+    "parse_args",
+    "EXIT_SUCCESS",
+    "EXIT_PARTIAL",
+    "EXIT_USAGE",
+    "EXIT_FAILED",
+    "EXIT_CONFIG",
+    "EXIT_INTERRUPTED",
+]
+
+EXIT_SUCCESS = 0  # 全部处理成功
+EXIT_PARTIAL = 1  # 部分处理失败，或者校验发现损坏文件
+EXIT_USAGE = 2  # 命令参数错误
+EXIT_FAILED = 3  # 全部处理失败
+EXIT_CONFIG = 4  # 未同意免责声明或缺少必要配置
+EXIT_INTERRUPTED = 130  # 用户中断
+
+
+def parser() -> ArgumentParser:
+    common = ArgumentParser(add_help=False)
+    common.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=_("同时处理的对象数量"),
+    )
+    common.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help=_("每分钟请求次数上限，0 代表不限制"),
+    )
+    common.add_argument("--cookie", default=None, help=_("本次运行使用的 Cookie"))
+    common.add_argument("--proxy", default=None, help=_("本次运行使用的代理"))
+    common.add_argument(
+        "--accept-disclaimer",
+        action="store_true",
+        help=_("同意免责声明，首次运行时必须提供"),
+    )
+    source = ArgumentParser(add_help=False)
+    source.add_argument("items", nargs="*", help=_("链接或 ID"))
+    source.add_argument("--file", type=Path, help=_("读取链接或 ID 的文本文档"))
+    platform = ArgumentParser(add_help=False)
+    platform.add_argument(
+        "--platform",
+        choices=("douyin", "tiktok"),
+        default="douyin",
+    )
+
+    root = ArgumentParser(
+        prog="main.py",
+        description=_("无交互命令行模式，进度事件以 JSON Lines 格式输出至标准输出"),
+    )
+    commands = root.add_subparsers(dest="command", required=True)
+    download = commands.add_parser("download", help=_("下载作品"))
+    targets = download.add_subparsers(dest="target", required=True)
+
+    accounts = targets.add_parser(
+        "accounts",
+        parents=[common, source, platform],
+        help=_("批量下载账号作品，未提供链接时下载配置文件中的账号"),
+    )
+    accounts.add_argument(
+        "--tab",
+        choices=("post", "favorite", "collection"),
+        default="post",
+    )
+    accounts.add_argument("--mark", default="")
+    accounts.add_argument("--earliest", default="", help=_("作品最早发布日期"))
+    accounts.add_argument("--latest", default="", help=_("作品最晚发布日期"))
+    accounts.add_argument("--pages", type=int, default=None)
+    accounts.add_argument(
+        "--incremental",
+        action="store_true",
+        help=_("仅下载上次成功运行之后发布的作品"),
+    )
+    accounts.set_defaults(function="download_accounts")
+
+    ids = targets.add_parser(
+        "ids",
+        parents=[common, source, platform],
+        help=_("批量下载链接作品"),
+    )
+    ids.add_argument(
+        "--incremental",
+        action="store_true",
+        help=_("跳过存在下载记录的作品"),
+    )
+    ids.set_defaults(function="download_ids")
+
+    comments = commands.add_parser(
+        "comments",
+        parents=[common, source],
+        help=_("采集作品评论数据 (抖音)"),
+    )
+    comments.set_defaults(function="comments", platform="douyin")
+
+    criteria = ArgumentParser(add_help=False)
+    criteria.add_argument("keywords", nargs="+", help=_("搜索关键词"))
+    criteria.add_argument("--channel", type=int, choices=range(4), default=0)
+    criteria.add_argument("--pages", type=int, default=1)
+    criteria.add_argument("--sort-type", type=int, default=0)
+    criteria.add_argument("--publish-time", type=int, default=0)
+    criteria.add_argument("--duration", type=int, default=0)
+    criteria.add_argument("--search-range", type=int, default=0)
+    criteria.add_argument("--content-type", type=int, default=0)
+    criteria.add_argument("--user-fans", type=int, default=0)
+    criteria.add_argument("--user-type", type=int, default=0)
+    search = commands.add_parser(
+        "search",
+        parents=[common, criteria],
+        help=_("采集搜索结果数据 (抖音)"),
+    )
+    search.set_defaults(function="search", platform="douyin")
+
+    verify = commands.add_parser(
+        "verify",
+        parents=[common],
+        help=_("校验作品库文件完整性"),
+    )
+    verify.set_defaults(function="verify")
+
+    serve = commands.add_parser(
+        "serve",
+        help=_("多进程 Web API 模式"),
+    )
+    serve.add_argument("--host", default=SERVER_HOST)
+    serve.add_argument("--port", type=int, default=SERVER_PORT)
+    serve.add_argument("--workers", type=int, default=2, help=_("HTTP 进程数量"))
+    serve.add_argument(
+        "--job-workers",
+        type=int,
+        default=1,
+        help=_("执行下载任务的进程数量"),
+    )
+    serve.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=_("每个任务进程同时执行的下载任务数量"),
+    )
+    serve.add_argument(
+        "--accept-disclaimer",
+        action="store_true",
+        help=_("同意免责声明，首次运行时必须提供"),
+    )
+    serve.set_defaults(function="serve")
+
+    queue = ArgumentParser(add_help=False)
+    queue.add_argument(
+        "--queue",
+        type=Path,
+        default=None,
+        help=_("任务队列数据库文件路径，默认使用程序数据库"),
+    )
+    queue.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=300,
+        help=_("任务租约有效时间，单位秒"),
+    )
+    queue.add_argument("--attempts", type=int, default=3, help=_("任务最大执行次数"))
+    crawl = commands.add_parser("crawl", help=_("分布式采集"))
+    roles = crawl.add_subparsers(dest="role", required=True)
+    submit = roles.add_parser("submit", help=_("拆分采集任务并写入任务队列"))
+    kinds = submit.add_subparsers(dest="target", required=True)
+    crawl_accounts = kinds.add_parser(
+        "accounts",
+        parents=[common, queue, source, platform],
+    )
+    crawl_accounts.add_argument(
+        "--tab",
+        choices=("post", "favorite", "collection"),
+        default="post",
+    )
+    crawl_accounts.add_argument("--mark", default="")
+    crawl_accounts.add_argument("--earliest", default="")
+    crawl_accounts.add_argument("--latest", default="")
+    crawl_accounts.add_argument("--pages", type=int, default=None)
+    crawl_accounts.set_defaults(function="crawl_submit", kind="account")
+    crawl_mixes = kinds.add_parser(
+        "mixes",
+        parents=[common, queue, source, platform],
+    )
+    crawl_mixes.add_argument("--mark", default="")
+    crawl_mixes.set_defaults(function="crawl_submit", kind="mix")
+    crawl_search = kinds.add_parser("search", parents=[common, queue, criteria])
+    crawl_search.set_defaults(function="crawl_submit", kind="search", platform="douyin")
+    worker = roles.add_parser(
+        "worker",
+        parents=[common, queue],
+        help=_("从任务队列领取并执行采集任务"),
+    )
+    worker.add_argument(
+        "--exit-when-empty",
+        action="store_true",
+        help=_("任务队列没有可执行的任务时退出"),
+    )
+    worker.set_defaults(function="crawl_worker")
+    status = roles.add_parser(
+        "status",
+        parents=[common, queue],
+        help=_("查询任务队列状态"),
+    )
+    status.add_argument("--wait", action="store_true", help=_("等待全部任务结束"))
+    status.add_argument(
+        "--purge",
+        action="store_true",
+        help=_("删除已结束的任务与作品去重记录"),
+    )
+    status.set_defaults(function="crawl_status")
+    return root
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    """命令参数错误时输出用法说明并以退出码 2 结束程序"""
+    return parser().parse_args(argv)
+
+
+class Headless(TikTok):
+    """无交互命令行模式，复用终端交互模式的处理方法，进度事件输出至标准输出"""
+
+    def __init__(
+        self,
+        parameter: "Parameter",
+        database: "Database",
+        output: TextIO = stdout,
+    ):
+        super().__init__(parameter, database, server_mode=True)
+        self.output = output
+        self.count = SimpleNamespace(
+            success=0,
+            failed=0,
+            skipped=0,
+            downloaded=0,
+            download_failed=0,
+        )
+
+    def emit(self, event: dict[str, Any]) -> None:
+        self.output.write(json_dumps({"ts": time(), **event}) + "\n")
+        self.output.flush()
+
+    def progress(self) -> EventProgress:
+        return EventProgress(
+            self.emit,
+            throttle_ms=1000,
+            id_prefix=f"{uuid4().hex}:",
+        )
+
+    async def run(self, args: Namespace) -> int:
+        API.limiter.set_rate(max(args.rate, 0) / 60)
+        # 文件下载进度以事件形式输出
+        PROGRESS_FACTORY.set(self.progress)
+        start = time()
+        self.emit({"type": "start", "command": args.function})
+        try:
+            code = await getattr(self, args.function)(args)
+        except (KeyboardInterrupt, CancelledError):
+            code = EXIT_INTERRUPTED
+        except Exception as e:
+            self.logger.error(_("运行命令发生错误：{error}").format(error=repr(e)))
+            self.emit({"type": "error", "message": repr(e)})
+            code = EXIT_FAILED
+        self.emit(
+            {
+                "type": "summary",
+                **vars(self.count),
+                "elapsed": round(time() - start, 3),
+                "exit_code": code,
+            }
+        )
+        return code
+
+    def exit_code(self) -> int:
+        """对象处理成功但全部文件下载失败时同样视为失败"""
+        files = self.downloader.files
+        self.count.downloaded, self.count.download_failed = (
+            files.succeeded,
+            files.failed,
+        )
+        success = self.count.success and (files.succeeded or not files.failed)
+        if not (self.count.failed or files.failed):
+            return EXIT_SUCCESS if success or self.count.skipped else EXIT_FAILED
+        return EXIT_PARTIAL if success else EXIT_FAILED
+
+    def read_items(self, args: Namespace) -> list[str]:
+        items = list(args.items)
+        if args.file:
+            items.extend(args.file.read_text(encoding=self.ENCODE).split())
+        return items
+
+    async def process(
+        self,
+        items: list,
+        function: Callable[[Any], Awaitable[Any]],
+        concurrency: int,
+        key: Callable[[Any], str] = str,
+    ) -> None:
+        """并发处理对象，每个对象开始与结束时输出事件"""
+        semaphore = Semaphore(max(concurrency, 1))
+
+        async def inner(index: int, item):
+            async with semaphore:
+                event = {"index": index, "id": key(item)}
+                self.emit({"type": "item.start", **event})
+                try:
+                    result = await function(item)
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.error(
+                        _("处理 {id} 发生错误：{error}").format(
+                            id=event["id"], error=repr(e)
+                        )
+                    )
+                    result, event["error"] = None, repr(e)
+                if isinstance(result, list):
+                    event["count"] = len(result)
+                if result:
+                    self.count.success += 1
+                else:
+                    self.count.failed += 1
+                self.emit({"type": "item.done", **event, "ok": bool(result)})
+
+        await gather(*(inner(i, j) for i, j in enumerate(items, start=1)))
+
+    def missing_input(self) -> int:
+        self.emit({"type": "error", "message": _("未提供链接或 ID")})
+        return EXIT_USAGE
+
+    def missing_storage_format(self) -> int:
+        self.emit(
+            {
+                "type": "error",
+                "message": _(
+                    "未设置 storage_format 参数，无法正常使用该功能，详细说明请查阅项目文档！"
+                ),
+            }
+        )
+        return EXIT_CONFIG
+
+    async def download_accounts(self, args: Namespace) -> int:
+        tiktok = args.platform == "tiktok"
+        if items := self.read_items(args):
+            accounts = [
+                SimpleNamespace(
+                    url=i,
+                    mark=args.mark,
+                    tab=args.tab,
+                    earliest=args.earliest,
+                    latest=args.latest,
+                    pages=args.pages,
+                )
+                for i in items
+            ]
+        elif not (accounts := self.accounts_tiktok if tiktok else self.accounts):
+            return self.missing_input()
+        today = date.today().strftime("%Y/%m/%d")
+
+        async def handle(data: SimpleNamespace):
+            if not (sec_user_id := await self.check_sec_user_id(data.url, tiktok)):
+                raise ValueError(_("提取 sec_user_id 失败"))
+            account = vars(data) | {"sec_user_id": sec_user_id}
+            key = f"{args.platform}:{account.get('tab', 'post')}:{sec_user_id}"
+            if args.incremental and (
+                checkpoint := await self.database.read_checkpoint_data(key)
+            ):
+                account["earliest"] = checkpoint
+            else:
+                checkpoint = ""
+            if result := await self.deal_account_detail(
+                0,
+                **account,
+                cookie=args.cookie,
+                proxy=args.proxy,
+                tiktok=tiktok,
+            ):
+                await self.database.update_checkpoint_data(key, today)
+            # 增量模式下没有新作品不属于失败，但不更新检查点
+            return result or bool(checkpoint)
+
+        await self.process(accounts, handle, args.concurrency, key=lambda i: i.url)
+        return self.exit_code()
+
+    async def download_ids(self, args: Namespace) -> int:
+        tiktok = args.platform == "tiktok"
+        if not (items := self.read_items(args)):
+            return self.missing_input()
+        ids = await self.extract_ids(items, "detail", tiktok, args.proxy)
+        if args.incremental:
+            recorder = self.parameter.recorder
+            extracted = len(ids)
+            ids = [i for i in ids if not await recorder.has_id(i)]
+            self.count.skipped = extracted - len(ids)
+        processor = DetailTikTok if tiktok else Detail
+        details = {}
+
+        async def handle(detail_id: str):
+            if data := await self.handle_detail_single(
+                processor,
+                args.cookie,
+                args.proxy,
+                detail_id,
+            ):
+                details[detail_id] = data
+            return data
+
+        await self.process(ids, handle, args.concurrency)
+        if details:
+            root, params, logger = self.record.run(self.parameter, tiktok=tiktok)
+            async with logger(root, console=self.console, **params) as record:
+                data = await self.extractor.run(
+                    [details[i] for i in ids if i in details],
+                    record,
+                    tiktok=tiktok,
+                )
+                await self.downloader.run(data, "detail", tiktok=tiktok)
+        return self.exit_code()
+
+    async def comments(self, args: Namespace) -> int:
+        if not self.parameter.storage_format:
+            return self.missing_storage_format()
+        if not (items := self.read_items(args)):
+            return self.missing_input()
+        ids = await self.extract_ids(items, "detail", False, args.proxy)
+        await self.process(
+            ids,
+            lambda i: self.comment_handle_single(i, args.cookie, args.proxy),
+            args.concurrency,
+        )
+        return self.exit_code()
+
+    async def search(self, args: Namespace) -> int:
+        if not self.parameter.storage_format:
+            return self.missing_storage_format()
+
+        async def handle(keyword: str):
+            if isinstance(
+                model := self.generate_model(
+                    args.channel,
+                    keyword,
+                    args.pages,
+                    args.sort_type,
+                    args.publish_time,
+                    args.duration,
+                    args.search_range,
+                    args.content_type,
+                    args.user_fans,
+                    args.user_type,
+                ),
+                str,
+            ):
+                raise ValueError(model)
+            return await self.deal_search_data(model)
+
+        await self.process(args.keywords, handle, args.concurrency)
+        return self.exit_code()
+
+    @asynccontextmanager
+    async def crawl_queue(self, args: Namespace) -> AsyncIterator["SQLiteQueue"]:
+        from ..manager import Database, SQLiteQueue
+
+        if not args.queue:
+            yield SQLiteQueue(self.database, args.lease_timeout, args.attempts)
+            return
+        database = Database()
+        database.file = args.queue
+        async with database:
+            yield SQLiteQueue(database, args.lease_timeout, args.attempts)
+
+    async def crawl_submit(self, args: Namespace) -> int:
+        from .crawl import Coordinator
+
+        if args.kind == "search":
+            if not self.parameter.storage_format:
+                return self.missing_storage_format()
+            items = args.keywords
+            options = {
+                "channel": args.channel,
+                "pages": args.pages,
+                "sort_type": args.sort_type,
+                "publish_time": args.publish_time,
+                "duration": args.duration,
+                "search_range": args.search_range,
+                "content_type": args.content_type,
+                "douyin_user_fans": args.user_fans,
+                "douyin_user_type": args.user_type,
+            }
+        elif not (items := self.read_items(args)):
+            return self.missing_input()
+        elif args.kind == "account":
+            options = {
+                "mark": args.mark,
+                "tab": args.tab,
+                "earliest": args.earliest,
+                "latest": args.latest,
+                "pages": args.pages,
+            }
+        else:
+            options = {"mark": args.mark}
+        async with self.crawl_queue(args) as queue:
+            count = await Coordinator(queue).submit(
+                args.kind, items, args.platform, **options
+            )
+        self.count.success = count
+        self.count.skipped = len(set(items)) - count
+        self.emit({"type": "crawl.submitted", "kind": args.kind, "count": count})
+        return EXIT_SUCCESS
+
+    async def crawl_worker(self, args: Namespace) -> int:
+        from .crawl import CrawlWorker
+
+        async with self.crawl_queue(args) as queue:
+            worker = CrawlWorker(
+                self,
+                queue,
+                args.concurrency,
+                args.cookie,
+                args.proxy,
+            )
+            self.emit({"type": "crawl.worker", "worker": worker.id})
+            await worker.run(args.exit_when_empty)
+        return (
+            self.exit_code()
+            if self.count.success or self.count.failed
+            else EXIT_SUCCESS
+        )
+
+    async def crawl_status(self, args: Namespace) -> int:
+        from .crawl import Coordinator
+
+        async with self.crawl_queue(args) as queue:
+            if args.purge:
+                await queue.purge()
+            if args.wait:
+                stats = await Coordinator(queue).wait(
+                    callback=lambda i: self.emit({"type": "crawl.status", **i})
+                )
+            else:
+                self.emit({"type": "crawl.status", **(stats := await queue.stats())})
+        return EXIT_PARTIAL if stats.get("failed") else EXIT_SUCCESS
+
+    async def verify(self, args: Namespace) -> int:
+        corrupt = (await self.verify_library())["corrupt"]
+        for i in corrupt:
+            self.emit({"type": "corrupt", **i})
+        self.count.failed = len(corrupt)
+        return EXIT_PARTIAL if corrupt else EXIT_SUCCESS
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from asyncio import create_task, to_thread
+from asyncio import CancelledError, Queue, create_task, to_thread, wait_for
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, suppress
 from textwrap import dedent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal
 
-from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from uvicorn import Config, Server
 
 from ..custom import (
@@ -20,10 +21,12 @@ from ..custom import (
 from ..models import (
     Account,
     AccountTiktok,
+    BandwidthLimit,
     Comment,
     DataResponse,
     Detail,
     DetailTikTok,
+    DownloadJob,
     GeneralSearch,
     Live,
     LiveSearch,
@@ -31,21 +34,29 @@ from ..models import (
     Mix,
     MixTikTok,
     Reply,
+    SessionAdd,
     Settings,
     ShortUrl,
     KuaishouText,
+    LibrarySearch,
     UrlResponse,
     UserSearch,
     VideoSearch,
 )
+from ..interface import PAGE_SINK, Search
+from ..interface import Comment as CommentAPI
+from ..manager import Session
+from ..tools import BANDWIDTH, json_bytes, json_dumps
 from ..translation import _
+from .jobs import Job, JobManager, JobQueue
 from .main_terminal import TikTok
 
 if TYPE_CHECKING:
     from ..config import Parameter
+    from ..interface import API
     from ..manager import Database
 
-__all__ = ["APIServer"]
+__all__ = ["APIServer", "FastJSONResponse"]
 
 
 def token_dependency(token: str = Header(None)):
@@ -56,12 +67,22 @@ def token_dependency(token: str = Header(None)):
         )
 
 
+class FastJSONResponse(JSONResponse):
+    """已安装 orjson 时使用 orjson 编码响应内容"""
+
+    def render(self, content: Any) -> bytes:
+        return json_bytes(content)
+
+
 class APIServer(TikTok):
+    STREAM_PAGES = 2  # 流式响应等待推送的最大页数，超过时暂停获取数据
+
     def __init__(
         self,
         parameter: "Parameter",
         database: "Database",
         server_mode: bool = True,
+        queue: JobQueue = None,
     ):
         super().__init__(
             parameter,
@@ -69,6 +90,9 @@ class APIServer(TikTok):
             server_mode,
         )
         self.server = None
+        self.jobs = JobManager()
+        # 多进程部署时下载任务提交至共享任务队列，由任务进程执行
+        self.queue = queue
 
     async def handle_redirect(self, text: str, proxy: str = None) -> str:
         return await self.links.run(
@@ -90,6 +114,7 @@ class APIServer(TikTok):
         port=SERVER_PORT,
         log_level="info",
         stop_event=None,
+        sockets=None,
     ):
         import sys
 
@@ -97,6 +122,7 @@ class APIServer(TikTok):
             debug=VERSION_BETA,
             title=PROJECT_NAME,
             version=__VERSION__,
+            default_response_class=FastJSONResponse,
         )
         self.setup_routes()
 
@@ -121,7 +147,7 @@ class APIServer(TikTok):
         if stop_event is not None:
             create_task(wait_for_stop())
 
-        await server.serve()
+        await server.serve(sockets=sockets)
 
     def setup_routes(self):
         @self.server.get(
@@ -186,6 +212,144 @@ class APIServer(TikTok):
         async def get_settings(token: str = Depends(token_dependency)):
             return Settings(**self.parameter.get_settings_data())
 
+        @self.server.get(
+            "/settings/bandwidth",
+            summary=_("获取下载限速"),
+            description=_("返回当前生效的全局、平台与任务下载限速，单位字节每秒"),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def get_bandwidth(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取下载限速成功！"),
+                data=BANDWIDTH.limits(),
+                params=None,
+            )
+
+        @self.server.post(
+            "/settings/bandwidth",
+            summary=_("修改下载限速"),
+            description=_(
+                dedent("""
+                修改下载限速，单位字节每秒，设置为 0 代表不限速，修改后立即对进行中的下载任务生效
+                
+                **参数**:
+                
+                - **global**: 全部下载任务的总速度上限；可选参数
+                - **douyin**、**tiktok**、**kuaishou**: 对应平台下载任务的总速度上限；可选参数
+                - **tasks**: Web UI 任务 ID 与该任务下载速度上限；可选参数，不保存至配置文件
+                """)
+            ),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def handle_bandwidth(
+            extract: BandwidthLimit, token: str = Depends(token_dependency)
+        ):
+            if limits := extract.model_dump(
+                by_alias=True,
+                exclude={"tasks"},
+                exclude_none=True,
+            ):
+                await self.parameter.set_settings_data(
+                    {"bandwidth": self.parameter.bandwidth | limits}
+                )
+            BANDWIDTH.update(tasks=extract.tasks)
+            return DataResponse(
+                message=_("修改下载限速成功！"),
+                data=BANDWIDTH.limits(),
+                params=extract.model_dump(by_alias=True),
+            )
+
+        @self.server.get(
+            "/proxies",
+            summary=_("获取代理池状态"),
+            description=_("返回代理池全部代理的响应时间、成功率与暂停使用剩余时间"),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def get_proxies(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取代理池状态成功！"),
+                data={
+                    "douyin": self.parameter.proxies.list(),
+                    "tiktok": self.parameter.proxies_tiktok.list(),
+                },
+                params=None,
+            )
+
+        @self.server.get(
+            "/sessions",
+            summary=_("获取会话池状态"),
+            description=_(
+                "返回会话池全部会话的健康评分、冷却时间与请求次数，不返回 Cookie"
+            ),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def get_sessions(
+            platform: str = "", token: str = Depends(token_dependency)
+        ):
+            return DataResponse(
+                message=_("获取会话池状态成功！"),
+                data=self.parameter.sessions.list(platform),
+                params={"platform": platform},
+            )
+
+        @self.server.post(
+            "/sessions",
+            summary=_("添加会话"),
+            description=_(
+                dedent("""
+                向会话池添加已登录账号的会话，未设置 Cookie 参数的数据采集请求将轮流使用会话池中的会话
+
+                **参数**:
+
+                - **sessions**: 会话列表；必需参数
+                - **platform**: 平台，可选值：douyin、tiktok；可选参数，默认值：douyin
+                - **cookie**: 账号 Cookie，程序从中读取 msToken、ttwid、UIFID；必需参数
+                - **ms_token**: msToken，覆盖 Cookie 中的值；可选参数
+                - **device_id**: TikTok 设备 ID；可选参数
+                """)
+            ),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def handle_sessions(
+            extract: SessionAdd, token: str = Depends(token_dependency)
+        ):
+            sessions = [
+                await self.parameter.sessions.add(
+                    Session.create(i.platform, i.cookie, i.ms_token, i.device_id)
+                )
+                for i in extract.sessions
+            ]
+            return DataResponse(
+                message=_("添加会话成功！"),
+                data=[i.snapshot() for i in sessions],
+                params=None,
+            )
+
+        @self.server.delete(
+            "/sessions/{session_id}",
+            summary=_("删除会话"),
+            tags=[_("配置")],
+            response_model=DataResponse,
+        )
+        async def delete_session(
+            session_id: str, token: str = Depends(token_dependency)
+        ):
+            if not await self.parameter.sessions.remove(session_id):
+                raise HTTPException(
+                    status_code=404,
+                    detail=_("会话不存在！"),
+                )
+            return DataResponse(
+                message=_("删除会话成功！"),
+                data=None,
+                params={"session_id": session_id},
+            )
+
         @self.server.post(
             "/douyin/share",
             summary=_("获取分享链接重定向的完整链接"),
@@ -531,6 +695,95 @@ class APIServer(TikTok):
         ):
             return await self.handle_search(extract)
 
+        stream_description = _(
+            dedent("""
+            **参数**: 与对应的非流式接口相同
+            
+            - **format**: 查询参数，`ndjson` 或 `sse`；可选参数，默认值：`ndjson`
+            
+            每获取一页数据立即推送，每条消息为一个 JSON 对象，`type` 依次为 `start`、`item`、`page`、`end`；
+            发生错误时推送 `error` 消息
+            """)
+        )
+
+        @self.server.post(
+            "/douyin/account/stream",
+            summary=_("流式获取账号作品数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_account(
+            extract: Account,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_account(extract, format_)
+
+        @self.server.post(
+            "/douyin/comment/stream",
+            summary=_("流式获取作品评论数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_comment(
+            extract: Comment,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_comment(extract, format_)
+
+        @self.server.post(
+            "/douyin/search/general/stream",
+            summary=_("流式获取综合搜索数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_search_general(
+            extract: GeneralSearch,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_search(extract, format_)
+
+        @self.server.post(
+            "/douyin/search/video/stream",
+            summary=_("流式获取视频搜索数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_search_video(
+            extract: VideoSearch,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_search(extract, format_)
+
+        @self.server.post(
+            "/douyin/search/user/stream",
+            summary=_("流式获取用户搜索数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_search_user(
+            extract: UserSearch,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_search(extract, format_)
+
+        @self.server.post(
+            "/douyin/search/live/stream",
+            summary=_("流式获取直播搜索数据"),
+            description=stream_description,
+            tags=[_("抖音")],
+        )
+        async def stream_search_live(
+            extract: LiveSearch,
+            format_: Literal["ndjson", "sse"] = Query("ndjson", alias="format"),
+            token: str = Depends(token_dependency),
+        ):
+            return self.stream_search(extract, format_)
+
         @self.server.post(
             "/tiktok/share",
             summary=_("获取分享链接重定向的完整链接"),
@@ -739,6 +992,310 @@ class APIServer(TikTok):
                 return self.success_response(extract, data[0])
             return self.failed_response(extract)
 
+        @self.server.post(
+            "/library/search",
+            summary=_("搜索作品库"),
+            description=_(
+                dedent("""
+                **参数**:
+
+                - **keyword**: 关键词，匹配作品描述、话题标签、账号昵称、音乐信息；可选参数，为空时返回最近的作品
+                - **platform**: 平台，可选值：douyin、tiktok；可选参数，默认搜索全部平台
+                - **limit**: 返回数量；可选参数，默认值：20
+                - **offset**: 偏移量；可选参数，默认值：0
+                """)
+            ),
+            tags=[_("作品库")],
+            response_model=DataResponse,
+        )
+        async def handle_library_search(
+            extract: LibrarySearch, token: str = Depends(token_dependency)
+        ):
+            if data := await self.downloader.library.search(
+                extract.keyword,
+                extract.platform,
+                extract.limit,
+                extract.offset,
+            ):
+                return self.success_response(extract, data)
+            return self.success_response(extract, None, _("搜索结果为空！"))
+
+        @self.server.post(
+            "/library/import",
+            summary=_("导入作品库"),
+            description=_(
+                dedent("""
+                导入已有的 CSV、XLSX、SQLite 作品数据文件，并按文件命名规则关联下载文件夹中已存在的文件
+                """)
+            ),
+            tags=[_("作品库")],
+            response_model=DataResponse,
+        )
+        async def handle_library_import(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("导入作品库成功！"),
+                data=await self.import_library(),
+                params=None,
+            )
+
+        @self.server.post(
+            "/library/verify",
+            summary=_("校验作品库文件"),
+            description=_(
+                dedent("""
+                校验作品库关联的本地文件，删除大小异常、文件签名不符或视频结构不完整的文件，
+                并清除对应的下载记录，以便下次下载时重新下载
+                """)
+            ),
+            tags=[_("作品库")],
+            response_model=DataResponse,
+        )
+        async def handle_library_verify(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("校验作品库文件成功！"),
+                data=await self.verify_library(),
+                params=None,
+            )
+
+        @self.server.post(
+            "/download",
+            summary=_("创建下载任务"),
+            description=_(
+                dedent("""
+                批量下载作品与账号作品文件，立即返回下载任务 ID，任务在后台运行；
+                多个下载任务同时运行时共用文件下载并发数量限制
+
+                **参数**:
+
+                - **platform**: 平台，可选值：douyin、tiktok；可选参数，默认值：douyin
+                - **detail**: 作品 ID 或作品链接列表；可选参数
+                - **account**: 账号 sec_uid 或账号主页链接列表；可选参数
+                - **tab**、**earliest**、**latest**、**pages**、**mark**: 账号作品下载参数；可选参数
+                - **cookie**: Cookie；可选参数
+                - **proxy**: 代理；可选参数
+                """)
+            ),
+            tags=[_("下载任务")],
+            response_model=DataResponse,
+        )
+        async def handle_download(
+            extract: DownloadJob, token: str = Depends(token_dependency)
+        ):
+            if not (extract.detail or extract.account):
+                raise HTTPException(
+                    status_code=400,
+                    detail=_("作品与账号均为空！"),
+                )
+            if self.queue:
+                job = await self.queue.create(
+                    {"platform": extract.platform},
+                    extract.model_dump(),
+                )
+            else:
+                job = self.jobs.create({"platform": extract.platform})
+                self.jobs.run(job, lambda i: self.run_download_job(i, extract))
+            return DataResponse(
+                message=_("创建下载任务成功！"),
+                data=job.snapshot(),
+                params=extract.model_dump(),
+            )
+
+        @self.server.get(
+            "/download",
+            summary=_("获取全部下载任务"),
+            tags=[_("下载任务")],
+            response_model=DataResponse,
+        )
+        async def list_download(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取下载任务成功！"),
+                data=await self.queue.list() if self.queue else self.jobs.list(),
+                params=None,
+            )
+
+        @self.server.get(
+            "/download/{job_id}",
+            summary=_("获取下载任务状态"),
+            description=_("返回下载任务状态与每个文件的下载进度"),
+            tags=[_("下载任务")],
+            response_model=DataResponse,
+        )
+        async def get_download(job_id: str, token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取下载任务成功！"),
+                data=(await self.get_job(job_id)).snapshot(),
+                params={"job_id": job_id},
+            )
+
+        @self.server.get(
+            "/download/{job_id}/events",
+            summary=_("长轮询下载任务事件"),
+            description=_(
+                dedent("""
+                返回序号大于 sequence 的下载任务事件，没有新事件时等待至多 timeout 秒
+
+                **参数**:
+
+                - **sequence**: 已接收的最后一个事件序号；可选参数，默认值：0
+                - **timeout**: 等待时间，单位秒，最大值 120；可选参数，默认值：30
+                """)
+            ),
+            tags=[_("下载任务")],
+            response_model=DataResponse,
+        )
+        async def poll_download(
+            job_id: str,
+            sequence: int = 0,
+            timeout: float = 30,
+            token: str = Depends(token_dependency),
+        ):
+            job = await self.get_job(job_id)
+            timeout_ = min(max(timeout, 0), 120)
+            if self.queue:
+                events = await self.queue.wait(job_id, sequence, timeout_)
+                job = await self.get_job(job_id)
+            else:
+                events = await job.wait(sequence, timeout_)
+            return DataResponse(
+                message=_("获取下载任务事件成功！"),
+                data={**job.snapshot(False), "events": events},
+                params={"job_id": job_id, "sequence": sequence, "timeout": timeout},
+            )
+
+        @self.server.get(
+            "/download/{job_id}/stream",
+            summary=_("订阅下载任务事件"),
+            description=_(
+                "以 Server-Sent Events 格式推送下载任务事件，任务结束后关闭连接"
+            ),
+            tags=[_("下载任务")],
+        )
+        async def stream_download(
+            job_id: str,
+            sequence: int = 0,
+            token: str = Depends(token_dependency),
+        ):
+            job = await self.get_job(job_id)
+            return StreamingResponse(
+                self.stream_queue(job_id, sequence)
+                if self.queue
+                else self.stream_job(job, sequence),
+                media_type="text/event-stream",
+            )
+
+        @self.server.delete(
+            "/download/{job_id}",
+            summary=_("取消下载任务"),
+            tags=[_("下载任务")],
+            response_model=DataResponse,
+        )
+        async def cancel_download(job_id: str, token: str = Depends(token_dependency)):
+            await self.get_job(job_id)
+            if self.queue:
+                cancelled = await self.queue.cancel(job_id)
+            else:
+                cancelled = self.jobs.cancel(job_id)
+            # 返回取消后的任务状态
+            job = await self.get_job(job_id)
+            return DataResponse(
+                message=_("取消下载任务成功！") if cancelled else _("下载任务已结束！"),
+                data=job.snapshot(False),
+                params={"job_id": job_id},
+            )
+
+    async def get_job(self, job_id: str) -> Job:
+        if job := (
+            await self.queue.get(job_id) if self.queue else self.jobs.get(job_id)
+        ):
+            return job
+        raise HTTPException(
+            status_code=404,
+            detail=_("下载任务不存在！"),
+        )
+
+    @staticmethod
+    async def stream_job(job: Job, sequence: int = 0):
+        """按事件序号读取历史事件，客户端读取缓慢时不会丢失事件"""
+        while True:
+            if not (events := await job.wait(sequence, 10)):
+                if job.finished:
+                    break
+                yield ": ping\n\n"
+                continue
+            if events[0]["seq"] > sequence + 1:
+                # 未读取的事件已移出历史记录，先推送任务快照
+                snapshot = {"type": "job.snapshot", **job.snapshot()}
+                yield f"data: {json_dumps(snapshot)}\n\n"
+            for event in events:
+                yield f"data: {json_dumps(event)}\n\n"
+            sequence = events[-1]["seq"]
+            if events[-1]["type"] == "job.finished":
+                break
+
+    async def stream_queue(self, job_id: str, sequence: int = 0):
+        """多进程部署时从共享任务队列读取下载任务事件"""
+        while True:
+            if not (events := await self.queue.wait(job_id, sequence, 10)):
+                job = await self.queue.get(job_id)
+                if not job or job.finished:
+                    break
+                yield ": ping\n\n"
+                continue
+            for event in events:
+                yield f"data: {json_dumps(event)}\n\n"
+            sequence = events[-1]["seq"]
+            if events[-1]["type"] == "job.finished":
+                break
+
+    async def run_download_job(self, job: Job, extract: DownloadJob) -> None:
+        tiktok = extract.platform == "tiktok"
+        job.emit({"type": "phase", "name": "extract"})
+        ids = await self.extract_ids(extract.detail, "detail", tiktok, extract.proxy)
+        accounts = await self.extract_ids(
+            extract.account, "user", tiktok, extract.proxy
+        )
+        job.meta |= {"works_count": len(ids), "accounts_count": len(accounts)}
+        job.emit({"type": "meta", **job.meta})
+        if not (ids or accounts):
+            raise ValueError(_("未提取到作品或账号数据"))
+        job.emit({"type": "phase", "name": "download"})
+        if ids:
+            root, params, logger = self.record.run(self.parameter, tiktok=tiktok)
+            async with logger(root, console=self.console, **params) as record:
+                await self._handle_detail(
+                    ids,
+                    tiktok,
+                    record,
+                    False,
+                    False,
+                    extract.cookie,
+                    extract.proxy,
+                )
+        for index, sec_user_id in enumerate(accounts, start=1):
+            job.emit(
+                {"type": "account.start", "index": index, "sec_user_id": sec_user_id}
+            )
+            ok = await self.deal_account_detail(
+                index,
+                sec_user_id,
+                mark=extract.mark,
+                tab=extract.tab,
+                earliest=extract.earliest or "",
+                latest=extract.latest or "",
+                pages=extract.pages,
+                cookie=extract.cookie,
+                proxy=extract.proxy,
+                tiktok=tiktok,
+            )
+            job.emit(
+                {
+                    "type": "account.done",
+                    "index": index,
+                    "sec_user_id": sec_user_id,
+                    "ok": bool(ok),
+                }
+            )
+
     async def handle_search(self, extract):
         if isinstance(
             data := await self.deal_search_data(
@@ -795,28 +1352,229 @@ class APIServer(TikTok):
             return self.success_response(extract, data)
         return self.failed_response(extract)
 
+    def stream_account(self, extract: Account, format_: str) -> StreamingResponse:
+        root, params, logger = self.record.run(self.parameter, blank=True)
+        info = []
+
+        async def fetch():
+            await self._get_account_data(
+                extract.cookie,
+                extract.proxy,
+                extract.sec_user_id,
+                extract.tab,
+                extract.earliest,
+                extract.latest,
+                extract.pages,
+            )
+
+        async def convert(api: "API", page: list[dict], recorder) -> list[dict]:
+            if extract.source:
+                return self.extractor.source_date_filter(page, api.earliest, api.latest)
+            # 账号昵称与标识从第一页数据提取
+            if not info:
+                info.extend(
+                    self.extractor.preprocessing_data(
+                        page,
+                        mode=extract.tab,
+                        user_id=extract.sec_user_id,
+                    )
+                )
+            return await self.extractor.run(
+                page,
+                recorder,
+                type_="batch",
+                name=info[1],
+                mark=info[2],
+                earliest=api.earliest,
+                latest=api.latest,
+                same=extract.tab in {"post", "mix"},
+            )
+
+        return self.stream_response(
+            extract,
+            fetch,
+            convert,
+            format_,
+            lambda: logger(root, console=self.console, **params),
+        )
+
+    def stream_comment(self, extract: Comment, format_: str) -> StreamingResponse:
+        root, params, logger = self.record.run(self.parameter, type_="comment")
+
+        async def fetch():
+            await CommentAPI(
+                self.parameter,
+                extract.cookie,
+                extract.proxy,
+                detail_id=extract.detail_id,
+                pages=extract.pages,
+                cursor=extract.cursor,
+                count=extract.count,
+                count_reply=extract.count_reply,
+                reply=extract.reply,
+            ).run()
+
+        async def convert(api: "API", page: list[dict], recorder) -> list[dict]:
+            if extract.source:
+                return page
+            return await self.extractor.run(page, recorder, type_="comment")
+
+        return self.stream_response(
+            extract,
+            fetch,
+            convert,
+            format_,
+            None
+            if extract.source
+            else lambda: logger(
+                root,
+                name=_("作品{id}_评论数据").format(id=extract.detail_id),
+                console=self.console,
+                **params,
+            ),
+        )
+
+    def stream_search(self, extract, format_: str) -> StreamingResponse:
+        root, params, logger = self.record.run(
+            self.parameter,
+            type_=Search.search_data_field[extract.channel],
+        )
+
+        async def fetch():
+            await Search(self.parameter, **extract.model_dump()).run()
+
+        async def convert(api: "API", page: list[dict], recorder) -> list[dict]:
+            if extract.source:
+                return page
+            return await self.extractor.run(
+                page,
+                recorder,
+                type_="search",
+                tab=extract.channel,
+            )
+
+        return self.stream_response(
+            extract,
+            fetch,
+            convert,
+            format_,
+            None
+            if extract.source
+            else lambda: logger(
+                root,
+                name=self._generate_search_name(extract),
+                console=self.console,
+                **params,
+            ),
+        )
+
+    def stream_response(
+        self,
+        extract,
+        fetch: Callable[[], Awaitable],
+        convert: Callable[["API", list[dict], Any], Awaitable[list[dict]]],
+        format_: str = "ndjson",
+        record: Callable[[], AbstractAsyncContextManager] = None,
+    ) -> StreamingResponse:
+        sse = format_ == "sse"
+        return StreamingResponse(
+            self.stream_pages(extract, fetch, convert, sse, record),
+            media_type="text/event-stream" if sse else "application/x-ndjson",
+        )
+
+    async def stream_pages(
+        self,
+        extract,
+        fetch: Callable[[], Awaitable],
+        convert: Callable[["API", list[dict], Any], Awaitable[list[dict]]],
+        sse=False,
+        record: Callable[[], AbstractAsyncContextManager] = None,
+    ):
+        """获取数据的同时逐页推送，客户端接收缓慢时暂停获取，客户端断开连接时停止获取"""
+        pages: Queue[list[dict] | Exception | None] = Queue(maxsize=self.STREAM_PAGES)
+
+        def encode(event: dict) -> str:
+            text = json_dumps(event)
+            return f"data: {text}\n\n" if sse else f"{text}\n"
+
+        async def producer():
+            error = None
+            try:
+                async with AsyncExitStack() as stack:
+                    recorder = (
+                        await stack.enter_async_context(record()) if record else None
+                    )
+
+                    async def sink(api: "API", page: list[dict]):
+                        await pages.put(await convert(api, page, recorder))
+
+                    PAGE_SINK.set(sink)
+                    await fetch()
+            except Exception as e:
+                self.logger.error(_("获取数据发生错误：{error}").format(error=repr(e)))
+                error = e
+            await pages.put(error)
+
+        task = create_task(producer())
+        count = index = 0
+        try:
+            yield encode({"type": "start", "params": extract.model_dump()})
+            while True:
+                try:
+                    data = await wait_for(pages.get(), timeout=10)
+                except TimeoutError:
+                    if sse:
+                        yield ": ping\n\n"
+                    continue
+                if not isinstance(data, list):
+                    break
+                index += 1
+                for item in data:
+                    yield encode({"type": "item", "data": item})
+                count += len(data)
+                yield encode({"type": "page", "index": index, "count": len(data)})
+            if data:
+                yield encode({"type": "error", "message": repr(data)})
+            yield encode(
+                {
+                    "type": "end",
+                    "count": count,
+                    "message": _("获取数据成功！") if count else _("获取数据失败！"),
+                }
+            )
+        finally:
+            task.cancel()
+            with suppress(CancelledError):
+                await task
+
     @staticmethod
+    def data_response(
+        extract,
+        data: dict | list[dict] | None,
+        message: str,
+    ) -> FastJSONResponse:
+        """直接编码作品数据，跳过 DataResponse 模型对大量数据的校验与转换"""
+        content = DataResponse(
+            message=message,
+            params=extract.model_dump(),
+        ).model_dump()
+        content["data"] = data
+        return FastJSONResponse(content)
+
     def success_response(
+        self,
         extract,
         data: dict | list[dict],
         message: str = None,
-    ):
-        return DataResponse(
-            message=message or _("获取数据成功！"),
-            data=data,
-            params=extract.model_dump(),
-        )
+    ) -> FastJSONResponse:
+        return self.data_response(extract, data, message or _("获取数据成功！"))
 
-    @staticmethod
     def failed_response(
+        self,
         extract,
         message: str = None,
-    ):
-        return DataResponse(
-            message=message or _("获取数据失败！"),
-            data=None,
-            params=extract.model_dump(),
-        )
+    ) -> FastJSONResponse:
+        return self.data_response(extract, None, message or _("获取数据失败！"))
 
     @staticmethod
     def generate_mix_params(mix_id: str = None, detail_id: str = None):
@@ -427,6 +427,20 @@ class TikTok:
                 sec_user_id = await self.links.run(sec_user_id, "user")
         return sec_user_id[0] if len(sec_user_id) > 0 else ""
 
+    async def extract_ids(
+        self,
+        items: list[str],
+        type_: str,
+        tiktok: bool,
+        proxy: str = None,
+    ) -> list[str]:
+        """作品 ID 与账号 sec_uid 直接使用，链接需要提取 ID"""
+        result = [i for i in items if i and "/" not in i]
+        if links := " ".join(i for i in items if "/" in i):
+            link = self.links_tiktok if tiktok else self.links
+            result.extend(await link.run(links, type_=type_, proxy=proxy))
+        return list(dict.fromkeys(i for i in result if i))
+
     async def account_detail_inquire(
         self,
         *args,
@@ -2295,6 +2309,35 @@ class TikTok:
                 if data := extractor.run(data):
                     await self.downloader.run([data], "detail", tiktok=True)
 
+    async def import_library(self) -> dict:
+        """导入已有的作品数据文件并关联本地文件至作品库索引"""
+        result = {"works": 0, "files": 0}
+        for tiktok, root in (
+            (False, self.parameter.root_douyin),
+            (True, self.parameter.root_tiktok),
+        ):
+            library = self.downloader.library
+            result["works"] += await library.import_records(root, tiktok)
+            result["files"] += await library.import_files(
+                root,
+                self.downloader.restore_detail_name,
+                tiktok,
+            )
+        self.logger.info(
+            _("作品库索引导入完成，作品数量: {works}，文件数量: {files}").format(
+                **result
+            )
+        )
+        return result
+
+    async def verify_library(self) -> dict:
+        """校验作品库中已下载文件的完整性，损坏的文件将在下次下载时重新下载"""
+        corrupt = await self.downloader.verify_library()
+        self.logger.info(
+            _("作品库文件校验完成，损坏文件数量: {count}").format(count=len(corrupt))
+        )
+        return {"corrupt": corrupt}
+
     async def run(self, run_command: list):
         self.run_command = run_command
         while self.running:
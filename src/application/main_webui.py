@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from asyncio import CancelledError, Lock, Queue, create_task, wait_for
+from asyncio import (
+    CancelledError,
+    Event,
+    Lock,
+    TimerHandle,
+    create_task,
+    get_running_loop,
+    wait_for,
+)
 from collections import deque
 from dataclasses import dataclass, field
-from json import dumps
 from pathlib import Path
 from platform import system
 from subprocess import Popen
@@ -29,8 +36,16 @@ from ..custom import (
     __VERSION__,
 )
 from ..interface import API, Collection, Collects, CollectsMix, CollectsMusic
+from ..models import LibrarySearch
 from ..module import Cookie, DetailTikTokExtractor, DetailTikTokUnofficial
-from ..tools import Browser, cookie_dict_to_str, cookie_str_to_dict
+from ..tools import (
+    BANDWIDTH,
+    BANDWIDTH_TASK,
+    Browser,
+    cookie_dict_to_str,
+    cookie_str_to_dict,
+    json_dumps,
+)
 from ..tools.progress import EventProgress
 from ..translation import _
 from .main_server import APIServer, token_dependency
@@ -188,8 +203,48 @@ def _split_inputs(text: str) -> list[str]:
     return [i for i in text.replace("\r", "\n").split() if i]
 
 
+class TaskSubscriber:
+    """任务事件订阅者，积压过多时丢弃积压的帧，下次读取时发送完整快照"""
+
+    def __init__(self, task: UITask, size: int = 64):
+        self.task = task
+        self.size = size
+        self.frames: deque[str] = deque()
+        self.ready = Event()
+        self.stale = True  # 首次读取时发送完整快照
+
+    def put(self, frame: str) -> None:
+        if self.stale:
+            return
+        if len(self.frames) >= self.size:
+            self.frames.clear()
+            self.stale = True
+        else:
+            self.frames.append(frame)
+        self.ready.set()
+
+    async def get(self, timeout: float) -> str | None:
+        """返回下一帧事件，等待超时返回 None"""
+        if not self.stale and not self.frames:
+            self.ready.clear()
+            try:
+                await wait_for(self.ready.wait(), timeout)
+            except TimeoutError:
+                return None
+        if self.stale:
+            self.stale = False
+            self.frames.clear()
+            return self.task.encode(self.task.resync())
+        return self.frames.popleft()
+
+
 @dataclass(slots=True)
 class UITask:
+    """WebUI 任务，下载进度按文件合并后定时推送，不计入历史事件"""
+
+    FLUSH_INTERVAL = 0.5  # 下载进度推送间隔，单位：秒
+    FILES = 1000  # 保留的已完成文件进度数量
+
     id: str
     type: str
     title: str
@@ -199,8 +254,12 @@ class UITask:
     finished_at: float | None = None
     error: str | None = None
     meta: dict[str, Any] = field(default_factory=dict)
-    events: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=2000))
-    subscribers: set[Queue[dict[str, Any]]] = field(default_factory=set)
+    events: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=1000))
+    files: dict[str | int, dict[str, Any]] = field(default_factory=dict)
+    finished: deque[str | int] = field(default_factory=deque)
+    pending: dict[str | int, None] = field(default_factory=dict)
+    flusher: TimerHandle | None = None
+    subscribers: set[TaskSubscriber] = field(default_factory=set)
 
     def snapshot(self) -> dict[str, Any]:
         return {
@@ -215,14 +274,106 @@ class UITask:
             "meta": self.meta,
         }
 
+    def subscribe(self) -> TaskSubscriber:
+        self.subscribers.add(subscriber := TaskSubscriber(self))
+        return subscriber
+
     def emit(self, event: dict[str, Any]) -> None:
         event = {"ts": time(), **event}
+        if event["type"].startswith("progress."):
+            self.update_file(event)
+            if self.subscribers:
+                # 同一文件仅推送最新进度
+                self.pending[event["task_id"]] = None
+                self.schedule()
+            return
+        self.flush()
         self.events.append(event)
-        for queue in list(self.subscribers):
-            try:
-                queue.put_nowait(event)
-            except Exception:
-                self.subscribers.discard(queue)
+        self.publish([event])
+
+    def update_file(self, event: dict[str, Any]) -> None:
+        id_ = event["task_id"]
+        match event["type"]:
+            case "progress.add" | "progress.update":
+                self.files[id_] = {
+                    "task_id": id_,
+                    "description": event["description"],
+                    "total": event["total"],
+                    "completed": event["completed"],
+                    "finished": False,
+                }
+            case "progress.remove" if file := self.files.get(id_):
+                file["finished"] = True
+                self.finished.append(id_)
+                if len(self.finished) > self.FILES:
+                    self.files.pop(self.finished.popleft(), None)
+
+    def schedule(self) -> None:
+        if self.flusher:
+            return
+        try:
+            self.flusher = get_running_loop().call_later(
+                self.FLUSH_INTERVAL, self.flush
+            )
+        except RuntimeError:
+            self.flush()
+
+    def flush(self) -> None:
+        """推送合并后的下载进度"""
+        if self.flusher:
+            self.flusher.cancel()
+            self.flusher = None
+        if self.pending:
+            now = time()
+            events = [
+                i
+                for id_ in self.pending
+                if (file := self.files.get(id_))
+                for i in self.file_events(file, now, "progress.update")
+            ]
+            self.pending.clear()
+            self.publish(events)
+
+    def publish(self, events: list[dict[str, Any]]) -> None:
+        if not self.subscribers:
+            return
+        # 每帧仅编码一次，全部订阅者共用
+        frame = self.encode(events)
+        for subscriber in self.subscribers:
+            subscriber.put(frame)
+
+    def resync(self) -> list[dict[str, Any]]:
+        """完整快照：任务状态、历史事件与各文件的最新进度"""
+        now = time()
+        events = [{"ts": now, "type": "snapshot", "task": self.snapshot()}]
+        events.extend(self.events)
+        for file in self.files.values():
+            events.extend(self.file_events(file, now, "progress.add"))
+        return events
+
+    @staticmethod
+    def file_events(
+        file: dict[str, Any], now: float, type_: str
+    ) -> list[dict[str, Any]]:
+        events = [
+            {
+                "ts": now,
+                "type": type_,
+                "task_id": file["task_id"],
+                "description": file["description"],
+                "total": file["total"],
+                "completed": file["completed"],
+            }
+        ]
+        if file["finished"]:
+            events.append(
+                {"ts": now, "type": "progress.remove", "task_id": file["task_id"]}
+            )
+        return events
+
+    @staticmethod
+    def encode(events: list[dict[str, Any]]) -> str:
+        return "".join(f"data: {json_dumps(i)}\n\n" for i in events)
 
 
 class UITaskManager:
@@ -251,6 +402,8 @@ class UITaskManager:
 
     def run(self, task: UITask, coro) -> None:
         async def runner():
+            # 下载协程继承任务 ID，用于按任务限速
+            BANDWIDTH_TASK.set(task.id)
             task.status = "running"
             task.started_at = time()
             task.emit({"type": "task.started"})
@@ -267,6 +420,7 @@ class UITaskManager:
                 task.error = repr(e)
                 task.emit({"type": "task.failed", "error": task.error})
             finally:
+                BANDWIDTH.update(tasks={task.id: 0})
                 task.finished_at = time()
                 task.emit({"type": "task.finished"})
 
@@ -607,6 +761,39 @@ class WebUIServer(APIServer):
                 await self.parameter.recorder.delete_ids(ids)
                 return {"ok": True}
 
+        @self.server.post(
+            "/ui-api/library/search",
+            tags=["WebUI"],
+        )
+        async def ui_search_library(
+            extract: LibrarySearch,
+            token: str = Depends(token_dependency),
+        ):
+            return {
+                "items": await self.downloader.library.search(
+                    extract.keyword,
+                    extract.platform,
+                    extract.limit,
+                    extract.offset,
+                )
+            }
+
+        @self.server.post(
+            "/ui-api/library/import",
+            tags=["WebUI"],
+        )
+        async def ui_import_library(token: str = Depends(token_dependency)):
+            async with self._ui_task_lock:
+                return await self.import_library()
+
+        @self.server.post(
+            "/ui-api/library/verify",
+            tags=["WebUI"],
+        )
+        async def ui_verify_library(token: str = Depends(token_dependency)):
+            async with self._ui_task_lock:
+                return await self.verify_library()
+
         @self.server.get(
             "/ui-api/kuaishou/settings",
             tags=["WebUI"],
@@ -1423,21 +1610,17 @@ try {
         )
         async def task_events(task_id: str, token: str = Depends(token_dependency)):
             task = self.ui_tasks.get(task_id)
-            queue: Queue[dict[str, Any]] = Queue(maxsize=200)
-            task.subscribers.add(queue)
+            subscriber = task.subscribe()
 
             async def gen():
                 try:
-                    for e in list(task.events):
-                        yield f"data: {dumps(e, ensure_ascii=False)}\n\n"
                     while True:
-                        try:
-                            e = await wait_for(queue.get(), timeout=10)
-                            yield f"data: {dumps(e, ensure_ascii=False)}\n\n"
-                        except TimeoutError:
+                        if (frame := await subscriber.get(10)) is None:
                             yield ": ping\n\n"
+                        else:
+                            yield frame
                 finally:
-                    task.subscribers.discard(queue)
+                    task.subscribers.discard(subscriber)
 
             return StreamingResponse(gen(), media_type="text/event-stream")
 
@@ -28,12 +28,20 @@ from ..encrypt import (
     XBogus,
     XGnarly,
 )
-from ..extract import Extractor
+from ..extract import Extractor, MediaIndex
 from ..interface import API, APITikTok
+from ..manager import CredentialManager, Credentials, SessionPool
 from ..module import FFMPEG
 from ..record import BaseLogger, LoggerManager
 from ..storage import RecordManager
-from ..tools import Cleaner, DownloaderError, cookie_dict_to_str, create_client
+from ..tools import (
+    BANDWIDTH,
+    Cleaner,
+    DownloaderError,
+    ProxyPool,
+    cookie_dict_to_str,
+    create_client,
+)
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -111,18 +119,37 @@ class Parameter:
         timeout=10,
         douyin_platform=True,
         tiktok_platform=True,
+        deduplicate=False,
+        mirror_race=False,
+        video_policy=None,
+        log_options=None,
+        verify_moov=False,
+        preflight=None,
+        disk_watermark=0,
+        cache_cleanup=None,
+        bandwidth=None,
+        session_pool=None,
+        proxy_pool=None,
         **kwargs,
     ):
         self.settings = settings
         self.cookie_object = cookie_object
         self.ROOT = PROJECT_ROOT  # 项目根路径
         self.logger = logger(PROJECT_ROOT, console)
-        self.logger.run()
+        self.log_options = self.__check_log_options(log_options)
+        self.logger.run(**self.log_options)
         self.ab = ABogus()
         self.xb = XBogus()
         self.xg = XGnarly()
         self.console = console
         self.recorder = recorder
+        self.sessions = SessionPool(recorder.database, self.logger)
+        self.media = MediaIndex()
+        self.credentials = CredentialManager(
+            self.fetch_credentials,
+            self.logger,
+            recorder.database,
+        )
         self.preview = BLANK_PREVIEW
         self.ms_token = ""
         self.ms_token_tiktok = ""
@@ -154,7 +181,7 @@ class Parameter:
         )
         self.cookie_state: bool = self.__check_cookie_state()
         self.cookie_tiktok_state: bool = self.__check_cookie_state(True)
-        self.set_uif_id()
+        self.set_credentials()
         # self.set_download_headers()
 
         self.root = self.__check_root(root)
@@ -189,6 +216,16 @@ class Parameter:
         self.tiktok_platform = self.check_bool_true(
             tiktok_platform,
         )
+        self.deduplicate = self.check_bool_false(deduplicate)
+        self.mirror_race = self.check_bool_false(mirror_race)
+        self.video_policy = self.__check_video_policy(video_policy)
+        self.verify_moov = self.check_bool_false(verify_moov)
+        self.preflight = self.__check_preflight(preflight)
+        self.disk_watermark = self.__check_disk_watermark(disk_watermark)
+        self.cache_cleanup = self.__check_cache_cleanup(cache_cleanup)
+        self.bandwidth = self.__check_bandwidth(bandwidth)
+        self.session_pool = self.__check_session_pool(session_pool)
+        self.proxy_pool = self.__check_proxy_pool(proxy_pool)
 
         self.browser_info = self.merge_browser_info(
             browser_info,
@@ -215,6 +252,18 @@ class Parameter:
             timeout=self.timeout,
             proxy=self.proxy_tiktok,
         )
+        self.proxies = ProxyPool(
+            self.proxy_pool["douyin"],
+            self.timeout,
+            self.proxy_pool["failures"],
+            self.proxy_pool["eject"],
+        )
+        self.proxies_tiktok = ProxyPool(
+            self.proxy_pool["tiktok"],
+            self.timeout,
+            self.proxy_pool["failures"],
+            self.proxy_pool["eject"],
+        )
 
         self.__generate_folders()
 
@@ -252,6 +301,17 @@ class Parameter:
             "live_qualities": self.__check_live_qualities,
             "douyin_platform": self.check_bool_true,
             "tiktok_platform": self.check_bool_true,
+            "deduplicate": self.check_bool_false,
+            "mirror_race": self.check_bool_false,
+            "video_policy": self.__check_video_policy,
+            "log_options": self.__check_log_options,
+            "verify_moov": self.check_bool_false,
+            "preflight": self.__check_preflight,
+            "disk_watermark": self.__check_disk_watermark,
+            "cache_cleanup": self.__check_cache_cleanup,
+            "bandwidth": self.__check_bandwidth,
+            "session_pool": self.__check_session_pool,
+            "proxy_pool": self.__check_proxy_pool,
         }
         # self.__BROWSER_INFO = {
         #     "browser_info": None,
@@ -317,7 +377,7 @@ class Parameter:
         self,
         parameters: tuple[dict, ...],
         cookie: dict | str,
-    ) -> None | str:
+    ) -> str:
         if isinstance(cookie, dict):
             for i in parameters:
                 if i:
@@ -325,8 +385,8 @@ class Parameter:
                         f"参数: {i}",
                         False,
                     )
-                    cookie |= i
-            return None
+                    cookie = cookie | i
+            return cookie_dict_to_str(cookie)
         elif isinstance(cookie, str):
             for i in parameters:
                 if i:
@@ -528,6 +588,181 @@ class Parameter:
         self.logger.info(f"max_size 参数已设置为 {max_size}", False)
         return max_size
 
+    def __check_bandwidth(self, bandwidth: dict | None) -> dict:
+        """限速设置修改后立即生效"""
+        options = {
+            "global": 0,
+            "douyin": 0,
+            "tiktok": 0,
+            "kuaishou": 0,
+        }
+        if isinstance(bandwidth, dict):
+            for key, value in bandwidth.items():
+                if key not in options:
+                    continue
+                if isinstance(value, int) and value >= 0:
+                    options[key] = value
+                else:
+                    self.logger.warning(
+                        _("bandwidth 参数 {key} 设置错误，程序将使用默认值").format(
+                            key=key
+                        )
+                    )
+        BANDWIDTH.update(options)
+        self.logger.info(f"bandwidth 参数已设置为 {options}", False)
+        return options
+
+    def __check_cache_cleanup(self, cache_cleanup: dict | None) -> dict:
+        options = {
+            "max_age": 168,
+            "max_size": 0,
+            "interval": 60,
+        }
+        if not isinstance(cache_cleanup, dict):
+            return options
+        for key, value in cache_cleanup.items():
+            if key not in options:
+                continue
+            if isinstance(value, int) and value >= 0:
+                options[key] = value
+            else:
+                self.logger.warning(
+                    _("cache_cleanup 参数 {key} 设置错误，程序将使用默认值").format(
+                        key=key
+                    )
+                )
+        self.logger.info(f"cache_cleanup 参数已设置为 {options}", False)
+        return options
+
+    def __check_session_pool(self, session_pool: dict | None) -> dict:
+        options = {
+            "rate": 30,
+            "cooldown": 600,
+        }
+        if not isinstance(session_pool, dict):
+            return options
+        for key, value in session_pool.items():
+            if key not in options:
+                continue
+            if isinstance(value, int) and value >= 0:
+                options[key] = value
+            else:
+                self.logger.warning(
+                    _("session_pool 参数 {key} 设置错误，程序将使用默认值").format(
+                        key=key
+                    )
+                )
+        self.sessions.update(**options)
+        self.logger.info(f"session_pool 参数已设置为 {options}", False)
+        return options
+
+    def __check_proxy_pool(self, proxy_pool: dict | None) -> dict:
+        options = {
+            "douyin": [],
+            "tiktok": [],
+            "failures": 3,
+            "eject": 300,
+        }
+        if not isinstance(proxy_pool, dict):
+            return options
+        for key, value in proxy_pool.items():
+            if key not in options:
+                continue
+            if key in {"douyin", "tiktok"}:
+                valid = isinstance(value, list) and all(
+                    isinstance(i, str) and "://" in i for i in value
+                )
+            else:
+                valid = isinstance(value, int) and value >= 0
+            if valid:
+                options[key] = value
+            else:
+                self.logger.warning(
+                    _("proxy_pool 参数 {key} 设置错误，程序将使用默认值").format(
+                        key=key
+                    )
+                )
+        self.logger.info(f"proxy_pool 参数已设置为 {options}", False)
+        return options
+
+    def __check_disk_watermark(self, disk_watermark: int) -> int:
+        return self.__check_number_value(
+            disk_watermark,
+            "disk_watermark",
+            0,
+            0,
+        )
+
+    def __check_video_policy(self, video_policy: dict | None) -> dict:
+        policy = {
+            "resolution": 0,
+            "file_size": 0,
+            "batch_size": 0,
+            "h265": False,
+        }
+        if not isinstance(video_policy, dict):
+            return policy
+        for key, value in video_policy.items():
+            if key not in policy:
+                continue
+            if isinstance(value, type(policy[key])) and value >= 0:
+                policy[key] = value
+            else:
+                self.logger.warning(
+                    _("video_policy 参数 {key} 设置错误，程序将使用默认值").format(
+                        key=key
+                    )
+                )
+        self.logger.info(f"video_policy 参数已设置为 {policy}", False)
+        return policy
+
+    def __check_preflight(self, preflight: dict | None) -> dict:
+        options = {
+            "switch": False,
+            "order": "",
+            "concurrency": 8,
+        }
+        if not isinstance(preflight, dict):
+            return options
+        for key, value in preflight.items():
+            if key not in options:
+                continue
+            match key:
+                case "order":
+                    valid = value in {"", "largest", "smallest"}
+                case "concurrency":
+                    valid = isinstance(value, int) and value > 0
+                case _:
+                    valid = isinstance(value, bool)
+            if valid:
+                options[key] = value
+            else:
+                self.logger.warning(
+                    _("preflight 参数 {key} 设置错误，程序将使用默认值").format(
+                        key=key
+                    )
+                )
+        self.logger.info(f"preflight 参数已设置为 {options}", False)
+        return options
+
+    @staticmethod
+    def __check_log_options(log_options: dict | None) -> dict:
+        """日志记录器尚未启动，参数值由日志记录器校验"""
+        options = {
+            "json": False,
+            "max_size": 0,
+            "when": "",
+            "backup_count": 5,
+            "level": "DEBUG",
+        }
+        if isinstance(log_options, dict):
+            options |= {
+                k: v
+                for k, v in log_options.items()
+                if k in options and isinstance(v, type(options[k]))
+            }
+        return options
+
     def __check_chunk(self, chunk: int) -> int:
         return self.__check_number_value(
             chunk,
@@ -585,7 +820,12 @@ class Parameter:
         return run_command.split()[::-1] if run_command else []
 
     async def update_params(self) -> None:
-        if self.douyin_platform:
+        for platform in ("douyin", "tiktok"):
+            await self.credentials.refresh(platform)
+
+    async def fetch_credentials(self, platform: str) -> Credentials | None:
+        """请求最新的 msToken 与 ttwid，返回新的凭据快照"""
+        if platform == "douyin" and self.douyin_platform:
             if any(
                 (
                     self.cookie_dict,
@@ -597,8 +837,8 @@ class Parameter:
                 )
                 ms_token = await self.__get_token_params()
                 tt_wid = await self.__get_tt_wid_params()
-                API.params["msToken"] = ms_token.get(MsToken.NAME, "")
-                await self.__update_cookie(
+                credentials = self.__update_cookie(
+                    platform,
                     (
                         ms_token,
                         tt_wid,
@@ -609,15 +849,19 @@ class Parameter:
                     ),
                     self.cookie_dict,
                     self.cookie_str,
+                    {
+                        "msToken": ms_token.get(MsToken.NAME, ""),
+                        "uifid": self.__get_cookie_value("UIFID"),
+                    },
                 )
                 self.console.info(
                     _("抖音参数更新完毕！"),
                 )
-            else:
-                self.logger.warning(
-                    _("配置文件 cookie 参数未设置，抖音平台功能可能无法正常使用")
-                )
-        if self.tiktok_platform:
+                return credentials
+            self.logger.warning(
+                _("配置文件 cookie 参数未设置，抖音平台功能可能无法正常使用")
+            )
+        elif platform == "tiktok" and self.tiktok_platform:
             if any(
                 (
                     self.cookie_dict_tiktok,
@@ -629,8 +873,8 @@ class Parameter:
                 )
                 ms_token = await self.__get_token_params_tiktok()
                 tt_wid = await self.__get_tt_wid_params_tiktok()
-                APITikTok.params["msToken"] = ms_token.get(MsTokenTikTok.NAME, "")
-                await self.__update_cookie(
+                credentials = self.__update_cookie(
+                    platform,
                     (
                         ms_token,
                         tt_wid,
@@ -641,16 +885,18 @@ class Parameter:
                     ),
                     self.cookie_dict_tiktok,
                     self.cookie_str_tiktok,
+                    {"msToken": ms_token.get(MsTokenTikTok.NAME, "")},
                 )
                 self.console.info(
                     _("TikTok 参数更新完毕！"),
                 )
-            else:
-                self.logger.warning(
-                    _(
-                        "配置文件 cookie_tiktok 参数未设置，TikTok 平台功能可能无法正常使用"
-                    )
+                return credentials
+            self.logger.warning(
+                _(
+                    "配置文件 cookie_tiktok 参数未设置，TikTok 平台功能可能无法正常使用"
                 )
+            )
+        return None
 
     async def update_params_offline(self) -> None:
         if self.douyin_platform:
@@ -660,19 +906,22 @@ class Parameter:
                     self.cookie_str,
                 )
             ):
-                ms_token = self.cookie_dict.get(MsToken.NAME) or self.get_cookie_value(
-                    self.cookie_str,
-                    MsToken.NAME,
-                )
-                API.params["msToken"] = ms_token
-                await self.__update_cookie(
-                    ({MsToken.NAME: ms_token},),
-                    (
-                        self.headers,
-                        self.headers_download,
-                    ),
-                    self.cookie_dict,
-                    self.cookie_str,
+                ms_token = self.__get_cookie_value(MsToken.NAME)
+                self.credentials.set(
+                    self.__update_cookie(
+                        "douyin",
+                        ({MsToken.NAME: ms_token},),
+                        (
+                            self.headers,
+                            self.headers_download,
+                        ),
+                        self.cookie_dict,
+                        self.cookie_str,
+                        {
+                            "msToken": ms_token,
+                            "uifid": self.__get_cookie_value("UIFID"),
+                        },
+                    )
                 )
             else:
                 self.logger.warning(
@@ -686,15 +935,18 @@ class Parameter:
                 )
             ):
                 ms_token = await self.__get_token_params_tiktok()
-                APITikTok.params["msToken"] = ms_token.get(MsTokenTikTok.NAME, "")
-                await self.__update_cookie(
-                    (ms_token,),
-                    (
-                        self.headers_tiktok,
-                        self.headers_download_tiktok,
-                    ),
-                    self.cookie_dict_tiktok,
-                    self.cookie_str_tiktok,
+                self.credentials.set(
+                    self.__update_cookie(
+                        "tiktok",
+                        (ms_token,),
+                        (
+                            self.headers_tiktok,
+                            self.headers_download_tiktok,
+                        ),
+                        self.cookie_dict_tiktok,
+                        self.cookie_str_tiktok,
+                        {"msToken": ms_token.get(MsTokenTikTok.NAME, "")},
+                    )
                 )
             else:
                 self.logger.warning(
@@ -703,21 +955,59 @@ class Parameter:
                     )
                 )
 
-    async def __update_cookie(
+    def __update_cookie(
         self,
+        platform: str,
         parameters: tuple[dict, ...],
         headers: tuple[dict, ...],
         cookie_dict: dict,
         cookie_str: str,
-    ) -> None:
+        params: dict,
+    ) -> Credentials:
         cookie = self.__add_cookie(
             parameters,
             cookie_dict or cookie_str,
         )
-        if not isinstance(cookie, str):
-            cookie = cookie_dict_to_str(cookie_dict)
         for i in headers:
             i["Cookie"] = cookie
+        return Credentials(
+            platform,
+            cookie,
+            params,
+            Credentials.digest(cookie_dict_to_str(cookie_dict) or cookie_str),
+        )
+
+    def set_credentials(self) -> None:
+        """根据配置文件的 Cookie 生成凭据快照，首次请求数据时再获取最新的参数"""
+        cookie = cookie_dict_to_str(self.cookie_dict) or self.cookie_str
+        self.credentials.set(
+            Credentials(
+                "douyin",
+                cookie,
+                {
+                    "msToken": self.__get_cookie_value(MsToken.NAME),
+                    "uifid": self.__get_cookie_value("UIFID"),
+                },
+                Credentials.digest(cookie),
+            )
+        )
+        cookie = cookie_dict_to_str(self.cookie_dict_tiktok) or self.cookie_str_tiktok
+        self.credentials.set(
+            Credentials(
+                "tiktok",
+                cookie,
+                {"msToken": self.__get_cookie_value(MsTokenTikTok.NAME, True)},
+                Credentials.digest(cookie),
+            )
+        )
+
+    def __get_cookie_value(self, key: str, tiktok=False) -> str:
+        cookie_dict, cookie_str = (
+            (self.cookie_dict_tiktok, self.cookie_str_tiktok)
+            if tiktok
+            else (self.cookie_dict, self.cookie_str)
+        )
+        return cookie_dict.get(key) or self.get_cookie_value(cookie_str, key) or ""
 
     def set_headers_cookie(
         self,
@@ -834,15 +1124,6 @@ class Parameter:
         #     return {MsTokenTikTok.NAME: m}
         return {MsTokenTikTok.NAME: m}
 
-    def set_uif_id(
-        self,
-    ) -> None:
-        API.params["uifid"] = ""
-        if self.cookie_dict:
-            API.params["uifid"] = self.cookie_dict.get("UIFID", "")
-        elif self.cookie_str:
-            API.params["uifid"] = self.get_cookie_value(self.cookie_str, "UIFID")
-
     @staticmethod
     def __generate_ffmpeg_object(ffmpeg_path: str) -> FFMPEG:
         return FFMPEG(ffmpeg_path)
@@ -886,6 +1167,17 @@ class Parameter:
             "live_qualities": self.live_qualities,
             "douyin_platform": self.douyin_platform,
             "tiktok_platform": self.tiktok_platform,
+            "deduplicate": self.deduplicate,
+            "mirror_race": self.mirror_race,
+            "video_policy": self.video_policy,
+            "log_options": self.log_options,
+            "verify_moov": self.verify_moov,
+            "preflight": self.preflight,
+            "disk_watermark": self.disk_watermark,
+            "cache_cleanup": self.cache_cleanup,
+            "bandwidth": self.bandwidth,
+            "session_pool": self.session_pool,
+            "proxy_pool": self.proxy_pool,
             "browser_info": self.browser_info,
             "browser_info_tiktok": self.browser_info_tiktok,
         }
@@ -956,6 +1248,8 @@ class Parameter:
             self.client_tiktok = create_client(timeout=self.timeout, proxy=self.proxy_tiktok)
         if cookie_updated:
             await self.update_params_offline()
+        if "proxy_pool" in data:
+            await self.update_proxy_pool()
         self.settings.update(self.get_settings_data())
 
     async def __update_cookie_data(self, data: dict) -> None:
@@ -1015,11 +1309,11 @@ class Parameter:
     ):
         self.cookie_dict, self.cookie_str = self.__check_cookie(cookie)
         self.cookie_state = self.__check_cookie_state()
-        self.set_uif_id()
         self.cookie_dict_tiktok, self.cookie_str_tiktok = self.__check_cookie_tiktok(
             cookie_tiktok
         )
         self.cookie_tiktok_state = self.__check_cookie_state(True)
+        self.set_credentials()
         self.set_headers_cookie()
         self.__update_download_headers_tiktok()
 
@@ -1071,8 +1365,23 @@ class Parameter:
         return value if isinstance(value, str) else ""
 
     async def close_client(self) -> None:
+        await self.credentials.close()
         await self.client.aclose()
         await self.client_tiktok.aclose()
+        await self.proxies.close()
+        await self.proxies_tiktok.close()
+
+    async def update_proxy_pool(self) -> None:
+        await self.proxies.update(
+            self.proxy_pool["douyin"],
+            self.proxy_pool["failures"],
+            self.proxy_pool["eject"],
+        )
+        await self.proxies_tiktok.update(
+            self.proxy_pool["tiktok"],
+            self.proxy_pool["failures"],
+            self.proxy_pool["eject"],
+        )
 
     def __generate_folders(self):
         self.refresh_storage_paths()
@@ -92,6 +92,49 @@ class Settings:
         "live_qualities": "",
         "douyin_platform": True,
         "tiktok_platform": True,
+        "deduplicate": False,
+        "mirror_race": False,
+        "video_policy": {
+            "resolution": 0,
+            "file_size": 0,
+            "batch_size": 0,
+            "h265": False,
+        },
+        "log_options": {
+            "json": False,
+            "max_size": 0,
+            "when": "",
+            "backup_count": 5,
+            "level": "DEBUG",
+        },
+        "verify_moov": False,
+        "preflight": {
+            "switch": False,
+            "order": "",
+            "concurrency": 8,
+        },
+        "disk_watermark": 0,
+        "cache_cleanup": {
+            "max_age": 168,
+            "max_size": 0,
+            "interval": 60,
+        },
+        "bandwidth": {
+            "global": 0,
+            "douyin": 0,
+            "tiktok": 0,
+            "kuaishou": 0,
+        },
+        "session_pool": {
+            "rate": 30,
+            "cooldown": 600,
+        },
+        "proxy_pool": {
+            "douyin": [],
+            "tiktok": [],
+            "failures": 3,
+            "eject": 300,
+        },
         "browser_info": {
             "User-Agent": USERAGENT,
             "pc_libra_divert": "Windows",
@@ -1,12 +1,11 @@
-from asyncio import Semaphore, gather
-from datetime import datetime
+from asyncio import Semaphore, gather, to_thread
+from datetime import datetime, timedelta
 from pathlib import Path
-from shutil import move
+from shutil import disk_usage, move
 from time import time
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Callable, Union
 
-from aiofiles import open
 from httpx import HTTPStatusError, RequestError, StreamError
 from rich.progress import (
     BarColumn,
@@ -23,20 +22,33 @@ from ..custom import (
     MAX_WORKERS,
     PROGRESS,
 )
+from ..extract.policy import VideoPolicy
+from ..storage import Library
 from ..tools import (
+    BANDWIDTH,
     CacheError,
+    DirectoryIndex,
     DownloaderError,
     FakeProgress,
+    PROGRESS_FACTORY,
     Retry,
     beautify_string,
     format_size,
 )
 from ..translation import _
+from .mirror import Mirror
+from .preflight import Preflight
+from .resume import ResumeIndex
+from .space import DiskSpace
+from .store import BlobStore
+from .verify import FileVerifier
+from .writer import FileWriter, ProgressThrottle
 
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
     from ..config import Parameter
+    from .space import Reservation
 
 __all__ = ["Downloader"]
 
@@ -88,6 +100,24 @@ class Downloader:
         self.timeout = params.timeout
         self.ffmpeg = params.ffmpeg
         self.truncate = params.truncate
+        self.index = DirectoryIndex()
+        self.store = BlobStore(
+            params.root.joinpath("Store"),
+            params.recorder.database,
+            params.deduplicate,
+        )
+        self.library = Library(params.recorder.database)
+        self.mirror = Mirror(params.mirror_race)
+        self.policy = VideoPolicy(**params.video_policy)
+        self.media = params.media
+        self.verifier = FileVerifier(params.verify_moov)
+        self.preflight = Preflight(**params.preflight)
+        self.space = DiskSpace(self.log, params.disk_watermark)
+        self.resume = ResumeIndex(self.log, **params.cache_cleanup)
+        self.received = 0  # 已接收的字节数
+        self.throughput = 0.0  # 上一批下载任务的平均下载速度
+        self.batches = 0  # 正在运行的批量下载任务数量
+        self.files = SimpleNamespace(succeeded=0, failed=0)  # 累计下载文件数量
         self.general_progress_object: Callable = self.init_general_progress(
             server_mode,
         )
@@ -106,6 +136,10 @@ class Downloader:
             return self.__fake_progress_object
         return self.__general_progress_object
 
+    def progress_object(self):
+        """优先使用当前任务设置的进度条"""
+        return (PROGRESS_FACTORY.get() or self.general_progress_object)()
+
     @staticmethod
     def __fake_progress_object(
         *args,
@@ -158,19 +192,21 @@ class Downloader:
         type_: str,
         tiktok=False,
         **kwargs,
-    ) -> None:
+    ) -> tuple[int, int]:
+        """返回下载成功与失败的文件数量，直播下载由 ffmpeg 处理，不计入数量"""
         if not self.download or not data:
-            return
+            return 0, 0
         self.log.info(_("开始下载作品文件"))
         match type_:
             case "batch":
-                await self.run_batch(data, tiktok, **kwargs)
+                return await self.run_batch(data, tiktok, **kwargs)
             case "detail":
-                await self.run_general(data, tiktok, **kwargs)
+                return await self.run_general(data, tiktok, **kwargs)
             case "music":
-                await self.run_music(data, tiktok=tiktok, **kwargs)
+                return await self.run_music(data, tiktok=tiktok, **kwargs)
             case "live":
                 await self.run_live(data, tiktok, **kwargs)
+                return 0, 0
             case _:
                 raise ValueError
 
@@ -186,7 +222,7 @@ class Downloader:
         mix_title: str = "",
         collect_id: str = "",
         collect_name: str = "",
-    ):
+    ) -> tuple[int, int]:
         root = self.storage_folder(
             mode,
             *self.data_classification(
@@ -201,15 +237,17 @@ class Downloader:
             ),
             tiktok=tiktok,
         )
-        await self.batch_processing(
+        return await self.batch_processing(
             data,
             root,
             tiktok=tiktok,
         )
 
-    async def run_general(self, data: list[dict], tiktok: bool, **kwargs):
+    async def run_general(
+        self, data: list[dict], tiktok: bool, **kwargs
+    ) -> tuple[int, int]:
         root = self.storage_folder(mode="detail", tiktok=tiktok)
-        await self.batch_processing(
+        return await self.batch_processing(
             data,
             root,
             tiktok=tiktok,
@@ -221,9 +259,10 @@ class Downloader:
         *,
         tiktok: bool = False,
         **kwargs,
-    ):
+    ) -> tuple[int, int]:
         root = self._storage_root(tiktok).joinpath("Music")
         tasks = []
+        self.index.clear()
         for i in data:
             name = self.generate_music_name(i)
             temp_root, actual_root = self.deal_folder_path(
@@ -243,8 +282,8 @@ class Downloader:
                 True,
                 type_=_("音乐"),
             )
-        await self.downloader_chart(
-            tasks, SimpleNamespace(), self.general_progress_object(), **kwargs
+        return await self.downloader_chart(
+            tasks, SimpleNamespace(), self.progress_object(), **kwargs
         )
 
     async def run_live(
@@ -300,7 +339,9 @@ class Downloader:
             self.headers["User-Agent"],
         )
 
-    async def batch_processing(self, data: list[dict], root: Path, **kwargs):
+    async def batch_processing(
+        self, data: list[dict], root: Path, **kwargs
+    ) -> tuple[int, int]:
         tiktok = bool(kwargs.get("tiktok", False))
         count = SimpleNamespace(
             downloaded_image=set(),
@@ -311,56 +352,142 @@ class Downloader:
             skipped_live=set(),
         )
         tasks = []
-        for item in data:
-            item["desc"] = beautify_string(
-                item["desc"],
-                self.desc_length,
-            )
-            name = self.generate_detail_name(item)
-            temp_root, actual_root = self.deal_folder_path(
-                root,
-                name,
-                self.folder_mode,
-                tiktok=tiktok,
-            )
-            params = {
-                "tasks": tasks,
-                "name": name,
-                "id_": item["id"],
-                "item": item,
-                "temp_root": temp_root,
-                "actual_root": actual_root,
-            }
-            if (t := item["type"]) == _("图集"):
-                await self.download_image(
-                    **params,
-                    type_=_("图集"),
-                    skipped=count.skipped_image,
+        # 多个批量下载任务同时运行时，保留其他任务的目录索引与备用链接
+        if not self.batches:
+            self.index.clear()
+            self.mirror.clear()
+        self.batches += 1
+        try:
+            if self.resume.due():
+                await self.resume.clean(self._cache_root(False), self._cache_root(True))
+            await self.estimate_size(data)
+            await self.library.update(data, tiktok)
+            for item in data:
+                self.mirror.update(self.media.pop(item["id"])["mirrors"])
+                item["desc"] = beautify_string(
+                    item["desc"],
+                    self.desc_length,
                 )
-            elif t == _("视频"):
-                await self.download_video(
-                    **params,
-                    type_=_("视频"),
-                    skipped=count.skipped_video,
+                name = self.generate_detail_name(item)
+                temp_root, actual_root = self.deal_folder_path(
+                    root,
+                    name,
+                    self.folder_mode,
+                    tiktok=tiktok,
                 )
-            elif t == _("实况"):
-                await self.download_image(
-                    suffix="mp4",
-                    type_=_("实况"),
+                params = {
+                    "tasks": tasks,
+                    "name": name,
+                    "id_": item["id"],
+                    "item": item,
+                    "temp_root": temp_root,
+                    "actual_root": actual_root,
+                }
+                if (t := item["type"]) == _("图集"):
+                    await self.download_image(
+                        **params,
+                        type_=_("图集"),
+                        skipped=count.skipped_image,
+                    )
+                elif t == _("视频"):
+                    await self.download_video(
+                        **params,
+                        type_=_("视频"),
+                        skipped=count.skipped_video,
+                    )
+                elif t == _("实况"):
+                    await self.download_image(
+                        suffix="mp4",
+                        type_=_("实况"),
+                        **params,
+                        skipped=count.skipped_live,
+                    )
+                else:
+                    raise DownloaderError
+                self.download_music(
                     **params,
-                    skipped=count.skipped_live,
+                    type=_("音乐"),
                 )
-            else:
-                raise DownloaderError
-            self.download_music(
-                **params,
-                type=_("音乐"),
+                self.download_cover(**params)
+            tasks = await self.preflight_tasks(tasks, tiktok)
+            result = await self.downloader_chart(
+                tasks, count, self.progress_object(), **kwargs
             )
-            self.download_cover(**params)
-        await self.downloader_chart(
-            tasks, count, self.general_progress_object(), **kwargs
+            self.statistics_count(count)
+            return result
+        finally:
+            self.batches -= 1
+            # 下载失败或跳过下载的作品不再占用，避免心跳持续占用作品
+            await self.recorder.release(*(i["id"] for i in data))
+
+    async def estimate_size(self, data: list[dict]) -> int:
+        """下载前按照批量大小限制调整视频清晰度，并汇总预计下载的视频文件大小"""
+        videos = [
+            (i, self.media.get(i["id"]))
+            for i in data
+            if i["type"] == _("视频") and not await self.is_downloaded(i["id"])
+        ]
+        if size := self.policy.budget(videos):
+            self.log.info(
+                _("预计下载视频文件大小: {size}").format(size=format_size(size))
+            )
+        return size
+
+    async def preflight_tasks(self, tasks: list[tuple], tiktok: bool) -> list[tuple]:
+        """获取全部文件大小，跳过超出大小限制的文件，检查磁盘剩余空间并排序下载任务"""
+        if not (self.preflight.switch and tasks):
+            return tasks
+        sizes = await self.preflight.run(
+            self.client_tiktok if tiktok else self.client,
+            [i[0] for i in tasks],
+            self.__adapter_headers(None, tiktok),
         )
-        self.statistics_count(count)
+        result, known, remaining = [], [], 0
+        for task in tasks:
+            size = sizes[task[0]]
+            if self.max_size and size > self.max_size:
+                self.log.info(
+                    _("{show} 文件大小超出限制，跳过下载").format(show=task[3])
+                )
+                continue
+            result.append(task)
+            known.append(size)
+            if size:
+                remaining += max(size - self.__get_resume_byte_position(task[1]), 0)
+        self.log.info(
+            _(
+                "预计下载文件大小: {size}，文件数量: {count}，未知大小: {unknown}"
+            ).format(
+                size=format_size(remaining),
+                count=len(result),
+                unknown=known.count(0),
+            )
+        )
+        if self.throughput and remaining:
+            self.log.info(
+                _("预计下载耗时: {time}").format(
+                    time=timedelta(seconds=round(remaining / self.throughput))
+                )
+            )
+        await to_thread(self.check_disk_space, result, remaining, tiktok)
+        return self.preflight.sort(result, known)
+
+    def check_disk_space(self, tasks: list[tuple], size: int, tiktok: bool) -> None:
+        """缓存文件夹与存储文件夹空间不足时提示，下载过程中按磁盘水位线暂停"""
+        if not (tasks and size):
+            return
+        folders = {}
+        for i in (self._cache_root(tiktok), tasks[0][2].parent):
+            path = next((j for j in (i, *i.parents) if j.exists()), None)
+            if path:
+                folders.setdefault(path.stat().st_dev, path)
+        for path in folders.values():
+            if (free := disk_usage(path).free) < size:
+                self.log.warning(
+                    _("{path} 磁盘剩余空间 {free} 不足以下载全部文件").format(
+                        path=path, free=format_size(free)
+                    )
+                )
 
     async def downloader_chart(
         self,
@@ -369,7 +496,9 @@ class Downloader:
         progress: Progress,
         semaphore: Semaphore = None,
         **kwargs,
-    ):
+    ) -> tuple[int, int]:
+        """返回下载成功与失败的文件数量"""
+        start, received = time(), self.received
         with progress:
             tasks = [
                 self.request_file(
@@ -381,7 +510,13 @@ class Downloader:
                 )
                 for task in tasks
             ]
-            await gather(*tasks)
+            results = await gather(*tasks)
+        if (received := self.received - received) and (elapsed := time() - start):
+            self.throughput = received / elapsed
+        succeeded = sum(map(bool, results))
+        self.files.succeeded += succeeded
+        self.files.failed += len(results) - succeeded
+        return succeeded, len(results) - succeeded
 
     def deal_folder_path(
         self,
@@ -401,9 +536,8 @@ class Downloader:
     async def is_downloaded(self, id_: str) -> bool:
         return await self.recorder.has_id(id_)
 
-    @staticmethod
-    def is_exists(path: Path) -> bool:
-        return path.exists()
+    def is_exists(self, path: Path) -> bool:
+        return self.index.exists(path)
 
     async def is_skip(self, id_: str, path: Path) -> bool:
         return await self.is_downloaded(id_) or self.is_exists(path)
@@ -456,6 +590,7 @@ class Downloader:
                     f"【{type_}】{name}_{index}",
                     id_,
                     suffix,
+                    self.store.key(suffix, f"{id_}_{index}"),
                 )
             )
 
@@ -500,6 +635,7 @@ class Downloader:
                 f"【{type_}】{name}",
                 id_,
                 suffix,
+                self.store.key(suffix, id_),
             )
         )
 
@@ -533,6 +669,7 @@ class Downloader:
                     ),
                     id_,
                     suffix,
+                    self.store.uri(suffix, url),
                 )
             )
 
@@ -565,6 +702,7 @@ class Downloader:
                     f"【封面】{name}",
                     id_,
                     static_suffix,
+                    self.store.key(static_suffix, id_),
                 )
             )
         if all(
@@ -584,6 +722,7 @@ class Downloader:
                     f"【动图】{name}",
                     id_,
                     dynamic_suffix,
+                    self.store.key(dynamic_suffix, id_),
                 )
             )
 
@@ -605,80 +744,161 @@ class Downloader:
         show: str,
         id_: str,
         suffix: str,
+        key: str,
         count: SimpleNamespace,
         progress: Progress,
         headers: dict = None,
         tiktok=False,
         unknown_size=False,
         semaphore: Semaphore = None,
+    ) -> bool:
+        """代理网络异常时更换代理重新请求，每次重试最多尝试代理池中的全部代理"""
+        if (blob := await self.store.lookup(key)) and await self.link_file(
+            *blob, actual, show, id_, count
+        ):
+            return True
+        proxies = self.params.proxies_tiktok if tiktok else self.params.proxies
+        attempts = max(len(proxies.proxies), 1)
+        for attempt in range(attempts):
+            if (
+                result := await self.__request_file(
+                    url,
+                    temp,
+                    actual,
+                    show,
+                    id_,
+                    suffix,
+                    key,
+                    count,
+                    progress,
+                    headers,
+                    tiktok,
+                    unknown_size,
+                    semaphore,
+                    attempt == attempts - 1,
+                )
+            ) is not None:
+                return result
+        return False
+
+    async def __request_file(
+        self,
+        url: str,
+        temp: Path,
+        actual: Path,
+        show: str,
+        id_: str,
+        suffix: str,
+        key: str,
+        count: SimpleNamespace,
+        progress: Progress,
+        headers: dict,
+        tiktok: bool,
+        unknown_size: bool,
+        semaphore: Semaphore | None,
+        last: bool,
     ) -> bool | None:
+        """请求一次文件，代理网络异常或返回代理错误响应码且可以更换代理时返回 None"""
         async with semaphore or self.semaphore:
             client = self.client_tiktok if tiktok else self.client
-            headers = self.__adapter_headers(
+            proxies = self.params.proxies_tiktok if tiktok else self.params.proxies
+            if proxy := proxies.choose():
+                client = proxy.client
+            request_headers = self.__adapter_headers(
                 headers,
                 tiktok,
             )
             self.__record_request_messages(
                 show,
                 url,
-                headers,
+                request_headers,
             )
             try:
                 # length, suffix = await self.__head_file(client, url, headers, suffix, )
                 position = self.__update_headers_range(
-                    headers,
+                    request_headers,
                     temp,
+                    actual,
                 )
-                async with client.stream(
-                    "GET",
-                    url,
-                    headers=headers,
-                ) as response:
-                    if response.status_code == 416:
-                        raise CacheError(_("文件缓存异常，尝试重新下载"))
-                    response.raise_for_status()
-                    length, suffix = self._extract_content(
-                        response.headers,
-                        suffix,
-                    )
-                    length += position
-                    self._record_response(
-                        response,
-                        show,
-                        length,
-                    )
-                    match self._download_initial_check(
-                        length,
-                        unknown_size,
-                        show,
-                    ):
-                        case 1:
-                            return await self.download_file(
-                                temp,
-                                actual.with_suffix(
-                                    f".{suffix}",
-                                ),
-                                show,
-                                id_,
-                                response,
-                                length,
-                                position,
-                                count,
-                                progress,
-                            )
-                        case 0:
-                            return True
-                        case -1:
-                            return False
-                        case _:
-                            raise DownloaderError
+                async with self.space.reserve(
+                    self.__estimate_remaining(url, position),
+                    temp,
+                    actual,
+                    notify=getattr(progress, "emit", None),
+                ) as reservation:
+                    start = time()
+                    async with self.mirror.stream(
+                        client,
+                        url,
+                        request_headers,
+                    ) as response:
+                        if response.status_code == 416:
+                            raise CacheError(_("文件缓存异常，尝试重新下载"))
+                        response.raise_for_status()
+                        proxies.record(proxy, response.status_code, time() - start)
+                        if position and response.status_code == 200:
+                            # 文件已变更或服务器不支持续传，返回完整文件内容
+                            self.resume.remove(temp)
+                            position = 0
+                        length, suffix = self._extract_content(
+                            response.headers,
+                            suffix,
+                        )
+                        length += position
+                        reservation.update(length - position)
+                        await to_thread(
+                            self.resume.write,
+                            temp,
+                            url,
+                            response.headers,
+                            length,
+                            actual,
+                            actual.with_suffix(f".{suffix}"),
+                        )
+                        self._record_response(
+                            response,
+                            show,
+                            length,
+                        )
+                        match self._download_initial_check(
+                            length,
+                            unknown_size,
+                            show,
+                        ):
+                            case 1:
+                                return await self.download_file(
+                                    temp,
+                                    actual.with_suffix(
+                                        f".{suffix}",
+                                    ),
+                                    show,
+                                    id_,
+                                    response,
+                                    length,
+                                    position,
+                                    count,
+                                    progress,
+                                    key,
+                                    tiktok,
+                                    reservation,
+                                )
+                            case 0:
+                                return True
+                            case -1:
+                                return False
+                            case _:
+                                raise DownloaderError
             except RequestError as e:
                 self.log.warning(_("网络异常: {error_repr}").format(error_repr=repr(e)))
-                return False
+                proxies.record(proxy)
+                return None if proxy and not last else False
             except HTTPStatusError as e:
+                proxies.record(proxy, e.response.status_code, time() - start)
                 self.log.warning(
                     _("响应码异常: {error_repr}").format(error_repr=repr(e))
                 )
+                if proxy and not last and e.response.status_code in proxies.FAILED:
+                    return None
                 self.console.warning(
                     _(
                         "如果 TikTok 平台作品下载功能异常，请检查配置文件中 browser_info_tiktok 的 device_id 参数！"
@@ -686,7 +906,7 @@ class Downloader:
                 )
                 return False
             except CacheError as e:
-                self.delete(temp)
+                self.resume.remove(temp)
                 self.log.error(str(e))
                 return False
             except Exception as e:
@@ -696,9 +916,15 @@ class Downloader:
                     ).format(error=repr(e)),
                 )
                 self.log.error(f"URL: {url}", False)
-                self.log.error(f"Headers: {headers}", False)
+                self.log.error(f"Headers: {request_headers}", False)
                 return False
 
+    def __estimate_remaining(self, url: str, position: int) -> int:
+        """获取响应头前，使用预检获取的文件大小预留磁盘空间"""
+        if size := self.preflight.cache.get(url):
+            return max(size - position, 0)
+        return 0
+
     async def download_file(
         self,
         cache: Path,
@@ -710,18 +936,36 @@ class Downloader:
         position: int,
         count: SimpleNamespace,
         progress: Progress,
+        key: str = "",
+        tiktok: bool = False,
+        reservation: "Reservation" = None,
     ) -> bool:
+        digest = (
+            await self.store.hasher(cache, position)
+            if self.store.switch and key
+            else None
+        )
         task_id = progress.add_task(
             beautify_string(show, self.truncate),
             total=content or None,
             completed=position,
         )
+        throttle = ProgressThrottle(progress, task_id)
+        self.resume.active.add(cache)
         try:
-            async with open(cache, "ab") as f:
-                async for chunk in response.aiter_bytes(self.chunk):
+            async with FileWriter(cache, digest) as f:
+                async for chunk in BANDWIDTH.iterate(
+                    response.aiter_bytes(self.chunk),
+                    "tiktok" if tiktok else "douyin",
+                ):
                     await f.write(chunk)
-                    progress.update(task_id, advance=len(chunk))
-                progress.remove_task(task_id)
+                    throttle.update(len(chunk))
+                    if reservation:
+                        # 已写入的数据已计入磁盘已用空间，不再重复预留
+                        reservation.update(max(content - position - f.written, 0))
+            throttle.flush()
+            progress.remove_task(task_id)
+            self.received += cache.stat().st_size - position
         except (
             RequestError,
             StreamError,
@@ -733,23 +977,129 @@ class Downloader:
             # self.delete_file(cache)
             await self.recorder.delete_id(id_)
             return False
-        self.save_file(cache, actual)
+        finally:
+            self.resume.active.discard(cache)
+        if not await self.verify_file(cache, actual, show, content, response):
+            await self.recorder.delete_id(id_)
+            return False
+        if digest:
+            await self.store.save(cache, actual, key, digest.hexdigest())
+        else:
+            self.save_file(cache, actual)
+        self.resume.discard(cache)
+        self.index.add(actual)
+        await self.library.link(id_, actual)
         self.log.info(_("{show} 文件下载成功").format(show=show))
         self.log.info(f"文件路径 {actual.resolve()}", False)
         await self.recorder.update_id(id_)
         self.add_count(show, id_, count)
         return True
 
+    async def link_file(
+        self,
+        blob: Path,
+        suffix: str,
+        actual: Path,
+        show: str,
+        id_: str,
+        count: SimpleNamespace,
+    ) -> bool:
+        """资源已存在于内容寻址存储，直接链接文件，无需重新下载"""
+        actual = actual.with_suffix(f".{suffix}")
+        # 校验作品库时发现的损坏文件仍保留在存储库，链接前需要完整校验视频文件结构
+        if error := await to_thread(self.verifier.check, blob, 0, suffix, True):
+            self.log.warning(
+                _("{show} 已存储文件校验失败：{error}，重新下载文件").format(
+                    show=show, error=error
+                )
+            )
+            await to_thread(blob.unlink, True)
+            return False
+        try:
+            await to_thread(self.store.link, blob, actual)
+        except OSError as e:
+            self.log.warning(
+                _("{show} 链接已存储文件失败：{error}").format(show=show, error=repr(e))
+            )
+            return False
+        self.index.add(actual)
+        await self.library.link(id_, actual)
+        self.log.info(
+            _("{show} 文件已存在于存储库，已链接至目标路径").format(show=show)
+        )
+        self.log.info(f"文件路径 {actual.resolve()}", False)
+        await self.recorder.update_id(id_)
+        self.add_count(show, id_, count)
+        return True
+
+    async def verify_file(
+        self,
+        cache: Path,
+        actual: Path,
+        show: str,
+        content: int,
+        response,
+    ) -> bool:
+        """校验下载完成的缓存文件，文件不完整时保留缓存以便断点续传，否则删除缓存"""
+        # 响应内容经过压缩时，文件大小与 Content-Length 不一致
+        length = (
+            0
+            if response.headers.get("Content-Encoding", "identity") != "identity"
+            else content
+        )
+        if not (
+            error := await to_thread(
+                self.verifier.check,
+                cache,
+                length,
+                actual.suffix.lstrip("."),
+            )
+        ):
+            return True
+        self.log.warning(
+            _("{show} 文件校验失败：{error}").format(show=show, error=error)
+        )
+        if not length or cache.stat().st_size >= length:
+            self.resume.remove(cache)
+        return False
+
+    async def verify_library(self) -> list[dict]:
+        """校验作品库关联的本地文件，删除损坏的文件及其下载记录，以便重新下载"""
+        corrupt = []
+        for i in await self.library.files():
+            if not (path := Path(i["PATH"])).is_file():
+                continue
+            if error := await to_thread(
+                self.verifier.check,
+                path,
+                0,
+                path.suffix.lstrip("."),
+                True,
+            ):
+                corrupt.append({"id": i["ID"], "path": str(path), "error": error})
+        for i in corrupt:
+            self.log.warning(
+                _("{path} 文件校验失败：{error}").format(
+                    path=i["path"], error=i["error"]
+                )
+            )
+            self.delete_file(Path(i["path"]))
+            await self.recorder.delete_id(i["id"])
+        await self.library.unlink(*(i["path"] for i in corrupt))
+        return corrupt
+
     def __record_request_messages(
         self,
         show: str,
         url: str,
         headers: dict,
     ):
-        self.log.info(f"{show} URL: {url}", False)
+        if not self.log.detailed:
+            return
+        self.log.detail("%s URL: %s", show, url)
         # 请求头脱敏处理，不记录 Cookie
         desensitize = {k: v for k, v in headers.items() if k != "Cookie"}
-        self.log.info(f"{show} Headers: {desensitize}", False)
+        self.log.detail("%s Headers: %s", show, desensitize)
 
     def __adapter_headers(
         self,
@@ -838,6 +1188,12 @@ class Downloader:
             length=self.name_length,
         )
 
+    def restore_detail_name(self, data: dict) -> str:
+        """根据原始作品数据还原作品文件名称"""
+        return self.generate_detail_name(
+            data | {"desc": beautify_string(data["desc"], self.desc_length)}
+        )
+
     def generate_music_name(self, data: dict) -> str:
         """生成音乐文件名称"""
         return beautify_string(
@@ -876,6 +1232,7 @@ class Downloader:
 
     def delete_file(self, path: Path):
         path.unlink()
+        self.index.discard(path)
         self.log.info(_("{file_name} 文件已删除").format(file_name=path.name))
 
     def statistics_count(self, count: SimpleNamespace):
@@ -916,13 +1273,12 @@ class Downloader:
         show: str,
         length: int,
     ):
-        self.log.info(f"{show} Response URL: {response.url}", False)
-        self.log.info(f"{show} Response Code: {response.status_code}", False)
-        self.log.info(f"{show} Response Headers: {response.headers}", False)
-        self.log.info(
-            f"{show} 文件大小 {format_size(length)}",
-            False,
-        )
+        if not self.log.detailed:
+            return
+        self.log.detail("%s Response URL: %s", show, response.url)
+        self.log.detail("%s Response Code: %s", show, response.status_code)
+        self.log.detail("%s Response Headers: %s", show, response.headers)
+        self.log.detail("%s 文件大小 %s", show, format_size(length))
 
     async def __head_file(
         self,
@@ -968,13 +1324,12 @@ class Downloader:
         self,
         headers: dict,
         file: Path,
-        length: int = 0,
+        target: Path,
     ) -> int:
-        position = self.__get_resume_byte_position(file)
-        # if length and position >= length:
-        #     self.delete(file)
-        #     position = 0
+        position, validator = self.resume.check(file, target)
         headers["Range"] = f"bytes={position}-"
+        if validator:
+            headers["If-Range"] = validator
         return position
 
     def __extract_type(self, content: str) -> str:
@@ -0,0 +1,141 @@
+from asyncio import FIRST_COMPLETED, CancelledError, create_task, wait
+from contextlib import asynccontextmanager, suppress
+from time import perf_counter
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from httpx import HTTPStatusError, RequestError
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
+__all__ = ["Mirror"]
+
+
+class Mirror:
+    """作品文件镜像地址，按域名响应耗时排序，请求失败或响应过慢时切换下一镜像"""
+
+    SLOW_START = 5  # 等待响应头超过该时间则切换下一镜像
+    PENALTY = 30.0  # 请求失败的域名记为该耗时
+    WEIGHT = 0.3  # 响应耗时的指数移动平均权重
+
+    def __init__(self, race: bool = False):
+        self.race = race
+        self.urls: dict[str, list[str]] = {}
+        self.latency: dict[str, float] = {}
+
+    def update(self, mirrors: dict[str, list[str]] | None) -> None:
+        if mirrors:
+            self.urls.update(mirrors)
+
+    def clear(self) -> None:
+        self.urls.clear()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc
+
+    def record(self, url: str, latency: float) -> None:
+        host = self.host(url)
+        if (old := self.latency.get(host)) is None:
+            self.latency[host] = latency
+        else:
+            self.latency[host] = old + (latency - old) * self.WEIGHT
+
+    def failure(self, url: str) -> None:
+        self.record(url, self.PENALTY)
+
+    def order(self, url: str) -> list[str]:
+        """未知域名使用已知域名的平均耗时，排序稳定，耗时相同时保持接口返回的顺序"""
+        urls = self.urls.get(url) or [url]
+        if not self.latency:
+            return list(urls)
+        default = sum(self.latency.values()) / len(self.latency)
+        return sorted(urls, key=lambda i: self.latency.get(self.host(i), default))
+
+    def groups(self, urls: list[str]) -> list[list[str]]:
+        size = 2 if self.race else 1
+        return [urls[i : i + size] for i in range(0, len(urls), size)]
+
+    @asynccontextmanager
+    async def stream(self, client: "AsyncClient", url: str, headers: dict):
+        """依次尝试镜像地址，返回首个可用的响应；最后一组镜像不限制响应耗时"""
+        groups = self.groups(self.order(url))
+        response = None
+        for index, group in enumerate(groups):
+            last = index == len(groups) - 1
+            try:
+                response = await self.__open(
+                    client,
+                    group,
+                    headers,
+                    None if last else self.SLOW_START,
+                )
+                break
+            except (RequestError, HTTPStatusError, TimeoutError):
+                if last:
+                    raise
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def __open(
+        self,
+        client: "AsyncClient",
+        urls: list[str],
+        headers: dict,
+        timeout: float | None,
+    ) -> "Response":
+        """同时请求多个镜像时，使用最先返回响应的镜像并取消其余请求"""
+        tasks = {create_task(self.__send(client, i, headers)): i for i in urls}
+        pending, response, error = set(tasks), None, None
+        try:
+            while pending and not response:
+                done, pending = await wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    for task in pending:
+                        self.record(tasks[task], self.SLOW_START)
+                    raise TimeoutError
+                for task in done:
+                    if task.exception():
+                        error = task.exception()
+                    elif response:
+                        await task.result().aclose()
+                    else:
+                        response = task.result()
+            if response:
+                return response
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+                with suppress(CancelledError, RequestError, HTTPStatusError):
+                    await (await task).aclose()
+
+    async def __send(
+        self,
+        client: "AsyncClient",
+        url: str,
+        headers: dict,
+    ) -> "Response":
+        start = perf_counter()
+        try:
+            response = await client.send(
+                client.build_request("GET", url, headers=headers),
+                stream=True,
+            )
+        except RequestError:
+            self.failure(url)
+            raise
+        # 416 表示缓存文件异常，与镜像无关，交由调用方处理
+        if response.status_code != 416 and response.is_error:
+            await response.aclose()
+            self.failure(url)
+            response.raise_for_status()
+        self.record(url, perf_counter() - start)
+        return response
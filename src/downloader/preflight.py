@@ -0,0 +1,80 @@
+from asyncio import Semaphore, gather
+from re import compile
+from typing import TYPE_CHECKING
+
+from httpx import HTTPError
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+__all__ = ["Preflight"]
+
+
+class Preflight:
+    """下载前并发获取文件大小，用于排序下载任务、跳过超出大小限制的文件与估算耗时"""
+
+    CONTENT_RANGE = compile(r"/(\d+)$")
+    CACHE = 10000  # 缓存数量上限
+    ORDER = {"", "largest", "smallest"}
+
+    def __init__(
+        self,
+        switch: bool = False,
+        order: str = "",
+        concurrency: int = 8,
+        **kwargs,
+    ):
+        self.switch = switch
+        self.order = order
+        self.concurrency = concurrency
+        # 使用完整链接作为缓存键，抖音视频链接的路径相同，仅查询参数 video_id 不同
+        self.cache: dict[str, int] = {}
+
+    async def run(
+        self,
+        client: "AsyncClient",
+        urls: list[str],
+        headers: dict,
+    ) -> dict[str, int]:
+        """返回链接对应的文件大小，获取失败时为 0"""
+        semaphore = Semaphore(self.concurrency)
+        if len(self.cache) > self.CACHE:
+            self.cache.clear()
+
+        async def probe(url: str) -> None:
+            if url in self.cache:
+                return
+            async with semaphore:
+                if size := await self.probe(client, url, headers):
+                    self.cache[url] = size
+
+        await gather(*(probe(i) for i in set(urls)))
+        return {i: self.cache.get(i, 0) for i in urls}
+
+    @classmethod
+    async def probe(cls, client: "AsyncClient", url: str, headers: dict) -> int:
+        """部分 CDN 不支持 HEAD 请求，使用仅请求首个字节的 GET 请求获取文件大小"""
+        try:
+            async with client.stream(
+                "GET",
+                url,
+                headers=headers | {"Range": "bytes=0-0"},
+            ) as response:
+                if response.status_code == 206:
+                    match = cls.CONTENT_RANGE.search(
+                        response.headers.get("Content-Range", "")
+                    )
+                    return int(match.group(1)) if match else 0
+                if response.is_success:
+                    return int(response.headers.get("Content-Length", 0))
+        except (HTTPError, ValueError):
+            pass
+        return 0
+
+    def sort(self, tasks: list, sizes: list[int]) -> list:
+        """按文件大小排序下载任务，文件大小未知的任务排在最后"""
+        if not self.order:
+            return tasks
+        known = [(t, s) for t, s in zip(tasks, sizes) if s]
+        known.sort(key=lambda x: x[1], reverse=self.order == "largest")
+        return [t for t, _ in known] + [t for t, s in zip(tasks, sizes) if not s]
@@ -0,0 +1,150 @@
+from asyncio import to_thread
+from contextlib import suppress
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING
+
+from ..tools import format_size
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+
+__all__ = ["ResumeIndex"]
+
+
+class ResumeIndex:
+    """断点续传索引，记录缓存文件对应的链接、校验值、文件大小与目标路径，保存在缓存文件旁"""
+
+    SUFFIX = ".resume"
+    GRACE = 3600  # 没有索引记录的缓存文件超过该时间未修改即视为孤立文件
+
+    def __init__(
+        self,
+        log: "BaseLogger | LoggerManager",
+        max_age: int = 168,
+        max_size: int = 0,
+        interval: int = 60,
+        **kwargs,
+    ):
+        self.log = log
+        self.max_age = max_age * 3600  # 缓存文件保留时长
+        self.max_size = max_size  # 缓存文件夹大小上限
+        self.interval = interval * 60  # 定期清理间隔
+        self.active: set[Path] = set()  # 正在下载的缓存文件
+        self.collected = time()
+
+    @classmethod
+    def path(cls, cache: Path) -> Path:
+        return cache.with_name(f"{cache.name}{cls.SUFFIX}")
+
+    def read(self, cache: Path) -> dict | None:
+        try:
+            return loads(self.path(cache).read_text("UTF-8"))
+        except (OSError, JSONDecodeError):
+            return None
+
+    def write(
+        self,
+        cache: Path,
+        url: str,
+        headers,
+        length: int,
+        target: Path,
+        file: Path,
+    ) -> None:
+        self.path(cache).write_text(
+            dumps(
+                {
+                    "url": url,
+                    "etag": headers.get("ETag", ""),
+                    "last_modified": headers.get("Last-Modified", ""),
+                    "length": length,
+                    "target": str(target),
+                    "file": str(file),
+                },
+                ensure_ascii=False,
+            ),
+            "UTF-8",
+        )
+
+    def discard(self, cache: Path) -> None:
+        with suppress(FileNotFoundError):
+            self.path(cache).unlink()
+
+    def remove(self, cache: Path) -> None:
+        with suppress(FileNotFoundError):
+            cache.unlink()
+        self.discard(cache)
+
+    def check(self, cache: Path, target: Path) -> tuple[int, str]:
+        """返回可续传的字节位置与 If-Range 校验值，缓存文件与当前下载任务不符时删除缓存"""
+        if not (position := cache.stat().st_size if cache.is_file() else 0):
+            self.discard(cache)
+            return 0, ""
+        if not (record := self.read(cache)):
+            # 旧版本程序生成的缓存文件，沿用按文件大小续传的方式
+            return position, ""
+        length = record.get("length", 0)
+        if record.get("target") != str(target) or 0 < length <= position:
+            self.remove(cache)
+            return 0, ""
+        return position, self.validator(record)
+
+    @staticmethod
+    def validator(record: dict) -> str:
+        """弱 ETag 不能用于 If-Range 请求头"""
+        if (etag := record.get("etag", "")) and not etag.startswith("W/"):
+            return etag
+        return record.get("last_modified", "")
+
+    def due(self) -> bool:
+        return bool(self.interval) and time() - self.collected >= self.interval
+
+    async def clean(self, *roots: Path) -> None:
+        count, size = await to_thread(self.collect, *roots)
+        if count:
+            self.log.info(
+                _("已清理缓存文件 {count} 个，释放空间 {size}").format(
+                    count=count, size=format_size(size)
+                )
+            )
+
+    def collect(self, *roots: Path) -> tuple[int, int]:
+        """删除孤立、过期的缓存文件，缓存文件夹超出大小上限时优先删除最早修改的文件"""
+        self.collected = now = time()
+        count = size = 0
+        files = []
+        for root in set(roots):
+            if not root.is_dir():
+                continue
+            for path in root.iterdir():
+                if not path.is_file() or path in self.active:
+                    continue
+                if path.suffix == self.SUFFIX:
+                    if not path.with_suffix("").exists():
+                        path.unlink()
+                    continue
+                stat = path.stat()
+                if self.__expired(path, now - stat.st_mtime):
+                    self.remove(path)
+                    count += 1
+                    size += stat.st_size
+                else:
+                    files.append((stat.st_mtime, stat.st_size, path))
+        if self.max_size and (total := sum(i[1] for i in files)) > self.max_size:
+            for __, length, path in sorted(files):
+                self.remove(path)
+                count += 1
+                size += length
+                if (total := total - length) <= self.max_size:
+                    break
+        return count, size
+
+    def __expired(self, path: Path, age: float) -> bool:
+        if not (record := self.read(path)):
+            return age > self.GRACE
+        if self.max_age and age > self.max_age:
+            return True
+        return Path(record.get("file", "")).is_file()
@@ -0,0 +1,109 @@
+from asyncio import sleep, to_thread
+from contextlib import asynccontextmanager
+from pathlib import Path
+from shutil import disk_usage
+from typing import TYPE_CHECKING, Callable
+
+from ..tools import format_size
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+
+__all__ = ["DiskSpace"]
+
+
+class Reservation:
+    """单个下载任务预留的磁盘空间"""
+
+    def __init__(self, space: "DiskSpace", size: int):
+        self.space = space
+        self.size = size
+
+    def update(self, size: int) -> None:
+        """获取响应头后，按照实际需要下载的字节数更新预留空间"""
+        self.space.reserved += size - self.size
+        self.size = size
+
+
+class DiskSpace:
+    """下载准入控制，磁盘剩余空间扣除进行中任务的预留空间后低于水位线时暂停新的下载任务"""
+
+    INTERVAL = 10  # 暂停期间检查磁盘剩余空间的间隔
+
+    def __init__(
+        self,
+        log: "BaseLogger | LoggerManager",
+        watermark: int = 0,
+    ):
+        self.log = log
+        self.watermark = watermark
+        self.reserved = 0
+        self.paused = False
+
+    @staticmethod
+    def __existing(path: Path) -> Path | None:
+        return next((i for i in (path, *path.parents) if i.exists()), None)
+
+    def available(self, *paths: Path) -> int:
+        """返回缓存与存储文件夹所在文件系统中较小的剩余空间"""
+        free = [
+            disk_usage(path).free for i in paths if (path := self.__existing(i.parent))
+        ]
+        return min(free) - self.reserved if free else 0
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        size: int,
+        *paths: Path,
+        notify: Callable[[dict], None] = None,
+    ):
+        if self.watermark:
+            await self.__wait(size, paths, notify)
+        reservation = Reservation(self, size)
+        self.reserved += size
+        try:
+            yield reservation
+        finally:
+            self.reserved -= reservation.size
+
+    async def __wait(
+        self,
+        size: int,
+        paths: tuple[Path, ...],
+        notify: Callable[[dict], None] | None,
+    ) -> None:
+        while (free := await to_thread(self.available, *paths)) - size < self.watermark:
+            if not self.paused:
+                self.paused = True
+                self.log.warning(
+                    _("磁盘剩余空间 {free} 低于 {watermark}，暂停下载新文件").format(
+                        free=format_size(max(free, 0)),
+                        watermark=format_size(self.watermark),
+                    )
+                )
+                self.__notify(notify, "disk.paused", free)
+            await sleep(self.INTERVAL)
+        if self.paused:
+            self.paused = False
+            self.log.info(
+                _("磁盘剩余空间 {free}，恢复下载").format(free=format_size(free))
+            )
+            self.__notify(notify, "disk.resumed", free)
+
+    def __notify(
+        self,
+        notify: Callable[[dict], None] | None,
+        type_: str,
+        free: int,
+    ) -> None:
+        if notify:
+            notify(
+                {
+                    "type": type_,
+                    "free": free,
+                    "watermark": self.watermark,
+                    "reserved": self.reserved,
+                }
+            )
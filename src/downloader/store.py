@@ -0,0 +1,108 @@
+from asyncio import to_thread
+from contextlib import suppress
+from hashlib import sha256
+from os import link
+from pathlib import Path
+from shutil import copy2, move
+from sys import platform
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
+    from ..manager import Database
+
+__all__ = ["BlobStore"]
+
+
+class BlobStore:
+    """内容寻址存储，相同内容的文件只保存一份，再链接至作品文件夹"""
+
+    FICLONE = 0x40049409  # Linux reflink ioctl
+    BUFFER = 1024 * 1024
+
+    def __init__(self, root: Path, database: "Database", switch: bool = False):
+        self.root = root
+        self.database = database
+        self.switch = switch
+
+    @staticmethod
+    def key(kind: str, value: str) -> str:
+        return f"{kind}:{value}" if value else ""
+
+    @classmethod
+    def uri(cls, kind: str, url: str) -> str:
+        """使用去除域名与查询参数的链接路径作为资源标识，用于跨作品共享的音乐等文件"""
+        return cls.key(kind, urlparse(url).path.strip("/")) if url else ""
+
+    def path(self, digest: str) -> Path:
+        return self.root.joinpath(digest[:2], digest[2:4], digest)
+
+    async def lookup(self, key: str) -> tuple[Path, str] | None:
+        """返回已知资源的存储文件路径与文件后缀"""
+        if not (self.switch and key):
+            return None
+        if not (row := await self.database.read_asset_data(key)):
+            return None
+        blob = self.path(row["HASH"])
+        return (blob, row["SUFFIX"]) if blob.is_file() else None
+
+    async def hasher(self, cache: Path, position: int) -> "_Hash":
+        """断点续传时需要先计算已下载部分的哈希值"""
+        if position and cache.is_file():
+            return await to_thread(self.__hash_file, cache)
+        return sha256()
+
+    @classmethod
+    def __hash_file(cls, path: Path) -> "_Hash":
+        digest = sha256()
+        with path.open("rb") as f:
+            while chunk := f.read(cls.BUFFER):
+                digest.update(chunk)
+        return digest
+
+    async def save(self, cache: Path, actual: Path, key: str, digest: str) -> None:
+        suffix = actual.suffix.lstrip(".")
+        blob = self.path(digest)
+        size = await to_thread(self.__store, cache, blob)
+        await to_thread(self.link, blob, actual)
+        await self.database.write_asset_data(key, digest, suffix, size)
+
+    @staticmethod
+    def __store(cache: Path, blob: Path) -> int:
+        if blob.is_file():
+            cache.unlink()
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            move(cache.resolve(), blob)
+        return blob.stat().st_size
+
+    @classmethod
+    def link(cls, blob: Path, target: Path) -> None:
+        """优先使用硬链接，跨文件系统时尝试 reflink，均不支持时复制文件"""
+        with suppress(FileNotFoundError):
+            target.unlink()
+        try:
+            link(blob, target)
+            return
+        except OSError:
+            pass
+        if cls.__reflink(blob, target):
+            return
+        copy2(blob, target)
+
+    @classmethod
+    def __reflink(cls, blob: Path, target: Path) -> bool:
+        if platform != "linux":
+            return False
+        from fcntl import ioctl
+
+        try:
+            with blob.open("rb") as source, target.open("wb") as destination:
+                ioctl(destination.fileno(), cls.FICLONE, source.fileno())
+            return True
+        except OSError:
+            with suppress(FileNotFoundError):
+                target.unlink()
+            return False
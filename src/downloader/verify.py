@@ -0,0 +1,80 @@
+from pathlib import Path
+from struct import unpack
+
+from ..custom import FILE_SIGNATURES, FILE_SIGNATURES_LENGTH
+from ..translation import _
+
+__all__ = ["FileVerifier"]
+
+
+class FileVerifier:
+    """下载文件完整性校验，返回校验失败原因，校验通过时返回空字符串"""
+
+    IMAGE = {"jpg", "jpeg", "png", "webp", "heic", "avif"}
+    HEIF = {"heic", "avif"}  # 兼容品牌众多，仅检查 ftyp 盒子
+    ISO = {"mp4", "m4v", "mov", "m4a"}  # ISO 基础媒体文件格式
+    # 首个盒子类型，早期 QuickTime 文件没有 ftyp 盒子
+    FIRST = {b"ftyp", b"moov", b"wide", b"free", b"mdat"}
+    HEADER = 8  # 盒子头部长度
+    LARGE = 16  # 64 位长度盒子的头部长度
+
+    def __init__(self, moov: bool = False):
+        self.moov = moov
+
+    @staticmethod
+    def signature(data: bytes) -> str:
+        for offset, signature, suffix in FILE_SIGNATURES:
+            if data[offset : offset + len(signature)] == signature:
+                return suffix
+        return ""
+
+    def check(
+        self,
+        path: Path,
+        length: int = 0,
+        suffix: str = "",
+        moov: bool = None,
+    ) -> str:
+        size = path.stat().st_size
+        if not size:
+            return _("文件内容为空")
+        if length and size != length:
+            return _("文件大小 {size} 与响应头 {length} 不一致").format(
+                size=size, length=length
+            )
+        with path.open("rb") as f:
+            head = f.read(FILE_SIGNATURES_LENGTH)
+        suffix = suffix.lower()
+        if suffix in self.HEIF and head[4:8] == b"ftyp":
+            return ""
+        if suffix in self.IMAGE and self.signature(head) not in self.IMAGE:
+            return _("文件签名与图片格式不符")
+        if suffix in self.ISO:
+            if head[4:8] not in self.FIRST:
+                return _("文件签名与视频格式不符")
+            if (self.moov if moov is None else moov) and not self.__check_boxes(
+                path, size
+            ):
+                return _("视频文件结构不完整")
+        return ""
+
+    @classmethod
+    def __check_boxes(cls, path: Path, size: int) -> bool:
+        """遍历顶层盒子，盒子长度之和需与文件大小一致且包含 moov 盒子"""
+        offset, moov = 0, False
+        with path.open("rb") as f:
+            while offset + cls.HEADER <= size:
+                f.seek(offset)
+                header = f.read(cls.LARGE)
+                length, type_ = unpack(">I4s", header[: cls.HEADER])
+                if length == 1:
+                    if len(header) < cls.LARGE:
+                        return False
+                    length = unpack(">Q", header[cls.HEADER :])[0]
+                elif not length:
+                    length = size - offset
+                if length < cls.HEADER:
+                    return False
+                moov = moov or type_ == b"moov"
+                offset += length
+        return moov and offset == size
@@ -0,0 +1,96 @@
+from asyncio import Task, create_task, to_thread
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
+    from rich.progress import Progress, TaskID
+
+__all__ = ["FileWriter", "ProgressThrottle"]
+
+
+class FileWriter:
+    """合并数据块后由后台线程写入文件，写入与接收数据同时进行"""
+
+    BUFFER = 4 * 1024 * 1024  # 缓冲区达到该大小时写入文件
+
+    def __init__(
+        self,
+        path: Path,
+        digest: "_Hash" = None,
+        buffer: int = BUFFER,
+    ):
+        self.path = path
+        self.digest = digest
+        self.size = buffer
+        self.buffer = bytearray()
+        self.written = 0  # 已提交写入的字节数
+        self.file = None
+        self.task: Task | None = None
+
+    async def __aenter__(self) -> "FileWriter":
+        self.file = await to_thread(self.path.open, "ab")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # 下载中断时同样写入已接收的数据，以便断点续传
+        try:
+            await self.flush()
+            await self.wait()
+        finally:
+            await to_thread(self.file.close)
+
+    async def write(self, chunk: bytes) -> None:
+        self.buffer += chunk
+        if len(self.buffer) >= self.size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """等待上一次写入完成后提交缓冲区数据，同一时间仅有一个写入任务"""
+        if not self.buffer:
+            return
+        await self.wait()
+        data, self.buffer = self.buffer, bytearray()
+        self.written += len(data)
+        self.task = create_task(to_thread(self.__write, data))
+
+    async def wait(self) -> None:
+        if self.task:
+            task, self.task = self.task, None
+            await task
+
+    def __write(self, data: bytearray) -> None:
+        self.file.write(data)
+        if self.digest:
+            self.digest.update(data)
+
+
+class ProgressThrottle:
+    """按时间间隔合并进度更新，减少进度条渲染开销"""
+
+    INTERVAL = 0.1
+
+    def __init__(
+        self,
+        progress: "Progress",
+        task_id: "TaskID",
+        interval: float = INTERVAL,
+    ):
+        self.progress = progress
+        self.task_id = task_id
+        self.interval = interval
+        self.advance = 0
+        self.last = perf_counter()
+
+    def update(self, advance: int) -> None:
+        self.advance += advance
+        if (now := perf_counter()) - self.last >= self.interval:
+            self.flush()
+            self.last = now
+
+    def flush(self) -> None:
+        if self.advance:
+            self.progress.update(self.task_id, advance=self.advance)
+            self.advance = 0
@@ -1,3 +1,4 @@
 from .extractor import Extractor
+from .policy import MediaIndex
 
-__all__ = ["Extractor"]
+__all__ = ["Extractor", "MediaIndex"]
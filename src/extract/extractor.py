@@ -31,6 +31,7 @@ from ..custom import (
 )
 from ..tools import DownloaderError
 from ..translation import _
+from .policy import VideoPolicy
 
 if TYPE_CHECKING:
     from datetime import date
@@ -77,6 +78,8 @@ class Extractor:
         self.log = params.logger
         self.date_format = params.date_format
         self.cleaner = params.CLEANER
+        self.policy = VideoPolicy(**params.video_policy)
+        self.media = params.media
         self.type = {
             "batch": self.__batch,
             "detail": self.__detail,
@@ -423,6 +426,7 @@ class Extractor:
             )
             item["downloads"] = [
                 self.__classify_slides_item(
+                    item,
                     i,
                 )
                 for i in images
@@ -434,9 +438,10 @@ class Extractor:
                 _("图集"),
             )
             item["downloads"] = [
-                self.safe_extract(
-                    i,
-                    f"url_list[{IMAGE_INDEX}]",
+                self.__select_url(
+                    item,
+                    self.safe_extract(i, "url_list", []),
+                    IMAGE_INDEX,
                 )
                 for i in images
             ]
@@ -453,9 +458,10 @@ class Extractor:
             _("图集"),
         )
         item["downloads"] = [
-            self.safe_extract(
-                i,
-                f"imageURL.urlList[{IMAGE_TIKTOK_INDEX}]",
+            self.__select_url(
+                item,
+                self.safe_extract(i, "imageURL.urlList", []),
+                IMAGE_TIKTOK_INDEX,
             )
             for i in images
         ]
@@ -480,10 +486,11 @@ class Extractor:
         type_=_("视频"),
     ) -> None:
         item["type"] = type_
-        item["height"], item["width"], item["downloads"] = (
-            self.__extract_video_download(
+        self.__select_video(
+            item,
+            self.__extract_video_variants(
                 data,
-            )
+            ),
         )
         item["duration"] = self.time_conversion(
             self.safe_extract(data, "video.duration", 0)
@@ -493,75 +500,73 @@ class Extractor:
 
     def __classify_slides_item(
         self,
-        item: SimpleNamespace,
+        item: dict,
+        data: SimpleNamespace,
     ) -> str:
-        if self.safe_extract(item, "video"):
-            return self.__extract_video_download(
-                item,
-            )[-1]
-        return self.safe_extract(item, f"url_list[{IMAGE_INDEX}]")
+        if self.safe_extract(data, "video"):
+            variant = self.policy.select(
+                self.__extract_video_variants(
+                    data,
+                )
+            )
+            return self.__select_url(item, variant["urls"], 0) if variant else ""
+        return self.__select_url(
+            item,
+            self.safe_extract(data, "url_list", []),
+            IMAGE_INDEX,
+        )
 
-    def __extract_video_download(
+    def __select_url(self, item: dict, urls: list[str], index: int) -> str:
+        """选择下载地址，同时记录该文件的全部镜像地址，供下载失败时切换"""
+        if not (urls := self.__mirror_urls(urls, index)):
+            return ""
+        if len(urls) > 1:
+            self.media.get(item["id"])["mirrors"][urls[0]] = urls
+        return urls[0]
+
+    @staticmethod
+    def __mirror_urls(urls: list[str], index: int) -> list[str]:
+        """将选择的下载地址排在首位，其余地址作为镜像地址"""
+        try:
+            url = urls[index]
+        except (IndexError, TypeError):
+            return []
+        return [url, *(i for i in urls if i != url)]
+
+    def __select_video(self, item: dict, variants: list[dict]) -> None:
+        """按照清晰度策略选择视频文件，批量大小限制在下载前处理"""
+        media = self.media.get(item["id"])
+        if variant := self.policy.select(variants):
+            self.policy.apply(item, variant, media)
+            if self.policy.batch_size and len(variants) > 1:
+                media["variants"] = variants
+        else:
+            item["height"], item["width"], item["downloads"] = -1, -1, ""
+            media["size"] = 0
+
+    def __extract_video_variants(
         self,
         data: SimpleNamespace,
-    ) -> tuple[int, int, str]:
-        bit_rate: list[SimpleNamespace] = self.safe_extract(
-            data,
-            "video.bit_rate",
-            [],
-        )
-        try:
-            bit_rate: list[tuple[int, int, int, int, int, list[str]]] = [
-                (
-                    i.FPS,
-                    i.bit_rate,
-                    i.play_addr.data_size,
-                    i.play_addr.height,
-                    i.play_addr.width,
-                    i.play_addr.url_list,
-                )
-                for i in bit_rate
-            ]
-            bit_rate.sort(
-                key=lambda x: (
-                    max(
-                        x[3],
-                        x[4],
-                    ),
-                    x[0],
-                    x[1],
-                    x[2],
-                ),
-            )
-            return (
-                (
-                    bit_rate[-1][-3],
-                    bit_rate[-1][-2],
-                    bit_rate[-1][-1][VIDEO_INDEX],
+    ) -> list[dict]:
+        """提取全部清晰度的视频信息"""
+        variants = []
+        for i in self.safe_extract(data, "video.bit_rate", []):
+            if urls := self.__mirror_urls(
+                self.safe_extract(i, "play_addr.url_list", []),
+                VIDEO_INDEX,
+            ):
+                variants.append(
+                    {
+                        "height": self.safe_extract(i, "play_addr.height", -1),
+                        "width": self.safe_extract(i, "play_addr.width", -1),
+                        "fps": self.safe_extract(i, "FPS", 0),
+                        "bitrate": self.safe_extract(i, "bit_rate", 0),
+                        "size": self.safe_extract(i, "play_addr.data_size", 0),
+                        "h265": bool(self.safe_extract(i, "is_h265", 0)),
+                        "urls": urls,
+                    }
                 )
-                if bit_rate
-                else (-1, -1, "")
-            )
-        except AttributeError:
-            self.log.error(
-                f"视频下载地址解析失败: {data}",
-                False,
-            )
-            height = self.safe_extract(
-                bit_rate[0],
-                "play_addr.height",
-                -1,
-            )
-            width = self.safe_extract(
-                bit_rate[0],
-                "play_addr.width",
-                -1,
-            )
-            url = self.safe_extract(
-                bit_rate[0],
-                f"play_addr.url_list[{VIDEO_INDEX}]",
-            )
-            return height, width, url
+        return variants
 
     def __extract_video_info_tiktok(
         self,
@@ -574,10 +579,11 @@ class Extractor:
         #     data,
         #     "video.playAddr",
         # )  # 视频文件大小优先
-        item["height"], item["width"], item["downloads"] = (
-            self.__extract_video_download_tiktok(
+        self.__select_video(
+            item,
+            self.__extract_video_variants_tiktok(
                 data,
-            )
+            ),
         )  # 视频分辨率优先
         item["duration"] = self.time_conversion_tiktok(
             self.safe_extract(
@@ -592,65 +598,37 @@ class Extractor:
         )
         self.__extract_cover_tiktok(item, data, True)
 
-    def __extract_video_download_tiktok(
+    def __extract_video_variants_tiktok(
         self,
         data: SimpleNamespace,
-    ) -> tuple[int, int, str]:
-        bitrate_info: list[SimpleNamespace] = self.safe_extract(
-            data,
-            "video.bitrateInfo",
-            [],
-        )
-        try:
-            bitrate_info: list[tuple[int, str, int, int, list[str]]] = [
-                (
-                    i.Bitrate,
-                    i.PlayAddr.DataSize,
-                    i.PlayAddr.Height,
-                    i.PlayAddr.Width,
-                    i.PlayAddr.UrlList,
-                )
-                for i in bitrate_info
-            ]
-            bitrate_info.sort(
-                key=lambda x: (
-                    max(
-                        x[2],
-                        x[3],
-                    ),
-                    x[0],
-                    x[1],
-                ),
-            )
-            return (
-                (
-                    bitrate_info[-1][-3],
-                    bitrate_info[-1][-2],
-                    bitrate_info[-1][-1][VIDEO_TIKTOK_INDEX],
+    ) -> list[dict]:
+        """提取全部清晰度的视频信息"""
+        variants = []
+        for i in self.safe_extract(data, "video.bitrateInfo", []):
+            if urls := self.__mirror_urls(
+                self.safe_extract(i, "PlayAddr.UrlList", []),
+                VIDEO_TIKTOK_INDEX,
+            ):
+                codec = str(self.safe_extract(i, "CodecType")).lower()
+                variants.append(
+                    {
+                        "height": self.safe_extract(i, "PlayAddr.Height", -1),
+                        "width": self.safe_extract(i, "PlayAddr.Width", -1),
+                        "fps": 0,
+                        "bitrate": self.safe_extract(i, "Bitrate", 0),
+                        "size": self.__int(self.safe_extract(i, "PlayAddr.DataSize")),
+                        "h265": "265" in codec or "bytevc1" in codec,
+                        "urls": urls,
+                    }
                 )
-                if bitrate_info
-                else (-1, -1, "")
-            )
-        except AttributeError:
-            self.log.error(
-                f"视频下载地址解析失败: {data}",
-                False,
-            )
-            height = self.safe_extract(
-                bitrate_info[0],
-                "PlayAddr.Height",
-                -1,
-            )
-            width = self.safe_extract(
-                bitrate_info[0],
-                "PlayAddr.Width",
-                -1,
-            )
-            url = self.safe_extract(
-                bitrate_info[0],
-                f"PlayAddr.UrlList[{VIDEO_TIKTOK_INDEX}]",
-            )
-            return height, width, url
+        return variants
+
+    @staticmethod
+    def __int(value) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
 
     @staticmethod
     def time_conversion(time_: int) -> str:
@@ -695,12 +673,16 @@ class Extractor:
     ) -> None:
         if has:
             # 动态封面图链接
-            item["dynamic_cover"] = self.safe_extract(
-                data, f"video.dynamic_cover.url_list[{DYNAMIC_COVER_INDEX}]"
+            item["dynamic_cover"] = self.__select_url(
+                item,
+                self.safe_extract(data, "video.dynamic_cover.url_list", []),
+                DYNAMIC_COVER_INDEX,
             )
             # 静态封面图链接
-            item["static_cover"] = self.safe_extract(
-                data, f"video.cover.url_list[{STATIC_COVER_INDEX}]"
+            item["static_cover"] = self.__select_url(
+                item,
+                self.safe_extract(data, "video.cover.url_list", []),
+                STATIC_COVER_INDEX,
             )
         else:
             item["dynamic_cover"], item["static_cover"] = "", ""
@@ -733,9 +715,10 @@ class Extractor:
             else:
                 author = self.safe_extract(music_data, "author")
                 title = self.safe_extract(music_data, "title")
-                url = self.safe_extract(
-                    music_data,
-                    f"play_url.url_list[{MUSIC_INDEX}]",
+                url = self.__select_url(
+                    item,
+                    self.safe_extract(music_data, "play_url.url_list", []),
+                    MUSIC_INDEX,
                 )  # 部分作品的音乐无法下载
 
         else:
@@ -0,0 +1,122 @@
+from heapq import heapify, heappop, heappush
+
+__all__ = ["MediaIndex", "VideoPolicy"]
+
+
+class MediaIndex:
+    """按作品 ID 记录文件镜像地址、可选视频与预计文件大小，不写入作品数据"""
+
+    SIZE = 10000  # 保留的作品数量，超出时移除最早记录的作品
+
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+
+    @staticmethod
+    def create() -> dict:
+        return {"mirrors": {}, "variants": [], "size": 0}
+
+    def get(self, id_: str) -> dict:
+        if (media := self.data.pop(id_, None)) is None:
+            media = self.create()
+        self.data[id_] = media
+        while len(self.data) > self.SIZE:
+            del self.data[next(iter(self.data))]
+        return media
+
+    def pop(self, id_: str) -> dict:
+        return self.data.pop(id_, None) or self.create()
+
+
+class VideoPolicy:
+    """根据分辨率与文件大小限制选择视频清晰度，参数为 0 代表不限制"""
+
+    def __init__(
+        self,
+        resolution: int = 0,
+        file_size: int = 0,
+        batch_size: int = 0,
+        h265: bool = False,
+        **kwargs,
+    ):
+        self.resolution = resolution  # 视频长边像素上限
+        self.file_size = file_size  # 单个视频文件大小上限
+        self.batch_size = batch_size  # 单次批量下载的视频总大小上限
+        self.h265 = h265  # 同分辨率下优先选择体积更小的 H.265 视频
+
+    @staticmethod
+    def side(variant: dict) -> int:
+        return max(variant["height"], variant["width"])
+
+    @classmethod
+    def quality(cls, variant: dict) -> tuple:
+        return (
+            cls.side(variant),
+            variant["fps"],
+            variant["bitrate"],
+            variant["size"],
+        )
+
+    def candidates(self, variants: list[dict]) -> list[dict]:
+        """返回满足单个文件限制的视频，按画质从高到低排序"""
+        variants = sorted(variants, key=self.quality, reverse=True)
+        result = variants
+        if self.resolution:
+            result = [i for i in result if self.side(i) <= self.resolution] or variants[
+                -1:
+            ]
+        if self.file_size:
+            result = [i for i in result if i["size"] <= self.file_size] or [
+                min(result, key=lambda x: x["size"])
+            ]
+        return result
+
+    def select(self, variants: list[dict]) -> dict | None:
+        if not (result := self.candidates(variants)):
+            return None
+        best = result[0]
+        if self.h265 and not best["h265"]:
+            for i in result:
+                if (
+                    i["h265"]
+                    and self.side(i) == self.side(best)
+                    and 0 < i["size"] < best["size"]
+                ):
+                    return i
+        return best
+
+    def downgrade(self, variants: list[dict], size: int) -> dict | None:
+        """选择文件更小的最高画质视频"""
+        for i in self.candidates(variants):
+            if 0 < i["size"] < size:
+                return i
+        return None
+
+    @staticmethod
+    def apply(item: dict, variant: dict, media: dict) -> None:
+        item["height"] = variant["height"]
+        item["width"] = variant["width"]
+        item["downloads"] = variant["urls"][0]
+        media["size"] = variant["size"]
+        if len(variant["urls"]) > 1:
+            media["mirrors"][variant["urls"][0]] = variant["urls"]
+
+    def budget(self, items: list[tuple[dict, dict]]) -> int:
+        """超出批量大小限制时，依次降低当前文件最大的作品的画质，返回预计下载总大小
+
+        items 为作品数据与对应的 MediaIndex 记录
+        """
+        total = sum(media["size"] for _, media in items)
+        if not self.batch_size or total <= self.batch_size:
+            return total
+        heap = [(-media["size"], i) for i, (_, media) in enumerate(items)]
+        heapify(heap)
+        while total > self.batch_size and heap:
+            _, index = heappop(heap)
+            item, media = items[index]
+            # 无法降低画质的作品不再参与比较
+            if not (variant := self.downgrade(media["variants"], media["size"])):
+                continue
+            total += variant["size"] - media["size"]
+            self.apply(item, variant, media)
+            heappush(heap, (-media["size"], index))
+        return total
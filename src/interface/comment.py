@@ -147,6 +147,8 @@ class Comment(API):
                 *args,
                 **kwargs,
             )
+            # 评论回复由 Reply 对象获取，本页评论先于回复交给接收方
+            await self.deliver()
             self.pages -= 1
             if callback:
                 await callback()
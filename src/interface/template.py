@@ -1,5 +1,6 @@
+from contextvars import ContextVar
 from time import time
-from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
+from typing import TYPE_CHECKING, Awaitable, Callable, Coroutine, Type, Union
 from urllib.parse import quote, urlencode
 
 from httpx import AsyncClient, get, post
@@ -11,20 +12,37 @@ from rich.progress import (
 )
 
 from ..custom import PROGRESS, USERAGENT, wait
-from ..tools import DownloaderError, FakeProgress, Retry, capture_error_request
+from ..tools import (
+    DownloaderError,
+    FakeProgress,
+    Retry,
+    TokenBucket,
+    capture_error_request,
+    json_loads,
+)
 from ..translation import _
 
 if TYPE_CHECKING:
     from ..config import Parameter
+    from ..manager import CredentialManager, Credentials, Session, SessionPool
+    from ..tools import ProxyPool
     from ..testers import Params
 
 __all__ = [
     "API",
     "APITikTok",
+    "PAGE_SINK",
 ]
 
+# 流式响应的数据接收方，设置后每获取一页数据立即交给接收方处理，不再保留于内存
+PAGE_SINK: ContextVar[Callable[["API", list[dict]], Awaitable] | None] = ContextVar(
+    "page_sink", default=None
+)
+
 
 class API:
+    platform = "douyin"
+    EXPIRED = {200, 401}  # 响应为空且响应码属于该集合时刷新凭据
     domain = "https://www.douyin.com/"
     short_domain = "https://www.iesdouyin.com/"
     referer = f"{domain}?recommend=1"
@@ -61,6 +79,7 @@ class API:
         "uifid": "",
         "msToken": "",
     }
+    limiter = TokenBucket()  # 全局请求频率限制，单位为每秒请求次数，0 代表不限制
     progress_object: Callable
 
     def __init__(
@@ -81,11 +100,16 @@ class API:
         self.timeout = params.timeout
         self.cookie = cookie
         self.client: AsyncClient = params.client
+        self.sessions: "SessionPool | None" = params.sessions
+        self.credentials: "CredentialManager | None" = params.credentials
+        self.proxies: "ProxyPool | None" = params.proxies
+        self.status_code = 0
         self.pages = 99999
         self.cursor = 0
         self.response = []
         self.finished = False
         self.text = ""
+        self.sink = PAGE_SINK.get()
         self.set_temp_cookie(cookie)
 
     def set_temp_cookie(self, cookie: str = ""):
@@ -210,6 +234,14 @@ class API:
                 self.pages -= 1
                 if callback:
                     await callback()
+                # 回调函数可能需要读取本页数据
+                await self.deliver()
+
+    async def deliver(self) -> None:
+        """流式响应时将已获取的数据交给接收方，接收方处理缓慢时暂停获取下一页数据"""
+        if self.sink and any(self.response):
+            page, self.response = self.response, []
+            await self.sink(self, page)
 
     def check_response(
         self,
@@ -250,51 +282,192 @@ class API:
         *args,
         **kwargs,
     ):
+        headers = headers or self.headers
+        if session := await self.acquire_session():
+            response = await self.__send_session(
+                session,
+                url,
+                params,
+                data,
+                method,
+                headers,
+                encryption,
+                *args,
+                **kwargs,
+            )
+        elif credentials := await self.acquire_credentials():
+            response = await self.__send(
+                url,
+                credentials.apply(params),
+                data,
+                method,
+                self.__credentials_headers(headers, credentials),
+                encryption,
+                *args,
+                **kwargs,
+            )
+            if (
+                self.token_expired(response)
+                and (
+                    refreshed := await self.credentials.refresh(
+                        self.platform,
+                        credentials,
+                    )
+                )
+                and refreshed is not credentials
+            ):
+                self.log.info(f"{self.platform} 凭据已刷新，重新请求数据", False)
+                response = await self.__send(
+                    url,
+                    refreshed.apply(params),
+                    data,
+                    method,
+                    self.__credentials_headers(headers, refreshed),
+                    encryption,
+                    *args,
+                    **kwargs,
+                )
+        else:
+            response = await self.__send(
+                url,
+                params,
+                data,
+                method,
+                headers,
+                encryption,
+                *args,
+                **kwargs,
+            )
+        if finished and not response:
+            self.finished = True
+        return response
+
+    async def __send_session(
+        self,
+        session: "Session",
+        url: str,
+        params: dict | None,
+        data: dict | None,
+        method: str,
+        headers: dict,
+        encryption,
+        *args,
+        **kwargs,
+    ):
+        """使用会话池中的会话请求数据，每次请求均更新会话评分，重试时重新选择会话"""
+        for i in range(self.max_retry + 1):
+            # 替换 Cookie 与会话相关的请求参数
+            response = await self.__send(
+                url,
+                params and params | session.params,
+                data,
+                method,
+                headers | {"Cookie": session.cookie},
+                encryption,
+                *args,
+                retry=False,
+                **kwargs,
+            )
+            await self.sessions.report(session, response, self.status_code)
+            if (
+                response
+                or i == self.max_retry
+                or not (session := await self.acquire_session())
+            ):
+                return response
+            self.log.warning(_("正在进行第 {index} 次重试").format(index=i + 1))
+            await wait()
+
+    async def __send(
+        self,
+        url: str,
+        params: dict | None,
+        data: dict | None,
+        method: str,
+        headers: dict,
+        encryption,
+        *args,
+        retry=True,
+        **kwargs,
+    ):
+        await self.limiter.consume(1)
+        # 请求未指定代理时从代理池选择代理
+        proxy = None if self.proxy or not self.proxies else self.proxies.choose()
+        client = proxy.client if proxy else self.client
+        self.status_code = 0
+        start = time()
         params = self.deal_url_params(
             params,
             encryption,
         )
         match (method, bool(self.proxy)):
             case ("GET", False):
-                return await self.request_data_get(
+                response = await self.request_data_get(
                     url,
                     params,
-                    headers or self.headers,
-                    finished=finished,
+                    headers,
+                    client=client,
                     *args,
+                    retry=retry,
                     **kwargs,
                 )
             case ("GET", True):
-                return await self.request_data_get_proxy(
+                response = await self.request_data_get_proxy(
                     url,
                     params,
-                    headers or self.headers,
-                    finished=finished,
+                    headers,
                     *args,
+                    retry=retry,
                     **kwargs,
                 )
             case ("POST", False):
-                return await self.request_data_post(
+                response = await self.request_data_post(
                     url,
                     params,
                     data,
-                    headers or self.headers,
-                    finished=finished,
+                    headers,
+                    client=client,
                     *args,
+                    retry=retry,
                     **kwargs,
                 )
             case ("POST", True):
-                return await self.request_data_post_proxy(
+                response = await self.request_data_post_proxy(
                     url,
                     params,
                     data,
-                    headers or self.headers,
-                    finished=finished,
+                    headers,
                     *args,
+                    retry=retry,
                     **kwargs,
                 )
             case _:
                 raise DownloaderError
+        if proxy:
+            self.proxies.record(proxy, self.status_code, time() - start)
+        return response
+
+    async def acquire_session(self):
+        """请求未指定 Cookie 时从会话池选择会话"""
+        if self.cookie or not self.sessions:
+            return None
+        return await self.sessions.acquire(self.platform)
+
+    async def acquire_credentials(self) -> "Credentials | None":
+        """请求未指定 Cookie 时读取当前凭据快照，首次请求时获取最新的参数"""
+        if self.cookie or not self.credentials:
+            return None
+        return await self.credentials.acquire(self.platform)
+
+    @staticmethod
+    def __credentials_headers(headers: dict, credentials: "Credentials") -> dict:
+        return (
+            headers | {"Cookie": credentials.cookie} if credentials.cookie else headers
+        )
+
+    def token_expired(self, response) -> bool:
+        """响应为空通常代表 msToken 已失效"""
+        return not response and self.status_code in self.EXPIRED
 
     @Retry.retry
     @capture_error_request
@@ -304,6 +477,7 @@ class API:
         params: str,
         headers: dict,
         finished=False,
+        client: AsyncClient = None,
         **kwargs,
     ):
         self.__record_request_messages(
@@ -313,7 +487,7 @@ class API:
             headers,
             **kwargs,
         )
-        response = await self.client.get(
+        response = await (client or self.client).get(
             f"{url}?{params}",
             headers=headers,
             **kwargs,
@@ -351,7 +525,14 @@ class API:
     @Retry.retry
     @capture_error_request
     async def request_data_post(
-        self, url: str, params: str, data: dict, headers: dict, finished=False, **kwargs
+        self,
+        url: str,
+        params: str,
+        data: dict,
+        headers: dict,
+        finished=False,
+        client: AsyncClient = None,
+        **kwargs,
     ):
         self.__record_request_messages(
             url,
@@ -360,7 +541,7 @@ class API:
             headers,
             **kwargs,
         )
-        response = await self.client.post(
+        response = await (client or self.client).post(
             f"{url}?{params}",
             data=data,
             headers=headers,
@@ -393,9 +574,11 @@ class API:
         return await self.__return_response(response)
 
     async def __return_response(self, response):
-        self.log.info(f"Response URL: {response.url}", False)
-        self.log.info(f"Response Code: {response.status_code}", False)
-        self.log.info(f"Response Headers: {dict(response.headers)}", False)
+        self.status_code = response.status_code
+        if self.log.detailed:
+            self.log.detail("Response URL: %s", response.url)
+            self.log.detail("Response Code: %s", response.status_code)
+            self.log.detail("Response Headers: %s", dict(response.headers))
         # 记录请求体数据会导致日志文件体积过大，仅在必要时记录
         # self.log.info(f"Response Content: {response.content}", False)
         response.raise_for_status()
@@ -403,7 +586,7 @@ class API:
         # if response.status_code != 200:
         #     self.log.error(f"请求 {url} 失败，响应码 {response.status_code}")
         #     return
-        return response.json()
+        return json_loads(response.content)
 
     def __record_request_messages(
         self,
@@ -413,13 +596,15 @@ class API:
         headers: dict,
         **kwargs,
     ):
-        self.log.info(f"URL: {url}", False)
-        self.log.info(f"Params: {params}", False)
-        self.log.info(f"Data: {data}", False)
+        if not self.log.detailed:
+            return
+        self.log.detail("URL: %s", url)
+        self.log.detail("Params: %s", params)
+        self.log.detail("Data: %s", data)
         # 请求头脱敏处理，不记录 Cookie
         desensitize = {k: v for k, v in headers.items() if k != "Cookie"}
-        self.log.info(f"Headers: {desensitize}", False)
-        self.log.info(f"Other: {kwargs}", False)
+        self.log.detail("Headers: %s", desensitize)
+        self.log.detail("Other: %s", kwargs)
 
     def deal_url_params(
         self,
@@ -493,6 +678,7 @@ class API:
 
 
 class APITikTok(API):
+    platform = "tiktok"
     domain = "https://www.tiktok.com/"
     short_domain = ""
     referer = f"{domain}explore"
@@ -543,6 +729,7 @@ class APITikTok(API):
         self.headers = params.headers_tiktok.copy()
         self.cookie = cookie
         self.client: AsyncClient = params.client_tiktok
+        self.proxies: "ProxyPool | None" = params.proxies_tiktok
         self.set_temp_cookie(cookie)
 
     async def request_data(
@@ -14,6 +14,9 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
+from src.tools.bandwidth import BANDWIDTH
+from src.tools.directory import DirectoryIndex
+
 from ..module import CacheError
 from ..tools import (
     PROGRESS,
@@ -63,6 +66,7 @@ class Downloader:
         self.database = database
         self.name_format = manager.name_format
         self.name_length = manager.name_length
+        self.index = DirectoryIndex()
         self.general_progress_object: Callable = self.init_general_progress(
             server_mode,
         )
@@ -118,6 +122,7 @@ class Downloader:
         data: list[dict],
     ):
         tasks = []
+        self.index.clear()
         with self.general_progress_object() as progress:
             for item in data:
                 if await self.database.has_download_data(i := item["detailID"]):
@@ -321,13 +326,17 @@ class Downloader:
                         completed=position,
                     )
                     async with open(temp, "ab") as f:
-                        async for chunk in response.aiter_bytes(self.chunk):
+                        async for chunk in BANDWIDTH.iterate(
+                            response.aiter_bytes(self.chunk),
+                            "kuaishou",
+                        ):
                             await f.write(chunk)
                             progress.update(task_id, advance=len(chunk))
             except HTTPError as e:
                 await self.database.delete_download_data(id_)
                 raise HTTPError(repr(e)) from e
             self.move(temp, path)
+            self.index.add(path)
             self.console.info(
                 _("【{type}】{name} 下载完成").format(type=tip, name=text)
             )
@@ -357,8 +366,12 @@ class Downloader:
         move(temp.resolve(), path.resolve())
 
     def __file_exists(self, path: "Path", suffix="*") -> bool:
-        if e := any(path.parent.glob(n := f"{path.name}.{suffix}")):
-            self.console.info(_("{filename} 已存在，跳过下载").format(filename=n))
+        if e := self.index.match(path, suffix):
+            self.console.info(
+                _("{filename} 已存在，跳过下载").format(
+                    filename=f"{path.name}.{suffix}"
+                )
+            )
         return e
 
     def __generate_name(
@@ -1,4 +1,5 @@
 from datetime import datetime
+from json import JSONDecodeError, loads
 from re import compile
 from time import localtime, strftime
 from types import SimpleNamespace
@@ -20,6 +21,9 @@ class HTMLExtractor:
     WEB_KEYWORD = "window.__APOLLO_STATE__="
     APP_KEYWORD = "window.INIT_STATE = "
     PHOTO_REGEX = compile(r"\"photo\":(\{\".*\"}),\"serialInfo\"")
+    PHOTO_KEY = '"photo":{"'
+    SCRIPT_END = "</script>"
+    TOKEN_REGEX = compile(r'"(?:[^"\\]|\\.)*"|[{}]')
 
     def __init__(self, manager: "Manager"):
         self.date_format = "%Y-%m-%d_%H:%M:%S"
@@ -75,14 +79,15 @@ class HTMLExtractor:
         id_: str,
         web: bool,
     ) -> dict:
-        tree = self.__extract_object(
-            html,
-            web,
-        )
-        data = self.__convert_object(
-            tree,
-            web,
-        )
+        if not (data := self.__extract_state(html, web)):
+            tree = self.__extract_object(
+                html,
+                web,
+            )
+            data = self.__convert_object(
+                tree,
+                web,
+            )
         if not data:
             self.console.warning(_("提取网页数据失败"))
             return {}
@@ -93,6 +98,55 @@ class HTMLExtractor:
             web,
         )
 
+    def __extract_state(
+        self,
+        html: str,
+        web: bool,
+    ) -> dict | None:
+        """在原始网页文本中定位状态脚本并截取目标对象，失败时返回 None 以回退到完整解析"""
+        if not html:
+            return None
+        keyword = self.WEB_KEYWORD if web else self.APP_KEYWORD
+        if (start := html.find(keyword)) == -1:
+            return None
+        start += len(keyword)
+        if (end := html.find(self.SCRIPT_END, start)) == -1:
+            end = len(html)
+        if not web:
+            if (index := html.find(self.PHOTO_KEY, start, end)) == -1:
+                return None
+            start = index + len(self.PHOTO_KEY) - 2
+        if not (text := self.slice_object(html, start, end)):
+            return None
+        try:
+            data = loads(text)
+        except JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    @classmethod
+    def slice_object(
+        cls,
+        text: str,
+        start: int,
+        end: int = -1,
+    ) -> str:
+        """从 start 处的左花括号开始扫描，返回与之匹配的完整对象文本"""
+        if end < 0:
+            end = len(text)
+        if text[start : start + 1] != "{":
+            return ""
+        depth = 0
+        for match in cls.TOKEN_REGEX.finditer(text, start, end):
+            match match[0]:
+                case "{":
+                    depth += 1
+                case "}":
+                    depth -= 1
+                    if not depth:
+                        return text[start : match.end()]
+        return ""
+
     def __extract_object(
         self,
         html: str,
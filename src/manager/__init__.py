@@ -1,9 +1,23 @@
 from .cache import Cache
+from .credential import CredentialManager, Credentials
 from .database import Database
-from .recorder import DownloadRecorder
+from .queue import CrawlTask, QueueBackend, SQLiteQueue
+from .recorder import DistributedRecorder, DownloadRecorder
+from .session import Session, SessionPool
+from .shared import SharedState, SharedTokenBucket
 
 __all__ = [
     "Cache",
+    "CredentialManager",
+    "Credentials",
+    "CrawlTask",
+    "DistributedRecorder",
     "DownloadRecorder",
     "Database",
+    "QueueBackend",
+    "Session",
+    "SessionPool",
+    "SharedState",
+    "SharedTokenBucket",
+    "SQLiteQueue",
 ]
@@ -0,0 +1,164 @@
+from asyncio import CancelledError, Lock, Task, create_task, sleep
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from hashlib import sha1
+from json import dumps, loads
+from random import uniform
+from time import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable, Callable, Mapping
+
+from ..custom import COOKIE_UPDATE_INTERVAL
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+    from .database import Database
+
+__all__ = ["Credentials", "CredentialManager"]
+
+
+@dataclass(frozen=True, slots=True)
+class Credentials:
+    """不可变的凭据快照，更新凭据时整体替换快照"""
+
+    platform: str
+    cookie: str = ""
+    params: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({}),
+    )
+    source: str = ""  # 配置文件 Cookie 的摘要，Cookie 修改后缓存失效
+    expires: float = 0.0  # 过期时间戳，0 代表尚未请求最新参数
+
+    def __post_init__(self):
+        object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
+
+    @staticmethod
+    def digest(cookie: str) -> str:
+        return sha1(cookie.encode()).hexdigest() if cookie else ""
+
+    @property
+    def expired(self) -> bool:
+        return self.expires <= time()
+
+    def apply(self, params: dict | None) -> dict | None:
+        """替换请求参数中已存在的凭据参数"""
+        if not params:
+            return params
+        return params | {k: v for k, v in self.params.items() if k in params}
+
+
+class CredentialManager:
+    """凭据管理器，首次请求时获取凭据，在当前事件循环中定期刷新，请求时读取最新的凭据快照"""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[Credentials | None]],
+        log: "BaseLogger | LoggerManager",
+        database: "Database" = None,
+        interval: int | float = COOKIE_UPDATE_INTERVAL,
+        jitter: float = 0.1,
+    ):
+        self.fetch = fetch
+        self.log = log
+        self.database = database  # 缓存凭据，重启程序后无需重新请求
+        self.interval = interval  # 凭据有效期，同时也是刷新间隔
+        self.jitter = jitter  # 刷新间隔随机浮动比例，避免多个实例同时请求
+        self.snapshots: dict[str, Credentials] = {}
+        self.locks: dict[str, Lock] = {}
+        self.task: Task | None = None
+
+    def get(self, platform: str) -> Credentials | None:
+        return self.snapshots.get(platform)
+
+    def set(self, credentials: Credentials) -> None:
+        self.snapshots[credentials.platform] = credentials
+
+    async def acquire(self, platform: str) -> Credentials | None:
+        """返回凭据快照，快照过期时等待刷新完成"""
+        credentials = self.snapshots.get(platform)
+        if credentials and credentials.expired:
+            return await self.refresh(platform, credentials)
+        return credentials
+
+    async def refresh(
+        self,
+        platform: str,
+        stale: Credentials | None = None,
+    ) -> Credentials | None:
+        """刷新凭据；传入 stale 时，仅在当前快照仍为 stale 时刷新，并发请求共享同一次刷新"""
+        lock = self.locks.setdefault(platform, Lock())
+        async with lock:
+            current = self.snapshots.get(platform)
+            if stale and current is not stale:
+                return current
+            if stale and not stale.expires and (cache := await self.__read(stale)):
+                self.set(cache)
+            elif credentials := await self.fetch(platform):
+                credentials = replace(credentials, expires=time() + self.interval)
+                self.set(credentials)
+                await self.__write(credentials)
+            elif current:
+                # 无法获取凭据时沿用当前快照，避免每次请求都触发刷新
+                self.set(replace(current, expires=time() + self.interval))
+            return self.snapshots.get(platform)
+
+    async def __read(self, credentials: Credentials) -> Credentials | None:
+        if not self.database or not (
+            row := await self.database.read_credential_data(credentials.platform)
+        ):
+            return None
+        if row["SOURCE"] != credentials.source or row["EXPIRES"] <= time():
+            return None
+        self.log.info(f"{credentials.platform} 使用缓存凭据", False)
+        return replace(
+            credentials,
+            cookie=row["COOKIE"],
+            params=loads(row["PARAMS"]),
+            expires=row["EXPIRES"],
+        )
+
+    async def __write(self, credentials: Credentials) -> None:
+        if not self.database:
+            return
+        await self.database.update_credential_data(
+            (
+                credentials.platform,
+                credentials.source,
+                credentials.cookie,
+                dumps(dict(credentials.params)),
+                credentials.expires,
+            )
+        )
+
+    def delay(self) -> float:
+        return self.interval * uniform(1 - self.jitter, 1 + self.jitter)
+
+    def start(self) -> None:
+        if not self.task or self.task.done():
+            self.task = create_task(self.__run())
+
+    async def __run(self) -> None:
+        while True:
+            await sleep(self.delay())
+            # 仅刷新已使用的平台，未使用的平台在首次请求时获取凭据
+            for platform, credentials in list(self.snapshots.items()):
+                if not credentials.expires:
+                    continue
+                try:
+                    await self.refresh(platform)
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    self.log.error(
+                        _("更新 {platform} 参数失败：{error}").format(
+                            platform=platform, error=repr(e)
+                        )
+                    )
+
+    async def close(self) -> None:
+        if self.task and not self.task.done():
+            self.task.cancel()
+            with suppress(CancelledError):
+                await self.task
+        self.task = None
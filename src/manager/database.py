@@ -1,6 +1,8 @@
 from asyncio import CancelledError
 from contextlib import suppress
 from shutil import move
+from sqlite3 import OperationalError
+from time import time
 
 from aiosqlite import Row, connect
 
@@ -11,6 +13,7 @@ __all__ = ["Database"]
 
 class Database:
     __FILE = "DouK-Downloader.db"
+    TIMEOUT = 30000  # 等待其他进程释放数据库锁的时间，单位毫秒
 
     def __init__(
         self,
@@ -18,10 +21,14 @@ class Database:
         self.file = PROJECT_ROOT.joinpath(self.__FILE)
         self.database = None
         self.cursor = None
+        self.fts = False  # 当前 SQLite 是否支持 FTS5 trigram 分词
 
     async def __connect_database(self):
         self.database = await connect(self.file)
         self.database.row_factory = Row
+        # 多进程部署时多个进程同时读写数据库
+        await self.database.execute("PRAGMA journal_mode=WAL;")
+        await self.database.execute(f"PRAGMA busy_timeout={self.TIMEOUT};")
         self.cursor = await self.database.cursor()
         await self.__create_table()
         await self.__write_default_config()
@@ -47,6 +54,153 @@ class Database:
         NAME TEXT PRIMARY KEY,
         VALUE TEXT NOT NULL
         );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS blob_data (
+        HASH TEXT PRIMARY KEY,
+        SUFFIX TEXT NOT NULL,
+        SIZE INTEGER NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS asset_data (
+        KEY TEXT PRIMARY KEY,
+        HASH TEXT NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS library_data (
+        ID TEXT PRIMARY KEY,
+        PLATFORM TEXT NOT NULL,
+        TYPE TEXT NOT NULL,
+        NICKNAME TEXT NOT NULL,
+        DESCRIPTION TEXT NOT NULL,
+        TAG TEXT NOT NULL,
+        MUSIC TEXT NOT NULL,
+        CREATE_TIME TEXT NOT NULL,
+        DATA TEXT NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS library_file (
+        PATH TEXT PRIMARY KEY,
+        ID TEXT NOT NULL
+        );""")
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS library_file_id ON library_file (ID);"
+        )
+        # 未使用全文检索时按发布时间顺序读取索引，无需排序全部作品
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS library_data_time "
+            "ON library_data (CREATE_TIME);"
+        )
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS library_data_platform "
+            "ON library_data (PLATFORM, CREATE_TIME);"
+        )
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS session_data (
+        ID TEXT PRIMARY KEY,
+        PLATFORM TEXT NOT NULL,
+        COOKIE TEXT NOT NULL,
+        MS_TOKEN TEXT NOT NULL,
+        DEVICE_ID TEXT NOT NULL,
+        SCORE REAL NOT NULL,
+        COOLDOWN REAL NOT NULL,
+        STRIKES INTEGER NOT NULL,
+        REQUESTS INTEGER NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS credential_data (
+        PLATFORM TEXT PRIMARY KEY,
+        SOURCE TEXT NOT NULL,
+        COOKIE TEXT NOT NULL,
+        PARAMS TEXT NOT NULL,
+        EXPIRES REAL NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS checkpoint_data (
+        KEY TEXT PRIMARY KEY,
+        VALUE TEXT NOT NULL,
+        UPDATED REAL NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS job_data (
+        ID TEXT PRIMARY KEY,
+        STATUS TEXT NOT NULL,
+        PAYLOAD TEXT NOT NULL,
+        META TEXT NOT NULL,
+        FILES TEXT NOT NULL,
+        ERROR TEXT,
+        WORKER TEXT,
+        ATTEMPTS INTEGER NOT NULL DEFAULT 0,
+        EXPIRES REAL,
+        CANCEL INTEGER NOT NULL DEFAULT 0,
+        SEQUENCE INTEGER NOT NULL DEFAULT 0,
+        CREATED REAL NOT NULL,
+        STARTED REAL,
+        FINISHED REAL
+        );""")
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS job_data_status ON job_data (STATUS, CREATED);"
+        )
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS job_event (
+        JOB TEXT NOT NULL,
+        SEQ INTEGER NOT NULL,
+        DATA TEXT NOT NULL,
+        PRIMARY KEY (JOB, SEQ)
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS rate_data (
+        KEY TEXT PRIMARY KEY,
+        RATE REAL NOT NULL,
+        TOKENS REAL NOT NULL,
+        UPDATED REAL NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS crawl_task (
+        ID TEXT PRIMARY KEY,
+        KIND TEXT NOT NULL,
+        PAYLOAD TEXT NOT NULL,
+        STATUS TEXT NOT NULL,
+        ATTEMPTS INTEGER NOT NULL DEFAULT 0,
+        WORKER TEXT,
+        LEASE TEXT,
+        EXPIRES REAL,
+        AVAILABLE REAL NOT NULL,
+        CHECKPOINT TEXT NOT NULL DEFAULT '{}',
+        RESULT TEXT,
+        ERROR TEXT,
+        CREATED REAL NOT NULL,
+        UPDATED REAL NOT NULL
+        );""")
+        await self.database.execute(
+            "CREATE INDEX IF NOT EXISTS crawl_task_status ON crawl_task "
+            "(STATUS, AVAILABLE, CREATED);"
+        )
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS crawl_item (
+        ID TEXT PRIMARY KEY,
+        WORKER TEXT NOT NULL,
+        DONE INTEGER NOT NULL DEFAULT 0,
+        EXPIRES REAL NOT NULL
+        );""")
+        await self.__create_search_table()
+
+    async def __create_search_table(self):
+        try:
+            await self.database.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS
+            library_search USING fts5(
+            DESCRIPTION, TAG, NICKNAME, MUSIC,
+            content='library_data', content_rowid='rowid', tokenize='trigram'
+            );""")
+        except OperationalError:
+            return
+        await self.database.execute("""CREATE TRIGGER IF NOT EXISTS library_insert
+        AFTER INSERT ON library_data BEGIN
+        INSERT INTO library_search (rowid, DESCRIPTION, TAG, NICKNAME, MUSIC)
+        VALUES (new.rowid, new.DESCRIPTION, new.TAG, new.NICKNAME, new.MUSIC);
+        END;""")
+        await self.database.execute("""CREATE TRIGGER IF NOT EXISTS library_delete
+        AFTER DELETE ON library_data BEGIN
+        INSERT INTO library_search
+        (library_search, rowid, DESCRIPTION, TAG, NICKNAME, MUSIC)
+        VALUES ('delete', old.rowid, old.DESCRIPTION, old.TAG, old.NICKNAME, old.MUSIC);
+        END;""")
+        await self.database.execute("""CREATE TRIGGER IF NOT EXISTS library_update
+        AFTER UPDATE ON library_data BEGIN
+        INSERT INTO library_search
+        (library_search, rowid, DESCRIPTION, TAG, NICKNAME, MUSIC)
+        VALUES ('delete', old.rowid, old.DESCRIPTION, old.TAG, old.NICKNAME, old.MUSIC);
+        INSERT INTO library_search (rowid, DESCRIPTION, TAG, NICKNAME, MUSIC)
+        VALUES (new.rowid, new.DESCRIPTION, new.TAG, new.NICKNAME, new.MUSIC);
+        END;""")
+        self.fts = True
 
     async def __write_default_config(self):
         await self.database.execute("""INSERT OR IGNORE INTO config_data (NAME, VALUE)
@@ -124,6 +278,370 @@ class Database:
         await self.database.execute("DELETE FROM download_data")
         await self.database.commit()
 
+    async def read_asset_data(self, key: str):
+        await self.cursor.execute(
+            """SELECT blob_data.HASH, blob_data.SUFFIX FROM asset_data
+            JOIN blob_data ON asset_data.HASH = blob_data.HASH
+            WHERE asset_data.KEY=?""",
+            (key,),
+        )
+        return await self.cursor.fetchone()
+
+    async def write_asset_data(self, key: str, hash_: str, suffix: str, size: int):
+        await self.database.execute(
+            "INSERT OR IGNORE INTO blob_data (HASH, SUFFIX, SIZE) VALUES (?,?,?)",
+            (hash_, suffix, size),
+        )
+        await self.database.execute(
+            "REPLACE INTO asset_data (KEY, HASH) VALUES (?,?)",
+            (key, hash_),
+        )
+        await self.database.commit()
+
+    async def write_library_data(self, data: list[tuple]):
+        """使用 UPSERT 更新作品数据，REPLACE 不会触发全文索引的删除触发器"""
+        await self.database.executemany(
+            """INSERT INTO library_data
+            (ID, PLATFORM, TYPE, NICKNAME, DESCRIPTION, TAG, MUSIC, CREATE_TIME, DATA)
+            VALUES (?,?,?,?,?,?,?,?,?)
+            ON CONFLICT (ID) DO UPDATE SET
+            PLATFORM=excluded.PLATFORM, TYPE=excluded.TYPE,
+            NICKNAME=excluded.NICKNAME, DESCRIPTION=excluded.DESCRIPTION,
+            TAG=excluded.TAG, MUSIC=excluded.MUSIC,
+            CREATE_TIME=excluded.CREATE_TIME, DATA=excluded.DATA;""",
+            data,
+        )
+        await self.database.commit()
+
+    async def read_library_data(self, platform: str):
+        await self.cursor.execute(
+            "SELECT ID, DATA FROM library_data WHERE PLATFORM=?", (platform,)
+        )
+        return await self.cursor.fetchall()
+
+    async def search_library_data(
+        self,
+        condition: str,
+        params: tuple,
+        order: str,
+        limit: int,
+        offset: int,
+        search: bool,
+    ):
+        source = (
+            "library_data JOIN library_search "
+            "ON library_data.rowid = library_search.rowid"
+            if search
+            else "library_data"
+        )
+        await self.cursor.execute(
+            f"""SELECT library_data.ID, PLATFORM, TYPE, library_data.NICKNAME,
+            library_data.DESCRIPTION, library_data.TAG, library_data.MUSIC,
+            CREATE_TIME, DATA FROM {source}
+            WHERE {condition} ORDER BY {order} LIMIT ? OFFSET ?""",
+            (*params, limit, offset),
+        )
+        return await self.cursor.fetchall()
+
+    async def write_library_file(self, data: list[tuple]):
+        await self.database.executemany(
+            "REPLACE INTO library_file (PATH, ID) VALUES (?,?)",
+            data,
+        )
+        await self.database.commit()
+
+    async def read_library_file(self, ids: list[str]):
+        await self.cursor.execute(
+            f"""SELECT ID, PATH FROM library_file
+            WHERE ID IN ({", ".join("?" for _ in ids)}) ORDER BY PATH""",
+            ids,
+        )
+        return await self.cursor.fetchall()
+
+    async def read_all_library_file(self):
+        await self.cursor.execute("SELECT ID, PATH FROM library_file ORDER BY PATH")
+        return await self.cursor.fetchall()
+
+    async def delete_library_file(self, paths: list[str]):
+        await self.database.executemany(
+            "DELETE FROM library_file WHERE PATH=?",
+            [(i,) for i in paths],
+        )
+        await self.database.commit()
+
+    async def read_session_data(self):
+        await self.cursor.execute("SELECT * FROM session_data")
+        return await self.cursor.fetchall()
+
+    async def update_session_data(self, data: list[tuple]):
+        await self.database.executemany(
+            """REPLACE INTO session_data (ID, PLATFORM, COOKIE, MS_TOKEN, DEVICE_ID,
+            SCORE, COOLDOWN, STRIKES, REQUESTS) VALUES (?,?,?,?,?,?,?,?,?)""",
+            data,
+        )
+        await self.database.commit()
+
+    async def delete_session_data(self, id_: str):
+        await self.database.execute("DELETE FROM session_data WHERE ID=?", (id_,))
+        await self.database.commit()
+
+    async def read_credential_data(self, platform: str):
+        await self.cursor.execute(
+            "SELECT * FROM credential_data WHERE PLATFORM=?", (platform,)
+        )
+        return await self.cursor.fetchone()
+
+    async def update_credential_data(self, data: tuple):
+        await self.database.execute(
+            """REPLACE INTO credential_data (PLATFORM, SOURCE, COOKIE, PARAMS,
+            EXPIRES) VALUES (?,?,?,?,?)""",
+            data,
+        )
+        await self.database.commit()
+
+    async def read_checkpoint_data(self, key: str) -> str:
+        await self.cursor.execute(
+            "SELECT VALUE FROM checkpoint_data WHERE KEY=?", (key,)
+        )
+        return row[0] if (row := await self.cursor.fetchone()) else ""
+
+    async def update_checkpoint_data(self, key: str, value: str):
+        await self.database.execute(
+            "REPLACE INTO checkpoint_data (KEY, VALUE, UPDATED) VALUES (?,?,?)",
+            (key, value, time()),
+        )
+        await self.database.commit()
+
+    # 以下方法可能被多个协程同时调用，使用独立游标读取结果
+    async def create_job_data(self, data: tuple, event: tuple):
+        await self.database.execute(
+            """INSERT INTO job_data (ID, STATUS, PAYLOAD, META, FILES, SEQUENCE,
+            CREATED) VALUES (?,?,?,?,?,?,?)""",
+            data,
+        )
+        await self.database.execute(
+            "INSERT INTO job_event (JOB, SEQ, DATA) VALUES (?,?,?)", event
+        )
+        await self.database.commit()
+
+    async def claim_job_data(
+        self,
+        worker: str,
+        now: float,
+        expires: float,
+        attempts: int,
+    ):
+        """领取最早创建的排队任务或租约已过期的任务，多个进程不会领取同一任务；
+        超过执行次数或已请求取消的过期任务直接结束"""
+        await self.database.execute(
+            """UPDATE job_data SET
+            STATUS=CASE CANCEL WHEN 1 THEN 'cancelled' ELSE 'error' END,
+            ERROR=CASE CANCEL WHEN 1 THEN ERROR
+            ELSE COALESCE(ERROR, 'lease expired') END,
+            EXPIRES=NULL, FINISHED=?
+            WHERE STATUS='running' AND EXPIRES<=? AND (CANCEL=1 OR ATTEMPTS>=?)""",
+            (now, now, attempts),
+        )
+        async with self.database.execute(
+            """UPDATE job_data SET STATUS='running', WORKER=?, EXPIRES=?,
+            ATTEMPTS=ATTEMPTS+1, STARTED=?
+            WHERE ID=(SELECT ID FROM job_data WHERE STATUS='queued'
+            OR (STATUS='running' AND EXPIRES<=?)
+            ORDER BY CREATED LIMIT 1) RETURNING *""",
+            (worker, expires, now, now),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return row
+
+    async def renew_job_data(self, id_: str, worker: str, expires: float) -> bool:
+        """延长运行中任务的租约，任务已被其他进程领取时返回 False"""
+        async with self.database.execute(
+            """UPDATE job_data SET EXPIRES=?
+            WHERE ID=? AND WORKER=? AND STATUS='running' RETURNING ID""",
+            (expires, id_, worker),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return bool(row)
+
+    async def read_job_data(self, id_: str):
+        async with self.database.execute(
+            "SELECT * FROM job_data WHERE ID=?", (id_,)
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def read_all_job_data(self):
+        async with self.database.execute(
+            "SELECT * FROM job_data ORDER BY CREATED DESC"
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def update_job_data(self, data: tuple, events: list[tuple]):
+        await self.database.execute(
+            """UPDATE job_data SET STATUS=?, META=?, FILES=?, ERROR=?, SEQUENCE=?,
+            STARTED=?, FINISHED=? WHERE ID=?""",
+            data,
+        )
+        await self.database.executemany(
+            "INSERT OR IGNORE INTO job_event (JOB, SEQ, DATA) VALUES (?,?,?)",
+            events,
+        )
+        await self.database.commit()
+
+    async def cancel_job_data(self, id_: str, finished: float) -> bool:
+        """排队中的任务直接取消，运行中的任务由执行任务的进程取消"""
+        async with self.database.execute(
+            """UPDATE job_data SET CANCEL=1,
+            STATUS=CASE STATUS WHEN 'queued' THEN 'cancelled' ELSE STATUS END,
+            FINISHED=CASE STATUS WHEN 'queued' THEN ? ELSE FINISHED END
+            WHERE ID=? AND STATUS IN ('queued', 'running') RETURNING STATUS""",
+            (finished, id_),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return bool(row)
+
+    async def read_job_event(self, id_: str, sequence: int):
+        async with self.database.execute(
+            "SELECT DATA FROM job_event WHERE JOB=? AND SEQ>? ORDER BY SEQ",
+            (id_, sequence),
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def delete_job_data(self, ids: list[str]):
+        await self.database.executemany(
+            "DELETE FROM job_data WHERE ID=?", [(i,) for i in ids]
+        )
+        await self.database.executemany(
+            "DELETE FROM job_event WHERE JOB=?", [(i,) for i in ids]
+        )
+        await self.database.commit()
+
+    async def reserve_rate_data(
+        self,
+        key: str,
+        size: float,
+        now: float,
+        rate: float | None = None,
+    ) -> tuple[float, float]:
+        """扣除共享令牌，返回扣除后的令牌数量与当前速率；传入 rate 时更新速率"""
+        async with self.database.execute(
+            """INSERT INTO rate_data (KEY, RATE, TOKENS, UPDATED) VALUES (?,?,?,?)
+            ON CONFLICT (KEY) DO UPDATE SET
+            RATE=COALESCE(?, RATE),
+            TOKENS=MIN(TOKENS + (excluded.UPDATED - UPDATED) * RATE,
+            COALESCE(?, RATE)) - ?,
+            UPDATED=excluded.UPDATED
+            RETURNING TOKENS, RATE""",
+            (key, rate or 0, (rate or 0) - size, now, rate, rate, size),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return row["TOKENS"], row["RATE"]
+
+    async def put_crawl_task(self, data: list[tuple]) -> int:
+        """写入采集任务，相同 ID 的任务未结束时忽略，已结束的任务重新排队并保留检查点"""
+        before = self.database.total_changes
+        await self.database.executemany(
+            """INSERT INTO crawl_task (ID, KIND, PAYLOAD, STATUS, AVAILABLE, CREATED,
+            UPDATED) VALUES (?,?,?,'queued',?,?,?)
+            ON CONFLICT (ID) DO UPDATE SET
+            PAYLOAD=excluded.PAYLOAD, STATUS='queued', ATTEMPTS=0, WORKER=NULL,
+            LEASE=NULL, EXPIRES=NULL, AVAILABLE=excluded.AVAILABLE, RESULT=NULL,
+            ERROR=NULL, UPDATED=excluded.UPDATED
+            WHERE STATUS IN ('done', 'failed')""",
+            data,
+        )
+        await self.database.commit()
+        return self.database.total_changes - before
+
+    async def lease_crawl_task(
+        self,
+        worker: str,
+        lease: str,
+        now: float,
+        expires: float,
+        attempts: int,
+    ):
+        """领取排队任务或租约已过期的任务，超过重试次数的过期任务标记为失败"""
+        await self.database.execute(
+            """UPDATE crawl_task SET STATUS='failed', LEASE=NULL,
+            ERROR=COALESCE(ERROR, 'lease expired'), UPDATED=?
+            WHERE STATUS='leased' AND EXPIRES<=? AND ATTEMPTS>=?""",
+            (now, now, attempts),
+        )
+        async with self.database.execute(
+            """UPDATE crawl_task SET STATUS='leased', WORKER=?, LEASE=?, EXPIRES=?,
+            ATTEMPTS=ATTEMPTS+1, UPDATED=?
+            WHERE ID=(SELECT ID FROM crawl_task
+            WHERE (STATUS='queued' AND AVAILABLE<=?)
+            OR (STATUS='leased' AND EXPIRES<=?)
+            ORDER BY CREATED LIMIT 1) RETURNING *""",
+            (worker, lease, expires, now, now, now),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return row
+
+    async def update_crawl_task(self, sql: str, data: tuple) -> bool:
+        """更新租约有效的采集任务，data 末尾为任务 ID 与租约标识"""
+        async with self.database.execute(
+            f"""UPDATE crawl_task SET {sql}
+            WHERE ID=? AND LEASE=? AND STATUS='leased' RETURNING ID""",
+            data,
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return bool(row)
+
+    async def read_crawl_task(self, id_: str):
+        async with self.database.execute(
+            "SELECT * FROM crawl_task WHERE ID=?", (id_,)
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def count_crawl_task(self, now: float):
+        async with self.database.execute(
+            """SELECT CASE WHEN STATUS='leased' AND EXPIRES<=? THEN 'expired'
+            ELSE STATUS END AS STATUS, COUNT(*) AS COUNT
+            FROM crawl_task GROUP BY 1""",
+            (now,),
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def claim_crawl_item(self, id_: str, worker: str, expires: float, now: float):
+        """占用作品，已完成或被其他进程占用且未过期时返回 False"""
+        async with self.database.execute(
+            """INSERT INTO crawl_item (ID, WORKER, EXPIRES) VALUES (?,?,?)
+            ON CONFLICT (ID) DO UPDATE SET
+            WORKER=excluded.WORKER, EXPIRES=excluded.EXPIRES
+            WHERE DONE=0 AND (WORKER=excluded.WORKER OR EXPIRES<=?)
+            RETURNING ID""",
+            (id_, worker, expires, now),
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self.database.commit()
+        return bool(row)
+
+    async def finish_crawl_item(self, id_: str):
+        await self.database.execute("UPDATE crawl_item SET DONE=1 WHERE ID=?", (id_,))
+        await self.database.commit()
+
+    async def release_crawl_item(self, id_: str, worker: str):
+        await self.database.execute(
+            "DELETE FROM crawl_item WHERE ID=? AND WORKER=? AND DONE=0",
+            (id_, worker),
+        )
+        await self.database.commit()
+
+    async def purge_crawl_data(self):
+        await self.database.execute(
+            "DELETE FROM crawl_task WHERE STATUS IN ('done', 'failed')"
+        )
+        await self.database.execute("DELETE FROM crawl_item")
+        await self.database.commit()
+
     async def __aenter__(self):
         self.compatible()
         await self.__connect_database()
@@ -139,6 +657,8 @@ class Database:
 
     def compatible(self):
         if (
-            old := PROJECT_ROOT.parent.joinpath(self.__FILE)
-        ).exists() and not self.file.exists():
+            self.file == PROJECT_ROOT.joinpath(self.__FILE)
+            and (old := PROJECT_ROOT.parent.joinpath(self.__FILE)).exists()
+            and not self.file.exists()
+        ):
             move(old, self.file)
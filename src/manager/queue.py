@@ -0,0 +1,209 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from json import dumps, loads
+from time import time
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from .database import Database
+
+__all__ = ["CrawlTask", "QueueBackend", "SQLiteQueue"]
+
+
+@dataclass(slots=True)
+class CrawlTask:
+    """已领取的采集任务，lease 为本次租约标识，租约失效后任务可被其他节点领取"""
+
+    id: str
+    kind: str
+    payload: dict[str, Any]
+    lease: str
+    expires: float
+    attempts: int = 1
+    checkpoint: dict[str, Any] = field(default_factory=dict)
+
+
+class QueueBackend(ABC):
+    """分布式采集任务队列，协调节点写入任务，工作节点以租约形式领取任务
+
+    任务 ID 相同时视为同一任务；租约到期前需要发送心跳，租约过期的任务重新排队；
+    作品占用记录用于多个工作节点之间去重"""
+
+    def __init__(self, timeout: float = 300, attempts: int = 3, backoff: float = 30):
+        self.timeout = timeout  # 租约有效时间，单位秒
+        self.attempts = attempts  # 任务最大执行次数
+        self.backoff = backoff  # 任务失败后重新排队的等待时间，单位秒
+
+    @abstractmethod
+    async def put(self, tasks: list[tuple[str, str, dict[str, Any]]]) -> int:
+        """写入 (ID, 类型, 参数) 格式的任务，返回新增或重新排队的任务数量"""
+
+    @abstractmethod
+    async def lease(self, worker: str) -> CrawlTask | None:
+        """领取任务，没有可执行的任务时返回 None"""
+
+    @abstractmethod
+    async def heartbeat(self, task: CrawlTask) -> bool:
+        """延长租约，租约已失效时返回 False"""
+
+    @abstractmethod
+    async def checkpoint(self, task: CrawlTask, data: dict[str, Any]) -> bool:
+        """保存任务检查点，任务重新执行时读取"""
+
+    @abstractmethod
+    async def complete(self, task: CrawlTask, result: dict[str, Any]) -> bool:
+        """任务执行成功"""
+
+    @abstractmethod
+    async def fail(self, task: CrawlTask, error: str) -> bool:
+        """任务执行失败，未达到最大执行次数时重新排队"""
+
+    @abstractmethod
+    async def stats(self) -> dict[str, int]:
+        """各状态任务数量"""
+
+    @abstractmethod
+    async def get(self, id_: str) -> dict[str, Any] | None:
+        """读取任务状态"""
+
+    @abstractmethod
+    async def claim_item(self, id_: str, worker: str) -> bool:
+        """占用作品，作品已完成或被其他节点占用时返回 False"""
+
+    @abstractmethod
+    async def finish_item(self, id_: str) -> None:
+        """作品下载完成"""
+
+    @abstractmethod
+    async def release_item(self, id_: str, worker: str) -> None:
+        """作品下载失败，释放占用"""
+
+    @abstractmethod
+    async def purge(self) -> None:
+        """删除已结束的任务与作品占用记录"""
+
+    def renew(self, task: CrawlTask) -> float:
+        task.expires = time() + self.timeout
+        return task.expires
+
+
+class SQLiteQueue(QueueBackend):
+    """基于 SQLite 数据库的任务队列，适用于单机多进程或共享存储部署"""
+
+    def __init__(
+        self,
+        database: "Database",
+        timeout: float = 300,
+        attempts: int = 3,
+        backoff: float = 30,
+    ):
+        super().__init__(timeout, attempts, backoff)
+        self.database = database
+
+    async def put(self, tasks: list[tuple[str, str, dict[str, Any]]]) -> int:
+        now = time()
+        return await self.database.put_crawl_task(
+            [
+                (id_, kind, dumps(payload, ensure_ascii=False), now, now, now)
+                for id_, kind, payload in tasks
+            ]
+        )
+
+    async def lease(self, worker: str) -> CrawlTask | None:
+        now, lease = time(), uuid4().hex
+        if not (
+            row := await self.database.lease_crawl_task(
+                worker,
+                lease,
+                now,
+                now + self.timeout,
+                self.attempts,
+            )
+        ):
+            return None
+        return CrawlTask(
+            row["ID"],
+            row["KIND"],
+            loads(row["PAYLOAD"]),
+            lease,
+            row["EXPIRES"],
+            row["ATTEMPTS"],
+            loads(row["CHECKPOINT"]),
+        )
+
+    async def heartbeat(self, task: CrawlTask) -> bool:
+        return await self.database.update_crawl_task(
+            "EXPIRES=?, UPDATED=?",
+            (self.renew(task), time(), task.id, task.lease),
+        )
+
+    async def checkpoint(self, task: CrawlTask, data: dict[str, Any]) -> bool:
+        task.checkpoint = data
+        return await self.database.update_crawl_task(
+            "CHECKPOINT=?, EXPIRES=?, UPDATED=?",
+            (
+                dumps(data, ensure_ascii=False),
+                self.renew(task),
+                time(),
+                task.id,
+                task.lease,
+            ),
+        )
+
+    async def complete(self, task: CrawlTask, result: dict[str, Any]) -> bool:
+        return await self.database.update_crawl_task(
+            "STATUS='done', LEASE=NULL, RESULT=?, ERROR=NULL, UPDATED=?",
+            (dumps(result, ensure_ascii=False), time(), task.id, task.lease),
+        )
+
+    async def fail(self, task: CrawlTask, error: str) -> bool:
+        now = time()
+        status = "failed" if task.attempts >= self.attempts else "queued"
+        return await self.database.update_crawl_task(
+            "STATUS=?, LEASE=NULL, WORKER=NULL, ERROR=?, AVAILABLE=?, UPDATED=?",
+            (
+                status,
+                error,
+                now + self.backoff * task.attempts,
+                now,
+                task.id,
+                task.lease,
+            ),
+        )
+
+    async def stats(self) -> dict[str, int]:
+        return {
+            i["STATUS"]: i["COUNT"]
+            for i in await self.database.count_crawl_task(time())
+        }
+
+    async def get(self, id_: str) -> dict[str, Any] | None:
+        if not (row := await self.database.read_crawl_task(id_)):
+            return None
+        return {
+            "id": row["ID"],
+            "kind": row["KIND"],
+            "status": row["STATUS"],
+            "attempts": row["ATTEMPTS"],
+            "worker": row["WORKER"],
+            "payload": loads(row["PAYLOAD"]),
+            "checkpoint": loads(row["CHECKPOINT"]),
+            "result": loads(row["RESULT"]) if row["RESULT"] else None,
+            "error": row["ERROR"],
+        }
+
+    async def claim_item(self, id_: str, worker: str) -> bool:
+        now = time()
+        return await self.database.claim_crawl_item(
+            id_, worker, now + self.timeout, now
+        )
+
+    async def finish_item(self, id_: str) -> None:
+        await self.database.finish_crawl_item(id_)
+
+    async def release_item(self, id_: str, worker: str) -> None:
+        await self.database.release_crawl_item(id_, worker)
+
+    async def purge(self) -> None:
+        await self.database.purge_crawl_data()
@@ -12,9 +12,11 @@ from ..custom import (
 if TYPE_CHECKING:
     from ..tools import ColorfulConsole
     from .database import Database
+    from .queue import QueueBackend
 
 __all__ = [
     "DownloadRecorder",
+    "DistributedRecorder",
 ]
 
 
@@ -136,6 +138,9 @@ class DownloadRecorder:
         if self.switch and id_:
             await self.database.delete_download_data(id_)
 
+    async def release(self, *ids: str) -> None:
+        """仅分布式采集时需要释放作品占用"""
+
     async def delete_ids(self, ids: str) -> None:
         if ids.upper() == "ALL":
             await self.database.delete_all_download_data()
@@ -150,3 +155,49 @@ class DownloadRecorder:
             if id_ := self.detail.search(i):
                 result.append(id_.group())
         return result
+
+
+class DistributedRecorder:
+    """分布式采集时包装作品下载记录，通过任务队列的作品占用记录在多个工作节点之间去重"""
+
+    def __init__(self, recorder: DownloadRecorder, queue: "QueueBackend", worker: str):
+        self.recorder = recorder
+        self.queue = queue
+        self.worker = worker
+        self.items: set[str] = set()  # 本节点占用但尚未下载完成的作品
+
+    def __getattr__(self, name: str):
+        return getattr(self.recorder, name)
+
+    async def has_id(self, id_: str) -> bool:
+        if await self.recorder.has_id(id_):
+            return True
+        if not id_ or id_ in self.items:
+            return False
+        if await self.queue.claim_item(id_, self.worker):
+            self.items.add(id_)
+            return False
+        return True
+
+    async def update_id(self, id_: str):
+        await self.recorder.update_id(id_)
+        if id_:
+            await self.queue.finish_item(id_)
+            self.items.discard(id_)
+
+    async def delete_id(self, id_: str) -> None:
+        await self.recorder.delete_id(id_)
+        await self.release(id_)
+
+    async def release(self, *ids: str) -> None:
+        """释放本节点占用但未下载完成的作品，以便其他节点下载"""
+        for id_ in ids:
+            if id_ in self.items:
+                await self.queue.release_item(id_, self.worker)
+                self.items.discard(id_)
+
+    async def renew(self) -> None:
+        """延长本节点占用作品的有效时间，占用已过期并被其他节点占用的作品不再视为本节点占用"""
+        for id_ in list(self.items):
+            if not await self.queue.claim_item(id_, self.worker):
+                self.items.discard(id_)
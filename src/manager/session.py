@@ -0,0 +1,287 @@
+from asyncio import sleep
+from dataclasses import dataclass, field
+from time import time
+from typing import TYPE_CHECKING, Callable
+from uuid import uuid4
+
+from ..tools import cookie_str_to_dict
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+    from ..tools import TokenBucket
+    from .database import Database
+
+__all__ = ["Session", "SessionPool"]
+
+
+@dataclass(slots=True)
+class Session:
+    """账号会话，包含 Cookie、msToken、ttwid、uifid 与设备信息"""
+
+    id: str
+    platform: str
+    cookie: str
+    ms_token: str = ""
+    ttwid: str = ""
+    uifid: str = ""
+    device_id: str = ""
+    score: float = 1.0  # 健康评分，取值范围 0 至 1
+    cooldown: float = 0.0  # 冷却结束时间戳
+    strikes: int = 0  # 连续触发风控次数
+    failures: int = 0  # 连续请求失败次数
+    requests: int = 0
+    tokens: float = 0.0
+    updated: float = field(default_factory=time)
+
+    @classmethod
+    def create(
+        cls,
+        platform: str,
+        cookie: str,
+        ms_token: str = "",
+        device_id: str = "",
+        id_: str = "",
+    ) -> "Session":
+        values = cookie_str_to_dict(cookie)
+        return cls(
+            id=id_ or uuid4().hex,
+            platform=platform,
+            cookie=cookie,
+            ms_token=ms_token or values.get("msToken", ""),
+            ttwid=values.get("ttwid", ""),
+            uifid=values.get("UIFID", ""),
+            device_id=device_id,
+        )
+
+    @property
+    def params(self) -> dict:
+        """请求该会话时需要替换的请求参数"""
+        params = {"msToken": self.ms_token}
+        if self.platform == "tiktok":
+            params["device_id"] = self.device_id
+        else:
+            params["uifid"] = self.uifid
+        return {k: v for k, v in params.items() if v}
+
+    def refill(self, rate: int, now: float) -> None:
+        """按照每分钟请求次数补充令牌，令牌上限为每分钟请求次数"""
+        self.tokens = min(self.tokens + (now - self.updated) * rate / 60, rate)
+        self.updated = now
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "platform": self.platform,
+            "ms_token": bool(self.ms_token),
+            "ttwid": bool(self.ttwid),
+            "uifid": bool(self.uifid),
+            "device_id": self.device_id,
+            "score": round(self.score, 3),
+            "cooldown": max(self.cooldown - time(), 0),
+            "strikes": self.strikes,
+            "failures": self.failures,
+            "requests": self.requests,
+        }
+
+
+class SessionPool:
+    """会话池，按照健康评分与请求额度为每次请求分配会话，会话状态保存至数据库"""
+
+    RISK = {403, 429}  # 触发风控的响应码
+    MIN_SCORE = 0.2  # 评分低于该值时进入冷却
+    INTERVAL = 30  # 会话状态保存间隔，单位秒
+
+    def __init__(
+        self,
+        database: "Database",
+        log: "BaseLogger | LoggerManager",
+        rate: int = 30,
+        cooldown: int = 600,
+        **kwargs,
+    ):
+        self.database = database
+        self.log = log
+        self.rate = rate  # 每个会话每分钟请求次数上限，0 代表不限制
+        self.cooldown = cooldown  # 首次触发风控后的冷却时长，重复触发时加倍
+        self.sessions: dict[str, Session] = {}
+        self.dirty: set[str] = set()
+        self.saved = time()
+        # 多进程部署时每个会话使用共享令牌桶，请求额度对全部进程生效
+        self.factory: Callable[[str, float], "TokenBucket"] | None = None
+        self.buckets: dict[str, "TokenBucket"] = {}
+
+    def update(self, rate: int, cooldown: int) -> None:
+        self.rate = rate
+        self.cooldown = cooldown
+        for bucket in self.buckets.values():
+            bucket.set_rate(rate / 60)
+
+    def share(self, factory: Callable[[str, float], "TokenBucket"]) -> None:
+        self.factory = factory
+
+    def __bool__(self) -> bool:
+        return bool(self.sessions)
+
+    async def load(self) -> None:
+        for row in await self.database.read_session_data():
+            session = Session.create(
+                row["PLATFORM"],
+                row["COOKIE"],
+                row["MS_TOKEN"],
+                row["DEVICE_ID"],
+                row["ID"],
+            )
+            self.__restore(session, row)
+            session.tokens = self.rate
+            self.sessions[session.id] = session
+        if self.sessions:
+            self.log.info(_("已加载会话 {count} 个").format(count=len(self.sessions)))
+
+    @staticmethod
+    def __restore(session: Session, row) -> None:
+        session.score = row["SCORE"]
+        session.cooldown = row["COOLDOWN"]
+        session.strikes = row["STRIKES"]
+        session.requests = row["REQUESTS"]
+
+    async def sync(self) -> None:
+        """保存本进程的会话状态后读取其他进程添加、删除与更新的会话"""
+        await self.save()
+        rows = {i["ID"]: i for i in await self.database.read_session_data()}
+        for id_ in self.sessions.keys() - rows.keys():
+            del self.sessions[id_]
+            self.buckets.pop(id_, None)
+        for id_, row in rows.items():
+            if session := self.sessions.get(id_):
+                self.__restore(session, row)
+                continue
+            session = Session.create(
+                row["PLATFORM"],
+                row["COOKIE"],
+                row["MS_TOKEN"],
+                row["DEVICE_ID"],
+                id_,
+            )
+            self.__restore(session, row)
+            session.tokens = self.rate
+            self.sessions[id_] = session
+
+    async def add(self, session: Session) -> Session:
+        session.tokens = self.rate
+        self.sessions[session.id] = session
+        await self.database.update_session_data([self.__row(session)])
+        return session
+
+    async def remove(self, id_: str) -> bool:
+        if self.sessions.pop(id_, None):
+            self.dirty.discard(id_)
+            await self.database.delete_session_data(id_)
+            return True
+        return False
+
+    def list(self, platform: str = "") -> list[dict]:
+        return [
+            i.snapshot()
+            for i in self.sessions.values()
+            if not platform or i.platform == platform
+        ]
+
+    async def acquire(self, platform: str) -> Session | None:
+        """返回可用会话；全部会话请求额度耗尽时等待，全部会话冷却中时返回 None"""
+        while True:
+            now = time()
+            sessions = [
+                i
+                for i in self.sessions.values()
+                if i.platform == platform and i.cooldown <= now
+            ]
+            if not sessions:
+                return None
+            if not self.rate:
+                return self.__use(max(sessions, key=self.__priority))
+            for i in sessions:
+                i.refill(self.rate, now)
+            if ready := [i for i in sessions if i.tokens >= 1]:
+                session = max(ready, key=self.__priority)
+                session.tokens -= 1
+                await self.__limit(session)
+                return self.__use(session)
+            await sleep(
+                min((1 - i.tokens) * 60 / self.rate for i in sessions),
+            )
+
+    async def __limit(self, session: Session) -> None:
+        if not self.factory:
+            return
+        if not (bucket := self.buckets.get(session.id)):
+            bucket = self.buckets[session.id] = self.factory(
+                f"session:{session.id}", self.rate / 60
+            )
+        await bucket.consume(1)
+
+    @staticmethod
+    def __priority(session: Session) -> tuple[float, float]:
+        # 评分相同时优先使用剩余额度更多的会话
+        return session.score, session.tokens
+
+    def __use(self, session: Session) -> Session:
+        session.requests += 1
+        self.dirty.add(session.id)
+        return session
+
+    async def report(
+        self,
+        session: Session,
+        data: dict | None,
+        status: int = 200,
+    ) -> None:
+        """根据响应码与响应数据更新会话健康评分"""
+        if status in self.RISK:
+            session.strikes += 1
+            session.score = max(session.score - 0.5, 0)
+            self.__cool(session, self.cooldown * 2 ** min(session.strikes - 1, 5))
+        elif data:
+            session.strikes = session.failures = 0
+            session.score = min(session.score + 0.1, 1)
+        else:
+            # 响应为空通常代表 Cookie 失效或被风控
+            session.failures += 1
+            session.score = max(session.score - 0.2, 0)
+            if session.score < self.MIN_SCORE:
+                self.__cool(session, self.cooldown)
+        self.dirty.add(session.id)
+        if time() - self.saved >= self.INTERVAL:
+            await self.save()
+
+    def __cool(self, session: Session, seconds: float) -> None:
+        session.cooldown = time() + seconds
+        # 冷却结束后以较低评分恢复使用
+        session.score = max(session.score, self.MIN_SCORE)
+        self.log.warning(
+            _("会话 {id} 触发风控，暂停使用 {seconds} 秒").format(
+                id=session.id[:8], seconds=round(seconds)
+            )
+        )
+
+    async def save(self) -> None:
+        self.saved = time()
+        if not self.dirty:
+            return
+        rows = [self.__row(self.sessions[i]) for i in self.dirty if i in self.sessions]
+        self.dirty.clear()
+        await self.database.update_session_data(rows)
+
+    @staticmethod
+    def __row(session: Session) -> tuple:
+        return (
+            session.id,
+            session.platform,
+            session.cookie,
+            session.ms_token,
+            session.device_id,
+            session.score,
+            session.cooldown,
+            session.strikes,
+            session.requests,
+        )
@@ -0,0 +1,114 @@
+from asyncio import CancelledError, Task, create_task, sleep
+from contextlib import suppress
+from time import time
+from typing import TYPE_CHECKING
+
+from ..tools import BANDWIDTH, TokenBucket
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+    from .database import Database
+    from .session import SessionPool
+
+__all__ = ["SharedTokenBucket", "SharedState"]
+
+
+class SharedTokenBucket(TokenBucket):
+    """多进程共享的令牌桶，按批次从数据库扣除令牌，修改速率后同步至全部进程"""
+
+    QUANTUM = 0.1  # 每次从数据库扣除的令牌数量，单位为秒
+
+    def __init__(self, database: "Database", key: str, rate: int | float = 0):
+        super().__init__(rate)
+        self.database = database
+        self.key = key
+        self.tokens = 0.0  # 本进程已扣除但尚未使用的令牌
+        self.changed = True  # 本进程修改速率后需要写入数据库
+
+    def set_rate(self, rate: int | float) -> None:
+        self.rate = rate
+        self.changed = True
+
+    async def reserve(self, size: float) -> float:
+        tokens, self.rate = await self.database.reserve_rate_data(
+            self.key,
+            size,
+            time(),
+            self.rate if self.changed else None,
+        )
+        self.changed = False
+        return tokens
+
+    async def consume(self, size: int) -> None:
+        if not self.rate:
+            return
+        if self.tokens >= size:
+            self.tokens -= size
+            return
+        quantum = max(size, self.rate * self.QUANTUM)
+        tokens = await self.reserve(quantum)
+        self.tokens += quantum - size
+        if tokens < 0 and self.rate:
+            await sleep(-tokens / self.rate)
+
+    async def sync(self) -> None:
+        """写入本进程修改的速率，读取其他进程修改的速率"""
+        await self.reserve(0)
+
+
+class SharedState:
+    """多进程部署时共享下载限速、请求频率与会话状态，定期与数据库同步"""
+
+    def __init__(
+        self,
+        database: "Database",
+        sessions: "SessionPool",
+        log: "BaseLogger | LoggerManager",
+        interval: int | float = 2,
+    ):
+        self.database = database
+        self.sessions = sessions
+        self.log = log
+        self.interval = interval
+        self.buckets: list[SharedTokenBucket] = []
+        self.task: Task | None = None
+
+    def bucket(self, key: str, rate: int | float = 0) -> SharedTokenBucket:
+        bucket = SharedTokenBucket(self.database, key, rate)
+        self.buckets.append(bucket)
+        return bucket
+
+    def share(self) -> None:
+        from ..interface import API
+
+        BANDWIDTH.share(self.bucket)
+        API.limiter = self.bucket("request", API.limiter.rate)
+        self.sessions.share(self.bucket)
+
+    async def sync(self) -> None:
+        for bucket in self.buckets:
+            await bucket.sync()
+        await self.sessions.sync()
+
+    def start(self) -> None:
+        if not self.task or self.task.done():
+            self.task = create_task(self.__run())
+
+    async def __run(self) -> None:
+        while True:
+            await sleep(self.interval)
+            try:
+                await self.sync()
+            except CancelledError:
+                raise
+            except Exception as e:
+                self.log.error(_("同步共享状态失败：{error}").format(error=repr(e)))
+
+    async def close(self) -> None:
+        if self.task and not self.task.done():
+            self.task.cancel()
+            with suppress(CancelledError):
+                await self.task
+        self.task = None
+        await self.sync()
@@ -14,6 +14,10 @@ from .reply import Reply
 from .mix import Mix, MixTikTok
 from .live import Live, LiveTikTok
 from .kuaishou import KuaishouText
+from .library import LibrarySearch
+from .bandwidth import BandwidthLimit
+from .job import DownloadJob
+from .session import SessionAdd
 
 __all__ = (
     "GeneralSearch",
@@ -35,4 +39,8 @@ __all__ = (
     "Live",
     "LiveTikTok",
     "KuaishouText",
+    "LibrarySearch",
+    "BandwidthLimit",
+    "DownloadJob",
+    "SessionAdd",
 )
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class BandwidthLimit(BaseModel):
+    global_: int | None = Field(None, ge=0, alias="global")
+    douyin: int | None = Field(None, ge=0)
+    tiktok: int | None = Field(None, ge=0)
+    kuaishou: int | None = Field(None, ge=0)
+    tasks: dict[str, int] = {}
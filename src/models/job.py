@@ -0,0 +1,16 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class DownloadJob(BaseModel):
+    platform: Literal["douyin", "tiktok"] = "douyin"
+    detail: list[str] = []
+    account: list[str] = []
+    tab: str = "post"
+    earliest: str | float | int | None = None
+    latest: str | float | int | None = None
+    pages: int | None = None
+    mark: str = ""
+    cookie: str = ""
+    proxy: str = ""
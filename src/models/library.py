@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class LibrarySearch(BaseModel):
+    keyword: str = ""
+    platform: Literal["", "douyin", "tiktok"] = ""
+    limit: int = Field(
+        20,
+        gt=0,
+        le=200,
+    )
+    offset: int = Field(
+        0,
+        ge=0,
+    )
@@ -0,0 +1,14 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class SessionEntry(BaseModel):
+    platform: Literal["douyin", "tiktok"] = "douyin"
+    cookie: str = Field(min_length=1)
+    ms_token: str = ""
+    device_id: str = ""
+
+
+class SessionAdd(BaseModel):
+    sessions: list[SessionEntry] = Field(min_length=1)
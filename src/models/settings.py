@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Literal
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,52 @@ class OwnerUrl(BaseModel):
     nickname: str = ""
 
 
+class VideoPolicy(BaseModel):
+    resolution: int = Field(0, ge=0)
+    file_size: int = Field(0, ge=0)
+    batch_size: int = Field(0, ge=0)
+    h265: bool = False
+
+
+class LogOptions(BaseModel):
+    json_: bool = Field(False, alias="json")
+    max_size: int = Field(0, ge=0)
+    when: str = ""
+    backup_count: int = Field(5, ge=0)
+    level: str = "DEBUG"
+
+
+class PreflightOptions(BaseModel):
+    switch: bool = False
+    order: Literal["", "largest", "smallest"] = ""
+    concurrency: int = Field(8, ge=1)
+
+
+class CacheCleanup(BaseModel):
+    max_age: int = Field(168, ge=0)
+    max_size: int = Field(0, ge=0)
+    interval: int = Field(60, ge=0)
+
+
+class Bandwidth(BaseModel):
+    global_: int = Field(0, ge=0, alias="global")
+    douyin: int = Field(0, ge=0)
+    tiktok: int = Field(0, ge=0)
+    kuaishou: int = Field(0, ge=0)
+
+
+class SessionPoolOptions(BaseModel):
+    rate: int = Field(30, ge=0)
+    cooldown: int = Field(600, ge=0)
+
+
+class ProxyPoolOptions(BaseModel):
+    douyin: list[str] = []
+    tiktok: list[str] = []
+    failures: int = Field(3, ge=0)
+    eject: int = Field(300, ge=0)
+
+
 class BrowserInfo(BaseModel):
     User_Agent: str = Field(
         default="",
@@ -100,6 +146,17 @@ class Settings(BaseModel):
     live_qualities: str | None = None
     douyin_platform: bool | None = None
     tiktok_platform: bool | None = None
+    deduplicate: bool | None = None
+    mirror_race: bool | None = None
+    video_policy: VideoPolicy | None = None
+    log_options: LogOptions | None = None
+    verify_moov: bool | None = None
+    preflight: PreflightOptions | None = None
+    disk_watermark: int | None = Field(None, ge=0)
+    cache_cleanup: CacheCleanup | None = None
+    bandwidth: Bandwidth | None = None
+    session_pool: SessionPoolOptions | None = None
+    proxy_pool: ProxyPoolOptions | None = None
     browser_info: BrowserInfo | None = None
     browser_info_tiktok: TikTokBrowserInfo | None = None
 
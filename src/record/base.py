@@ -79,6 +79,17 @@ class BaseLogger:
     def run(self, *args, **kwargs):
         pass
 
+    def close(self):
+        pass
+
+    @property
+    def detailed(self) -> bool:
+        """是否记录请求与响应详细信息"""
+        return False
+
+    def detail(self, text: str, *args):
+        pass
+
     def info(self, text: str, output=True, **kwargs):
         if output:
             self.console.print(text, style=INFO, **kwargs)
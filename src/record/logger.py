@@ -1,7 +1,15 @@
-from logging import INFO as INFO_LEVEL
-from logging import FileHandler, Formatter, getLogger
+from json import dumps
+from logging import DEBUG as DEBUG_LEVEL
+from logging import FileHandler, Formatter, LogRecord, getLevelNamesMapping, getLogger
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from platform import system
+from queue import SimpleQueue
 from shutil import move
 from time import localtime, strftime
 from typing import TYPE_CHECKING
@@ -18,37 +26,121 @@ if TYPE_CHECKING:
     from ..tools import ColorfulConsole
 
 
+class JSONFormatter(Formatter):
+    """JSON Lines 格式日志"""
+
+    def format(self, record: LogRecord) -> str:
+        return dumps(
+            {
+                "time": self.formatTime(record, self.datefmt),
+                "level": record.levelname,
+                "message": record.getMessage(),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+
+class LazyQueueHandler(QueueHandler):
+    """日志消息由后台线程格式化，调用方仅将日志记录放入队列"""
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        return record
+
+
 class LoggerManager(BaseLogger):
     """日志记录"""
 
     encode = "UTF-8-SIG" if system() == "Windows" else "UTF-8"
+    WHEN = {"S", "M", "H", "D", "MIDNIGHT"}
 
     def __init__(
         self, main_path: Path, console: "ColorfulConsole", root="", folder="", name=""
     ):
         super().__init__(main_path, console, root, folder, name)
+        self.listener = None
+        self.handler = None
 
     def run(
         self,
         format_="%(asctime)s[%(levelname)s]:  %(message)s",
         filename=None,
+        json=False,
+        max_size=0,
+        when="",
+        backup_count=5,
+        level="DEBUG",
+        **kwargs,
     ):
         dir_ = self._root.joinpath(self._folder)
         self.compatible(dir_)
         dir_.mkdir(exist_ok=True)
-        file_handler = FileHandler(
+        file_handler = self.__create_handler(
             dir_.joinpath(
                 f"{filename}.log"
                 if filename
                 else f"{strftime(self._name, localtime())}.log"
             ),
-            encoding=self.encode,
+            max_size,
+            when,
+            backup_count,
+        )
+        formatter = (JSONFormatter if json else Formatter)(
+            format_, datefmt="%Y-%m-%d %H:%M:%S"
         )
-        formatter = Formatter(format_, datefmt="%Y-%m-%d %H:%M:%S")
         file_handler.setFormatter(formatter)
+        queue = SimpleQueue()
+        self.listener = QueueListener(queue, file_handler)
+        self.handler = LazyQueueHandler(queue)
         self.log = getLogger(__name__)
-        self.log.addHandler(file_handler)
-        self.log.setLevel(INFO_LEVEL)
+        self.log.addHandler(self.handler)
+        self.log.setLevel(self.__check_level(level))
+        self.listener.start()
+
+    def __create_handler(
+        self,
+        path: Path,
+        max_size: int,
+        when: str,
+        backup_count: int,
+    ) -> FileHandler:
+        if isinstance(max_size, int) and max_size > 0:
+            return RotatingFileHandler(
+                path,
+                maxBytes=max_size,
+                backupCount=backup_count,
+                encoding=self.encode,
+            )
+        if isinstance(when, str) and when.upper() in self.WHEN:
+            return TimedRotatingFileHandler(
+                path,
+                when=when,
+                backupCount=backup_count,
+                encoding=self.encode,
+            )
+        return FileHandler(path, encoding=self.encode)
+
+    def __check_level(self, level: str) -> int:
+        if isinstance(level, str) and (
+            value := getLevelNamesMapping().get(level.upper())
+        ):
+            return value
+        self.console.print(f"日志级别 {level} 无效，程序将使用默认级别：DEBUG")
+        return DEBUG_LEVEL
+
+    def close(self):
+        if self.listener:
+            self.listener.stop()
+            self.log.removeHandler(self.handler)
+            self.listener.handlers[0].close()
+            self.listener = None
+
+    @property
+    def detailed(self) -> bool:
+        return self.log.isEnabledFor(DEBUG_LEVEL)
+
+    def detail(self, text: str, *args):
+        self.log.debug(text, *args)
 
     def info(self, text: str, output=True, **kwargs):
         if output:
@@ -1,3 +1,4 @@
+from .library import Library
 from .manager import RecordManager
 
-__all__ = ["RecordManager"]
+__all__ = ["Library", "RecordManager"]
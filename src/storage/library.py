@@ -0,0 +1,254 @@
+from asyncio import to_thread
+from csv import DictReader
+from json import dumps, loads
+from os import walk
+from pathlib import Path
+from re import compile
+from sqlite3 import DatabaseError, connect
+from typing import TYPE_CHECKING, Callable
+
+from .manager import RecordManager
+
+if TYPE_CHECKING:
+    from ..manager import Database
+
+__all__ = ["Library"]
+
+
+class Library:
+    """作品库索引，汇总作品数据与本地文件，支持全文检索"""
+
+    TITLES = {i[1]: i[0] for i in RecordManager.detail}
+    FIELDS = ("DESCRIPTION", "TAG", "NICKNAME", "MUSIC")
+    LIKE = f"({' OR '.join(f'library_data.{i} LIKE ?' for i in FIELDS)})"
+    RECORD_SUFFIX = {".csv", ".xlsx", ".db"}
+    EXCLUDE = {"Cache", "Store"}
+    INDEX_SUFFIX = compile(r"^(.+)_\d+$")
+    TRIGRAM = 3  # trigram 分词无法匹配少于三个字符的关键词
+
+    def __init__(self, database: "Database"):
+        self.database = database
+
+    @staticmethod
+    def platform(tiktok: bool) -> str:
+        return "tiktok" if tiktok else "douyin"
+
+    @staticmethod
+    def __join(*values) -> str:
+        result = []
+        for i in values:
+            if isinstance(i, list):
+                result.extend(str(j) for j in i if j)
+            elif i:
+                result.append(str(i))
+        return " ".join(result)
+
+    def __format_row(self, item: dict, platform: str) -> tuple:
+        return (
+            str(item["id"]),
+            platform,
+            str(item.get("type", "")),
+            str(item.get("nickname", "")),
+            str(item.get("desc", "")),
+            self.__join(item.get("text_extra"), item.get("tag")),
+            self.__join(item.get("music_author"), item.get("music_title")),
+            str(item.get("create_time", "")),
+            dumps(item, ensure_ascii=False, default=str),
+        )
+
+    async def update(self, data: list[dict], tiktok=False) -> int:
+        """写入或更新作品数据"""
+        platform = self.platform(tiktok)
+        if rows := [self.__format_row(i, platform) for i in data if i.get("id")]:
+            await self.database.write_library_data(rows)
+        return len(rows)
+
+    async def link(self, id_: str, *paths: Path) -> None:
+        """关联作品与本地文件"""
+        if id_ and paths:
+            await self.database.write_library_file(
+                [(str(i.resolve()), id_) for i in paths]
+            )
+
+    async def files(self) -> list:
+        """返回全部已关联的本地文件"""
+        return await self.database.read_all_library_file()
+
+    async def unlink(self, *paths: str) -> None:
+        """移除本地文件关联"""
+        if paths:
+            await self.database.delete_library_file(list(paths))
+
+    async def search(
+        self,
+        keyword: str = "",
+        platform: str = "",
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[dict]:
+        """检索作品数据
+
+        不少于三个字符的关键词使用全文索引检索，按相关度排序；较短的关键词使用
+        LIKE 在全文检索结果中过滤。仅包含较短关键词或未提供关键词时，按发布时间
+        倒序读取索引并逐条匹配，直至获取 limit 条结果，关键词命中越少扫描的作品越多
+        """
+        terms = keyword.split()
+        fts = [i for i in terms if len(i) >= self.TRIGRAM] if self.database.fts else []
+        condition, params = ["1"], []
+        if platform:
+            condition.append("PLATFORM=?")
+            params.append(platform)
+        if search := bool(fts):
+            condition.append("library_search MATCH ?")
+            params.append(" ".join(self.__quote(i) for i in fts))
+            order = "library_search.rank"
+        else:
+            order = "CREATE_TIME DESC"
+        for i in terms:
+            if i not in fts:
+                condition.append(self.LIKE)
+                params.extend([f"%{i}%"] * len(self.FIELDS))
+        rows = await self.database.search_library_data(
+            " AND ".join(condition),
+            tuple(params),
+            order,
+            limit,
+            offset,
+            search,
+        )
+        return await self.__format_result(rows)
+
+    @staticmethod
+    def __quote(term: str) -> str:
+        """转义为 FTS5 短语，避免关键词中的运算符被解析"""
+        return '"{}"'.format(term.replace('"', '""'))
+
+    async def __format_result(self, rows) -> list[dict]:
+        if not rows:
+            return []
+        files = {}
+        for i in await self.database.read_library_file([i["ID"] for i in rows]):
+            path = Path(i["PATH"])
+            files.setdefault(i["ID"], []).append(
+                {"path": str(path), "exists": path.is_file()}
+            )
+        return [
+            {
+                "id": i["ID"],
+                "platform": i["PLATFORM"],
+                "type": i["TYPE"],
+                "nickname": i["NICKNAME"],
+                "desc": i["DESCRIPTION"],
+                "tag": i["TAG"],
+                "music": i["MUSIC"],
+                "create_time": i["CREATE_TIME"],
+                "share_url": loads(i["DATA"]).get("share_url", ""),
+                "files": files.get(i["ID"], []),
+            }
+            for i in rows
+        ]
+
+    async def import_records(self, root: Path, tiktok=False) -> int:
+        """导入已有的 CSV、XLSX、SQLite 作品数据文件"""
+        return await self.update(await to_thread(self.read_records, root), tiktok)
+
+    @classmethod
+    def read_records(cls, root: Path) -> list[dict]:
+        data = []
+        if not root.is_dir():
+            return data
+        for path in root.rglob("*"):
+            if path.suffix not in cls.RECORD_SUFFIX or not path.is_file():
+                continue
+            match path.suffix:
+                case ".csv":
+                    rows = cls.__read_csv(path)
+                case ".xlsx":
+                    rows = cls.__read_xlsx(path)
+                case _:
+                    rows = cls.__read_sqlite(path)
+            data.extend(cls.__convert(i) for i in rows)
+        return [i for i in data if i.get("id")]
+
+    @classmethod
+    def __convert(cls, row: dict) -> dict:
+        return {cls.TITLES[k]: v for k, v in row.items() if k in cls.TITLES}
+
+    @staticmethod
+    def __read_csv(path: Path) -> list[dict]:
+        with path.open("r", encoding="UTF-8-SIG", newline="") as f:
+            return list(DictReader(f))
+
+    @staticmethod
+    def __read_xlsx(path: Path) -> list[dict]:
+        from openpyxl import load_workbook
+
+        result = []
+        book = load_workbook(path, read_only=True)
+        try:
+            for sheet in book.worksheets:
+                rows = sheet.iter_rows(values_only=True)
+                title = next(rows, ())
+                result.extend(dict(zip(title, i)) for i in rows)
+        finally:
+            book.close()
+        return result
+
+    @staticmethod
+    def __read_sqlite(path: Path) -> list[dict]:
+        result = []
+        try:
+            database = connect(path)
+        except DatabaseError:
+            return result
+        try:
+            tables = database.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ).fetchall()
+            for (table,) in tables:
+                cursor = database.execute(f'SELECT * FROM "{table}"')
+                title = [i[0] for i in cursor.description]
+                if "作品ID" in title:
+                    result.extend(dict(zip(title, i)) for i in cursor)
+        except DatabaseError:
+            pass
+        finally:
+            database.close()
+        return result
+
+    async def import_files(
+        self,
+        root: Path,
+        namer: Callable[[dict], str],
+        tiktok=False,
+    ) -> int:
+        """根据作品文件命名规则，关联下载文件夹中已存在的文件"""
+        files = await to_thread(self.scan_files, root)
+        links = []
+        for i in await self.database.read_library_data(self.platform(tiktok)):
+            try:
+                name = namer(loads(i["DATA"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            links.extend((str(j), i["ID"]) for j in files.get(name, ()))
+        if links:
+            await self.database.write_library_file(links)
+        return len(links)
+
+    @classmethod
+    def scan_files(cls, root: Path) -> dict[str, list[Path]]:
+        """按文件名称建立索引，图集文件同时以去除序号后的名称索引"""
+        files = {}
+        if not root.is_dir():
+            return files
+        for folder, folders, names in walk(root):
+            folders[:] = [i for i in folders if i not in cls.EXCLUDE]
+            folder = Path(folder).resolve()
+            for name in names:
+                path = folder.joinpath(name)
+                if path.suffix in cls.RECORD_SUFFIX:
+                    continue
+                files.setdefault(stem := path.stem, []).append(path)
+                if match := cls.INDEX_SUFFIX.match(stem):
+                    files.setdefault(match.group(1), []).append(path)
+        return files
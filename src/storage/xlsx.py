@@ -1,9 +1,6 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.utils.exceptions import IllegalCharacterError
-
 from ..translation import _
 from .text import BaseTextLogger
 
@@ -17,6 +14,7 @@ class XLSXLogger(BaseTextLogger):
     """XLSX 格式保存数据"""
 
     __type = "xlsx"
+    PART_SIZE = 512 * 1024  # 数据文件超过该大小后，新数据写入分卷文件
 
     def __init__(
         self,
@@ -34,27 +32,48 @@ class XLSXLogger(BaseTextLogger):
         self.book = None  # XLSX数据簿
         self.sheet = None  # XLSX数据表
         self.name = self._rename(root, self.__type, old, name)  # 文件名称
+        self.root = root
         self.path = root.joinpath(f"{self.name}.{self.__type}")
         self.title_line = title_line  # 标题行
         self.field_keys = field_keys
 
     async def __aenter__(self):
-        self.book = load_workbook(self.path) if self.path.exists() else Workbook()
-        self.sheet = self.book.active
+        # 仅在使用 XLSX 格式时导入 openpyxl，减少启动耗时
+        from openpyxl import Workbook, load_workbook
+
+        self.path = self.__select_part()
+        if self.path.exists():
+            self.book = load_workbook(self.path)
+            self.sheet = self.book.active
+        else:
+            self.book = Workbook(write_only=True)
+            self.sheet = self.book.create_sheet()
         self.title()
         return self
 
+    def __select_part(self) -> Path:
+        """追加写入需要加载整个数据簿，较大的数据文件不再写入，改为写入新的分卷文件"""
+        path, index = self.path, 0
+        while path.exists() and path.stat().st_size >= self.PART_SIZE:
+            index += 1
+            path = self.root.joinpath(f"{self.name}.{index}.{self.__type}")
+        return path
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self.book.save(self.path)
         self.book.close()
 
     def title(self):
-        if not self.sheet["A1"].value:
+        if self.book.write_only:
+            self.sheet.append(self.title_line)
+        elif not self.sheet["A1"].value:
             # 如果文件没有任何数据，则写入标题行
             for col, value in enumerate(self.title_line, start=1):
                 self.sheet.cell(row=1, column=col, value=value)
 
     async def _save(self, data, *args, **kwargs):
+        from openpyxl.utils.exceptions import IllegalCharacterError
+
         try:
             self.sheet.append(data)
         except IllegalCharacterError as e:
@@ -0,0 +1,41 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from src.tools import DirectoryIndex
+
+
+def create_files(folder: Path, amount: int) -> None:
+    for i in range(amount):
+        folder.joinpath(f"作品_{i:06d}.mp4").touch()
+
+
+def main(amount: int = 50_000, lookups: int = 500):
+    with TemporaryDirectory() as temp:
+        folder = Path(temp)
+        create_files(folder, amount)
+        step = amount * 2 // lookups
+        paths = [folder.joinpath(f"作品_{i:06d}") for i in range(0, amount * 2, step)]
+
+        start = perf_counter()
+        glob = sum(any(i.parent.glob(f"{i.name}.mp4")) for i in paths)
+        glob_time = perf_counter() - start
+
+        start = perf_counter()
+        exists = sum(i.with_name(f"{i.name}.mp4").exists() for i in paths)
+        exists_time = perf_counter() - start
+
+        start = perf_counter()
+        index = DirectoryIndex()
+        cached = sum(index.match(i, "mp4") for i in paths)
+        index_time = perf_counter() - start
+
+        assert glob == exists == cached
+        print(f"{amount} files, {len(paths)} lookups")
+        print(f"glob:   {glob_time * 1000:.1f} ms")
+        print(f"exists: {exists_time * 1000:.1f} ms")
+        print(f"index:  {index_time * 1000:.1f} ms (including one scandir)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from asyncio import run
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process, Queue
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, process_time
+
+from aiofiles import open
+from httpx import AsyncClient
+from rich.progress import Progress
+
+from src.downloader.writer import FileWriter, ProgressThrottle
+
+SIZE = 256 * 1024 * 1024
+CHUNK = 64 * 1024
+BLOCK = b"\0" * 1024 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(SIZE))
+        self.end_headers()
+        for _ in range(SIZE // len(BLOCK)):
+            self.wfile.write(BLOCK)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(queue: Queue) -> None:
+    """本地服务器运行于独立进程，避免计入下载端的 CPU 时间"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    queue.put(server.server_port)
+    server.serve_forever()
+
+
+async def legacy(client: AsyncClient, url: str, path: Path, progress: Progress):
+    task_id = progress.add_task("legacy", total=SIZE)
+    async with client.stream("GET", url) as response:
+        async with open(path, "ab") as f:
+            async for chunk in response.aiter_bytes(CHUNK):
+                await f.write(chunk)
+                progress.update(task_id, advance=len(chunk))
+    progress.remove_task(task_id)
+
+
+async def writer(client: AsyncClient, url: str, path: Path, progress: Progress):
+    task_id = progress.add_task("writer", total=SIZE)
+    throttle = ProgressThrottle(progress, task_id)
+    async with client.stream("GET", url) as response:
+        async with FileWriter(path) as f:
+            async for chunk in response.aiter_bytes(CHUNK):
+                await f.write(chunk)
+                throttle.update(len(chunk))
+    throttle.flush()
+    progress.remove_task(task_id)
+
+
+async def measure(function, url: str, root: Path) -> tuple[float, float]:
+    path = root.joinpath(function.__name__)
+    async with AsyncClient(timeout=None) as client:
+        with Progress(disable=True) as progress:
+            begin, cpu = perf_counter(), process_time()
+            await function(client, url, path, progress)
+            elapsed, cpu = perf_counter() - begin, process_time() - cpu
+    assert path.stat().st_size == SIZE
+    path.unlink()
+    gigabyte = SIZE / 1024 / 1024 / 1024
+    return SIZE / 1024 / 1024 / elapsed, cpu / gigabyte
+
+
+def main():
+    queue = Queue()
+    server = Process(target=serve, args=(queue,), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{queue.get()}/video.mp4"
+    try:
+        with TemporaryDirectory() as temp:
+            for function in (legacy, writer):
+                speed, cpu = run(measure(function, url, Path(temp)))
+                print(f"{function.__name__}: {speed:.1f} MB/s, {cpu:.2f} CPU s/GB")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from datetime import datetime
+from json import dumps, loads
+from time import perf_counter
+
+from src.models import DataResponse
+from src.tools import serialize
+from src.tools.serialize import json_bytes, json_dumps, json_loads
+
+
+def create_page(index: int, amount: int = 18) -> dict:
+    """模拟账号作品接口响应，字段结构与数量接近真实数据"""
+    return {
+        "status_code": 0,
+        "has_more": 1,
+        "max_cursor": 1700000000000 - index,
+        "aweme_list": [
+            {
+                "aweme_id": f"73{index:08d}{i:09d}",
+                "desc": f"作品描述 {i} #话题{i} #测试 @用户{i}",
+                "create_time": 1700000000 + i,
+                "author": {
+                    "uid": f"{i:019d}",
+                    "sec_uid": f"MS4wLjABAAAA{'x' * 64}",
+                    "nickname": f"账号昵称{i}",
+                    "signature": "个人简介\n" * 3,
+                },
+                "music": {
+                    "id": i,
+                    "title": f"原声{i}",
+                    "play_url": {"url_list": [f"https://example.com/{i}.mp3"] * 3},
+                },
+                "statistics": {
+                    "digg_count": i * 100,
+                    "comment_count": i * 10,
+                    "share_count": i,
+                    "collect_count": i * 3,
+                },
+                "video": {
+                    "bit_rate": [
+                        {
+                            "bit_rate": 1000000 + j,
+                            "play_addr": {
+                                "url_list": [f"https://example.com/{i}/{j}.mp4"] * 3,
+                                "width": 1080,
+                                "height": 1920,
+                            },
+                        }
+                        for j in range(4)
+                    ],
+                    "duration": 15000,
+                },
+                "text_extra": [{"hashtag_name": f"话题{j}"} for j in range(5)],
+            }
+            for i in range(amount)
+        ],
+    }
+
+
+def measure(function, repeat: int) -> float:
+    begin = perf_counter()
+    for _ in range(repeat):
+        function()
+    return (perf_counter() - begin) / repeat * 1000
+
+
+def legacy_response(data: list[dict]) -> bytes:
+    """DataResponse 模型校验后由 FastAPI 再次校验并使用标准库编码"""
+    model = DataResponse(message="", data=data, params={})
+    content = DataResponse.model_validate(model.model_dump()).model_dump(mode="json")
+    return dumps(content, ensure_ascii=False).encode()
+
+
+def fast_response(data: list[dict]) -> bytes:
+    content = DataResponse(message="", params={}).model_dump()
+    content["data"] = data
+    return json_bytes(content)
+
+
+def main(pages: int = 50, repeat: int = 5):
+    raw = [dumps(create_page(i), ensure_ascii=False).encode() for i in range(pages)]
+    data = [
+        {**i, "collection_time": f"{datetime.now():%Y-%m-%d %H:%M:%S}"}
+        for page in raw
+        for i in loads(page)["aweme_list"]
+    ]
+    events = [
+        {"type": "progress.update", "task_id": i, "completed": i} for i in range(5000)
+    ]
+    print(
+        f"backend: {serialize.JSON_BACKEND}, {pages} pages, "
+        f"{sum(map(len, raw)) / 1024 / 1024:.1f} MB, {len(data)} items"
+    )
+    cases = (
+        (
+            "parse pages",
+            lambda: [loads(i) for i in raw],
+            lambda: [json_loads(i) for i in raw],
+        ),
+        ("data response", lambda: legacy_response(data), lambda: fast_response(data)),
+        (
+            "sse events",
+            lambda: [f"data: {dumps(i, ensure_ascii=False)}\n\n" for i in events],
+            lambda: [f"data: {json_dumps(i)}\n\n" for i in events],
+        ),
+    )
+    for name, legacy, fast in cases:
+        print(
+            f"{name}: legacy {measure(legacy, repeat):.1f} ms, "
+            f"fast {measure(fast, repeat):.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+
+from src.kuaishou.source.extract import HTMLExtractor
+from src.testers.logger import Logger
+
+FIXTURES = Path(__file__).parent.joinpath("data", "kuaishou")
+
+
+def inflate(html: str, keyword: str, size: int) -> str:
+    """在状态对象前后填充大量脚本与数据，模拟体积较大的网页"""
+    padding = '{"k":"%s","v":[1,2,3],"s":"}{"}' % ("x" * 64)
+    noise = "<script>var noise=[%s];</script>\n" % ",".join([padding] * 256)
+    count = max(size // len(noise), 1)
+    head, tail = html.split(keyword, 1)
+    return head + noise * count + keyword + tail + noise * count
+
+
+def measure(function, *args, rounds: int = 5) -> float:
+    start = perf_counter()
+    for _ in range(rounds):
+        function(*args)
+    return (perf_counter() - start) / rounds
+
+
+def legacy(extractor: HTMLExtractor, html: str, web: bool) -> dict:
+    text = extractor._HTMLExtractor__extract_object(html, web)
+    return extractor._HTMLExtractor__convert_object(text, web)
+
+
+def main(size: int = 4 * 1024 * 1024):
+    extractor = HTMLExtractor(SimpleNamespace(console=Logger(), cleaner=None))
+    for name, web, keyword in (
+        ("web_video.html", True, "<script>window.__APOLLO_STATE__"),
+        ("app_atlas.html", False, "<script>window.INIT_STATE"),
+    ):
+        html = inflate(
+            FIXTURES.joinpath(name).read_text(encoding="utf-8"), keyword, size
+        )
+        old = measure(legacy, extractor, html, web)
+        new = measure(extractor._HTMLExtractor__extract_state, html, web)
+        print(
+            f"{name}: {len(html) / 1024 / 1024:.2f} MB, "
+            f"legacy {old * 1000:.2f} ms, bounded {new * 1000:.2f} ms, "
+            f"speedup {old / new:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from pathlib import Path
+from subprocess import run
+from sys import executable
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+# 入口模块与运行模式对应关系
+ENTRIES = {
+    "cli": "from src.application import TikTokDownloader",
+    "server": "from src.application.main_server import APIServer",
+    "webui": "from src.application.main_webui import WebUIServer",
+}
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """使用 python -X importtime 统计模块导入耗时，返回模块名称与累计耗时（微秒）"""
+    result = run(
+        [executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        __, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(top: int = 15):
+    for mode, statement in ENTRIES.items():
+        times = import_times(statement)
+        print(f"{mode}: {sum(times[i] for i in times if '.' not in i) / 1000:.0f} ms")
+        for name, cost in sorted(times.items(), key=lambda i: i[1])[-top:][::-1]:
+            print(f"  {cost / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from asyncio import run
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from openpyxl import Workbook, load_workbook
+
+from src.storage import RecordManager
+from src.storage.xlsx import XLSXLogger
+
+
+class _Console:
+    def warning(self, *args, **kwargs):
+        pass
+
+
+ROW = [f"value_{i}" for i in range(len(RecordManager.detail_name))]
+
+
+def create_workbook(path: Path, amount: int) -> None:
+    book = Workbook(write_only=True)
+    sheet = book.create_sheet()
+    sheet.append(RecordManager.detail_name)
+    for _ in range(amount):
+        sheet.append(ROW)
+    book.save(path)
+
+
+def append_legacy(path: Path, amount: int) -> None:
+    book = load_workbook(path)
+    for _ in range(amount):
+        book.active.append(ROW)
+    book.save(path)
+    book.close()
+
+
+async def append_logger(root: Path, amount: int) -> None:
+    async with XLSXLogger(
+        root,
+        RecordManager.detail_name,
+        RecordManager.detail_keys,
+        _Console(),
+    ) as logger:
+        for _ in range(amount):
+            await logger.save(ROW.copy())
+
+
+def measure(function, *args) -> tuple[float, float]:
+    """分别测量耗时与内存峰值，tracemalloc 会显著拖慢 openpyxl"""
+    begin = perf_counter()
+    function(*args)
+    elapsed = perf_counter() - begin
+    start()
+    function(*args)
+    peak = get_traced_memory()[1]
+    stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main(amount: int = 20_000, append: int = 50):
+    with TemporaryDirectory() as temp:
+        root = Path(temp)
+        path = root.joinpath("Download.xlsx")
+        create_workbook(path, amount)
+        print(f"{amount} rows, {path.stat().st_size / 1024 / 1024:.1f} MB")
+        legacy = measure(append_legacy, path, append)
+        logger = measure(lambda: run(append_logger(root, append)))
+        print(f"legacy: {legacy[0]:.2f} s, peak {legacy[1]:.1f} MB")
+        print(f"logger: {logger[0]:.2f} s, peak {logger[1]:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,3 +30,12 @@ class Logger:
         print(
             *args,
         )
+
+    detailed = True
+
+    @staticmethod
+    def detail(
+        text: str,
+        *args,
+    ):
+        print(text % args)
@@ -38,6 +38,10 @@ class Params:
         self.console = Console()
         self.max_retry = 0
         self.timeout = 5
+        self.sessions = None
+        self.credentials = None
+        self.proxies = None
+        self.proxies_tiktok = None
         self.max_pages = 2
         self.date_format = "%Y-%m-%d %H:%M:%S"
         self.client = create_client(
@@ -0,0 +1,60 @@
+from asyncio import gather, run
+from time import perf_counter
+
+from src.tools.bandwidth import BANDWIDTH_TASK, Bandwidth, TokenBucket
+
+
+async def _chunks(amount: int, size: int):
+    for _ in range(amount):
+        yield b"\0" * size
+
+
+async def _read(bandwidth: Bandwidth, platform: str, task="", size=1000) -> int:
+    BANDWIDTH_TASK.set(task)
+    total = 0
+    async for chunk in bandwidth.iterate(_chunks(10, size), platform):
+        total += len(chunk)
+    return total
+
+
+def _elapsed(coroutine) -> float:
+    start = perf_counter()
+    run(coroutine)
+    return perf_counter() - start
+
+
+def test_unlimited():
+    assert _elapsed(_read(Bandwidth(), "douyin")) < 0.1
+
+
+def test_global_limit_is_shared():
+    bandwidth = Bandwidth()
+    bandwidth.update({"global": 20000})
+
+    async def inner():
+        # 两个任务共 20000 字节，首秒允许突发 20000 字节
+        await gather(_read(bandwidth, "douyin"), _read(bandwidth, "tiktok"))
+        await _read(bandwidth, "douyin")
+
+    assert 0.4 < _elapsed(inner()) < 1.5
+
+
+def test_platform_and_task_limit():
+    bandwidth = Bandwidth()
+    bandwidth.update({"tiktok": 20000}, {"task": 10000})
+    assert bandwidth.limits()["tasks"] == {"task": 10000}
+    assert _elapsed(_read(bandwidth, "douyin")) < 0.1
+    # 首秒允许突发 10000 字节，其余 10000 字节限速读取
+    assert 0.8 < _elapsed(_read(bandwidth, "douyin", "task", 2000)) < 1.5
+    bandwidth.update(tasks={"task": 0})
+    assert bandwidth.limits()["tasks"] == {}
+
+
+def test_token_bucket_rate_change():
+    bucket = TokenBucket(1000)
+    bucket.set_rate(0)
+
+    async def inner():
+        await bucket.consume(10**9)
+
+    assert _elapsed(inner()) < 0.1
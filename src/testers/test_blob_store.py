@@ -0,0 +1,133 @@
+from asyncio import run
+from hashlib import sha256
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.downloader import Downloader
+from src.downloader.store import BlobStore
+from src.downloader.verify import FileVerifier
+
+
+class _Database:
+    def __init__(self):
+        self.blobs = {}
+        self.assets = {}
+
+    async def read_asset_data(self, key: str):
+        if hash_ := self.assets.get(key):
+            return {"HASH": hash_, "SUFFIX": self.blobs[hash_]}
+        return None
+
+    async def write_asset_data(self, key: str, hash_: str, suffix: str, size: int):
+        self.blobs.setdefault(hash_, suffix)
+        self.assets[key] = hash_
+
+
+def test_key_and_uri():
+    assert BlobStore.key("mp4", "7168743658076900608") == "mp4:7168743658076900608"
+    assert BlobStore.key("mp4", "") == ""
+    assert (
+        BlobStore.uri("mp3", "https://sf3.douyinstatic.com/obj/ies-music/1.mp3?a=1")
+        == BlobStore.uri("mp3", "https://sf6.douyinstatic.com/obj/ies-music/1.mp3")
+        == "mp3:obj/ies-music/1.mp3"
+    )
+
+
+def test_save_and_link(tmp_path):
+    async def inner():
+        store = BlobStore(tmp_path.joinpath("Store"), _Database(), True)
+        content = b"music" * 1024
+        digest = sha256(content).hexdigest()
+        for index in range(2):
+            cache = tmp_path.joinpath(f"cache_{index}.mp3")
+            cache.write_bytes(content)
+            actual = tmp_path.joinpath(f"account_{index}", "music.mp3")
+            actual.parent.mkdir()
+            await store.save(cache, actual, f"mp3:{index}", digest)
+            assert actual.read_bytes() == content
+            assert not cache.exists()
+        blob, suffix = await store.lookup("mp3:0")
+        assert blob == store.path(digest)
+        assert suffix == "mp3"
+        assert len(list(tmp_path.joinpath("Store").rglob("*.*"))) == 0
+        assert await store.lookup("mp3:missing") is None
+
+    run(inner())
+
+
+def test_resume_hasher(tmp_path):
+    async def inner():
+        store = BlobStore(tmp_path, _Database(), True)
+        cache = tmp_path.joinpath("cache.mp4")
+        cache.write_bytes(b"head")
+        digest = await store.hasher(cache, 4)
+        digest.update(b"tail")
+        assert digest.hexdigest() == sha256(b"headtail").hexdigest()
+
+    run(inner())
+
+
+class _Log:
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+
+class _Library:
+    def __init__(self):
+        self.paths = {}
+
+    async def files(self):
+        return [{"ID": i, "PATH": str(j)} for i, j in self.paths.items()]
+
+    async def link(self, id_: str, path: Path):
+        self.paths[id_] = path
+
+    async def unlink(self, *paths: str):
+        self.paths = {i: j for i, j in self.paths.items() if str(j) not in paths}
+
+
+class _Recorder:
+    def __init__(self):
+        self.ids = set()
+
+    async def update_id(self, id_: str):
+        self.ids.add(id_)
+
+    async def delete_id(self, id_: str):
+        self.ids.discard(id_)
+
+
+def test_verified_blob_not_relinked(tmp_path):
+    async def inner():
+        # 仅测试作品库校验与存储库链接，无需初始化完整的运行参数
+        downloader = Downloader.__new__(Downloader)
+        downloader.store = BlobStore(tmp_path.joinpath("Store"), _Database(), True)
+        downloader.verifier = FileVerifier()
+        downloader.library = _Library()
+        downloader.recorder = _Recorder()
+        downloader.index = set()
+        downloader.log = _Log()
+        # 缺少 moov 盒子的视频文件
+        content = b"\0\0\0\x10ftypisom\0\0\0\0" + b"\0\0\0\x10mdat" + b"\0" * 8
+        cache = tmp_path.joinpath("cache.mp4")
+        cache.write_bytes(content)
+        actual = tmp_path.joinpath("video.mp4")
+        await downloader.store.save(cache, actual, "mp4:1", sha256(content).hexdigest())
+        await downloader.library.link("1", actual)
+        corrupt = await downloader.verify_library()
+        assert [i["path"] for i in corrupt] == [str(actual)]
+        assert not actual.exists()
+        # 重新下载时不会链接存储库中的损坏文件
+        blob = await downloader.store.lookup("mp4:1")
+        count = SimpleNamespace(downloaded_video=set())
+        assert not await downloader.link_file(
+            *blob, actual.with_suffix(""), "video", "1", count
+        )
+        assert not actual.exists() and not blob[0].exists()
+        assert await downloader.store.lookup("mp4:1") is None
+        assert not downloader.recorder.ids
+
+    run(inner())
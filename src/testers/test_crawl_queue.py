@@ -0,0 +1,261 @@
+from asyncio import Semaphore, run, sleep
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
+
+from src.application.crawl import Coordinator, CrawlWorker
+from src.downloader import Downloader
+from src.downloader.mirror import Mirror
+from src.downloader.preflight import Preflight
+from src.downloader.space import DiskSpace
+from src.extract import MediaIndex
+from src.manager import Database, DistributedRecorder, SQLiteQueue
+from src.tools import ProxyPool
+from src.tools.directory import DirectoryIndex
+from src.translation import _
+
+
+class _Log:
+    detailed = False
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        pass
+
+
+class _Recorder:
+    def __init__(self):
+        self.ids = set()
+
+    async def has_id(self, id_: str) -> bool:
+        return id_ in self.ids
+
+    async def update_id(self, id_: str):
+        self.ids.add(id_)
+
+    async def delete_id(self, id_: str) -> None:
+        self.ids.discard(id_)
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+def _handler() -> SimpleNamespace:
+    # 仅测试任务调度，无需初始化完整的运行参数
+    events = []
+    return SimpleNamespace(
+        events=events,
+        emit=events.append,
+        logger=_Log(),
+        count=SimpleNamespace(success=0, failed=0, skipped=0),
+        downloader=SimpleNamespace(recorder=_Recorder()),
+    )
+
+
+def test_lease_expiry_and_retry(tmp_path: Path):
+    async def inner():
+        first, second = await _database(tmp_path), await _database(tmp_path)
+        a = SQLiteQueue(first, timeout=0.2, attempts=2, backoff=0)
+        b = SQLiteQueue(second, timeout=0.2, attempts=2, backoff=0)
+        try:
+            coordinator = Coordinator(a)
+            assert await coordinator.submit("account", ["x", "y", "x"]) == 2
+            # 未结束的任务重复提交时忽略
+            assert await coordinator.submit("account", ["x"]) == 0
+
+            task = await a.lease("a")
+            assert task.id == "account:douyin:x" and task.payload["item"] == "x"
+            assert await a.checkpoint(task, {"earliest": "2024/01/01"})
+            other = await b.lease("b")
+            assert other.id == "account:douyin:y"
+            assert await b.lease("b") is None
+            assert await b.complete(other, {"count": 0})
+
+            # 租约过期后任务由其他节点领取，原节点无法继续更新任务
+            await sleep(0.25)
+            retried = await b.lease("b")
+            assert retried.id == task.id and retried.attempts == 2
+            assert retried.checkpoint == {"earliest": "2024/01/01"}
+            assert not await a.heartbeat(task)
+            assert not await a.complete(task, {})
+            assert await b.heartbeat(retried)
+
+            # 达到最大执行次数后标记为失败
+            assert await b.fail(retried, "error")
+            assert (await a.get(task.id))["status"] == "failed"
+            await sleep(0.25)
+            assert await a.lease("a") is None
+            assert await a.stats() == {"done": 1, "failed": 1}
+
+            # 已结束的任务重新提交时保留检查点
+            assert await coordinator.submit("account", ["x"]) == 1
+            task = await a.lease("a")
+            assert task.attempts == 1 and task.checkpoint["earliest"] == "2024/01/01"
+            assert await a.complete(task, {"count": 1})
+            assert (await b.get(task.id))["result"] == {"count": 1}
+            await a.purge()
+            assert await a.stats() == {}
+        finally:
+            await first.close()
+            await second.close()
+
+    run(inner())
+
+
+def test_items_deduplicated_across_workers(tmp_path: Path):
+    async def inner():
+        first, second = await _database(tmp_path), await _database(tmp_path)
+        try:
+            a = DistributedRecorder(_Recorder(), SQLiteQueue(first, 0.2), "a")
+            b = DistributedRecorder(_Recorder(), SQLiteQueue(second, 0.2), "b")
+            assert not await a.has_id("1")
+            assert not await a.has_id("1")
+            assert await b.has_id("1")
+
+            # 下载失败释放占用，其他节点可以下载
+            await a.delete_id("1")
+            assert not await b.has_id("1")
+            await b.update_id("1")
+            assert await a.has_id("1")
+
+            # 占用节点退出后，占用记录过期
+            assert not await a.has_id("2")
+            await sleep(0.25)
+            assert not await b.has_id("2")
+            await a.renew()
+            assert await a.has_id("2")
+        finally:
+            await first.close()
+            await second.close()
+
+    run(inner())
+
+
+def test_worker_requeues_failed_task(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        queue = SQLiteQueue(database, timeout=1.5, attempts=2, backoff=0)
+        handler = _handler()
+        worker = CrawlWorker(handler, queue, concurrency=2, interval=0.02)
+        calls = []
+
+        async def account(task):
+            calls.append(task.payload["item"])
+            await sleep(0.6)
+            if task.payload["item"] == "bad" and task.attempts == 1:
+                raise ValueError
+            return {"count": 1}
+
+        worker.handlers["account"] = account
+        try:
+            assert isinstance(handler.downloader.recorder, DistributedRecorder)
+            await Coordinator(queue).submit("account", ["good", "bad"])
+            await worker.run(exit_when_empty=True)
+            # 执行时间超过心跳间隔，心跳保持租约有效
+            assert sorted(calls) == ["bad", "bad", "good"]
+            assert await queue.stats() == {"done": 2}
+            assert (handler.count.success, handler.count.failed) == (2, 1)
+            assert [i["type"] for i in handler.events].count("task.done") == 3
+        finally:
+            await database.close()
+
+    run(inner())
+
+
+class _Forbidden(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(403)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+async def _lookup(key: str):
+    return None
+
+
+async def _update(data: list[dict], tiktok: bool):
+    pass
+
+
+def _downloader(recorder: DistributedRecorder, tmp_path: Path) -> Downloader:
+    # 仅测试批量下载失败时释放作品占用，无需初始化完整的运行参数
+    downloader = Downloader.__new__(Downloader)
+    downloader.recorder = recorder
+    downloader.download = True
+    downloader.batches = 0
+    downloader.index = DirectoryIndex()
+    downloader.mirror = Mirror()
+    downloader.media = MediaIndex()
+    downloader.resume = SimpleNamespace(
+        due=lambda: False, check=lambda file, target: (0, "")
+    )
+    downloader.estimate_size = lambda data: sleep(0)
+    downloader.library = SimpleNamespace(update=_update)
+    downloader.store = SimpleNamespace(key=lambda *args: "", lookup=_lookup)
+    downloader.desc_length = 64
+    downloader.generate_detail_name = lambda item: item["id"]
+    downloader.folder_mode = False
+    downloader.params = SimpleNamespace(
+        cache=tmp_path.joinpath("cache"), proxies=ProxyPool()
+    )
+    downloader.music = downloader.static_cover = downloader.dynamic_cover = False
+    downloader.preflight = Preflight()
+    downloader.space = DiskSpace(_Log())
+    downloader.received = 0
+    downloader.files = SimpleNamespace(succeeded=0, failed=0)
+    downloader.general_progress_object = Downloader.init_general_progress(
+        downloader, True
+    )
+    downloader.semaphore = Semaphore(1)
+    downloader.client = None
+    downloader.headers = {}
+    downloader.max_retry = 0
+    downloader.log = downloader.console = _Log()
+    downloader.params.cache.mkdir()
+    return downloader
+
+
+def test_failed_download_releases_item(tmp_path: Path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Forbidden)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    async def inner():
+        first, second = await _database(tmp_path), await _database(tmp_path)
+        try:
+            a = DistributedRecorder(_Recorder(), SQLiteQueue(first, 60), "a")
+            b = DistributedRecorder(_Recorder(), SQLiteQueue(second, 60), "b")
+            downloader = _downloader(a, tmp_path)
+            item = {
+                "id": "1",
+                "desc": "",
+                "type": _("视频"),
+                "downloads": f"http://127.0.0.1:{server.server_port}/1.mp4",
+                "music_url": "",
+                "static_cover": "",
+                "dynamic_cover": "",
+            }
+            assert await downloader.batch_processing([item], tmp_path) == (0, 1)
+            # 下载失败后释放占用，心跳不再延长占用，其他节点可以下载
+            assert not a.items
+            await a.renew()
+            assert not a.items
+            assert not await b.has_id("1")
+        finally:
+            await first.close()
+            await second.close()
+            server.shutdown()
+            server.server_close()
+
+    run(inner())
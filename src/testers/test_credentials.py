@@ -0,0 +1,193 @@
+from asyncio import gather, run, sleep
+from pathlib import Path
+from time import time
+from types import SimpleNamespace
+
+from httpx import AsyncClient, MockTransport, Response
+from pytest import raises
+
+from src.encrypt import ABogus
+from src.interface import API
+from src.manager import CredentialManager, Credentials, Database
+
+
+class _Log:
+    detailed = False
+
+    def __init__(self):
+        self.messages = []
+
+    def info(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def warning(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def error(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+
+def _fetcher(calls: list, delay=0.0, source=""):
+    async def fetch(platform: str) -> Credentials:
+        calls.append(platform)
+        await sleep(delay)
+        return Credentials(
+            platform,
+            f"msToken=new{len(calls)}",
+            {"msToken": f"new{len(calls)}"},
+            source,
+        )
+
+    return fetch
+
+
+def _stale(platform="douyin", source="", expires=None) -> Credentials:
+    return Credentials(
+        platform,
+        "msToken=old",
+        {"msToken": "old"},
+        source,
+        time() + 600 if expires is None else expires,
+    )
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+def test_snapshot_is_immutable():
+    params = {"msToken": "a"}
+    credentials = Credentials("douyin", "msToken=a", params)
+    params["msToken"] = "b"
+    assert credentials.params["msToken"] == "a"
+    with raises(TypeError):
+        credentials.params["msToken"] = "b"
+    with raises(AttributeError):
+        credentials.cookie = ""
+    assert credentials.apply({"msToken": "", "aid": "1"}) == {
+        "msToken": "a",
+        "aid": "1",
+    }
+    assert credentials.apply({"aid": "1"}) == {"aid": "1"}
+    assert credentials.apply(None) is None
+
+
+def test_concurrent_refresh_is_shared():
+    calls = []
+    manager = CredentialManager(_fetcher(calls, 0.05), _Log())
+    stale = _stale()
+    manager.set(stale)
+
+    async def inner():
+        return await gather(*(manager.refresh("douyin", stale) for __ in range(5)))
+
+    result = run(inner())
+    assert calls == ["douyin"]
+    assert all(i is manager.get("douyin") for i in result)
+    assert manager.get("douyin").params["msToken"] == "new1"
+
+
+def test_background_refresh_with_jitter():
+    calls = []
+    manager = CredentialManager(_fetcher(calls), _Log(), interval=0.02, jitter=0.5)
+    assert all(0.01 <= manager.delay() <= 0.03 for __ in range(100))
+    manager.set(_stale())
+    manager.set(_stale("tiktok", expires=0))
+
+    async def inner():
+        manager.start()
+        await sleep(0.15)
+        task = manager.task
+        await manager.close()
+        assert task.cancelled() and manager.task is None
+
+    run(inner())
+    # 尚未使用的平台不会在后台请求参数
+    assert set(calls) == {"douyin"} and len(calls) >= 2
+    assert manager.get("tiktok").params["msToken"] == "old"
+
+
+def test_first_use_fetch_and_disk_cache(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        try:
+            calls = []
+            manager = CredentialManager(_fetcher(calls, source="a"), _Log(), database)
+            manager.set(_stale(source="a", expires=0))
+            assert calls == []
+            credentials = await manager.acquire("douyin")
+            assert calls == ["douyin"] and credentials.params["msToken"] == "new1"
+            assert not credentials.expired
+            assert await manager.acquire("douyin") is credentials
+
+            # 重新启动程序后读取缓存凭据，Cookie 修改后缓存失效
+            calls = []
+            manager = CredentialManager(_fetcher(calls, source="a"), _Log(), database)
+            manager.set(_stale(source="a", expires=0))
+            assert (await manager.acquire("douyin")).params["msToken"] == "new1"
+            assert calls == []
+            manager = CredentialManager(_fetcher(calls, source="b"), _Log(), database)
+            manager.set(_stale(source="b", expires=0))
+            await manager.acquire("douyin")
+            assert calls == ["douyin"]
+
+            calls = []
+
+            async def unavailable(platform):
+                calls.append(platform)
+
+            manager = CredentialManager(unavailable, _Log())
+            manager.set(_stale(expires=0))
+            for __ in range(3):
+                assert (await manager.acquire("douyin")).params["msToken"] == "old"
+            assert calls == ["douyin"]
+        finally:
+            await database.close()
+
+    run(inner())
+
+
+def test_api_refreshes_expired_token():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.params["msToken"] == "old":
+            return Response(200, content=b"")
+        return Response(200, json={"data": [1]})
+
+    async def inner():
+        calls = []
+        client = AsyncClient(transport=MockTransport(handler))
+        manager = CredentialManager(_fetcher(calls), _Log())
+        manager.set(_stale())
+        try:
+            params = SimpleNamespace(
+                headers={"Cookie": "default"},
+                logger=_Log(),
+                ab=ABogus(),
+                console=None,
+                max_retry=0,
+                timeout=5,
+                client=client,
+                sessions=None,
+                credentials=manager,
+                proxies=None,
+            )
+            api = API(params)
+            assert await api.request_data(
+                "https://example.com/api", {"msToken": "", "id": 1}
+            )
+            assert [i.url.params["msToken"] for i in requests] == ["old", "new1"]
+            assert requests[-1].headers["Cookie"] == "msToken=new1"
+            assert calls == ["douyin"]
+            api = API(params, cookie="temp")
+            await api.request_data("https://example.com/api", {"msToken": "x"})
+            assert requests[-1].headers["Cookie"] == "temp"
+            assert requests[-1].url.params["msToken"] == "x"
+        finally:
+            await client.aclose()
+
+    run(inner())
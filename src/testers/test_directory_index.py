@@ -0,0 +1,34 @@
+from src.tools import DirectoryIndex
+
+
+def test_exists_and_add(tmp_path):
+    tmp_path.joinpath("a.mp4").touch()
+    index = DirectoryIndex()
+    assert index.exists(tmp_path.joinpath("a.mp4"))
+    assert not index.exists(tmp_path.joinpath("b.mp4"))
+    tmp_path.joinpath("b.mp4").touch()
+    assert not index.exists(tmp_path.joinpath("b.mp4"))
+    index.add(tmp_path.joinpath("b.mp4"))
+    assert index.exists(tmp_path.joinpath("b.mp4"))
+    index.discard(tmp_path.joinpath("a.mp4"))
+    assert not index.exists(tmp_path.joinpath("a.mp4"))
+    index.clear()
+    assert index.exists(tmp_path.joinpath("a.mp4"))
+
+
+def test_match_suffix(tmp_path):
+    tmp_path.joinpath("work_1.webp").touch()
+    tmp_path.joinpath("work [2].jpeg").touch()
+    index = DirectoryIndex()
+    assert index.match(tmp_path.joinpath("work_1"), "webp")
+    assert not index.match(tmp_path.joinpath("work_1"), "jpeg")
+    assert index.match(tmp_path.joinpath("work [2]"), "*")
+    assert not index.match(tmp_path.joinpath("work"), "*")
+
+
+def test_missing_folder(tmp_path):
+    index = DirectoryIndex()
+    folder = tmp_path.joinpath("missing")
+    assert not index.exists(folder.joinpath("a.mp4"))
+    index.add(folder.joinpath("a.mp4"))
+    assert index.exists(folder.joinpath("a.mp4"))
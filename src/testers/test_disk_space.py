@@ -0,0 +1,87 @@
+from asyncio import create_task, run, sleep
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.downloader import space
+from src.downloader.space import DiskSpace
+from src.downloader.writer import FileWriter
+
+
+class _Log:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def warning(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+
+def test_reserve_and_release(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(space, "disk_usage", lambda path: SimpleNamespace(free=1000))
+    disk = DiskSpace(_Log(), 100)
+    path = tmp_path.joinpath("file.mp4")
+
+    async def inner():
+        async with disk.reserve(300, path) as reservation:
+            assert disk.available(path) == 700
+            reservation.update(500)
+            assert disk.reserved == 500
+        assert disk.reserved == 0
+
+    run(inner())
+
+
+def test_reservation_shrinks_while_writing(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(space, "disk_usage", lambda path: SimpleNamespace(free=1000))
+    disk = DiskSpace(_Log(), 100)
+    path = tmp_path.joinpath("file.mp4")
+
+    async def inner():
+        async with disk.reserve(300, path) as reservation:
+            async with FileWriter(path, buffer=50) as f:
+                for _ in range(10):
+                    await f.write(b"\0" * 20)
+                    reservation.update(max(300 - f.written, 0))
+                # 已写入文件的数据不再重复预留
+                assert f.written == 180 and disk.reserved == 120
+        assert disk.reserved == 0
+
+    run(inner())
+
+
+def test_pause_and_resume(tmp_path: Path, monkeypatch):
+    free = SimpleNamespace(free=150)
+    monkeypatch.setattr(space, "disk_usage", lambda path: free)
+    monkeypatch.setattr(DiskSpace, "INTERVAL", 0.01)
+    log, events = _Log(), []
+    disk = DiskSpace(log, 100)
+    path = tmp_path.joinpath("file.mp4")
+
+    async def download():
+        async with disk.reserve(100, path, notify=events.append):
+            pass
+
+    async def inner():
+        task = create_task(download())
+        await sleep(0.05)
+        assert disk.paused and not task.done()
+        free.free = 500
+        await task
+        assert not disk.paused
+
+    run(inner())
+    assert [i["type"] for i in events] == ["disk.paused", "disk.resumed"]
+    assert len(log.messages) == 2
+
+
+def test_disabled_without_watermark(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(space, "disk_usage", lambda path: SimpleNamespace(free=0))
+    disk = DiskSpace(_Log())
+
+    async def inner():
+        async with disk.reserve(100, tmp_path.joinpath("file.mp4")):
+            assert disk.reserved == 100
+
+    run(inner())
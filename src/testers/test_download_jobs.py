@@ -0,0 +1,89 @@
+from asyncio import create_task, run, sleep
+from json import loads
+
+from src.application.jobs import JobManager
+from src.application.main_server import APIServer
+from src.tools import PROGRESS_FACTORY
+
+
+async def _download(job):
+    progress = PROGRESS_FACTORY.get()()
+    task_id = progress.add_task("file.mp4", total=100)
+    await sleep(0.01)
+    progress.update(task_id, completed=100)
+    progress.remove_task(task_id)
+
+
+def test_job_progress_and_long_poll():
+    manager = JobManager()
+
+    async def inner():
+        job = manager.create({"platform": "douyin"})
+        waiter = create_task(job.wait(job.sequence, 5))
+        manager.run(job, _download)
+        assert (await waiter)[0]["type"] == "job.started"
+        await job.task
+        assert job.status == "success"
+        assert job.snapshot()["files"] == [
+            {
+                "id": job.snapshot()["files"][0]["id"],
+                "description": "file.mp4",
+                "total": 100,
+                "completed": 100,
+                "status": "finished",
+            }
+        ]
+        events = await job.wait(0, 5)
+        assert events[0]["type"] == "job.created"
+        assert events[-1]["type"] == "job.finished"
+        assert events[-1]["status"] == "success"
+        assert await job.wait(job.sequence, 5) == []
+
+    run(inner())
+    assert PROGRESS_FACTORY.get() is None
+
+
+def test_cancel_and_prune():
+    manager = JobManager(max_jobs=1)
+
+    async def inner():
+        first = manager.create()
+        manager.run(first, lambda job: sleep(10))
+        await sleep(0)
+        assert manager.cancel(first.id)
+        await first.task
+        assert first.status == "cancelled"
+        assert not manager.cancel(first.id)
+        second = manager.create()
+        manager.run(second, lambda job: sleep(0))
+        await second.task
+        assert manager.get(first.id) is None
+        third = manager.create()
+        assert [i["id"] for i in manager.list()] == [third.id]
+
+    run(inner())
+
+
+def test_stream_slow_subscriber():
+    manager = JobManager()
+
+    async def download(job):
+        for i in range(1500):
+            job.emit({"type": "phase", "name": str(i)})
+
+    async def inner():
+        job = manager.create()
+        stream = APIServer.stream_job(job)
+        first = loads((await anext(stream)).removeprefix("data: "))
+        assert first["type"] == "job.created"
+        manager.run(job, download)
+        await job.task
+        # 未读取的事件超出历史记录数量时先推送快照，任务结束事件不会丢失
+        events = [loads(i.removeprefix("data: ")) async for i in stream]
+        assert events[0]["type"] == "job.snapshot"
+        assert events[0]["status"] == "success"
+        assert events[-1]["type"] == "job.finished"
+        sequence = [i["seq"] for i in events[1:]]
+        assert sequence == list(range(sequence[0], job.sequence + 1))
+
+    run(inner())
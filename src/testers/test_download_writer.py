@@ -0,0 +1,58 @@
+from asyncio import run
+from hashlib import sha256
+from pathlib import Path
+
+from pytest import raises
+
+from src.downloader.writer import FileWriter, ProgressThrottle
+
+
+class _Progress:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, task_id, advance=0):
+        self.updates.append(advance)
+
+
+def test_writer_appends_in_order_with_digest(tmp_path: Path):
+    path = tmp_path.joinpath("cache.mp4")
+    path.write_bytes(b"head")
+    chunks = [bytes([i]) * 3 for i in range(100)]
+
+    async def inner():
+        digest = sha256(b"head")
+        async with FileWriter(path, digest, buffer=16) as f:
+            for i in chunks:
+                await f.write(i)
+        return digest.hexdigest()
+
+    data = b"head" + b"".join(chunks)
+    assert run(inner()) == sha256(data).hexdigest()
+    assert path.read_bytes() == data
+
+
+def test_writer_keeps_received_data_when_interrupted(tmp_path: Path):
+    path = tmp_path.joinpath("cache.mp4")
+
+    async def inner():
+        async with FileWriter(path) as f:
+            await f.write(b"partial")
+            raise OSError
+
+    with raises(OSError):
+        run(inner())
+    assert path.read_bytes() == b"partial"
+
+
+def test_progress_throttle():
+    progress = _Progress()
+    throttle = ProgressThrottle(progress, 0, interval=60)
+    for _ in range(10):
+        throttle.update(5)
+    assert not progress.updates
+    throttle.flush()
+    assert progress.updates == [50]
+    throttle = ProgressThrottle(progress, 0, interval=0)
+    throttle.update(1)
+    assert progress.updates == [50, 1]
@@ -0,0 +1,57 @@
+from pathlib import Path
+from struct import pack
+
+from src.downloader.verify import FileVerifier
+
+
+def _box(type_: bytes, size: int) -> bytes:
+    return pack(">I4s", size, type_) + b"\0" * (size - 8)
+
+
+def _mp4(*boxes: bytes) -> bytes:
+    return _box(b"ftyp", 24)[:8] + b"isom" + b"\0" * 12 + b"".join(boxes)
+
+
+def test_size_and_signature(tmp_path: Path):
+    verifier = FileVerifier()
+    image = tmp_path.joinpath("image.jpeg")
+    image.write_bytes(b"\xff\xd8\xff" + b"\0" * 13)
+    assert not verifier.check(image, 16, "jpeg")
+    assert verifier.check(image, 32, "jpeg")
+    # 图片链接可能返回其他格式的图片
+    image.write_bytes(b"RIFF\0\0\0\0WEBP" + b"\0" * 4)
+    assert not verifier.check(image, 0, "jpeg")
+    image.write_bytes(b"<html></html>")
+    assert verifier.check(image, 0, "jpeg")
+    # HEIF 图片可能使用 mif1、msf1、heix 等品牌
+    heif = tmp_path.joinpath("image.heic")
+    for brand in (b"heic", b"mif1", b"msf1", b"heix", b"hevc", b"avif"):
+        heif.write_bytes(b"\0\0\0\x18ftyp" + brand + b"\0" * 12)
+        assert not verifier.check(heif, 0, "heic")
+        assert not verifier.check(heif, 0, "avif")
+    heif.write_bytes(b"<html></html>")
+    assert verifier.check(heif, 0, "heic")
+    video = tmp_path.joinpath("video.mp4")
+    video.write_bytes(b"<html></html>")
+    assert verifier.check(video, 0, "mp4")
+    music = tmp_path.joinpath("music.mp3")
+    music.write_bytes(b"ID3")
+    assert not verifier.check(music, 0, "mp3")
+    music.write_bytes(b"")
+    assert verifier.check(music, 0, "mp3")
+
+
+def test_moov_box(tmp_path: Path):
+    verifier = FileVerifier(moov=True)
+    video = tmp_path.joinpath("video.mp4")
+    video.write_bytes(_mp4(_box(b"moov", 16), _box(b"mdat", 64)))
+    assert not verifier.check(video, 0, "mp4")
+    data = _mp4(_box(b"mdat", 64), _box(b"moov", 16))
+    video.write_bytes(data[:-4])
+    assert verifier.check(video, 0, "mp4")
+    assert not verifier.check(video, 0, "mp4", moov=False)
+    video.write_bytes(_mp4(_box(b"mdat", 64)))
+    assert verifier.check(video, 0, "mp4")
+    large = pack(">I4sQ", 1, b"mdat", 32) + b"\0" * 16
+    video.write_bytes(_mp4(_box(b"moov", 16), large))
+    assert not verifier.check(video, 0, "mp4")
@@ -0,0 +1,167 @@
+from asyncio import run, sleep
+from io import StringIO
+from json import loads
+from pathlib import Path
+from types import SimpleNamespace
+
+from pytest import raises
+
+from src.application.main_headless import (
+    EXIT_FAILED,
+    EXIT_PARTIAL,
+    EXIT_SUCCESS,
+    Headless,
+    parse_args,
+)
+from src.manager import Database
+from src.tools import ColorfulConsole, Retry
+
+
+class _Log:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def warning(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def error(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+
+def _headless() -> Headless:
+    # 仅测试事件输出与并发处理，无需初始化完整的运行参数
+    headless = Headless.__new__(Headless)
+    headless.output = StringIO()
+    headless.logger = _Log()
+    headless.count = SimpleNamespace(success=0, failed=0, skipped=0)
+    headless.downloader = SimpleNamespace(files=SimpleNamespace(succeeded=0, failed=0))
+    return headless
+
+
+def _events(headless: Headless) -> list[dict]:
+    return [loads(i) for i in headless.output.getvalue().splitlines()]
+
+
+def test_parse_args():
+    args = parse_args(
+        [
+            "download",
+            "accounts",
+            "--file",
+            "accounts.txt",
+            "--concurrency",
+            "3",
+            "--rate",
+            "120",
+            "--incremental",
+        ]
+    )
+    assert args.function == "download_accounts"
+    assert args.file == Path("accounts.txt") and args.items == []
+    assert (args.concurrency, args.rate, args.incremental) == (3, 120, True)
+    assert args.platform == "douyin" and args.tab == "post"
+    args = parse_args(["search", "cat", "dog", "--channel", "1"])
+    assert args.keywords == ["cat", "dog"] and args.channel == 1
+    assert parse_args(["verify"]).function == "verify"
+    for argv in (["download"], ["comments", "--platform", "tiktok"], ["unknown"]):
+        with raises(SystemExit) as error:
+            parse_args(argv)
+        assert error.value.code == 2
+
+
+def test_process_events_and_exit_code():
+    headless = _headless()
+    running = []
+
+    async def handle(item: str):
+        running.append(item)
+        assert len(running) <= 2
+        await sleep(0.01)
+        running.remove(item)
+        if item == "bad":
+            raise ValueError(item)
+        return [item] if item != "empty" else None
+
+    run(headless.process(["a", "bad", "b", "empty"], handle, 2))
+    events = _events(headless)
+    done = {i["id"]: i for i in events if i["type"] == "item.done"}
+    assert [i["type"] for i in events].count("item.start") == 4
+    assert done["a"]["ok"] and done["a"]["count"] == 1
+    assert not done["bad"]["ok"] and "ValueError" in done["bad"]["error"]
+    assert not done["empty"]["ok"]
+    assert headless.exit_code() == EXIT_PARTIAL
+
+    headless.count = SimpleNamespace(success=0, failed=0, skipped=0)
+    assert headless.exit_code() == EXIT_FAILED
+    headless.count.skipped = 1
+    assert headless.exit_code() == EXIT_SUCCESS
+    headless.count.failed = 1
+    assert headless.exit_code() == EXIT_FAILED
+
+
+def test_exit_code_counts_files():
+    headless = _headless()
+    headless.count.success = 2
+    files = headless.downloader.files
+    files.failed = 3
+    # 提取到数据但全部文件下载失败
+    assert headless.exit_code() == EXIT_FAILED
+    assert (headless.count.downloaded, headless.count.download_failed) == (0, 3)
+    files.succeeded = 1
+    assert headless.exit_code() == EXIT_PARTIAL
+    files.failed = 0
+    assert headless.exit_code() == EXIT_SUCCESS
+
+
+def test_non_interactive_never_prompts():
+    console = ColorfulConsole(interactive=False)
+    assert console.input("prompt") == ""
+    calls = []
+
+    class Object:
+        def __init__(self):
+            self.console = console
+
+        @Retry.retry_limited
+        def limited(self):
+            calls.append("limited")
+            return False
+
+        @Retry.retry_infinite
+        def infinite(self):
+            calls.append("infinite")
+            return False
+
+    Object().limited()
+    Object().infinite()
+    assert calls == ["limited", "infinite"]
+    # 未设置 console 属性时同样不会等待输入
+    instance = Object.__new__(Object)
+    instance.limited()
+    instance.infinite()
+    assert calls == ["limited", "infinite"] * 2
+
+
+def test_checkpoint_data(tmp_path: Path):
+    async def inner():
+        database = Database()
+        database.file = tmp_path.joinpath("test.db")
+        await database.__aenter__()
+        try:
+            assert await database.read_checkpoint_data("douyin:post:a") == ""
+            await database.update_checkpoint_data("douyin:post:a", "2024/01/01")
+            await database.update_checkpoint_data("douyin:post:a", "2024/02/01")
+            assert await database.read_checkpoint_data("douyin:post:a") == "2024/02/01"
+        finally:
+            await database.close()
+
+    run(inner())
+
+
+def test_lazy_application_export():
+    from src.application import TikTokDownloader
+
+    assert isinstance(TikTokDownloader, type)
@@ -0,0 +1,133 @@
+from asyncio import create_task, run, sleep
+from pathlib import Path
+
+from src.application.jobs import JobQueue, JobWorker
+from src.manager import Database
+from src.tools import PROGRESS_FACTORY
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+async def _download(job, payload):
+    progress = PROGRESS_FACTORY.get()()
+    task_id = progress.add_task(payload["name"], total=100)
+    await sleep(0.01)
+    progress.update(task_id, completed=100)
+    progress.remove_task(task_id)
+
+
+async def _until(condition, timeout=5.0):
+    for __ in range(int(timeout / 0.02)):
+        if await condition():
+            return
+        await sleep(0.02)
+    raise TimeoutError
+
+
+def test_queue_shared_between_connections(tmp_path: Path):
+    async def inner():
+        # 两个数据库连接模拟 HTTP 进程与任务进程
+        http, worker_database = await _database(tmp_path), await _database(tmp_path)
+        queue, worker_queue = JobQueue(http, interval=0.02), JobQueue(worker_database)
+        worker = JobWorker(worker_queue, _download, interval=0.02)
+        try:
+            job = await queue.create({"platform": "douyin"}, {"name": "file.mp4"})
+            assert (await queue.get(job.id)).status == "queued"
+            assert await worker_queue.claim("other") is not None
+            assert await worker_queue.claim("other") is None
+            second = await queue.create({}, {"name": "second.mp4"})
+            runner = create_task(worker.run())
+            events = await queue.wait(second.id, 1, 5)
+            assert events[0]["type"] == "job.started"
+            await _until(lambda: _finished(queue, second.id))
+            runner.cancel()
+            snapshot = (await queue.get(second.id)).snapshot()
+            assert snapshot["status"] == "success"
+            assert snapshot["files"][0]["description"] == "second.mp4"
+            assert snapshot["files"][0]["status"] == "finished"
+            events = await queue.since(second.id, 0)
+            assert [i["seq"] for i in events] == list(range(1, len(events) + 1))
+            assert events[-1]["type"] == "job.finished"
+            assert await queue.wait(second.id, events[-1]["seq"], 5) == []
+            assert [i["id"] for i in await queue.list()] == [second.id, job.id]
+            assert not worker.events
+        finally:
+            await worker.close()
+            await http.close()
+            await worker_database.close()
+
+    run(inner())
+
+
+async def _finished(queue: JobQueue, job_id: str) -> bool:
+    return (await queue.get(job_id)).finished
+
+
+def test_cancel_across_processes(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        queue = JobQueue(database, max_jobs=1)
+        worker = JobWorker(queue, lambda job, payload: sleep(10), interval=0.02)
+        try:
+            queued = await queue.create({}, {})
+            assert await queue.cancel(queued.id)
+            assert (await queue.get(queued.id)).status == "cancelled"
+            assert not await queue.cancel(queued.id)
+
+            running = await queue.create({}, {})
+            # 创建任务时清理超出数量限制的已结束任务
+            assert await queue.get(queued.id) is None
+            worker.start(*await queue.claim(worker.id))
+            await sleep(0.05)
+            assert await queue.cancel(running.id)
+            await _until(lambda: _flushed(worker, queue, running.id))
+            assert (await queue.get(running.id)).status == "cancelled"
+            assert not worker.events
+        finally:
+            await worker.close()
+            await database.close()
+
+    run(inner())
+
+
+async def _flushed(worker: JobWorker, queue: JobQueue, job_id: str) -> bool:
+    await worker.flush()
+    return await _finished(queue, job_id)
+
+
+def test_expired_lease_reclaimed(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        queue = JobQueue(database, timeout=0.1, attempts=2)
+        worker = JobWorker(queue, lambda job, payload: sleep(0.3), interval=0.02)
+        try:
+            # 领取任务的进程崩溃，租约过期后由其他进程重新领取
+            crashed = await queue.create({}, {})
+            assert (await queue.claim("crashed"))[0].id == crashed.id
+            assert await queue.claim("other") is None
+            await sleep(0.15)
+            assert (await queue.claim("other"))[0].id == crashed.id
+            await sleep(0.15)
+            # 超过最大执行次数的过期任务标记为失败
+            assert await queue.claim("other") is None
+            job = await queue.get(crashed.id)
+            assert (job.status, job.error) == ("error", "lease expired")
+            assert job.finished_at
+
+            # 运行中的任务定期延长租约，不会被其他进程领取
+            running = await queue.create({}, {})
+            runner = create_task(worker.run())
+            await sleep(0.2)
+            assert await queue.claim("other") is None
+            await _until(lambda: _finished(queue, running.id))
+            runner.cancel()
+            assert (await queue.get(running.id)).status == "success"
+        finally:
+            await worker.close()
+            await database.close()
+
+    run(inner())
@@ -0,0 +1,78 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from pytest import fixture, mark
+
+from src.kuaishou.source.extract import HTMLExtractor
+
+FIXTURES = Path(__file__).parent.joinpath("data", "kuaishou")
+
+
+class _Console:
+    def warning(self, *_args, **_kwargs):
+        pass
+
+
+@fixture
+def extractor():
+    return HTMLExtractor(SimpleNamespace(console=_Console(), cleaner=None))
+
+
+def _legacy(extractor: HTMLExtractor, html: str, web: bool) -> dict:
+    text = extractor._HTMLExtractor__extract_object(html, web)
+    return extractor._HTMLExtractor__convert_object(text, web)
+
+
+def _without_time(data: dict) -> dict:
+    return {k: v for k, v in data.items() if k != "collection_time"}
+
+
+@mark.parametrize(
+    "name, web, id_",
+    [
+        ("web_video.html", True, "3xabcdefghijk"),
+        ("app_atlas.html", False, "3xatlas"),
+        ("app_single.html", False, "3xsingle"),
+    ],
+)
+def test_state_matches_legacy(extractor, name, web, id_):
+    html = FIXTURES.joinpath(name).read_text(encoding="utf-8")
+    state = extractor._HTMLExtractor__extract_state(html, web)
+    assert state
+    assert state == _legacy(extractor, html, web)
+    assert _without_time(extractor.run(html, id_, web))
+
+
+def test_run_output_unchanged(extractor, monkeypatch):
+    html = FIXTURES.joinpath("app_atlas.html").read_text(encoding="utf-8")
+    fast = extractor.run(html, "3xatlas", False)
+    monkeypatch.setattr(
+        extractor,
+        "_HTMLExtractor__extract_state",
+        lambda *_args: None,
+    )
+    assert _without_time(fast) == _without_time(extractor.run(html, "3xatlas", False))
+    assert fast["download"] == [
+        "https://p3.a.yximgs.com/ufile/atlas/1.webp",
+        "https://p3.a.yximgs.com/ufile/atlas/2.webp",
+        "https://p3.a.yximgs.com/ufile/atlas/3.webp",
+    ]
+
+
+def test_missing_state_falls_back(extractor):
+    html = FIXTURES.joinpath("missing_state.html").read_text(encoding="utf-8")
+    assert extractor._HTMLExtractor__extract_state(html, True) is None
+    assert extractor.run(html, "3xmissing", True) == {}
+
+
+@mark.parametrize(
+    "text, result",
+    [
+        ('{"a":"}"}tail', '{"a":"}"}'),
+        ('{"a":{"b":"\\"{"}},"c":1}', '{"a":{"b":"\\"{"}}'),
+        ('{"a":', ""),
+        ("[]", ""),
+    ],
+)
+def test_slice_object(text, result):
+    assert HTMLExtractor.slice_object(text, 0) == result
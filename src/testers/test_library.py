@@ -0,0 +1,130 @@
+from asyncio import run
+from csv import writer
+from pathlib import Path
+
+from src.manager import Database
+from src.storage import Library, RecordManager
+
+
+def _item(id_: str, desc: str, nickname="作者", music="") -> dict:
+    return {
+        "id": id_,
+        "type": "视频",
+        "desc": desc,
+        "nickname": nickname,
+        "text_extra": ["旅行", "风景"],
+        "tag": [],
+        "music_author": music,
+        "music_title": "",
+        "create_time": f"2024-01-0{id_[-1]} 12.00.00",
+        "share_url": f"https://www.douyin.com/video/{id_}",
+    }
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+def test_search_full_text_and_short_keyword(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        library = Library(database)
+        try:
+            await library.update(
+                [
+                    _item("7000000000000000001", "海边日落延时摄影"),
+                    _item("7000000000000000002", "城市夜景航拍", music="周杰伦"),
+                ]
+            )
+            await library.update(
+                [_item("7000000000000000003", "海边冲浪", "tk")], tiktok=True
+            )
+            video = tmp_path.joinpath("video.mp4")
+            video.write_bytes(b"data")
+            await library.link("7000000000000000001", video)
+
+            result = await library.search("日落延时")
+            assert [i["id"] for i in result] == ["7000000000000000001"]
+            assert result[0]["files"] == [
+                {"path": str(video.resolve()), "exists": True}
+            ]
+            assert result[0]["tag"] == "旅行 风景"
+
+            result = await library.search("海边")
+            assert {i["id"] for i in result} == {
+                "7000000000000000001",
+                "7000000000000000003",
+            }
+            # 较短的关键词在全文检索结果中过滤
+            assert [i["id"] for i in await library.search("延时摄影 日落")] == [
+                "7000000000000000001"
+            ]
+            assert not await library.search("城市夜景 日落")
+            for platform in ("", "douyin"):
+                async with database.database.execute(
+                    "EXPLAIN QUERY PLAN SELECT ID FROM library_data "
+                    f"WHERE {'PLATFORM=? AND ' if platform else ''}1 "
+                    "ORDER BY CREATE_TIME DESC LIMIT 20",
+                    (platform,) if platform else (),
+                ) as cursor:
+                    plan = " ".join(i[-1] for i in await cursor.fetchall())
+                assert "USING INDEX" in plan and "TEMP B-TREE" not in plan
+
+            result = await library.search("海边", "tiktok")
+            assert [i["id"] for i in result] == ["7000000000000000003"]
+            assert [i["id"] for i in await library.search("周杰伦")] == [
+                "7000000000000000002"
+            ]
+
+            await library.update([_item("7000000000000000001", "雪山徒步")])
+            assert not await library.search("日落延时")
+            assert len(await library.search("雪山徒步")) == 1
+            assert len(await library.search(limit=2)) == 2
+
+            assert [i["PATH"] for i in await library.files()] == [str(video.resolve())]
+            await library.unlink(str(video.resolve()))
+            assert not await library.files()
+        finally:
+            await database.close()
+
+    run(inner())
+
+
+def test_import_records_and_files(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        library = Library(database)
+        root = tmp_path.joinpath("Douyin")
+        data = root.joinpath("Data")
+        data.mkdir(parents=True)
+        download = root.joinpath("Download")
+        download.mkdir()
+        item = _item("7000000000000000004", "山间云海")
+        with data.joinpath("作品.csv").open("w", encoding="UTF-8", newline="") as f:
+            csv = writer(f)
+            csv.writerow(RecordManager.detail_name)
+            csv.writerow(
+                [
+                    " ".join(v) if isinstance(v := item.get(i, ""), list) else v
+                    for i in RecordManager.detail_keys
+                ]
+            )
+        for name in ("山间云海_1.jpeg", "山间云海_2.jpeg", "其他.mp4"):
+            download.joinpath(name).write_bytes(b"data")
+        root.joinpath("Cache").mkdir()
+        root.joinpath("Cache", "山间云海_3.jpeg").write_bytes(b"data")
+        try:
+            assert await library.import_records(root) == 1
+            assert await library.import_files(root, lambda i: i["desc"]) == 2
+            result = await library.search("云海")
+            assert result[0]["desc"] == "山间云海"
+            assert sorted(Path(i["path"]).name for i in result[0]["files"]) == [
+                "山间云海_1.jpeg",
+                "山间云海_2.jpeg",
+            ]
+        finally:
+            await database.close()
+
+    run(inner())
@@ -0,0 +1,58 @@
+from json import loads
+from pathlib import Path
+
+from src.record import LoggerManager
+
+
+class _Console:
+    def print(self, *args, **kwargs):
+        pass
+
+
+def _logger(tmp_path: Path, **kwargs) -> LoggerManager:
+    logger = LoggerManager(tmp_path, _Console(), folder="Log")
+    logger.run(filename="test", **kwargs)
+    return logger
+
+
+def test_json_lines_and_lazy_detail(tmp_path: Path):
+    logger = _logger(tmp_path, json=True)
+    try:
+        assert logger.detailed
+        logger.info("开始下载", False)
+        logger.detail("URL: %s", "https://example.com")
+    finally:
+        logger.close()
+    lines = tmp_path.joinpath("Log", "test.log").read_text("UTF-8").splitlines()
+    data = [loads(i) for i in lines]
+    assert [i["level"] for i in data] == ["INFO", "DEBUG"]
+    assert data[1]["message"] == "URL: https://example.com"
+
+
+def test_level_filter_skips_detail(tmp_path: Path):
+    class _Value:
+        def __str__(self):
+            raise AssertionError("日志级别不满足时不应格式化参数")
+
+    logger = _logger(tmp_path, level="info")
+    try:
+        assert not logger.detailed
+        logger.detail("Response: %s", _Value())
+        logger.warning("警告", False)
+    finally:
+        logger.close()
+    text = tmp_path.joinpath("Log", "test.log").read_text("UTF-8")
+    assert "警告" in text
+    assert "Response" not in text
+
+
+def test_rotate_by_size(tmp_path: Path):
+    logger = _logger(tmp_path, max_size=256, backup_count=2)
+    try:
+        for i in range(20):
+            logger.info(f"消息 {i:02d}", False)
+    finally:
+        logger.close()
+    files = sorted(i.name for i in tmp_path.joinpath("Log").iterdir())
+    assert files == ["test.log", "test.log.1", "test.log.2"]
+    assert "消息 19" in tmp_path.joinpath("Log", "test.log").read_text("UTF-8")
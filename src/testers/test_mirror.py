@@ -0,0 +1,76 @@
+from asyncio import run
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+from httpx import AsyncClient, HTTPStatusError
+from pytest import fixture, raises
+
+from src.downloader.mirror import Mirror
+
+
+class _Handler(BaseHTTPRequestHandler):
+    status = 200
+    delay = 0.0
+
+    def do_GET(self):
+        sleep(self.delay)
+        self.send_response(self.status)
+        self.send_header("Content-Length", "4")
+        self.end_headers()
+        self.wfile.write(b"data")
+
+    def log_message(self, *args):
+        pass
+
+
+def _server(status=200, delay=0.0) -> str:
+    handler = type("Handler", (_Handler,), {"status": status, "delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/video.mp4"
+
+
+@fixture(scope="module")
+def servers() -> dict[str, str]:
+    return {
+        "ok": _server(),
+        "forbidden": _server(403),
+        "slow": _server(delay=1),
+    }
+
+
+async def _get(mirror: Mirror, url: str) -> str:
+    async with AsyncClient() as client:
+        async with mirror.stream(client, url, {}) as response:
+            await response.aread()
+            return str(response.url)
+
+
+def test_failover_and_ordering(servers):
+    mirror = Mirror()
+    mirror.update({servers["forbidden"]: [servers["forbidden"], servers["ok"]]})
+    assert run(_get(mirror, servers["forbidden"])) == servers["ok"]
+    assert mirror.order(servers["forbidden"]) == [
+        servers["ok"],
+        servers["forbidden"],
+    ]
+
+
+def test_slow_start_switches_mirror(servers, monkeypatch):
+    monkeypatch.setattr(Mirror, "SLOW_START", 0.2)
+    mirror = Mirror()
+    mirror.update({servers["slow"]: [servers["slow"], servers["ok"]]})
+    assert run(_get(mirror, servers["slow"])) == servers["ok"]
+
+
+def test_race_uses_fastest_mirror(servers):
+    mirror = Mirror(race=True)
+    mirror.update({servers["slow"]: [servers["slow"], servers["ok"]]})
+    assert run(_get(mirror, servers["slow"])) == servers["ok"]
+
+
+def test_all_mirrors_failed(servers):
+    mirror = Mirror()
+    with raises(HTTPStatusError):
+        run(_get(mirror, servers["forbidden"]))
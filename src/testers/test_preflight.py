@@ -0,0 +1,86 @@
+from asyncio import run
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from httpx import AsyncClient
+from pytest import fixture
+
+from src.downloader.preflight import Preflight
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        if "size=" in self.path:
+            size = int(self.path.split("size=")[-1])
+        else:
+            size = int(self.path.split("/")[-1].split("?")[0])
+        if self.path.startswith("/range"):
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes 0-0/{size}")
+            self.send_header("Content-Length", "1")
+            self.end_headers()
+            self.wfile.write(b"\0")
+        else:
+            self.send_response(200)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            self.wfile.write(b"\0" * size)
+
+    def log_message(self, *args):
+        pass
+
+
+@fixture(scope="module")
+def base() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def test_probe_and_cache(base):
+    preflight = Preflight(switch=True)
+    urls = [
+        f"{base}/range/2048?sign=1",
+        f"{base}/plain/16",
+        f"{base}/missing/1",
+    ]
+
+    async def inner():
+        async with AsyncClient() as client:
+            first = await preflight.run(client, urls, {})
+            second = await preflight.run(client, urls[:2], {})
+        return first, second
+
+    _Handler.hits.clear()
+    first, second = run(inner())
+    assert list(first.values()) == [2048, 16, 0]
+    assert list(second.values()) == [2048, 16]
+    # 获取失败的链接不缓存
+    assert len(_Handler.hits) == 3
+
+
+def test_cache_keeps_query(base):
+    """抖音视频链接路径相同，仅查询参数不同"""
+    preflight = Preflight(switch=True)
+    urls = [f"{base}/play/?video_id=1&size=100", f"{base}/play/?video_id=2&size=300"]
+
+    async def inner():
+        async with AsyncClient() as client:
+            return await preflight.run(client, urls, {})
+
+    assert list(run(inner()).values()) == [100, 300]
+
+
+def test_sort_tasks():
+    tasks = ["a", "b", "c", "d"]
+    sizes = [20, 0, 30, 10]
+    assert Preflight().sort(tasks, sizes) == tasks
+    assert Preflight(order="largest").sort(tasks, sizes) == ["c", "a", "d", "b"]
+    assert Preflight(order="smallest").sort(tasks, sizes) == ["d", "a", "c", "b"]
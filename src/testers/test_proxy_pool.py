@@ -0,0 +1,183 @@
+from asyncio import Semaphore, run
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socket import socket
+from threading import Thread
+from time import monotonic, sleep
+from types import SimpleNamespace
+
+from httpx import RequestError
+
+from src.downloader import Downloader
+from src.downloader.mirror import Mirror
+from src.downloader.preflight import Preflight
+from src.downloader.space import DiskSpace
+from src.tools import ProxyPool
+
+
+def _handler(name: str, delay: float, status: int):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            # 代理服务器收到完整的请求链接，直接返回响应以代替转发请求
+            sleep(delay)
+            body = name.encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("X-Proxy", name)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def _proxy(name: str, delay=0.0, status=200):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(name, delay, status))
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _unused() -> str:
+    with socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+async def _request(pool: ProxyPool, proxy=None) -> str:
+    proxy = proxy or pool.choose()
+    start = monotonic()
+    try:
+        response = await proxy.client.get("http://example.com/video.mp4")
+    except RequestError:
+        pool.record(proxy)
+        return ""
+    pool.record(proxy, response.status_code, monotonic() - start)
+    return response.headers["X-Proxy"]
+
+
+def test_latency_and_ejection():
+    with _proxy("fast") as fast, _proxy("slow", 0.1) as slow:
+        dead = _unused()
+        pool = ProxyPool([fast, slow, dead], timeout=2, failures=3, eject=60)
+
+        async def inner():
+            clients = {i: j.client for i, j in pool.proxies.items()}
+            for __ in range(3):
+                assert await _request(pool, pool.proxies[dead]) == ""
+            assert pool.proxies[dead].ejected > 0
+            result = [await _request(pool) for __ in range(40)]
+            assert "" not in result
+            assert result.count("fast") > result.count("slow") > 0
+            assert pool.proxies[slow].latency > pool.proxies[fast].latency
+            assert clients == {i: j.client for i, j in pool.proxies.items()}
+            await pool.close()
+
+        run(inner())
+
+
+def test_update_keeps_statistics():
+    with _proxy("first") as first, _proxy("second") as second:
+        pool = ProxyPool([first])
+
+        async def inner():
+            await _request(pool)
+            client = pool.proxies[first].client
+            await pool.update([first, second], failures=1, eject=10)
+            assert pool.proxies[first].client is client
+            assert pool.proxies[first].requests == 1
+            await pool.update([second])
+            assert client.is_closed and list(pool.proxies) == [second]
+            assert await _request(pool) == "second"
+            await pool.close()
+
+        run(inner())
+
+    assert ProxyPool().choose() is None
+
+
+class _Log:
+    detailed = False
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        pass
+
+
+async def _lookup(key: str):
+    return None
+
+
+def _downloader(pool: ProxyPool) -> Downloader:
+    # 仅测试请求失败时的重试次数，无需初始化完整的运行参数
+    downloader = Downloader.__new__(Downloader)
+    downloader.params = SimpleNamespace(proxies=pool)
+    downloader.store = SimpleNamespace(lookup=_lookup)
+    downloader.semaphore = Semaphore(1)
+    downloader.client = None
+    downloader.headers = {}
+    downloader.log = _Log()
+    downloader.max_retry = 1
+    downloader.resume = SimpleNamespace(check=lambda file, target: (0, ""))
+    downloader.space = DiskSpace(_Log())
+    downloader.preflight = Preflight()
+    downloader.mirror = Mirror()
+    downloader.console = _Log()
+    return downloader
+
+
+def _request_file(downloader: Downloader, pool: ProxyPool, tmp_path) -> bool:
+    async def inner():
+        try:
+            return await downloader.request_file(
+                "http://example.com/video.mp4",
+                tmp_path.joinpath("video.mp4"),
+                tmp_path.joinpath("video"),
+                "video",
+                "1",
+                "mp4",
+                "",
+                None,
+                None,
+            )
+        finally:
+            await pool.close()
+
+    return run(inner())
+
+
+def test_download_fails_over_dead_proxies(tmp_path):
+    pool = ProxyPool([_unused() for __ in range(3)], timeout=2, failures=100)
+    failures = []
+    record = pool.record
+    pool.record = lambda proxy, *args: (failures.append(proxy), record(proxy, *args))
+    downloader = _downloader(pool)
+    assert _request_file(downloader, pool, tmp_path) is False
+    # 每次重试最多尝试全部代理，重试次数不随代理数量指数增长
+    assert len(failures) == (downloader.max_retry + 1) * 3
+
+
+def test_download_fails_over_proxy_error_status(tmp_path):
+    with _proxy("first", status=503) as first, _proxy("second", status=503) as second:
+        pool = ProxyPool([first, second], timeout=2, failures=3)
+        proxies = iter(pool.proxies.values())
+        pool.choose = lambda: next(proxies)
+        downloader = _downloader(pool)
+        downloader.max_retry = 0
+        assert _request_file(downloader, pool, tmp_path) is False
+        # 代理返回错误响应码时仅记录一次失败，并更换代理重新请求
+        assert [i.failures for i in pool.proxies.values()] == [1, 1]
+        assert [i.ejected for i in pool.proxies.values()] == [0, 0]
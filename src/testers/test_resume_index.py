@@ -0,0 +1,73 @@
+from os import utime
+from pathlib import Path
+from time import time
+
+from src.downloader.resume import ResumeIndex
+
+
+class _Log:
+    def info(self, *args, **kwargs):
+        pass
+
+
+def _cache(index: ResumeIndex, root: Path, name: str, size: int, **kwargs) -> Path:
+    cache = root.joinpath(name)
+    cache.write_bytes(b"\0" * size)
+    index.write(
+        cache,
+        "https://example.com/video.mp4",
+        kwargs.get("headers", {}),
+        kwargs.get("length", 100),
+        kwargs.get("target", root.joinpath("target")),
+        kwargs.get("file", root.joinpath("target.mp4")),
+    )
+    return cache
+
+
+def test_check_validates_index(tmp_path: Path):
+    index = ResumeIndex(_Log())
+    target = tmp_path.joinpath("target")
+    cache = _cache(index, tmp_path, "a.mp4", 10, headers={"ETag": '"v1"'})
+    assert index.check(cache, target) == (10, '"v1"')
+    cache = _cache(
+        index,
+        tmp_path,
+        "b.mp4",
+        10,
+        headers={"ETag": 'W/"v1"', "Last-Modified": "Mon"},
+    )
+    assert index.check(cache, target) == (10, "Mon")
+    cache = _cache(index, tmp_path, "c.mp4", 10)
+    assert index.check(cache, tmp_path.joinpath("other")) == (0, "")
+    assert not cache.exists() and not index.path(cache).exists()
+    cache = _cache(index, tmp_path, "d.mp4", 100)
+    assert index.check(cache, target) == (0, "")
+    legacy = tmp_path.joinpath("e.mp4")
+    legacy.write_bytes(b"\0" * 5)
+    assert index.check(legacy, target) == (5, "")
+
+
+def test_collect_orphaned_and_expired(tmp_path: Path):
+    index = ResumeIndex(_Log(), max_age=1, max_size=15)
+    old = time() - 7200
+    fresh = _cache(index, tmp_path, "fresh.mp4", 10)
+    expired = _cache(index, tmp_path, "expired.mp4", 10)
+    utime(expired, (old, old))
+    finished = tmp_path.joinpath("finished.mp4")
+    finished.write_bytes(b"")
+    done = _cache(index, tmp_path, "done.mp4", 10, file=finished)
+    orphan = tmp_path.joinpath("orphan.mp4")
+    orphan.write_bytes(b"\0" * 10)
+    utime(orphan, (old, old))
+    tmp_path.joinpath("missing.mp4.resume").write_text("{}")
+    active = _cache(index, tmp_path, "active.mp4", 10)
+    utime(active, (old, old))
+    index.active.add(active)
+    oldest = _cache(index, tmp_path, "oldest.mp4", 10)
+    utime(oldest, (time() - 60, time() - 60))
+
+    assert index.collect(tmp_path) == (4, 40)
+    assert fresh.exists() and index.path(fresh).exists()
+    assert active.exists()
+    assert not any(i.exists() for i in (expired, done, orphan, oldest))
+    assert not tmp_path.joinpath("missing.mp4.resume").exists()
@@ -0,0 +1,40 @@
+from json import JSONDecodeError, loads
+
+from pytest import raises
+
+from src.tools import serialize
+from src.tools.serialize import json_bytes, json_dumps, json_loads
+
+DATA = {
+    "desc": "测试作品 🎉",
+    "id": "7300000000000000000",
+    "statistics": {"digg_count": 12, "ratio": 0.5},
+    "tags": [None, True, "标签"],
+}
+
+
+def _check():
+    assert loads(json_dumps(DATA)) == DATA
+    assert json_bytes(DATA).decode() == json_dumps(DATA)
+    assert "测试作品" in json_dumps(DATA)
+    assert json_loads(json_bytes(DATA)) == DATA
+    assert json_loads(json_dumps(DATA)) == DATA
+    # 超过 64 位的整数与非字符串键
+    assert loads(json_dumps({1: 2**70})) == {"1": 2**70}
+    assert json_loads(b'{"id": 123456789012345678901234567890}')["id"] == (
+        123456789012345678901234567890
+    )
+    assert json_loads('{"a": 1}'.encode("utf-16")) == {"a": 1}
+    with raises(JSONDecodeError):
+        json_loads(b"")
+    with raises(TypeError):
+        json_dumps({"value": object()})
+
+
+def test_serialize():
+    _check()
+
+
+def test_serialize_fallback(monkeypatch):
+    monkeypatch.setattr(serialize, "orjson", None)
+    _check()
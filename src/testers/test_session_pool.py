@@ -0,0 +1,169 @@
+from asyncio import run
+from pathlib import Path
+from time import monotonic
+from types import SimpleNamespace
+
+from httpx import AsyncClient, MockTransport, Response
+
+from src.encrypt import ABogus
+from src.interface import API
+from src.manager import Database, Session, SessionPool
+
+
+class _Log:
+    detailed = False
+
+    def __init__(self):
+        self.messages = []
+
+    def info(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def warning(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+    def error(self, text, *args, **kwargs):
+        self.messages.append(text)
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+def test_session_fields():
+    session = Session.create(
+        "douyin", "ttwid=a; UIFID=b; msToken=c; sessionid=d", device_id="e"
+    )
+    assert (session.ttwid, session.uifid, session.ms_token) == ("a", "b", "c")
+    assert session.params == {"msToken": "c", "uifid": "b"}
+    session = Session.create("tiktok", "msToken=c", "f", "e")
+    assert session.params == {"msToken": "f", "device_id": "e"}
+
+
+def test_health_cooldown_and_persistence(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        try:
+            pool = SessionPool(database, _Log(), rate=0, cooldown=60)
+            first = await pool.add(Session.create("douyin", "msToken=1"))
+            second = await pool.add(Session.create("douyin", "msToken=2"))
+            await pool.add(Session.create("tiktok", "msToken=3"))
+            await pool.report(first, {})
+            assert await pool.acquire("douyin") is second
+            await pool.report(second, None, 429)
+            assert second.cooldown > 0 and second.strikes == 1
+            assert await pool.acquire("douyin") is first
+            for __ in range(4):
+                await pool.report(first, {})
+            assert await pool.acquire("douyin") is None
+            await pool.save()
+
+            pool = SessionPool(database, _Log())
+            await pool.load()
+            assert len(pool.list("douyin")) == 2
+            assert pool.sessions[second.id].strikes == 1
+            assert pool.sessions[second.id].requests == 1
+            assert pool.sessions[first.id].cooldown == first.cooldown
+            assert await pool.remove(first.id)
+            assert not await pool.remove(first.id)
+        finally:
+            await database.close()
+
+    run(inner())
+
+
+def test_rate_budget(tmp_path: Path):
+    async def inner():
+        database = await _database(tmp_path)
+        try:
+            pool = SessionPool(database, _Log(), rate=600)
+            session = await pool.add(Session.create("douyin", "msToken=1"))
+            session.tokens = 0
+            start = monotonic()
+            assert await pool.acquire("douyin") is session
+            return monotonic() - start
+        finally:
+            await database.close()
+
+    assert 0.05 < run(inner()) < 0.5
+
+
+def test_api_uses_session(tmp_path: Path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return Response(200, json={"data": [1]})
+
+    async def inner():
+        database = await _database(tmp_path)
+        client = AsyncClient(transport=MockTransport(handler))
+        try:
+            pool = SessionPool(database, _Log())
+            session = await pool.add(Session.create("douyin", "msToken=pool; a=b"))
+            params = SimpleNamespace(
+                headers={"Cookie": "default"},
+                logger=_Log(),
+                ab=ABogus(),
+                console=None,
+                max_retry=0,
+                timeout=5,
+                client=client,
+                sessions=pool,
+                credentials=None,
+                proxies=None,
+            )
+            api = API(params)
+            assert await api.request_data("https://example.com/api", {"id": 1})
+            assert requests[-1].headers["Cookie"] == "msToken=pool; a=b"
+            assert requests[-1].url.params["msToken"] == "pool"
+            assert session.requests == 1
+            api = API(params, cookie="temp")
+            await api.request_data("https://example.com/api", {"id": 1})
+            assert requests[-1].headers["Cookie"] == "temp"
+            assert session.requests == 1
+        finally:
+            await client.aclose()
+            await database.close()
+
+    run(inner())
+
+
+def test_api_reports_each_attempt(tmp_path: Path):
+    def handler(request):
+        if "risk" in request.headers["Cookie"]:
+            return Response(403)
+        return Response(200, json={"data": [1]})
+
+    async def inner():
+        database = await _database(tmp_path)
+        client = AsyncClient(transport=MockTransport(handler))
+        try:
+            pool = SessionPool(database, _Log())
+            risk = await pool.add(Session.create("douyin", "msToken=risk"))
+            risk.score = 1
+            normal = await pool.add(Session.create("douyin", "msToken=normal"))
+            normal.score = 0.5
+            params = SimpleNamespace(
+                headers={},
+                logger=_Log(),
+                ab=ABogus(),
+                console=None,
+                max_retry=3,
+                timeout=5,
+                client=client,
+                sessions=pool,
+                credentials=None,
+                proxies=None,
+            )
+            # 触发风控的会话仅请求一次，重试时选择其他会话
+            assert await API(params).request_data("https://example.com/api", {})
+            assert (risk.requests, risk.strikes) == (1, 1)
+            assert normal.requests == 1
+        finally:
+            await client.aclose()
+            await database.close()
+
+    run(inner())
@@ -0,0 +1,77 @@
+from asyncio import run
+from pathlib import Path
+from time import monotonic
+
+from src.manager import Database, Session, SessionPool, SharedTokenBucket
+
+
+class _Log:
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        pass
+
+
+async def _database(tmp_path: Path) -> Database:
+    database = Database()
+    database.file = tmp_path.joinpath("test.db")
+    return await database.__aenter__()
+
+
+def test_bucket_is_shared_between_processes(tmp_path: Path):
+    async def inner():
+        first, second = await _database(tmp_path), await _database(tmp_path)
+        try:
+            a = SharedTokenBucket(first, "request", 50)
+            b = SharedTokenBucket(second, "request", 50)
+            start = monotonic()
+            for __ in range(5):
+                await a.consume(10)
+                await b.consume(10)
+            # 共享令牌桶初始令牌为一秒的额度，两个进程共消耗 100 个令牌需要约 1 秒
+            assert monotonic() - start >= 0.8
+
+            # 一个进程修改速率后，其他进程同步后生效
+            a.set_rate(0)
+            await a.sync()
+            await b.sync()
+            assert b.rate == 0
+            start = monotonic()
+            await b.consume(10_000)
+            assert monotonic() - start < 0.1
+        finally:
+            await first.close()
+            await second.close()
+
+    run(inner())
+
+
+def test_session_pool_sync(tmp_path: Path):
+    async def inner():
+        first, second = await _database(tmp_path), await _database(tmp_path)
+        try:
+            a = SessionPool(first, _Log(), rate=0)
+            b = SessionPool(second, _Log(), rate=0)
+            session = await a.add(Session.create("douyin", "msToken=a"))
+            await b.sync()
+            assert (used := await b.acquire("douyin")).id == session.id
+
+            # 其他进程记录的风控状态同步至本进程
+            await b.report(used, None, 429)
+            await b.save()
+            await a.sync()
+            assert a.sessions[session.id].cooldown > 0
+            assert await a.acquire("douyin") is None
+
+            await b.remove(session.id)
+            await a.sync()
+            assert not a.sessions
+        finally:
+            await first.close()
+            await second.close()
+
+    run(inner())
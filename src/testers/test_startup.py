@@ -0,0 +1,30 @@
+from src.testers.benchmark_startup import ENTRIES, import_times
+
+# 命令行模式启动时不应导入的模块
+DEFERRED = (
+    "fastapi",
+    "uvicorn",
+    "openpyxl",
+    "lxml",
+    "webview",
+    "src.application.main_server",
+    "src.application.main_webui",
+    "src.application.main_terminal",
+    "src.application.main_monitor",
+    "src.kuaishou",
+)
+
+
+def _imported(times: dict[str, int], module: str) -> bool:
+    return any(i == module or i.startswith(f"{module}.") for i in times)
+
+
+def test_cli_startup_defers_mode_dependencies():
+    times = import_times(ENTRIES["cli"])
+    assert "src.application.TikTokDownloader" in times
+    assert [i for i in DEFERRED if _imported(times, i)] == []
+
+
+def test_package_import_is_lazy():
+    times = import_times("import src.application.jobs")
+    assert not _imported(times, "src.application.TikTokDownloader")
@@ -0,0 +1,114 @@
+from asyncio import run, sleep
+from json import loads
+from types import SimpleNamespace
+
+from src.application.main_server import APIServer
+from src.interface import API, PAGE_SINK
+from src.tools import FakeProgress
+
+
+class _Log:
+    def error(self, *args, **kwargs):
+        pass
+
+
+class _API(API):
+    """每次请求返回一页数据，无需发送网络请求"""
+
+    progress_object = FakeProgress
+
+    def __init__(self, pages: int, size: int = 3, fail=False):
+        self.response = []
+        self.finished = False
+        self.pages = pages
+        self.size = size
+        self.fail = fail
+        self.requested = 0
+        self.text = ""
+        self.sink = PAGE_SINK.get()
+
+    async def run_single(self, *args, **kwargs):
+        if self.fail and self.requested:
+            raise ValueError("page")
+        self.append_response(
+            [{"id": self.requested * self.size + i} for i in range(self.size)]
+        )
+        self.requested += 1
+
+
+def _server() -> APIServer:
+    # 仅测试流式推送，无需初始化完整的运行参数
+    server = APIServer.__new__(APIServer)
+    server.logger = _Log()
+    return server
+
+
+def _extract() -> SimpleNamespace:
+    return SimpleNamespace(model_dump=lambda: {"keyword": "test"})
+
+
+async def _convert(api, page, recorder):
+    return [i | {"page": api.requested} for i in page]
+
+
+def test_stream_pages_with_backpressure():
+    apis = []
+
+    async def fetch():
+        apis.append(api := _API(5))
+        await api.run_batch("")
+
+    async def inner():
+        stream = _server().stream_pages(_extract(), fetch, _convert)
+        events = [loads(await anext(stream)), loads(await anext(stream))]
+        await sleep(0.05)
+        # 客户端未读取数据时仅缓冲有限页数
+        assert apis[0].requested <= APIServer.STREAM_PAGES + 2
+        events += [loads(i) async for i in stream]
+        assert [i["type"] for i in events[:5]] == [
+            "start",
+            "item",
+            "item",
+            "item",
+            "page",
+        ]
+        items = [i["data"] for i in events if i["type"] == "item"]
+        assert [i["id"] for i in items] == list(range(15))
+        assert items[0]["page"] == 1
+        assert events[-1] == {
+            "type": "end",
+            "count": 15,
+            "message": events[-1]["message"],
+        }
+        # 已推送的数据不再保留于内存
+        assert apis[0].response == []
+
+    run(inner())
+    assert PAGE_SINK.get() is None
+
+
+def test_stream_error_and_disconnect():
+    apis = []
+
+    async def fetch(fail=True):
+        apis.append(api := _API(100, fail=fail))
+        await api.run_batch("")
+
+    async def inner():
+        stream = _server().stream_pages(_extract(), fetch, _convert, sse=True)
+        chunks = [i async for i in stream]
+        assert all(i.startswith("data: ") and i.endswith("\n\n") for i in chunks)
+        events = [loads(i.removeprefix("data: ")) for i in chunks]
+        assert [i["type"] for i in events[-3:]] == ["page", "error", "end"]
+        assert "ValueError" in events[-2]["message"]
+
+        # 客户端断开连接后停止获取数据
+        stream = _server().stream_pages(_extract(), lambda: fetch(False), _convert)
+        await anext(stream)
+        await anext(stream)
+        await stream.aclose()
+        requested = apis[-1].requested
+        await sleep(0.05)
+        assert apis[-1].requested == requested < 100
+
+    run(inner())
@@ -0,0 +1,105 @@
+from src.extract import Extractor
+from src.extract.policy import MediaIndex, VideoPolicy
+
+
+def _variant(side: int, size: int, bitrate=1000, h265=False) -> dict:
+    return {
+        "height": side,
+        "width": side * 9 // 16,
+        "fps": 30,
+        "bitrate": bitrate,
+        "size": size,
+        "h265": h265,
+        "urls": [f"https://v{side}-{size}.example.com/video"],
+    }
+
+
+VARIANTS = [
+    _variant(720, 10_000),
+    _variant(1920, 50_000, 4000),
+    _variant(1080, 30_000, 2000),
+    _variant(1080, 20_000, 1500, True),
+]
+
+
+def test_default_selects_highest_quality():
+    assert VideoPolicy().select(VARIANTS)["size"] == 50_000
+    assert VideoPolicy().select([]) is None
+
+
+def test_resolution_and_file_size_limits():
+    assert VideoPolicy(resolution=1080).select(VARIANTS)["size"] == 30_000
+    assert VideoPolicy(file_size=25_000).select(VARIANTS)["size"] == 20_000
+    assert VideoPolicy(resolution=480).select(VARIANTS)["size"] == 10_000
+    assert VideoPolicy(file_size=1).select(VARIANTS)["size"] == 10_000
+
+
+def test_prefer_h265_when_smaller():
+    policy = VideoPolicy(resolution=1080, h265=True)
+    assert policy.select(VARIANTS)["h265"]
+
+
+def test_batch_budget_downgrades_largest_first():
+    policy = VideoPolicy(batch_size=90_000)
+    index = MediaIndex()
+    items = []
+    for i in range(2):
+        item, media = {"id": str(i)}, index.get(str(i))
+        media["variants"] = VARIANTS
+        policy.apply(item, policy.select(VARIANTS), media)
+        items.append((item, media))
+    assert policy.budget(items) == 80_000
+    assert sorted(i["size"] for _, i in items) == [30_000, 50_000]
+    assert items[0][0]["downloads"].startswith("https://v")
+    # 内部数据不写入作品数据
+    assert set(items[0][0]) == {"id", "height", "width", "downloads"}
+
+    policy.batch_size = 1
+    assert policy.budget(items) == 20_000
+    assert {i["height"] for i, _ in items} == {720}
+    assert index.pop("0")["size"] == 10_000
+    assert index.pop("0") == MediaIndex.create()
+
+
+def test_batch_budget_large_batch():
+    policy = VideoPolicy(batch_size=1000 * 25_000)
+    index = MediaIndex()
+    items = []
+    for i in range(1000):
+        item, media = {"id": str(i)}, index.get(str(i))
+        media["variants"] = VARIANTS
+        policy.apply(item, policy.select(VARIANTS), media)
+        items.append((item, media))
+    assert policy.budget(items) == policy.batch_size
+    # 优先降低文件最大的作品，各作品画质相差不超过一级
+    sizes = [i["size"] for _, i in items]
+    assert sizes.count(20_000) == sizes.count(30_000) == 500
+
+
+def test_media_index_bounded(monkeypatch):
+    monkeypatch.setattr(MediaIndex, "SIZE", 2)
+    index = MediaIndex()
+    for i in "abc":
+        index.get(i)["size"] = 1
+    index.get("b")
+    index.get("d")
+    assert list(index.data) == ["b", "d"]
+
+
+def test_tiktok_variants_invalid_size():
+    extractor = Extractor.__new__(Extractor)
+    data = extractor.generate_data_object(
+        {
+            "video": {
+                "bitrateInfo": [
+                    {
+                        "PlayAddr": {"UrlList": ["https://a/1"], "DataSize": i},
+                        "Bitrate": 1000,
+                    }
+                    for i in ("", None, "unknown", "2048")
+                ]
+            }
+        }
+    )
+    variants = extractor._Extractor__extract_video_variants_tiktok(data)
+    assert [i["size"] for i in variants] == [0, 0, 0, 2048]
@@ -0,0 +1,80 @@
+from asyncio import run, sleep
+from json import loads
+
+from src.application.main_webui import UITask
+from src.tools.progress import EventProgress
+
+
+def _events(frame: str) -> list[dict]:
+    return [loads(i.removeprefix("data: ")) for i in frame.split("\n\n") if i]
+
+
+def _task(monkeypatch) -> UITask:
+    monkeypatch.setattr(UITask, "FLUSH_INTERVAL", 0.05)
+    return UITask(id="test", type="download.detail", title="test")
+
+
+def test_progress_coalesced(monkeypatch):
+    async def inner():
+        task = _task(monkeypatch)
+        a, b = task.subscribe(), task.subscribe()
+        task.emit({"type": "task.started"})
+        await b.get(1)
+        assert [i["type"] for i in _events(await a.get(1))] == [
+            "snapshot",
+            "task.started",
+        ]
+        progress = EventProgress(task.emit, throttle_ms=0)
+        files = [progress.add_task(f"{i}.mp4", total=100) for i in range(50)]
+        for _ in range(100):
+            for i in files:
+                progress.update(i, advance=1)
+        progress.remove_task(files[0])
+        await sleep(0.1)
+        # 同一文件的进度合并为一帧推送，全部订阅者共用同一帧
+        frame = await a.get(1)
+        assert frame is b.frames[-1]
+        events = _events(frame)
+        assert len(events) == 51
+        assert {i["completed"] for i in events if "completed" in i} == {100}
+        assert events[1] == {
+            "ts": events[1]["ts"],
+            "type": "progress.remove",
+            "task_id": files[0],
+        }
+        assert await a.get(0.01) is None
+
+        # 历史事件不保留下载进度事件
+        task.emit({"type": "task.finished"})
+        assert [i["type"] for i in task.events] == ["task.started", "task.finished"]
+        assert len(task.files) == 50 and task.files[files[0]]["finished"]
+
+    run(inner())
+
+
+def test_slow_subscriber_resync(monkeypatch):
+    async def inner():
+        task = _task(monkeypatch)
+        subscriber = task.subscribe()
+        await subscriber.get(1)
+        progress = EventProgress(task.emit, throttle_ms=0)
+        file = progress.add_task("1.mp4", total=1000)
+        for i in range(subscriber.size + 10):
+            task.emit({"type": "phase", "name": str(i)})
+            progress.update(file, advance=1)
+        # 订阅者读取缓慢时丢弃积压的帧，读取时发送完整快照
+        assert subscriber.stale and not subscriber.frames
+        events = _events(await subscriber.get(1))
+        assert events[0]["type"] == "snapshot"
+        assert events[0]["task"]["id"] == "test"
+        assert len([i for i in events if i["type"] == "phase"]) == subscriber.size + 10
+        assert events[-1]["completed"] == subscriber.size + 10
+        await sleep(0.1)
+        # 快照之后仅推送增量
+        events = _events(await subscriber.get(1))
+        assert [(i["type"], i["completed"]) for i in events] == [
+            ("progress.update", subscriber.size + 10)
+        ]
+        assert await subscriber.get(0.01) is None
+
+    run(inner())
@@ -0,0 +1,49 @@
+from asyncio import run
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from src.storage.xlsx import XLSXLogger
+
+
+class _Console:
+    def warning(self, *args, **kwargs):
+        pass
+
+
+def _rows(path: Path) -> list[tuple]:
+    book = load_workbook(path, read_only=True)
+    rows = list(book.active.iter_rows(values_only=True))
+    book.close()
+    return rows
+
+
+async def _write(root: Path, *rows: list):
+    async with XLSXLogger(
+        root, ("作品ID", "作品描述"), ("id", "desc"), _Console()
+    ) as f:
+        for i in rows:
+            await f.save(i)
+
+
+def test_append_existing_file(tmp_path: Path):
+    run(_write(tmp_path, ["1", "a"]))
+    run(_write(tmp_path, ["2", "b"]))
+    assert _rows(tmp_path.joinpath("Download.xlsx")) == [
+        ("作品ID", "作品描述"),
+        ("1", "a"),
+        ("2", "b"),
+    ]
+
+
+def test_large_file_rolls_into_part(tmp_path: Path, monkeypatch):
+    run(_write(tmp_path, ["1", "a"]))
+    monkeypatch.setattr(XLSXLogger, "PART_SIZE", 1)
+    run(_write(tmp_path, ["2", "b"]))
+    run(_write(tmp_path, ["3", "c"]))
+    assert _rows(tmp_path.joinpath("Download.xlsx"))[1:] == [("1", "a")]
+    assert _rows(tmp_path.joinpath("Download.1.xlsx")) == [
+        ("作品ID", "作品描述"),
+        ("2", "b"),
+    ]
+    assert _rows(tmp_path.joinpath("Download.2.xlsx"))[1:] == [("3", "c")]
@@ -1,9 +1,11 @@
+from .bandwidth import BANDWIDTH, BANDWIDTH_TASK, TokenBucket
 from .browser import Browser
 from .capture import capture_error_params
 from .capture import capture_error_request
 from .choose import choose
 from .cleaner import Cleaner
 from .console import ColorfulConsole
+from .directory import DirectoryIndex
 from .error import CacheError
 from .error import DownloaderError
 from .file_folder import file_switch
@@ -21,6 +23,7 @@ from .session import (
     request_params,
     create_client,
 )
+from .proxy import ProxyPool
 from .temporary import random_string
 from .temporary import timestamp
 from .timer import run_time
@@ -28,4 +31,5 @@ from .truncate import beautify_string
 from .truncate import trim_string
 from .truncate import truncate_string
 from .rename_compatible import RenameCompatible
-from .progress import FakeProgress
+from .progress import PROGRESS_FACTORY, FakeProgress
+from .serialize import JSON_BACKEND, json_bytes, json_dumps, json_loads
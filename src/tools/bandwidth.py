@@ -0,0 +1,99 @@
+from asyncio import sleep
+from contextvars import ContextVar
+from time import monotonic
+from typing import AsyncIterator, Callable
+
+__all__ = ["TokenBucket", "Bandwidth", "BANDWIDTH", "BANDWIDTH_TASK"]
+
+
+class TokenBucket:
+    """令牌桶限速，rate 为每秒字节数，0 代表不限速"""
+
+    def __init__(self, rate: int = 0):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated = monotonic()
+
+    def set_rate(self, rate: int) -> None:
+        self.tokens = float(rate) if not self.rate else min(self.tokens, float(rate))
+        self.rate = rate
+
+    async def consume(self, size: int) -> None:
+        """扣除令牌，令牌不足时按欠额等待；后到的下载任务欠额更多，等待时间更长"""
+        if not self.rate:
+            return
+        now = monotonic()
+        # 令牌数量上限为一秒的字节数，允许短时突发
+        self.tokens = min(
+            self.tokens + (now - self.updated) * self.rate,
+            float(self.rate),
+        )
+        self.updated = now
+        self.tokens -= size
+        if self.tokens < 0:
+            await sleep(-self.tokens / self.rate)
+
+
+class Bandwidth:
+    """下载限速，支持全局、平台与 Web UI 任务三级限速，修改后立即生效"""
+
+    PLATFORMS = ("douyin", "tiktok", "kuaishou")
+
+    def __init__(self):
+        self.global_ = TokenBucket()
+        self.platforms = {i: TokenBucket() for i in self.PLATFORMS}
+        self.tasks: dict[str, TokenBucket] = {}
+
+    def update(
+        self,
+        limits: dict[str, int] = None,
+        tasks: dict[str, int] = None,
+    ) -> None:
+        for key, value in (limits or {}).items():
+            if key == "global":
+                self.global_.set_rate(value)
+            elif key in self.platforms:
+                self.platforms[key].set_rate(value)
+        for key, value in (tasks or {}).items():
+            if value:
+                self.tasks.setdefault(key, TokenBucket(value)).set_rate(value)
+            else:
+                self.tasks.pop(key, None)
+
+    def share(self, factory: Callable[[str, int], TokenBucket]) -> None:
+        """多进程部署时替换为共享令牌桶，全局与平台限速对全部进程生效"""
+        self.global_ = factory("bandwidth:global", self.global_.rate)
+        self.platforms = {
+            k: factory(f"bandwidth:{k}", v.rate) for k, v in self.platforms.items()
+        }
+
+    def limits(self) -> dict:
+        return {
+            "global": self.global_.rate,
+            **{k: v.rate for k, v in self.platforms.items()},
+            "tasks": {k: v.rate for k, v in self.tasks.items()},
+        }
+
+    def buckets(self, platform: str) -> list[TokenBucket]:
+        result = [self.global_]
+        if bucket := self.platforms.get(platform):
+            result.append(bucket)
+        if bucket := self.tasks.get(BANDWIDTH_TASK.get()):
+            result.append(bucket)
+        return result
+
+    async def iterate(
+        self,
+        chunks: AsyncIterator[bytes],
+        platform: str,
+    ) -> AsyncIterator[bytes]:
+        """按照当前限速设置读取数据块，暂停读取时由 TCP 流量控制限制服务器发送速度"""
+        async for chunk in chunks:
+            for bucket in self.buckets(platform):
+                await bucket.consume(len(chunk))
+            yield chunk
+
+
+# 当前 Web UI 任务 ID，由任务协程设置，下载协程继承
+BANDWIDTH_TASK: ContextVar[str] = ContextVar("bandwidth_task", default="")
+BANDWIDTH = Bandwidth()
@@ -14,9 +14,16 @@ __all__ = ["ColorfulConsole"]
 
 
 class ColorfulConsole(Console):
-    def __init__(self, *args, debug: bool = False, **kwargs):
+    def __init__(
+        self,
+        *args,
+        debug: bool = False,
+        interactive: bool = True,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.debug_mode = debug
+        self.interactive = interactive  # 非交互模式不等待用户输入
 
     def print(self, *args, style=GENERAL, highlight=False, **kwargs):
         super().print(*args, style=style, highlight=highlight, **kwargs)
@@ -35,6 +42,8 @@ class ColorfulConsole(Console):
             self.print(*args, style=DEBUG, highlight=highlight, **kwargs)
 
     def input(self, prompt="", style=PROMPT, *args, **kwargs):
+        if not self.interactive:
+            return ""
         try:
             return super().input(Text(prompt, style=style), *args, **kwargs)
         except EOFError as e:
@@ -0,0 +1,47 @@
+from os import scandir
+from os.path import normcase
+from pathlib import Path
+
+__all__ = ["DirectoryIndex"]
+
+
+class DirectoryIndex:
+    """批量下载期间缓存文件夹内容，每个文件夹只扫描一次"""
+
+    def __init__(self):
+        self.folders: dict[Path, set[str]] = {}
+
+    def names(self, folder: Path) -> set[str]:
+        if (names := self.folders.get(folder)) is None:
+            names = self.folders[folder] = self.__scan(folder)
+        return names
+
+    @staticmethod
+    def __scan(folder: Path) -> set[str]:
+        try:
+            with scandir(folder) as entries:
+                return {normcase(i.name) for i in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
+    def exists(self, path: Path) -> bool:
+        return normcase(path.name) in self.names(path.parent)
+
+    def match(self, path: Path, suffix: str = "*") -> bool:
+        """判断是否存在名称为 path.name 且后缀为 suffix 的文件，suffix 为 * 时匹配任意后缀"""
+        names = self.names(path.parent)
+        if suffix != "*":
+            return normcase(f"{path.name}.{suffix}") in names
+        prefix = normcase(f"{path.name}.")
+        return any(i.startswith(prefix) for i in names)
+
+    def add(self, path: Path) -> None:
+        if (names := self.folders.get(path.parent)) is not None:
+            names.add(normcase(path.name))
+
+    def discard(self, path: Path) -> None:
+        if (names := self.folders.get(path.parent)) is not None:
+            names.discard(normcase(path.name))
+
+    def clear(self) -> None:
+        self.folders.clear()
@@ -1,3 +1,7 @@
+from contextvars import ContextVar
+from typing import Callable
+
+
 class FakeProgress:
     def __init__(
         self,
@@ -66,6 +70,10 @@ class EventProgress:
     def __exit__(self, exc_type, exc_val, exc_tb):
         return None
 
+    def emit(self, event: dict) -> None:
+        """推送下载进度以外的事件"""
+        self._emit(event)
+
     def add_task(
         self,
         description: str,
@@ -147,3 +155,9 @@ class EventProgress:
                 "task_id": task_id,
             }
         )
+
+
+# 当前协程使用的下载进度条，由 API 下载任务设置，未设置时使用下载器默认进度条
+PROGRESS_FACTORY: ContextVar[Callable | None] = ContextVar(
+    "progress_factory", default=None
+)
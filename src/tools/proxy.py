@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from random import choices
+from time import time
+from typing import TYPE_CHECKING
+
+from .session import create_client
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+__all__ = ["Proxy", "ProxyPool"]
+
+
+@dataclass(slots=True)
+class Proxy:
+    url: str
+    client: "AsyncClient"
+    latency: float = 0.0  # 响应时间，指数加权平均值
+    success: float = 1.0  # 请求成功率，指数加权平均值
+    failures: int = 0  # 连续失败次数
+    ejected: float = 0.0  # 暂停使用的结束时间戳
+    requests: int = 0
+
+    @property
+    def weight(self) -> float:
+        # 尚未测量响应时间的代理优先使用
+        return self.success**2 / (self.latency + 0.05)
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "latency": round(self.latency, 3),
+            "success": round(self.success, 3),
+            "failures": self.failures,
+            "ejected": max(self.ejected - time(), 0),
+            "requests": self.requests,
+        }
+
+
+class ProxyPool:
+    """代理池，按照响应时间与成功率为每次请求分配代理，每个代理使用独立的连接池"""
+
+    ALPHA = 0.3  # 指数加权平均系数
+    FAILED = {407, 502, 503, 504}  # 代理异常时可能返回的响应码
+
+    def __init__(
+        self,
+        proxies: list[str] = None,
+        timeout: int | float = 10,
+        failures: int = 3,
+        eject: int = 300,
+    ):
+        self.timeout = timeout
+        self.failures = failures  # 连续失败次数达到该值时暂停使用代理
+        self.eject = eject  # 暂停使用代理的时长，单位秒
+        self.proxies: dict[str, Proxy] = {
+            i: self.__create(i) for i in dict.fromkeys(proxies or ())
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.proxies)
+
+    def __create(self, url: str) -> Proxy:
+        return Proxy(url, create_client(timeout=self.timeout, proxy=url))
+
+    async def update(
+        self,
+        proxies: list[str],
+        failures: int = 3,
+        eject: int = 300,
+    ) -> None:
+        """保留未修改代理的统计数据与连接池，关闭已移除代理的连接池"""
+        self.failures = failures
+        self.eject = eject
+        proxies = dict.fromkeys(proxies)
+        for url in [i for i in self.proxies if i not in proxies]:
+            await self.proxies.pop(url).client.aclose()
+        for url in proxies:
+            if url not in self.proxies:
+                self.proxies[url] = self.__create(url)
+
+    def choose(self) -> Proxy | None:
+        """按照权重随机选择代理；全部代理暂停使用时，选择最早恢复的代理"""
+        if not self.proxies:
+            return None
+        now = time()
+        if available := [i for i in self.proxies.values() if i.ejected <= now]:
+            proxy = choices(available, [i.weight for i in available])[0]
+        else:
+            proxy = min(self.proxies.values(), key=lambda i: i.ejected)
+        proxy.requests += 1
+        return proxy
+
+    def record(self, proxy: Proxy | None, status: int = 0, latency=0.0) -> None:
+        """记录请求结果，status 为 0 代表网络异常"""
+        if not proxy:
+            return
+        if status and status not in self.FAILED:
+            proxy.failures = 0
+            proxy.success += (1 - proxy.success) * self.ALPHA
+            proxy.latency = (
+                proxy.latency + (latency - proxy.latency) * self.ALPHA
+                if proxy.latency
+                else latency
+            )
+            return
+        proxy.failures += 1
+        proxy.success -= proxy.success * self.ALPHA
+        if proxy.failures >= self.failures:
+            proxy.failures = 0
+            # 恢复使用后重新评估成功率
+            proxy.success = 0.5
+            proxy.ejected = time() + self.eject
+
+    def list(self) -> list[dict]:
+        return [i.snapshot() for i in self.proxies.values()]
+
+    async def close(self) -> None:
+        for proxy in self.proxies.values():
+            await proxy.client.aclose()
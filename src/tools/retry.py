@@ -13,7 +13,8 @@ class Retry:
 
         async def inner(self, *args, **kwargs):
             finished = kwargs.pop("finished", False)
-            for i in range(self.max_retry):
+            # retry 为 False 时仅执行一次，由调用方处理重试
+            for i in range(self.max_retry if kwargs.pop("retry", True) else 0):
                 if result := await function(self, *args, **kwargs):
                     return result
                 self.log.warning(_("正在进行第 {index} 次重试").format(index=i + 1))
@@ -43,11 +44,16 @@ class Retry:
             while True:
                 if function(self, *args, **kwargs):
                     return
-                if self.console.input(
-                    _(
-                        "如需重新尝试处理该对象，请关闭所有正在访问该对象的窗口或程序，然后直接按下回车键！\n"
-                        "如需跳过处理该对象，请输入任意字符后按下回车键！"
-                    ),
+                # 非交互模式直接跳过处理该对象
+                if (
+                    not (console := getattr(self, "console", None))
+                    or not getattr(console, "interactive", True)
+                    or console.input(
+                        _(
+                            "如需重新尝试处理该对象，请关闭所有正在访问该对象的窗口或程序，然后直接按下回车键！\n"
+                            "如需跳过处理该对象，请输入任意字符后按下回车键！"
+                        ),
+                    )
                 ):
                     return
 
@@ -59,7 +65,11 @@ class Retry:
             while True:
                 if function(self, *args, **kwargs):
                     return
-                self.console.input(
+                if not (console := getattr(self, "console", None)) or not getattr(
+                    console, "interactive", True
+                ):
+                    return
+                console.input(
                     _("请关闭所有正在访问该对象的窗口或程序，然后按下回车键继续处理！")
                 )
 
@@ -0,0 +1,41 @@
+from json import JSONDecodeError, dumps, loads
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["JSON_BACKEND", "json_bytes", "json_dumps", "json_loads"]
+
+# 已安装 orjson 时使用 orjson 编码与解析 JSON，否则使用标准库
+JSON_BACKEND = "orjson" if orjson else "json"
+
+
+def json_bytes(data: Any) -> bytes:
+    """编码为 UTF-8 JSON，orjson 不支持的数据 (如超过 64 位的整数) 使用标准库编码"""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_dumps(data: Any) -> str:
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """解析 JSON，orjson 无法解析的数据 (如非 UTF-8 编码) 使用标准库解析"""
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except JSONDecodeError:
+            pass
+    return loads(data)
@@ -222,4 +222,4 @@ Please change the parent <Route path="${_}"> to <Route path="${_==="/"?"*":`${_}
 `)},ky=function(){var n=parseInt(document.body.getAttribute(Br)||"0",10);return isFinite(n)?n:0},Q_=function(){v.useEffect(function(){return document.body.setAttribute(Br,(ky()+1).toString()),function(){var n=ky()-1;n<=0?document.body.removeAttribute(Br):document.body.setAttribute(Br,n.toString())}},[])},K_=function(n){var a=n.noRelative,r=n.noImportant,o=n.gapMode,s=o===void 0?"margin":o;Q_();var u=v.useMemo(function(){return X_(s)},[s]);return v.createElement($_,{styles:F_(u,!a,s,r?"":"!important")})},Hf=!1;if(typeof window<"u")try{var Qs=Object.defineProperty({},"passive",{get:function(){return Hf=!0,!0}});window.addEventListener("test",Qs,Qs),window.removeEventListener("test",Qs,Qs)}catch{Hf=!1}var Or=Hf?{passive:!1}:!1,Z_=function(n){return n.tagName==="TEXTAREA"},Zb=function(n,a){if(!(n instanceof Element))return!1;var r=window.getComputedStyle(n);return r[a]!=="hidden"&&!(r.overflowY===r.overflowX&&!Z_(n)&&r[a]==="visible")},I_=function(n){return Zb(n,"overflowY")},J_=function(n){return Zb(n,"overflowX")},My=function(n,a){var r=a.ownerDocument,o=a;do{typeof ShadowRoot<"u"&&o instanceof ShadowRoot&&(o=o.host);var s=Ib(n,o);if(s){var u=Jb(n,o),f=u[1],h=u[2];if(f>h)return!0}o=o.parentNode}while(o&&o!==r.body);return!1},eO=function(n){var a=n.scrollTop,r=n.scrollHeight,o=n.clientHeight;return[a,r,o]},tO=function(n){var a=n.scrollLeft,r=n.scrollWidth,o=n.clientWidth;return[a,r,o]},Ib=function(n,a){return n==="v"?I_(a):J_(a)},Jb=function(n,a){return n==="v"?eO(a):tO(a)},nO=function(n,a){return n==="h"&&a==="rtl"?-1:1},aO=function(n,a,r,o,s){var u=nO(n,window.getComputedStyle(a).direction),f=u*o,h=r.target,m=a.contains(h),g=!1,y=f>0,x=0,S=0;do{if(!h)break;var j=Jb(n,h),M=j[0],C=j[1],N=j[2],E=C-N-u*M;(M||E)&&Ib(n,h)&&(x+=E,S+=M);var O=h.parentNode;h=O&&O.nodeType===Node.DOCUMENT_FRAGMENT_NODE?O.host:O}while(!m&&h!==document.body||m&&(a.contains(h)||a===h));return(y&&Math.abs(x)<1||!y&&Math.abs(S)<1)&&(g=!0),g},Ks=function(n){return"changedTouches"in n?[n.changedTouches[0].clientX,n.changedTouches[0].clientY]:[0,0]},Dy=function(n){return[n.deltaX,n.deltaY]},Ry=function(n){return n&&"current"in n?n.current:n},lO=function(n,a){return n[0]===a[0]&&n[1]===a[1]},rO=function(n){return`
   .block-interactivity-`.concat(n,` {pointer-events: none;}
   .allow-interactivity-`).concat(n,` {pointer-events: all;}
-`)},oO=0,kr=[];function iO(n){var a=v.useRef([]),r=v.useRef([0,0]),o=v.useRef(),s=v.useState(oO++)[0],u=v.useState(Kb)[0],f=v.useRef(n);v.useEffect(function(){f.current=n},[n]),v.useEffect(function(){if(n.inert){document.body.classList.add("block-interactivity-".concat(s));var C=__([n.lockRef.current],(n.shards||[]).map(Ry),!0).filter(Boolean);return C.forEach(function(N){return N.classList.add("allow-interactivity-".concat(s))}),function(){document.body.classList.remove("block-interactivity-".concat(s)),C.forEach(function(N){return N.classList.remove("allow-interactivity-".concat(s))})}}},[n.inert,n.lockRef.current,n.shards]);var h=v.useCallback(function(C,N){if("touches"in C&&C.touches.length===2||C.type==="wheel"&&C.ctrlKey)return!f.current.allowPinchZoom;var E=Ks(C),O=r.current,_="deltaX"in C?C.deltaX:O[0]-E[0],z="deltaY"in C?C.deltaY:O[1]-E[1],D,k=C.target,T=Math.abs(_)>Math.abs(z)?"h":"v";if("touches"in C&&T==="h"&&k.type==="range")return!1;var Y=window.getSelection(),H=Y&&Y.anchorNode,Z=H?H===k||H.contains(k):!1;if(Z)return!1;var ne=My(T,k);if(!ne)return!0;if(ne?D=T:(D=T==="v"?"h":"v",ne=My(T,k)),!ne)return!1;if(!o.current&&"changedTouches"in C&&(_||z)&&(o.current=D),!D)return!0;var fe=o.current||D;return aO(fe,N,C,fe==="h"?_:z)},[]),m=v.useCallback(function(C){var N=C;if(!(!kr.length||kr[kr.length-1]!==u)){var E="deltaY"in N?Dy(N):Ks(N),O=a.current.filter(function(D){return D.name===N.type&&(D.target===N.target||N.target===D.shadowParent)&&lO(D.delta,E)})[0];if(O&&O.should){N.cancelable&&N.preventDefault();return}if(!O){var _=(f.current.shards||[]).map(Ry).filter(Boolean).filter(function(D){return D.contains(N.target)}),z=_.length>0?h(N,_[0]):!f.current.noIsolation;z&&N.cancelable&&N.preventDefault()}}},[]),g=v.useCallback(function(C,N,E,O){var _={name:C,delta:N,target:E,should:O,shadowParent:sO(E)};a.current.push(_),setTimeout(function(){a.current=a.current.filter(function(z){return z!==_})},1)},[]),y=v.useCallback(function(C){r.current=Ks(C),o.current=void 0},[]),x=v.useCallback(function(C){g(C.type,Dy(C),C.target,h(C,n.lockRef.current))},[]),S=v.useCallback(function(C){g(C.type,Ks(C),C.target,h(C,n.lockRef.current))},[]);v.useEffect(function(){return kr.push(u),n.setCallbacks({onScrollCapture:x,onWheelCapture:x,onTouchMoveCapture:S}),document.addEventListener("wheel",m,Or),document.addEventListener("touchmove",m,Or),document.addEventListener("touchstart",y,Or),function(){kr=kr.filter(function(C){return C!==u}),document.removeEventListener("wheel",m,Or),document.removeEventListener("touchmove",m,Or),document.removeEventListener("touchstart",y,Or)}},[]);var j=n.removeScrollBar,M=n.inert;return v.createElement(v.Fragment,null,M?v.createElement(u,{styles:rO(s)}):null,j?v.createElement(K_,{noRelative:n.noRelative,gapMode:n.gapMode}):null)}function sO(n){for(var a=null;n!==null;)n instanceof ShadowRoot&&(a=n.host,n=n.host),n=n.parentNode;return a}const cO=U_(Qb,iO);var Ch=v.forwardRef(function(n,a){return v.createElement(Nc,Qn({},n,{ref:a,sideCar:cO}))});Ch.classNames=Nc.classNames;var uO=[" ","Enter","ArrowUp","ArrowDown"],dO=[" ","Enter"],Ll="Select",[Ec,Tc,fO]=pb(Ll),[Ir]=dl(Ll,[fO,jc]),_c=jc(),[hO,fl]=Ir(Ll),[mO,pO]=Ir(Ll),e0=n=>{const{__scopeSelect:a,children:r,open:o,defaultOpen:s,onOpenChange:u,value:f,defaultValue:h,onValueChange:m,dir:g,name:y,autoComplete:x,disabled:S,required:j,form:M}=n,C=_c(a),[N,E]=v.useState(null),[O,_]=v.useState(null),[z,D]=v.useState(!1),k=gc(g),[T,Y]=Lr({prop:o,defaultProp:s??!1,onChange:u,caller:Ll}),[H,Z]=Lr({prop:f,defaultProp:h,onChange:m,caller:Ll}),ne=v.useRef(null),fe=N?M||!!N.closest("form"):!0,[ve,$]=v.useState(new Set),se=Array.from(ve).map(U=>U.props.value).join(";");return c.jsx(Pb,{...C,children:c.jsxs(hO,{required:j,scope:a,trigger:N,onTriggerChange:E,valueNode:O,onValueNodeChange:_,valueNodeHasChildren:z,onValueNodeHasChildrenChange:D,contentId:Qr(),value:H,onValueChange:Z,open:T,onOpenChange:Y,dir:k,triggerPointerDownPosRef:ne,disabled:S,children:[c.jsx(Ec.Provider,{scope:a,children:c.jsx(mO,{scope:n.__scopeSelect,onNativeOptionAdd:v.useCallback(U=>{$(Q=>new Set(Q).add(U))},[]),onNativeOptionRemove:v.useCallback(U=>{$(Q=>{const q=new Set(Q);return q.delete(U),q})},[]),children:r})}),fe?c.jsxs(j0,{"aria-hidden":!0,required:j,tabIndex:-1,name:y,autoComplete:x,value:H,onChange:U=>Z(U.target.value),disabled:S,form:M,children:[H===void 0?c.jsx("option",{value:""}):null,Array.from(ve)]},se):null]})})};e0.displayName=Ll;var t0="SelectTrigger",n0=v.forwardRef((n,a)=>{const{__scopeSelect:r,disabled:o=!1,...s}=n,u=_c(r),f=fl(t0,r),h=f.disabled||o,m=lt(a,f.onTriggerChange),g=Tc(r),y=v.useRef("touch"),[x,S,j]=E0(C=>{const N=g().filter(_=>!_.disabled),E=N.find(_=>_.value===f.value),O=T0(N,C,E);O!==void 0&&f.onValueChange(O.value)}),M=C=>{h||(f.onOpenChange(!0),j()),C&&(f.triggerPointerDownPosRef.current={x:Math.round(C.pageX),y:Math.round(C.pageY)})};return c.jsx(Sh,{asChild:!0,...u,children:c.jsx(Ve.button,{type:"button",role:"combobox","aria-controls":f.contentId,"aria-expanded":f.open,"aria-required":f.required,"aria-autocomplete":"none",dir:f.dir,"data-state":f.open?"open":"closed",disabled:h,"data-disabled":h?"":void 0,"data-placeholder":N0(f.value)?"":void 0,...s,ref:m,onClick:De(s.onClick,C=>{C.currentTarget.focus(),y.current!=="mouse"&&M(C)}),onPointerDown:De(s.onPointerDown,C=>{y.current=C.pointerType;const N=C.target;N.hasPointerCapture(C.pointerId)&&N.releasePointerCapture(C.pointerId),C.button===0&&C.ctrlKey===!1&&C.pointerType==="mouse"&&(M(C),C.preventDefault())}),onKeyDown:De(s.onKeyDown,C=>{const N=x.current!=="";!(C.ctrlKey||C.altKey||C.metaKey)&&C.key.length===1&&S(C.key),!(N&&C.key===" ")&&uO.includes(C.key)&&(M(),C.preventDefault())})})})});n0.displayName=t0;var a0="SelectValue",l0=v.forwardRef((n,a)=>{const{__scopeSelect:r,className:o,style:s,children:u,placeholder:f="",...h}=n,m=fl(a0,r),{onValueNodeHasChildrenChange:g}=m,y=u!==void 0,x=lt(a,m.onValueNodeChange);return qt(()=>{g(y)},[g,y]),c.jsx(Ve.span,{...h,ref:x,style:{pointerEvents:"none"},children:N0(m.value)?c.jsx(c.Fragment,{children:f}):u})});l0.displayName=a0;var gO="SelectIcon",r0=v.forwardRef((n,a)=>{const{__scopeSelect:r,children:o,...s}=n;return c.jsx(Ve.span,{"aria-hidden":!0,...s,ref:a,children:o||"▼"})});r0.displayName=gO;var vO="SelectPortal",o0=n=>c.jsx(wh,{asChild:!0,...n});o0.displayName=vO;var Yl="SelectContent",i0=v.forwardRef((n,a)=>{const r=fl(Yl,n.__scopeSelect),[o,s]=v.useState();if(qt(()=>{s(new DocumentFragment)},[]),!r.open){const u=o;return u?fi.createPortal(c.jsx(s0,{scope:n.__scopeSelect,children:c.jsx(Ec.Slot,{scope:n.__scopeSelect,children:c.jsx("div",{children:n.children})})}),u):null}return c.jsx(c0,{...n,ref:a})});i0.displayName=Yl;var Ln=10,[s0,hl]=Ir(Yl),yO="SelectContentImpl",xO=v_("SelectContent.RemoveScroll"),c0=v.forwardRef((n,a)=>{const{__scopeSelect:r,position:o="item-aligned",onCloseAutoFocus:s,onEscapeKeyDown:u,onPointerDownOutside:f,side:h,sideOffset:m,align:g,alignOffset:y,arrowPadding:x,collisionBoundary:S,collisionPadding:j,sticky:M,hideWhenDetached:C,avoidCollisions:N,...E}=n,O=fl(Yl,r),[_,z]=v.useState(null),[D,k]=v.useState(null),T=lt(a,ae=>z(ae)),[Y,H]=v.useState(null),[Z,ne]=v.useState(null),fe=Tc(r),[ve,$]=v.useState(!1),se=v.useRef(!1);v.useEffect(()=>{if(_)return Xb(_)},[_]),yb();const U=v.useCallback(ae=>{const[Ne,...Ee]=fe().map(ze=>ze.ref.current),[ke]=Ee.slice(-1),je=document.activeElement;for(const ze of ae)if(ze===je||(ze==null||ze.scrollIntoView({block:"nearest"}),ze===Ne&&D&&(D.scrollTop=0),ze===ke&&D&&(D.scrollTop=D.scrollHeight),ze==null||ze.focus(),document.activeElement!==je))return},[fe,D]),Q=v.useCallback(()=>U([Y,_]),[U,Y,_]);v.useEffect(()=>{ve&&Q()},[ve,Q]);const{onOpenChange:q,triggerPointerDownPosRef:ie}=O;v.useEffect(()=>{if(_){let ae={x:0,y:0};const Ne=ke=>{var je,ze;ae={x:Math.abs(Math.round(ke.pageX)-(((je=ie.current)==null?void 0:je.x)??0)),y:Math.abs(Math.round(ke.pageY)-(((ze=ie.current)==null?void 0:ze.y)??0))}},Ee=ke=>{ae.x<=10&&ae.y<=10?ke.preventDefault():_.contains(ke.target)||q(!1),document.removeEventListener("pointermove",Ne),ie.current=null};return ie.current!==null&&(document.addEventListener("pointermove",Ne),document.addEventListener("pointerup",Ee,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",Ne),document.removeEventListener("pointerup",Ee,{capture:!0})}}},[_,q,ie]),v.useEffect(()=>{const ae=()=>q(!1);return window.addEventListener("blur",ae),window.addEventListener("resize",ae),()=>{window.removeEventListener("blur",ae),window.removeEventListener("resize",ae)}},[q]);const[ue,A]=E0(ae=>{const Ne=fe().filter(je=>!je.disabled),Ee=Ne.find(je=>je.ref.current===document.activeElement),ke=T0(Ne,ae,Ee);ke&&setTimeout(()=>ke.ref.current.focus())}),P=v.useCallback((ae,Ne,Ee)=>{const ke=!se.current&&!Ee;(O.value!==void 0&&O.value===Ne||ke)&&(H(ae),ke&&(se.current=!0))},[O.value]),te=v.useCallback(()=>_==null?void 0:_.focus(),[_]),le=v.useCallback((ae,Ne,Ee)=>{const ke=!se.current&&!Ee;(O.value!==void 0&&O.value===Ne||ke)&&ne(ae)},[O.value]),he=o==="popper"?Lf:u0,Se=he===Lf?{side:h,sideOffset:m,align:g,alignOffset:y,arrowPadding:x,collisionBoundary:S,collisionPadding:j,sticky:M,hideWhenDetached:C,avoidCollisions:N}:{};return c.jsx(s0,{scope:r,content:_,viewport:D,onViewportChange:k,itemRefCallback:P,selectedItem:Y,onItemLeave:te,itemTextRefCallback:le,focusSelectedItem:Q,selectedItemText:Z,position:o,isPositioned:ve,searchRef:ue,children:c.jsx(Ch,{as:xO,allowPinchZoom:!0,children:c.jsx(fh,{asChild:!0,trapped:O.open,onMountAutoFocus:ae=>{ae.preventDefault()},onUnmountAutoFocus:De(s,ae=>{var Ne;(Ne=O.trigger)==null||Ne.focus({preventScroll:!0}),ae.preventDefault()}),children:c.jsx(dh,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:u,onPointerDownOutside:f,onFocusOutside:ae=>ae.preventDefault(),onDismiss:()=>O.onOpenChange(!1),children:c.jsx(he,{role:"listbox",id:O.contentId,"data-state":O.open?"open":"closed",dir:O.dir,onContextMenu:ae=>ae.preventDefault(),...E,...Se,onPlaced:()=>$(!0),ref:T,style:{display:"flex",flexDirection:"column",outline:"none",...E.style},onKeyDown:De(E.onKeyDown,ae=>{const Ne=ae.ctrlKey||ae.altKey||ae.metaKey;if(ae.key==="Tab"&&ae.preventDefault(),!Ne&&ae.key.length===1&&A(ae.key),["ArrowUp","ArrowDown","Home","End"].includes(ae.key)){let ke=fe().filter(je=>!je.disabled).map(je=>je.ref.current);if(["ArrowUp","End"].includes(ae.key)&&(ke=ke.slice().reverse()),["ArrowUp","ArrowDown"].includes(ae.key)){const je=ae.target,ze=ke.indexOf(je);ke=ke.slice(ze+1)}setTimeout(()=>U(ke)),ae.preventDefault()}})})})})})})});c0.displayName=yO;var bO="SelectItemAlignedPosition",u0=v.forwardRef((n,a)=>{const{__scopeSelect:r,onPlaced:o,...s}=n,u=fl(Yl,r),f=hl(Yl,r),[h,m]=v.useState(null),[g,y]=v.useState(null),x=lt(a,T=>y(T)),S=Tc(r),j=v.useRef(!1),M=v.useRef(!0),{viewport:C,selectedItem:N,selectedItemText:E,focusSelectedItem:O}=f,_=v.useCallback(()=>{if(u.trigger&&u.valueNode&&h&&g&&C&&N&&E){const T=u.trigger.getBoundingClientRect(),Y=g.getBoundingClientRect(),H=u.valueNode.getBoundingClientRect(),Z=E.getBoundingClientRect();if(u.dir!=="rtl"){const je=Z.left-Y.left,ze=H.left-je,Ct=T.left-ze,G=T.width+Ct,Qe=Math.max(G,Y.width),qe=window.innerWidth-Ln,ut=Rf(ze,[Ln,Math.max(Ln,qe-Qe)]);h.style.minWidth=G+"px",h.style.left=ut+"px"}else{const je=Y.right-Z.right,ze=window.innerWidth-H.right-je,Ct=window.innerWidth-T.right-ze,G=T.width+Ct,Qe=Math.max(G,Y.width),qe=window.innerWidth-Ln,ut=Rf(ze,[Ln,Math.max(Ln,qe-Qe)]);h.style.minWidth=G+"px",h.style.right=ut+"px"}const ne=S(),fe=window.innerHeight-Ln*2,ve=C.scrollHeight,$=window.getComputedStyle(g),se=parseInt($.borderTopWidth,10),U=parseInt($.paddingTop,10),Q=parseInt($.borderBottomWidth,10),q=parseInt($.paddingBottom,10),ie=se+U+ve+q+Q,ue=Math.min(N.offsetHeight*5,ie),A=window.getComputedStyle(C),P=parseInt(A.paddingTop,10),te=parseInt(A.paddingBottom,10),le=T.top+T.height/2-Ln,he=fe-le,Se=N.offsetHeight/2,ae=N.offsetTop+Se,Ne=se+U+ae,Ee=ie-Ne;if(Ne<=le){const je=ne.length>0&&N===ne[ne.length-1].ref.current;h.style.bottom="0px";const ze=g.clientHeight-C.offsetTop-C.offsetHeight,Ct=Math.max(he,Se+(je?te:0)+ze+Q),G=Ne+Ct;h.style.height=G+"px"}else{const je=ne.length>0&&N===ne[0].ref.current;h.style.top="0px";const Ct=Math.max(le,se+C.offsetTop+(je?P:0)+Se)+Ee;h.style.height=Ct+"px",C.scrollTop=Ne-le+C.offsetTop}h.style.margin=`${Ln}px 0`,h.style.minHeight=ue+"px",h.style.maxHeight=fe+"px",o==null||o(),requestAnimationFrame(()=>j.current=!0)}},[S,u.trigger,u.valueNode,h,g,C,N,E,u.dir,o]);qt(()=>_(),[_]);const[z,D]=v.useState();qt(()=>{g&&D(window.getComputedStyle(g).zIndex)},[g]);const k=v.useCallback(T=>{T&&M.current===!0&&(_(),O==null||O(),M.current=!1)},[_,O]);return c.jsx(wO,{scope:r,contentWrapper:h,shouldExpandOnScrollRef:j,onScrollButtonChange:k,children:c.jsx("div",{ref:m,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:z},children:c.jsx(Ve.div,{...s,ref:x,style:{boxSizing:"border-box",maxHeight:"100%",...s.style}})})})});u0.displayName=bO;var SO="SelectPopperPosition",Lf=v.forwardRef((n,a)=>{const{__scopeSelect:r,align:o="start",collisionPadding:s=Ln,...u}=n,f=_c(r);return c.jsx(Wb,{...f,...u,ref:a,align:o,collisionPadding:s,style:{boxSizing:"border-box",...u.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});Lf.displayName=SO;var[wO,jh]=Ir(Yl,{}),Yf="SelectViewport",d0=v.forwardRef((n,a)=>{const{__scopeSelect:r,nonce:o,...s}=n,u=hl(Yf,r),f=jh(Yf,r),h=lt(a,u.onViewportChange),m=v.useRef(0);return c.jsxs(c.Fragment,{children:[c.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:o}),c.jsx(Ec.Slot,{scope:r,children:c.jsx(Ve.div,{"data-radix-select-viewport":"",role:"presentation",...s,ref:h,style:{position:"relative",flex:1,overflow:"hidden auto",...s.style},onScroll:De(s.onScroll,g=>{const y=g.currentTarget,{contentWrapper:x,shouldExpandOnScrollRef:S}=f;if(S!=null&&S.current&&x){const j=Math.abs(m.current-y.scrollTop);if(j>0){const M=window.innerHeight-Ln*2,C=parseFloat(x.style.minHeight),N=parseFloat(x.style.height),E=Math.max(C,N);if(E<M){const O=E+j,_=Math.min(M,O),z=O-_;x.style.height=_+"px",x.style.bottom==="0px"&&(y.scrollTop=z>0?z:0,x.style.justifyContent="flex-end")}}}m.current=y.scrollTop})})})]})});d0.displayName=Yf;var f0="SelectGroup",[CO,jO]=Ir(f0),NO=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=Qr();return c.jsx(CO,{scope:r,id:s,children:c.jsx(Ve.div,{role:"group","aria-labelledby":s,...o,ref:a})})});NO.displayName=f0;var h0="SelectLabel",m0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=jO(h0,r);return c.jsx(Ve.div,{id:s.id,...o,ref:a})});m0.displayName=h0;var fc="SelectItem",[EO,p0]=Ir(fc),g0=v.forwardRef((n,a)=>{const{__scopeSelect:r,value:o,disabled:s=!1,textValue:u,...f}=n,h=fl(fc,r),m=hl(fc,r),g=h.value===o,[y,x]=v.useState(u??""),[S,j]=v.useState(!1),M=lt(a,O=>{var _;return(_=m.itemRefCallback)==null?void 0:_.call(m,O,o,s)}),C=Qr(),N=v.useRef("touch"),E=()=>{s||(h.onValueChange(o),h.onOpenChange(!1))};if(o==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return c.jsx(EO,{scope:r,value:o,disabled:s,textId:C,isSelected:g,onItemTextChange:v.useCallback(O=>{x(_=>_||((O==null?void 0:O.textContent)??"").trim())},[]),children:c.jsx(Ec.ItemSlot,{scope:r,value:o,disabled:s,textValue:y,children:c.jsx(Ve.div,{role:"option","aria-labelledby":C,"data-highlighted":S?"":void 0,"aria-selected":g&&S,"data-state":g?"checked":"unchecked","aria-disabled":s||void 0,"data-disabled":s?"":void 0,tabIndex:s?void 0:-1,...f,ref:M,onFocus:De(f.onFocus,()=>j(!0)),onBlur:De(f.onBlur,()=>j(!1)),onClick:De(f.onClick,()=>{N.current!=="mouse"&&E()}),onPointerUp:De(f.onPointerUp,()=>{N.current==="mouse"&&E()}),onPointerDown:De(f.onPointerDown,O=>{N.current=O.pointerType}),onPointerMove:De(f.onPointerMove,O=>{var _;N.current=O.pointerType,s?(_=m.onItemLeave)==null||_.call(m):N.current==="mouse"&&O.currentTarget.focus({preventScroll:!0})}),onPointerLeave:De(f.onPointerLeave,O=>{var _;O.currentTarget===document.activeElement&&((_=m.onItemLeave)==null||_.call(m))}),onKeyDown:De(f.onKeyDown,O=>{var z;((z=m.searchRef)==null?void 0:z.current)!==""&&O.key===" "||(dO.includes(O.key)&&E(),O.key===" "&&O.preventDefault())})})})})});g0.displayName=fc;var ti="SelectItemText",v0=v.forwardRef((n,a)=>{const{__scopeSelect:r,className:o,style:s,...u}=n,f=fl(ti,r),h=hl(ti,r),m=p0(ti,r),g=pO(ti,r),[y,x]=v.useState(null),S=lt(a,E=>x(E),m.onItemTextChange,E=>{var O;return(O=h.itemTextRefCallback)==null?void 0:O.call(h,E,m.value,m.disabled)}),j=y==null?void 0:y.textContent,M=v.useMemo(()=>c.jsx("option",{value:m.value,disabled:m.disabled,children:j},m.value),[m.disabled,m.value,j]),{onNativeOptionAdd:C,onNativeOptionRemove:N}=g;return qt(()=>(C(M),()=>N(M)),[C,N,M]),c.jsxs(c.Fragment,{children:[c.jsx(Ve.span,{id:m.textId,...u,ref:S}),m.isSelected&&f.valueNode&&!f.valueNodeHasChildren?fi.createPortal(u.children,f.valueNode):null]})});v0.displayName=ti;var y0="SelectItemIndicator",x0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n;return p0(y0,r).isSelected?c.jsx(Ve.span,{"aria-hidden":!0,...o,ref:a}):null});x0.displayName=y0;var Pf="SelectScrollUpButton",b0=v.forwardRef((n,a)=>{const r=hl(Pf,n.__scopeSelect),o=jh(Pf,n.__scopeSelect),[s,u]=v.useState(!1),f=lt(a,o.onScrollButtonChange);return qt(()=>{if(r.viewport&&r.isPositioned){let h=function(){const g=m.scrollTop>0;u(g)};const m=r.viewport;return h(),m.addEventListener("scroll",h),()=>m.removeEventListener("scroll",h)}},[r.viewport,r.isPositioned]),s?c.jsx(w0,{...n,ref:f,onAutoScroll:()=>{const{viewport:h,selectedItem:m}=r;h&&m&&(h.scrollTop=h.scrollTop-m.offsetHeight)}}):null});b0.displayName=Pf;var Wf="SelectScrollDownButton",S0=v.forwardRef((n,a)=>{const r=hl(Wf,n.__scopeSelect),o=jh(Wf,n.__scopeSelect),[s,u]=v.useState(!1),f=lt(a,o.onScrollButtonChange);return qt(()=>{if(r.viewport&&r.isPositioned){let h=function(){const g=m.scrollHeight-m.clientHeight,y=Math.ceil(m.scrollTop)<g;u(y)};const m=r.viewport;return h(),m.addEventListener("scroll",h),()=>m.removeEventListener("scroll",h)}},[r.viewport,r.isPositioned]),s?c.jsx(w0,{...n,ref:f,onAutoScroll:()=>{const{viewport:h,selectedItem:m}=r;h&&m&&(h.scrollTop=h.scrollTop+m.offsetHeight)}}):null});S0.displayName=Wf;var w0=v.forwardRef((n,a)=>{const{__scopeSelect:r,onAutoScroll:o,...s}=n,u=hl("SelectScrollButton",r),f=v.useRef(null),h=Tc(r),m=v.useCallback(()=>{f.current!==null&&(window.clearInterval(f.current),f.current=null)},[]);return v.useEffect(()=>()=>m(),[m]),qt(()=>{var y;const g=h().find(x=>x.ref.current===document.activeElement);(y=g==null?void 0:g.ref.current)==null||y.scrollIntoView({block:"nearest"})},[h]),c.jsx(Ve.div,{"aria-hidden":!0,...s,ref:a,style:{flexShrink:0,...s.style},onPointerDown:De(s.onPointerDown,()=>{f.current===null&&(f.current=window.setInterval(o,50))}),onPointerMove:De(s.onPointerMove,()=>{var g;(g=u.onItemLeave)==null||g.call(u),f.current===null&&(f.current=window.setInterval(o,50))}),onPointerLeave:De(s.onPointerLeave,()=>{m()})})}),TO="SelectSeparator",C0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n;return c.jsx(Ve.div,{"aria-hidden":!0,...o,ref:a})});C0.displayName=TO;var Vf="SelectArrow",_O=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=_c(r),u=fl(Vf,r),f=hl(Vf,r);return u.open&&f.position==="popper"?c.jsx(Vb,{...s,...o,ref:a}):null});_O.displayName=Vf;var OO="SelectBubbleInput",j0=v.forwardRef(({__scopeSelect:n,value:a,...r},o)=>{const s=v.useRef(null),u=lt(o,s),f=lb(a);return v.useEffect(()=>{const h=s.current;if(!h)return;const m=window.HTMLSelectElement.prototype,y=Object.getOwnPropertyDescriptor(m,"value").set;if(f!==a&&y){const x=new Event("change",{bubbles:!0});y.call(h,a),h.dispatchEvent(x)}},[f,a]),c.jsx(Ve.select,{...r,style:{...qb,...r.style},ref:u,defaultValue:a})});j0.displayName=OO;function N0(n){return n===""||n===void 0}function E0(n){const a=Kt(n),r=v.useRef(""),o=v.useRef(0),s=v.useCallback(f=>{const h=r.current+f;a(h),(function m(g){r.current=g,window.clearTimeout(o.current),g!==""&&(o.current=window.setTimeout(()=>m(""),1e3))})(h)},[a]),u=v.useCallback(()=>{r.current="",window.clearTimeout(o.current)},[]);return v.useEffect(()=>()=>window.clearTimeout(o.current),[]),[r,s,u]}function T0(n,a,r){const s=a.length>1&&Array.from(a).every(g=>g===a[0])?a[0]:a,u=r?n.indexOf(r):-1;let f=kO(n,Math.max(u,0));s.length===1&&(f=f.filter(g=>g!==r));const m=f.find(g=>g.textValue.toLowerCase().startsWith(s.toLowerCase()));return m!==r?m:void 0}function kO(n,a){return n.map((r,o)=>n[(a+o)%n.length])}var MO=e0,_0=n0,DO=l0,RO=r0,AO=o0,O0=i0,zO=d0,k0=m0,M0=g0,BO=v0,UO=x0,D0=b0,R0=S0,A0=C0;const pi=MO,gi=DO,Jr=v.forwardRef(({className:n,children:a,...r},o)=>c.jsxs(_0,{ref:o,className:ce("flex h-9 w-full items-center justify-between whitespace-nowrap rounded-md border border-input bg-transparent px-3 py-2 text-sm shadow-sm ring-offset-background data-[placeholder]:text-muted-foreground focus:outline-none focus:ring-1 focus:ring-ring disabled:cursor-not-allowed disabled:opacity-50 [&>span]:line-clamp-1",n),...r,children:[a,c.jsx(RO,{asChild:!0,children:c.jsx(lh,{className:"h-4 w-4 opacity-50"})})]}));Jr.displayName=_0.displayName;const z0=v.forwardRef(({className:n,...a},r)=>c.jsx(D0,{ref:r,className:ce("flex cursor-default items-center justify-center py-1",n),...a,children:c.jsx(sE,{className:"h-4 w-4"})}));z0.displayName=D0.displayName;const B0=v.forwardRef(({className:n,...a},r)=>c.jsx(R0,{ref:r,className:ce("flex cursor-default items-center justify-center py-1",n),...a,children:c.jsx(lh,{className:"h-4 w-4"})}));B0.displayName=R0.displayName;const eo=v.forwardRef(({className:n,children:a,position:r="popper",...o},s)=>c.jsx(AO,{children:c.jsxs(O0,{ref:s,className:ce("relative z-50 max-h-[--radix-select-content-available-height] min-w-[8rem] overflow-y-auto overflow-x-hidden rounded-md border bg-popover text-popover-foreground shadow-md data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-select-content-transform-origin]",r==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",n),position:r,...o,children:[c.jsx(z0,{}),c.jsx(zO,{className:ce("p-1",r==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)]"),children:a}),c.jsx(B0,{})]})}));eo.displayName=O0.displayName;const HO=v.forwardRef(({className:n,...a},r)=>c.jsx(k0,{ref:r,className:ce("px-2 py-1.5 text-sm font-semibold",n),...a}));HO.displayName=k0.displayName;const vn=v.forwardRef(({className:n,children:a,...r},o)=>c.jsxs(M0,{ref:o,className:ce("relative flex w-full cursor-default select-none items-center rounded-sm py-1.5 pl-2 pr-8 text-sm outline-none focus:bg-accent focus:text-accent-foreground data-[disabled]:pointer-events-none data-[disabled]:opacity-50",n),...r,children:[c.jsx("span",{className:"absolute right-2 flex h-3.5 w-3.5 items-center justify-center",children:c.jsx(UO,{children:c.jsx(Lx,{className:"h-4 w-4"})})}),c.jsx(BO,{children:a})]}));vn.displayName=M0.displayName;const LO=v.forwardRef(({className:n,...a},r)=>c.jsx(A0,{ref:r,className:ce("-mx-1 my-1 h-px bg-muted",n),...a}));LO.displayName=A0.displayName;var yf="rovingFocusGroup.onEntryFocus",YO={bubbles:!1,cancelable:!0},vi="RovingFocusGroup",[qf,U0,PO]=pb(vi),[WO,H0]=dl(vi,[PO]),[VO,qO]=WO(vi),L0=v.forwardRef((n,a)=>c.jsx(qf.Provider,{scope:n.__scopeRovingFocusGroup,children:c.jsx(qf.Slot,{scope:n.__scopeRovingFocusGroup,children:c.jsx(GO,{...n,ref:a})})}));L0.displayName=vi;var GO=v.forwardRef((n,a)=>{const{__scopeRovingFocusGroup:r,orientation:o,loop:s=!1,dir:u,currentTabStopId:f,defaultCurrentTabStopId:h,onCurrentTabStopIdChange:m,onEntryFocus:g,preventScrollOnEntryFocus:y=!1,...x}=n,S=v.useRef(null),j=lt(a,S),M=gc(u),[C,N]=Lr({prop:f,defaultProp:h??null,onChange:m,caller:vi}),[E,O]=v.useState(!1),_=Kt(g),z=U0(r),D=v.useRef(!1),[k,T]=v.useState(0);return v.useEffect(()=>{const Y=S.current;if(Y)return Y.addEventListener(yf,_),()=>Y.removeEventListener(yf,_)},[_]),c.jsx(VO,{scope:r,orientation:o,dir:M,loop:s,currentTabStopId:C,onItemFocus:v.useCallback(Y=>N(Y),[N]),onItemShiftTab:v.useCallback(()=>O(!0),[]),onFocusableItemAdd:v.useCallback(()=>T(Y=>Y+1),[]),onFocusableItemRemove:v.useCallback(()=>T(Y=>Y-1),[]),children:c.jsx(Ve.div,{tabIndex:E||k===0?-1:0,"data-orientation":o,...x,ref:j,style:{outline:"none",...n.style},onMouseDown:De(n.onMouseDown,()=>{D.current=!0}),onFocus:De(n.onFocus,Y=>{const H=!D.current;if(Y.target===Y.currentTarget&&H&&!E){const Z=new CustomEvent(yf,YO);if(Y.currentTarget.dispatchEvent(Z),!Z.defaultPrevented){const ne=z().filter(U=>U.focusable),fe=ne.find(U=>U.active),ve=ne.find(U=>U.id===C),se=[fe,ve,...ne].filter(Boolean).map(U=>U.ref.current);W0(se,y)}}D.current=!1}),onBlur:De(n.onBlur,()=>O(!1))})})}),Y0="RovingFocusGroupItem",P0=v.forwardRef((n,a)=>{const{__scopeRovingFocusGroup:r,focusable:o=!0,active:s=!1,tabStopId:u,children:f,...h}=n,m=Qr(),g=u||m,y=qO(Y0,r),x=y.currentTabStopId===g,S=U0(r),{onFocusableItemAdd:j,onFocusableItemRemove:M,currentTabStopId:C}=y;return v.useEffect(()=>{if(o)return j(),()=>M()},[o,j,M]),c.jsx(qf.ItemSlot,{scope:r,id:g,focusable:o,active:s,children:c.jsx(Ve.span,{tabIndex:x?0:-1,"data-orientation":y.orientation,...h,ref:a,onMouseDown:De(n.onMouseDown,N=>{o?y.onItemFocus(g):N.preventDefault()}),onFocus:De(n.onFocus,()=>y.onItemFocus(g)),onKeyDown:De(n.onKeyDown,N=>{if(N.key==="Tab"&&N.shiftKey){y.onItemShiftTab();return}if(N.target!==N.currentTarget)return;const E=FO(N,y.orientation,y.dir);if(E!==void 0){if(N.metaKey||N.ctrlKey||N.altKey||N.shiftKey)return;N.preventDefault();let _=S().filter(z=>z.focusable).map(z=>z.ref.current);if(E==="last")_.reverse();else if(E==="prev"||E==="next"){E==="prev"&&_.reverse();const z=_.indexOf(N.currentTarget);_=y.loop?QO(_,z+1):_.slice(z+1)}setTimeout(()=>W0(_))}}),children:typeof f=="function"?f({isCurrentTabStop:x,hasTabStop:C!=null}):f})})});P0.displayName=Y0;var XO={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function $O(n,a){return a!=="rtl"?n:n==="ArrowLeft"?"ArrowRight":n==="ArrowRight"?"ArrowLeft":n}function FO(n,a,r){const o=$O(n.key,r);if(!(a==="vertical"&&["ArrowLeft","ArrowRight"].includes(o))&&!(a==="horizontal"&&["ArrowUp","ArrowDown"].includes(o)))return XO[o]}function W0(n,a=!1){const r=document.activeElement;for(const o of n)if(o===r||(o.focus({preventScroll:a}),document.activeElement!==r))return}function QO(n,a){return n.map((r,o)=>n[(a+o)%n.length])}var KO=L0,ZO=P0,Oc="Tabs",[IO]=dl(Oc,[H0]),V0=H0(),[JO,Nh]=IO(Oc),q0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,onValueChange:s,defaultValue:u,orientation:f="horizontal",dir:h,activationMode:m="automatic",...g}=n,y=gc(h),[x,S]=Lr({prop:o,onChange:s,defaultProp:u??"",caller:Oc});return c.jsx(JO,{scope:r,baseId:Qr(),value:x,onValueChange:S,orientation:f,dir:y,activationMode:m,children:c.jsx(Ve.div,{dir:y,"data-orientation":f,...g,ref:a})})});q0.displayName=Oc;var G0="TabsList",X0=v.forwardRef((n,a)=>{const{__scopeTabs:r,loop:o=!0,...s}=n,u=Nh(G0,r),f=V0(r);return c.jsx(KO,{asChild:!0,...f,orientation:u.orientation,dir:u.dir,loop:o,children:c.jsx(Ve.div,{role:"tablist","aria-orientation":u.orientation,...s,ref:a})})});X0.displayName=G0;var $0="TabsTrigger",F0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,disabled:s=!1,...u}=n,f=Nh($0,r),h=V0(r),m=Z0(f.baseId,o),g=I0(f.baseId,o),y=o===f.value;return c.jsx(ZO,{asChild:!0,...h,focusable:!s,active:y,children:c.jsx(Ve.button,{type:"button",role:"tab","aria-selected":y,"aria-controls":g,"data-state":y?"active":"inactive","data-disabled":s?"":void 0,disabled:s,id:m,...u,ref:a,onMouseDown:De(n.onMouseDown,x=>{!s&&x.button===0&&x.ctrlKey===!1?f.onValueChange(o):x.preventDefault()}),onKeyDown:De(n.onKeyDown,x=>{[" ","Enter"].includes(x.key)&&f.onValueChange(o)}),onFocus:De(n.onFocus,()=>{const x=f.activationMode!=="manual";!y&&!s&&x&&f.onValueChange(o)})})})});F0.displayName=$0;var Q0="TabsContent",K0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,forceMount:s,children:u,...f}=n,h=Nh(Q0,r),m=Z0(h.baseId,o),g=I0(h.baseId,o),y=o===h.value,x=v.useRef(y);return v.useEffect(()=>{const S=requestAnimationFrame(()=>x.current=!1);return()=>cancelAnimationFrame(S)},[]),c.jsx(Ra,{present:s||y,children:({present:S})=>c.jsx(Ve.div,{"data-state":y?"active":"inactive","data-orientation":h.orientation,role:"tabpanel","aria-labelledby":m,hidden:!S,id:g,tabIndex:0,...f,ref:a,style:{...n.style,animationDuration:x.current?"0s":void 0},children:S&&u})})});K0.displayName=Q0;function Z0(n,a){return`${n}-trigger-${a}`}function I0(n,a){return`${n}-content-${a}`}var ek=q0,J0=X0,eS=F0,tS=K0;const yi=ek,to=v.forwardRef(({className:n,...a},r)=>c.jsx(J0,{ref:r,className:ce("inline-flex h-9 items-center justify-center rounded-lg bg-muted p-1 text-muted-foreground",n),...a}));to.displayName=J0.displayName;const Mt=v.forwardRef(({className:n,...a},r)=>c.jsx(eS,{ref:r,className:ce("inline-flex items-center justify-center whitespace-nowrap rounded-md px-3 py-1 text-sm font-medium ring-offset-background transition-all focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:bg-background data-[state=active]:text-foreground data-[state=active]:shadow",n),...a}));Mt.displayName=eS.displayName;const Dt=v.forwardRef(({className:n,...a},r)=>c.jsx(tS,{ref:r,className:ce("mt-2 ring-offset-background focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2",n),...a}));Dt.displayName=tS.displayName;const St=v.forwardRef(({className:n,...a},r)=>c.jsx("textarea",{className:ce("flex min-h-[60px] w-full rounded-md border border-input bg-transparent px-3 py-2 text-base shadow-sm placeholder:text-muted-foreground focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-50 md:text-sm",n),ref:r,...a}));St.displayName="Textarea";function Ay(){return{tab:"live",liveText:"",liveDownload:!1,liveQuality:"",liveCookie:"",liveProxy:"",commentText:"",commentPages:"1",commentReply:!1,commentCursor:"0",commentCount:"20",commentCountReply:"3",commentCookie:"",commentProxy:"",userText:"",userCookie:"",userProxy:"",hotCookie:"",hotProxy:"",searchMode:"general",searchKeyword:"",searchPages:"1",searchOffset:"0",searchCount:"10",searchSortType:"0",searchPublishTime:"0",searchDuration:"0",searchRange:"0",searchContentType:"0",searchUserFans:"0",searchUserType:"0",searchCookie:"",searchProxy:""}}function tk(){const n=Gr(),a=T=>n(`/tasks?task=${encodeURIComponent(T)}`),{platform:r}=hi(),o=r==="douyin"||r==="tiktok",s=r==="tiktok"?"tiktok":"douyin",u=s==="tiktok",[f,h]=v.useState(()=>({douyin:Ay(),tiktok:Ay()})),m=f[s],g=T=>{h(Y=>({...Y,[s]:{...Y[s],...T}}))},[y,x]=v.useState(!1),[S,j]=v.useState(!1),[M,C]=v.useState(!1),[N,E]=v.useState(!1),[O,_]=v.useState(!1),[z,D]=v.useState(null),k=(T,Y)=>{const H=Number(T);return Number.isFinite(H)?H:Y};return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:o?c.jsxs(c.Fragment,{children:[z?c.jsx("div",{className:"text-sm text-destructive",children:z}):null,c.jsxs(yi,{value:m.tab,onValueChange:T=>g({tab:T}),className:"w-full",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"live",children:"直播"}),u?null:c.jsxs(c.Fragment,{children:[c.jsx(Mt,{value:"comment",children:"评论"}),c.jsx(Mt,{value:"search",children:"搜索"}),c.jsx(Mt,{value:"hot",children:"热榜"}),c.jsx(Mt,{value:"user",children:"用户数据"})]})]}),c.jsx(Dt,{value:"live",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{checked:m.liveDownload,onCheckedChange:T=>g({liveDownload:!!T})}),c.jsx(K,{children:"同时下载（需要 ffmpeg）"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播链接/房间号文本"}),c.jsx(St,{value:m.liveText,onChange:T=>g({liveText:T.target.value}),rows:6,placeholder:"粘贴多个链接，空格/换行分隔"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"画质（可选）"}),c.jsx(re,{value:m.liveQuality,onChange:T=>g({liveQuality:T.target.value}),placeholder:"如：origin 或 1"})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.liveCookie,onChange:T=>g({liveCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.liveProxy,onChange:T=>g({liveProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:y||!m.liveText.trim(),onClick:async()=>{x(!0),D(null);try{const T=await Ae.createCollectLiveTask({platform:s,text:m.liveText,download:m.liveDownload,quality:m.liveQuality.trim()||null,cookie:m.liveCookie.trim()||null,proxy:m.liveProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{x(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"comment",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"评论采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"作品链接文本"}),c.jsx(St,{value:m.commentText,onChange:T=>g({commentText:T.target.value}),rows:6,placeholder:"粘贴多个作品链接，空格/换行分隔"})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:m.commentPages,onChange:T=>g({commentPages:T.target.value}),placeholder:"1"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-8",children:[c.jsx(pt,{checked:m.commentReply,onCheckedChange:T=>g({commentReply:!!T})}),c.jsx(K,{children:"采集回复"})]})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"cursor"}),c.jsx(re,{value:m.commentCursor,onChange:T=>g({commentCursor:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count"}),c.jsx(re,{value:m.commentCount,onChange:T=>g({commentCount:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count_reply"}),c.jsx(re,{value:m.commentCountReply,onChange:T=>g({commentCountReply:T.target.value})})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.commentCookie,onChange:T=>g({commentCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.commentProxy,onChange:T=>g({commentProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:S||!m.commentText.trim(),onClick:async()=>{j(!0),D(null);try{const T=await Ae.createCollectCommentTask({text:m.commentText,pages:k(m.commentPages,1),cursor:k(m.commentCursor,0),count:k(m.commentCount,20),count_reply:k(m.commentCountReply,3),reply:m.commentReply,cookie:m.commentCookie.trim()||null,proxy:m.commentProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{j(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"search",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"搜索采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"模式"}),c.jsxs(pi,{value:m.searchMode,onValueChange:T=>g({searchMode:T}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"general",children:"综合"}),c.jsx(vn,{value:"video",children:"视频"}),c.jsx(vn,{value:"user",children:"用户"}),c.jsx(vn,{value:"live",children:"直播"})]})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"关键词"}),c.jsx(re,{value:m.searchKeyword,onChange:T=>g({searchKeyword:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:m.searchPages,onChange:T=>g({searchPages:T.target.value})})]})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"offset"}),c.jsx(re,{value:m.searchOffset,onChange:T=>g({searchOffset:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count"}),c.jsx(re,{value:m.searchCount,onChange:T=>g({searchCount:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"sort_type"}),c.jsx(re,{value:m.searchSortType,onChange:T=>g({searchSortType:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"publish_time"}),c.jsx(re,{value:m.searchPublishTime,onChange:T=>g({searchPublishTime:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"duration"}),c.jsx(re,{value:m.searchDuration,onChange:T=>g({searchDuration:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"search_range"}),c.jsx(re,{value:m.searchRange,onChange:T=>g({searchRange:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"content_type"}),c.jsx(re,{value:m.searchContentType,onChange:T=>g({searchContentType:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"douyin_user_fans"}),c.jsx(re,{value:m.searchUserFans,onChange:T=>g({searchUserFans:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"douyin_user_type"}),c.jsx(re,{value:m.searchUserType,onChange:T=>g({searchUserType:T.target.value})})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.searchCookie,onChange:T=>g({searchCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.searchProxy,onChange:T=>g({searchProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:O||!m.searchKeyword.trim(),onClick:async()=>{_(!0),D(null);try{const T=await Ae.createCollectSearchTask({mode:m.searchMode,keyword:m.searchKeyword,pages:k(m.searchPages,1),offset:k(m.searchOffset,0),count:k(m.searchCount,10),sort_type:k(m.searchSortType,0),publish_time:k(m.searchPublishTime,0),duration:k(m.searchDuration,0),search_range:k(m.searchRange,0),content_type:k(m.searchContentType,0),douyin_user_fans:k(m.searchUserFans,0),douyin_user_type:k(m.searchUserType,0),cookie:m.searchCookie.trim()||null,proxy:m.searchProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{_(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"hot",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"热榜采集需要先在设置中启用“存储格式”。"}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.hotCookie,onChange:T=>g({hotCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.hotProxy,onChange:T=>g({hotProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:N,onClick:async()=>{E(!0),D(null);try{const T=await Ae.createCollectHotTask({cookie:m.hotCookie.trim()||null,proxy:m.hotProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{E(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"user",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"用户数据采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"账号链接文本"}),c.jsx(St,{value:m.userText,onChange:T=>g({userText:T.target.value}),rows:6,placeholder:"粘贴多个账号主页链接，空格/换行分隔"})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.userCookie,onChange:T=>g({userCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.userProxy,onChange:T=>g({userProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:M||!m.userText.trim(),onClick:async()=>{C(!0),D(null);try{const T=await Ae.createCollectUserDataTask({text:m.userText,cookie:m.userCookie.trim()||null,proxy:m.userProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{C(!1)}},children:"开始"})})]})})})]})]}):c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})})}function nk(){const n=Gr(),[a,r]=v.useState(""),[o,s]=v.useState(!1),u=async()=>{const f=a.trim();if(f){s(!0);try{const h=await Ae.createDownloadKuaishouDetailTask({text:f});rn.success("任务已创建"),n(`/tasks?task=${encodeURIComponent(h.id)}`)}catch{}finally{s(!1)}}};return c.jsxs("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:[c.jsxs(yi,{defaultValue:"detail",className:"w-full",children:[c.jsx(to,{children:c.jsx(Mt,{value:"detail",children:"链接作品"})}),c.jsx(Dt,{value:"detail",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"链接文本"}),c.jsx(St,{value:a,onChange:f=>r(f.target.value),rows:8,placeholder:"粘贴多个快手分享链接或完整链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{onClick:()=>void u(),disabled:o||!a.trim(),children:o?"处理中...":"开始下载"})})]})})})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"提示"})}),c.jsxs(Oe,{className:"space-y-2 text-sm text-muted-foreground",children:[c.jsx("div",{children:"快手 Cookie 支持动态获取（无需登录）。"}),c.jsx("div",{children:"若解析/下载失败，建议先在“设置”中配置 Cookie（必要时配置代理）。"})]})]})]})}function Ur(n){return(a={})=>{const r=a.width?String(a.width):n.defaultWidth;return n.formats[r]||n.formats[n.defaultWidth]}}function Kn(n){return(a,r)=>{const o=r!=null&&r.context?String(r.context):"standalone";let s;if(o==="formatting"&&n.formattingValues){const f=n.defaultFormattingWidth||n.defaultWidth,h=r!=null&&r.width?String(r.width):f;s=n.formattingValues[h]||n.formattingValues[f]}else{const f=n.defaultWidth,h=r!=null&&r.width?String(r.width):n.defaultWidth;s=n.values[h]||n.values[f]}const u=n.argumentCallback?n.argumentCallback(a):a;return s[u]}}function Zn(n){return(a,r={})=>{const o=r.width,s=o&&n.matchPatterns[o]||n.matchPatterns[n.defaultMatchWidth],u=a.match(s);if(!u)return null;const f=u[0],h=o&&n.parsePatterns[o]||n.parsePatterns[n.defaultParseWidth],m=Array.isArray(h)?lk(h,x=>x.test(f)):ak(h,x=>x.test(f));let g;g=n.valueCallback?n.valueCallback(m):m,g=r.valueCallback?r.valueCallback(g):g;const y=a.slice(f.length);return{value:g,rest:y}}}function ak(n,a){for(const r in n)if(Object.prototype.hasOwnProperty.call(n,r)&&a(n[r]))return r}function lk(n,a){for(let r=0;r<n.length;r++)if(a(n[r]))return r}function nS(n){return(a,r={})=>{const o=a.match(n.matchPattern);if(!o)return null;const s=o[0],u=a.match(n.parsePattern);if(!u)return null;let f=n.valueCallback?n.valueCallback(u[0]):u[0];f=r.valueCallback?r.valueCallback(f):f;const h=a.slice(s.length);return{value:f,rest:h}}}const aS=6048e5,rk=864e5,zy=Symbol.for("constructDateFrom");function _t(n,a){return typeof n=="function"?n(a):n&&typeof n=="object"&&zy in n?n[zy](a):n instanceof Date?new n.constructor(a):new Date(a)}function Pl(n,...a){const r=_t.bind(null,n||a.find(o=>typeof o=="object"));return a.map(r)}let ok={};function xi(){return ok}function st(n,a){return _t(a||n,n)}function ul(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.weekStartsOn)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.weekStartsOn)??r.weekStartsOn??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.weekStartsOn)??0,s=st(n,a==null?void 0:a.in),u=s.getDay(),f=(u<o?7:0)+u-o;return s.setDate(s.getDate()-f),s.setHours(0,0,0,0),s}function ik(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return+ul(o,r)==+ul(s,r)}const sk={lessThanXSeconds:{one:"less than a second",other:"less than {{count}} seconds"},xSeconds:{one:"1 second",other:"{{count}} seconds"},halfAMinute:"half a minute",lessThanXMinutes:{one:"less than a minute",other:"less than {{count}} minutes"},xMinutes:{one:"1 minute",other:"{{count}} minutes"},aboutXHours:{one:"about 1 hour",other:"about {{count}} hours"},xHours:{one:"1 hour",other:"{{count}} hours"},xDays:{one:"1 day",other:"{{count}} days"},aboutXWeeks:{one:"about 1 week",other:"about {{count}} weeks"},xWeeks:{one:"1 week",other:"{{count}} weeks"},aboutXMonths:{one:"about 1 month",other:"about {{count}} months"},xMonths:{one:"1 month",other:"{{count}} months"},aboutXYears:{one:"about 1 year",other:"about {{count}} years"},xYears:{one:"1 year",other:"{{count}} years"},overXYears:{one:"over 1 year",other:"over {{count}} years"},almostXYears:{one:"almost 1 year",other:"almost {{count}} years"}},ck=(n,a,r)=>{let o;const s=sk[n];return typeof s=="string"?o=s:a===1?o=s.one:o=s.other.replace("{{count}}",a.toString()),r!=null&&r.addSuffix?r.comparison&&r.comparison>0?"in "+o:o+" ago":o},uk={lastWeek:"'last' eeee 'at' p",yesterday:"'yesterday at' p",today:"'today at' p",tomorrow:"'tomorrow at' p",nextWeek:"eeee 'at' p",other:"P"},dk=(n,a,r,o)=>uk[n],fk={narrow:["B","A"],abbreviated:["BC","AD"],wide:["Before Christ","Anno Domini"]},hk={narrow:["1","2","3","4"],abbreviated:["Q1","Q2","Q3","Q4"],wide:["1st quarter","2nd quarter","3rd quarter","4th quarter"]},mk={narrow:["J","F","M","A","M","J","J","A","S","O","N","D"],abbreviated:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],wide:["January","February","March","April","May","June","July","August","September","October","November","December"]},pk={narrow:["S","M","T","W","T","F","S"],short:["Su","Mo","Tu","We","Th","Fr","Sa"],abbreviated:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],wide:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},gk={narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"}},vk={narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"}},yk=(n,a)=>{const r=Number(n),o=r%100;if(o>20||o<10)switch(o%10){case 1:return r+"st";case 2:return r+"nd";case 3:return r+"rd"}return r+"th"},xk={ordinalNumber:yk,era:Kn({values:fk,defaultWidth:"wide"}),quarter:Kn({values:hk,defaultWidth:"wide",argumentCallback:n=>n-1}),month:Kn({values:mk,defaultWidth:"wide"}),day:Kn({values:pk,defaultWidth:"wide"}),dayPeriod:Kn({values:gk,defaultWidth:"wide",formattingValues:vk,defaultFormattingWidth:"wide"})},bk=/^(\d+)(th|st|nd|rd)?/i,Sk=/\d+/i,wk={narrow:/^(b|a)/i,abbreviated:/^(b\.?\s?c\.?|b\.?\s?c\.?\s?e\.?|a\.?\s?d\.?|c\.?\s?e\.?)/i,wide:/^(before christ|before common era|anno domini|common era)/i},Ck={any:[/^b/i,/^(a|c)/i]},jk={narrow:/^[1234]/i,abbreviated:/^q[1234]/i,wide:/^[1234](th|st|nd|rd)? quarter/i},Nk={any:[/1/i,/2/i,/3/i,/4/i]},Ek={narrow:/^[jfmasond]/i,abbreviated:/^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/i,wide:/^(january|february|march|april|may|june|july|august|september|october|november|december)/i},Tk={narrow:[/^j/i,/^f/i,/^m/i,/^a/i,/^m/i,/^j/i,/^j/i,/^a/i,/^s/i,/^o/i,/^n/i,/^d/i],any:[/^ja/i,/^f/i,/^mar/i,/^ap/i,/^may/i,/^jun/i,/^jul/i,/^au/i,/^s/i,/^o/i,/^n/i,/^d/i]},_k={narrow:/^[smtwf]/i,short:/^(su|mo|tu|we|th|fr|sa)/i,abbreviated:/^(sun|mon|tue|wed|thu|fri|sat)/i,wide:/^(sunday|monday|tuesday|wednesday|thursday|friday|saturday)/i},Ok={narrow:[/^s/i,/^m/i,/^t/i,/^w/i,/^t/i,/^f/i,/^s/i],any:[/^su/i,/^m/i,/^tu/i,/^w/i,/^th/i,/^f/i,/^sa/i]},kk={narrow:/^(a|p|mi|n|(in the|at) (morning|afternoon|evening|night))/i,any:/^([ap]\.?\s?m\.?|midnight|noon|(in the|at) (morning|afternoon|evening|night))/i},Mk={any:{am:/^a/i,pm:/^p/i,midnight:/^mi/i,noon:/^no/i,morning:/morning/i,afternoon:/afternoon/i,evening:/evening/i,night:/night/i}},Dk={ordinalNumber:nS({matchPattern:bk,parsePattern:Sk,valueCallback:n=>parseInt(n,10)}),era:Zn({matchPatterns:wk,defaultMatchWidth:"wide",parsePatterns:Ck,defaultParseWidth:"any"}),quarter:Zn({matchPatterns:jk,defaultMatchWidth:"wide",parsePatterns:Nk,defaultParseWidth:"any",valueCallback:n=>n+1}),month:Zn({matchPatterns:Ek,defaultMatchWidth:"wide",parsePatterns:Tk,defaultParseWidth:"any"}),day:Zn({matchPatterns:_k,defaultMatchWidth:"wide",parsePatterns:Ok,defaultParseWidth:"any"}),dayPeriod:Zn({matchPatterns:kk,defaultMatchWidth:"any",parsePatterns:Mk,defaultParseWidth:"any"})},Rk={full:"EEEE, MMMM do, y",long:"MMMM do, y",medium:"MMM d, y",short:"MM/dd/yyyy"},Ak={full:"h:mm:ss a zzzz",long:"h:mm:ss a z",medium:"h:mm:ss a",short:"h:mm a"},zk={full:"{{date}} 'at' {{time}}",long:"{{date}} 'at' {{time}}",medium:"{{date}}, {{time}}",short:"{{date}}, {{time}}"},Bk={date:Ur({formats:Rk,defaultWidth:"full"}),time:Ur({formats:Ak,defaultWidth:"full"}),dateTime:Ur({formats:zk,defaultWidth:"full"})},Ar={code:"en-US",formatDistance:ck,formatLong:Bk,formatRelative:dk,localize:xk,match:Dk,options:{weekStartsOn:0,firstWeekContainsDate:1}},Uk={lessThanXSeconds:{one:"不到 1 秒",other:"不到 {{count}} 秒"},xSeconds:{one:"1 秒",other:"{{count}} 秒"},halfAMinute:"半分钟",lessThanXMinutes:{one:"不到 1 分钟",other:"不到 {{count}} 分钟"},xMinutes:{one:"1 分钟",other:"{{count}} 分钟"},xHours:{one:"1 小时",other:"{{count}} 小时"},aboutXHours:{one:"大约 1 小时",other:"大约 {{count}} 小时"},xDays:{one:"1 天",other:"{{count}} 天"},aboutXWeeks:{one:"大约 1 个星期",other:"大约 {{count}} 个星期"},xWeeks:{one:"1 个星期",other:"{{count}} 个星期"},aboutXMonths:{one:"大约 1 个月",other:"大约 {{count}} 个月"},xMonths:{one:"1 个月",other:"{{count}} 个月"},aboutXYears:{one:"大约 1 年",other:"大约 {{count}} 年"},xYears:{one:"1 年",other:"{{count}} 年"},overXYears:{one:"超过 1 年",other:"超过 {{count}} 年"},almostXYears:{one:"将近 1 年",other:"将近 {{count}} 年"}},Hk=(n,a,r)=>{let o;const s=Uk[n];return typeof s=="string"?o=s:a===1?o=s.one:o=s.other.replace("{{count}}",String(a)),r!=null&&r.addSuffix?r.comparison&&r.comparison>0?o+"内":o+"前":o},Lk={full:"y'年'M'月'd'日' EEEE",long:"y'年'M'月'd'日'",medium:"yyyy-MM-dd",short:"yy-MM-dd"},Yk={full:"zzzz a h:mm:ss",long:"z a h:mm:ss",medium:"a h:mm:ss",short:"a h:mm"},Pk={full:"{{date}} {{time}}",long:"{{date}} {{time}}",medium:"{{date}} {{time}}",short:"{{date}} {{time}}"},Wk={date:Ur({formats:Lk,defaultWidth:"full"}),time:Ur({formats:Yk,defaultWidth:"full"}),dateTime:Ur({formats:Pk,defaultWidth:"full"})};function By(n,a,r){const o="eeee p";return ik(n,a,r)?o:n.getTime()>a.getTime()?"'下个'"+o:"'上个'"+o}const Vk={lastWeek:By,yesterday:"'昨天' p",today:"'今天' p",tomorrow:"'明天' p",nextWeek:By,other:"PP p"},qk=(n,a,r,o)=>{const s=Vk[n];return typeof s=="function"?s(a,r,o):s},Gk={narrow:["前","公元"],abbreviated:["前","公元"],wide:["公元前","公元"]},Xk={narrow:["1","2","3","4"],abbreviated:["第一季","第二季","第三季","第四季"],wide:["第一季度","第二季度","第三季度","第四季度"]},$k={narrow:["一","二","三","四","五","六","七","八","九","十","十一","十二"],abbreviated:["1月","2月","3月","4月","5月","6月","7月","8月","9月","10月","11月","12月"],wide:["一月","二月","三月","四月","五月","六月","七月","八月","九月","十月","十一月","十二月"]},Fk={narrow:["日","一","二","三","四","五","六"],short:["日","一","二","三","四","五","六"],abbreviated:["周日","周一","周二","周三","周四","周五","周六"],wide:["星期日","星期一","星期二","星期三","星期四","星期五","星期六"]},Qk={narrow:{am:"上",pm:"下",midnight:"凌晨",noon:"午",morning:"早",afternoon:"下午",evening:"晚",night:"夜"},abbreviated:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"},wide:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"}},Kk={narrow:{am:"上",pm:"下",midnight:"凌晨",noon:"午",morning:"早",afternoon:"下午",evening:"晚",night:"夜"},abbreviated:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"},wide:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"}},Zk=(n,a)=>{const r=Number(n);switch(a==null?void 0:a.unit){case"date":return r.toString()+"日";case"hour":return r.toString()+"时";case"minute":return r.toString()+"分";case"second":return r.toString()+"秒";default:return"第 "+r.toString()}},Ik={ordinalNumber:Zk,era:Kn({values:Gk,defaultWidth:"wide"}),quarter:Kn({values:Xk,defaultWidth:"wide",argumentCallback:n=>n-1}),month:Kn({values:$k,defaultWidth:"wide"}),day:Kn({values:Fk,defaultWidth:"wide"}),dayPeriod:Kn({values:Qk,defaultWidth:"wide",formattingValues:Kk,defaultFormattingWidth:"wide"})},Jk=/^(第\s*)?\d+(日|时|分|秒)?/i,eM=/\d+/i,tM={narrow:/^(前)/i,abbreviated:/^(前)/i,wide:/^(公元前|公元)/i},nM={any:[/^(前)/i,/^(公元)/i]},aM={narrow:/^[1234]/i,abbreviated:/^第[一二三四]刻/i,wide:/^第[一二三四]刻钟/i},lM={any:[/(1|一)/i,/(2|二)/i,/(3|三)/i,/(4|四)/i]},rM={narrow:/^(一|二|三|四|五|六|七|八|九|十[二一])/i,abbreviated:/^(一|二|三|四|五|六|七|八|九|十[二一]|\d|1[12])月/i,wide:/^(一|二|三|四|五|六|七|八|九|十[二一])月/i},oM={narrow:[/^一/i,/^二/i,/^三/i,/^四/i,/^五/i,/^六/i,/^七/i,/^八/i,/^九/i,/^十(?!(一|二))/i,/^十一/i,/^十二/i],any:[/^一|1/i,/^二|2/i,/^三|3/i,/^四|4/i,/^五|5/i,/^六|6/i,/^七|7/i,/^八|8/i,/^九|9/i,/^十(?!(一|二))|10/i,/^十一|11/i,/^十二|12/i]},iM={narrow:/^[一二三四五六日]/i,short:/^[一二三四五六日]/i,abbreviated:/^周[一二三四五六日]/i,wide:/^星期[一二三四五六日]/i},sM={any:[/日/i,/一/i,/二/i,/三/i,/四/i,/五/i,/六/i]},cM={any:/^(上午?|下午?|午夜|[中正]午|早上?|下午|晚上?|凌晨|)/i},uM={any:{am:/^上午?/i,pm:/^下午?/i,midnight:/^午夜/i,noon:/^[中正]午/i,morning:/^早上/i,afternoon:/^下午/i,evening:/^晚上?/i,night:/^凌晨/i}},dM={ordinalNumber:nS({matchPattern:Jk,parsePattern:eM,valueCallback:n=>parseInt(n,10)}),era:Zn({matchPatterns:tM,defaultMatchWidth:"wide",parsePatterns:nM,defaultParseWidth:"any"}),quarter:Zn({matchPatterns:aM,defaultMatchWidth:"wide",parsePatterns:lM,defaultParseWidth:"any",valueCallback:n=>n+1}),month:Zn({matchPatterns:rM,defaultMatchWidth:"wide",parsePatterns:oM,defaultParseWidth:"any"}),day:Zn({matchPatterns:iM,defaultMatchWidth:"wide",parsePatterns:sM,defaultParseWidth:"any"}),dayPeriod:Zn({matchPatterns:cM,defaultMatchWidth:"any",parsePatterns:uM,defaultParseWidth:"any"})},fM={code:"zh-CN",formatDistance:Hk,formatLong:Wk,formatRelative:qk,localize:Ik,match:dM,options:{weekStartsOn:1,firstWeekContainsDate:4}};function hM(n,a,r="long"){return new Intl.DateTimeFormat("en-US",{hour:"numeric",timeZone:n,timeZoneName:r}).format(a).split(/\s/g).slice(2).join(" ")}const xf={},ni={};function zl(n,a){try{const o=(xf[n]||(xf[n]=new Intl.DateTimeFormat("en-US",{timeZone:n,timeZoneName:"longOffset"}).format))(a).split("GMT")[1];return o in ni?ni[o]:Uy(o,o.split(":"))}catch{if(n in ni)return ni[n];const r=n==null?void 0:n.match(mM);return r?Uy(n,r.slice(1)):NaN}}const mM=/([+-]\d\d):?(\d\d)?/;function Uy(n,a){const r=+(a[0]||0),o=+(a[1]||0),s=+(a[2]||0)/60;return ni[n]=r*60+o>0?r*60+o+s:r*60-o-s}class Jn extends Date{constructor(...a){super(),a.length>1&&typeof a[a.length-1]=="string"&&(this.timeZone=a.pop()),this.internal=new Date,isNaN(zl(this.timeZone,this))?this.setTime(NaN):a.length?typeof a[0]=="number"&&(a.length===1||a.length===2&&typeof a[1]!="number")?this.setTime(a[0]):typeof a[0]=="string"?this.setTime(+new Date(a[0])):a[0]instanceof Date?this.setTime(+a[0]):(this.setTime(+new Date(...a)),lS(this),Gf(this)):this.setTime(Date.now())}static tz(a,...r){return r.length?new Jn(...r,a):new Jn(Date.now(),a)}withTimeZone(a){return new Jn(+this,a)}getTimezoneOffset(){const a=-zl(this.timeZone,this);return a>0?Math.floor(a):Math.ceil(a)}setTime(a){return Date.prototype.setTime.apply(this,arguments),Gf(this),+this}[Symbol.for("constructDateFrom")](a){return new Jn(+new Date(a),this.timeZone)}}const Hy=/^(get|set)(?!UTC)/;Object.getOwnPropertyNames(Date.prototype).forEach(n=>{if(!Hy.test(n))return;const a=n.replace(Hy,"$1UTC");Jn.prototype[a]&&(n.startsWith("get")?Jn.prototype[n]=function(){return this.internal[a]()}:(Jn.prototype[n]=function(){return Date.prototype[a].apply(this.internal,arguments),pM(this),+this},Jn.prototype[a]=function(){return Date.prototype[a].apply(this,arguments),Gf(this),+this}))});function Gf(n){n.internal.setTime(+n),n.internal.setUTCSeconds(n.internal.getUTCSeconds()-Math.round(-zl(n.timeZone,n)*60))}function pM(n){Date.prototype.setFullYear.call(n,n.internal.getUTCFullYear(),n.internal.getUTCMonth(),n.internal.getUTCDate()),Date.prototype.setHours.call(n,n.internal.getUTCHours(),n.internal.getUTCMinutes(),n.internal.getUTCSeconds(),n.internal.getUTCMilliseconds()),lS(n)}function lS(n){const a=zl(n.timeZone,n),r=a>0?Math.floor(a):Math.ceil(a),o=new Date(+n);o.setUTCHours(o.getUTCHours()-1);const s=-new Date(+n).getTimezoneOffset(),u=-new Date(+o).getTimezoneOffset(),f=s-u,h=Date.prototype.getHours.apply(n)!==n.internal.getUTCHours();f&&h&&n.internal.setUTCMinutes(n.internal.getUTCMinutes()+f);const m=s-r;m&&Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+m);const g=new Date(+n);g.setUTCSeconds(0);const y=s>0?g.getSeconds():(g.getSeconds()-60)%60,x=Math.round(-(zl(n.timeZone,n)*60))%60;(x||y)&&(n.internal.setUTCSeconds(n.internal.getUTCSeconds()+x),Date.prototype.setUTCSeconds.call(n,Date.prototype.getUTCSeconds.call(n)+x+y));const S=zl(n.timeZone,n),j=S>0?Math.floor(S):Math.ceil(S),C=-new Date(+n).getTimezoneOffset()-j,N=j!==r,E=C-m;if(N&&E){Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+E);const O=zl(n.timeZone,n),_=O>0?Math.floor(O):Math.ceil(O),z=j-_;z&&(n.internal.setUTCMinutes(n.internal.getUTCMinutes()+z),Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+z))}}class Xt extends Jn{static tz(a,...r){return r.length?new Xt(...r,a):new Xt(Date.now(),a)}toISOString(){const[a,r,o]=this.tzComponents(),s=`${a}${r}:${o}`;return this.internal.toISOString().slice(0,-1)+s}toString(){return`${this.toDateString()} ${this.toTimeString()}`}toDateString(){const[a,r,o,s]=this.internal.toUTCString().split(" ");return`${a==null?void 0:a.slice(0,-1)} ${o} ${r} ${s}`}toTimeString(){const a=this.internal.toUTCString().split(" ")[4],[r,o,s]=this.tzComponents();return`${a} GMT${r}${o}${s} (${hM(this.timeZone,this)})`}toLocaleString(a,r){return Date.prototype.toLocaleString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}toLocaleDateString(a,r){return Date.prototype.toLocaleDateString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}toLocaleTimeString(a,r){return Date.prototype.toLocaleTimeString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}tzComponents(){const a=this.getTimezoneOffset(),r=a>0?"-":"+",o=String(Math.floor(Math.abs(a)/60)).padStart(2,"0"),s=String(Math.abs(a)%60).padStart(2,"0");return[r,o,s]}withTimeZone(a){return new Xt(+this,a)}[Symbol.for("constructDateFrom")](a){return new Xt(+new Date(a),this.timeZone)}}function rS(n,a,r){const o=st(n,r==null?void 0:r.in);return isNaN(a)?_t(n,NaN):(a&&o.setDate(o.getDate()+a),o)}function oS(n,a,r){const o=st(n,r==null?void 0:r.in);if(isNaN(a))return _t(n,NaN);if(!a)return o;const s=o.getDate(),u=_t(n,o.getTime());u.setMonth(o.getMonth()+a+1,0);const f=u.getDate();return s>=f?u:(o.setFullYear(u.getFullYear(),u.getMonth(),s),o)}function si(n,a){return ul(n,{...a,weekStartsOn:1})}function iS(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=_t(r,0);s.setFullYear(o+1,0,4),s.setHours(0,0,0,0);const u=si(s),f=_t(r,0);f.setFullYear(o,0,4),f.setHours(0,0,0,0);const h=si(f);return r.getTime()>=u.getTime()?o+1:r.getTime()>=h.getTime()?o:o-1}function Ly(n){const a=st(n),r=new Date(Date.UTC(a.getFullYear(),a.getMonth(),a.getDate(),a.getHours(),a.getMinutes(),a.getSeconds(),a.getMilliseconds()));return r.setUTCFullYear(a.getFullYear()),+n-+r}function ci(n,a){const r=st(n,a==null?void 0:a.in);return r.setHours(0,0,0,0),r}function Eh(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a),u=ci(o),f=ci(s),h=+u-Ly(u),m=+f-Ly(f);return Math.round((h-m)/rk)}function gM(n,a){const r=iS(n,a),o=_t(n,0);return o.setFullYear(r,0,4),o.setHours(0,0,0,0),si(o)}function vM(n,a,r){return rS(n,a*7,r)}function yM(n,a,r){return oS(n,a*12,r)}function xM(n,a){let r,o=a==null?void 0:a.in;return n.forEach(s=>{!o&&typeof s=="object"&&(o=_t.bind(null,s));const u=st(s,o);(!r||r<u||isNaN(+u))&&(r=u)}),_t(o,r||NaN)}function bM(n,a){let r,o=a==null?void 0:a.in;return n.forEach(s=>{!o&&typeof s=="object"&&(o=_t.bind(null,s));const u=st(s,o);(!r||r>u||isNaN(+u))&&(r=u)}),_t(o,r||NaN)}function SM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return+ci(o)==+ci(s)}function sS(n){return n instanceof Date||typeof n=="object"&&Object.prototype.toString.call(n)==="[object Date]"}function wM(n){return!(!sS(n)&&typeof n!="number"||isNaN(+st(n)))}function cS(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a),u=o.getFullYear()-s.getFullYear(),f=o.getMonth()-s.getMonth();return u*12+f}function CM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getMonth();return r.setFullYear(r.getFullYear(),o+1,0),r.setHours(23,59,59,999),r}function uS(n,a){const[r,o]=Pl(n,a.start,a.end);return{start:r,end:o}}function jM(n,a){const{start:r,end:o}=uS(a==null?void 0:a.in,n);let s=+r>+o;const u=s?+r:+o,f=s?o:r;f.setHours(0,0,0,0),f.setDate(1);let h=1;const m=[];for(;+f<=u;)m.push(_t(r,f)),f.setMonth(f.getMonth()+h);return s?m.reverse():m}function NM(n,a){const r=st(n,a==null?void 0:a.in);return r.setDate(1),r.setHours(0,0,0,0),r}function EM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear();return r.setFullYear(o+1,0,0),r.setHours(23,59,59,999),r}function dS(n,a){const r=st(n,a==null?void 0:a.in);return r.setFullYear(r.getFullYear(),0,1),r.setHours(0,0,0,0),r}function TM(n,a){const{start:r,end:o}=uS(a==null?void 0:a.in,n);let s=+r>+o;const u=s?+r:+o,f=s?o:r;f.setHours(0,0,0,0),f.setMonth(0,1);let h=1;const m=[];for(;+f<=u;)m.push(_t(r,f)),f.setFullYear(f.getFullYear()+h);return s?m.reverse():m}function fS(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.weekStartsOn)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.weekStartsOn)??r.weekStartsOn??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.weekStartsOn)??0,s=st(n,a==null?void 0:a.in),u=s.getDay(),f=(u<o?-7:0)+6-(u-o);return s.setDate(s.getDate()+f),s.setHours(23,59,59,999),s}function _M(n,a){return fS(n,{...a,weekStartsOn:1})}function OM(n,a){const r=st(n,a==null?void 0:a.in);return Eh(r,dS(r))+1}function Th(n,a){const r=st(n,a==null?void 0:a.in),o=+si(r)-+gM(r);return Math.round(o/aS)+1}function hS(n,a){var y,x,S,j;const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=xi(),u=(a==null?void 0:a.firstWeekContainsDate)??((x=(y=a==null?void 0:a.locale)==null?void 0:y.options)==null?void 0:x.firstWeekContainsDate)??s.firstWeekContainsDate??((j=(S=s.locale)==null?void 0:S.options)==null?void 0:j.firstWeekContainsDate)??1,f=_t((a==null?void 0:a.in)||n,0);f.setFullYear(o+1,0,u),f.setHours(0,0,0,0);const h=ul(f,a),m=_t((a==null?void 0:a.in)||n,0);m.setFullYear(o,0,u),m.setHours(0,0,0,0);const g=ul(m,a);return+r>=+h?o+1:+r>=+g?o:o-1}function kM(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.firstWeekContainsDate)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.firstWeekContainsDate)??r.firstWeekContainsDate??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.firstWeekContainsDate)??1,s=hS(n,a),u=_t((a==null?void 0:a.in)||n,0);return u.setFullYear(s,0,o),u.setHours(0,0,0,0),ul(u,a)}function _h(n,a){const r=st(n,a==null?void 0:a.in),o=+ul(r,a)-+kM(r,a);return Math.round(o/aS)+1}function at(n,a){const r=n<0?"-":"",o=Math.abs(n).toString().padStart(a,"0");return r+o}const rl={y(n,a){const r=n.getFullYear(),o=r>0?r:1-r;return at(a==="yy"?o%100:o,a.length)},M(n,a){const r=n.getMonth();return a==="M"?String(r+1):at(r+1,2)},d(n,a){return at(n.getDate(),a.length)},a(n,a){const r=n.getHours()/12>=1?"pm":"am";switch(a){case"a":case"aa":return r.toUpperCase();case"aaa":return r;case"aaaaa":return r[0];case"aaaa":default:return r==="am"?"a.m.":"p.m."}},h(n,a){return at(n.getHours()%12||12,a.length)},H(n,a){return at(n.getHours(),a.length)},m(n,a){return at(n.getMinutes(),a.length)},s(n,a){return at(n.getSeconds(),a.length)},S(n,a){const r=a.length,o=n.getMilliseconds(),s=Math.trunc(o*Math.pow(10,r-3));return at(s,a.length)}},Mr={midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},Yy={G:function(n,a,r){const o=n.getFullYear()>0?1:0;switch(a){case"G":case"GG":case"GGG":return r.era(o,{width:"abbreviated"});case"GGGGG":return r.era(o,{width:"narrow"});case"GGGG":default:return r.era(o,{width:"wide"})}},y:function(n,a,r){if(a==="yo"){const o=n.getFullYear(),s=o>0?o:1-o;return r.ordinalNumber(s,{unit:"year"})}return rl.y(n,a)},Y:function(n,a,r,o){const s=hS(n,o),u=s>0?s:1-s;if(a==="YY"){const f=u%100;return at(f,2)}return a==="Yo"?r.ordinalNumber(u,{unit:"year"}):at(u,a.length)},R:function(n,a){const r=iS(n);return at(r,a.length)},u:function(n,a){const r=n.getFullYear();return at(r,a.length)},Q:function(n,a,r){const o=Math.ceil((n.getMonth()+1)/3);switch(a){case"Q":return String(o);case"QQ":return at(o,2);case"Qo":return r.ordinalNumber(o,{unit:"quarter"});case"QQQ":return r.quarter(o,{width:"abbreviated",context:"formatting"});case"QQQQQ":return r.quarter(o,{width:"narrow",context:"formatting"});case"QQQQ":default:return r.quarter(o,{width:"wide",context:"formatting"})}},q:function(n,a,r){const o=Math.ceil((n.getMonth()+1)/3);switch(a){case"q":return String(o);case"qq":return at(o,2);case"qo":return r.ordinalNumber(o,{unit:"quarter"});case"qqq":return r.quarter(o,{width:"abbreviated",context:"standalone"});case"qqqqq":return r.quarter(o,{width:"narrow",context:"standalone"});case"qqqq":default:return r.quarter(o,{width:"wide",context:"standalone"})}},M:function(n,a,r){const o=n.getMonth();switch(a){case"M":case"MM":return rl.M(n,a);case"Mo":return r.ordinalNumber(o+1,{unit:"month"});case"MMM":return r.month(o,{width:"abbreviated",context:"formatting"});case"MMMMM":return r.month(o,{width:"narrow",context:"formatting"});case"MMMM":default:return r.month(o,{width:"wide",context:"formatting"})}},L:function(n,a,r){const o=n.getMonth();switch(a){case"L":return String(o+1);case"LL":return at(o+1,2);case"Lo":return r.ordinalNumber(o+1,{unit:"month"});case"LLL":return r.month(o,{width:"abbreviated",context:"standalone"});case"LLLLL":return r.month(o,{width:"narrow",context:"standalone"});case"LLLL":default:return r.month(o,{width:"wide",context:"standalone"})}},w:function(n,a,r,o){const s=_h(n,o);return a==="wo"?r.ordinalNumber(s,{unit:"week"}):at(s,a.length)},I:function(n,a,r){const o=Th(n);return a==="Io"?r.ordinalNumber(o,{unit:"week"}):at(o,a.length)},d:function(n,a,r){return a==="do"?r.ordinalNumber(n.getDate(),{unit:"date"}):rl.d(n,a)},D:function(n,a,r){const o=OM(n);return a==="Do"?r.ordinalNumber(o,{unit:"dayOfYear"}):at(o,a.length)},E:function(n,a,r){const o=n.getDay();switch(a){case"E":case"EE":case"EEE":return r.day(o,{width:"abbreviated",context:"formatting"});case"EEEEE":return r.day(o,{width:"narrow",context:"formatting"});case"EEEEEE":return r.day(o,{width:"short",context:"formatting"});case"EEEE":default:return r.day(o,{width:"wide",context:"formatting"})}},e:function(n,a,r,o){const s=n.getDay(),u=(s-o.weekStartsOn+8)%7||7;switch(a){case"e":return String(u);case"ee":return at(u,2);case"eo":return r.ordinalNumber(u,{unit:"day"});case"eee":return r.day(s,{width:"abbreviated",context:"formatting"});case"eeeee":return r.day(s,{width:"narrow",context:"formatting"});case"eeeeee":return r.day(s,{width:"short",context:"formatting"});case"eeee":default:return r.day(s,{width:"wide",context:"formatting"})}},c:function(n,a,r,o){const s=n.getDay(),u=(s-o.weekStartsOn+8)%7||7;switch(a){case"c":return String(u);case"cc":return at(u,a.length);case"co":return r.ordinalNumber(u,{unit:"day"});case"ccc":return r.day(s,{width:"abbreviated",context:"standalone"});case"ccccc":return r.day(s,{width:"narrow",context:"standalone"});case"cccccc":return r.day(s,{width:"short",context:"standalone"});case"cccc":default:return r.day(s,{width:"wide",context:"standalone"})}},i:function(n,a,r){const o=n.getDay(),s=o===0?7:o;switch(a){case"i":return String(s);case"ii":return at(s,a.length);case"io":return r.ordinalNumber(s,{unit:"day"});case"iii":return r.day(o,{width:"abbreviated",context:"formatting"});case"iiiii":return r.day(o,{width:"narrow",context:"formatting"});case"iiiiii":return r.day(o,{width:"short",context:"formatting"});case"iiii":default:return r.day(o,{width:"wide",context:"formatting"})}},a:function(n,a,r){const s=n.getHours()/12>=1?"pm":"am";switch(a){case"a":case"aa":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"aaa":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"}).toLowerCase();case"aaaaa":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"aaaa":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},b:function(n,a,r){const o=n.getHours();let s;switch(o===12?s=Mr.noon:o===0?s=Mr.midnight:s=o/12>=1?"pm":"am",a){case"b":case"bb":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"bbb":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"}).toLowerCase();case"bbbbb":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"bbbb":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},B:function(n,a,r){const o=n.getHours();let s;switch(o>=17?s=Mr.evening:o>=12?s=Mr.afternoon:o>=4?s=Mr.morning:s=Mr.night,a){case"B":case"BB":case"BBB":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"BBBBB":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"BBBB":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},h:function(n,a,r){if(a==="ho"){let o=n.getHours()%12;return o===0&&(o=12),r.ordinalNumber(o,{unit:"hour"})}return rl.h(n,a)},H:function(n,a,r){return a==="Ho"?r.ordinalNumber(n.getHours(),{unit:"hour"}):rl.H(n,a)},K:function(n,a,r){const o=n.getHours()%12;return a==="Ko"?r.ordinalNumber(o,{unit:"hour"}):at(o,a.length)},k:function(n,a,r){let o=n.getHours();return o===0&&(o=24),a==="ko"?r.ordinalNumber(o,{unit:"hour"}):at(o,a.length)},m:function(n,a,r){return a==="mo"?r.ordinalNumber(n.getMinutes(),{unit:"minute"}):rl.m(n,a)},s:function(n,a,r){return a==="so"?r.ordinalNumber(n.getSeconds(),{unit:"second"}):rl.s(n,a)},S:function(n,a){return rl.S(n,a)},X:function(n,a,r){const o=n.getTimezoneOffset();if(o===0)return"Z";switch(a){case"X":return Wy(o);case"XXXX":case"XX":return Al(o);case"XXXXX":case"XXX":default:return Al(o,":")}},x:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"x":return Wy(o);case"xxxx":case"xx":return Al(o);case"xxxxx":case"xxx":default:return Al(o,":")}},O:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"O":case"OO":case"OOO":return"GMT"+Py(o,":");case"OOOO":default:return"GMT"+Al(o,":")}},z:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"z":case"zz":case"zzz":return"GMT"+Py(o,":");case"zzzz":default:return"GMT"+Al(o,":")}},t:function(n,a,r){const o=Math.trunc(+n/1e3);return at(o,a.length)},T:function(n,a,r){return at(+n,a.length)}};function Py(n,a=""){const r=n>0?"-":"+",o=Math.abs(n),s=Math.trunc(o/60),u=o%60;return u===0?r+String(s):r+String(s)+a+at(u,2)}function Wy(n,a){return n%60===0?(n>0?"-":"+")+at(Math.abs(n)/60,2):Al(n,a)}function Al(n,a=""){const r=n>0?"-":"+",o=Math.abs(n),s=at(Math.trunc(o/60),2),u=at(o%60,2);return r+s+a+u}const Vy=(n,a)=>{switch(n){case"P":return a.date({width:"short"});case"PP":return a.date({width:"medium"});case"PPP":return a.date({width:"long"});case"PPPP":default:return a.date({width:"full"})}},mS=(n,a)=>{switch(n){case"p":return a.time({width:"short"});case"pp":return a.time({width:"medium"});case"ppp":return a.time({width:"long"});case"pppp":default:return a.time({width:"full"})}},MM=(n,a)=>{const r=n.match(/(P+)(p+)?/)||[],o=r[1],s=r[2];if(!s)return Vy(n,a);let u;switch(o){case"P":u=a.dateTime({width:"short"});break;case"PP":u=a.dateTime({width:"medium"});break;case"PPP":u=a.dateTime({width:"long"});break;case"PPPP":default:u=a.dateTime({width:"full"});break}return u.replace("{{date}}",Vy(o,a)).replace("{{time}}",mS(s,a))},DM={p:mS,P:MM},RM=/^D+$/,AM=/^Y+$/,zM=["D","DD","YY","YYYY"];function BM(n){return RM.test(n)}function UM(n){return AM.test(n)}function HM(n,a,r){const o=LM(n,a,r);if(console.warn(o),zM.includes(n))throw new RangeError(o)}function LM(n,a,r){const o=n[0]==="Y"?"years":"days of the month";return`Use \`${n.toLowerCase()}\` instead of \`${n}\` (in \`${a}\`) for formatting ${o} to the input \`${r}\`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md`}const YM=/[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g,PM=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g,WM=/^'([^]*?)'?$/,VM=/''/g,qM=/[a-zA-Z]/;function ai(n,a,r){var y,x,S,j,M,C,N,E;const o=xi(),s=(r==null?void 0:r.locale)??o.locale??Ar,u=(r==null?void 0:r.firstWeekContainsDate)??((x=(y=r==null?void 0:r.locale)==null?void 0:y.options)==null?void 0:x.firstWeekContainsDate)??o.firstWeekContainsDate??((j=(S=o.locale)==null?void 0:S.options)==null?void 0:j.firstWeekContainsDate)??1,f=(r==null?void 0:r.weekStartsOn)??((C=(M=r==null?void 0:r.locale)==null?void 0:M.options)==null?void 0:C.weekStartsOn)??o.weekStartsOn??((E=(N=o.locale)==null?void 0:N.options)==null?void 0:E.weekStartsOn)??0,h=st(n,r==null?void 0:r.in);if(!wM(h))throw new RangeError("Invalid time value");let m=a.match(PM).map(O=>{const _=O[0];if(_==="p"||_==="P"){const z=DM[_];return z(O,s.formatLong)}return O}).join("").match(YM).map(O=>{if(O==="''")return{isToken:!1,value:"'"};const _=O[0];if(_==="'")return{isToken:!1,value:GM(O)};if(Yy[_])return{isToken:!0,value:O};if(_.match(qM))throw new RangeError("Format string contains an unescaped latin alphabet character `"+_+"`");return{isToken:!1,value:O}});s.localize.preprocessor&&(m=s.localize.preprocessor(h,m));const g={firstWeekContainsDate:u,weekStartsOn:f,locale:s};return m.map(O=>{if(!O.isToken)return O.value;const _=O.value;(!(r!=null&&r.useAdditionalWeekYearTokens)&&UM(_)||!(r!=null&&r.useAdditionalDayOfYearTokens)&&BM(_))&&HM(_,a,String(n));const z=Yy[_[0]];return z(h,_,s.localize,g)}).join("")}function GM(n){const a=n.match(WM);return a?a[1].replace(VM,"'"):n}function XM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=r.getMonth(),u=_t(r,0);return u.setFullYear(o,s+1,0),u.setHours(0,0,0,0),u.getDate()}function $M(n,a){return st(n,a==null?void 0:a.in).getMonth()}function FM(n,a){return st(n,a==null?void 0:a.in).getFullYear()}function QM(n,a){return+st(n)>+st(a)}function KM(n,a){return+st(n)<+st(a)}function ZM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return o.getFullYear()===s.getFullYear()&&o.getMonth()===s.getMonth()}function IM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return o.getFullYear()===s.getFullYear()}function JM(n,a,r){const o=st(n,r==null?void 0:r.in),s=o.getFullYear(),u=o.getDate(),f=_t(n,0);f.setFullYear(s,a,15),f.setHours(0,0,0,0);const h=XM(f);return o.setMonth(a,Math.min(u,h)),o}function eD(n,a,r){const o=st(n,r==null?void 0:r.in);return isNaN(+o)?_t(n,NaN):(o.setFullYear(a),o)}const qy=5,tD=4;function nD(n,a){const r=a.startOfMonth(n),o=r.getDay()>0?r.getDay():7,s=a.addDays(n,-o+1),u=a.addDays(s,qy*7-1);return a.getMonth(n)===a.getMonth(u)?qy:tD}function pS(n,a){const r=a.startOfMonth(n),o=r.getDay();return o===1?r:o===0?a.addDays(r,-6):a.addDays(r,-1*(o-1))}function aD(n,a){const r=pS(n,a),o=nD(n,a);return a.addDays(r,o*7-1)}const gS={...Ar,labels:{labelDayButton:(n,a,r,o)=>{let s;o&&typeof o.format=="function"?s=o.format.bind(o):s=(f,h)=>ai(f,h,{locale:Ar,...r});let u=s(n,"PPPP");return a.today&&(u=`Today, ${u}`),a.selected&&(u=`${u}, selected`),u},labelMonthDropdown:"Choose the Month",labelNext:"Go to the Next Month",labelPrevious:"Go to the Previous Month",labelWeekNumber:n=>`Week ${n}`,labelYearDropdown:"Choose the Year",labelGrid:(n,a,r)=>{let o;return r&&typeof r.format=="function"?o=r.format.bind(r):o=(s,u)=>ai(s,u,{locale:Ar,...a}),o(n,"LLLL yyyy")},labelGridcell:(n,a,r,o)=>{let s;o&&typeof o.format=="function"?s=o.format.bind(o):s=(f,h)=>ai(f,h,{locale:Ar,...r});let u=s(n,"PPPP");return a!=null&&a.today&&(u=`Today, ${u}`),u},labelNav:"Navigation bar",labelWeekNumberHeader:"Week Number",labelWeekday:(n,a,r)=>{let o;return r&&typeof r.format=="function"?o=r.format.bind(r):o=(s,u)=>ai(s,u,{locale:Ar,...a}),o(n,"cccc")}}};class Vt{constructor(a,r){this.Date=Date,this.today=()=>{var o;return(o=this.overrides)!=null&&o.today?this.overrides.today():this.options.timeZone?Xt.tz(this.options.timeZone):new this.Date},this.newDate=(o,s,u)=>{var f;return(f=this.overrides)!=null&&f.newDate?this.overrides.newDate(o,s,u):this.options.timeZone?new Xt(o,s,u,this.options.timeZone):new Date(o,s,u)},this.addDays=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addDays?this.overrides.addDays(o,s):rS(o,s)},this.addMonths=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addMonths?this.overrides.addMonths(o,s):oS(o,s)},this.addWeeks=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addWeeks?this.overrides.addWeeks(o,s):vM(o,s)},this.addYears=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addYears?this.overrides.addYears(o,s):yM(o,s)},this.differenceInCalendarDays=(o,s)=>{var u;return(u=this.overrides)!=null&&u.differenceInCalendarDays?this.overrides.differenceInCalendarDays(o,s):Eh(o,s)},this.differenceInCalendarMonths=(o,s)=>{var u;return(u=this.overrides)!=null&&u.differenceInCalendarMonths?this.overrides.differenceInCalendarMonths(o,s):cS(o,s)},this.eachMonthOfInterval=o=>{var s;return(s=this.overrides)!=null&&s.eachMonthOfInterval?this.overrides.eachMonthOfInterval(o):jM(o)},this.eachYearOfInterval=o=>{var h;const s=(h=this.overrides)!=null&&h.eachYearOfInterval?this.overrides.eachYearOfInterval(o):TM(o),u=new Set(s.map(m=>this.getYear(m)));if(u.size===s.length)return s;const f=[];return u.forEach(m=>{f.push(new Date(m,0,1))}),f},this.endOfBroadcastWeek=o=>{var s;return(s=this.overrides)!=null&&s.endOfBroadcastWeek?this.overrides.endOfBroadcastWeek(o):aD(o,this)},this.endOfISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.endOfISOWeek?this.overrides.endOfISOWeek(o):_M(o)},this.endOfMonth=o=>{var s;return(s=this.overrides)!=null&&s.endOfMonth?this.overrides.endOfMonth(o):CM(o)},this.endOfWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.endOfWeek?this.overrides.endOfWeek(o,s):fS(o,this.options)},this.endOfYear=o=>{var s;return(s=this.overrides)!=null&&s.endOfYear?this.overrides.endOfYear(o):EM(o)},this.format=(o,s,u)=>{var h;const f=(h=this.overrides)!=null&&h.format?this.overrides.format(o,s,this.options):ai(o,s,this.options);return this.options.numerals&&this.options.numerals!=="latn"?this.replaceDigits(f):f},this.getISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.getISOWeek?this.overrides.getISOWeek(o):Th(o)},this.getMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getMonth?this.overrides.getMonth(o,this.options):$M(o,this.options)},this.getYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getYear?this.overrides.getYear(o,this.options):FM(o,this.options)},this.getWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getWeek?this.overrides.getWeek(o,this.options):_h(o,this.options)},this.isAfter=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isAfter?this.overrides.isAfter(o,s):QM(o,s)},this.isBefore=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isBefore?this.overrides.isBefore(o,s):KM(o,s)},this.isDate=o=>{var s;return(s=this.overrides)!=null&&s.isDate?this.overrides.isDate(o):sS(o)},this.isSameDay=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameDay?this.overrides.isSameDay(o,s):SM(o,s)},this.isSameMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameMonth?this.overrides.isSameMonth(o,s):ZM(o,s)},this.isSameYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameYear?this.overrides.isSameYear(o,s):IM(o,s)},this.max=o=>{var s;return(s=this.overrides)!=null&&s.max?this.overrides.max(o):xM(o)},this.min=o=>{var s;return(s=this.overrides)!=null&&s.min?this.overrides.min(o):bM(o)},this.setMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.setMonth?this.overrides.setMonth(o,s):JM(o,s)},this.setYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.setYear?this.overrides.setYear(o,s):eD(o,s)},this.startOfBroadcastWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.startOfBroadcastWeek?this.overrides.startOfBroadcastWeek(o,this):pS(o,this)},this.startOfDay=o=>{var s;return(s=this.overrides)!=null&&s.startOfDay?this.overrides.startOfDay(o):ci(o)},this.startOfISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.startOfISOWeek?this.overrides.startOfISOWeek(o):si(o)},this.startOfMonth=o=>{var s;return(s=this.overrides)!=null&&s.startOfMonth?this.overrides.startOfMonth(o):NM(o)},this.startOfWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.startOfWeek?this.overrides.startOfWeek(o,this.options):ul(o,this.options)},this.startOfYear=o=>{var s;return(s=this.overrides)!=null&&s.startOfYear?this.overrides.startOfYear(o):dS(o)},this.options={locale:gS,...a},this.overrides=r}getDigitMap(){const{numerals:a="latn"}=this.options,r=new Intl.NumberFormat("en-US",{numberingSystem:a}),o={};for(let s=0;s<10;s++)o[s.toString()]=r.format(s);return o}replaceDigits(a){const r=this.getDigitMap();return a.replace(/\d/g,o=>r[o]||o)}formatNumber(a){return this.replaceDigits(a.toString())}getMonthYearOrder(){var r;const a=(r=this.options.locale)==null?void 0:r.code;return a&&Vt.yearFirstLocales.has(a)?"year-first":"month-first"}formatMonthYear(a){const{locale:r,timeZone:o,numerals:s}=this.options,u=r==null?void 0:r.code;if(u&&Vt.yearFirstLocales.has(u))try{return new Intl.DateTimeFormat(u,{month:"long",year:"numeric",timeZone:o,numberingSystem:s}).format(a)}catch{}const f=this.getMonthYearOrder()==="year-first"?"y LLLL":"LLLL y";return this.format(a,f)}}Vt.yearFirstLocales=new Set(["eu","hu","ja","ja-Hira","ja-JP","ko","ko-KR","lt","lt-LT","lv","lv-LV","mn","mn-MN","zh","zh-CN","zh-HK","zh-TW"]);const ra=new Vt,lD={...fM,labels:{labelDayButton:(n,a,r,o)=>{let u=(o??new Vt(r)).format(n,"PPPP");return a.today&&(u=`今天，${u}`),a.selected&&(u=`${u}，已选择`),u},labelMonthDropdown:"选择月份",labelNext:"前往下个月",labelPrevious:"前往上个月",labelWeekNumber:n=>`第 ${n} 周`,labelYearDropdown:"选择年份",labelGrid:(n,a,r)=>(r??new Vt(a)).formatMonthYear(n),labelGridcell:(n,a,r,o)=>{let u=(o??new Vt(r)).format(n,"PPPP");return a!=null&&a.today&&(u=`今天，${u}`),u},labelNav:"导航栏",labelWeekNumberHeader:"周数",labelWeekday:(n,a,r)=>(r??new Vt(a)).format(n,"cccc")}};class vS{constructor(a,r,o=ra){this.date=a,this.displayMonth=r,this.outside=!!(r&&!o.isSameMonth(a,r)),this.dateLib=o,this.isoDate=o.format(a,"yyyy-MM-dd"),this.displayMonthId=o.format(r,"yyyy-MM"),this.dateMonthId=o.format(a,"yyyy-MM")}isEqualTo(a){return this.dateLib.isSameDay(a.date,this.date)&&this.dateLib.isSameMonth(a.displayMonth,this.displayMonth)}}class rD{constructor(a,r){this.date=a,this.weeks=r}}class oD{constructor(a,r){this.days=r,this.weekNumber=a}}function iD(n){return oe.createElement("button",{...n})}function sD(n){return oe.createElement("span",{...n})}function cD(n){const{size:a=24,orientation:r="left",className:o}=n;return oe.createElement("svg",{className:o,width:a,height:a,viewBox:"0 0 24 24"},r==="up"&&oe.createElement("polygon",{points:"6.77 17 12.5 11.43 18.24 17 20 15.28 12.5 8 5 15.28"}),r==="down"&&oe.createElement("polygon",{points:"6.77 8 12.5 13.57 18.24 8 20 9.72 12.5 17 5 9.72"}),r==="left"&&oe.createElement("polygon",{points:"16 18.112 9.81111111 12 16 5.87733333 14.0888889 4 6 12 14.0888889 20"}),r==="right"&&oe.createElement("polygon",{points:"8 18.112 14.18888889 12 8 5.87733333 9.91111111 4 18 12 9.91111111 20"}))}function uD(n){const{day:a,modifiers:r,...o}=n;return oe.createElement("td",{...o})}function dD(n){const{day:a,modifiers:r,...o}=n,s=oe.useRef(null);return oe.useEffect(()=>{var u;r.focused&&((u=s.current)==null||u.focus())},[r.focused]),oe.createElement("button",{ref:s,...o})}var ye;(function(n){n.Root="root",n.Chevron="chevron",n.Day="day",n.DayButton="day_button",n.CaptionLabel="caption_label",n.Dropdowns="dropdowns",n.Dropdown="dropdown",n.DropdownRoot="dropdown_root",n.Footer="footer",n.MonthGrid="month_grid",n.MonthCaption="month_caption",n.MonthsDropdown="months_dropdown",n.Month="month",n.Months="months",n.Nav="nav",n.NextMonthButton="button_next",n.PreviousMonthButton="button_previous",n.Week="week",n.Weeks="weeks",n.Weekday="weekday",n.Weekdays="weekdays",n.WeekNumber="week_number",n.WeekNumberHeader="week_number_header",n.YearsDropdown="years_dropdown"})(ye||(ye={}));var gt;(function(n){n.disabled="disabled",n.hidden="hidden",n.outside="outside",n.focused="focused",n.today="today"})(gt||(gt={}));var Yn;(function(n){n.range_end="range_end",n.range_middle="range_middle",n.range_start="range_start",n.selected="selected"})(Yn||(Yn={}));var pn;(function(n){n.weeks_before_enter="weeks_before_enter",n.weeks_before_exit="weeks_before_exit",n.weeks_after_enter="weeks_after_enter",n.weeks_after_exit="weeks_after_exit",n.caption_after_enter="caption_after_enter",n.caption_after_exit="caption_after_exit",n.caption_before_enter="caption_before_enter",n.caption_before_exit="caption_before_exit"})(pn||(pn={}));function fD(n){const{options:a,className:r,components:o,classNames:s,...u}=n,f=[s[ye.Dropdown],r].join(" "),h=a==null?void 0:a.find(({value:m})=>m===u.value);return oe.createElement("span",{"data-disabled":u.disabled,className:s[ye.DropdownRoot]},oe.createElement(o.Select,{className:f,...u},a==null?void 0:a.map(({value:m,label:g,disabled:y})=>oe.createElement(o.Option,{key:m,value:m,disabled:y},g))),oe.createElement("span",{className:s[ye.CaptionLabel],"aria-hidden":!0},h==null?void 0:h.label,oe.createElement(o.Chevron,{orientation:"down",size:18,className:s[ye.Chevron]})))}function hD(n){return oe.createElement("div",{...n})}function mD(n){return oe.createElement("div",{...n})}function pD(n){const{calendarMonth:a,displayIndex:r,...o}=n;return oe.createElement("div",{...o},n.children)}function gD(n){const{calendarMonth:a,displayIndex:r,...o}=n;return oe.createElement("div",{...o})}function vD(n){return oe.createElement("table",{...n})}function yD(n){return oe.createElement("div",{...n})}const yS=v.createContext(void 0);function bi(){const n=v.useContext(yS);if(n===void 0)throw new Error("useDayPicker() must be used within a custom component.");return n}function xD(n){const{components:a}=bi();return oe.createElement(a.Dropdown,{...n})}function bD(n){const{onPreviousClick:a,onNextClick:r,previousMonth:o,nextMonth:s,...u}=n,{components:f,classNames:h,labels:{labelPrevious:m,labelNext:g}}=bi(),y=v.useCallback(S=>{s&&(r==null||r(S))},[s,r]),x=v.useCallback(S=>{o&&(a==null||a(S))},[o,a]);return oe.createElement("nav",{...u},oe.createElement(f.PreviousMonthButton,{type:"button",className:h[ye.PreviousMonthButton],tabIndex:o?void 0:-1,"aria-disabled":o?void 0:!0,"aria-label":m(o),onClick:x},oe.createElement(f.Chevron,{disabled:o?void 0:!0,className:h[ye.Chevron],orientation:"left"})),oe.createElement(f.NextMonthButton,{type:"button",className:h[ye.NextMonthButton],tabIndex:s?void 0:-1,"aria-disabled":s?void 0:!0,"aria-label":g(s),onClick:y},oe.createElement(f.Chevron,{disabled:s?void 0:!0,orientation:"right",className:h[ye.Chevron]})))}function SD(n){const{components:a}=bi();return oe.createElement(a.Button,{...n})}function wD(n){return oe.createElement("option",{...n})}function CD(n){const{components:a}=bi();return oe.createElement(a.Button,{...n})}function jD(n){const{rootRef:a,...r}=n;return oe.createElement("div",{...r,ref:a})}function ND(n){return oe.createElement("select",{...n})}function ED(n){const{week:a,...r}=n;return oe.createElement("tr",{...r})}function TD(n){return oe.createElement("th",{...n})}function _D(n){return oe.createElement("thead",{"aria-hidden":!0},oe.createElement("tr",{...n}))}function OD(n){const{week:a,...r}=n;return oe.createElement("th",{...r})}function kD(n){return oe.createElement("th",{...n})}function MD(n){return oe.createElement("tbody",{...n})}function DD(n){const{components:a}=bi();return oe.createElement(a.Dropdown,{...n})}const RD=Object.freeze(Object.defineProperty({__proto__:null,Button:iD,CaptionLabel:sD,Chevron:cD,Day:uD,DayButton:dD,Dropdown:fD,DropdownNav:hD,Footer:mD,Month:pD,MonthCaption:gD,MonthGrid:vD,Months:yD,MonthsDropdown:xD,Nav:bD,NextMonthButton:SD,Option:wD,PreviousMonthButton:CD,Root:jD,Select:ND,Week:ED,WeekNumber:OD,WeekNumberHeader:kD,Weekday:TD,Weekdays:_D,Weeks:MD,YearsDropdown:DD},Symbol.toStringTag,{value:"Module"}));function Ea(n,a,r=!1,o=ra){let{from:s,to:u}=n;const{differenceInCalendarDays:f,isSameDay:h}=o;return s&&u?(f(u,s)<0&&([s,u]=[u,s]),f(a,s)>=(r?1:0)&&f(u,a)>=(r?1:0)):!r&&u?h(u,a):!r&&s?h(s,a):!1}function Oh(n){return!!(n&&typeof n=="object"&&"before"in n&&"after"in n)}function kc(n){return!!(n&&typeof n=="object"&&"from"in n)}function kh(n){return!!(n&&typeof n=="object"&&"after"in n)}function Mh(n){return!!(n&&typeof n=="object"&&"before"in n)}function xS(n){return!!(n&&typeof n=="object"&&"dayOfWeek"in n)}function bS(n,a){return Array.isArray(n)&&n.every(a.isDate)}function Ta(n,a,r=ra){const o=Array.isArray(a)?a:[a],{isSameDay:s,differenceInCalendarDays:u,isAfter:f}=r;return o.some(h=>{if(typeof h=="boolean")return h;if(r.isDate(h))return s(n,h);if(bS(h,r))return h.some(m=>s(n,m));if(kc(h))return Ea(h,n,!1,r);if(xS(h))return Array.isArray(h.dayOfWeek)?h.dayOfWeek.includes(n.getDay()):h.dayOfWeek===n.getDay();if(Oh(h)){const m=u(h.before,n),g=u(h.after,n),y=m>0,x=g<0;return f(h.before,h.after)?x&&y:y||x}return kh(h)?u(n,h.after)>0:Mh(h)?u(h.before,n)>0:typeof h=="function"?h(n):!1})}function AD(n,a,r,o,s){const{disabled:u,hidden:f,modifiers:h,showOutsideDays:m,broadcastCalendar:g,today:y=s.today()}=a,{isSameDay:x,isSameMonth:S,startOfMonth:j,isBefore:M,endOfMonth:C,isAfter:N}=s,E=r&&j(r),O=o&&C(o),_={[gt.focused]:[],[gt.outside]:[],[gt.disabled]:[],[gt.hidden]:[],[gt.today]:[]},z={};for(const D of n){const{date:k,displayMonth:T}=D,Y=!!(T&&!S(k,T)),H=!!(E&&M(k,E)),Z=!!(O&&N(k,O)),ne=!!(u&&Ta(k,u,s)),fe=!!(f&&Ta(k,f,s))||H||Z||!g&&!m&&Y||g&&m===!1&&Y,ve=x(k,y);Y&&_.outside.push(D),ne&&_.disabled.push(D),fe&&_.hidden.push(D),ve&&_.today.push(D),h&&Object.keys(h).forEach($=>{const se=h==null?void 0:h[$];se&&Ta(k,se,s)&&(z[$]?z[$].push(D):z[$]=[D])})}return D=>{const k={[gt.focused]:!1,[gt.disabled]:!1,[gt.hidden]:!1,[gt.outside]:!1,[gt.today]:!1},T={};for(const Y in _){const H=_[Y];k[Y]=H.some(Z=>Z===D)}for(const Y in z)T[Y]=z[Y].some(H=>H===D);return{...k,...T}}}function zD(n,a,r={}){return Object.entries(n).filter(([,s])=>s===!0).reduce((s,[u])=>(r[u]?s.push(r[u]):a[gt[u]]?s.push(a[gt[u]]):a[Yn[u]]&&s.push(a[Yn[u]]),s),[a[ye.Day]])}function BD(n){return{...RD,...n}}function UD(n){const a={"data-mode":n.mode??void 0,"data-required":"required"in n?n.required:void 0,"data-multiple-months":n.numberOfMonths&&n.numberOfMonths>1||void 0,"data-week-numbers":n.showWeekNumber||void 0,"data-broadcast-calendar":n.broadcastCalendar||void 0,"data-nav-layout":n.navLayout||void 0};return Object.entries(n).forEach(([r,o])=>{r.startsWith("data-")&&(a[r]=o)}),a}function Dh(){const n={};for(const a in ye)n[ye[a]]=`rdp-${ye[a]}`;for(const a in gt)n[gt[a]]=`rdp-${gt[a]}`;for(const a in Yn)n[Yn[a]]=`rdp-${Yn[a]}`;for(const a in pn)n[pn[a]]=`rdp-${pn[a]}`;return n}function SS(n,a,r){return(r??new Vt(a)).formatMonthYear(n)}const HD=SS;function LD(n,a,r){return(r??new Vt(a)).format(n,"d")}function YD(n,a=ra){return a.format(n,"LLLL")}function PD(n,a,r){return(r??new Vt(a)).format(n,"cccccc")}function WD(n,a=ra){return n<10?a.formatNumber(`0${n.toLocaleString()}`):a.formatNumber(`${n.toLocaleString()}`)}function VD(){return""}function wS(n,a=ra){return a.format(n,"yyyy")}const qD=wS,GD=Object.freeze(Object.defineProperty({__proto__:null,formatCaption:SS,formatDay:LD,formatMonthCaption:HD,formatMonthDropdown:YD,formatWeekNumber:WD,formatWeekNumberHeader:VD,formatWeekdayName:PD,formatYearCaption:qD,formatYearDropdown:wS},Symbol.toStringTag,{value:"Module"}));function XD(n){return n!=null&&n.formatMonthCaption&&!n.formatCaption&&(n.formatCaption=n.formatMonthCaption),n!=null&&n.formatYearCaption&&!n.formatYearDropdown&&(n.formatYearDropdown=n.formatYearCaption),{...GD,...n}}function Rh(n,a,r,o){let s=(o??new Vt(r)).format(n,"PPPP");return a.today&&(s=`Today, ${s}`),a.selected&&(s=`${s}, selected`),s}const $D=Rh;function Ah(n,a,r){return(r??new Vt(a)).formatMonthYear(n)}const FD=Ah;function CS(n,a,r,o){let s=(o??new Vt(r)).format(n,"PPPP");return a!=null&&a.today&&(s=`Today, ${s}`),s}function jS(n){return"Choose the Month"}function NS(){return""}const QD="Go to the Next Month";function ES(n,a){return QD}function TS(n){return"Go to the Previous Month"}function _S(n,a,r){return(r??new Vt(a)).format(n,"cccc")}function OS(n,a){return`Week ${n}`}function kS(n){return"Week Number"}function MS(n){return"Choose the Year"}const KD=Object.freeze(Object.defineProperty({__proto__:null,labelCaption:FD,labelDay:$D,labelDayButton:Rh,labelGrid:Ah,labelGridcell:CS,labelMonthDropdown:jS,labelNav:NS,labelNext:ES,labelPrevious:TS,labelWeekNumber:OS,labelWeekNumberHeader:kS,labelWeekday:_S,labelYearDropdown:MS},Symbol.toStringTag,{value:"Module"})),Hn=(n,a,r)=>a||(r?typeof r=="function"?r:(...o)=>r:n);function ZD(n,a){var o;const r=((o=a.locale)==null?void 0:o.labels)??{};return{...KD,...n??{},labelDayButton:Hn(Rh,n==null?void 0:n.labelDayButton,r.labelDayButton),labelMonthDropdown:Hn(jS,n==null?void 0:n.labelMonthDropdown,r.labelMonthDropdown),labelNext:Hn(ES,n==null?void 0:n.labelNext,r.labelNext),labelPrevious:Hn(TS,n==null?void 0:n.labelPrevious,r.labelPrevious),labelWeekNumber:Hn(OS,n==null?void 0:n.labelWeekNumber,r.labelWeekNumber),labelYearDropdown:Hn(MS,n==null?void 0:n.labelYearDropdown,r.labelYearDropdown),labelGrid:Hn(Ah,n==null?void 0:n.labelGrid,r.labelGrid),labelGridcell:Hn(CS,n==null?void 0:n.labelGridcell,r.labelGridcell),labelNav:Hn(NS,n==null?void 0:n.labelNav,r.labelNav),labelWeekNumberHeader:Hn(kS,n==null?void 0:n.labelWeekNumberHeader,r.labelWeekNumberHeader),labelWeekday:Hn(_S,n==null?void 0:n.labelWeekday,r.labelWeekday)}}function ID(n,a,r,o,s){const{startOfMonth:u,startOfYear:f,endOfYear:h,eachMonthOfInterval:m,getMonth:g}=s;return m({start:f(n),end:h(n)}).map(S=>{const j=o.formatMonthDropdown(S,s),M=g(S),C=a&&S<u(a)||r&&S>u(r)||!1;return{value:M,label:j,disabled:C}})}function JD(n,a={},r={}){let o={...a==null?void 0:a[ye.Day]};return Object.entries(n).filter(([,s])=>s===!0).forEach(([s])=>{o={...o,...r==null?void 0:r[s]}}),o}function eR(n,a,r,o){const s=o??n.today(),u=r?n.startOfBroadcastWeek(s,n):a?n.startOfISOWeek(s):n.startOfWeek(s),f=[];for(let h=0;h<7;h++){const m=n.addDays(u,h);f.push(m)}return f}function tR(n,a,r,o,s=!1){if(!n||!a)return;const{startOfYear:u,endOfYear:f,eachYearOfInterval:h,getYear:m}=o,g=u(n),y=f(a),x=h({start:g,end:y});return s&&x.reverse(),x.map(S=>{const j=r.formatYearDropdown(S,o);return{value:m(S),label:j,disabled:!1}})}function nR(n,a={}){var h;const{weekStartsOn:r,locale:o}=a,s=r??((h=o==null?void 0:o.options)==null?void 0:h.weekStartsOn)??0,u=m=>{const g=typeof m=="number"||typeof m=="string"?new Date(m):m;return new Xt(g.getFullYear(),g.getMonth(),g.getDate(),12,0,0,n)},f=m=>{const g=u(m);return new Date(g.getFullYear(),g.getMonth(),g.getDate(),0,0,0,0)};return{today:()=>u(Xt.tz(n)),newDate:(m,g,y)=>new Xt(m,g,y,12,0,0,n),startOfDay:m=>u(m),startOfWeek:(m,g)=>{const y=u(m),x=(g==null?void 0:g.weekStartsOn)??s,S=(y.getDay()-x+7)%7;return y.setDate(y.getDate()-S),y},startOfISOWeek:m=>{const g=u(m),y=(g.getDay()-1+7)%7;return g.setDate(g.getDate()-y),g},startOfMonth:m=>{const g=u(m);return g.setDate(1),g},startOfYear:m=>{const g=u(m);return g.setMonth(0,1),g},endOfWeek:(m,g)=>{const y=u(m),j=((((g==null?void 0:g.weekStartsOn)??s)+6)%7-y.getDay()+7)%7;return y.setDate(y.getDate()+j),y},endOfISOWeek:m=>{const g=u(m),y=(7-g.getDay())%7;return g.setDate(g.getDate()+y),g},endOfMonth:m=>{const g=u(m);return g.setMonth(g.getMonth()+1,0),g},endOfYear:m=>{const g=u(m);return g.setMonth(11,31),g},eachMonthOfInterval:m=>{const g=u(m.start),y=u(m.end),x=[],S=new Xt(g.getFullYear(),g.getMonth(),1,12,0,0,n),j=y.getFullYear()*12+y.getMonth();for(;S.getFullYear()*12+S.getMonth()<=j;)x.push(new Xt(S,n)),S.setMonth(S.getMonth()+1,1);return x},addDays:(m,g)=>{const y=u(m);return y.setDate(y.getDate()+g),y},addWeeks:(m,g)=>{const y=u(m);return y.setDate(y.getDate()+g*7),y},addMonths:(m,g)=>{const y=u(m);return y.setMonth(y.getMonth()+g),y},addYears:(m,g)=>{const y=u(m);return y.setFullYear(y.getFullYear()+g),y},eachYearOfInterval:m=>{const g=u(m.start),y=u(m.end),x=[],S=new Xt(g.getFullYear(),0,1,12,0,0,n);for(;S.getFullYear()<=y.getFullYear();)x.push(new Xt(S,n)),S.setFullYear(S.getFullYear()+1,0,1);return x},getWeek:(m,g)=>{var x;const y=f(m);return _h(y,{weekStartsOn:(g==null?void 0:g.weekStartsOn)??s,firstWeekContainsDate:(g==null?void 0:g.firstWeekContainsDate)??((x=o==null?void 0:o.options)==null?void 0:x.firstWeekContainsDate)??1})},getISOWeek:m=>{const g=f(m);return Th(g)},differenceInCalendarDays:(m,g)=>{const y=f(m),x=f(g);return Eh(y,x)},differenceInCalendarMonths:(m,g)=>{const y=f(m),x=f(g);return cS(y,x)}}}const Si=n=>n instanceof HTMLElement?n:null,bf=n=>[...n.querySelectorAll("[data-animated-month]")??[]],aR=n=>Si(n.querySelector("[data-animated-month]")),Sf=n=>Si(n.querySelector("[data-animated-caption]")),wf=n=>Si(n.querySelector("[data-animated-weeks]")),lR=n=>Si(n.querySelector("[data-animated-nav]")),rR=n=>Si(n.querySelector("[data-animated-weekdays]"));function oR(n,a,{classNames:r,months:o,focused:s,dateLib:u}){const f=v.useRef(null),h=v.useRef(o),m=v.useRef(!1);v.useLayoutEffect(()=>{const g=h.current;if(h.current=o,!a||!n.current||!(n.current instanceof HTMLElement)||o.length===0||g.length===0||o.length!==g.length)return;const y=u.isSameMonth(o[0].date,g[0].date),x=u.isAfter(o[0].date,g[0].date),S=x?r[pn.caption_after_enter]:r[pn.caption_before_enter],j=x?r[pn.weeks_after_enter]:r[pn.weeks_before_enter],M=f.current,C=n.current.cloneNode(!0);if(C instanceof HTMLElement?(bf(C).forEach(_=>{if(!(_ instanceof HTMLElement))return;const z=aR(_);z&&_.contains(z)&&_.removeChild(z);const D=Sf(_);D&&D.classList.remove(S);const k=wf(_);k&&k.classList.remove(j)}),f.current=C):f.current=null,m.current||y||s)return;const N=M instanceof HTMLElement?bf(M):[],E=bf(n.current);if(E!=null&&E.every(O=>O instanceof HTMLElement)&&N&&N.every(O=>O instanceof HTMLElement)){m.current=!0,n.current.style.isolation="isolate";const O=lR(n.current);O&&(O.style.zIndex="1"),E.forEach((_,z)=>{const D=N[z];if(!D)return;_.style.position="relative",_.style.overflow="hidden";const k=Sf(_);k&&k.classList.add(S);const T=wf(_);T&&T.classList.add(j);const Y=()=>{m.current=!1,n.current&&(n.current.style.isolation=""),O&&(O.style.zIndex=""),k&&k.classList.remove(S),T&&T.classList.remove(j),_.style.position="",_.style.overflow="",_.contains(D)&&_.removeChild(D)};D.style.pointerEvents="none",D.style.position="absolute",D.style.overflow="hidden",D.setAttribute("aria-hidden","true");const H=rR(D);H&&(H.style.opacity="0");const Z=Sf(D);Z&&(Z.classList.add(x?r[pn.caption_before_exit]:r[pn.caption_after_exit]),Z.addEventListener("animationend",Y));const ne=wf(D);ne&&ne.classList.add(x?r[pn.weeks_before_exit]:r[pn.weeks_after_exit]),_.insertBefore(D,_.firstChild)})}})}function iR(n,a,r,o){const s=n[0],u=n[n.length-1],{ISOWeek:f,fixedWeeks:h,broadcastCalendar:m}=r??{},{addDays:g,differenceInCalendarDays:y,differenceInCalendarMonths:x,endOfBroadcastWeek:S,endOfISOWeek:j,endOfMonth:M,endOfWeek:C,isAfter:N,startOfBroadcastWeek:E,startOfISOWeek:O,startOfWeek:_}=o,z=m?E(s,o):f?O(s):_(s),D=m?S(u):f?j(M(u)):C(M(u)),k=a&&(m?S(a):f?j(a):C(a)),T=k&&N(D,k)?k:D,Y=y(T,z),H=x(u,s)+1,Z=[];for(let ve=0;ve<=Y;ve++){const $=g(z,ve);Z.push($)}const fe=(m?35:42)*H;if(h&&Z.length<fe){const ve=fe-Z.length;for(let $=0;$<ve;$++){const se=g(Z[Z.length-1],1);Z.push(se)}}return Z}function sR(n){const a=[];return n.reduce((r,o)=>{const s=o.weeks.reduce((u,f)=>u.concat(f.days.slice()),a.slice());return r.concat(s.slice())},a.slice())}function cR(n,a,r,o){const{numberOfMonths:s=1}=r,u=[];for(let f=0;f<s;f++){const h=o.addMonths(n,f);if(a&&h>a)break;u.push(h)}return u}function Gy(n,a,r,o){const{month:s,defaultMonth:u,today:f=o.today(),numberOfMonths:h=1}=n;let m=s||u||f;const{differenceInCalendarMonths:g,addMonths:y,startOfMonth:x}=o;if(r&&g(r,m)<h-1){const S=-1*(h-1);m=y(r,S)}return a&&g(m,a)<0&&(m=a),x(m)}function uR(n,a,r,o){const{addDays:s,endOfBroadcastWeek:u,endOfISOWeek:f,endOfMonth:h,endOfWeek:m,getISOWeek:g,getWeek:y,startOfBroadcastWeek:x,startOfISOWeek:S,startOfWeek:j}=o,M=n.reduce((C,N)=>{const E=r.broadcastCalendar?x(N,o):r.ISOWeek?S(N):j(N),O=r.broadcastCalendar?u(N):r.ISOWeek?f(h(N)):m(h(N)),_=a.filter(T=>T>=E&&T<=O),z=r.broadcastCalendar?35:42;if(r.fixedWeeks&&_.length<z){const T=a.filter(Y=>{const H=z-_.length;return Y>O&&Y<=s(O,H)});_.push(...T)}const D=_.reduce((T,Y)=>{const H=r.ISOWeek?g(Y):y(Y),Z=T.find(fe=>fe.weekNumber===H),ne=new vS(Y,N,o);return Z?Z.days.push(ne):T.push(new oD(H,[ne])),T},[]),k=new rD(N,D);return C.push(k),C},[]);return r.reverseMonths?M.reverse():M}function dR(n,a){let{startMonth:r,endMonth:o}=n;const{startOfYear:s,startOfDay:u,startOfMonth:f,endOfMonth:h,addYears:m,endOfYear:g,newDate:y,today:x}=a,{fromYear:S,toYear:j,fromMonth:M,toMonth:C}=n;!r&&M&&(r=M),!r&&S&&(r=a.newDate(S,0,1)),!o&&C&&(o=C),!o&&j&&(o=y(j,11,31));const N=n.captionLayout==="dropdown"||n.captionLayout==="dropdown-years";return r?r=f(r):S?r=y(S,0,1):!r&&N&&(r=s(m(n.today??x(),-100))),o?o=h(o):j?o=y(j,11,31):!o&&N&&(o=g(n.today??x())),[r&&u(r),o&&u(o)]}function fR(n,a,r,o){if(r.disableNavigation)return;const{pagedNavigation:s,numberOfMonths:u=1}=r,{startOfMonth:f,addMonths:h,differenceInCalendarMonths:m}=o,g=s?u:1,y=f(n);if(!a)return h(y,g);if(!(m(a,n)<u))return h(y,g)}function hR(n,a,r,o){if(r.disableNavigation)return;const{pagedNavigation:s,numberOfMonths:u}=r,{startOfMonth:f,addMonths:h,differenceInCalendarMonths:m}=o,g=s?u??1:1,y=f(n);if(!a)return h(y,-g);if(!(m(y,a)<=0))return h(y,-g)}function mR(n){const a=[];return n.reduce((r,o)=>r.concat(o.weeks.slice()),a.slice())}function Mc(n,a){const[r,o]=v.useState(n);return[a===void 0?r:a,o]}function pR(n,a){var z;const[r,o]=dR(n,a),{startOfMonth:s,endOfMonth:u}=a,f=Gy(n,r,o,a),[h,m]=Mc(f,n.month?f:void 0);v.useEffect(()=>{const D=Gy(n,r,o,a);m(D)},[n.timeZone]);const{months:g,weeks:y,days:x,previousMonth:S,nextMonth:j}=v.useMemo(()=>{const D=cR(h,o,{numberOfMonths:n.numberOfMonths},a),k=iR(D,n.endMonth?u(n.endMonth):void 0,{ISOWeek:n.ISOWeek,fixedWeeks:n.fixedWeeks,broadcastCalendar:n.broadcastCalendar},a),T=uR(D,k,{broadcastCalendar:n.broadcastCalendar,fixedWeeks:n.fixedWeeks,ISOWeek:n.ISOWeek,reverseMonths:n.reverseMonths},a),Y=mR(T),H=sR(T),Z=hR(h,r,n,a),ne=fR(h,o,n,a);return{months:T,weeks:Y,days:H,previousMonth:Z,nextMonth:ne}},[a,h.getTime(),o==null?void 0:o.getTime(),r==null?void 0:r.getTime(),n.disableNavigation,n.broadcastCalendar,(z=n.endMonth)==null?void 0:z.getTime(),n.fixedWeeks,n.ISOWeek,n.numberOfMonths,n.pagedNavigation,n.reverseMonths]),{disableNavigation:M,onMonthChange:C}=n,N=D=>y.some(k=>k.days.some(T=>T.isEqualTo(D))),E=D=>{if(M)return;let k=s(D);r&&k<s(r)&&(k=s(r)),o&&k>s(o)&&(k=s(o)),m(k),C==null||C(k)};return{months:g,weeks:y,days:x,navStart:r,navEnd:o,previousMonth:S,nextMonth:j,goToMonth:E,goToDay:D=>{N(D)||E(D.date)}}}var Fn;(function(n){n[n.Today=0]="Today",n[n.Selected=1]="Selected",n[n.LastFocused=2]="LastFocused",n[n.FocusedModifier=3]="FocusedModifier"})(Fn||(Fn={}));function Xy(n){return!n[gt.disabled]&&!n[gt.hidden]&&!n[gt.outside]}function gR(n,a,r,o){let s,u=-1;for(const f of n){const h=a(f);Xy(h)&&(h[gt.focused]&&u<Fn.FocusedModifier?(s=f,u=Fn.FocusedModifier):o!=null&&o.isEqualTo(f)&&u<Fn.LastFocused?(s=f,u=Fn.LastFocused):r(f.date)&&u<Fn.Selected?(s=f,u=Fn.Selected):h[gt.today]&&u<Fn.Today&&(s=f,u=Fn.Today))}return s||(s=n.find(f=>Xy(a(f)))),s}function vR(n,a,r,o,s,u,f){const{ISOWeek:h,broadcastCalendar:m}=u,{addDays:g,addMonths:y,addWeeks:x,addYears:S,endOfBroadcastWeek:j,endOfISOWeek:M,endOfWeek:C,max:N,min:E,startOfBroadcastWeek:O,startOfISOWeek:_,startOfWeek:z}=f;let k={day:g,week:x,month:y,year:S,startOfWeek:T=>m?O(T,f):h?_(T):z(T),endOfWeek:T=>m?j(T):h?M(T):C(T)}[n](r,a==="after"?1:-1);return a==="before"&&o?k=N([o,k]):a==="after"&&s&&(k=E([s,k])),k}function DS(n,a,r,o,s,u,f,h=0){if(h>365)return;const m=vR(n,a,r.date,o,s,u,f),g=!!(u.disabled&&Ta(m,u.disabled,f)),y=!!(u.hidden&&Ta(m,u.hidden,f)),x=m,S=new vS(m,x,f);return!g&&!y?S:DS(n,a,S,o,s,u,f,h+1)}function yR(n,a,r,o,s){const{autoFocus:u}=n,[f,h]=v.useState(),m=gR(a.days,r,o||(()=>!1),f),[g,y]=v.useState(u?m:void 0);return{isFocusTarget:C=>!!(m!=null&&m.isEqualTo(C)),setFocused:y,focused:g,blur:()=>{h(g),y(void 0)},moveFocus:(C,N)=>{if(!g)return;const E=DS(C,N,g,a.navStart,a.navEnd,n,s);E&&(n.disableNavigation&&!a.days.some(_=>_.isEqualTo(E))||(a.goToDay(E),y(E)))}}}function xR(n,a){const{selected:r,required:o,onSelect:s}=n,[u,f]=Mc(r,s?r:void 0),h=s?r:u,{isSameDay:m}=a,g=j=>(h==null?void 0:h.some(M=>m(M,j)))??!1,{min:y,max:x}=n;return{selected:h,select:(j,M,C)=>{let N=[...h??[]];if(g(j)){if((h==null?void 0:h.length)===y||o&&(h==null?void 0:h.length)===1)return;N=h==null?void 0:h.filter(E=>!m(E,j))}else(h==null?void 0:h.length)===x?N=[j]:N=[...N,j];return s||f(N),s==null||s(N,j,M,C),N},isSelected:g}}function bR(n,a,r=0,o=0,s=!1,u=ra){const{from:f,to:h}=a||{},{isSameDay:m,isAfter:g,isBefore:y}=u;let x;if(!f&&!h)x={from:n,to:r>0?void 0:n};else if(f&&!h)m(f,n)?r===0?x={from:f,to:n}:s?x={from:f,to:void 0}:x=void 0:y(n,f)?x={from:n,to:f}:x={from:f,to:n};else if(f&&h)if(m(f,n)&&m(h,n))s?x={from:f,to:h}:x=void 0;else if(m(f,n))x={from:f,to:r>0?void 0:n};else if(m(h,n))x={from:n,to:r>0?void 0:n};else if(y(n,f))x={from:n,to:h};else if(g(n,f))x={from:f,to:n};else if(g(n,h))x={from:f,to:n};else throw new Error("Invalid range");if(x!=null&&x.from&&(x!=null&&x.to)){const S=u.differenceInCalendarDays(x.to,x.from);o>0&&S>o?x={from:n,to:void 0}:r>1&&S<r&&(x={from:n,to:void 0})}return x}function SR(n,a,r=ra){const o=Array.isArray(a)?a:[a];let s=n.from;const u=r.differenceInCalendarDays(n.to,n.from),f=Math.min(u,6);for(let h=0;h<=f;h++){if(o.includes(s.getDay()))return!0;s=r.addDays(s,1)}return!1}function $y(n,a,r=ra){return Ea(n,a.from,!1,r)||Ea(n,a.to,!1,r)||Ea(a,n.from,!1,r)||Ea(a,n.to,!1,r)}function wR(n,a,r=ra){const o=Array.isArray(a)?a:[a];if(o.filter(h=>typeof h!="function").some(h=>typeof h=="boolean"?h:r.isDate(h)?Ea(n,h,!1,r):bS(h,r)?h.some(m=>Ea(n,m,!1,r)):kc(h)?h.from&&h.to?$y(n,{from:h.from,to:h.to},r):!1:xS(h)?SR(n,h.dayOfWeek,r):Oh(h)?r.isAfter(h.before,h.after)?$y(n,{from:r.addDays(h.after,1),to:r.addDays(h.before,-1)},r):Ta(n.from,h,r)||Ta(n.to,h,r):kh(h)||Mh(h)?Ta(n.from,h,r)||Ta(n.to,h,r):!1))return!0;const f=o.filter(h=>typeof h=="function");if(f.length){let h=n.from;const m=r.differenceInCalendarDays(n.to,n.from);for(let g=0;g<=m;g++){if(f.some(y=>y(h)))return!0;h=r.addDays(h,1)}}return!1}function CR(n,a){const{disabled:r,excludeDisabled:o,selected:s,required:u,onSelect:f}=n,[h,m]=Mc(s,f?s:void 0),g=f?s:h;return{selected:g,select:(S,j,M)=>{const{min:C,max:N}=n,E=S?bR(S,g,C,N,u,a):void 0;return o&&r&&(E!=null&&E.from)&&E.to&&wR({from:E.from,to:E.to},r,a)&&(E.from=S,E.to=void 0),f||m(E),f==null||f(E,S,j,M),E},isSelected:S=>g&&Ea(g,S,!1,a)}}function jR(n,a){const{selected:r,required:o,onSelect:s}=n,[u,f]=Mc(r,s?r:void 0),h=s?r:u,{isSameDay:m}=a;return{selected:h,select:(x,S,j)=>{let M=x;return!o&&h&&h&&m(x,h)&&(M=void 0),s||f(M),s==null||s(M,x,S,j),M},isSelected:x=>h?m(h,x):!1}}function NR(n,a){const r=jR(n,a),o=xR(n,a),s=CR(n,a);switch(n.mode){case"single":return r;case"multiple":return o;case"range":return s;default:return}}function Mn(n,a){return n instanceof Xt&&n.timeZone===a?n:new Xt(n,a)}function Dr(n,a,r){return Mn(n,a)}function Fy(n,a,r){return typeof n=="boolean"||typeof n=="function"?n:n instanceof Date?Dr(n,a):Array.isArray(n)?n.map(o=>o instanceof Date?Dr(o,a):o):kc(n)?{...n,from:n.from?Mn(n.from,a):n.from,to:n.to?Mn(n.to,a):n.to}:Oh(n)?{before:Dr(n.before,a),after:Dr(n.after,a)}:kh(n)?{after:Dr(n.after,a)}:Mh(n)?{before:Dr(n.before,a)}:n}function Cf(n,a,r){return n&&(Array.isArray(n)?n.map(o=>Fy(o,a)):Fy(n,a))}function ER(n){var _i;let a=n;const r=a.timeZone;if(r&&(a={...n,timeZone:r},a.today&&(a.today=Mn(a.today,r)),a.month&&(a.month=Mn(a.month,r)),a.defaultMonth&&(a.defaultMonth=Mn(a.defaultMonth,r)),a.startMonth&&(a.startMonth=Mn(a.startMonth,r)),a.endMonth&&(a.endMonth=Mn(a.endMonth,r)),a.mode==="single"&&a.selected?a.selected=Mn(a.selected,r):a.mode==="multiple"&&a.selected?a.selected=(_i=a.selected)==null?void 0:_i.map(Te=>Mn(Te,r)):a.mode==="range"&&a.selected&&(a.selected={from:a.selected.from?Mn(a.selected.from,r):a.selected.from,to:a.selected.to?Mn(a.selected.to,r):a.selected.to}),a.disabled!==void 0&&(a.disabled=Cf(a.disabled,r)),a.hidden!==void 0&&(a.hidden=Cf(a.hidden,r)),a.modifiers)){const Te={};Object.keys(a.modifiers).forEach($e=>{var be;Te[$e]=Cf((be=a.modifiers)==null?void 0:be[$e],r)}),a.modifiers=Te}const{components:o,formatters:s,labels:u,dateLib:f,locale:h,classNames:m}=v.useMemo(()=>{const Te={...gS,...a.locale},$e=a.broadcastCalendar?1:a.weekStartsOn,be=a.noonSafe&&a.timeZone?nR(a.timeZone,{weekStartsOn:$e,locale:Te}):void 0,Le=a.dateLib&&be?{...be,...a.dateLib}:a.dateLib??be,At=new Vt({locale:Te,weekStartsOn:$e,firstWeekContainsDate:a.firstWeekContainsDate,useAdditionalWeekYearTokens:a.useAdditionalWeekYearTokens,useAdditionalDayOfYearTokens:a.useAdditionalDayOfYearTokens,timeZone:a.timeZone,numerals:a.numerals},Le);return{dateLib:At,components:BD(a.components),formatters:XD(a.formatters),labels:ZD(a.labels,At.options),locale:Te,classNames:{...Dh(),...a.classNames}}},[a.locale,a.broadcastCalendar,a.weekStartsOn,a.firstWeekContainsDate,a.useAdditionalWeekYearTokens,a.useAdditionalDayOfYearTokens,a.timeZone,a.numerals,a.dateLib,a.noonSafe,a.components,a.formatters,a.labels,a.classNames]);a.today||(a={...a,today:f.today()});const{captionLayout:g,mode:y,navLayout:x,numberOfMonths:S=1,onDayBlur:j,onDayClick:M,onDayFocus:C,onDayKeyDown:N,onDayMouseEnter:E,onDayMouseLeave:O,onNextClick:_,onPrevClick:z,showWeekNumber:D,styles:k}=a,{formatCaption:T,formatDay:Y,formatMonthDropdown:H,formatWeekNumber:Z,formatWeekNumberHeader:ne,formatWeekdayName:fe,formatYearDropdown:ve}=s,$=pR(a,f),{days:se,months:U,navStart:Q,navEnd:q,previousMonth:ie,nextMonth:ue,goToMonth:A}=$,P=AD(se,a,Q,q,f),{isSelected:te,select:le,selected:he}=NR(a,f)??{},{blur:Se,focused:ae,isFocusTarget:Ne,moveFocus:Ee,setFocused:ke}=yR(a,$,P,te??(()=>!1),f),{labelDayButton:je,labelGridcell:ze,labelGrid:Ct,labelMonthDropdown:G,labelNav:Qe,labelPrevious:qe,labelNext:ut,labelWeekday:Rt,labelWeekNumber:on,labelWeekNumberHeader:no,labelYearDropdown:ao}=u,Rc=v.useMemo(()=>eR(f,a.ISOWeek,a.broadcastCalendar,a.today),[f,a.ISOWeek,a.broadcastCalendar,a.today]),Ci=y!==void 0||M!==void 0,Ut=v.useCallback(()=>{ie&&(A(ie),z==null||z(ie))},[ie,A,z]),lo=v.useCallback(()=>{ue&&(A(ue),_==null||_(ue))},[A,ue,_]),ji=v.useCallback((Te,$e)=>be=>{be.preventDefault(),be.stopPropagation(),ke(Te),!$e.disabled&&(le==null||le(Te.date,$e,be),M==null||M(Te.date,$e,be))},[le,M,ke]),Ni=v.useCallback((Te,$e)=>be=>{ke(Te),C==null||C(Te.date,$e,be)},[C,ke]),Wl=v.useCallback((Te,$e)=>be=>{Se(),j==null||j(Te.date,$e,be)},[Se,j]),Ac=v.useCallback((Te,$e)=>be=>{const Le={ArrowLeft:[be.shiftKey?"month":"day",a.dir==="rtl"?"after":"before"],ArrowRight:[be.shiftKey?"month":"day",a.dir==="rtl"?"before":"after"],ArrowDown:[be.shiftKey?"year":"week","after"],ArrowUp:[be.shiftKey?"year":"week","before"],PageUp:[be.shiftKey?"year":"month","before"],PageDown:[be.shiftKey?"year":"month","after"],Home:["startOfWeek","before"],End:["endOfWeek","after"]};if(Le[be.key]){be.preventDefault(),be.stopPropagation();const[At,Ue]=Le[be.key];Ee(At,Ue)}N==null||N(Te.date,$e,be)},[Ee,N,a.dir]),Ei=v.useCallback((Te,$e)=>be=>{E==null||E(Te.date,$e,be)},[E]),zc=v.useCallback((Te,$e)=>be=>{O==null||O(Te.date,$e,be)},[O]),Bc=v.useCallback(Te=>$e=>{const be=Number($e.target.value),Le=f.setMonth(f.startOfMonth(Te),be);A(Le)},[f,A]),pl=v.useCallback(Te=>$e=>{const be=Number($e.target.value),Le=f.setYear(f.startOfMonth(Te),be);A(Le)},[f,A]),{className:$t,style:Vn}=v.useMemo(()=>({className:[m[ye.Root],a.className].filter(Boolean).join(" "),style:{...k==null?void 0:k[ye.Root],...a.style}}),[m,a.className,a.style,k]),Ft=UD(a),Ti=v.useRef(null);oR(Ti,!!a.animate,{classNames:m,months:U,focused:ae,dateLib:f});const Uc={dayPickerProps:a,selected:he,select:le,isSelected:te,months:U,nextMonth:ue,previousMonth:ie,goToMonth:A,getModifiers:P,components:o,classNames:m,styles:k,labels:u,formatters:s};return oe.createElement(yS.Provider,{value:Uc},oe.createElement(o.Root,{rootRef:a.animate?Ti:void 0,className:$t,style:Vn,dir:a.dir,id:a.id,lang:a.lang,nonce:a.nonce,title:a.title,role:a.role,"aria-label":a["aria-label"],"aria-labelledby":a["aria-labelledby"],...Ft},oe.createElement(o.Months,{className:m[ye.Months],style:k==null?void 0:k[ye.Months]},!a.hideNavigation&&!x&&oe.createElement(o.Nav,{"data-animated-nav":a.animate?"true":void 0,className:m[ye.Nav],style:k==null?void 0:k[ye.Nav],"aria-label":Qe(),onPreviousClick:Ut,onNextClick:lo,previousMonth:ie,nextMonth:ue}),U.map((Te,$e)=>oe.createElement(o.Month,{"data-animated-month":a.animate?"true":void 0,className:m[ye.Month],style:k==null?void 0:k[ye.Month],key:$e,displayIndex:$e,calendarMonth:Te},x==="around"&&!a.hideNavigation&&$e===0&&oe.createElement(o.PreviousMonthButton,{type:"button",className:m[ye.PreviousMonthButton],tabIndex:ie?void 0:-1,"aria-disabled":ie?void 0:!0,"aria-label":qe(ie),onClick:Ut,"data-animated-button":a.animate?"true":void 0},oe.createElement(o.Chevron,{disabled:ie?void 0:!0,className:m[ye.Chevron],orientation:a.dir==="rtl"?"right":"left"})),oe.createElement(o.MonthCaption,{"data-animated-caption":a.animate?"true":void 0,className:m[ye.MonthCaption],style:k==null?void 0:k[ye.MonthCaption],calendarMonth:Te,displayIndex:$e},g!=null&&g.startsWith("dropdown")?oe.createElement(o.DropdownNav,{className:m[ye.Dropdowns],style:k==null?void 0:k[ye.Dropdowns]},(()=>{const be=g==="dropdown"||g==="dropdown-months"?oe.createElement(o.MonthsDropdown,{key:"month",className:m[ye.MonthsDropdown],"aria-label":G(),classNames:m,components:o,disabled:!!a.disableNavigation,onChange:Bc(Te.date),options:ID(Te.date,Q,q,s,f),style:k==null?void 0:k[ye.Dropdown],value:f.getMonth(Te.date)}):oe.createElement("span",{key:"month"},H(Te.date,f)),Le=g==="dropdown"||g==="dropdown-years"?oe.createElement(o.YearsDropdown,{key:"year",className:m[ye.YearsDropdown],"aria-label":ao(f.options),classNames:m,components:o,disabled:!!a.disableNavigation,onChange:pl(Te.date),options:tR(Q,q,s,f,!!a.reverseYears),style:k==null?void 0:k[ye.Dropdown],value:f.getYear(Te.date)}):oe.createElement("span",{key:"year"},ve(Te.date,f));return f.getMonthYearOrder()==="year-first"?[Le,be]:[be,Le]})(),oe.createElement("span",{role:"status","aria-live":"polite",style:{border:0,clip:"rect(0 0 0 0)",height:"1px",margin:"-1px",overflow:"hidden",padding:0,position:"absolute",width:"1px",whiteSpace:"nowrap",wordWrap:"normal"}},T(Te.date,f.options,f))):oe.createElement(o.CaptionLabel,{className:m[ye.CaptionLabel],role:"status","aria-live":"polite"},T(Te.date,f.options,f))),x==="around"&&!a.hideNavigation&&$e===S-1&&oe.createElement(o.NextMonthButton,{type:"button",className:m[ye.NextMonthButton],tabIndex:ue?void 0:-1,"aria-disabled":ue?void 0:!0,"aria-label":ut(ue),onClick:lo,"data-animated-button":a.animate?"true":void 0},oe.createElement(o.Chevron,{disabled:ue?void 0:!0,className:m[ye.Chevron],orientation:a.dir==="rtl"?"left":"right"})),$e===S-1&&x==="after"&&!a.hideNavigation&&oe.createElement(o.Nav,{"data-animated-nav":a.animate?"true":void 0,className:m[ye.Nav],style:k==null?void 0:k[ye.Nav],"aria-label":Qe(),onPreviousClick:Ut,onNextClick:lo,previousMonth:ie,nextMonth:ue}),oe.createElement(o.MonthGrid,{role:"grid","aria-multiselectable":y==="multiple"||y==="range","aria-label":Ct(Te.date,f.options,f)||void 0,className:m[ye.MonthGrid],style:k==null?void 0:k[ye.MonthGrid]},!a.hideWeekdays&&oe.createElement(o.Weekdays,{"data-animated-weekdays":a.animate?"true":void 0,className:m[ye.Weekdays],style:k==null?void 0:k[ye.Weekdays]},D&&oe.createElement(o.WeekNumberHeader,{"aria-label":no(f.options),className:m[ye.WeekNumberHeader],style:k==null?void 0:k[ye.WeekNumberHeader],scope:"col"},ne()),Rc.map(be=>oe.createElement(o.Weekday,{"aria-label":Rt(be,f.options,f),className:m[ye.Weekday],key:String(be),style:k==null?void 0:k[ye.Weekday],scope:"col"},fe(be,f.options,f)))),oe.createElement(o.Weeks,{"data-animated-weeks":a.animate?"true":void 0,className:m[ye.Weeks],style:k==null?void 0:k[ye.Weeks]},Te.weeks.map(be=>oe.createElement(o.Week,{className:m[ye.Week],key:be.weekNumber,style:k==null?void 0:k[ye.Week],week:be},D&&oe.createElement(o.WeekNumber,{week:be,style:k==null?void 0:k[ye.WeekNumber],"aria-label":on(be.weekNumber,{locale:h}),className:m[ye.WeekNumber],scope:"row",role:"rowheader"},Z(be.weekNumber,f)),be.days.map(Le=>{const{date:At}=Le,Ue=P(Le);if(Ue[gt.focused]=!Ue.hidden&&!!(ae!=null&&ae.isEqualTo(Le)),Ue[Yn.selected]=(te==null?void 0:te(At))||Ue.selected,kc(he)){const{from:oa,to:oo}=he;Ue[Yn.range_start]=!!(oa&&oo&&f.isSameDay(At,oa)),Ue[Yn.range_end]=!!(oa&&oo&&f.isSameDay(At,oo)),Ue[Yn.range_middle]=Ea(he,At,!0,f)}const Hc=JD(Ue,k,a.modifiersStyles),Oi=zD(Ue,m,a.modifiersClassNames),ro=!Ci&&!Ue.hidden?ze(At,Ue,f.options,f):void 0;return oe.createElement(o.Day,{key:`${Le.isoDate}_${Le.displayMonthId}`,day:Le,modifiers:Ue,className:Oi.join(" "),style:Hc,role:"gridcell","aria-selected":Ue.selected||void 0,"aria-label":ro,"data-day":Le.isoDate,"data-month":Le.outside?Le.dateMonthId:void 0,"data-selected":Ue.selected||void 0,"data-disabled":Ue.disabled||void 0,"data-hidden":Ue.hidden||void 0,"data-outside":Le.outside||void 0,"data-focused":Ue.focused||void 0,"data-today":Ue.today||void 0},!Ue.hidden&&Ci?oe.createElement(o.DayButton,{className:m[ye.DayButton],style:k==null?void 0:k[ye.DayButton],type:"button",day:Le,modifiers:Ue,disabled:!Ue.focused&&Ue.disabled||void 0,"aria-disabled":Ue.focused&&Ue.disabled||void 0,tabIndex:Ne(Le)?0:-1,"aria-label":je(At,Ue,f.options,f),onClick:ji(Le,Ue),onBlur:Wl(Le,Ue),onFocus:Ni(Le,Ue),onKeyDown:Ac(Le,Ue),onMouseEnter:Ei(Le,Ue),onMouseLeave:zc(Le,Ue)},Y(At,f.options,f)):!Ue.hidden&&Y(Le.date,f.options,f))})))))))),a.footer&&oe.createElement(o.Footer,{className:m[ye.Footer],style:k==null?void 0:k[ye.Footer],role:"status","aria-live":"polite"},a.footer)))}function TR({className:n,classNames:a,showOutsideDays:r=!0,captionLayout:o="label",buttonVariant:s="ghost",formatters:u,components:f,...h}){const m=Dh();return c.jsx(ER,{showOutsideDays:r,className:ce("bg-background group/calendar p-3 [--cell-size:2rem] [[data-slot=card-content]_&]:bg-transparent [[data-slot=popover-content]_&]:bg-transparent",String.raw`rtl:**:[.rdp-button\_next>svg]:rotate-180`,String.raw`rtl:**:[.rdp-button\_previous>svg]:rotate-180`,n),captionLayout:o,formatters:{formatMonthDropdown:g=>g.toLocaleString("default",{month:"short"}),...u},classNames:{root:ce("w-fit",m.root),months:ce("relative flex flex-col gap-4 md:flex-row",m.months),month:ce("flex w-full flex-col gap-4",m.month),nav:ce("absolute inset-x-0 top-0 flex w-full items-center justify-between gap-1",m.nav),button_previous:ce(ri({variant:s}),"h-[--cell-size] w-[--cell-size] select-none p-0 aria-disabled:opacity-50",m.button_previous),button_next:ce(ri({variant:s}),"h-[--cell-size] w-[--cell-size] select-none p-0 aria-disabled:opacity-50",m.button_next),month_caption:ce("flex h-[--cell-size] w-full items-center justify-center px-[--cell-size]",m.month_caption),dropdowns:ce("flex h-[--cell-size] w-full items-center justify-center gap-1.5 text-sm font-medium",m.dropdowns),dropdown_root:ce("has-focus:border-ring border-input shadow-xs has-focus:ring-ring/50 has-focus:ring-[3px] relative rounded-md border",m.dropdown_root),dropdown:ce("bg-popover absolute inset-0 opacity-0",m.dropdown),caption_label:ce("select-none font-medium",o==="label"?"text-sm":"[&>svg]:text-muted-foreground flex h-8 items-center gap-1 rounded-md pl-2 pr-1 text-sm [&>svg]:size-3.5",m.caption_label),table:"w-full border-collapse",weekdays:ce("flex",m.weekdays),weekday:ce("text-muted-foreground flex-1 select-none rounded-md text-[0.8rem] font-normal",m.weekday),week:ce("mt-2 flex w-full",m.week),week_number_header:ce("w-[--cell-size] select-none",m.week_number_header),week_number:ce("text-muted-foreground select-none text-[0.8rem]",m.week_number),day:ce("group/day relative aspect-square h-full w-full select-none p-0 text-center [&:first-child[data-selected=true]_button]:rounded-l-md [&:last-child[data-selected=true]_button]:rounded-r-md",m.day),range_start:ce("bg-accent rounded-l-md",m.range_start),range_middle:ce("rounded-none",m.range_middle),range_end:ce("bg-accent rounded-r-md",m.range_end),today:ce("bg-accent text-accent-foreground rounded-md data-[selected=true]:rounded-none",m.today),outside:ce("text-muted-foreground aria-selected:text-muted-foreground",m.outside),disabled:ce("text-muted-foreground opacity-50",m.disabled),hidden:ce("invisible",m.hidden),...a},components:{Root:({className:g,rootRef:y,...x})=>c.jsx("div",{"data-slot":"calendar",ref:y,className:ce(g),...x}),Chevron:({className:g,orientation:y,...x})=>y==="left"?c.jsx(lE,{className:ce("size-4",g),...x}):y==="right"?c.jsx(oE,{className:ce("size-4",g),...x}):c.jsx(lh,{className:ce("size-4",g),...x}),DayButton:_R,WeekNumber:({children:g,...y})=>c.jsx("td",{...y,children:c.jsx("div",{className:"flex size-[--cell-size] items-center justify-center text-center",children:g})}),...f},...h})}function _R({className:n,day:a,modifiers:r,...o}){const s=Dh(),u=v.useRef(null);return v.useEffect(()=>{var f;r.focused&&((f=u.current)==null||f.focus())},[r.focused]),c.jsx(we,{ref:u,variant:"ghost",size:"icon","data-day":a.date.toLocaleDateString(),"data-selected-single":r.selected&&!r.range_start&&!r.range_end&&!r.range_middle,"data-range-start":r.range_start,"data-range-end":r.range_end,"data-range-middle":r.range_middle,className:ce("data-[selected-single=true]:bg-primary data-[selected-single=true]:text-primary-foreground data-[range-middle=true]:bg-accent data-[range-middle=true]:text-accent-foreground data-[range-start=true]:bg-primary data-[range-start=true]:text-primary-foreground data-[range-end=true]:bg-primary data-[range-end=true]:text-primary-foreground group-data-[focused=true]/day:border-ring group-data-[focused=true]/day:ring-ring/50 flex aspect-square h-auto w-full min-w-[--cell-size] flex-col gap-1 font-normal leading-none data-[range-end=true]:rounded-md data-[range-middle=true]:rounded-none data-[range-start=true]:rounded-md group-data-[focused=true]/day:relative group-data-[focused=true]/day:z-10 group-data-[focused=true]/day:ring-[3px] [&>span]:text-xs [&>span]:opacity-70",s.day,n),...o})}function OR(n){const a=kR(n),r=v.forwardRef((o,s)=>{const{children:u,...f}=o,h=v.Children.toArray(u),m=h.find(DR);if(m){const g=m.props.children,y=h.map(x=>x===m?v.Children.count(g)>1?v.Children.only(null):v.isValidElement(g)?g.props.children:null:x);return c.jsx(a,{...f,ref:s,children:v.isValidElement(g)?v.cloneElement(g,void 0,y):null})}return c.jsx(a,{...f,ref:s,children:u})});return r.displayName=`${n}.Slot`,r}function kR(n){const a=v.forwardRef((r,o)=>{const{children:s,...u}=r;if(v.isValidElement(s)){const f=AR(s),h=RR(u,s.props);return s.type!==v.Fragment&&(h.ref=o?Xr(o,f):f),v.cloneElement(s,h)}return v.Children.count(s)>1?v.Children.only(null):null});return a.displayName=`${n}.SlotClone`,a}var MR=Symbol("radix.slottable");function DR(n){return v.isValidElement(n)&&typeof n.type=="function"&&"__radixId"in n.type&&n.type.__radixId===MR}function RR(n,a){const r={...a};for(const o in a){const s=n[o],u=a[o];/^on[A-Z]/.test(o)?s&&u?r[o]=(...h)=>{const m=u(...h);return s(...h),m}:s&&(r[o]=s):o==="style"?r[o]={...s,...u}:o==="className"&&(r[o]=[s,u].filter(Boolean).join(" "))}return{...n,...r}}function AR(n){var o,s;let a=(o=Object.getOwnPropertyDescriptor(n.props,"ref"))==null?void 0:o.get,r=a&&"isReactWarning"in a&&a.isReactWarning;return r?n.ref:(a=(s=Object.getOwnPropertyDescriptor(n,"ref"))==null?void 0:s.get,r=a&&"isReactWarning"in a&&a.isReactWarning,r?n.props.ref:n.props.ref||n.ref)}var Dc="Popover",[RS]=dl(Dc,[jc]),wi=jc(),[zR,ml]=RS(Dc),AS=n=>{const{__scopePopover:a,children:r,open:o,defaultOpen:s,onOpenChange:u,modal:f=!1}=n,h=wi(a),m=v.useRef(null),[g,y]=v.useState(!1),[x,S]=Lr({prop:o,defaultProp:s??!1,onChange:u,caller:Dc});return c.jsx(Pb,{...h,children:c.jsx(zR,{scope:a,contentId:Qr(),triggerRef:m,open:x,onOpenChange:S,onOpenToggle:v.useCallback(()=>S(j=>!j),[S]),hasCustomAnchor:g,onCustomAnchorAdd:v.useCallback(()=>y(!0),[]),onCustomAnchorRemove:v.useCallback(()=>y(!1),[]),modal:f,children:r})})};AS.displayName=Dc;var zS="PopoverAnchor",BR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(zS,r),u=wi(r),{onCustomAnchorAdd:f,onCustomAnchorRemove:h}=s;return v.useEffect(()=>(f(),()=>h()),[f,h]),c.jsx(Sh,{...u,...o,ref:a})});BR.displayName=zS;var BS="PopoverTrigger",US=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(BS,r),u=wi(r),f=lt(a,s.triggerRef),h=c.jsx(Ve.button,{type:"button","aria-haspopup":"dialog","aria-expanded":s.open,"aria-controls":s.contentId,"data-state":WS(s.open),...o,ref:f,onClick:De(n.onClick,s.onOpenToggle)});return s.hasCustomAnchor?h:c.jsx(Sh,{asChild:!0,...u,children:h})});US.displayName=BS;var zh="PopoverPortal",[UR,HR]=RS(zh,{forceMount:void 0}),HS=n=>{const{__scopePopover:a,forceMount:r,children:o,container:s}=n,u=ml(zh,a);return c.jsx(UR,{scope:a,forceMount:r,children:c.jsx(Ra,{present:r||u.open,children:c.jsx(wh,{asChild:!0,container:s,children:o})})})};HS.displayName=zh;var Pr="PopoverContent",LS=v.forwardRef((n,a)=>{const r=HR(Pr,n.__scopePopover),{forceMount:o=r.forceMount,...s}=n,u=ml(Pr,n.__scopePopover);return c.jsx(Ra,{present:o||u.open,children:u.modal?c.jsx(YR,{...s,ref:a}):c.jsx(PR,{...s,ref:a})})});LS.displayName=Pr;var LR=OR("PopoverContent.RemoveScroll"),YR=v.forwardRef((n,a)=>{const r=ml(Pr,n.__scopePopover),o=v.useRef(null),s=lt(a,o),u=v.useRef(!1);return v.useEffect(()=>{const f=o.current;if(f)return Xb(f)},[]),c.jsx(Ch,{as:LR,allowPinchZoom:!0,children:c.jsx(YS,{...n,ref:s,trapFocus:r.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:De(n.onCloseAutoFocus,f=>{var h;f.preventDefault(),u.current||(h=r.triggerRef.current)==null||h.focus()}),onPointerDownOutside:De(n.onPointerDownOutside,f=>{const h=f.detail.originalEvent,m=h.button===0&&h.ctrlKey===!0,g=h.button===2||m;u.current=g},{checkForDefaultPrevented:!1}),onFocusOutside:De(n.onFocusOutside,f=>f.preventDefault(),{checkForDefaultPrevented:!1})})})}),PR=v.forwardRef((n,a)=>{const r=ml(Pr,n.__scopePopover),o=v.useRef(!1),s=v.useRef(!1);return c.jsx(YS,{...n,ref:a,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:u=>{var f,h;(f=n.onCloseAutoFocus)==null||f.call(n,u),u.defaultPrevented||(o.current||(h=r.triggerRef.current)==null||h.focus(),u.preventDefault()),o.current=!1,s.current=!1},onInteractOutside:u=>{var m,g;(m=n.onInteractOutside)==null||m.call(n,u),u.defaultPrevented||(o.current=!0,u.detail.originalEvent.type==="pointerdown"&&(s.current=!0));const f=u.target;((g=r.triggerRef.current)==null?void 0:g.contains(f))&&u.preventDefault(),u.detail.originalEvent.type==="focusin"&&s.current&&u.preventDefault()}})}),YS=v.forwardRef((n,a)=>{const{__scopePopover:r,trapFocus:o,onOpenAutoFocus:s,onCloseAutoFocus:u,disableOutsidePointerEvents:f,onEscapeKeyDown:h,onPointerDownOutside:m,onFocusOutside:g,onInteractOutside:y,...x}=n,S=ml(Pr,r),j=wi(r);return yb(),c.jsx(fh,{asChild:!0,loop:!0,trapped:o,onMountAutoFocus:s,onUnmountAutoFocus:u,children:c.jsx(dh,{asChild:!0,disableOutsidePointerEvents:f,onInteractOutside:y,onEscapeKeyDown:h,onPointerDownOutside:m,onFocusOutside:g,onDismiss:()=>S.onOpenChange(!1),children:c.jsx(Wb,{"data-state":WS(S.open),role:"dialog",id:S.contentId,...j,...x,ref:a,style:{...x.style,"--radix-popover-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-popover-content-available-width":"var(--radix-popper-available-width)","--radix-popover-content-available-height":"var(--radix-popper-available-height)","--radix-popover-trigger-width":"var(--radix-popper-anchor-width)","--radix-popover-trigger-height":"var(--radix-popper-anchor-height)"}})})})}),PS="PopoverClose",WR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(PS,r);return c.jsx(Ve.button,{type:"button",...o,ref:a,onClick:De(n.onClick,()=>s.onOpenChange(!1))})});WR.displayName=PS;var VR="PopoverArrow",qR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=wi(r);return c.jsx(Vb,{...s,...o,ref:a})});qR.displayName=VR;function WS(n){return n?"open":"closed"}var GR=AS,XR=US,$R=HS,VS=LS;const FR=GR,QR=XR,qS=v.forwardRef(({className:n,align:a="center",sideOffset:r=4,...o},s)=>c.jsx($R,{children:c.jsx(VS,{ref:s,align:a,sideOffset:r,className:ce("z-50 w-72 rounded-md border bg-popover p-4 text-popover-foreground shadow-md outline-none data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-popover-content-transform-origin]",n),...o})}));qS.displayName=VS.displayName;function hc(n){const[a,r]=v.useState(!1),[o,s]=v.useState(),u=f=>{if(f){s(f);const h=f.getFullYear(),m=String(f.getMonth()+1).padStart(2,"0"),g=String(f.getDate()).padStart(2,"0");n.onSelect(`${h}/${m}/${g}`),r(!1)}};return c.jsxs(FR,{open:a,onOpenChange:r,children:[c.jsx(QR,{asChild:!0,children:c.jsx(we,{type:"button",variant:"outline",size:"icon",className:"shrink-0","aria-label":n.ariaLabel??"选择日期",children:c.jsx(eE,{className:"h-4 w-4"})})}),c.jsx(qS,{className:"w-auto overflow-hidden rounded-xl p-0",align:"start",children:c.jsx(TR,{mode:"single",selected:o,onSelect:u,locale:lD,className:"rounded-xl",initialFocus:!0})})]})}function Qy(){return{tab:"detail",detailText:"",detailOriginal:!1,accountText:"",accountTab:"post",accountEarliest:"",accountLatest:"",accountPages:"",accountMark:"",mixText:"",mixMark:"",selectedCollectIds:[],selectedMixCollectionIds:[],mixCollectionMark:""}}function KR(){const n=Gr(),{platform:a}=hi(),r=a==="douyin"||a==="tiktok",o=a==="tiktok"?"tiktok":"douyin",s=o==="tiktok",[u,f]=v.useState(()=>({douyin:Qy(),tiktok:Qy()})),h=u[o],m=$=>{f(se=>({...se,[o]:{...se[o],...$}}))},[g,y]=v.useState(!1),[x,S]=v.useState(!1),[j,M]=v.useState(!1),[C,N]=v.useState(null),[E,O]=v.useState(!1),[_,z]=v.useState(!1),[D,k]=v.useState([]),[T,Y]=v.useState(!1),[H,Z]=v.useState([]),ne=$=>n(`/tasks?task=${encodeURIComponent($)}`),fe=async()=>{if(!s){z(!0),N(null);try{const $=await Ae.listDouyinCollects();k($),m({selectedCollectIds:[]})}catch($){N(String($))}finally{z(!1)}}},ve=async()=>{if(!s){Y(!0),N(null);try{const $=await Ae.listDouyinMixCollections();Z($),m({selectedMixCollectionIds:[]})}catch($){N(String($))}finally{Y(!1)}}};return a==="kuaishou"?c.jsx(nk,{}):c.jsxs("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:[r?null:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})}),r?c.jsxs(yi,{value:h.tab,onValueChange:$=>m({tab:$}),className:"w-full",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"detail",children:"链接作品"}),c.jsx(Mt,{value:"account",children:"账号作品"}),c.jsx(Mt,{value:"mix",children:"合集作品"}),s?null:c.jsx(Mt,{value:"favorites",children:"收藏"})]}),c.jsx(Dt,{value:"detail",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[s?c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:"detailOriginal",checked:h.detailOriginal,onCheckedChange:$=>m({detailOriginal:$===!0})}),c.jsx(K,{htmlFor:"detailOriginal",className:"text-sm font-normal",children:"原画"})]}):null,c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"链接文本"}),c.jsx(St,{value:h.detailText,onChange:$=>m({detailText:$.target.value}),rows:8,placeholder:"粘贴多个分享链接或完整链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:g||!h.detailText.trim(),onClick:async()=>{y(!0);try{const $=s&&h.detailOriginal?await Ae.createDownloadTikTokOriginalTask({text:h.detailText}):await Ae.createDownloadDetailTask({platform:o,text:h.detailText});ne($.id)}finally{y(!1)}},children:"开始下载"})})]})})}),c.jsx(Dt,{value:"account",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"类型"}),c.jsxs(pi,{value:h.accountTab,onValueChange:$=>m({accountTab:$}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"post",children:"发布"}),c.jsx(vn,{value:"favorite",children:"喜欢"})]})]})]}),h.accountTab==="post"?c.jsxs(c.Fragment,{children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最早日期"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:h.accountEarliest,onChange:$=>m({accountEarliest:$.target.value}),placeholder:"YYYY/MM/DD 或天数"}),c.jsx(hc,{onSelect:$=>m({accountEarliest:$})})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最晚日期"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:h.accountLatest,onChange:$=>m({accountLatest:$.target.value}),placeholder:"YYYY/MM/DD 或天数"}),c.jsx(hc,{onSelect:$=>m({accountLatest:$})})]})]})]}):null,h.accountTab==="favorite"?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:h.accountPages,onChange:$=>m({accountPages:$.target.value}),placeholder:"留空表示自动"})]}):null,c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:h.accountMark,onChange:$=>m({accountMark:$.target.value}),placeholder:"可选"})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"账号链接文本"}),c.jsx(St,{value:h.accountText,onChange:$=>m({accountText:$.target.value}),rows:8,placeholder:"粘贴多个账号主页链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:x||!h.accountText.trim(),onClick:async()=>{S(!0);try{const $=h.accountTab==="favorite"?"favorite":"post",se=ie=>{const ue=ie.trim();if(!ue)return null;if(/^\d+(?:\.\d+)?$/.test(ue)){const A=Number(ue);return Number.isFinite(A)?A:null}return ue},U=$==="favorite"?Number(h.accountPages.trim()):NaN,Q=Number.isFinite(U)&&U>0?Math.floor(U):null,q=await Ae.createDownloadAccountTask({platform:o,text:h.accountText,tab:$,earliest:$==="post"?se(h.accountEarliest):null,latest:$==="post"?se(h.accountLatest):null,pages:Q,mark:h.accountMark});ne(q.id)}finally{S(!1)}},children:"开始下载"})})]})})}),s?null:c.jsx(Dt,{value:"favorites",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[C?c.jsx("div",{className:"text-sm text-destructive",children:C}):null,c.jsxs("div",{className:"flex flex-col gap-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsx(we,{variant:"outline",disabled:E,onClick:async()=>{O(!0),N(null);try{const $=await Ae.createDownloadCollectionTask();ne($.id)}catch($){N(String($))}finally{O(!1)}},children:"下载收藏作品"}),c.jsx(we,{variant:"outline",disabled:E,onClick:async()=>{O(!0),N(null);try{const $=await Ae.createDownloadCollectionMusicTask();ne($.id)}catch($){N(String($))}finally{O(!1)}},children:"下载收藏音乐"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-3",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"收藏夹作品"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>void fe(),disabled:_||E,children:_?"加载中...":"加载列表"}),D.length>0?c.jsxs(c.Fragment,{children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedCollectIds:D.map($=>$.id)}),disabled:E,children:"全选"}),c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedCollectIds:[]}),disabled:E||h.selectedCollectIds.length===0,children:"清空"})]}):null]})]}),D.length>0?c.jsxs("div",{className:"space-y-3",children:[c.jsx(Ul,{className:"h-56 rounded-md border p-4",children:c.jsx("div",{className:"space-y-2",children:D.map($=>c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:`collect-${$.id}`,checked:h.selectedCollectIds.includes($.id),onCheckedChange:se=>{const U=se===!0?[...h.selectedCollectIds,$.id]:h.selectedCollectIds.filter(Q=>Q!==$.id);m({selectedCollectIds:U})}}),c.jsx(K,{htmlFor:`collect-${$.id}`,className:"text-sm font-normal",children:$.name})]},$.id))})}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{size:"sm",disabled:E||h.selectedCollectIds.length===0,onClick:async()=>{O(!0),N(null);try{const $=D.filter(U=>h.selectedCollectIds.includes(U.id)),se=await Ae.createDownloadCollectsTask({items:$});ne(se.id)}catch($){N(String($))}finally{O(!1)}},children:"下载选中收藏夹"})})]}):null]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-3",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"收藏合集作品"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>void ve(),disabled:T||E,children:T?"加载中...":"加载列表"}),H.length>0?c.jsxs(c.Fragment,{children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedMixCollectionIds:H.map($=>$.id)}),disabled:E,children:"全选"}),c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedMixCollectionIds:[]}),disabled:E||h.selectedMixCollectionIds.length===0,children:"清空"})]}):null]})]}),H.length>0?c.jsxs("div",{className:"space-y-3",children:[c.jsx(Ul,{className:"h-56 rounded-md border p-4",children:c.jsx("div",{className:"space-y-2",children:H.map($=>c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:`mix-collect-${$.id}`,checked:h.selectedMixCollectionIds.includes($.id),onCheckedChange:se=>{const U=se===!0?[...h.selectedMixCollectionIds,$.id]:h.selectedMixCollectionIds.filter(Q=>Q!==$.id);m({selectedMixCollectionIds:U})}}),c.jsx(K,{htmlFor:`mix-collect-${$.id}`,className:"text-sm font-normal",children:$.title})]},$.id))})}),c.jsxs("div",{className:"flex flex-wrap items-end justify-between gap-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{className:"text-sm",children:"标识"}),c.jsx(re,{value:h.mixCollectionMark,onChange:$=>m({mixCollectionMark:$.target.value}),placeholder:"可选",className:"w-64"})]}),c.jsx(we,{size:"sm",disabled:E||h.selectedMixCollectionIds.length===0,onClick:async()=>{O(!0),N(null);try{const $=H.filter(U=>h.selectedMixCollectionIds.includes(U.id)),se=await Ae.createDownloadMixCollectionTask({items:$,mark:h.mixCollectionMark.trim()?h.mixCollectionMark.trim():void 0});ne(se.id)}catch($){N(String($))}finally{O(!1)}},children:"下载选中合集"})]})]}):null]}),c.jsx("div",{className:"text-sm text-muted-foreground",children:"需要登录抖音 Cookie，且设置里的 `owner_url` 必须指向当前账号主页。"})]})]})})}),c.jsx(Dt,{value:"mix",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsx("div",{className:"grid gap-4 md:grid-cols-2",children:c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:h.mixMark,onChange:$=>m({mixMark:$.target.value}),placeholder:"可选"})]})}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"合集链接文本"}),c.jsx(St,{value:h.mixText,onChange:$=>m({mixText:$.target.value}),rows:8,placeholder:"粘贴多个合集链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:j||!h.mixText.trim(),onClick:async()=>{M(!0);try{const $=await Ae.createDownloadMixTask({platform:o,text:h.mixText,mark:h.mixMark});ne($.id)}finally{M(!1)}},children:"开始下载"})})]})})})]}):null,r?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"提示"})}),c.jsxs(Oe,{className:"space-y-2 text-sm text-muted-foreground",children:[c.jsx("div",{children:"部分功能需要配置 Cookie、代理、browser_info 等参数。"}),c.jsx("div",{children:"请在“设置”页面完整配置后再开始大批量任务。"})]})]}):null]})}const jf="__none__";function Ky(n){try{return JSON.stringify(n??{},null,2)}catch{return"{}"}}function ZR(){const[n,a]=v.useState(!0),[r,o]=v.useState(!1),[s,u]=v.useState(null),[f,h]=v.useState(null),[m,g]=v.useState({}),[y,x]=v.useState(!1),[S,j]=v.useState("{}"),[M,C]=v.useState(""),[N,E]=v.useState(null),O=v.useMemo(()=>String(m.cover||"")||jf,[m.cover]),_=async()=>{var H;a(!0),u(null);try{const Z=await Ae.getKuaishouSettings();h(Z),g(Z.settings||{}),x(!!Z.record),j(Ky((H=Z.settings)==null?void 0:H.mapping_data))}catch(Z){u(String(Z))}finally{a(!1)}};v.useEffect(()=>{_()},[]);const z=(H,Z)=>{g(ne=>({...ne,[H]:Z}))},D=async()=>{var H;o(!0),u(null);try{let Z;try{Z=JSON.parse(S||"{}")}catch{throw new Error("mapping_data 不是有效的 JSON")}const ne=await Ae.saveKuaishouSettings({data:{...m,mapping_data:Z},record:y});h(ne),g(ne.settings||{}),x(!!ne.record),j(Ky((H=ne.settings)==null?void 0:H.mapping_data)),rn.success("已保存")}catch(Z){u(String(Z))}finally{o(!1)}},k=async H=>{E(H),u(null);try{const Z=H==="clipboard"?await Ae.importKuaishouCookieFromClipboard():await Ae.importKuaishouCookieFromBrowser({});z("cookie",Z.cookie),rn.success("Cookie 已导入")}catch(Z){u(String(Z))}finally{E(null)}},T=async()=>{const H=M.trim();if(H)try{await Ae.deleteKuaishouRecords(H),rn.success("已删除下载记录")}catch(Z){u(String(Z))}},Y=async()=>{try{await Ae.clearKuaishouRecords(),rn.success("已清空下载记录")}catch(H){u(String(H))}};return n?c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"加载中..."})})}):c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsxs(yi,{defaultValue:"general",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"general",children:"通用"}),c.jsx(Mt,{value:"network",children:"Cookie / 代理"}),c.jsx(Mt,{value:"advanced",children:"高级"})]}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"outline",onClick:()=>void _(),disabled:r,children:"刷新"}),c.jsx(we,{onClick:()=>void D(),disabled:r,children:r?"保存中...":"保存"})]})]}),f?c.jsxs("div",{className:"text-xs text-muted-foreground",children:["下载记录：",y?"启用":"禁用"]}):null,s?c.jsx("div",{className:"text-sm text-destructive",children:s}):null,c.jsxs(Dt,{value:"general",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"命名与输出"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载根目录"}),c.jsx(re,{value:String(m.work_path||""),onChange:H=>z("work_path",H.target.value),placeholder:"留空则使用 Volume/Kuaishou"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载文件夹名"}),c.jsx(re,{value:String(m.folder_name||""),onChange:H=>z("folder_name",H.target.value),placeholder:"Download"})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件命名格式"}),c.jsx(re,{value:String(m.name_format||""),onChange:H=>z("name_format",H.target.value),placeholder:"发布日期 作者昵称 作品描述"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件名长度限制"}),c.jsx(re,{type:"number",value:Number(m.name_length??128),onChange:H=>z("name_length",Number(H.target.value))})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.folder_mode,onCheckedChange:H=>z("folder_mode",!!H)}),c.jsx(K,{children:"作品单独文件夹"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.author_archive,onCheckedChange:H=>z("author_archive",!!H)}),c.jsx(K,{children:"作者归档（别名+重命名）"})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载内容"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.data_record,onCheckedChange:H=>z("data_record",!!H)}),c.jsx(K,{children:"保存作品数据（DetailData.db）"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.music,onCheckedChange:H=>z("music",!!H)}),c.jsx(K,{children:"下载音乐"})]})]}),c.jsx("div",{className:"grid gap-4 md:grid-cols-2",children:c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"封面格式"}),c.jsxs(pi,{value:O,onValueChange:H=>z("cover",H===jf?"":H),children:[c.jsx(Jr,{children:c.jsx(gi,{placeholder:"选择格式"})}),c.jsxs(eo,{children:[c.jsx(vn,{value:jf,children:"不下载"}),c.jsx(vn,{value:"JPEG",children:"JPEG"}),c.jsx(vn,{value:"WEBP",children:"WEBP"})]})]})]})})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载策略"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大并发下载数"}),c.jsx(re,{type:"number",value:Number(m.max_workers??4),onChange:H=>z("max_workers",Number(H.target.value))})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分块大小（字节）"}),c.jsx(re,{type:"number",value:Number(m.chunk??2097152),onChange:H=>z("chunk",Number(H.target.value))})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"请求超时（秒）"}),c.jsx(re,{type:"number",value:Number(m.timeout??10),onChange:H=>z("timeout",Number(H.target.value))})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大重试次数"}),c.jsx(re,{type:"number",value:Number(m.max_retry??5),onChange:H=>z("max_retry",Number(H.target.value))})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载记录"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3 rounded-md border p-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"作品下载记录（跳过已下载）"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"对应 Volume/Kuaishou/Kuaishou.db"})]}),c.jsx(pt,{checked:y,onCheckedChange:H=>x(!!H)})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"清空全部下载记录"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"用于重新下载；不会删除本地文件。"})]}),c.jsx(we,{variant:"destructive",size:"sm",onClick:()=>void Y(),disabled:r,children:"清空"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"删除指定作品 ID"}),c.jsx(St,{value:M,onChange:H=>C(H.target.value),rows:2,placeholder:"粘贴作品 ID（可多个，空格/换行分隔）"}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",size:"sm",disabled:r||!M.trim(),onClick:()=>void T(),children:"删除"})})]})]})]})]}),c.jsxs(Dt,{value:"network",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"Cookie"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsx(St,{value:String(m.cookie||""),onChange:H=>z("cookie",H.target.value),rows:4}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{variant:"outline",size:"sm",disabled:!!N||r,onClick:()=>void k("clipboard"),children:N==="clipboard"?"导入中...":"从剪贴板导入"}),c.jsx(we,{variant:"outline",size:"sm",disabled:!!N||r,onClick:()=>void k("browser"),children:N==="browser"?"导入中...":"从浏览器导入"})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"代理"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"代理地址"}),c.jsx(re,{value:String(m.proxy||""),onChange:H=>z("proxy",H.target.value),placeholder:"http://127.0.0.1:7890"})]})]})]}),c.jsxs(Dt,{value:"advanced",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"请求参数"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(re,{value:String(m.user_agent||""),onChange:H=>z("user_agent",H.target.value)})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"作者别名映射"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"mapping_data（JSON）"}),c.jsx(St,{value:S,onChange:H=>j(H.target.value),rows:8}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"保存时会校验 JSON 格式；仅在开启“作者归档”时生效。"})]})]})]})]})})}const Bh=v.forwardRef(({className:n,...a},r)=>c.jsx("div",{className:"relative w-full overflow-auto",children:c.jsx("table",{ref:r,className:ce("w-full caption-bottom text-sm",n),...a})}));Bh.displayName="Table";const Uh=v.forwardRef(({className:n,...a},r)=>c.jsx("thead",{ref:r,className:ce("[&_tr]:border-b",n),...a}));Uh.displayName="TableHeader";const Hh=v.forwardRef(({className:n,...a},r)=>c.jsx("tbody",{ref:r,className:ce("[&_tr:last-child]:border-0",n),...a}));Hh.displayName="TableBody";const IR=v.forwardRef(({className:n,...a},r)=>c.jsx("tfoot",{ref:r,className:ce("border-t bg-muted/50 font-medium [&>tr]:last:border-b-0",n),...a}));IR.displayName="TableFooter";const Bl=v.forwardRef(({className:n,...a},r)=>c.jsx("tr",{ref:r,className:ce("border-b transition-colors hover:bg-muted/50 data-[state=selected]:bg-muted",n),...a}));Bl.displayName="TableRow";const Dn=v.forwardRef(({className:n,...a},r)=>c.jsx("th",{ref:r,className:ce("h-10 px-2 text-left align-middle font-medium text-muted-foreground [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...a}));Dn.displayName="TableHead";const ln=v.forwardRef(({className:n,...a},r)=>c.jsx("td",{ref:r,className:ce("p-2 align-middle [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...a}));ln.displayName="TableCell";const JR=v.forwardRef(({className:n,...a},r)=>c.jsx("caption",{ref:r,className:ce("mt-4 text-sm text-muted-foreground",n),...a}));JR.displayName="TableCaption";const Nf="__none__";function Zs(n){return typeof n=="string"?n:!n||typeof n!="object"?"":Object.entries(n).map(([a,r])=>`${a}=${r}`).join("; ")}function eA(){return{enable:!0,mark:"",url:"",tab:"post",earliest:"",latest:""}}function tA(){return{enable:!0,mark:"",url:""}}function nA(){return{"User-Agent":"",pc_libra_divert:"",browser_language:"",browser_platform:"",browser_name:"",browser_version:"",engine_name:"",engine_version:"",os_name:"",os_version:"",webid:""}}function aA(){return{"User-Agent":"",app_language:"",browser_language:"",browser_name:"",browser_platform:"",browser_version:"",language:"",os:"",priority_region:"",region:"",tz_name:"",webcast_language:"",device_id:""}}function Zy(n){const a=n.value??[],r=(u,f)=>{n.onChange(a.map((h,m)=>m===u?{...h,...f}:h))},o=u=>n.onChange(a.filter((f,h)=>h!==u)),s=()=>n.onChange([...a,eA()]);return c.jsxs("div",{className:"space-y-3",children:[c.jsxs(Bh,{children:[c.jsx(Uh,{children:c.jsxs(Bl,{children:[c.jsx(Dn,{className:"w-16",children:"启用"}),c.jsx(Dn,{className:"w-28",children:"类型"}),c.jsx(Dn,{className:"w-32",children:"最早"}),c.jsx(Dn,{className:"w-32",children:"最晚"}),c.jsx(Dn,{className:"w-40",children:"标识"}),c.jsx(Dn,{children:"账号链接"}),c.jsx(Dn,{className:"w-20",children:"操作"})]})}),c.jsxs(Hh,{children:[a.map((u,f)=>c.jsxs(Bl,{children:[c.jsx(ln,{children:c.jsx(pt,{checked:u.enable,onCheckedChange:h=>r(f,{enable:!!h})})}),c.jsx(ln,{children:c.jsxs(pi,{value:u.tab,onValueChange:h=>r(f,{tab:h}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"post",children:"发布"}),c.jsx(vn,{value:"favorite",children:"喜欢"})]})]})}),c.jsx(ln,{children:c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:String(u.earliest??""),onChange:h=>r(f,{earliest:h.target.value}),placeholder:"YYYY/MM/DD 或 天数"}),c.jsx(hc,{onSelect:h=>r(f,{earliest:h})})]})}),c.jsx(ln,{children:c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:String(u.latest??""),onChange:h=>r(f,{latest:h.target.value}),placeholder:"YYYY/MM/DD 或 天数"}),c.jsx(hc,{onSelect:h=>r(f,{latest:h})})]})}),c.jsx(ln,{children:c.jsx(re,{value:u.mark,onChange:h=>r(f,{mark:h.target.value})})}),c.jsx(ln,{children:c.jsx(re,{value:u.url,onChange:h=>r(f,{url:h.target.value})})}),c.jsx(ln,{children:c.jsx(we,{variant:"outline",size:"sm",onClick:()=>o(f),children:"删除"})})]},`${f}-${u.url}`)),a.length===0?c.jsx(Bl,{children:c.jsx(ln,{colSpan:7,className:"text-sm text-muted-foreground",children:"暂无数据"})}):null]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",onClick:s,children:"添加账号"})})]})}function Iy(n){const a=n.value??[],r=(u,f)=>{n.onChange(a.map((h,m)=>m===u?{...h,...f}:h))},o=u=>n.onChange(a.filter((f,h)=>h!==u)),s=()=>n.onChange([...a,tA()]);return c.jsxs("div",{className:"space-y-3",children:[c.jsxs(Bh,{children:[c.jsx(Uh,{children:c.jsxs(Bl,{children:[c.jsx(Dn,{className:"w-16",children:"启用"}),c.jsx(Dn,{className:"w-40",children:"标识"}),c.jsx(Dn,{children:"合集链接"}),c.jsx(Dn,{className:"w-20",children:"操作"})]})}),c.jsxs(Hh,{children:[a.map((u,f)=>c.jsxs(Bl,{children:[c.jsx(ln,{children:c.jsx(pt,{checked:u.enable,onCheckedChange:h=>r(f,{enable:!!h})})}),c.jsx(ln,{children:c.jsx(re,{value:u.mark,onChange:h=>r(f,{mark:h.target.value})})}),c.jsx(ln,{children:c.jsx(re,{value:u.url,onChange:h=>r(f,{url:h.target.value})})}),c.jsx(ln,{children:c.jsx(we,{variant:"outline",size:"sm",onClick:()=>o(f),children:"删除"})})]},`${f}-${u.url}`)),a.length===0?c.jsx(Bl,{children:c.jsx(ln,{colSpan:4,className:"text-sm text-muted-foreground",children:"暂无数据"})}):null]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",onClick:s,children:"添加合集"})})]})}function lA(n){const a=n.value,r=(o,s)=>n.onChange({...a,[o]:s});return c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(St,{value:a["User-Agent"],onChange:o=>r("User-Agent",o.target.value),rows:3})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"平台"}),c.jsx(re,{value:a.pc_libra_divert,onChange:o=>r("pc_libra_divert",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"语言"}),c.jsx(re,{value:a.browser_language,onChange:o=>r("browser_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器平台"}),c.jsx(re,{value:a.browser_platform,onChange:o=>r("browser_platform",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器名称"}),c.jsx(re,{value:a.browser_name,onChange:o=>r("browser_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器版本"}),c.jsx(re,{value:a.browser_version,onChange:o=>r("browser_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"引擎名称"}),c.jsx(re,{value:a.engine_name,onChange:o=>r("engine_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"引擎版本"}),c.jsx(re,{value:a.engine_version,onChange:o=>r("engine_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统名称"}),c.jsx(re,{value:a.os_name,onChange:o=>r("os_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统版本"}),c.jsx(re,{value:a.os_version,onChange:o=>r("os_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"WebID（webid，可选）"}),c.jsx(re,{value:a.webid,onChange:o=>r("webid",o.target.value)})]})]})}function rA(n){const a=n.value,r=(o,s)=>n.onChange({...a,[o]:s});return c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(St,{value:a["User-Agent"],onChange:o=>r("User-Agent",o.target.value),rows:3})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"应用语言（app_language）"}),c.jsx(re,{value:a.app_language,onChange:o=>r("app_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器语言（browser_language）"}),c.jsx(re,{value:a.browser_language,onChange:o=>r("browser_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器名称（browser_name）"}),c.jsx(re,{value:a.browser_name,onChange:o=>r("browser_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器平台（browser_platform）"}),c.jsx(re,{value:a.browser_platform,onChange:o=>r("browser_platform",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器版本（browser_version）"}),c.jsx(re,{value:a.browser_version,onChange:o=>r("browser_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"语言（language）"}),c.jsx(re,{value:a.language,onChange:o=>r("language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统（os）"}),c.jsx(re,{value:a.os,onChange:o=>r("os",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"优先地区（priority_region）"}),c.jsx(re,{value:a.priority_region,onChange:o=>r("priority_region",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"地区（region）"}),c.jsx(re,{value:a.region,onChange:o=>r("region",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"时区（tz_name）"}),c.jsx(re,{value:a.tz_name,onChange:o=>r("tz_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播语言（webcast_language）"}),c.jsx(re,{value:a.webcast_language,onChange:o=>r("webcast_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"设备 ID（device_id）"}),c.jsx(re,{value:a.device_id,onChange:o=>r("device_id",o.target.value)})]})]})}function oA(){const{platform:n}=hi(),a=n==="tiktok",r=n==="douyin"||n==="tiktok",[o,s]=v.useState(null),[u,f]=v.useState(null),[h,m]=v.useState(""),[g,y]=v.useState(""),[x,S]=v.useState(null),[j,M]=v.useState(null),[C,N]=v.useState(!1),[E,O]=v.useState(!1),[_,z]=v.useState(null),[D,k]=v.useState(null),[T,Y]=v.useState(""),[H,Z]=v.useState(!1),[ne,fe]=v.useState(null),[ve,$]=v.useState(!1),[se,U]=v.useState(!1),[Q,q]=v.useState(!1),[ie,ue]=v.useState(!1),A=v.useMemo(()=>[{value:Nf,label:"不保存数据"},{value:"csv",label:"CSV"},{value:"xlsx",label:"Excel (XLSX)"},{value:"sql",label:"SQLite (sql)"}],[]);v.useEffect(()=>{if(!r)return;let G=!0;return(async()=>{try{const[qe,ut,Rt]=await Promise.all([Ae.getSettings(),Ae.getUIConfig(),Ae.getClipboardMonitorStatus()]);if(!G)return;s(qe),f(ut),m(Zs(qe.cookie)),y(Zs(qe.cookie_tiktok)),q(!!Rt.running)}catch(qe){if(!G)return;k(String(qe))}})(),()=>{G=!1}},[r]);const P=G=>{o&&s({...o,...G})},te=!!o&&!!u&&!E,le=async()=>{if(!(!o||!u)){O(!0),z(null),k(null);try{await Ae.updateUIConfig({record:u.record,logger:u.logger});const G=ut=>{if(typeof ut=="number")return ut;const Rt=typeof ut=="string"?ut.trim():String(ut??"").trim();if(!Rt)return"";if(/^\d+(?:\.\d+)?$/.test(Rt)){const on=Number(Rt);return Number.isFinite(on)?on:Rt}return Rt},Qe=ut=>({...ut,earliest:G(ut.earliest),latest:G(ut.latest)}),qe=await Ae.saveSettings({...o,accounts_urls:(o.accounts_urls??[]).map(Qe),accounts_urls_tiktok:(o.accounts_urls_tiktok??[]).map(Qe),cookie:h,cookie_tiktok:g});s(qe),m(Zs(qe.cookie)),y(Zs(qe.cookie_tiktok)),z("已保存")}catch(G){k(String(G))}finally{O(!1)}}};if(n==="kuaishou")return c.jsx(ZR,{});if(!r)return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})});if(!o||!u)return D?c.jsx("div",{className:"text-sm text-destructive",children:D}):c.jsx("div",{className:"text-sm text-muted-foreground",children:"加载中..."});const he=async(G,Qe)=>{S(`${G}.${Qe}`),z(null),k(null);try{if(Qe==="clipboard"){const Rt=await Ae.importCookieFromClipboard(G);G==="douyin"?m(Rt.cookie):y(Rt.cookie),z(`已从剪贴板导入并写入${G==="douyin"?"抖音":"TikTok"} Cookie${Rt.logged_in?"（已检测到登录）":"（未检测到登录）"}`);return}const qe=await Ae.importCookieFromBrowser({platform:G});G==="douyin"?m(qe.cookie):y(qe.cookie);const ut=qe.browser?`（${qe.browser}）`:"";z(`已从浏览器${ut}导入并写入${G==="douyin"?"抖音":"TikTok"} Cookie${qe.logged_in?"（已检测到登录）":"（未检测到登录）"}`)}catch{}finally{S(null)}},Se=async()=>{if(j){M(null);return}N(!0),k(null);try{const G=await Ae.listCookieBrowsers();M(G)}catch(G){k(String(G))}finally{N(!1)}},ae=async G=>{const Qe=G.trim();if(Qe&&window.confirm("确认要删除下载记录吗？此操作不可撤销。")){Z(!0),z(null),k(null);try{await Ae.deleteDownloadRecords(Qe),z(Qe.toUpperCase()==="ALL"?"已清空下载记录":"已删除下载记录"),Qe.toUpperCase()!=="ALL"&&Y("")}catch(qe){k(String(qe))}finally{Z(!1)}}},Ne=async()=>{$(!0),k(null);try{const G=await Ae.checkUpdate();fe(G)}catch(G){k(String(G))}finally{$(!1)}},Ee=async()=>{var G;if(ne!=null&&ne.update_available&&window.confirm("确定要自动下载并更新吗？更新过程中程序将自动重启。")){U(!0),z(null),k(null);try{await Ae.applyUpdate(),rn.success("正在更新，请稍候…");const Qe=window.pywebview;(G=Qe==null?void 0:Qe.api)!=null&&G.close?setTimeout(()=>{var qe,ut;return(ut=(qe=Qe.api)==null?void 0:qe.close)==null?void 0:ut.call(qe)},1500):(rn.info("未检测到桌面环境，请前往发布页手动下载更新。"),U(!1))}catch(Qe){k(String(Qe)),U(!1)}}},ke=async G=>{if(ie)return;const Qe=Q;q(G),ue(!0),z(null),k(null);try{const qe=G?await Ae.startClipboardMonitor():await Ae.stopClipboardMonitor();q(!!qe.running),rn.success(G?"已开启剪贴板监听下载":"已关闭剪贴板监听下载")}catch{q(Qe)}finally{ue(!1)}},je=o.owner_url&&typeof o.owner_url=="object"?o.owner_url:{mark:"",url:"",uid:"",sec_uid:"",nickname:""},ze=o.browser_info&&typeof o.browser_info=="object"?o.browser_info:nA(),Ct=o.browser_info_tiktok&&typeof o.browser_info_tiktok=="object"?o.browser_info_tiktok:aA();return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsxs(yi,{defaultValue:"general",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"general",children:"通用"}),c.jsx(Mt,{value:"accounts",children:"账号"}),c.jsx(Mt,{value:"mix",children:"合集"}),c.jsx(Mt,{value:"network",children:"Cookie / 代理"}),c.jsx(Mt,{value:"advanced",children:"高级"})]}),c.jsx(we,{onClick:le,disabled:!te,children:E?"保存中...":"保存"})]}),_?c.jsx("div",{className:"text-sm text-muted-foreground",children:_}):null,D?c.jsx("div",{className:"text-sm text-destructive",children:D}):null,c.jsxs(Dt,{value:"general",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"程序"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:u.record,onCheckedChange:G=>f({...u,record:!!G})}),c.jsx(K,{children:"作品下载记录（跳过已下载）"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:u.logger,onCheckedChange:G=>f({...u,logger:!!G})}),c.jsx(K,{children:"运行日志记录"})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:a?"TikTok 平台目录":"抖音平台目录"}),c.jsx(re,{value:a?o.root_tiktok??"":o.root_douyin??"",onChange:G=>P(a?{root_tiktok:G.target.value}:{root_douyin:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载文件夹名"}),c.jsx(re,{value:o.folder_name??"",onChange:G=>P({folder_name:G.target.value})})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.folder_mode,onCheckedChange:G=>P({folder_mode:!!G})}),c.jsx(K,{children:"按作品类型分文件夹"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.music,onCheckedChange:G=>P({music:!!G})}),c.jsx(K,{children:"仅下载音乐（如适用）"})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"存储格式（采集数据）"}),c.jsxs(pi,{value:o.storage_format||Nf,onValueChange:G=>P({storage_format:G===Nf?"":G}),children:[c.jsx(Jr,{children:c.jsx(gi,{placeholder:"选择格式"})}),c.jsx(eo,{children:A.map(G=>c.jsx(vn,{value:G.value,children:G.label},G.value))})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播画质偏好"}),c.jsx(re,{value:o.live_qualities??"",onChange:G=>P({live_qualities:G.target.value}),placeholder:"如：origin 或 1"})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"命名与输出"})}),c.jsx(Oe,{className:"space-y-6",children:c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"命名格式"}),c.jsx(re,{value:o.name_format??"",onChange:G=>P({name_format:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"描述长度"}),c.jsx(re,{type:"number",value:o.desc_length,onChange:G=>P({desc_length:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件名长度"}),c.jsx(re,{type:"number",value:o.name_length,onChange:G=>P({name_length:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"日期格式"}),c.jsx(re,{value:o.date_format??"",onChange:G=>P({date_format:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分隔符"}),c.jsx(re,{value:o.split??"",onChange:G=>P({split:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"清理长度"}),c.jsx(re,{type:"number",value:o.truncate,onChange:G=>P({truncate:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-6",children:[c.jsx(pt,{checked:o.dynamic_cover,onCheckedChange:G=>P({dynamic_cover:!!G})}),c.jsx(K,{children:"下载动态图封面"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-6",children:[c.jsx(pt,{checked:o.static_cover,onCheckedChange:G=>P({static_cover:!!G})}),c.jsx(K,{children:"下载静态封面"})]})]})})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载策略"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{checked:o.download,onCheckedChange:G=>P({download:!!G})}),c.jsx(K,{children:"允许下载（关闭后仅采集不下载）"})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"单文件最大大小"}),c.jsx(re,{type:"number",value:o.max_size,onChange:G=>P({max_size:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分片大小（字节）"}),c.jsx(re,{type:"number",value:o.chunk,onChange:G=>P({chunk:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"超时（秒）"}),c.jsx(re,{type:"number",value:o.timeout,onChange:G=>P({timeout:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大重试次数"}),c.jsx(re,{type:"number",value:o.max_retry,onChange:G=>P({max_retry:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大页数"}),c.jsx(re,{type:"number",value:o.max_pages,onChange:G=>P({max_pages:Number(G.target.value||0)})})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载记录"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"清空全部下载记录"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"用于重新下载；不会删除本地文件。"})]}),c.jsx(we,{variant:"destructive",size:"sm",disabled:H||E,onClick:()=>void ae("ALL"),children:"清空"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"删除指定作品 ID"}),c.jsx(St,{value:T,onChange:G=>Y(G.target.value),rows:2,placeholder:"粘贴作品 ID（可多个，空格/换行分隔）"}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",size:"sm",disabled:H||E||!T.trim(),onClick:()=>void ae(T),children:"删除"})})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"检查更新"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"软件版本"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"从发布页获取最新版本信息。"})]}),c.jsx(we,{variant:"outline",disabled:ve||se||E,onClick:()=>void Ne(),children:ve?"检查中...":"检查更新"})]}),ne?c.jsxs("div",{className:"space-y-2 rounded-md border bg-card/60 p-4 text-sm",children:[c.jsxs("div",{className:"grid gap-2 md:grid-cols-2",children:[c.jsxs("div",{children:["当前版本：",ne.current_version]}),c.jsxs("div",{children:["最新版本：",ne.latest_version]})]}),c.jsx("div",{className:ne.update_available?"text-primary font-medium":"text-muted-foreground",children:ne.update_available?"发现新版本":"已是最新版本"}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(we,{size:"sm",variant:"ghost",disabled:!ne.releases_url,onClick:()=>window.open(ne.releases_url,"_blank"),children:"打开发布页"}),ne.update_available?c.jsx(we,{size:"sm",disabled:se||E,onClick:()=>void Ee(),children:se?"更新中...":"下载并更新"}):null]}),ne.release_notes?c.jsxs("details",{className:"pt-2",children:[c.jsx("summary",{className:"cursor-pointer select-none text-xs text-muted-foreground hover:text-foreground",children:"查看更新内容"}),c.jsx("div",{className:"mt-2 max-h-60 overflow-auto rounded-md border bg-muted/50 p-3",children:c.jsx("pre",{className:"whitespace-pre-wrap text-xs leading-relaxed",children:ne.release_notes})})]}):null]}):null]})]})]}),c.jsxs(Dt,{value:"accounts",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"平台开关"})}),c.jsx(Oe,{className:"grid gap-4 md:grid-cols-2",children:a?c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.tiktok_platform,onCheckedChange:G=>P({tiktok_platform:!!G})}),c.jsx(K,{children:"启用 TikTok"})]}):c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.douyin_platform,onCheckedChange:G=>P({douyin_platform:!!G})}),c.jsx(K,{children:"启用抖音"})]})})]}),a?null:c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"当前账号（用于“收藏”下载）"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"主页链接"}),c.jsx(re,{value:je.url??"",onChange:G=>P({owner_url:{...je,url:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:je.mark??"",onChange:G=>P({owner_url:{...je,mark:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"uid"}),c.jsx(re,{value:je.uid??"",onChange:G=>P({owner_url:{...je,uid:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"sec_uid"}),c.jsx(re,{value:je.sec_uid??"",onChange:G=>P({owner_url:{...je,sec_uid:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"昵称"}),c.jsx(re,{value:je.nickname??"",onChange:G=>P({owner_url:{...je,nickname:G.target.value}})})]})]})]}),a?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"账号列表"})}),c.jsx(Oe,{children:c.jsx(Zy,{value:o.accounts_urls_tiktok,onChange:G=>P({accounts_urls_tiktok:G})})})]}):c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"账号列表"})}),c.jsx(Oe,{children:c.jsx(Zy,{value:o.accounts_urls,onChange:G=>P({accounts_urls:G})})})]})]}),c.jsx(Dt,{value:"mix",className:"mt-6 space-y-6",children:a?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"合集列表"})}),c.jsx(Oe,{children:c.jsx(Iy,{value:o.mix_urls_tiktok,onChange:G=>P({mix_urls_tiktok:G})})})]}):c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"合集列表"})}),c.jsx(Oe,{children:c.jsx(Iy,{value:o.mix_urls,onChange:G=>P({mix_urls:G})})})]})}),c.jsxs(Dt,{value:"network",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"Cookie"})}),c.jsxs(Oe,{className:"space-y-6",children:[a?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"TikTok Cookie"}),c.jsx(St,{value:g,onChange:G=>y(G.target.value),rows:6,placeholder:"粘贴 Cookie 字符串"}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("tiktok","clipboard"),children:"从剪贴板导入"}),c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("tiktok","browser"),children:"从浏览器导入"})]})]}):c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"抖音 Cookie"}),c.jsx(St,{value:h,onChange:G=>m(G.target.value),rows:6,placeholder:"粘贴 Cookie 字符串"}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("douyin","clipboard"),children:"从剪贴板导入"}),c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("douyin","browser"),children:"从浏览器导入"})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-xs text-muted-foreground",children:"Windows 读取 Chromium/Chrome/Edge Cookie 可能需要以管理员身份运行程序。"}),c.jsx(we,{type:"button",variant:"ghost",size:"sm",disabled:C||E,onClick:()=>void Se(),children:C?"加载中...":j?"收起支持的浏览器":"查看支持的浏览器"})]}),j?c.jsx("div",{className:"text-xs text-muted-foreground",children:j.map(G=>G.name).join(" / ")}):null]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"代理"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[a?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"TikTok 代理"}),c.jsx(re,{value:o.proxy_tiktok??"",onChange:G=>P({proxy_tiktok:G.target.value}),placeholder:"socks5://127.0.0.1:7890"})]}):c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"抖音代理"}),c.jsx(re,{value:o.proxy??"",onChange:G=>P({proxy:G.target.value}),placeholder:"http://127.0.0.1:7890"})]}),a?c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"TikTok ttwid（twc_tiktok，可选）"}),c.jsx(re,{value:o.twc_tiktok??"",onChange:G=>P({twc_tiktok:G.target.value})})]}):null]})]})]}),c.jsxs(Dt,{value:"advanced",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"运行与工具"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-start gap-3 rounded-md border p-4 md:col-span-2",children:[c.jsx(pt,{id:"clipboard-monitor",checked:Q,disabled:ie||E,onCheckedChange:G=>void ke(!!G)}),c.jsxs("div",{className:"space-y-1",children:[c.jsx(K,{htmlFor:"clipboard-monitor",children:"剪贴板监听下载"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:ie?"处理中...":Q?"运行中：自动识别剪贴板链接并下载":"未运行：勾选以开启后台监听"})]})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"自动选择序列（run_command）"}),c.jsx(re,{value:o.run_command??"",onChange:G=>P({run_command:G.target.value})})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"ffmpeg 路径"}),c.jsx(re,{value:o.ffmpeg??"",onChange:G=>P({ffmpeg:G.target.value})})]}),a?c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"TikTok 主页参数（owner_url_tiktok，保留）"}),c.jsx(re,{value:o.owner_url_tiktok?"已设置":"null",disabled:!0})]}):null]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"浏览器参数"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"仅在需要时修改，错误参数可能导致请求失败。"}),a?c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"TikTok 浏览器参数"}),c.jsx("div",{className:"pt-4",children:c.jsx(rA,{value:Ct,onChange:G=>P({browser_info_tiktok:G})})})]}):c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"抖音浏览器参数"}),c.jsx("div",{className:"pt-4",children:c.jsx(lA,{value:ze,onChange:G=>P({browser_info:G})})})]})]})]})]})]})})}const iA=nh("inline-flex items-center rounded-md border px-2.5 py-0.5 text-xs font-semibold transition-colors focus:outline-none focus:ring-2 focus:ring-ring focus:ring-offset-2",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground shadow hover:bg-primary/80",secondary:"border-transparent bg-secondary text-secondary-foreground hover:bg-secondary/80",destructive:"border-transparent bg-destructive text-destructive-foreground shadow hover:bg-destructive/80",outline:"text-foreground"}},defaultVariants:{variant:"default"}});function Ef({className:n,variant:a,...r}){return c.jsx("div",{className:ce(iA({variant:a}),n),...r})}function Tf(n){if(!Number.isFinite(n)||n<=0)return"0 B";const a=["B","KB","MB","GB","TB"],r=Math.min(Math.floor(Math.log(n)/Math.log(1024)),a.length-1),o=n/1024**r;return`${o.toFixed(o>=10||r===0?0:1)} ${a[r]}`}function _f(n){return n?new Date(n*1e3).toLocaleTimeString():""}function Jy(n){return n==="running"?"default":n==="success"?"secondary":n==="error"?"destructive":"outline"}const sA={queued:"排队中",running:"进行中",success:"已完成",error:"失败",cancelled:"已取消"},cA={"download.detail":"下载作品","download.account":"批量下载账号作品","download.mix":"批量下载合集作品","download.collection":"批量下载收藏作品","download.collects":"批量下载收藏夹作品","download.collection_music":"批量下载收藏音乐","download.mix_collection":"批量下载收藏合集作品","download.tiktok_original":"批量下载视频原画","download.kuaishou.detail":"下载快手作品","collect.live":"获取直播拉流地址","collect.comment":"采集作品评论数据","collect.user":"采集账号详细数据","collect.hot":"采集抖音热榜数据","collect.search":"采集搜索结果数据"};function ex(n){return sA[n]||n}function uA(n){return cA[n]||n}function dA(){const[n]=Yj(),a=n.get("task"),{platform:r}=hi(),o=r==="douyin"||r==="tiktok"||r==="kuaishou",s=r,u=D=>{const k=String(D.meta.platform??"");if(k)return k===s;const T=String(D.title||""),Y=T.toLowerCase();if(s==="kuaishou")return Y.includes("快手")||Y.includes("kuaishou");const H=Y.includes("tiktok")?"tiktok":T.includes("抖音")?"douyin":null;return!H||H===(s==="tiktok"?"tiktok":"douyin")},[f,h]=v.useState([]),[m,g]=v.useState(a),[y,x]=v.useState([]),[S,j]=v.useState({}),[M,C]=v.useState(null),N=v.useRef(null),E=v.useMemo(()=>f.find(D=>D.id===m)??null,[f,m]),O=()=>{if(!E)return;const D={exported_at:new Date().toISOString(),task:E,progress:S,events:y},k=new Blob([JSON.stringify(D,null,2)],{type:"application/json"}),T=URL.createObjectURL(k),Y=document.createElement("a");Y.href=T,Y.download=`task_${E.id}.json`,Y.click(),URL.revokeObjectURL(T)},_=async()=>{if(m)try{await Ae.openTaskFolder(m)}catch(D){C(String(D))}},z=async()=>{const D=await Ae.listTasks();h(D),!m&&D.length>0&&g(D[0].id)};return v.useEffect(()=>{if(!o){N.current&&(N.current.close(),N.current=null),x([]),j({}),C(null),g(null),h([]);return}let D=!0;const k=async()=>{var Y;try{const H=await Ae.listTasks();if(!D)return;const Z=H.filter(u);if(h(Z),!m&&Z.length>0){g(Z[0].id);return}m&&!Z.some(ne=>ne.id===m)&&g(((Y=Z[0])==null?void 0:Y.id)??null)}catch(H){if(!D)return;C(String(H))}};k();const T=setInterval(()=>void k(),2e3);return()=>{D=!1,clearInterval(T)}},[m,s,o]),v.useEffect(()=>{if(!o||(N.current&&(N.current.close(),N.current=null),x([]),j({}),C(null),!m))return;const D=new EventSource(`/ui-api/tasks/${encodeURIComponent(m)}/events`);return N.current=D,D.onmessage=k=>{try{const T=JSON.parse(k.data),Y=String(T.type||"");if(Y==="progress.add"||Y==="progress.update"){const H=String(T.task_id??"");if(!H)return;j(Z=>{var ne;return{...Z,[H]:{description:String(T.description||""),total:T.total===null||T.total===void 0?null:Number(T.total),completed:Number(T.completed||0),finished:(ne=Z[H])==null?void 0:ne.finished}}});return}if(Y==="progress.remove"){const H=String(T.task_id??"");if(!H)return;j(Z=>Z[H]?{...Z,[H]:{...Z[H],finished:!0}}:Z);return}x(H=>[...H.slice(-999),T])}catch(T){C(String(T)),rn.error("Error parsing task event: "+String(T))}},D.onerror=()=>{const k="EventSource disconnected";C(k),rn.error(k)},()=>{D.close()}},[m,o]),c.jsx("div",{className:"mx-auto w-full max-w-6xl",children:o?c.jsxs("div",{className:"grid gap-6 md:grid-cols-3",children:[c.jsxs(_e,{className:"md:col-span-1",children:[c.jsx(Je,{className:"py-4",children:c.jsx(et,{className:"text-base",children:"任务列表"})}),c.jsx(Oe,{className:"p-0",children:c.jsx(Ul,{className:"h-[calc(100vh-12rem)]",children:c.jsxs("div",{className:"flex flex-col",children:[f.map(D=>c.jsxs("button",{type:"button",className:`flex w-full flex-col gap-2 border-b px-4 py-3 text-left transition-colors hover:bg-muted/50 ${m===D.id?"bg-muted/60":""}`,onClick:()=>g(D.id),children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx("div",{className:"truncate text-sm font-medium",children:D.title}),c.jsx(Ef,{variant:Jy(D.status),className:"shrink-0",title:D.status,children:ex(D.status)})]}),c.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs text-muted-foreground",children:[c.jsx("div",{className:"truncate font-mono",children:D.id}),c.jsx("div",{className:"shrink-0",children:_f(D.created_at)})]})]},D.id)),f.length===0&&c.jsx("div",{className:"p-4 text-sm text-muted-foreground",children:"暂无任务"})]})})})]}),c.jsxs(_e,{className:"md:col-span-2",children:[c.jsx(Je,{className:"py-4",children:c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx(et,{className:"text-base",children:"任务详情"}),c.jsxs("div",{className:"flex items-center gap-2",children:[E!=null&&E.type.startsWith("download.")?c.jsx(we,{variant:"outline",size:"sm",onClick:()=>void _(),children:"打开文件夹"}):null,c.jsx(we,{variant:"outline",size:"sm",onClick:O,disabled:!E||y.length===0,children:"导出日志"}),c.jsx(we,{variant:"outline",size:"sm",onClick:()=>{z()},children:"刷新"})]})]})}),c.jsxs(Oe,{className:"space-y-4",children:[E?c.jsxs("div",{className:"space-y-1 text-sm",children:[c.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[c.jsx(Ef,{variant:"outline",title:E.type,children:uA(E.type)}),c.jsx(Ef,{variant:Jy(E.status),title:E.status,children:ex(E.status)})]}),c.jsxs("div",{className:"text-muted-foreground",children:["开始: ",_f(E.started_at)," ",E.finished_at?`结束: ${_f(E.finished_at)}`:""]}),E.error?c.jsx("div",{className:"text-destructive",children:E.error}):null]}):c.jsx("div",{className:"text-sm text-muted-foreground",children:"请选择一个任务"}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"下载进度"}),c.jsxs("div",{className:"space-y-2",children:[Object.entries(S).slice(0,200).map(([D,k])=>{const T=k.total&&k.total>0?Math.min(100,Math.floor(k.completed/k.total*100)):0;return c.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs",children:[c.jsx("div",{className:"min-w-0 flex-1 truncate",children:k.description||`#${D}`}),c.jsx("div",{className:"shrink-0 font-mono text-muted-foreground",children:k.total?`${Tf(k.completed)} / ${Tf(k.total)}`:`${Tf(k.completed)}`}),c.jsx("div",{className:"w-12 shrink-0 text-right font-mono",children:k.finished?"已完成":k.total?`${T}%`:""})]},D)}),Object.keys(S).length===0?c.jsx("div",{className:"text-sm text-muted-foreground",children:"暂无下载进度"}):null]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx("div",{className:"text-sm font-medium",children:"事件日志"}),M?c.jsx("div",{className:"text-xs text-destructive",children:M}):null]}),c.jsx(Ul,{className:"h-[22rem] rounded-md border bg-muted/10 p-3",children:c.jsxs("div",{className:"space-y-1 font-mono text-xs",children:[y.map((D,k)=>c.jsx("div",{className:"break-words",children:JSON.stringify(D)},k)),y.length===0?c.jsx("div",{className:"text-muted-foreground",children:"暂无日志"}):null]})})]})]})]})]}):c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})})}function fA(){const[n,a]=v.useState(null),[r,o]=v.useState(null),[s,u]=v.useState(!1),[f,h]=v.useState(null),[m,g]=v.useState(!1),[y,x]=v.useState(!1);v.useEffect(()=>{let C=!0;return(async()=>{try{const O=await Ae.getAppInfo();if(!C)return;a(O)}catch(O){if(!C)return;o(String(O))}})(),window.pywebview&&Ae.checkUpdate().then(O=>{if(!C||!O.update_available)return;const _=O.latest_tag||O.latest_version;localStorage.getItem("dismissed_update")!==_&&(h(O),g(!0))}).catch(()=>{}),()=>{C=!1}},[]);const S=!!n&&!(n!=null&&n.disclaimer_accepted),j=()=>{f&&localStorage.setItem("dismissed_update",f.latest_tag||f.latest_version),g(!1)},M=async()=>{var C;x(!0);try{await Ae.applyUpdate(),rn.success("正在更新，请稍候…");const N=window.pywebview;(C=N==null?void 0:N.api)!=null&&C.close&&setTimeout(()=>{var E,O;return(O=(E=N.api)==null?void 0:E.close)==null?void 0:O.call(E)},1500)}catch(N){rn.error(`更新失败：${String(N)}`),x(!1)}};return c.jsx(UE,{children:c.jsxs("div",{className:"flex h-screen w-full flex-col overflow-hidden bg-background text-foreground",children:[c.jsx(YE,{}),c.jsxs("div",{className:"flex flex-1 overflow-hidden",children:[c.jsx(HE,{}),c.jsxs("div",{className:"flex min-w-0 flex-1 flex-col overflow-hidden bg-muted/10",children:[c.jsx(BE,{}),c.jsx("main",{className:"app-scroll flex-1 overflow-auto px-6 pb-6 pt-4 lg:px-8 lg:pb-8",children:c.jsx(GN,{children:c.jsxs(dj,{children:[c.jsx(Rr,{path:"/",element:c.jsx(cj,{to:"/download",replace:!0})}),c.jsx(Rr,{path:"/download",element:c.jsx(KR,{})}),c.jsx(Rr,{path:"/collect",element:c.jsx(tk,{})}),c.jsx(Rr,{path:"/tasks",element:c.jsx(dA,{})}),c.jsx(Rr,{path:"/settings",element:c.jsx(oA,{})})]})})})]})]}),S&&n?c.jsx("div",{className:"fixed inset-0 z-50 flex items-center justify-center bg-background/80 p-6 backdrop-blur-sm",children:c.jsxs(_e,{className:"w-full max-w-3xl",children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"免责声明"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"首次使用需要确认免责声明。"}),c.jsx(Ul,{className:"h-[60vh] rounded-md border",children:c.jsx("pre",{className:"whitespace-pre-wrap p-4 text-sm leading-relaxed",children:n.disclaimer_text})}),c.jsx(Rn,{}),r?c.jsx("div",{className:"text-sm text-destructive",children:r}):null,c.jsx("div",{className:"flex items-center justify-end gap-2",children:c.jsx(we,{disabled:s,onClick:async()=>{u(!0),o(null);try{await Ae.acceptDisclaimer(),a({...n,disclaimer_accepted:!0})}catch(C){o(String(C))}finally{u(!1)}},children:"我已阅读并同意"})})]})]})}):null,!S&&m&&f?c.jsx("div",{className:"fixed inset-0 z-50 flex items-center justify-center bg-background/80 p-6 backdrop-blur-sm",children:c.jsxs(_e,{className:"w-full max-w-lg shadow-lg",children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"发现新版本"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsxs("div",{className:"grid gap-2 text-sm",children:[c.jsxs("div",{children:["当前版本：",c.jsx("span",{className:"font-mono",children:f.current_version})]}),c.jsxs("div",{children:["最新版本：",c.jsx("span",{className:"font-mono text-primary",children:f.latest_version})]})]}),f.release_notes?c.jsx(Ul,{className:"h-48 rounded-md border bg-muted/50",children:c.jsx("pre",{className:"whitespace-pre-wrap p-3 text-xs leading-relaxed",children:f.release_notes})}):null,c.jsxs("div",{className:"flex justify-end gap-2",children:[c.jsx(we,{variant:"ghost",onClick:j,disabled:y,children:"以后再说"}),c.jsx(we,{onClick:()=>void M(),disabled:y,children:y?"更新中...":"下载并更新"})]})]})]})}):null,c.jsx(PE,{})]})})}hC.createRoot(document.getElementById("root")).render(c.jsx(v.StrictMode,{children:c.jsx(Bj,{basename:"/ui",children:c.jsx(fA,{})})}));
+`)},oO=0,kr=[];function iO(n){var a=v.useRef([]),r=v.useRef([0,0]),o=v.useRef(),s=v.useState(oO++)[0],u=v.useState(Kb)[0],f=v.useRef(n);v.useEffect(function(){f.current=n},[n]),v.useEffect(function(){if(n.inert){document.body.classList.add("block-interactivity-".concat(s));var C=__([n.lockRef.current],(n.shards||[]).map(Ry),!0).filter(Boolean);return C.forEach(function(N){return N.classList.add("allow-interactivity-".concat(s))}),function(){document.body.classList.remove("block-interactivity-".concat(s)),C.forEach(function(N){return N.classList.remove("allow-interactivity-".concat(s))})}}},[n.inert,n.lockRef.current,n.shards]);var h=v.useCallback(function(C,N){if("touches"in C&&C.touches.length===2||C.type==="wheel"&&C.ctrlKey)return!f.current.allowPinchZoom;var E=Ks(C),O=r.current,_="deltaX"in C?C.deltaX:O[0]-E[0],z="deltaY"in C?C.deltaY:O[1]-E[1],D,k=C.target,T=Math.abs(_)>Math.abs(z)?"h":"v";if("touches"in C&&T==="h"&&k.type==="range")return!1;var Y=window.getSelection(),H=Y&&Y.anchorNode,Z=H?H===k||H.contains(k):!1;if(Z)return!1;var ne=My(T,k);if(!ne)return!0;if(ne?D=T:(D=T==="v"?"h":"v",ne=My(T,k)),!ne)return!1;if(!o.current&&"changedTouches"in C&&(_||z)&&(o.current=D),!D)return!0;var fe=o.current||D;return aO(fe,N,C,fe==="h"?_:z)},[]),m=v.useCallback(function(C){var N=C;if(!(!kr.length||kr[kr.length-1]!==u)){var E="deltaY"in N?Dy(N):Ks(N),O=a.current.filter(function(D){return D.name===N.type&&(D.target===N.target||N.target===D.shadowParent)&&lO(D.delta,E)})[0];if(O&&O.should){N.cancelable&&N.preventDefault();return}if(!O){var _=(f.current.shards||[]).map(Ry).filter(Boolean).filter(function(D){return D.contains(N.target)}),z=_.length>0?h(N,_[0]):!f.current.noIsolation;z&&N.cancelable&&N.preventDefault()}}},[]),g=v.useCallback(function(C,N,E,O){var _={name:C,delta:N,target:E,should:O,shadowParent:sO(E)};a.current.push(_),setTimeout(function(){a.current=a.current.filter(function(z){return z!==_})},1)},[]),y=v.useCallback(function(C){r.current=Ks(C),o.current=void 0},[]),x=v.useCallback(function(C){g(C.type,Dy(C),C.target,h(C,n.lockRef.current))},[]),S=v.useCallback(function(C){g(C.type,Ks(C),C.target,h(C,n.lockRef.current))},[]);v.useEffect(function(){return kr.push(u),n.setCallbacks({onScrollCapture:x,onWheelCapture:x,onTouchMoveCapture:S}),document.addEventListener("wheel",m,Or),document.addEventListener("touchmove",m,Or),document.addEventListener("touchstart",y,Or),function(){kr=kr.filter(function(C){return C!==u}),document.removeEventListener("wheel",m,Or),document.removeEventListener("touchmove",m,Or),document.removeEventListener("touchstart",y,Or)}},[]);var j=n.removeScrollBar,M=n.inert;return v.createElement(v.Fragment,null,M?v.createElement(u,{styles:rO(s)}):null,j?v.createElement(K_,{noRelative:n.noRelative,gapMode:n.gapMode}):null)}function sO(n){for(var a=null;n!==null;)n instanceof ShadowRoot&&(a=n.host,n=n.host),n=n.parentNode;return a}const cO=U_(Qb,iO);var Ch=v.forwardRef(function(n,a){return v.createElement(Nc,Qn({},n,{ref:a,sideCar:cO}))});Ch.classNames=Nc.classNames;var uO=[" ","Enter","ArrowUp","ArrowDown"],dO=[" ","Enter"],Ll="Select",[Ec,Tc,fO]=pb(Ll),[Ir]=dl(Ll,[fO,jc]),_c=jc(),[hO,fl]=Ir(Ll),[mO,pO]=Ir(Ll),e0=n=>{const{__scopeSelect:a,children:r,open:o,defaultOpen:s,onOpenChange:u,value:f,defaultValue:h,onValueChange:m,dir:g,name:y,autoComplete:x,disabled:S,required:j,form:M}=n,C=_c(a),[N,E]=v.useState(null),[O,_]=v.useState(null),[z,D]=v.useState(!1),k=gc(g),[T,Y]=Lr({prop:o,defaultProp:s??!1,onChange:u,caller:Ll}),[H,Z]=Lr({prop:f,defaultProp:h,onChange:m,caller:Ll}),ne=v.useRef(null),fe=N?M||!!N.closest("form"):!0,[ve,$]=v.useState(new Set),se=Array.from(ve).map(U=>U.props.value).join(";");return c.jsx(Pb,{...C,children:c.jsxs(hO,{required:j,scope:a,trigger:N,onTriggerChange:E,valueNode:O,onValueNodeChange:_,valueNodeHasChildren:z,onValueNodeHasChildrenChange:D,contentId:Qr(),value:H,onValueChange:Z,open:T,onOpenChange:Y,dir:k,triggerPointerDownPosRef:ne,disabled:S,children:[c.jsx(Ec.Provider,{scope:a,children:c.jsx(mO,{scope:n.__scopeSelect,onNativeOptionAdd:v.useCallback(U=>{$(Q=>new Set(Q).add(U))},[]),onNativeOptionRemove:v.useCallback(U=>{$(Q=>{const q=new Set(Q);return q.delete(U),q})},[]),children:r})}),fe?c.jsxs(j0,{"aria-hidden":!0,required:j,tabIndex:-1,name:y,autoComplete:x,value:H,onChange:U=>Z(U.target.value),disabled:S,form:M,children:[H===void 0?c.jsx("option",{value:""}):null,Array.from(ve)]},se):null]})})};e0.displayName=Ll;var t0="SelectTrigger",n0=v.forwardRef((n,a)=>{const{__scopeSelect:r,disabled:o=!1,...s}=n,u=_c(r),f=fl(t0,r),h=f.disabled||o,m=lt(a,f.onTriggerChange),g=Tc(r),y=v.useRef("touch"),[x,S,j]=E0(C=>{const N=g().filter(_=>!_.disabled),E=N.find(_=>_.value===f.value),O=T0(N,C,E);O!==void 0&&f.onValueChange(O.value)}),M=C=>{h||(f.onOpenChange(!0),j()),C&&(f.triggerPointerDownPosRef.current={x:Math.round(C.pageX),y:Math.round(C.pageY)})};return c.jsx(Sh,{asChild:!0,...u,children:c.jsx(Ve.button,{type:"button",role:"combobox","aria-controls":f.contentId,"aria-expanded":f.open,"aria-required":f.required,"aria-autocomplete":"none",dir:f.dir,"data-state":f.open?"open":"closed",disabled:h,"data-disabled":h?"":void 0,"data-placeholder":N0(f.value)?"":void 0,...s,ref:m,onClick:De(s.onClick,C=>{C.currentTarget.focus(),y.current!=="mouse"&&M(C)}),onPointerDown:De(s.onPointerDown,C=>{y.current=C.pointerType;const N=C.target;N.hasPointerCapture(C.pointerId)&&N.releasePointerCapture(C.pointerId),C.button===0&&C.ctrlKey===!1&&C.pointerType==="mouse"&&(M(C),C.preventDefault())}),onKeyDown:De(s.onKeyDown,C=>{const N=x.current!=="";!(C.ctrlKey||C.altKey||C.metaKey)&&C.key.length===1&&S(C.key),!(N&&C.key===" ")&&uO.includes(C.key)&&(M(),C.preventDefault())})})})});n0.displayName=t0;var a0="SelectValue",l0=v.forwardRef((n,a)=>{const{__scopeSelect:r,className:o,style:s,children:u,placeholder:f="",...h}=n,m=fl(a0,r),{onValueNodeHasChildrenChange:g}=m,y=u!==void 0,x=lt(a,m.onValueNodeChange);return qt(()=>{g(y)},[g,y]),c.jsx(Ve.span,{...h,ref:x,style:{pointerEvents:"none"},children:N0(m.value)?c.jsx(c.Fragment,{children:f}):u})});l0.displayName=a0;var gO="SelectIcon",r0=v.forwardRef((n,a)=>{const{__scopeSelect:r,children:o,...s}=n;return c.jsx(Ve.span,{"aria-hidden":!0,...s,ref:a,children:o||"▼"})});r0.displayName=gO;var vO="SelectPortal",o0=n=>c.jsx(wh,{asChild:!0,...n});o0.displayName=vO;var Yl="SelectContent",i0=v.forwardRef((n,a)=>{const r=fl(Yl,n.__scopeSelect),[o,s]=v.useState();if(qt(()=>{s(new DocumentFragment)},[]),!r.open){const u=o;return u?fi.createPortal(c.jsx(s0,{scope:n.__scopeSelect,children:c.jsx(Ec.Slot,{scope:n.__scopeSelect,children:c.jsx("div",{children:n.children})})}),u):null}return c.jsx(c0,{...n,ref:a})});i0.displayName=Yl;var Ln=10,[s0,hl]=Ir(Yl),yO="SelectContentImpl",xO=v_("SelectContent.RemoveScroll"),c0=v.forwardRef((n,a)=>{const{__scopeSelect:r,position:o="item-aligned",onCloseAutoFocus:s,onEscapeKeyDown:u,onPointerDownOutside:f,side:h,sideOffset:m,align:g,alignOffset:y,arrowPadding:x,collisionBoundary:S,collisionPadding:j,sticky:M,hideWhenDetached:C,avoidCollisions:N,...E}=n,O=fl(Yl,r),[_,z]=v.useState(null),[D,k]=v.useState(null),T=lt(a,ae=>z(ae)),[Y,H]=v.useState(null),[Z,ne]=v.useState(null),fe=Tc(r),[ve,$]=v.useState(!1),se=v.useRef(!1);v.useEffect(()=>{if(_)return Xb(_)},[_]),yb();const U=v.useCallback(ae=>{const[Ne,...Ee]=fe().map(ze=>ze.ref.current),[ke]=Ee.slice(-1),je=document.activeElement;for(const ze of ae)if(ze===je||(ze==null||ze.scrollIntoView({block:"nearest"}),ze===Ne&&D&&(D.scrollTop=0),ze===ke&&D&&(D.scrollTop=D.scrollHeight),ze==null||ze.focus(),document.activeElement!==je))return},[fe,D]),Q=v.useCallback(()=>U([Y,_]),[U,Y,_]);v.useEffect(()=>{ve&&Q()},[ve,Q]);const{onOpenChange:q,triggerPointerDownPosRef:ie}=O;v.useEffect(()=>{if(_){let ae={x:0,y:0};const Ne=ke=>{var je,ze;ae={x:Math.abs(Math.round(ke.pageX)-(((je=ie.current)==null?void 0:je.x)??0)),y:Math.abs(Math.round(ke.pageY)-(((ze=ie.current)==null?void 0:ze.y)??0))}},Ee=ke=>{ae.x<=10&&ae.y<=10?ke.preventDefault():_.contains(ke.target)||q(!1),document.removeEventListener("pointermove",Ne),ie.current=null};return ie.current!==null&&(document.addEventListener("pointermove",Ne),document.addEventListener("pointerup",Ee,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",Ne),document.removeEventListener("pointerup",Ee,{capture:!0})}}},[_,q,ie]),v.useEffect(()=>{const ae=()=>q(!1);return window.addEventListener("blur",ae),window.addEventListener("resize",ae),()=>{window.removeEventListener("blur",ae),window.removeEventListener("resize",ae)}},[q]);const[ue,A]=E0(ae=>{const Ne=fe().filter(je=>!je.disabled),Ee=Ne.find(je=>je.ref.current===document.activeElement),ke=T0(Ne,ae,Ee);ke&&setTimeout(()=>ke.ref.current.focus())}),P=v.useCallback((ae,Ne,Ee)=>{const ke=!se.current&&!Ee;(O.value!==void 0&&O.value===Ne||ke)&&(H(ae),ke&&(se.current=!0))},[O.value]),te=v.useCallback(()=>_==null?void 0:_.focus(),[_]),le=v.useCallback((ae,Ne,Ee)=>{const ke=!se.current&&!Ee;(O.value!==void 0&&O.value===Ne||ke)&&ne(ae)},[O.value]),he=o==="popper"?Lf:u0,Se=he===Lf?{side:h,sideOffset:m,align:g,alignOffset:y,arrowPadding:x,collisionBoundary:S,collisionPadding:j,sticky:M,hideWhenDetached:C,avoidCollisions:N}:{};return c.jsx(s0,{scope:r,content:_,viewport:D,onViewportChange:k,itemRefCallback:P,selectedItem:Y,onItemLeave:te,itemTextRefCallback:le,focusSelectedItem:Q,selectedItemText:Z,position:o,isPositioned:ve,searchRef:ue,children:c.jsx(Ch,{as:xO,allowPinchZoom:!0,children:c.jsx(fh,{asChild:!0,trapped:O.open,onMountAutoFocus:ae=>{ae.preventDefault()},onUnmountAutoFocus:De(s,ae=>{var Ne;(Ne=O.trigger)==null||Ne.focus({preventScroll:!0}),ae.preventDefault()}),children:c.jsx(dh,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:u,onPointerDownOutside:f,onFocusOutside:ae=>ae.preventDefault(),onDismiss:()=>O.onOpenChange(!1),children:c.jsx(he,{role:"listbox",id:O.contentId,"data-state":O.open?"open":"closed",dir:O.dir,onContextMenu:ae=>ae.preventDefault(),...E,...Se,onPlaced:()=>$(!0),ref:T,style:{display:"flex",flexDirection:"column",outline:"none",...E.style},onKeyDown:De(E.onKeyDown,ae=>{const Ne=ae.ctrlKey||ae.altKey||ae.metaKey;if(ae.key==="Tab"&&ae.preventDefault(),!Ne&&ae.key.length===1&&A(ae.key),["ArrowUp","ArrowDown","Home","End"].includes(ae.key)){let ke=fe().filter(je=>!je.disabled).map(je=>je.ref.current);if(["ArrowUp","End"].includes(ae.key)&&(ke=ke.slice().reverse()),["ArrowUp","ArrowDown"].includes(ae.key)){const je=ae.target,ze=ke.indexOf(je);ke=ke.slice(ze+1)}setTimeout(()=>U(ke)),ae.preventDefault()}})})})})})})});c0.displayName=yO;var bO="SelectItemAlignedPosition",u0=v.forwardRef((n,a)=>{const{__scopeSelect:r,onPlaced:o,...s}=n,u=fl(Yl,r),f=hl(Yl,r),[h,m]=v.useState(null),[g,y]=v.useState(null),x=lt(a,T=>y(T)),S=Tc(r),j=v.useRef(!1),M=v.useRef(!0),{viewport:C,selectedItem:N,selectedItemText:E,focusSelectedItem:O}=f,_=v.useCallback(()=>{if(u.trigger&&u.valueNode&&h&&g&&C&&N&&E){const T=u.trigger.getBoundingClientRect(),Y=g.getBoundingClientRect(),H=u.valueNode.getBoundingClientRect(),Z=E.getBoundingClientRect();if(u.dir!=="rtl"){const je=Z.left-Y.left,ze=H.left-je,Ct=T.left-ze,G=T.width+Ct,Qe=Math.max(G,Y.width),qe=window.innerWidth-Ln,ut=Rf(ze,[Ln,Math.max(Ln,qe-Qe)]);h.style.minWidth=G+"px",h.style.left=ut+"px"}else{const je=Y.right-Z.right,ze=window.innerWidth-H.right-je,Ct=window.innerWidth-T.right-ze,G=T.width+Ct,Qe=Math.max(G,Y.width),qe=window.innerWidth-Ln,ut=Rf(ze,[Ln,Math.max(Ln,qe-Qe)]);h.style.minWidth=G+"px",h.style.right=ut+"px"}const ne=S(),fe=window.innerHeight-Ln*2,ve=C.scrollHeight,$=window.getComputedStyle(g),se=parseInt($.borderTopWidth,10),U=parseInt($.paddingTop,10),Q=parseInt($.borderBottomWidth,10),q=parseInt($.paddingBottom,10),ie=se+U+ve+q+Q,ue=Math.min(N.offsetHeight*5,ie),A=window.getComputedStyle(C),P=parseInt(A.paddingTop,10),te=parseInt(A.paddingBottom,10),le=T.top+T.height/2-Ln,he=fe-le,Se=N.offsetHeight/2,ae=N.offsetTop+Se,Ne=se+U+ae,Ee=ie-Ne;if(Ne<=le){const je=ne.length>0&&N===ne[ne.length-1].ref.current;h.style.bottom="0px";const ze=g.clientHeight-C.offsetTop-C.offsetHeight,Ct=Math.max(he,Se+(je?te:0)+ze+Q),G=Ne+Ct;h.style.height=G+"px"}else{const je=ne.length>0&&N===ne[0].ref.current;h.style.top="0px";const Ct=Math.max(le,se+C.offsetTop+(je?P:0)+Se)+Ee;h.style.height=Ct+"px",C.scrollTop=Ne-le+C.offsetTop}h.style.margin=`${Ln}px 0`,h.style.minHeight=ue+"px",h.style.maxHeight=fe+"px",o==null||o(),requestAnimationFrame(()=>j.current=!0)}},[S,u.trigger,u.valueNode,h,g,C,N,E,u.dir,o]);qt(()=>_(),[_]);const[z,D]=v.useState();qt(()=>{g&&D(window.getComputedStyle(g).zIndex)},[g]);const k=v.useCallback(T=>{T&&M.current===!0&&(_(),O==null||O(),M.current=!1)},[_,O]);return c.jsx(wO,{scope:r,contentWrapper:h,shouldExpandOnScrollRef:j,onScrollButtonChange:k,children:c.jsx("div",{ref:m,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:z},children:c.jsx(Ve.div,{...s,ref:x,style:{boxSizing:"border-box",maxHeight:"100%",...s.style}})})})});u0.displayName=bO;var SO="SelectPopperPosition",Lf=v.forwardRef((n,a)=>{const{__scopeSelect:r,align:o="start",collisionPadding:s=Ln,...u}=n,f=_c(r);return c.jsx(Wb,{...f,...u,ref:a,align:o,collisionPadding:s,style:{boxSizing:"border-box",...u.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});Lf.displayName=SO;var[wO,jh]=Ir(Yl,{}),Yf="SelectViewport",d0=v.forwardRef((n,a)=>{const{__scopeSelect:r,nonce:o,...s}=n,u=hl(Yf,r),f=jh(Yf,r),h=lt(a,u.onViewportChange),m=v.useRef(0);return c.jsxs(c.Fragment,{children:[c.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:o}),c.jsx(Ec.Slot,{scope:r,children:c.jsx(Ve.div,{"data-radix-select-viewport":"",role:"presentation",...s,ref:h,style:{position:"relative",flex:1,overflow:"hidden auto",...s.style},onScroll:De(s.onScroll,g=>{const y=g.currentTarget,{contentWrapper:x,shouldExpandOnScrollRef:S}=f;if(S!=null&&S.current&&x){const j=Math.abs(m.current-y.scrollTop);if(j>0){const M=window.innerHeight-Ln*2,C=parseFloat(x.style.minHeight),N=parseFloat(x.style.height),E=Math.max(C,N);if(E<M){const O=E+j,_=Math.min(M,O),z=O-_;x.style.height=_+"px",x.style.bottom==="0px"&&(y.scrollTop=z>0?z:0,x.style.justifyContent="flex-end")}}}m.current=y.scrollTop})})})]})});d0.displayName=Yf;var f0="SelectGroup",[CO,jO]=Ir(f0),NO=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=Qr();return c.jsx(CO,{scope:r,id:s,children:c.jsx(Ve.div,{role:"group","aria-labelledby":s,...o,ref:a})})});NO.displayName=f0;var h0="SelectLabel",m0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=jO(h0,r);return c.jsx(Ve.div,{id:s.id,...o,ref:a})});m0.displayName=h0;var fc="SelectItem",[EO,p0]=Ir(fc),g0=v.forwardRef((n,a)=>{const{__scopeSelect:r,value:o,disabled:s=!1,textValue:u,...f}=n,h=fl(fc,r),m=hl(fc,r),g=h.value===o,[y,x]=v.useState(u??""),[S,j]=v.useState(!1),M=lt(a,O=>{var _;return(_=m.itemRefCallback)==null?void 0:_.call(m,O,o,s)}),C=Qr(),N=v.useRef("touch"),E=()=>{s||(h.onValueChange(o),h.onOpenChange(!1))};if(o==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return c.jsx(EO,{scope:r,value:o,disabled:s,textId:C,isSelected:g,onItemTextChange:v.useCallback(O=>{x(_=>_||((O==null?void 0:O.textContent)??"").trim())},[]),children:c.jsx(Ec.ItemSlot,{scope:r,value:o,disabled:s,textValue:y,children:c.jsx(Ve.div,{role:"option","aria-labelledby":C,"data-highlighted":S?"":void 0,"aria-selected":g&&S,"data-state":g?"checked":"unchecked","aria-disabled":s||void 0,"data-disabled":s?"":void 0,tabIndex:s?void 0:-1,...f,ref:M,onFocus:De(f.onFocus,()=>j(!0)),onBlur:De(f.onBlur,()=>j(!1)),onClick:De(f.onClick,()=>{N.current!=="mouse"&&E()}),onPointerUp:De(f.onPointerUp,()=>{N.current==="mouse"&&E()}),onPointerDown:De(f.onPointerDown,O=>{N.current=O.pointerType}),onPointerMove:De(f.onPointerMove,O=>{var _;N.current=O.pointerType,s?(_=m.onItemLeave)==null||_.call(m):N.current==="mouse"&&O.currentTarget.focus({preventScroll:!0})}),onPointerLeave:De(f.onPointerLeave,O=>{var _;O.currentTarget===document.activeElement&&((_=m.onItemLeave)==null||_.call(m))}),onKeyDown:De(f.onKeyDown,O=>{var z;((z=m.searchRef)==null?void 0:z.current)!==""&&O.key===" "||(dO.includes(O.key)&&E(),O.key===" "&&O.preventDefault())})})})})});g0.displayName=fc;var ti="SelectItemText",v0=v.forwardRef((n,a)=>{const{__scopeSelect:r,className:o,style:s,...u}=n,f=fl(ti,r),h=hl(ti,r),m=p0(ti,r),g=pO(ti,r),[y,x]=v.useState(null),S=lt(a,E=>x(E),m.onItemTextChange,E=>{var O;return(O=h.itemTextRefCallback)==null?void 0:O.call(h,E,m.value,m.disabled)}),j=y==null?void 0:y.textContent,M=v.useMemo(()=>c.jsx("option",{value:m.value,disabled:m.disabled,children:j},m.value),[m.disabled,m.value,j]),{onNativeOptionAdd:C,onNativeOptionRemove:N}=g;return qt(()=>(C(M),()=>N(M)),[C,N,M]),c.jsxs(c.Fragment,{children:[c.jsx(Ve.span,{id:m.textId,...u,ref:S}),m.isSelected&&f.valueNode&&!f.valueNodeHasChildren?fi.createPortal(u.children,f.valueNode):null]})});v0.displayName=ti;var y0="SelectItemIndicator",x0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n;return p0(y0,r).isSelected?c.jsx(Ve.span,{"aria-hidden":!0,...o,ref:a}):null});x0.displayName=y0;var Pf="SelectScrollUpButton",b0=v.forwardRef((n,a)=>{const r=hl(Pf,n.__scopeSelect),o=jh(Pf,n.__scopeSelect),[s,u]=v.useState(!1),f=lt(a,o.onScrollButtonChange);return qt(()=>{if(r.viewport&&r.isPositioned){let h=function(){const g=m.scrollTop>0;u(g)};const m=r.viewport;return h(),m.addEventListener("scroll",h),()=>m.removeEventListener("scroll",h)}},[r.viewport,r.isPositioned]),s?c.jsx(w0,{...n,ref:f,onAutoScroll:()=>{const{viewport:h,selectedItem:m}=r;h&&m&&(h.scrollTop=h.scrollTop-m.offsetHeight)}}):null});b0.displayName=Pf;var Wf="SelectScrollDownButton",S0=v.forwardRef((n,a)=>{const r=hl(Wf,n.__scopeSelect),o=jh(Wf,n.__scopeSelect),[s,u]=v.useState(!1),f=lt(a,o.onScrollButtonChange);return qt(()=>{if(r.viewport&&r.isPositioned){let h=function(){const g=m.scrollHeight-m.clientHeight,y=Math.ceil(m.scrollTop)<g;u(y)};const m=r.viewport;return h(),m.addEventListener("scroll",h),()=>m.removeEventListener("scroll",h)}},[r.viewport,r.isPositioned]),s?c.jsx(w0,{...n,ref:f,onAutoScroll:()=>{const{viewport:h,selectedItem:m}=r;h&&m&&(h.scrollTop=h.scrollTop+m.offsetHeight)}}):null});S0.displayName=Wf;var w0=v.forwardRef((n,a)=>{const{__scopeSelect:r,onAutoScroll:o,...s}=n,u=hl("SelectScrollButton",r),f=v.useRef(null),h=Tc(r),m=v.useCallback(()=>{f.current!==null&&(window.clearInterval(f.current),f.current=null)},[]);return v.useEffect(()=>()=>m(),[m]),qt(()=>{var y;const g=h().find(x=>x.ref.current===document.activeElement);(y=g==null?void 0:g.ref.current)==null||y.scrollIntoView({block:"nearest"})},[h]),c.jsx(Ve.div,{"aria-hidden":!0,...s,ref:a,style:{flexShrink:0,...s.style},onPointerDown:De(s.onPointerDown,()=>{f.current===null&&(f.current=window.setInterval(o,50))}),onPointerMove:De(s.onPointerMove,()=>{var g;(g=u.onItemLeave)==null||g.call(u),f.current===null&&(f.current=window.setInterval(o,50))}),onPointerLeave:De(s.onPointerLeave,()=>{m()})})}),TO="SelectSeparator",C0=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n;return c.jsx(Ve.div,{"aria-hidden":!0,...o,ref:a})});C0.displayName=TO;var Vf="SelectArrow",_O=v.forwardRef((n,a)=>{const{__scopeSelect:r,...o}=n,s=_c(r),u=fl(Vf,r),f=hl(Vf,r);return u.open&&f.position==="popper"?c.jsx(Vb,{...s,...o,ref:a}):null});_O.displayName=Vf;var OO="SelectBubbleInput",j0=v.forwardRef(({__scopeSelect:n,value:a,...r},o)=>{const s=v.useRef(null),u=lt(o,s),f=lb(a);return v.useEffect(()=>{const h=s.current;if(!h)return;const m=window.HTMLSelectElement.prototype,y=Object.getOwnPropertyDescriptor(m,"value").set;if(f!==a&&y){const x=new Event("change",{bubbles:!0});y.call(h,a),h.dispatchEvent(x)}},[f,a]),c.jsx(Ve.select,{...r,style:{...qb,...r.style},ref:u,defaultValue:a})});j0.displayName=OO;function N0(n){return n===""||n===void 0}function E0(n){const a=Kt(n),r=v.useRef(""),o=v.useRef(0),s=v.useCallback(f=>{const h=r.current+f;a(h),(function m(g){r.current=g,window.clearTimeout(o.current),g!==""&&(o.current=window.setTimeout(()=>m(""),1e3))})(h)},[a]),u=v.useCallback(()=>{r.current="",window.clearTimeout(o.current)},[]);return v.useEffect(()=>()=>window.clearTimeout(o.current),[]),[r,s,u]}function T0(n,a,r){const s=a.length>1&&Array.from(a).every(g=>g===a[0])?a[0]:a,u=r?n.indexOf(r):-1;let f=kO(n,Math.max(u,0));s.length===1&&(f=f.filter(g=>g!==r));const m=f.find(g=>g.textValue.toLowerCase().startsWith(s.toLowerCase()));return m!==r?m:void 0}function kO(n,a){return n.map((r,o)=>n[(a+o)%n.length])}var MO=e0,_0=n0,DO=l0,RO=r0,AO=o0,O0=i0,zO=d0,k0=m0,M0=g0,BO=v0,UO=x0,D0=b0,R0=S0,A0=C0;const pi=MO,gi=DO,Jr=v.forwardRef(({className:n,children:a,...r},o)=>c.jsxs(_0,{ref:o,className:ce("flex h-9 w-full items-center justify-between whitespace-nowrap rounded-md border border-input bg-transparent px-3 py-2 text-sm shadow-sm ring-offset-background data-[placeholder]:text-muted-foreground focus:outline-none focus:ring-1 focus:ring-ring disabled:cursor-not-allowed disabled:opacity-50 [&>span]:line-clamp-1",n),...r,children:[a,c.jsx(RO,{asChild:!0,children:c.jsx(lh,{className:"h-4 w-4 opacity-50"})})]}));Jr.displayName=_0.displayName;const z0=v.forwardRef(({className:n,...a},r)=>c.jsx(D0,{ref:r,className:ce("flex cursor-default items-center justify-center py-1",n),...a,children:c.jsx(sE,{className:"h-4 w-4"})}));z0.displayName=D0.displayName;const B0=v.forwardRef(({className:n,...a},r)=>c.jsx(R0,{ref:r,className:ce("flex cursor-default items-center justify-center py-1",n),...a,children:c.jsx(lh,{className:"h-4 w-4"})}));B0.displayName=R0.displayName;const eo=v.forwardRef(({className:n,children:a,position:r="popper",...o},s)=>c.jsx(AO,{children:c.jsxs(O0,{ref:s,className:ce("relative z-50 max-h-[--radix-select-content-available-height] min-w-[8rem] overflow-y-auto overflow-x-hidden rounded-md border bg-popover text-popover-foreground shadow-md data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-select-content-transform-origin]",r==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",n),position:r,...o,children:[c.jsx(z0,{}),c.jsx(zO,{className:ce("p-1",r==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)]"),children:a}),c.jsx(B0,{})]})}));eo.displayName=O0.displayName;const HO=v.forwardRef(({className:n,...a},r)=>c.jsx(k0,{ref:r,className:ce("px-2 py-1.5 text-sm font-semibold",n),...a}));HO.displayName=k0.displayName;const vn=v.forwardRef(({className:n,children:a,...r},o)=>c.jsxs(M0,{ref:o,className:ce("relative flex w-full cursor-default select-none items-center rounded-sm py-1.5 pl-2 pr-8 text-sm outline-none focus:bg-accent focus:text-accent-foreground data-[disabled]:pointer-events-none data-[disabled]:opacity-50",n),...r,children:[c.jsx("span",{className:"absolute right-2 flex h-3.5 w-3.5 items-center justify-center",children:c.jsx(UO,{children:c.jsx(Lx,{className:"h-4 w-4"})})}),c.jsx(BO,{children:a})]}));vn.displayName=M0.displayName;const LO=v.forwardRef(({className:n,...a},r)=>c.jsx(A0,{ref:r,className:ce("-mx-1 my-1 h-px bg-muted",n),...a}));LO.displayName=A0.displayName;var yf="rovingFocusGroup.onEntryFocus",YO={bubbles:!1,cancelable:!0},vi="RovingFocusGroup",[qf,U0,PO]=pb(vi),[WO,H0]=dl(vi,[PO]),[VO,qO]=WO(vi),L0=v.forwardRef((n,a)=>c.jsx(qf.Provider,{scope:n.__scopeRovingFocusGroup,children:c.jsx(qf.Slot,{scope:n.__scopeRovingFocusGroup,children:c.jsx(GO,{...n,ref:a})})}));L0.displayName=vi;var GO=v.forwardRef((n,a)=>{const{__scopeRovingFocusGroup:r,orientation:o,loop:s=!1,dir:u,currentTabStopId:f,defaultCurrentTabStopId:h,onCurrentTabStopIdChange:m,onEntryFocus:g,preventScrollOnEntryFocus:y=!1,...x}=n,S=v.useRef(null),j=lt(a,S),M=gc(u),[C,N]=Lr({prop:f,defaultProp:h??null,onChange:m,caller:vi}),[E,O]=v.useState(!1),_=Kt(g),z=U0(r),D=v.useRef(!1),[k,T]=v.useState(0);return v.useEffect(()=>{const Y=S.current;if(Y)return Y.addEventListener(yf,_),()=>Y.removeEventListener(yf,_)},[_]),c.jsx(VO,{scope:r,orientation:o,dir:M,loop:s,currentTabStopId:C,onItemFocus:v.useCallback(Y=>N(Y),[N]),onItemShiftTab:v.useCallback(()=>O(!0),[]),onFocusableItemAdd:v.useCallback(()=>T(Y=>Y+1),[]),onFocusableItemRemove:v.useCallback(()=>T(Y=>Y-1),[]),children:c.jsx(Ve.div,{tabIndex:E||k===0?-1:0,"data-orientation":o,...x,ref:j,style:{outline:"none",...n.style},onMouseDown:De(n.onMouseDown,()=>{D.current=!0}),onFocus:De(n.onFocus,Y=>{const H=!D.current;if(Y.target===Y.currentTarget&&H&&!E){const Z=new CustomEvent(yf,YO);if(Y.currentTarget.dispatchEvent(Z),!Z.defaultPrevented){const ne=z().filter(U=>U.focusable),fe=ne.find(U=>U.active),ve=ne.find(U=>U.id===C),se=[fe,ve,...ne].filter(Boolean).map(U=>U.ref.current);W0(se,y)}}D.current=!1}),onBlur:De(n.onBlur,()=>O(!1))})})}),Y0="RovingFocusGroupItem",P0=v.forwardRef((n,a)=>{const{__scopeRovingFocusGroup:r,focusable:o=!0,active:s=!1,tabStopId:u,children:f,...h}=n,m=Qr(),g=u||m,y=qO(Y0,r),x=y.currentTabStopId===g,S=U0(r),{onFocusableItemAdd:j,onFocusableItemRemove:M,currentTabStopId:C}=y;return v.useEffect(()=>{if(o)return j(),()=>M()},[o,j,M]),c.jsx(qf.ItemSlot,{scope:r,id:g,focusable:o,active:s,children:c.jsx(Ve.span,{tabIndex:x?0:-1,"data-orientation":y.orientation,...h,ref:a,onMouseDown:De(n.onMouseDown,N=>{o?y.onItemFocus(g):N.preventDefault()}),onFocus:De(n.onFocus,()=>y.onItemFocus(g)),onKeyDown:De(n.onKeyDown,N=>{if(N.key==="Tab"&&N.shiftKey){y.onItemShiftTab();return}if(N.target!==N.currentTarget)return;const E=FO(N,y.orientation,y.dir);if(E!==void 0){if(N.metaKey||N.ctrlKey||N.altKey||N.shiftKey)return;N.preventDefault();let _=S().filter(z=>z.focusable).map(z=>z.ref.current);if(E==="last")_.reverse();else if(E==="prev"||E==="next"){E==="prev"&&_.reverse();const z=_.indexOf(N.currentTarget);_=y.loop?QO(_,z+1):_.slice(z+1)}setTimeout(()=>W0(_))}}),children:typeof f=="function"?f({isCurrentTabStop:x,hasTabStop:C!=null}):f})})});P0.displayName=Y0;var XO={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function $O(n,a){return a!=="rtl"?n:n==="ArrowLeft"?"ArrowRight":n==="ArrowRight"?"ArrowLeft":n}function FO(n,a,r){const o=$O(n.key,r);if(!(a==="vertical"&&["ArrowLeft","ArrowRight"].includes(o))&&!(a==="horizontal"&&["ArrowUp","ArrowDown"].includes(o)))return XO[o]}function W0(n,a=!1){const r=document.activeElement;for(const o of n)if(o===r||(o.focus({preventScroll:a}),document.activeElement!==r))return}function QO(n,a){return n.map((r,o)=>n[(a+o)%n.length])}var KO=L0,ZO=P0,Oc="Tabs",[IO]=dl(Oc,[H0]),V0=H0(),[JO,Nh]=IO(Oc),q0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,onValueChange:s,defaultValue:u,orientation:f="horizontal",dir:h,activationMode:m="automatic",...g}=n,y=gc(h),[x,S]=Lr({prop:o,onChange:s,defaultProp:u??"",caller:Oc});return c.jsx(JO,{scope:r,baseId:Qr(),value:x,onValueChange:S,orientation:f,dir:y,activationMode:m,children:c.jsx(Ve.div,{dir:y,"data-orientation":f,...g,ref:a})})});q0.displayName=Oc;var G0="TabsList",X0=v.forwardRef((n,a)=>{const{__scopeTabs:r,loop:o=!0,...s}=n,u=Nh(G0,r),f=V0(r);return c.jsx(KO,{asChild:!0,...f,orientation:u.orientation,dir:u.dir,loop:o,children:c.jsx(Ve.div,{role:"tablist","aria-orientation":u.orientation,...s,ref:a})})});X0.displayName=G0;var $0="TabsTrigger",F0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,disabled:s=!1,...u}=n,f=Nh($0,r),h=V0(r),m=Z0(f.baseId,o),g=I0(f.baseId,o),y=o===f.value;return c.jsx(ZO,{asChild:!0,...h,focusable:!s,active:y,children:c.jsx(Ve.button,{type:"button",role:"tab","aria-selected":y,"aria-controls":g,"data-state":y?"active":"inactive","data-disabled":s?"":void 0,disabled:s,id:m,...u,ref:a,onMouseDown:De(n.onMouseDown,x=>{!s&&x.button===0&&x.ctrlKey===!1?f.onValueChange(o):x.preventDefault()}),onKeyDown:De(n.onKeyDown,x=>{[" ","Enter"].includes(x.key)&&f.onValueChange(o)}),onFocus:De(n.onFocus,()=>{const x=f.activationMode!=="manual";!y&&!s&&x&&f.onValueChange(o)})})})});F0.displayName=$0;var Q0="TabsContent",K0=v.forwardRef((n,a)=>{const{__scopeTabs:r,value:o,forceMount:s,children:u,...f}=n,h=Nh(Q0,r),m=Z0(h.baseId,o),g=I0(h.baseId,o),y=o===h.value,x=v.useRef(y);return v.useEffect(()=>{const S=requestAnimationFrame(()=>x.current=!1);return()=>cancelAnimationFrame(S)},[]),c.jsx(Ra,{present:s||y,children:({present:S})=>c.jsx(Ve.div,{"data-state":y?"active":"inactive","data-orientation":h.orientation,role:"tabpanel","aria-labelledby":m,hidden:!S,id:g,tabIndex:0,...f,ref:a,style:{...n.style,animationDuration:x.current?"0s":void 0},children:S&&u})})});K0.displayName=Q0;function Z0(n,a){return`${n}-trigger-${a}`}function I0(n,a){return`${n}-content-${a}`}var ek=q0,J0=X0,eS=F0,tS=K0;const yi=ek,to=v.forwardRef(({className:n,...a},r)=>c.jsx(J0,{ref:r,className:ce("inline-flex h-9 items-center justify-center rounded-lg bg-muted p-1 text-muted-foreground",n),...a}));to.displayName=J0.displayName;const Mt=v.forwardRef(({className:n,...a},r)=>c.jsx(eS,{ref:r,className:ce("inline-flex items-center justify-center whitespace-nowrap rounded-md px-3 py-1 text-sm font-medium ring-offset-background transition-all focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:bg-background data-[state=active]:text-foreground data-[state=active]:shadow",n),...a}));Mt.displayName=eS.displayName;const Dt=v.forwardRef(({className:n,...a},r)=>c.jsx(tS,{ref:r,className:ce("mt-2 ring-offset-background focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2",n),...a}));Dt.displayName=tS.displayName;const St=v.forwardRef(({className:n,...a},r)=>c.jsx("textarea",{className:ce("flex min-h-[60px] w-full rounded-md border border-input bg-transparent px-3 py-2 text-base shadow-sm placeholder:text-muted-foreground focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-ring disabled:cursor-not-allowed disabled:opacity-50 md:text-sm",n),ref:r,...a}));St.displayName="Textarea";function Ay(){return{tab:"live",liveText:"",liveDownload:!1,liveQuality:"",liveCookie:"",liveProxy:"",commentText:"",commentPages:"1",commentReply:!1,commentCursor:"0",commentCount:"20",commentCountReply:"3",commentCookie:"",commentProxy:"",userText:"",userCookie:"",userProxy:"",hotCookie:"",hotProxy:"",searchMode:"general",searchKeyword:"",searchPages:"1",searchOffset:"0",searchCount:"10",searchSortType:"0",searchPublishTime:"0",searchDuration:"0",searchRange:"0",searchContentType:"0",searchUserFans:"0",searchUserType:"0",searchCookie:"",searchProxy:""}}function tk(){const n=Gr(),a=T=>n(`/tasks?task=${encodeURIComponent(T)}`),{platform:r}=hi(),o=r==="douyin"||r==="tiktok",s=r==="tiktok"?"tiktok":"douyin",u=s==="tiktok",[f,h]=v.useState(()=>({douyin:Ay(),tiktok:Ay()})),m=f[s],g=T=>{h(Y=>({...Y,[s]:{...Y[s],...T}}))},[y,x]=v.useState(!1),[S,j]=v.useState(!1),[M,C]=v.useState(!1),[N,E]=v.useState(!1),[O,_]=v.useState(!1),[z,D]=v.useState(null),k=(T,Y)=>{const H=Number(T);return Number.isFinite(H)?H:Y};return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:o?c.jsxs(c.Fragment,{children:[z?c.jsx("div",{className:"text-sm text-destructive",children:z}):null,c.jsxs(yi,{value:m.tab,onValueChange:T=>g({tab:T}),className:"w-full",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"live",children:"直播"}),u?null:c.jsxs(c.Fragment,{children:[c.jsx(Mt,{value:"comment",children:"评论"}),c.jsx(Mt,{value:"search",children:"搜索"}),c.jsx(Mt,{value:"hot",children:"热榜"}),c.jsx(Mt,{value:"user",children:"用户数据"})]})]}),c.jsx(Dt,{value:"live",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{checked:m.liveDownload,onCheckedChange:T=>g({liveDownload:!!T})}),c.jsx(K,{children:"同时下载（需要 ffmpeg）"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播链接/房间号文本"}),c.jsx(St,{value:m.liveText,onChange:T=>g({liveText:T.target.value}),rows:6,placeholder:"粘贴多个链接，空格/换行分隔"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"画质（可选）"}),c.jsx(re,{value:m.liveQuality,onChange:T=>g({liveQuality:T.target.value}),placeholder:"如：origin 或 1"})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.liveCookie,onChange:T=>g({liveCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.liveProxy,onChange:T=>g({liveProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:y||!m.liveText.trim(),onClick:async()=>{x(!0),D(null);try{const T=await Ae.createCollectLiveTask({platform:s,text:m.liveText,download:m.liveDownload,quality:m.liveQuality.trim()||null,cookie:m.liveCookie.trim()||null,proxy:m.liveProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{x(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"comment",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"评论采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"作品链接文本"}),c.jsx(St,{value:m.commentText,onChange:T=>g({commentText:T.target.value}),rows:6,placeholder:"粘贴多个作品链接，空格/换行分隔"})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:m.commentPages,onChange:T=>g({commentPages:T.target.value}),placeholder:"1"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-8",children:[c.jsx(pt,{checked:m.commentReply,onCheckedChange:T=>g({commentReply:!!T})}),c.jsx(K,{children:"采集回复"})]})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"cursor"}),c.jsx(re,{value:m.commentCursor,onChange:T=>g({commentCursor:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count"}),c.jsx(re,{value:m.commentCount,onChange:T=>g({commentCount:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count_reply"}),c.jsx(re,{value:m.commentCountReply,onChange:T=>g({commentCountReply:T.target.value})})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.commentCookie,onChange:T=>g({commentCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.commentProxy,onChange:T=>g({commentProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:S||!m.commentText.trim(),onClick:async()=>{j(!0),D(null);try{const T=await Ae.createCollectCommentTask({text:m.commentText,pages:k(m.commentPages,1),cursor:k(m.commentCursor,0),count:k(m.commentCount,20),count_reply:k(m.commentCountReply,3),reply:m.commentReply,cookie:m.commentCookie.trim()||null,proxy:m.commentProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{j(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"search",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"搜索采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"模式"}),c.jsxs(pi,{value:m.searchMode,onValueChange:T=>g({searchMode:T}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"general",children:"综合"}),c.jsx(vn,{value:"video",children:"视频"}),c.jsx(vn,{value:"user",children:"用户"}),c.jsx(vn,{value:"live",children:"直播"})]})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"关键词"}),c.jsx(re,{value:m.searchKeyword,onChange:T=>g({searchKeyword:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:m.searchPages,onChange:T=>g({searchPages:T.target.value})})]})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"offset"}),c.jsx(re,{value:m.searchOffset,onChange:T=>g({searchOffset:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"count"}),c.jsx(re,{value:m.searchCount,onChange:T=>g({searchCount:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"sort_type"}),c.jsx(re,{value:m.searchSortType,onChange:T=>g({searchSortType:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"publish_time"}),c.jsx(re,{value:m.searchPublishTime,onChange:T=>g({searchPublishTime:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"duration"}),c.jsx(re,{value:m.searchDuration,onChange:T=>g({searchDuration:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"search_range"}),c.jsx(re,{value:m.searchRange,onChange:T=>g({searchRange:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"content_type"}),c.jsx(re,{value:m.searchContentType,onChange:T=>g({searchContentType:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"douyin_user_fans"}),c.jsx(re,{value:m.searchUserFans,onChange:T=>g({searchUserFans:T.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"douyin_user_type"}),c.jsx(re,{value:m.searchUserType,onChange:T=>g({searchUserType:T.target.value})})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.searchCookie,onChange:T=>g({searchCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.searchProxy,onChange:T=>g({searchProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:O||!m.searchKeyword.trim(),onClick:async()=>{_(!0),D(null);try{const T=await Ae.createCollectSearchTask({mode:m.searchMode,keyword:m.searchKeyword,pages:k(m.searchPages,1),offset:k(m.searchOffset,0),count:k(m.searchCount,10),sort_type:k(m.searchSortType,0),publish_time:k(m.searchPublishTime,0),duration:k(m.searchDuration,0),search_range:k(m.searchRange,0),content_type:k(m.searchContentType,0),douyin_user_fans:k(m.searchUserFans,0),douyin_user_type:k(m.searchUserType,0),cookie:m.searchCookie.trim()||null,proxy:m.searchProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{_(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"hot",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"热榜采集需要先在设置中启用“存储格式”。"}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.hotCookie,onChange:T=>g({hotCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.hotProxy,onChange:T=>g({hotProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:N,onClick:async()=>{E(!0),D(null);try{const T=await Ae.createCollectHotTask({cookie:m.hotCookie.trim()||null,proxy:m.hotProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{E(!1)}},children:"开始"})})]})})}),u?null:c.jsx(Dt,{value:"user",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"用户数据采集需要先在设置中启用“存储格式”。"}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"账号链接文本"}),c.jsx(St,{value:m.userText,onChange:T=>g({userText:T.target.value}),rows:6,placeholder:"粘贴多个账号主页链接，空格/换行分隔"})]}),c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"高级"}),c.jsxs("div",{className:"mt-4 space-y-4",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时 Cookie（可选）"}),c.jsx(St,{value:m.userCookie,onChange:T=>g({userCookie:T.target.value}),rows:4})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"临时代理（可选）"}),c.jsx(re,{value:m.userProxy,onChange:T=>g({userProxy:T.target.value})})]})]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{disabled:M||!m.userText.trim(),onClick:async()=>{C(!0),D(null);try{const T=await Ae.createCollectUserDataTask({text:m.userText,cookie:m.userCookie.trim()||null,proxy:m.userProxy.trim()||null});a(T.id)}catch(T){D(String(T))}finally{C(!1)}},children:"开始"})})]})})})]})]}):c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})})}function nk(){const n=Gr(),[a,r]=v.useState(""),[o,s]=v.useState(!1),u=async()=>{const f=a.trim();if(f){s(!0);try{const h=await Ae.createDownloadKuaishouDetailTask({text:f});rn.success("任务已创建"),n(`/tasks?task=${encodeURIComponent(h.id)}`)}catch{}finally{s(!1)}}};return c.jsxs("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:[c.jsxs(yi,{defaultValue:"detail",className:"w-full",children:[c.jsx(to,{children:c.jsx(Mt,{value:"detail",children:"链接作品"})}),c.jsx(Dt,{value:"detail",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"链接文本"}),c.jsx(St,{value:a,onChange:f=>r(f.target.value),rows:8,placeholder:"粘贴多个快手分享链接或完整链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{onClick:()=>void u(),disabled:o||!a.trim(),children:o?"处理中...":"开始下载"})})]})})})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"提示"})}),c.jsxs(Oe,{className:"space-y-2 text-sm text-muted-foreground",children:[c.jsx("div",{children:"快手 Cookie 支持动态获取（无需登录）。"}),c.jsx("div",{children:"若解析/下载失败，建议先在“设置”中配置 Cookie（必要时配置代理）。"})]})]})]})}function Ur(n){return(a={})=>{const r=a.width?String(a.width):n.defaultWidth;return n.formats[r]||n.formats[n.defaultWidth]}}function Kn(n){return(a,r)=>{const o=r!=null&&r.context?String(r.context):"standalone";let s;if(o==="formatting"&&n.formattingValues){const f=n.defaultFormattingWidth||n.defaultWidth,h=r!=null&&r.width?String(r.width):f;s=n.formattingValues[h]||n.formattingValues[f]}else{const f=n.defaultWidth,h=r!=null&&r.width?String(r.width):n.defaultWidth;s=n.values[h]||n.values[f]}const u=n.argumentCallback?n.argumentCallback(a):a;return s[u]}}function Zn(n){return(a,r={})=>{const o=r.width,s=o&&n.matchPatterns[o]||n.matchPatterns[n.defaultMatchWidth],u=a.match(s);if(!u)return null;const f=u[0],h=o&&n.parsePatterns[o]||n.parsePatterns[n.defaultParseWidth],m=Array.isArray(h)?lk(h,x=>x.test(f)):ak(h,x=>x.test(f));let g;g=n.valueCallback?n.valueCallback(m):m,g=r.valueCallback?r.valueCallback(g):g;const y=a.slice(f.length);return{value:g,rest:y}}}function ak(n,a){for(const r in n)if(Object.prototype.hasOwnProperty.call(n,r)&&a(n[r]))return r}function lk(n,a){for(let r=0;r<n.length;r++)if(a(n[r]))return r}function nS(n){return(a,r={})=>{const o=a.match(n.matchPattern);if(!o)return null;const s=o[0],u=a.match(n.parsePattern);if(!u)return null;let f=n.valueCallback?n.valueCallback(u[0]):u[0];f=r.valueCallback?r.valueCallback(f):f;const h=a.slice(s.length);return{value:f,rest:h}}}const aS=6048e5,rk=864e5,zy=Symbol.for("constructDateFrom");function _t(n,a){return typeof n=="function"?n(a):n&&typeof n=="object"&&zy in n?n[zy](a):n instanceof Date?new n.constructor(a):new Date(a)}function Pl(n,...a){const r=_t.bind(null,n||a.find(o=>typeof o=="object"));return a.map(r)}let ok={};function xi(){return ok}function st(n,a){return _t(a||n,n)}function ul(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.weekStartsOn)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.weekStartsOn)??r.weekStartsOn??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.weekStartsOn)??0,s=st(n,a==null?void 0:a.in),u=s.getDay(),f=(u<o?7:0)+u-o;return s.setDate(s.getDate()-f),s.setHours(0,0,0,0),s}function ik(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return+ul(o,r)==+ul(s,r)}const sk={lessThanXSeconds:{one:"less than a second",other:"less than {{count}} seconds"},xSeconds:{one:"1 second",other:"{{count}} seconds"},halfAMinute:"half a minute",lessThanXMinutes:{one:"less than a minute",other:"less than {{count}} minutes"},xMinutes:{one:"1 minute",other:"{{count}} minutes"},aboutXHours:{one:"about 1 hour",other:"about {{count}} hours"},xHours:{one:"1 hour",other:"{{count}} hours"},xDays:{one:"1 day",other:"{{count}} days"},aboutXWeeks:{one:"about 1 week",other:"about {{count}} weeks"},xWeeks:{one:"1 week",other:"{{count}} weeks"},aboutXMonths:{one:"about 1 month",other:"about {{count}} months"},xMonths:{one:"1 month",other:"{{count}} months"},aboutXYears:{one:"about 1 year",other:"about {{count}} years"},xYears:{one:"1 year",other:"{{count}} years"},overXYears:{one:"over 1 year",other:"over {{count}} years"},almostXYears:{one:"almost 1 year",other:"almost {{count}} years"}},ck=(n,a,r)=>{let o;const s=sk[n];return typeof s=="string"?o=s:a===1?o=s.one:o=s.other.replace("{{count}}",a.toString()),r!=null&&r.addSuffix?r.comparison&&r.comparison>0?"in "+o:o+" ago":o},uk={lastWeek:"'last' eeee 'at' p",yesterday:"'yesterday at' p",today:"'today at' p",tomorrow:"'tomorrow at' p",nextWeek:"eeee 'at' p",other:"P"},dk=(n,a,r,o)=>uk[n],fk={narrow:["B","A"],abbreviated:["BC","AD"],wide:["Before Christ","Anno Domini"]},hk={narrow:["1","2","3","4"],abbreviated:["Q1","Q2","Q3","Q4"],wide:["1st quarter","2nd quarter","3rd quarter","4th quarter"]},mk={narrow:["J","F","M","A","M","J","J","A","S","O","N","D"],abbreviated:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],wide:["January","February","March","April","May","June","July","August","September","October","November","December"]},pk={narrow:["S","M","T","W","T","F","S"],short:["Su","Mo","Tu","We","Th","Fr","Sa"],abbreviated:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],wide:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},gk={narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"}},vk={narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"}},yk=(n,a)=>{const r=Number(n),o=r%100;if(o>20||o<10)switch(o%10){case 1:return r+"st";case 2:return r+"nd";case 3:return r+"rd"}return r+"th"},xk={ordinalNumber:yk,era:Kn({values:fk,defaultWidth:"wide"}),quarter:Kn({values:hk,defaultWidth:"wide",argumentCallback:n=>n-1}),month:Kn({values:mk,defaultWidth:"wide"}),day:Kn({values:pk,defaultWidth:"wide"}),dayPeriod:Kn({values:gk,defaultWidth:"wide",formattingValues:vk,defaultFormattingWidth:"wide"})},bk=/^(\d+)(th|st|nd|rd)?/i,Sk=/\d+/i,wk={narrow:/^(b|a)/i,abbreviated:/^(b\.?\s?c\.?|b\.?\s?c\.?\s?e\.?|a\.?\s?d\.?|c\.?\s?e\.?)/i,wide:/^(before christ|before common era|anno domini|common era)/i},Ck={any:[/^b/i,/^(a|c)/i]},jk={narrow:/^[1234]/i,abbreviated:/^q[1234]/i,wide:/^[1234](th|st|nd|rd)? quarter/i},Nk={any:[/1/i,/2/i,/3/i,/4/i]},Ek={narrow:/^[jfmasond]/i,abbreviated:/^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/i,wide:/^(january|february|march|april|may|june|july|august|september|october|november|december)/i},Tk={narrow:[/^j/i,/^f/i,/^m/i,/^a/i,/^m/i,/^j/i,/^j/i,/^a/i,/^s/i,/^o/i,/^n/i,/^d/i],any:[/^ja/i,/^f/i,/^mar/i,/^ap/i,/^may/i,/^jun/i,/^jul/i,/^au/i,/^s/i,/^o/i,/^n/i,/^d/i]},_k={narrow:/^[smtwf]/i,short:/^(su|mo|tu|we|th|fr|sa)/i,abbreviated:/^(sun|mon|tue|wed|thu|fri|sat)/i,wide:/^(sunday|monday|tuesday|wednesday|thursday|friday|saturday)/i},Ok={narrow:[/^s/i,/^m/i,/^t/i,/^w/i,/^t/i,/^f/i,/^s/i],any:[/^su/i,/^m/i,/^tu/i,/^w/i,/^th/i,/^f/i,/^sa/i]},kk={narrow:/^(a|p|mi|n|(in the|at) (morning|afternoon|evening|night))/i,any:/^([ap]\.?\s?m\.?|midnight|noon|(in the|at) (morning|afternoon|evening|night))/i},Mk={any:{am:/^a/i,pm:/^p/i,midnight:/^mi/i,noon:/^no/i,morning:/morning/i,afternoon:/afternoon/i,evening:/evening/i,night:/night/i}},Dk={ordinalNumber:nS({matchPattern:bk,parsePattern:Sk,valueCallback:n=>parseInt(n,10)}),era:Zn({matchPatterns:wk,defaultMatchWidth:"wide",parsePatterns:Ck,defaultParseWidth:"any"}),quarter:Zn({matchPatterns:jk,defaultMatchWidth:"wide",parsePatterns:Nk,defaultParseWidth:"any",valueCallback:n=>n+1}),month:Zn({matchPatterns:Ek,defaultMatchWidth:"wide",parsePatterns:Tk,defaultParseWidth:"any"}),day:Zn({matchPatterns:_k,defaultMatchWidth:"wide",parsePatterns:Ok,defaultParseWidth:"any"}),dayPeriod:Zn({matchPatterns:kk,defaultMatchWidth:"any",parsePatterns:Mk,defaultParseWidth:"any"})},Rk={full:"EEEE, MMMM do, y",long:"MMMM do, y",medium:"MMM d, y",short:"MM/dd/yyyy"},Ak={full:"h:mm:ss a zzzz",long:"h:mm:ss a z",medium:"h:mm:ss a",short:"h:mm a"},zk={full:"{{date}} 'at' {{time}}",long:"{{date}} 'at' {{time}}",medium:"{{date}}, {{time}}",short:"{{date}}, {{time}}"},Bk={date:Ur({formats:Rk,defaultWidth:"full"}),time:Ur({formats:Ak,defaultWidth:"full"}),dateTime:Ur({formats:zk,defaultWidth:"full"})},Ar={code:"en-US",formatDistance:ck,formatLong:Bk,formatRelative:dk,localize:xk,match:Dk,options:{weekStartsOn:0,firstWeekContainsDate:1}},Uk={lessThanXSeconds:{one:"不到 1 秒",other:"不到 {{count}} 秒"},xSeconds:{one:"1 秒",other:"{{count}} 秒"},halfAMinute:"半分钟",lessThanXMinutes:{one:"不到 1 分钟",other:"不到 {{count}} 分钟"},xMinutes:{one:"1 分钟",other:"{{count}} 分钟"},xHours:{one:"1 小时",other:"{{count}} 小时"},aboutXHours:{one:"大约 1 小时",other:"大约 {{count}} 小时"},xDays:{one:"1 天",other:"{{count}} 天"},aboutXWeeks:{one:"大约 1 个星期",other:"大约 {{count}} 个星期"},xWeeks:{one:"1 个星期",other:"{{count}} 个星期"},aboutXMonths:{one:"大约 1 个月",other:"大约 {{count}} 个月"},xMonths:{one:"1 个月",other:"{{count}} 个月"},aboutXYears:{one:"大约 1 年",other:"大约 {{count}} 年"},xYears:{one:"1 年",other:"{{count}} 年"},overXYears:{one:"超过 1 年",other:"超过 {{count}} 年"},almostXYears:{one:"将近 1 年",other:"将近 {{count}} 年"}},Hk=(n,a,r)=>{let o;const s=Uk[n];return typeof s=="string"?o=s:a===1?o=s.one:o=s.other.replace("{{count}}",String(a)),r!=null&&r.addSuffix?r.comparison&&r.comparison>0?o+"内":o+"前":o},Lk={full:"y'年'M'月'd'日' EEEE",long:"y'年'M'月'd'日'",medium:"yyyy-MM-dd",short:"yy-MM-dd"},Yk={full:"zzzz a h:mm:ss",long:"z a h:mm:ss",medium:"a h:mm:ss",short:"a h:mm"},Pk={full:"{{date}} {{time}}",long:"{{date}} {{time}}",medium:"{{date}} {{time}}",short:"{{date}} {{time}}"},Wk={date:Ur({formats:Lk,defaultWidth:"full"}),time:Ur({formats:Yk,defaultWidth:"full"}),dateTime:Ur({formats:Pk,defaultWidth:"full"})};function By(n,a,r){const o="eeee p";return ik(n,a,r)?o:n.getTime()>a.getTime()?"'下个'"+o:"'上个'"+o}const Vk={lastWeek:By,yesterday:"'昨天' p",today:"'今天' p",tomorrow:"'明天' p",nextWeek:By,other:"PP p"},qk=(n,a,r,o)=>{const s=Vk[n];return typeof s=="function"?s(a,r,o):s},Gk={narrow:["前","公元"],abbreviated:["前","公元"],wide:["公元前","公元"]},Xk={narrow:["1","2","3","4"],abbreviated:["第一季","第二季","第三季","第四季"],wide:["第一季度","第二季度","第三季度","第四季度"]},$k={narrow:["一","二","三","四","五","六","七","八","九","十","十一","十二"],abbreviated:["1月","2月","3月","4月","5月","6月","7月","8月","9月","10月","11月","12月"],wide:["一月","二月","三月","四月","五月","六月","七月","八月","九月","十月","十一月","十二月"]},Fk={narrow:["日","一","二","三","四","五","六"],short:["日","一","二","三","四","五","六"],abbreviated:["周日","周一","周二","周三","周四","周五","周六"],wide:["星期日","星期一","星期二","星期三","星期四","星期五","星期六"]},Qk={narrow:{am:"上",pm:"下",midnight:"凌晨",noon:"午",morning:"早",afternoon:"下午",evening:"晚",night:"夜"},abbreviated:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"},wide:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"}},Kk={narrow:{am:"上",pm:"下",midnight:"凌晨",noon:"午",morning:"早",afternoon:"下午",evening:"晚",night:"夜"},abbreviated:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"},wide:{am:"上午",pm:"下午",midnight:"凌晨",noon:"中午",morning:"早晨",afternoon:"中午",evening:"晚上",night:"夜间"}},Zk=(n,a)=>{const r=Number(n);switch(a==null?void 0:a.unit){case"date":return r.toString()+"日";case"hour":return r.toString()+"时";case"minute":return r.toString()+"分";case"second":return r.toString()+"秒";default:return"第 "+r.toString()}},Ik={ordinalNumber:Zk,era:Kn({values:Gk,defaultWidth:"wide"}),quarter:Kn({values:Xk,defaultWidth:"wide",argumentCallback:n=>n-1}),month:Kn({values:$k,defaultWidth:"wide"}),day:Kn({values:Fk,defaultWidth:"wide"}),dayPeriod:Kn({values:Qk,defaultWidth:"wide",formattingValues:Kk,defaultFormattingWidth:"wide"})},Jk=/^(第\s*)?\d+(日|时|分|秒)?/i,eM=/\d+/i,tM={narrow:/^(前)/i,abbreviated:/^(前)/i,wide:/^(公元前|公元)/i},nM={any:[/^(前)/i,/^(公元)/i]},aM={narrow:/^[1234]/i,abbreviated:/^第[一二三四]刻/i,wide:/^第[一二三四]刻钟/i},lM={any:[/(1|一)/i,/(2|二)/i,/(3|三)/i,/(4|四)/i]},rM={narrow:/^(一|二|三|四|五|六|七|八|九|十[二一])/i,abbreviated:/^(一|二|三|四|五|六|七|八|九|十[二一]|\d|1[12])月/i,wide:/^(一|二|三|四|五|六|七|八|九|十[二一])月/i},oM={narrow:[/^一/i,/^二/i,/^三/i,/^四/i,/^五/i,/^六/i,/^七/i,/^八/i,/^九/i,/^十(?!(一|二))/i,/^十一/i,/^十二/i],any:[/^一|1/i,/^二|2/i,/^三|3/i,/^四|4/i,/^五|5/i,/^六|6/i,/^七|7/i,/^八|8/i,/^九|9/i,/^十(?!(一|二))|10/i,/^十一|11/i,/^十二|12/i]},iM={narrow:/^[一二三四五六日]/i,short:/^[一二三四五六日]/i,abbreviated:/^周[一二三四五六日]/i,wide:/^星期[一二三四五六日]/i},sM={any:[/日/i,/一/i,/二/i,/三/i,/四/i,/五/i,/六/i]},cM={any:/^(上午?|下午?|午夜|[中正]午|早上?|下午|晚上?|凌晨|)/i},uM={any:{am:/^上午?/i,pm:/^下午?/i,midnight:/^午夜/i,noon:/^[中正]午/i,morning:/^早上/i,afternoon:/^下午/i,evening:/^晚上?/i,night:/^凌晨/i}},dM={ordinalNumber:nS({matchPattern:Jk,parsePattern:eM,valueCallback:n=>parseInt(n,10)}),era:Zn({matchPatterns:tM,defaultMatchWidth:"wide",parsePatterns:nM,defaultParseWidth:"any"}),quarter:Zn({matchPatterns:aM,defaultMatchWidth:"wide",parsePatterns:lM,defaultParseWidth:"any",valueCallback:n=>n+1}),month:Zn({matchPatterns:rM,defaultMatchWidth:"wide",parsePatterns:oM,defaultParseWidth:"any"}),day:Zn({matchPatterns:iM,defaultMatchWidth:"wide",parsePatterns:sM,defaultParseWidth:"any"}),dayPeriod:Zn({matchPatterns:cM,defaultMatchWidth:"any",parsePatterns:uM,defaultParseWidth:"any"})},fM={code:"zh-CN",formatDistance:Hk,formatLong:Wk,formatRelative:qk,localize:Ik,match:dM,options:{weekStartsOn:1,firstWeekContainsDate:4}};function hM(n,a,r="long"){return new Intl.DateTimeFormat("en-US",{hour:"numeric",timeZone:n,timeZoneName:r}).format(a).split(/\s/g).slice(2).join(" ")}const xf={},ni={};function zl(n,a){try{const o=(xf[n]||(xf[n]=new Intl.DateTimeFormat("en-US",{timeZone:n,timeZoneName:"longOffset"}).format))(a).split("GMT")[1];return o in ni?ni[o]:Uy(o,o.split(":"))}catch{if(n in ni)return ni[n];const r=n==null?void 0:n.match(mM);return r?Uy(n,r.slice(1)):NaN}}const mM=/([+-]\d\d):?(\d\d)?/;function Uy(n,a){const r=+(a[0]||0),o=+(a[1]||0),s=+(a[2]||0)/60;return ni[n]=r*60+o>0?r*60+o+s:r*60-o-s}class Jn extends Date{constructor(...a){super(),a.length>1&&typeof a[a.length-1]=="string"&&(this.timeZone=a.pop()),this.internal=new Date,isNaN(zl(this.timeZone,this))?this.setTime(NaN):a.length?typeof a[0]=="number"&&(a.length===1||a.length===2&&typeof a[1]!="number")?this.setTime(a[0]):typeof a[0]=="string"?this.setTime(+new Date(a[0])):a[0]instanceof Date?this.setTime(+a[0]):(this.setTime(+new Date(...a)),lS(this),Gf(this)):this.setTime(Date.now())}static tz(a,...r){return r.length?new Jn(...r,a):new Jn(Date.now(),a)}withTimeZone(a){return new Jn(+this,a)}getTimezoneOffset(){const a=-zl(this.timeZone,this);return a>0?Math.floor(a):Math.ceil(a)}setTime(a){return Date.prototype.setTime.apply(this,arguments),Gf(this),+this}[Symbol.for("constructDateFrom")](a){return new Jn(+new Date(a),this.timeZone)}}const Hy=/^(get|set)(?!UTC)/;Object.getOwnPropertyNames(Date.prototype).forEach(n=>{if(!Hy.test(n))return;const a=n.replace(Hy,"$1UTC");Jn.prototype[a]&&(n.startsWith("get")?Jn.prototype[n]=function(){return this.internal[a]()}:(Jn.prototype[n]=function(){return Date.prototype[a].apply(this.internal,arguments),pM(this),+this},Jn.prototype[a]=function(){return Date.prototype[a].apply(this,arguments),Gf(this),+this}))});function Gf(n){n.internal.setTime(+n),n.internal.setUTCSeconds(n.internal.getUTCSeconds()-Math.round(-zl(n.timeZone,n)*60))}function pM(n){Date.prototype.setFullYear.call(n,n.internal.getUTCFullYear(),n.internal.getUTCMonth(),n.internal.getUTCDate()),Date.prototype.setHours.call(n,n.internal.getUTCHours(),n.internal.getUTCMinutes(),n.internal.getUTCSeconds(),n.internal.getUTCMilliseconds()),lS(n)}function lS(n){const a=zl(n.timeZone,n),r=a>0?Math.floor(a):Math.ceil(a),o=new Date(+n);o.setUTCHours(o.getUTCHours()-1);const s=-new Date(+n).getTimezoneOffset(),u=-new Date(+o).getTimezoneOffset(),f=s-u,h=Date.prototype.getHours.apply(n)!==n.internal.getUTCHours();f&&h&&n.internal.setUTCMinutes(n.internal.getUTCMinutes()+f);const m=s-r;m&&Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+m);const g=new Date(+n);g.setUTCSeconds(0);const y=s>0?g.getSeconds():(g.getSeconds()-60)%60,x=Math.round(-(zl(n.timeZone,n)*60))%60;(x||y)&&(n.internal.setUTCSeconds(n.internal.getUTCSeconds()+x),Date.prototype.setUTCSeconds.call(n,Date.prototype.getUTCSeconds.call(n)+x+y));const S=zl(n.timeZone,n),j=S>0?Math.floor(S):Math.ceil(S),C=-new Date(+n).getTimezoneOffset()-j,N=j!==r,E=C-m;if(N&&E){Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+E);const O=zl(n.timeZone,n),_=O>0?Math.floor(O):Math.ceil(O),z=j-_;z&&(n.internal.setUTCMinutes(n.internal.getUTCMinutes()+z),Date.prototype.setUTCMinutes.call(n,Date.prototype.getUTCMinutes.call(n)+z))}}class Xt extends Jn{static tz(a,...r){return r.length?new Xt(...r,a):new Xt(Date.now(),a)}toISOString(){const[a,r,o]=this.tzComponents(),s=`${a}${r}:${o}`;return this.internal.toISOString().slice(0,-1)+s}toString(){return`${this.toDateString()} ${this.toTimeString()}`}toDateString(){const[a,r,o,s]=this.internal.toUTCString().split(" ");return`${a==null?void 0:a.slice(0,-1)} ${o} ${r} ${s}`}toTimeString(){const a=this.internal.toUTCString().split(" ")[4],[r,o,s]=this.tzComponents();return`${a} GMT${r}${o}${s} (${hM(this.timeZone,this)})`}toLocaleString(a,r){return Date.prototype.toLocaleString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}toLocaleDateString(a,r){return Date.prototype.toLocaleDateString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}toLocaleTimeString(a,r){return Date.prototype.toLocaleTimeString.call(this,a,{...r,timeZone:(r==null?void 0:r.timeZone)||this.timeZone})}tzComponents(){const a=this.getTimezoneOffset(),r=a>0?"-":"+",o=String(Math.floor(Math.abs(a)/60)).padStart(2,"0"),s=String(Math.abs(a)%60).padStart(2,"0");return[r,o,s]}withTimeZone(a){return new Xt(+this,a)}[Symbol.for("constructDateFrom")](a){return new Xt(+new Date(a),this.timeZone)}}function rS(n,a,r){const o=st(n,r==null?void 0:r.in);return isNaN(a)?_t(n,NaN):(a&&o.setDate(o.getDate()+a),o)}function oS(n,a,r){const o=st(n,r==null?void 0:r.in);if(isNaN(a))return _t(n,NaN);if(!a)return o;const s=o.getDate(),u=_t(n,o.getTime());u.setMonth(o.getMonth()+a+1,0);const f=u.getDate();return s>=f?u:(o.setFullYear(u.getFullYear(),u.getMonth(),s),o)}function si(n,a){return ul(n,{...a,weekStartsOn:1})}function iS(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=_t(r,0);s.setFullYear(o+1,0,4),s.setHours(0,0,0,0);const u=si(s),f=_t(r,0);f.setFullYear(o,0,4),f.setHours(0,0,0,0);const h=si(f);return r.getTime()>=u.getTime()?o+1:r.getTime()>=h.getTime()?o:o-1}function Ly(n){const a=st(n),r=new Date(Date.UTC(a.getFullYear(),a.getMonth(),a.getDate(),a.getHours(),a.getMinutes(),a.getSeconds(),a.getMilliseconds()));return r.setUTCFullYear(a.getFullYear()),+n-+r}function ci(n,a){const r=st(n,a==null?void 0:a.in);return r.setHours(0,0,0,0),r}function Eh(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a),u=ci(o),f=ci(s),h=+u-Ly(u),m=+f-Ly(f);return Math.round((h-m)/rk)}function gM(n,a){const r=iS(n,a),o=_t(n,0);return o.setFullYear(r,0,4),o.setHours(0,0,0,0),si(o)}function vM(n,a,r){return rS(n,a*7,r)}function yM(n,a,r){return oS(n,a*12,r)}function xM(n,a){let r,o=a==null?void 0:a.in;return n.forEach(s=>{!o&&typeof s=="object"&&(o=_t.bind(null,s));const u=st(s,o);(!r||r<u||isNaN(+u))&&(r=u)}),_t(o,r||NaN)}function bM(n,a){let r,o=a==null?void 0:a.in;return n.forEach(s=>{!o&&typeof s=="object"&&(o=_t.bind(null,s));const u=st(s,o);(!r||r>u||isNaN(+u))&&(r=u)}),_t(o,r||NaN)}function SM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return+ci(o)==+ci(s)}function sS(n){return n instanceof Date||typeof n=="object"&&Object.prototype.toString.call(n)==="[object Date]"}function wM(n){return!(!sS(n)&&typeof n!="number"||isNaN(+st(n)))}function cS(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a),u=o.getFullYear()-s.getFullYear(),f=o.getMonth()-s.getMonth();return u*12+f}function CM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getMonth();return r.setFullYear(r.getFullYear(),o+1,0),r.setHours(23,59,59,999),r}function uS(n,a){const[r,o]=Pl(n,a.start,a.end);return{start:r,end:o}}function jM(n,a){const{start:r,end:o}=uS(a==null?void 0:a.in,n);let s=+r>+o;const u=s?+r:+o,f=s?o:r;f.setHours(0,0,0,0),f.setDate(1);let h=1;const m=[];for(;+f<=u;)m.push(_t(r,f)),f.setMonth(f.getMonth()+h);return s?m.reverse():m}function NM(n,a){const r=st(n,a==null?void 0:a.in);return r.setDate(1),r.setHours(0,0,0,0),r}function EM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear();return r.setFullYear(o+1,0,0),r.setHours(23,59,59,999),r}function dS(n,a){const r=st(n,a==null?void 0:a.in);return r.setFullYear(r.getFullYear(),0,1),r.setHours(0,0,0,0),r}function TM(n,a){const{start:r,end:o}=uS(a==null?void 0:a.in,n);let s=+r>+o;const u=s?+r:+o,f=s?o:r;f.setHours(0,0,0,0),f.setMonth(0,1);let h=1;const m=[];for(;+f<=u;)m.push(_t(r,f)),f.setFullYear(f.getFullYear()+h);return s?m.reverse():m}function fS(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.weekStartsOn)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.weekStartsOn)??r.weekStartsOn??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.weekStartsOn)??0,s=st(n,a==null?void 0:a.in),u=s.getDay(),f=(u<o?-7:0)+6-(u-o);return s.setDate(s.getDate()+f),s.setHours(23,59,59,999),s}function _M(n,a){return fS(n,{...a,weekStartsOn:1})}function OM(n,a){const r=st(n,a==null?void 0:a.in);return Eh(r,dS(r))+1}function Th(n,a){const r=st(n,a==null?void 0:a.in),o=+si(r)-+gM(r);return Math.round(o/aS)+1}function hS(n,a){var y,x,S,j;const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=xi(),u=(a==null?void 0:a.firstWeekContainsDate)??((x=(y=a==null?void 0:a.locale)==null?void 0:y.options)==null?void 0:x.firstWeekContainsDate)??s.firstWeekContainsDate??((j=(S=s.locale)==null?void 0:S.options)==null?void 0:j.firstWeekContainsDate)??1,f=_t((a==null?void 0:a.in)||n,0);f.setFullYear(o+1,0,u),f.setHours(0,0,0,0);const h=ul(f,a),m=_t((a==null?void 0:a.in)||n,0);m.setFullYear(o,0,u),m.setHours(0,0,0,0);const g=ul(m,a);return+r>=+h?o+1:+r>=+g?o:o-1}function kM(n,a){var h,m,g,y;const r=xi(),o=(a==null?void 0:a.firstWeekContainsDate)??((m=(h=a==null?void 0:a.locale)==null?void 0:h.options)==null?void 0:m.firstWeekContainsDate)??r.firstWeekContainsDate??((y=(g=r.locale)==null?void 0:g.options)==null?void 0:y.firstWeekContainsDate)??1,s=hS(n,a),u=_t((a==null?void 0:a.in)||n,0);return u.setFullYear(s,0,o),u.setHours(0,0,0,0),ul(u,a)}function _h(n,a){const r=st(n,a==null?void 0:a.in),o=+ul(r,a)-+kM(r,a);return Math.round(o/aS)+1}function at(n,a){const r=n<0?"-":"",o=Math.abs(n).toString().padStart(a,"0");return r+o}const rl={y(n,a){const r=n.getFullYear(),o=r>0?r:1-r;return at(a==="yy"?o%100:o,a.length)},M(n,a){const r=n.getMonth();return a==="M"?String(r+1):at(r+1,2)},d(n,a){return at(n.getDate(),a.length)},a(n,a){const r=n.getHours()/12>=1?"pm":"am";switch(a){case"a":case"aa":return r.toUpperCase();case"aaa":return r;case"aaaaa":return r[0];case"aaaa":default:return r==="am"?"a.m.":"p.m."}},h(n,a){return at(n.getHours()%12||12,a.length)},H(n,a){return at(n.getHours(),a.length)},m(n,a){return at(n.getMinutes(),a.length)},s(n,a){return at(n.getSeconds(),a.length)},S(n,a){const r=a.length,o=n.getMilliseconds(),s=Math.trunc(o*Math.pow(10,r-3));return at(s,a.length)}},Mr={midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},Yy={G:function(n,a,r){const o=n.getFullYear()>0?1:0;switch(a){case"G":case"GG":case"GGG":return r.era(o,{width:"abbreviated"});case"GGGGG":return r.era(o,{width:"narrow"});case"GGGG":default:return r.era(o,{width:"wide"})}},y:function(n,a,r){if(a==="yo"){const o=n.getFullYear(),s=o>0?o:1-o;return r.ordinalNumber(s,{unit:"year"})}return rl.y(n,a)},Y:function(n,a,r,o){const s=hS(n,o),u=s>0?s:1-s;if(a==="YY"){const f=u%100;return at(f,2)}return a==="Yo"?r.ordinalNumber(u,{unit:"year"}):at(u,a.length)},R:function(n,a){const r=iS(n);return at(r,a.length)},u:function(n,a){const r=n.getFullYear();return at(r,a.length)},Q:function(n,a,r){const o=Math.ceil((n.getMonth()+1)/3);switch(a){case"Q":return String(o);case"QQ":return at(o,2);case"Qo":return r.ordinalNumber(o,{unit:"quarter"});case"QQQ":return r.quarter(o,{width:"abbreviated",context:"formatting"});case"QQQQQ":return r.quarter(o,{width:"narrow",context:"formatting"});case"QQQQ":default:return r.quarter(o,{width:"wide",context:"formatting"})}},q:function(n,a,r){const o=Math.ceil((n.getMonth()+1)/3);switch(a){case"q":return String(o);case"qq":return at(o,2);case"qo":return r.ordinalNumber(o,{unit:"quarter"});case"qqq":return r.quarter(o,{width:"abbreviated",context:"standalone"});case"qqqqq":return r.quarter(o,{width:"narrow",context:"standalone"});case"qqqq":default:return r.quarter(o,{width:"wide",context:"standalone"})}},M:function(n,a,r){const o=n.getMonth();switch(a){case"M":case"MM":return rl.M(n,a);case"Mo":return r.ordinalNumber(o+1,{unit:"month"});case"MMM":return r.month(o,{width:"abbreviated",context:"formatting"});case"MMMMM":return r.month(o,{width:"narrow",context:"formatting"});case"MMMM":default:return r.month(o,{width:"wide",context:"formatting"})}},L:function(n,a,r){const o=n.getMonth();switch(a){case"L":return String(o+1);case"LL":return at(o+1,2);case"Lo":return r.ordinalNumber(o+1,{unit:"month"});case"LLL":return r.month(o,{width:"abbreviated",context:"standalone"});case"LLLLL":return r.month(o,{width:"narrow",context:"standalone"});case"LLLL":default:return r.month(o,{width:"wide",context:"standalone"})}},w:function(n,a,r,o){const s=_h(n,o);return a==="wo"?r.ordinalNumber(s,{unit:"week"}):at(s,a.length)},I:function(n,a,r){const o=Th(n);return a==="Io"?r.ordinalNumber(o,{unit:"week"}):at(o,a.length)},d:function(n,a,r){return a==="do"?r.ordinalNumber(n.getDate(),{unit:"date"}):rl.d(n,a)},D:function(n,a,r){const o=OM(n);return a==="Do"?r.ordinalNumber(o,{unit:"dayOfYear"}):at(o,a.length)},E:function(n,a,r){const o=n.getDay();switch(a){case"E":case"EE":case"EEE":return r.day(o,{width:"abbreviated",context:"formatting"});case"EEEEE":return r.day(o,{width:"narrow",context:"formatting"});case"EEEEEE":return r.day(o,{width:"short",context:"formatting"});case"EEEE":default:return r.day(o,{width:"wide",context:"formatting"})}},e:function(n,a,r,o){const s=n.getDay(),u=(s-o.weekStartsOn+8)%7||7;switch(a){case"e":return String(u);case"ee":return at(u,2);case"eo":return r.ordinalNumber(u,{unit:"day"});case"eee":return r.day(s,{width:"abbreviated",context:"formatting"});case"eeeee":return r.day(s,{width:"narrow",context:"formatting"});case"eeeeee":return r.day(s,{width:"short",context:"formatting"});case"eeee":default:return r.day(s,{width:"wide",context:"formatting"})}},c:function(n,a,r,o){const s=n.getDay(),u=(s-o.weekStartsOn+8)%7||7;switch(a){case"c":return String(u);case"cc":return at(u,a.length);case"co":return r.ordinalNumber(u,{unit:"day"});case"ccc":return r.day(s,{width:"abbreviated",context:"standalone"});case"ccccc":return r.day(s,{width:"narrow",context:"standalone"});case"cccccc":return r.day(s,{width:"short",context:"standalone"});case"cccc":default:return r.day(s,{width:"wide",context:"standalone"})}},i:function(n,a,r){const o=n.getDay(),s=o===0?7:o;switch(a){case"i":return String(s);case"ii":return at(s,a.length);case"io":return r.ordinalNumber(s,{unit:"day"});case"iii":return r.day(o,{width:"abbreviated",context:"formatting"});case"iiiii":return r.day(o,{width:"narrow",context:"formatting"});case"iiiiii":return r.day(o,{width:"short",context:"formatting"});case"iiii":default:return r.day(o,{width:"wide",context:"formatting"})}},a:function(n,a,r){const s=n.getHours()/12>=1?"pm":"am";switch(a){case"a":case"aa":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"aaa":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"}).toLowerCase();case"aaaaa":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"aaaa":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},b:function(n,a,r){const o=n.getHours();let s;switch(o===12?s=Mr.noon:o===0?s=Mr.midnight:s=o/12>=1?"pm":"am",a){case"b":case"bb":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"bbb":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"}).toLowerCase();case"bbbbb":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"bbbb":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},B:function(n,a,r){const o=n.getHours();let s;switch(o>=17?s=Mr.evening:o>=12?s=Mr.afternoon:o>=4?s=Mr.morning:s=Mr.night,a){case"B":case"BB":case"BBB":return r.dayPeriod(s,{width:"abbreviated",context:"formatting"});case"BBBBB":return r.dayPeriod(s,{width:"narrow",context:"formatting"});case"BBBB":default:return r.dayPeriod(s,{width:"wide",context:"formatting"})}},h:function(n,a,r){if(a==="ho"){let o=n.getHours()%12;return o===0&&(o=12),r.ordinalNumber(o,{unit:"hour"})}return rl.h(n,a)},H:function(n,a,r){return a==="Ho"?r.ordinalNumber(n.getHours(),{unit:"hour"}):rl.H(n,a)},K:function(n,a,r){const o=n.getHours()%12;return a==="Ko"?r.ordinalNumber(o,{unit:"hour"}):at(o,a.length)},k:function(n,a,r){let o=n.getHours();return o===0&&(o=24),a==="ko"?r.ordinalNumber(o,{unit:"hour"}):at(o,a.length)},m:function(n,a,r){return a==="mo"?r.ordinalNumber(n.getMinutes(),{unit:"minute"}):rl.m(n,a)},s:function(n,a,r){return a==="so"?r.ordinalNumber(n.getSeconds(),{unit:"second"}):rl.s(n,a)},S:function(n,a){return rl.S(n,a)},X:function(n,a,r){const o=n.getTimezoneOffset();if(o===0)return"Z";switch(a){case"X":return Wy(o);case"XXXX":case"XX":return Al(o);case"XXXXX":case"XXX":default:return Al(o,":")}},x:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"x":return Wy(o);case"xxxx":case"xx":return Al(o);case"xxxxx":case"xxx":default:return Al(o,":")}},O:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"O":case"OO":case"OOO":return"GMT"+Py(o,":");case"OOOO":default:return"GMT"+Al(o,":")}},z:function(n,a,r){const o=n.getTimezoneOffset();switch(a){case"z":case"zz":case"zzz":return"GMT"+Py(o,":");case"zzzz":default:return"GMT"+Al(o,":")}},t:function(n,a,r){const o=Math.trunc(+n/1e3);return at(o,a.length)},T:function(n,a,r){return at(+n,a.length)}};function Py(n,a=""){const r=n>0?"-":"+",o=Math.abs(n),s=Math.trunc(o/60),u=o%60;return u===0?r+String(s):r+String(s)+a+at(u,2)}function Wy(n,a){return n%60===0?(n>0?"-":"+")+at(Math.abs(n)/60,2):Al(n,a)}function Al(n,a=""){const r=n>0?"-":"+",o=Math.abs(n),s=at(Math.trunc(o/60),2),u=at(o%60,2);return r+s+a+u}const Vy=(n,a)=>{switch(n){case"P":return a.date({width:"short"});case"PP":return a.date({width:"medium"});case"PPP":return a.date({width:"long"});case"PPPP":default:return a.date({width:"full"})}},mS=(n,a)=>{switch(n){case"p":return a.time({width:"short"});case"pp":return a.time({width:"medium"});case"ppp":return a.time({width:"long"});case"pppp":default:return a.time({width:"full"})}},MM=(n,a)=>{const r=n.match(/(P+)(p+)?/)||[],o=r[1],s=r[2];if(!s)return Vy(n,a);let u;switch(o){case"P":u=a.dateTime({width:"short"});break;case"PP":u=a.dateTime({width:"medium"});break;case"PPP":u=a.dateTime({width:"long"});break;case"PPPP":default:u=a.dateTime({width:"full"});break}return u.replace("{{date}}",Vy(o,a)).replace("{{time}}",mS(s,a))},DM={p:mS,P:MM},RM=/^D+$/,AM=/^Y+$/,zM=["D","DD","YY","YYYY"];function BM(n){return RM.test(n)}function UM(n){return AM.test(n)}function HM(n,a,r){const o=LM(n,a,r);if(console.warn(o),zM.includes(n))throw new RangeError(o)}function LM(n,a,r){const o=n[0]==="Y"?"years":"days of the month";return`Use \`${n.toLowerCase()}\` instead of \`${n}\` (in \`${a}\`) for formatting ${o} to the input \`${r}\`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md`}const YM=/[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g,PM=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g,WM=/^'([^]*?)'?$/,VM=/''/g,qM=/[a-zA-Z]/;function ai(n,a,r){var y,x,S,j,M,C,N,E;const o=xi(),s=(r==null?void 0:r.locale)??o.locale??Ar,u=(r==null?void 0:r.firstWeekContainsDate)??((x=(y=r==null?void 0:r.locale)==null?void 0:y.options)==null?void 0:x.firstWeekContainsDate)??o.firstWeekContainsDate??((j=(S=o.locale)==null?void 0:S.options)==null?void 0:j.firstWeekContainsDate)??1,f=(r==null?void 0:r.weekStartsOn)??((C=(M=r==null?void 0:r.locale)==null?void 0:M.options)==null?void 0:C.weekStartsOn)??o.weekStartsOn??((E=(N=o.locale)==null?void 0:N.options)==null?void 0:E.weekStartsOn)??0,h=st(n,r==null?void 0:r.in);if(!wM(h))throw new RangeError("Invalid time value");let m=a.match(PM).map(O=>{const _=O[0];if(_==="p"||_==="P"){const z=DM[_];return z(O,s.formatLong)}return O}).join("").match(YM).map(O=>{if(O==="''")return{isToken:!1,value:"'"};const _=O[0];if(_==="'")return{isToken:!1,value:GM(O)};if(Yy[_])return{isToken:!0,value:O};if(_.match(qM))throw new RangeError("Format string contains an unescaped latin alphabet character `"+_+"`");return{isToken:!1,value:O}});s.localize.preprocessor&&(m=s.localize.preprocessor(h,m));const g={firstWeekContainsDate:u,weekStartsOn:f,locale:s};return m.map(O=>{if(!O.isToken)return O.value;const _=O.value;(!(r!=null&&r.useAdditionalWeekYearTokens)&&UM(_)||!(r!=null&&r.useAdditionalDayOfYearTokens)&&BM(_))&&HM(_,a,String(n));const z=Yy[_[0]];return z(h,_,s.localize,g)}).join("")}function GM(n){const a=n.match(WM);return a?a[1].replace(VM,"'"):n}function XM(n,a){const r=st(n,a==null?void 0:a.in),o=r.getFullYear(),s=r.getMonth(),u=_t(r,0);return u.setFullYear(o,s+1,0),u.setHours(0,0,0,0),u.getDate()}function $M(n,a){return st(n,a==null?void 0:a.in).getMonth()}function FM(n,a){return st(n,a==null?void 0:a.in).getFullYear()}function QM(n,a){return+st(n)>+st(a)}function KM(n,a){return+st(n)<+st(a)}function ZM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return o.getFullYear()===s.getFullYear()&&o.getMonth()===s.getMonth()}function IM(n,a,r){const[o,s]=Pl(r==null?void 0:r.in,n,a);return o.getFullYear()===s.getFullYear()}function JM(n,a,r){const o=st(n,r==null?void 0:r.in),s=o.getFullYear(),u=o.getDate(),f=_t(n,0);f.setFullYear(s,a,15),f.setHours(0,0,0,0);const h=XM(f);return o.setMonth(a,Math.min(u,h)),o}function eD(n,a,r){const o=st(n,r==null?void 0:r.in);return isNaN(+o)?_t(n,NaN):(o.setFullYear(a),o)}const qy=5,tD=4;function nD(n,a){const r=a.startOfMonth(n),o=r.getDay()>0?r.getDay():7,s=a.addDays(n,-o+1),u=a.addDays(s,qy*7-1);return a.getMonth(n)===a.getMonth(u)?qy:tD}function pS(n,a){const r=a.startOfMonth(n),o=r.getDay();return o===1?r:o===0?a.addDays(r,-6):a.addDays(r,-1*(o-1))}function aD(n,a){const r=pS(n,a),o=nD(n,a);return a.addDays(r,o*7-1)}const gS={...Ar,labels:{labelDayButton:(n,a,r,o)=>{let s;o&&typeof o.format=="function"?s=o.format.bind(o):s=(f,h)=>ai(f,h,{locale:Ar,...r});let u=s(n,"PPPP");return a.today&&(u=`Today, ${u}`),a.selected&&(u=`${u}, selected`),u},labelMonthDropdown:"Choose the Month",labelNext:"Go to the Next Month",labelPrevious:"Go to the Previous Month",labelWeekNumber:n=>`Week ${n}`,labelYearDropdown:"Choose the Year",labelGrid:(n,a,r)=>{let o;return r&&typeof r.format=="function"?o=r.format.bind(r):o=(s,u)=>ai(s,u,{locale:Ar,...a}),o(n,"LLLL yyyy")},labelGridcell:(n,a,r,o)=>{let s;o&&typeof o.format=="function"?s=o.format.bind(o):s=(f,h)=>ai(f,h,{locale:Ar,...r});let u=s(n,"PPPP");return a!=null&&a.today&&(u=`Today, ${u}`),u},labelNav:"Navigation bar",labelWeekNumberHeader:"Week Number",labelWeekday:(n,a,r)=>{let o;return r&&typeof r.format=="function"?o=r.format.bind(r):o=(s,u)=>ai(s,u,{locale:Ar,...a}),o(n,"cccc")}}};class Vt{constructor(a,r){this.Date=Date,this.today=()=>{var o;return(o=this.overrides)!=null&&o.today?this.overrides.today():this.options.timeZone?Xt.tz(this.options.timeZone):new this.Date},this.newDate=(o,s,u)=>{var f;return(f=this.overrides)!=null&&f.newDate?this.overrides.newDate(o,s,u):this.options.timeZone?new Xt(o,s,u,this.options.timeZone):new Date(o,s,u)},this.addDays=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addDays?this.overrides.addDays(o,s):rS(o,s)},this.addMonths=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addMonths?this.overrides.addMonths(o,s):oS(o,s)},this.addWeeks=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addWeeks?this.overrides.addWeeks(o,s):vM(o,s)},this.addYears=(o,s)=>{var u;return(u=this.overrides)!=null&&u.addYears?this.overrides.addYears(o,s):yM(o,s)},this.differenceInCalendarDays=(o,s)=>{var u;return(u=this.overrides)!=null&&u.differenceInCalendarDays?this.overrides.differenceInCalendarDays(o,s):Eh(o,s)},this.differenceInCalendarMonths=(o,s)=>{var u;return(u=this.overrides)!=null&&u.differenceInCalendarMonths?this.overrides.differenceInCalendarMonths(o,s):cS(o,s)},this.eachMonthOfInterval=o=>{var s;return(s=this.overrides)!=null&&s.eachMonthOfInterval?this.overrides.eachMonthOfInterval(o):jM(o)},this.eachYearOfInterval=o=>{var h;const s=(h=this.overrides)!=null&&h.eachYearOfInterval?this.overrides.eachYearOfInterval(o):TM(o),u=new Set(s.map(m=>this.getYear(m)));if(u.size===s.length)return s;const f=[];return u.forEach(m=>{f.push(new Date(m,0,1))}),f},this.endOfBroadcastWeek=o=>{var s;return(s=this.overrides)!=null&&s.endOfBroadcastWeek?this.overrides.endOfBroadcastWeek(o):aD(o,this)},this.endOfISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.endOfISOWeek?this.overrides.endOfISOWeek(o):_M(o)},this.endOfMonth=o=>{var s;return(s=this.overrides)!=null&&s.endOfMonth?this.overrides.endOfMonth(o):CM(o)},this.endOfWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.endOfWeek?this.overrides.endOfWeek(o,s):fS(o,this.options)},this.endOfYear=o=>{var s;return(s=this.overrides)!=null&&s.endOfYear?this.overrides.endOfYear(o):EM(o)},this.format=(o,s,u)=>{var h;const f=(h=this.overrides)!=null&&h.format?this.overrides.format(o,s,this.options):ai(o,s,this.options);return this.options.numerals&&this.options.numerals!=="latn"?this.replaceDigits(f):f},this.getISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.getISOWeek?this.overrides.getISOWeek(o):Th(o)},this.getMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getMonth?this.overrides.getMonth(o,this.options):$M(o,this.options)},this.getYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getYear?this.overrides.getYear(o,this.options):FM(o,this.options)},this.getWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.getWeek?this.overrides.getWeek(o,this.options):_h(o,this.options)},this.isAfter=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isAfter?this.overrides.isAfter(o,s):QM(o,s)},this.isBefore=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isBefore?this.overrides.isBefore(o,s):KM(o,s)},this.isDate=o=>{var s;return(s=this.overrides)!=null&&s.isDate?this.overrides.isDate(o):sS(o)},this.isSameDay=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameDay?this.overrides.isSameDay(o,s):SM(o,s)},this.isSameMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameMonth?this.overrides.isSameMonth(o,s):ZM(o,s)},this.isSameYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.isSameYear?this.overrides.isSameYear(o,s):IM(o,s)},this.max=o=>{var s;return(s=this.overrides)!=null&&s.max?this.overrides.max(o):xM(o)},this.min=o=>{var s;return(s=this.overrides)!=null&&s.min?this.overrides.min(o):bM(o)},this.setMonth=(o,s)=>{var u;return(u=this.overrides)!=null&&u.setMonth?this.overrides.setMonth(o,s):JM(o,s)},this.setYear=(o,s)=>{var u;return(u=this.overrides)!=null&&u.setYear?this.overrides.setYear(o,s):eD(o,s)},this.startOfBroadcastWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.startOfBroadcastWeek?this.overrides.startOfBroadcastWeek(o,this):pS(o,this)},this.startOfDay=o=>{var s;return(s=this.overrides)!=null&&s.startOfDay?this.overrides.startOfDay(o):ci(o)},this.startOfISOWeek=o=>{var s;return(s=this.overrides)!=null&&s.startOfISOWeek?this.overrides.startOfISOWeek(o):si(o)},this.startOfMonth=o=>{var s;return(s=this.overrides)!=null&&s.startOfMonth?this.overrides.startOfMonth(o):NM(o)},this.startOfWeek=(o,s)=>{var u;return(u=this.overrides)!=null&&u.startOfWeek?this.overrides.startOfWeek(o,this.options):ul(o,this.options)},this.startOfYear=o=>{var s;return(s=this.overrides)!=null&&s.startOfYear?this.overrides.startOfYear(o):dS(o)},this.options={locale:gS,...a},this.overrides=r}getDigitMap(){const{numerals:a="latn"}=this.options,r=new Intl.NumberFormat("en-US",{numberingSystem:a}),o={};for(let s=0;s<10;s++)o[s.toString()]=r.format(s);return o}replaceDigits(a){const r=this.getDigitMap();return a.replace(/\d/g,o=>r[o]||o)}formatNumber(a){return this.replaceDigits(a.toString())}getMonthYearOrder(){var r;const a=(r=this.options.locale)==null?void 0:r.code;return a&&Vt.yearFirstLocales.has(a)?"year-first":"month-first"}formatMonthYear(a){const{locale:r,timeZone:o,numerals:s}=this.options,u=r==null?void 0:r.code;if(u&&Vt.yearFirstLocales.has(u))try{return new Intl.DateTimeFormat(u,{month:"long",year:"numeric",timeZone:o,numberingSystem:s}).format(a)}catch{}const f=this.getMonthYearOrder()==="year-first"?"y LLLL":"LLLL y";return this.format(a,f)}}Vt.yearFirstLocales=new Set(["eu","hu","ja","ja-Hira","ja-JP","ko","ko-KR","lt","lt-LT","lv","lv-LV","mn","mn-MN","zh","zh-CN","zh-HK","zh-TW"]);const ra=new Vt,lD={...fM,labels:{labelDayButton:(n,a,r,o)=>{let u=(o??new Vt(r)).format(n,"PPPP");return a.today&&(u=`今天，${u}`),a.selected&&(u=`${u}，已选择`),u},labelMonthDropdown:"选择月份",labelNext:"前往下个月",labelPrevious:"前往上个月",labelWeekNumber:n=>`第 ${n} 周`,labelYearDropdown:"选择年份",labelGrid:(n,a,r)=>(r??new Vt(a)).formatMonthYear(n),labelGridcell:(n,a,r,o)=>{let u=(o??new Vt(r)).format(n,"PPPP");return a!=null&&a.today&&(u=`今天，${u}`),u},labelNav:"导航栏",labelWeekNumberHeader:"周数",labelWeekday:(n,a,r)=>(r??new Vt(a)).format(n,"cccc")}};class vS{constructor(a,r,o=ra){this.date=a,this.displayMonth=r,this.outside=!!(r&&!o.isSameMonth(a,r)),this.dateLib=o,this.isoDate=o.format(a,"yyyy-MM-dd"),this.displayMonthId=o.format(r,"yyyy-MM"),this.dateMonthId=o.format(a,"yyyy-MM")}isEqualTo(a){return this.dateLib.isSameDay(a.date,this.date)&&this.dateLib.isSameMonth(a.displayMonth,this.displayMonth)}}class rD{constructor(a,r){this.date=a,this.weeks=r}}class oD{constructor(a,r){this.days=r,this.weekNumber=a}}function iD(n){return oe.createElement("button",{...n})}function sD(n){return oe.createElement("span",{...n})}function cD(n){const{size:a=24,orientation:r="left",className:o}=n;return oe.createElement("svg",{className:o,width:a,height:a,viewBox:"0 0 24 24"},r==="up"&&oe.createElement("polygon",{points:"6.77 17 12.5 11.43 18.24 17 20 15.28 12.5 8 5 15.28"}),r==="down"&&oe.createElement("polygon",{points:"6.77 8 12.5 13.57 18.24 8 20 9.72 12.5 17 5 9.72"}),r==="left"&&oe.createElement("polygon",{points:"16 18.112 9.81111111 12 16 5.87733333 14.0888889 4 6 12 14.0888889 20"}),r==="right"&&oe.createElement("polygon",{points:"8 18.112 14.18888889 12 8 5.87733333 9.91111111 4 18 12 9.91111111 20"}))}function uD(n){const{day:a,modifiers:r,...o}=n;return oe.createElement("td",{...o})}function dD(n){const{day:a,modifiers:r,...o}=n,s=oe.useRef(null);return oe.useEffect(()=>{var u;r.focused&&((u=s.current)==null||u.focus())},[r.focused]),oe.createElement("button",{ref:s,...o})}var ye;(function(n){n.Root="root",n.Chevron="chevron",n.Day="day",n.DayButton="day_button",n.CaptionLabel="caption_label",n.Dropdowns="dropdowns",n.Dropdown="dropdown",n.DropdownRoot="dropdown_root",n.Footer="footer",n.MonthGrid="month_grid",n.MonthCaption="month_caption",n.MonthsDropdown="months_dropdown",n.Month="month",n.Months="months",n.Nav="nav",n.NextMonthButton="button_next",n.PreviousMonthButton="button_previous",n.Week="week",n.Weeks="weeks",n.Weekday="weekday",n.Weekdays="weekdays",n.WeekNumber="week_number",n.WeekNumberHeader="week_number_header",n.YearsDropdown="years_dropdown"})(ye||(ye={}));var gt;(function(n){n.disabled="disabled",n.hidden="hidden",n.outside="outside",n.focused="focused",n.today="today"})(gt||(gt={}));var Yn;(function(n){n.range_end="range_end",n.range_middle="range_middle",n.range_start="range_start",n.selected="selected"})(Yn||(Yn={}));var pn;(function(n){n.weeks_before_enter="weeks_before_enter",n.weeks_before_exit="weeks_before_exit",n.weeks_after_enter="weeks_after_enter",n.weeks_after_exit="weeks_after_exit",n.caption_after_enter="caption_after_enter",n.caption_after_exit="caption_after_exit",n.caption_before_enter="caption_before_enter",n.caption_before_exit="caption_before_exit"})(pn||(pn={}));function fD(n){const{options:a,className:r,components:o,classNames:s,...u}=n,f=[s[ye.Dropdown],r].join(" "),h=a==null?void 0:a.find(({value:m})=>m===u.value);return oe.createElement("span",{"data-disabled":u.disabled,className:s[ye.DropdownRoot]},oe.createElement(o.Select,{className:f,...u},a==null?void 0:a.map(({value:m,label:g,disabled:y})=>oe.createElement(o.Option,{key:m,value:m,disabled:y},g))),oe.createElement("span",{className:s[ye.CaptionLabel],"aria-hidden":!0},h==null?void 0:h.label,oe.createElement(o.Chevron,{orientation:"down",size:18,className:s[ye.Chevron]})))}function hD(n){return oe.createElement("div",{...n})}function mD(n){return oe.createElement("div",{...n})}function pD(n){const{calendarMonth:a,displayIndex:r,...o}=n;return oe.createElement("div",{...o},n.children)}function gD(n){const{calendarMonth:a,displayIndex:r,...o}=n;return oe.createElement("div",{...o})}function vD(n){return oe.createElement("table",{...n})}function yD(n){return oe.createElement("div",{...n})}const yS=v.createContext(void 0);function bi(){const n=v.useContext(yS);if(n===void 0)throw new Error("useDayPicker() must be used within a custom component.");return n}function xD(n){const{components:a}=bi();return oe.createElement(a.Dropdown,{...n})}function bD(n){const{onPreviousClick:a,onNextClick:r,previousMonth:o,nextMonth:s,...u}=n,{components:f,classNames:h,labels:{labelPrevious:m,labelNext:g}}=bi(),y=v.useCallback(S=>{s&&(r==null||r(S))},[s,r]),x=v.useCallback(S=>{o&&(a==null||a(S))},[o,a]);return oe.createElement("nav",{...u},oe.createElement(f.PreviousMonthButton,{type:"button",className:h[ye.PreviousMonthButton],tabIndex:o?void 0:-1,"aria-disabled":o?void 0:!0,"aria-label":m(o),onClick:x},oe.createElement(f.Chevron,{disabled:o?void 0:!0,className:h[ye.Chevron],orientation:"left"})),oe.createElement(f.NextMonthButton,{type:"button",className:h[ye.NextMonthButton],tabIndex:s?void 0:-1,"aria-disabled":s?void 0:!0,"aria-label":g(s),onClick:y},oe.createElement(f.Chevron,{disabled:s?void 0:!0,orientation:"right",className:h[ye.Chevron]})))}function SD(n){const{components:a}=bi();return oe.createElement(a.Button,{...n})}function wD(n){return oe.createElement("option",{...n})}function CD(n){const{components:a}=bi();return oe.createElement(a.Button,{...n})}function jD(n){const{rootRef:a,...r}=n;return oe.createElement("div",{...r,ref:a})}function ND(n){return oe.createElement("select",{...n})}function ED(n){const{week:a,...r}=n;return oe.createElement("tr",{...r})}function TD(n){return oe.createElement("th",{...n})}function _D(n){return oe.createElement("thead",{"aria-hidden":!0},oe.createElement("tr",{...n}))}function OD(n){const{week:a,...r}=n;return oe.createElement("th",{...r})}function kD(n){return oe.createElement("th",{...n})}function MD(n){return oe.createElement("tbody",{...n})}function DD(n){const{components:a}=bi();return oe.createElement(a.Dropdown,{...n})}const RD=Object.freeze(Object.defineProperty({__proto__:null,Button:iD,CaptionLabel:sD,Chevron:cD,Day:uD,DayButton:dD,Dropdown:fD,DropdownNav:hD,Footer:mD,Month:pD,MonthCaption:gD,MonthGrid:vD,Months:yD,MonthsDropdown:xD,Nav:bD,NextMonthButton:SD,Option:wD,PreviousMonthButton:CD,Root:jD,Select:ND,Week:ED,WeekNumber:OD,WeekNumberHeader:kD,Weekday:TD,Weekdays:_D,Weeks:MD,YearsDropdown:DD},Symbol.toStringTag,{value:"Module"}));function Ea(n,a,r=!1,o=ra){let{from:s,to:u}=n;const{differenceInCalendarDays:f,isSameDay:h}=o;return s&&u?(f(u,s)<0&&([s,u]=[u,s]),f(a,s)>=(r?1:0)&&f(u,a)>=(r?1:0)):!r&&u?h(u,a):!r&&s?h(s,a):!1}function Oh(n){return!!(n&&typeof n=="object"&&"before"in n&&"after"in n)}function kc(n){return!!(n&&typeof n=="object"&&"from"in n)}function kh(n){return!!(n&&typeof n=="object"&&"after"in n)}function Mh(n){return!!(n&&typeof n=="object"&&"before"in n)}function xS(n){return!!(n&&typeof n=="object"&&"dayOfWeek"in n)}function bS(n,a){return Array.isArray(n)&&n.every(a.isDate)}function Ta(n,a,r=ra){const o=Array.isArray(a)?a:[a],{isSameDay:s,differenceInCalendarDays:u,isAfter:f}=r;return o.some(h=>{if(typeof h=="boolean")return h;if(r.isDate(h))return s(n,h);if(bS(h,r))return h.some(m=>s(n,m));if(kc(h))return Ea(h,n,!1,r);if(xS(h))return Array.isArray(h.dayOfWeek)?h.dayOfWeek.includes(n.getDay()):h.dayOfWeek===n.getDay();if(Oh(h)){const m=u(h.before,n),g=u(h.after,n),y=m>0,x=g<0;return f(h.before,h.after)?x&&y:y||x}return kh(h)?u(n,h.after)>0:Mh(h)?u(h.before,n)>0:typeof h=="function"?h(n):!1})}function AD(n,a,r,o,s){const{disabled:u,hidden:f,modifiers:h,showOutsideDays:m,broadcastCalendar:g,today:y=s.today()}=a,{isSameDay:x,isSameMonth:S,startOfMonth:j,isBefore:M,endOfMonth:C,isAfter:N}=s,E=r&&j(r),O=o&&C(o),_={[gt.focused]:[],[gt.outside]:[],[gt.disabled]:[],[gt.hidden]:[],[gt.today]:[]},z={};for(const D of n){const{date:k,displayMonth:T}=D,Y=!!(T&&!S(k,T)),H=!!(E&&M(k,E)),Z=!!(O&&N(k,O)),ne=!!(u&&Ta(k,u,s)),fe=!!(f&&Ta(k,f,s))||H||Z||!g&&!m&&Y||g&&m===!1&&Y,ve=x(k,y);Y&&_.outside.push(D),ne&&_.disabled.push(D),fe&&_.hidden.push(D),ve&&_.today.push(D),h&&Object.keys(h).forEach($=>{const se=h==null?void 0:h[$];se&&Ta(k,se,s)&&(z[$]?z[$].push(D):z[$]=[D])})}return D=>{const k={[gt.focused]:!1,[gt.disabled]:!1,[gt.hidden]:!1,[gt.outside]:!1,[gt.today]:!1},T={};for(const Y in _){const H=_[Y];k[Y]=H.some(Z=>Z===D)}for(const Y in z)T[Y]=z[Y].some(H=>H===D);return{...k,...T}}}function zD(n,a,r={}){return Object.entries(n).filter(([,s])=>s===!0).reduce((s,[u])=>(r[u]?s.push(r[u]):a[gt[u]]?s.push(a[gt[u]]):a[Yn[u]]&&s.push(a[Yn[u]]),s),[a[ye.Day]])}function BD(n){return{...RD,...n}}function UD(n){const a={"data-mode":n.mode??void 0,"data-required":"required"in n?n.required:void 0,"data-multiple-months":n.numberOfMonths&&n.numberOfMonths>1||void 0,"data-week-numbers":n.showWeekNumber||void 0,"data-broadcast-calendar":n.broadcastCalendar||void 0,"data-nav-layout":n.navLayout||void 0};return Object.entries(n).forEach(([r,o])=>{r.startsWith("data-")&&(a[r]=o)}),a}function Dh(){const n={};for(const a in ye)n[ye[a]]=`rdp-${ye[a]}`;for(const a in gt)n[gt[a]]=`rdp-${gt[a]}`;for(const a in Yn)n[Yn[a]]=`rdp-${Yn[a]}`;for(const a in pn)n[pn[a]]=`rdp-${pn[a]}`;return n}function SS(n,a,r){return(r??new Vt(a)).formatMonthYear(n)}const HD=SS;function LD(n,a,r){return(r??new Vt(a)).format(n,"d")}function YD(n,a=ra){return a.format(n,"LLLL")}function PD(n,a,r){return(r??new Vt(a)).format(n,"cccccc")}function WD(n,a=ra){return n<10?a.formatNumber(`0${n.toLocaleString()}`):a.formatNumber(`${n.toLocaleString()}`)}function VD(){return""}function wS(n,a=ra){return a.format(n,"yyyy")}const qD=wS,GD=Object.freeze(Object.defineProperty({__proto__:null,formatCaption:SS,formatDay:LD,formatMonthCaption:HD,formatMonthDropdown:YD,formatWeekNumber:WD,formatWeekNumberHeader:VD,formatWeekdayName:PD,formatYearCaption:qD,formatYearDropdown:wS},Symbol.toStringTag,{value:"Module"}));function XD(n){return n!=null&&n.formatMonthCaption&&!n.formatCaption&&(n.formatCaption=n.formatMonthCaption),n!=null&&n.formatYearCaption&&!n.formatYearDropdown&&(n.formatYearDropdown=n.formatYearCaption),{...GD,...n}}function Rh(n,a,r,o){let s=(o??new Vt(r)).format(n,"PPPP");return a.today&&(s=`Today, ${s}`),a.selected&&(s=`${s}, selected`),s}const $D=Rh;function Ah(n,a,r){return(r??new Vt(a)).formatMonthYear(n)}const FD=Ah;function CS(n,a,r,o){let s=(o??new Vt(r)).format(n,"PPPP");return a!=null&&a.today&&(s=`Today, ${s}`),s}function jS(n){return"Choose the Month"}function NS(){return""}const QD="Go to the Next Month";function ES(n,a){return QD}function TS(n){return"Go to the Previous Month"}function _S(n,a,r){return(r??new Vt(a)).format(n,"cccc")}function OS(n,a){return`Week ${n}`}function kS(n){return"Week Number"}function MS(n){return"Choose the Year"}const KD=Object.freeze(Object.defineProperty({__proto__:null,labelCaption:FD,labelDay:$D,labelDayButton:Rh,labelGrid:Ah,labelGridcell:CS,labelMonthDropdown:jS,labelNav:NS,labelNext:ES,labelPrevious:TS,labelWeekNumber:OS,labelWeekNumberHeader:kS,labelWeekday:_S,labelYearDropdown:MS},Symbol.toStringTag,{value:"Module"})),Hn=(n,a,r)=>a||(r?typeof r=="function"?r:(...o)=>r:n);function ZD(n,a){var o;const r=((o=a.locale)==null?void 0:o.labels)??{};return{...KD,...n??{},labelDayButton:Hn(Rh,n==null?void 0:n.labelDayButton,r.labelDayButton),labelMonthDropdown:Hn(jS,n==null?void 0:n.labelMonthDropdown,r.labelMonthDropdown),labelNext:Hn(ES,n==null?void 0:n.labelNext,r.labelNext),labelPrevious:Hn(TS,n==null?void 0:n.labelPrevious,r.labelPrevious),labelWeekNumber:Hn(OS,n==null?void 0:n.labelWeekNumber,r.labelWeekNumber),labelYearDropdown:Hn(MS,n==null?void 0:n.labelYearDropdown,r.labelYearDropdown),labelGrid:Hn(Ah,n==null?void 0:n.labelGrid,r.labelGrid),labelGridcell:Hn(CS,n==null?void 0:n.labelGridcell,r.labelGridcell),labelNav:Hn(NS,n==null?void 0:n.labelNav,r.labelNav),labelWeekNumberHeader:Hn(kS,n==null?void 0:n.labelWeekNumberHeader,r.labelWeekNumberHeader),labelWeekday:Hn(_S,n==null?void 0:n.labelWeekday,r.labelWeekday)}}function ID(n,a,r,o,s){const{startOfMonth:u,startOfYear:f,endOfYear:h,eachMonthOfInterval:m,getMonth:g}=s;return m({start:f(n),end:h(n)}).map(S=>{const j=o.formatMonthDropdown(S,s),M=g(S),C=a&&S<u(a)||r&&S>u(r)||!1;return{value:M,label:j,disabled:C}})}function JD(n,a={},r={}){let o={...a==null?void 0:a[ye.Day]};return Object.entries(n).filter(([,s])=>s===!0).forEach(([s])=>{o={...o,...r==null?void 0:r[s]}}),o}function eR(n,a,r,o){const s=o??n.today(),u=r?n.startOfBroadcastWeek(s,n):a?n.startOfISOWeek(s):n.startOfWeek(s),f=[];for(let h=0;h<7;h++){const m=n.addDays(u,h);f.push(m)}return f}function tR(n,a,r,o,s=!1){if(!n||!a)return;const{startOfYear:u,endOfYear:f,eachYearOfInterval:h,getYear:m}=o,g=u(n),y=f(a),x=h({start:g,end:y});return s&&x.reverse(),x.map(S=>{const j=r.formatYearDropdown(S,o);return{value:m(S),label:j,disabled:!1}})}function nR(n,a={}){var h;const{weekStartsOn:r,locale:o}=a,s=r??((h=o==null?void 0:o.options)==null?void 0:h.weekStartsOn)??0,u=m=>{const g=typeof m=="number"||typeof m=="string"?new Date(m):m;return new Xt(g.getFullYear(),g.getMonth(),g.getDate(),12,0,0,n)},f=m=>{const g=u(m);return new Date(g.getFullYear(),g.getMonth(),g.getDate(),0,0,0,0)};return{today:()=>u(Xt.tz(n)),newDate:(m,g,y)=>new Xt(m,g,y,12,0,0,n),startOfDay:m=>u(m),startOfWeek:(m,g)=>{const y=u(m),x=(g==null?void 0:g.weekStartsOn)??s,S=(y.getDay()-x+7)%7;return y.setDate(y.getDate()-S),y},startOfISOWeek:m=>{const g=u(m),y=(g.getDay()-1+7)%7;return g.setDate(g.getDate()-y),g},startOfMonth:m=>{const g=u(m);return g.setDate(1),g},startOfYear:m=>{const g=u(m);return g.setMonth(0,1),g},endOfWeek:(m,g)=>{const y=u(m),j=((((g==null?void 0:g.weekStartsOn)??s)+6)%7-y.getDay()+7)%7;return y.setDate(y.getDate()+j),y},endOfISOWeek:m=>{const g=u(m),y=(7-g.getDay())%7;return g.setDate(g.getDate()+y),g},endOfMonth:m=>{const g=u(m);return g.setMonth(g.getMonth()+1,0),g},endOfYear:m=>{const g=u(m);return g.setMonth(11,31),g},eachMonthOfInterval:m=>{const g=u(m.start),y=u(m.end),x=[],S=new Xt(g.getFullYear(),g.getMonth(),1,12,0,0,n),j=y.getFullYear()*12+y.getMonth();for(;S.getFullYear()*12+S.getMonth()<=j;)x.push(new Xt(S,n)),S.setMonth(S.getMonth()+1,1);return x},addDays:(m,g)=>{const y=u(m);return y.setDate(y.getDate()+g),y},addWeeks:(m,g)=>{const y=u(m);return y.setDate(y.getDate()+g*7),y},addMonths:(m,g)=>{const y=u(m);return y.setMonth(y.getMonth()+g),y},addYears:(m,g)=>{const y=u(m);return y.setFullYear(y.getFullYear()+g),y},eachYearOfInterval:m=>{const g=u(m.start),y=u(m.end),x=[],S=new Xt(g.getFullYear(),0,1,12,0,0,n);for(;S.getFullYear()<=y.getFullYear();)x.push(new Xt(S,n)),S.setFullYear(S.getFullYear()+1,0,1);return x},getWeek:(m,g)=>{var x;const y=f(m);return _h(y,{weekStartsOn:(g==null?void 0:g.weekStartsOn)??s,firstWeekContainsDate:(g==null?void 0:g.firstWeekContainsDate)??((x=o==null?void 0:o.options)==null?void 0:x.firstWeekContainsDate)??1})},getISOWeek:m=>{const g=f(m);return Th(g)},differenceInCalendarDays:(m,g)=>{const y=f(m),x=f(g);return Eh(y,x)},differenceInCalendarMonths:(m,g)=>{const y=f(m),x=f(g);return cS(y,x)}}}const Si=n=>n instanceof HTMLElement?n:null,bf=n=>[...n.querySelectorAll("[data-animated-month]")??[]],aR=n=>Si(n.querySelector("[data-animated-month]")),Sf=n=>Si(n.querySelector("[data-animated-caption]")),wf=n=>Si(n.querySelector("[data-animated-weeks]")),lR=n=>Si(n.querySelector("[data-animated-nav]")),rR=n=>Si(n.querySelector("[data-animated-weekdays]"));function oR(n,a,{classNames:r,months:o,focused:s,dateLib:u}){const f=v.useRef(null),h=v.useRef(o),m=v.useRef(!1);v.useLayoutEffect(()=>{const g=h.current;if(h.current=o,!a||!n.current||!(n.current instanceof HTMLElement)||o.length===0||g.length===0||o.length!==g.length)return;const y=u.isSameMonth(o[0].date,g[0].date),x=u.isAfter(o[0].date,g[0].date),S=x?r[pn.caption_after_enter]:r[pn.caption_before_enter],j=x?r[pn.weeks_after_enter]:r[pn.weeks_before_enter],M=f.current,C=n.current.cloneNode(!0);if(C instanceof HTMLElement?(bf(C).forEach(_=>{if(!(_ instanceof HTMLElement))return;const z=aR(_);z&&_.contains(z)&&_.removeChild(z);const D=Sf(_);D&&D.classList.remove(S);const k=wf(_);k&&k.classList.remove(j)}),f.current=C):f.current=null,m.current||y||s)return;const N=M instanceof HTMLElement?bf(M):[],E=bf(n.current);if(E!=null&&E.every(O=>O instanceof HTMLElement)&&N&&N.every(O=>O instanceof HTMLElement)){m.current=!0,n.current.style.isolation="isolate";const O=lR(n.current);O&&(O.style.zIndex="1"),E.forEach((_,z)=>{const D=N[z];if(!D)return;_.style.position="relative",_.style.overflow="hidden";const k=Sf(_);k&&k.classList.add(S);const T=wf(_);T&&T.classList.add(j);const Y=()=>{m.current=!1,n.current&&(n.current.style.isolation=""),O&&(O.style.zIndex=""),k&&k.classList.remove(S),T&&T.classList.remove(j),_.style.position="",_.style.overflow="",_.contains(D)&&_.removeChild(D)};D.style.pointerEvents="none",D.style.position="absolute",D.style.overflow="hidden",D.setAttribute("aria-hidden","true");const H=rR(D);H&&(H.style.opacity="0");const Z=Sf(D);Z&&(Z.classList.add(x?r[pn.caption_before_exit]:r[pn.caption_after_exit]),Z.addEventListener("animationend",Y));const ne=wf(D);ne&&ne.classList.add(x?r[pn.weeks_before_exit]:r[pn.weeks_after_exit]),_.insertBefore(D,_.firstChild)})}})}function iR(n,a,r,o){const s=n[0],u=n[n.length-1],{ISOWeek:f,fixedWeeks:h,broadcastCalendar:m}=r??{},{addDays:g,differenceInCalendarDays:y,differenceInCalendarMonths:x,endOfBroadcastWeek:S,endOfISOWeek:j,endOfMonth:M,endOfWeek:C,isAfter:N,startOfBroadcastWeek:E,startOfISOWeek:O,startOfWeek:_}=o,z=m?E(s,o):f?O(s):_(s),D=m?S(u):f?j(M(u)):C(M(u)),k=a&&(m?S(a):f?j(a):C(a)),T=k&&N(D,k)?k:D,Y=y(T,z),H=x(u,s)+1,Z=[];for(let ve=0;ve<=Y;ve++){const $=g(z,ve);Z.push($)}const fe=(m?35:42)*H;if(h&&Z.length<fe){const ve=fe-Z.length;for(let $=0;$<ve;$++){const se=g(Z[Z.length-1],1);Z.push(se)}}return Z}function sR(n){const a=[];return n.reduce((r,o)=>{const s=o.weeks.reduce((u,f)=>u.concat(f.days.slice()),a.slice());return r.concat(s.slice())},a.slice())}function cR(n,a,r,o){const{numberOfMonths:s=1}=r,u=[];for(let f=0;f<s;f++){const h=o.addMonths(n,f);if(a&&h>a)break;u.push(h)}return u}function Gy(n,a,r,o){const{month:s,defaultMonth:u,today:f=o.today(),numberOfMonths:h=1}=n;let m=s||u||f;const{differenceInCalendarMonths:g,addMonths:y,startOfMonth:x}=o;if(r&&g(r,m)<h-1){const S=-1*(h-1);m=y(r,S)}return a&&g(m,a)<0&&(m=a),x(m)}function uR(n,a,r,o){const{addDays:s,endOfBroadcastWeek:u,endOfISOWeek:f,endOfMonth:h,endOfWeek:m,getISOWeek:g,getWeek:y,startOfBroadcastWeek:x,startOfISOWeek:S,startOfWeek:j}=o,M=n.reduce((C,N)=>{const E=r.broadcastCalendar?x(N,o):r.ISOWeek?S(N):j(N),O=r.broadcastCalendar?u(N):r.ISOWeek?f(h(N)):m(h(N)),_=a.filter(T=>T>=E&&T<=O),z=r.broadcastCalendar?35:42;if(r.fixedWeeks&&_.length<z){const T=a.filter(Y=>{const H=z-_.length;return Y>O&&Y<=s(O,H)});_.push(...T)}const D=_.reduce((T,Y)=>{const H=r.ISOWeek?g(Y):y(Y),Z=T.find(fe=>fe.weekNumber===H),ne=new vS(Y,N,o);return Z?Z.days.push(ne):T.push(new oD(H,[ne])),T},[]),k=new rD(N,D);return C.push(k),C},[]);return r.reverseMonths?M.reverse():M}function dR(n,a){let{startMonth:r,endMonth:o}=n;const{startOfYear:s,startOfDay:u,startOfMonth:f,endOfMonth:h,addYears:m,endOfYear:g,newDate:y,today:x}=a,{fromYear:S,toYear:j,fromMonth:M,toMonth:C}=n;!r&&M&&(r=M),!r&&S&&(r=a.newDate(S,0,1)),!o&&C&&(o=C),!o&&j&&(o=y(j,11,31));const N=n.captionLayout==="dropdown"||n.captionLayout==="dropdown-years";return r?r=f(r):S?r=y(S,0,1):!r&&N&&(r=s(m(n.today??x(),-100))),o?o=h(o):j?o=y(j,11,31):!o&&N&&(o=g(n.today??x())),[r&&u(r),o&&u(o)]}function fR(n,a,r,o){if(r.disableNavigation)return;const{pagedNavigation:s,numberOfMonths:u=1}=r,{startOfMonth:f,addMonths:h,differenceInCalendarMonths:m}=o,g=s?u:1,y=f(n);if(!a)return h(y,g);if(!(m(a,n)<u))return h(y,g)}function hR(n,a,r,o){if(r.disableNavigation)return;const{pagedNavigation:s,numberOfMonths:u}=r,{startOfMonth:f,addMonths:h,differenceInCalendarMonths:m}=o,g=s?u??1:1,y=f(n);if(!a)return h(y,-g);if(!(m(y,a)<=0))return h(y,-g)}function mR(n){const a=[];return n.reduce((r,o)=>r.concat(o.weeks.slice()),a.slice())}function Mc(n,a){const[r,o]=v.useState(n);return[a===void 0?r:a,o]}function pR(n,a){var z;const[r,o]=dR(n,a),{startOfMonth:s,endOfMonth:u}=a,f=Gy(n,r,o,a),[h,m]=Mc(f,n.month?f:void 0);v.useEffect(()=>{const D=Gy(n,r,o,a);m(D)},[n.timeZone]);const{months:g,weeks:y,days:x,previousMonth:S,nextMonth:j}=v.useMemo(()=>{const D=cR(h,o,{numberOfMonths:n.numberOfMonths},a),k=iR(D,n.endMonth?u(n.endMonth):void 0,{ISOWeek:n.ISOWeek,fixedWeeks:n.fixedWeeks,broadcastCalendar:n.broadcastCalendar},a),T=uR(D,k,{broadcastCalendar:n.broadcastCalendar,fixedWeeks:n.fixedWeeks,ISOWeek:n.ISOWeek,reverseMonths:n.reverseMonths},a),Y=mR(T),H=sR(T),Z=hR(h,r,n,a),ne=fR(h,o,n,a);return{months:T,weeks:Y,days:H,previousMonth:Z,nextMonth:ne}},[a,h.getTime(),o==null?void 0:o.getTime(),r==null?void 0:r.getTime(),n.disableNavigation,n.broadcastCalendar,(z=n.endMonth)==null?void 0:z.getTime(),n.fixedWeeks,n.ISOWeek,n.numberOfMonths,n.pagedNavigation,n.reverseMonths]),{disableNavigation:M,onMonthChange:C}=n,N=D=>y.some(k=>k.days.some(T=>T.isEqualTo(D))),E=D=>{if(M)return;let k=s(D);r&&k<s(r)&&(k=s(r)),o&&k>s(o)&&(k=s(o)),m(k),C==null||C(k)};return{months:g,weeks:y,days:x,navStart:r,navEnd:o,previousMonth:S,nextMonth:j,goToMonth:E,goToDay:D=>{N(D)||E(D.date)}}}var Fn;(function(n){n[n.Today=0]="Today",n[n.Selected=1]="Selected",n[n.LastFocused=2]="LastFocused",n[n.FocusedModifier=3]="FocusedModifier"})(Fn||(Fn={}));function Xy(n){return!n[gt.disabled]&&!n[gt.hidden]&&!n[gt.outside]}function gR(n,a,r,o){let s,u=-1;for(const f of n){const h=a(f);Xy(h)&&(h[gt.focused]&&u<Fn.FocusedModifier?(s=f,u=Fn.FocusedModifier):o!=null&&o.isEqualTo(f)&&u<Fn.LastFocused?(s=f,u=Fn.LastFocused):r(f.date)&&u<Fn.Selected?(s=f,u=Fn.Selected):h[gt.today]&&u<Fn.Today&&(s=f,u=Fn.Today))}return s||(s=n.find(f=>Xy(a(f)))),s}function vR(n,a,r,o,s,u,f){const{ISOWeek:h,broadcastCalendar:m}=u,{addDays:g,addMonths:y,addWeeks:x,addYears:S,endOfBroadcastWeek:j,endOfISOWeek:M,endOfWeek:C,max:N,min:E,startOfBroadcastWeek:O,startOfISOWeek:_,startOfWeek:z}=f;let k={day:g,week:x,month:y,year:S,startOfWeek:T=>m?O(T,f):h?_(T):z(T),endOfWeek:T=>m?j(T):h?M(T):C(T)}[n](r,a==="after"?1:-1);return a==="before"&&o?k=N([o,k]):a==="after"&&s&&(k=E([s,k])),k}function DS(n,a,r,o,s,u,f,h=0){if(h>365)return;const m=vR(n,a,r.date,o,s,u,f),g=!!(u.disabled&&Ta(m,u.disabled,f)),y=!!(u.hidden&&Ta(m,u.hidden,f)),x=m,S=new vS(m,x,f);return!g&&!y?S:DS(n,a,S,o,s,u,f,h+1)}function yR(n,a,r,o,s){const{autoFocus:u}=n,[f,h]=v.useState(),m=gR(a.days,r,o||(()=>!1),f),[g,y]=v.useState(u?m:void 0);return{isFocusTarget:C=>!!(m!=null&&m.isEqualTo(C)),setFocused:y,focused:g,blur:()=>{h(g),y(void 0)},moveFocus:(C,N)=>{if(!g)return;const E=DS(C,N,g,a.navStart,a.navEnd,n,s);E&&(n.disableNavigation&&!a.days.some(_=>_.isEqualTo(E))||(a.goToDay(E),y(E)))}}}function xR(n,a){const{selected:r,required:o,onSelect:s}=n,[u,f]=Mc(r,s?r:void 0),h=s?r:u,{isSameDay:m}=a,g=j=>(h==null?void 0:h.some(M=>m(M,j)))??!1,{min:y,max:x}=n;return{selected:h,select:(j,M,C)=>{let N=[...h??[]];if(g(j)){if((h==null?void 0:h.length)===y||o&&(h==null?void 0:h.length)===1)return;N=h==null?void 0:h.filter(E=>!m(E,j))}else(h==null?void 0:h.length)===x?N=[j]:N=[...N,j];return s||f(N),s==null||s(N,j,M,C),N},isSelected:g}}function bR(n,a,r=0,o=0,s=!1,u=ra){const{from:f,to:h}=a||{},{isSameDay:m,isAfter:g,isBefore:y}=u;let x;if(!f&&!h)x={from:n,to:r>0?void 0:n};else if(f&&!h)m(f,n)?r===0?x={from:f,to:n}:s?x={from:f,to:void 0}:x=void 0:y(n,f)?x={from:n,to:f}:x={from:f,to:n};else if(f&&h)if(m(f,n)&&m(h,n))s?x={from:f,to:h}:x=void 0;else if(m(f,n))x={from:f,to:r>0?void 0:n};else if(m(h,n))x={from:n,to:r>0?void 0:n};else if(y(n,f))x={from:n,to:h};else if(g(n,f))x={from:f,to:n};else if(g(n,h))x={from:f,to:n};else throw new Error("Invalid range");if(x!=null&&x.from&&(x!=null&&x.to)){const S=u.differenceInCalendarDays(x.to,x.from);o>0&&S>o?x={from:n,to:void 0}:r>1&&S<r&&(x={from:n,to:void 0})}return x}function SR(n,a,r=ra){const o=Array.isArray(a)?a:[a];let s=n.from;const u=r.differenceInCalendarDays(n.to,n.from),f=Math.min(u,6);for(let h=0;h<=f;h++){if(o.includes(s.getDay()))return!0;s=r.addDays(s,1)}return!1}function $y(n,a,r=ra){return Ea(n,a.from,!1,r)||Ea(n,a.to,!1,r)||Ea(a,n.from,!1,r)||Ea(a,n.to,!1,r)}function wR(n,a,r=ra){const o=Array.isArray(a)?a:[a];if(o.filter(h=>typeof h!="function").some(h=>typeof h=="boolean"?h:r.isDate(h)?Ea(n,h,!1,r):bS(h,r)?h.some(m=>Ea(n,m,!1,r)):kc(h)?h.from&&h.to?$y(n,{from:h.from,to:h.to},r):!1:xS(h)?SR(n,h.dayOfWeek,r):Oh(h)?r.isAfter(h.before,h.after)?$y(n,{from:r.addDays(h.after,1),to:r.addDays(h.before,-1)},r):Ta(n.from,h,r)||Ta(n.to,h,r):kh(h)||Mh(h)?Ta(n.from,h,r)||Ta(n.to,h,r):!1))return!0;const f=o.filter(h=>typeof h=="function");if(f.length){let h=n.from;const m=r.differenceInCalendarDays(n.to,n.from);for(let g=0;g<=m;g++){if(f.some(y=>y(h)))return!0;h=r.addDays(h,1)}}return!1}function CR(n,a){const{disabled:r,excludeDisabled:o,selected:s,required:u,onSelect:f}=n,[h,m]=Mc(s,f?s:void 0),g=f?s:h;return{selected:g,select:(S,j,M)=>{const{min:C,max:N}=n,E=S?bR(S,g,C,N,u,a):void 0;return o&&r&&(E!=null&&E.from)&&E.to&&wR({from:E.from,to:E.to},r,a)&&(E.from=S,E.to=void 0),f||m(E),f==null||f(E,S,j,M),E},isSelected:S=>g&&Ea(g,S,!1,a)}}function jR(n,a){const{selected:r,required:o,onSelect:s}=n,[u,f]=Mc(r,s?r:void 0),h=s?r:u,{isSameDay:m}=a;return{selected:h,select:(x,S,j)=>{let M=x;return!o&&h&&h&&m(x,h)&&(M=void 0),s||f(M),s==null||s(M,x,S,j),M},isSelected:x=>h?m(h,x):!1}}function NR(n,a){const r=jR(n,a),o=xR(n,a),s=CR(n,a);switch(n.mode){case"single":return r;case"multiple":return o;case"range":return s;default:return}}function Mn(n,a){return n instanceof Xt&&n.timeZone===a?n:new Xt(n,a)}function Dr(n,a,r){return Mn(n,a)}function Fy(n,a,r){return typeof n=="boolean"||typeof n=="function"?n:n instanceof Date?Dr(n,a):Array.isArray(n)?n.map(o=>o instanceof Date?Dr(o,a):o):kc(n)?{...n,from:n.from?Mn(n.from,a):n.from,to:n.to?Mn(n.to,a):n.to}:Oh(n)?{before:Dr(n.before,a),after:Dr(n.after,a)}:kh(n)?{after:Dr(n.after,a)}:Mh(n)?{before:Dr(n.before,a)}:n}function Cf(n,a,r){return n&&(Array.isArray(n)?n.map(o=>Fy(o,a)):Fy(n,a))}function ER(n){var _i;let a=n;const r=a.timeZone;if(r&&(a={...n,timeZone:r},a.today&&(a.today=Mn(a.today,r)),a.month&&(a.month=Mn(a.month,r)),a.defaultMonth&&(a.defaultMonth=Mn(a.defaultMonth,r)),a.startMonth&&(a.startMonth=Mn(a.startMonth,r)),a.endMonth&&(a.endMonth=Mn(a.endMonth,r)),a.mode==="single"&&a.selected?a.selected=Mn(a.selected,r):a.mode==="multiple"&&a.selected?a.selected=(_i=a.selected)==null?void 0:_i.map(Te=>Mn(Te,r)):a.mode==="range"&&a.selected&&(a.selected={from:a.selected.from?Mn(a.selected.from,r):a.selected.from,to:a.selected.to?Mn(a.selected.to,r):a.selected.to}),a.disabled!==void 0&&(a.disabled=Cf(a.disabled,r)),a.hidden!==void 0&&(a.hidden=Cf(a.hidden,r)),a.modifiers)){const Te={};Object.keys(a.modifiers).forEach($e=>{var be;Te[$e]=Cf((be=a.modifiers)==null?void 0:be[$e],r)}),a.modifiers=Te}const{components:o,formatters:s,labels:u,dateLib:f,locale:h,classNames:m}=v.useMemo(()=>{const Te={...gS,...a.locale},$e=a.broadcastCalendar?1:a.weekStartsOn,be=a.noonSafe&&a.timeZone?nR(a.timeZone,{weekStartsOn:$e,locale:Te}):void 0,Le=a.dateLib&&be?{...be,...a.dateLib}:a.dateLib??be,At=new Vt({locale:Te,weekStartsOn:$e,firstWeekContainsDate:a.firstWeekContainsDate,useAdditionalWeekYearTokens:a.useAdditionalWeekYearTokens,useAdditionalDayOfYearTokens:a.useAdditionalDayOfYearTokens,timeZone:a.timeZone,numerals:a.numerals},Le);return{dateLib:At,components:BD(a.components),formatters:XD(a.formatters),labels:ZD(a.labels,At.options),locale:Te,classNames:{...Dh(),...a.classNames}}},[a.locale,a.broadcastCalendar,a.weekStartsOn,a.firstWeekContainsDate,a.useAdditionalWeekYearTokens,a.useAdditionalDayOfYearTokens,a.timeZone,a.numerals,a.dateLib,a.noonSafe,a.components,a.formatters,a.labels,a.classNames]);a.today||(a={...a,today:f.today()});const{captionLayout:g,mode:y,navLayout:x,numberOfMonths:S=1,onDayBlur:j,onDayClick:M,onDayFocus:C,onDayKeyDown:N,onDayMouseEnter:E,onDayMouseLeave:O,onNextClick:_,onPrevClick:z,showWeekNumber:D,styles:k}=a,{formatCaption:T,formatDay:Y,formatMonthDropdown:H,formatWeekNumber:Z,formatWeekNumberHeader:ne,formatWeekdayName:fe,formatYearDropdown:ve}=s,$=pR(a,f),{days:se,months:U,navStart:Q,navEnd:q,previousMonth:ie,nextMonth:ue,goToMonth:A}=$,P=AD(se,a,Q,q,f),{isSelected:te,select:le,selected:he}=NR(a,f)??{},{blur:Se,focused:ae,isFocusTarget:Ne,moveFocus:Ee,setFocused:ke}=yR(a,$,P,te??(()=>!1),f),{labelDayButton:je,labelGridcell:ze,labelGrid:Ct,labelMonthDropdown:G,labelNav:Qe,labelPrevious:qe,labelNext:ut,labelWeekday:Rt,labelWeekNumber:on,labelWeekNumberHeader:no,labelYearDropdown:ao}=u,Rc=v.useMemo(()=>eR(f,a.ISOWeek,a.broadcastCalendar,a.today),[f,a.ISOWeek,a.broadcastCalendar,a.today]),Ci=y!==void 0||M!==void 0,Ut=v.useCallback(()=>{ie&&(A(ie),z==null||z(ie))},[ie,A,z]),lo=v.useCallback(()=>{ue&&(A(ue),_==null||_(ue))},[A,ue,_]),ji=v.useCallback((Te,$e)=>be=>{be.preventDefault(),be.stopPropagation(),ke(Te),!$e.disabled&&(le==null||le(Te.date,$e,be),M==null||M(Te.date,$e,be))},[le,M,ke]),Ni=v.useCallback((Te,$e)=>be=>{ke(Te),C==null||C(Te.date,$e,be)},[C,ke]),Wl=v.useCallback((Te,$e)=>be=>{Se(),j==null||j(Te.date,$e,be)},[Se,j]),Ac=v.useCallback((Te,$e)=>be=>{const Le={ArrowLeft:[be.shiftKey?"month":"day",a.dir==="rtl"?"after":"before"],ArrowRight:[be.shiftKey?"month":"day",a.dir==="rtl"?"before":"after"],ArrowDown:[be.shiftKey?"year":"week","after"],ArrowUp:[be.shiftKey?"year":"week","before"],PageUp:[be.shiftKey?"year":"month","before"],PageDown:[be.shiftKey?"year":"month","after"],Home:["startOfWeek","before"],End:["endOfWeek","after"]};if(Le[be.key]){be.preventDefault(),be.stopPropagation();const[At,Ue]=Le[be.key];Ee(At,Ue)}N==null||N(Te.date,$e,be)},[Ee,N,a.dir]),Ei=v.useCallback((Te,$e)=>be=>{E==null||E(Te.date,$e,be)},[E]),zc=v.useCallback((Te,$e)=>be=>{O==null||O(Te.date,$e,be)},[O]),Bc=v.useCallback(Te=>$e=>{const be=Number($e.target.value),Le=f.setMonth(f.startOfMonth(Te),be);A(Le)},[f,A]),pl=v.useCallback(Te=>$e=>{const be=Number($e.target.value),Le=f.setYear(f.startOfMonth(Te),be);A(Le)},[f,A]),{className:$t,style:Vn}=v.useMemo(()=>({className:[m[ye.Root],a.className].filter(Boolean).join(" "),style:{...k==null?void 0:k[ye.Root],...a.style}}),[m,a.className,a.style,k]),Ft=UD(a),Ti=v.useRef(null);oR(Ti,!!a.animate,{classNames:m,months:U,focused:ae,dateLib:f});const Uc={dayPickerProps:a,selected:he,select:le,isSelected:te,months:U,nextMonth:ue,previousMonth:ie,goToMonth:A,getModifiers:P,components:o,classNames:m,styles:k,labels:u,formatters:s};return oe.createElement(yS.Provider,{value:Uc},oe.createElement(o.Root,{rootRef:a.animate?Ti:void 0,className:$t,style:Vn,dir:a.dir,id:a.id,lang:a.lang,nonce:a.nonce,title:a.title,role:a.role,"aria-label":a["aria-label"],"aria-labelledby":a["aria-labelledby"],...Ft},oe.createElement(o.Months,{className:m[ye.Months],style:k==null?void 0:k[ye.Months]},!a.hideNavigation&&!x&&oe.createElement(o.Nav,{"data-animated-nav":a.animate?"true":void 0,className:m[ye.Nav],style:k==null?void 0:k[ye.Nav],"aria-label":Qe(),onPreviousClick:Ut,onNextClick:lo,previousMonth:ie,nextMonth:ue}),U.map((Te,$e)=>oe.createElement(o.Month,{"data-animated-month":a.animate?"true":void 0,className:m[ye.Month],style:k==null?void 0:k[ye.Month],key:$e,displayIndex:$e,calendarMonth:Te},x==="around"&&!a.hideNavigation&&$e===0&&oe.createElement(o.PreviousMonthButton,{type:"button",className:m[ye.PreviousMonthButton],tabIndex:ie?void 0:-1,"aria-disabled":ie?void 0:!0,"aria-label":qe(ie),onClick:Ut,"data-animated-button":a.animate?"true":void 0},oe.createElement(o.Chevron,{disabled:ie?void 0:!0,className:m[ye.Chevron],orientation:a.dir==="rtl"?"right":"left"})),oe.createElement(o.MonthCaption,{"data-animated-caption":a.animate?"true":void 0,className:m[ye.MonthCaption],style:k==null?void 0:k[ye.MonthCaption],calendarMonth:Te,displayIndex:$e},g!=null&&g.startsWith("dropdown")?oe.createElement(o.DropdownNav,{className:m[ye.Dropdowns],style:k==null?void 0:k[ye.Dropdowns]},(()=>{const be=g==="dropdown"||g==="dropdown-months"?oe.createElement(o.MonthsDropdown,{key:"month",className:m[ye.MonthsDropdown],"aria-label":G(),classNames:m,components:o,disabled:!!a.disableNavigation,onChange:Bc(Te.date),options:ID(Te.date,Q,q,s,f),style:k==null?void 0:k[ye.Dropdown],value:f.getMonth(Te.date)}):oe.createElement("span",{key:"month"},H(Te.date,f)),Le=g==="dropdown"||g==="dropdown-years"?oe.createElement(o.YearsDropdown,{key:"year",className:m[ye.YearsDropdown],"aria-label":ao(f.options),classNames:m,components:o,disabled:!!a.disableNavigation,onChange:pl(Te.date),options:tR(Q,q,s,f,!!a.reverseYears),style:k==null?void 0:k[ye.Dropdown],value:f.getYear(Te.date)}):oe.createElement("span",{key:"year"},ve(Te.date,f));return f.getMonthYearOrder()==="year-first"?[Le,be]:[be,Le]})(),oe.createElement("span",{role:"status","aria-live":"polite",style:{border:0,clip:"rect(0 0 0 0)",height:"1px",margin:"-1px",overflow:"hidden",padding:0,position:"absolute",width:"1px",whiteSpace:"nowrap",wordWrap:"normal"}},T(Te.date,f.options,f))):oe.createElement(o.CaptionLabel,{className:m[ye.CaptionLabel],role:"status","aria-live":"polite"},T(Te.date,f.options,f))),x==="around"&&!a.hideNavigation&&$e===S-1&&oe.createElement(o.NextMonthButton,{type:"button",className:m[ye.NextMonthButton],tabIndex:ue?void 0:-1,"aria-disabled":ue?void 0:!0,"aria-label":ut(ue),onClick:lo,"data-animated-button":a.animate?"true":void 0},oe.createElement(o.Chevron,{disabled:ue?void 0:!0,className:m[ye.Chevron],orientation:a.dir==="rtl"?"left":"right"})),$e===S-1&&x==="after"&&!a.hideNavigation&&oe.createElement(o.Nav,{"data-animated-nav":a.animate?"true":void 0,className:m[ye.Nav],style:k==null?void 0:k[ye.Nav],"aria-label":Qe(),onPreviousClick:Ut,onNextClick:lo,previousMonth:ie,nextMonth:ue}),oe.createElement(o.MonthGrid,{role:"grid","aria-multiselectable":y==="multiple"||y==="range","aria-label":Ct(Te.date,f.options,f)||void 0,className:m[ye.MonthGrid],style:k==null?void 0:k[ye.MonthGrid]},!a.hideWeekdays&&oe.createElement(o.Weekdays,{"data-animated-weekdays":a.animate?"true":void 0,className:m[ye.Weekdays],style:k==null?void 0:k[ye.Weekdays]},D&&oe.createElement(o.WeekNumberHeader,{"aria-label":no(f.options),className:m[ye.WeekNumberHeader],style:k==null?void 0:k[ye.WeekNumberHeader],scope:"col"},ne()),Rc.map(be=>oe.createElement(o.Weekday,{"aria-label":Rt(be,f.options,f),className:m[ye.Weekday],key:String(be),style:k==null?void 0:k[ye.Weekday],scope:"col"},fe(be,f.options,f)))),oe.createElement(o.Weeks,{"data-animated-weeks":a.animate?"true":void 0,className:m[ye.Weeks],style:k==null?void 0:k[ye.Weeks]},Te.weeks.map(be=>oe.createElement(o.Week,{className:m[ye.Week],key:be.weekNumber,style:k==null?void 0:k[ye.Week],week:be},D&&oe.createElement(o.WeekNumber,{week:be,style:k==null?void 0:k[ye.WeekNumber],"aria-label":on(be.weekNumber,{locale:h}),className:m[ye.WeekNumber],scope:"row",role:"rowheader"},Z(be.weekNumber,f)),be.days.map(Le=>{const{date:At}=Le,Ue=P(Le);if(Ue[gt.focused]=!Ue.hidden&&!!(ae!=null&&ae.isEqualTo(Le)),Ue[Yn.selected]=(te==null?void 0:te(At))||Ue.selected,kc(he)){const{from:oa,to:oo}=he;Ue[Yn.range_start]=!!(oa&&oo&&f.isSameDay(At,oa)),Ue[Yn.range_end]=!!(oa&&oo&&f.isSameDay(At,oo)),Ue[Yn.range_middle]=Ea(he,At,!0,f)}const Hc=JD(Ue,k,a.modifiersStyles),Oi=zD(Ue,m,a.modifiersClassNames),ro=!Ci&&!Ue.hidden?ze(At,Ue,f.options,f):void 0;return oe.createElement(o.Day,{key:`${Le.isoDate}_${Le.displayMonthId}`,day:Le,modifiers:Ue,className:Oi.join(" "),style:Hc,role:"gridcell","aria-selected":Ue.selected||void 0,"aria-label":ro,"data-day":Le.isoDate,"data-month":Le.outside?Le.dateMonthId:void 0,"data-selected":Ue.selected||void 0,"data-disabled":Ue.disabled||void 0,"data-hidden":Ue.hidden||void 0,"data-outside":Le.outside||void 0,"data-focused":Ue.focused||void 0,"data-today":Ue.today||void 0},!Ue.hidden&&Ci?oe.createElement(o.DayButton,{className:m[ye.DayButton],style:k==null?void 0:k[ye.DayButton],type:"button",day:Le,modifiers:Ue,disabled:!Ue.focused&&Ue.disabled||void 0,"aria-disabled":Ue.focused&&Ue.disabled||void 0,tabIndex:Ne(Le)?0:-1,"aria-label":je(At,Ue,f.options,f),onClick:ji(Le,Ue),onBlur:Wl(Le,Ue),onFocus:Ni(Le,Ue),onKeyDown:Ac(Le,Ue),onMouseEnter:Ei(Le,Ue),onMouseLeave:zc(Le,Ue)},Y(At,f.options,f)):!Ue.hidden&&Y(Le.date,f.options,f))})))))))),a.footer&&oe.createElement(o.Footer,{className:m[ye.Footer],style:k==null?void 0:k[ye.Footer],role:"status","aria-live":"polite"},a.footer)))}function TR({className:n,classNames:a,showOutsideDays:r=!0,captionLayout:o="label",buttonVariant:s="ghost",formatters:u,components:f,...h}){const m=Dh();return c.jsx(ER,{showOutsideDays:r,className:ce("bg-background group/calendar p-3 [--cell-size:2rem] [[data-slot=card-content]_&]:bg-transparent [[data-slot=popover-content]_&]:bg-transparent",String.raw`rtl:**:[.rdp-button\_next>svg]:rotate-180`,String.raw`rtl:**:[.rdp-button\_previous>svg]:rotate-180`,n),captionLayout:o,formatters:{formatMonthDropdown:g=>g.toLocaleString("default",{month:"short"}),...u},classNames:{root:ce("w-fit",m.root),months:ce("relative flex flex-col gap-4 md:flex-row",m.months),month:ce("flex w-full flex-col gap-4",m.month),nav:ce("absolute inset-x-0 top-0 flex w-full items-center justify-between gap-1",m.nav),button_previous:ce(ri({variant:s}),"h-[--cell-size] w-[--cell-size] select-none p-0 aria-disabled:opacity-50",m.button_previous),button_next:ce(ri({variant:s}),"h-[--cell-size] w-[--cell-size] select-none p-0 aria-disabled:opacity-50",m.button_next),month_caption:ce("flex h-[--cell-size] w-full items-center justify-center px-[--cell-size]",m.month_caption),dropdowns:ce("flex h-[--cell-size] w-full items-center justify-center gap-1.5 text-sm font-medium",m.dropdowns),dropdown_root:ce("has-focus:border-ring border-input shadow-xs has-focus:ring-ring/50 has-focus:ring-[3px] relative rounded-md border",m.dropdown_root),dropdown:ce("bg-popover absolute inset-0 opacity-0",m.dropdown),caption_label:ce("select-none font-medium",o==="label"?"text-sm":"[&>svg]:text-muted-foreground flex h-8 items-center gap-1 rounded-md pl-2 pr-1 text-sm [&>svg]:size-3.5",m.caption_label),table:"w-full border-collapse",weekdays:ce("flex",m.weekdays),weekday:ce("text-muted-foreground flex-1 select-none rounded-md text-[0.8rem] font-normal",m.weekday),week:ce("mt-2 flex w-full",m.week),week_number_header:ce("w-[--cell-size] select-none",m.week_number_header),week_number:ce("text-muted-foreground select-none text-[0.8rem]",m.week_number),day:ce("group/day relative aspect-square h-full w-full select-none p-0 text-center [&:first-child[data-selected=true]_button]:rounded-l-md [&:last-child[data-selected=true]_button]:rounded-r-md",m.day),range_start:ce("bg-accent rounded-l-md",m.range_start),range_middle:ce("rounded-none",m.range_middle),range_end:ce("bg-accent rounded-r-md",m.range_end),today:ce("bg-accent text-accent-foreground rounded-md data-[selected=true]:rounded-none",m.today),outside:ce("text-muted-foreground aria-selected:text-muted-foreground",m.outside),disabled:ce("text-muted-foreground opacity-50",m.disabled),hidden:ce("invisible",m.hidden),...a},components:{Root:({className:g,rootRef:y,...x})=>c.jsx("div",{"data-slot":"calendar",ref:y,className:ce(g),...x}),Chevron:({className:g,orientation:y,...x})=>y==="left"?c.jsx(lE,{className:ce("size-4",g),...x}):y==="right"?c.jsx(oE,{className:ce("size-4",g),...x}):c.jsx(lh,{className:ce("size-4",g),...x}),DayButton:_R,WeekNumber:({children:g,...y})=>c.jsx("td",{...y,children:c.jsx("div",{className:"flex size-[--cell-size] items-center justify-center text-center",children:g})}),...f},...h})}function _R({className:n,day:a,modifiers:r,...o}){const s=Dh(),u=v.useRef(null);return v.useEffect(()=>{var f;r.focused&&((f=u.current)==null||f.focus())},[r.focused]),c.jsx(we,{ref:u,variant:"ghost",size:"icon","data-day":a.date.toLocaleDateString(),"data-selected-single":r.selected&&!r.range_start&&!r.range_end&&!r.range_middle,"data-range-start":r.range_start,"data-range-end":r.range_end,"data-range-middle":r.range_middle,className:ce("data-[selected-single=true]:bg-primary data-[selected-single=true]:text-primary-foreground data-[range-middle=true]:bg-accent data-[range-middle=true]:text-accent-foreground data-[range-start=true]:bg-primary data-[range-start=true]:text-primary-foreground data-[range-end=true]:bg-primary data-[range-end=true]:text-primary-foreground group-data-[focused=true]/day:border-ring group-data-[focused=true]/day:ring-ring/50 flex aspect-square h-auto w-full min-w-[--cell-size] flex-col gap-1 font-normal leading-none data-[range-end=true]:rounded-md data-[range-middle=true]:rounded-none data-[range-start=true]:rounded-md group-data-[focused=true]/day:relative group-data-[focused=true]/day:z-10 group-data-[focused=true]/day:ring-[3px] [&>span]:text-xs [&>span]:opacity-70",s.day,n),...o})}function OR(n){const a=kR(n),r=v.forwardRef((o,s)=>{const{children:u,...f}=o,h=v.Children.toArray(u),m=h.find(DR);if(m){const g=m.props.children,y=h.map(x=>x===m?v.Children.count(g)>1?v.Children.only(null):v.isValidElement(g)?g.props.children:null:x);return c.jsx(a,{...f,ref:s,children:v.isValidElement(g)?v.cloneElement(g,void 0,y):null})}return c.jsx(a,{...f,ref:s,children:u})});return r.displayName=`${n}.Slot`,r}function kR(n){const a=v.forwardRef((r,o)=>{const{children:s,...u}=r;if(v.isValidElement(s)){const f=AR(s),h=RR(u,s.props);return s.type!==v.Fragment&&(h.ref=o?Xr(o,f):f),v.cloneElement(s,h)}return v.Children.count(s)>1?v.Children.only(null):null});return a.displayName=`${n}.SlotClone`,a}var MR=Symbol("radix.slottable");function DR(n){return v.isValidElement(n)&&typeof n.type=="function"&&"__radixId"in n.type&&n.type.__radixId===MR}function RR(n,a){const r={...a};for(const o in a){const s=n[o],u=a[o];/^on[A-Z]/.test(o)?s&&u?r[o]=(...h)=>{const m=u(...h);return s(...h),m}:s&&(r[o]=s):o==="style"?r[o]={...s,...u}:o==="className"&&(r[o]=[s,u].filter(Boolean).join(" "))}return{...n,...r}}function AR(n){var o,s;let a=(o=Object.getOwnPropertyDescriptor(n.props,"ref"))==null?void 0:o.get,r=a&&"isReactWarning"in a&&a.isReactWarning;return r?n.ref:(a=(s=Object.getOwnPropertyDescriptor(n,"ref"))==null?void 0:s.get,r=a&&"isReactWarning"in a&&a.isReactWarning,r?n.props.ref:n.props.ref||n.ref)}var Dc="Popover",[RS]=dl(Dc,[jc]),wi=jc(),[zR,ml]=RS(Dc),AS=n=>{const{__scopePopover:a,children:r,open:o,defaultOpen:s,onOpenChange:u,modal:f=!1}=n,h=wi(a),m=v.useRef(null),[g,y]=v.useState(!1),[x,S]=Lr({prop:o,defaultProp:s??!1,onChange:u,caller:Dc});return c.jsx(Pb,{...h,children:c.jsx(zR,{scope:a,contentId:Qr(),triggerRef:m,open:x,onOpenChange:S,onOpenToggle:v.useCallback(()=>S(j=>!j),[S]),hasCustomAnchor:g,onCustomAnchorAdd:v.useCallback(()=>y(!0),[]),onCustomAnchorRemove:v.useCallback(()=>y(!1),[]),modal:f,children:r})})};AS.displayName=Dc;var zS="PopoverAnchor",BR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(zS,r),u=wi(r),{onCustomAnchorAdd:f,onCustomAnchorRemove:h}=s;return v.useEffect(()=>(f(),()=>h()),[f,h]),c.jsx(Sh,{...u,...o,ref:a})});BR.displayName=zS;var BS="PopoverTrigger",US=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(BS,r),u=wi(r),f=lt(a,s.triggerRef),h=c.jsx(Ve.button,{type:"button","aria-haspopup":"dialog","aria-expanded":s.open,"aria-controls":s.contentId,"data-state":WS(s.open),...o,ref:f,onClick:De(n.onClick,s.onOpenToggle)});return s.hasCustomAnchor?h:c.jsx(Sh,{asChild:!0,...u,children:h})});US.displayName=BS;var zh="PopoverPortal",[UR,HR]=RS(zh,{forceMount:void 0}),HS=n=>{const{__scopePopover:a,forceMount:r,children:o,container:s}=n,u=ml(zh,a);return c.jsx(UR,{scope:a,forceMount:r,children:c.jsx(Ra,{present:r||u.open,children:c.jsx(wh,{asChild:!0,container:s,children:o})})})};HS.displayName=zh;var Pr="PopoverContent",LS=v.forwardRef((n,a)=>{const r=HR(Pr,n.__scopePopover),{forceMount:o=r.forceMount,...s}=n,u=ml(Pr,n.__scopePopover);return c.jsx(Ra,{present:o||u.open,children:u.modal?c.jsx(YR,{...s,ref:a}):c.jsx(PR,{...s,ref:a})})});LS.displayName=Pr;var LR=OR("PopoverContent.RemoveScroll"),YR=v.forwardRef((n,a)=>{const r=ml(Pr,n.__scopePopover),o=v.useRef(null),s=lt(a,o),u=v.useRef(!1);return v.useEffect(()=>{const f=o.current;if(f)return Xb(f)},[]),c.jsx(Ch,{as:LR,allowPinchZoom:!0,children:c.jsx(YS,{...n,ref:s,trapFocus:r.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:De(n.onCloseAutoFocus,f=>{var h;f.preventDefault(),u.current||(h=r.triggerRef.current)==null||h.focus()}),onPointerDownOutside:De(n.onPointerDownOutside,f=>{const h=f.detail.originalEvent,m=h.button===0&&h.ctrlKey===!0,g=h.button===2||m;u.current=g},{checkForDefaultPrevented:!1}),onFocusOutside:De(n.onFocusOutside,f=>f.preventDefault(),{checkForDefaultPrevented:!1})})})}),PR=v.forwardRef((n,a)=>{const r=ml(Pr,n.__scopePopover),o=v.useRef(!1),s=v.useRef(!1);return c.jsx(YS,{...n,ref:a,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:u=>{var f,h;(f=n.onCloseAutoFocus)==null||f.call(n,u),u.defaultPrevented||(o.current||(h=r.triggerRef.current)==null||h.focus(),u.preventDefault()),o.current=!1,s.current=!1},onInteractOutside:u=>{var m,g;(m=n.onInteractOutside)==null||m.call(n,u),u.defaultPrevented||(o.current=!0,u.detail.originalEvent.type==="pointerdown"&&(s.current=!0));const f=u.target;((g=r.triggerRef.current)==null?void 0:g.contains(f))&&u.preventDefault(),u.detail.originalEvent.type==="focusin"&&s.current&&u.preventDefault()}})}),YS=v.forwardRef((n,a)=>{const{__scopePopover:r,trapFocus:o,onOpenAutoFocus:s,onCloseAutoFocus:u,disableOutsidePointerEvents:f,onEscapeKeyDown:h,onPointerDownOutside:m,onFocusOutside:g,onInteractOutside:y,...x}=n,S=ml(Pr,r),j=wi(r);return yb(),c.jsx(fh,{asChild:!0,loop:!0,trapped:o,onMountAutoFocus:s,onUnmountAutoFocus:u,children:c.jsx(dh,{asChild:!0,disableOutsidePointerEvents:f,onInteractOutside:y,onEscapeKeyDown:h,onPointerDownOutside:m,onFocusOutside:g,onDismiss:()=>S.onOpenChange(!1),children:c.jsx(Wb,{"data-state":WS(S.open),role:"dialog",id:S.contentId,...j,...x,ref:a,style:{...x.style,"--radix-popover-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-popover-content-available-width":"var(--radix-popper-available-width)","--radix-popover-content-available-height":"var(--radix-popper-available-height)","--radix-popover-trigger-width":"var(--radix-popper-anchor-width)","--radix-popover-trigger-height":"var(--radix-popper-anchor-height)"}})})})}),PS="PopoverClose",WR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=ml(PS,r);return c.jsx(Ve.button,{type:"button",...o,ref:a,onClick:De(n.onClick,()=>s.onOpenChange(!1))})});WR.displayName=PS;var VR="PopoverArrow",qR=v.forwardRef((n,a)=>{const{__scopePopover:r,...o}=n,s=wi(r);return c.jsx(Vb,{...s,...o,ref:a})});qR.displayName=VR;function WS(n){return n?"open":"closed"}var GR=AS,XR=US,$R=HS,VS=LS;const FR=GR,QR=XR,qS=v.forwardRef(({className:n,align:a="center",sideOffset:r=4,...o},s)=>c.jsx($R,{children:c.jsx(VS,{ref:s,align:a,sideOffset:r,className:ce("z-50 w-72 rounded-md border bg-popover p-4 text-popover-foreground shadow-md outline-none data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-popover-content-transform-origin]",n),...o})}));qS.displayName=VS.displayName;function hc(n){const[a,r]=v.useState(!1),[o,s]=v.useState(),u=f=>{if(f){s(f);const h=f.getFullYear(),m=String(f.getMonth()+1).padStart(2,"0"),g=String(f.getDate()).padStart(2,"0");n.onSelect(`${h}/${m}/${g}`),r(!1)}};return c.jsxs(FR,{open:a,onOpenChange:r,children:[c.jsx(QR,{asChild:!0,children:c.jsx(we,{type:"button",variant:"outline",size:"icon",className:"shrink-0","aria-label":n.ariaLabel??"选择日期",children:c.jsx(eE,{className:"h-4 w-4"})})}),c.jsx(qS,{className:"w-auto overflow-hidden rounded-xl p-0",align:"start",children:c.jsx(TR,{mode:"single",selected:o,onSelect:u,locale:lD,className:"rounded-xl",initialFocus:!0})})]})}function Qy(){return{tab:"detail",detailText:"",detailOriginal:!1,accountText:"",accountTab:"post",accountEarliest:"",accountLatest:"",accountPages:"",accountMark:"",mixText:"",mixMark:"",selectedCollectIds:[],selectedMixCollectionIds:[],mixCollectionMark:""}}function KR(){const n=Gr(),{platform:a}=hi(),r=a==="douyin"||a==="tiktok",o=a==="tiktok"?"tiktok":"douyin",s=o==="tiktok",[u,f]=v.useState(()=>({douyin:Qy(),tiktok:Qy()})),h=u[o],m=$=>{f(se=>({...se,[o]:{...se[o],...$}}))},[g,y]=v.useState(!1),[x,S]=v.useState(!1),[j,M]=v.useState(!1),[C,N]=v.useState(null),[E,O]=v.useState(!1),[_,z]=v.useState(!1),[D,k]=v.useState([]),[T,Y]=v.useState(!1),[H,Z]=v.useState([]),ne=$=>n(`/tasks?task=${encodeURIComponent($)}`),fe=async()=>{if(!s){z(!0),N(null);try{const $=await Ae.listDouyinCollects();k($),m({selectedCollectIds:[]})}catch($){N(String($))}finally{z(!1)}}},ve=async()=>{if(!s){Y(!0),N(null);try{const $=await Ae.listDouyinMixCollections();Z($),m({selectedMixCollectionIds:[]})}catch($){N(String($))}finally{Y(!1)}}};return a==="kuaishou"?c.jsx(nk,{}):c.jsxs("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:[r?null:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})}),r?c.jsxs(yi,{value:h.tab,onValueChange:$=>m({tab:$}),className:"w-full",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"detail",children:"链接作品"}),c.jsx(Mt,{value:"account",children:"账号作品"}),c.jsx(Mt,{value:"mix",children:"合集作品"}),s?null:c.jsx(Mt,{value:"favorites",children:"收藏"})]}),c.jsx(Dt,{value:"detail",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[s?c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:"detailOriginal",checked:h.detailOriginal,onCheckedChange:$=>m({detailOriginal:$===!0})}),c.jsx(K,{htmlFor:"detailOriginal",className:"text-sm font-normal",children:"原画"})]}):null,c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"链接文本"}),c.jsx(St,{value:h.detailText,onChange:$=>m({detailText:$.target.value}),rows:8,placeholder:"粘贴多个分享链接或完整链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:g||!h.detailText.trim(),onClick:async()=>{y(!0);try{const $=s&&h.detailOriginal?await Ae.createDownloadTikTokOriginalTask({text:h.detailText}):await Ae.createDownloadDetailTask({platform:o,text:h.detailText});ne($.id)}finally{y(!1)}},children:"开始下载"})})]})})}),c.jsx(Dt,{value:"account",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"类型"}),c.jsxs(pi,{value:h.accountTab,onValueChange:$=>m({accountTab:$}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"post",children:"发布"}),c.jsx(vn,{value:"favorite",children:"喜欢"})]})]})]}),h.accountTab==="post"?c.jsxs(c.Fragment,{children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最早日期"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:h.accountEarliest,onChange:$=>m({accountEarliest:$.target.value}),placeholder:"YYYY/MM/DD 或天数"}),c.jsx(hc,{onSelect:$=>m({accountEarliest:$})})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最晚日期"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:h.accountLatest,onChange:$=>m({accountLatest:$.target.value}),placeholder:"YYYY/MM/DD 或天数"}),c.jsx(hc,{onSelect:$=>m({accountLatest:$})})]})]})]}):null,h.accountTab==="favorite"?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"页数"}),c.jsx(re,{value:h.accountPages,onChange:$=>m({accountPages:$.target.value}),placeholder:"留空表示自动"})]}):null,c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:h.accountMark,onChange:$=>m({accountMark:$.target.value}),placeholder:"可选"})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"账号链接文本"}),c.jsx(St,{value:h.accountText,onChange:$=>m({accountText:$.target.value}),rows:8,placeholder:"粘贴多个账号主页链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:x||!h.accountText.trim(),onClick:async()=>{S(!0);try{const $=h.accountTab==="favorite"?"favorite":"post",se=ie=>{const ue=ie.trim();if(!ue)return null;if(/^\d+(?:\.\d+)?$/.test(ue)){const A=Number(ue);return Number.isFinite(A)?A:null}return ue},U=$==="favorite"?Number(h.accountPages.trim()):NaN,Q=Number.isFinite(U)&&U>0?Math.floor(U):null,q=await Ae.createDownloadAccountTask({platform:o,text:h.accountText,tab:$,earliest:$==="post"?se(h.accountEarliest):null,latest:$==="post"?se(h.accountLatest):null,pages:Q,mark:h.accountMark});ne(q.id)}finally{S(!1)}},children:"开始下载"})})]})})}),s?null:c.jsx(Dt,{value:"favorites",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-6 pt-6",children:[C?c.jsx("div",{className:"text-sm text-destructive",children:C}):null,c.jsxs("div",{className:"flex flex-col gap-4",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsx(we,{variant:"outline",disabled:E,onClick:async()=>{O(!0),N(null);try{const $=await Ae.createDownloadCollectionTask();ne($.id)}catch($){N(String($))}finally{O(!1)}},children:"下载收藏作品"}),c.jsx(we,{variant:"outline",disabled:E,onClick:async()=>{O(!0),N(null);try{const $=await Ae.createDownloadCollectionMusicTask();ne($.id)}catch($){N(String($))}finally{O(!1)}},children:"下载收藏音乐"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-3",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"收藏夹作品"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>void fe(),disabled:_||E,children:_?"加载中...":"加载列表"}),D.length>0?c.jsxs(c.Fragment,{children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedCollectIds:D.map($=>$.id)}),disabled:E,children:"全选"}),c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedCollectIds:[]}),disabled:E||h.selectedCollectIds.length===0,children:"清空"})]}):null]})]}),D.length>0?c.jsxs("div",{className:"space-y-3",children:[c.jsx(Ul,{className:"h-56 rounded-md border p-4",children:c.jsx("div",{className:"space-y-2",children:D.map($=>c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:`collect-${$.id}`,checked:h.selectedCollectIds.includes($.id),onCheckedChange:se=>{const U=se===!0?[...h.selectedCollectIds,$.id]:h.selectedCollectIds.filter(Q=>Q!==$.id);m({selectedCollectIds:U})}}),c.jsx(K,{htmlFor:`collect-${$.id}`,className:"text-sm font-normal",children:$.name})]},$.id))})}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{size:"sm",disabled:E||h.selectedCollectIds.length===0,onClick:async()=>{O(!0),N(null);try{const $=D.filter(U=>h.selectedCollectIds.includes(U.id)),se=await Ae.createDownloadCollectsTask({items:$});ne(se.id)}catch($){N(String($))}finally{O(!1)}},children:"下载选中收藏夹"})})]}):null]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-3",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"收藏合集作品"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>void ve(),disabled:T||E,children:T?"加载中...":"加载列表"}),H.length>0?c.jsxs(c.Fragment,{children:[c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedMixCollectionIds:H.map($=>$.id)}),disabled:E,children:"全选"}),c.jsx(we,{variant:"ghost",size:"sm",onClick:()=>m({selectedMixCollectionIds:[]}),disabled:E||h.selectedMixCollectionIds.length===0,children:"清空"})]}):null]})]}),H.length>0?c.jsxs("div",{className:"space-y-3",children:[c.jsx(Ul,{className:"h-56 rounded-md border p-4",children:c.jsx("div",{className:"space-y-2",children:H.map($=>c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{id:`mix-collect-${$.id}`,checked:h.selectedMixCollectionIds.includes($.id),onCheckedChange:se=>{const U=se===!0?[...h.selectedMixCollectionIds,$.id]:h.selectedMixCollectionIds.filter(Q=>Q!==$.id);m({selectedMixCollectionIds:U})}}),c.jsx(K,{htmlFor:`mix-collect-${$.id}`,className:"text-sm font-normal",children:$.title})]},$.id))})}),c.jsxs("div",{className:"flex flex-wrap items-end justify-between gap-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{className:"text-sm",children:"标识"}),c.jsx(re,{value:h.mixCollectionMark,onChange:$=>m({mixCollectionMark:$.target.value}),placeholder:"可选",className:"w-64"})]}),c.jsx(we,{size:"sm",disabled:E||h.selectedMixCollectionIds.length===0,onClick:async()=>{O(!0),N(null);try{const $=H.filter(U=>h.selectedMixCollectionIds.includes(U.id)),se=await Ae.createDownloadMixCollectionTask({items:$,mark:h.mixCollectionMark.trim()?h.mixCollectionMark.trim():void 0});ne(se.id)}catch($){N(String($))}finally{O(!1)}},children:"下载选中合集"})]})]}):null]}),c.jsx("div",{className:"text-sm text-muted-foreground",children:"需要登录抖音 Cookie，且设置里的 `owner_url` 必须指向当前账号主页。"})]})]})})}),c.jsx(Dt,{value:"mix",className:"mt-6",children:c.jsx(_e,{children:c.jsxs(Oe,{className:"space-y-4 pt-6",children:[c.jsx("div",{className:"grid gap-4 md:grid-cols-2",children:c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:h.mixMark,onChange:$=>m({mixMark:$.target.value}),placeholder:"可选"})]})}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"合集链接文本"}),c.jsx(St,{value:h.mixText,onChange:$=>m({mixText:$.target.value}),rows:8,placeholder:"粘贴多个合集链接，空格/换行分隔"})]}),c.jsx("div",{className:"flex justify-start",children:c.jsx(we,{disabled:j||!h.mixText.trim(),onClick:async()=>{M(!0);try{const $=await Ae.createDownloadMixTask({platform:o,text:h.mixText,mark:h.mixMark});ne($.id)}finally{M(!1)}},children:"开始下载"})})]})})})]}):null,r?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"提示"})}),c.jsxs(Oe,{className:"space-y-2 text-sm text-muted-foreground",children:[c.jsx("div",{children:"部分功能需要配置 Cookie、代理、browser_info 等参数。"}),c.jsx("div",{children:"请在“设置”页面完整配置后再开始大批量任务。"})]})]}):null]})}const jf="__none__";function Ky(n){try{return JSON.stringify(n??{},null,2)}catch{return"{}"}}function ZR(){const[n,a]=v.useState(!0),[r,o]=v.useState(!1),[s,u]=v.useState(null),[f,h]=v.useState(null),[m,g]=v.useState({}),[y,x]=v.useState(!1),[S,j]=v.useState("{}"),[M,C]=v.useState(""),[N,E]=v.useState(null),O=v.useMemo(()=>String(m.cover||"")||jf,[m.cover]),_=async()=>{var H;a(!0),u(null);try{const Z=await Ae.getKuaishouSettings();h(Z),g(Z.settings||{}),x(!!Z.record),j(Ky((H=Z.settings)==null?void 0:H.mapping_data))}catch(Z){u(String(Z))}finally{a(!1)}};v.useEffect(()=>{_()},[]);const z=(H,Z)=>{g(ne=>({...ne,[H]:Z}))},D=async()=>{var H;o(!0),u(null);try{let Z;try{Z=JSON.parse(S||"{}")}catch{throw new Error("mapping_data 不是有效的 JSON")}const ne=await Ae.saveKuaishouSettings({data:{...m,mapping_data:Z},record:y});h(ne),g(ne.settings||{}),x(!!ne.record),j(Ky((H=ne.settings)==null?void 0:H.mapping_data)),rn.success("已保存")}catch(Z){u(String(Z))}finally{o(!1)}},k=async H=>{E(H),u(null);try{const Z=H==="clipboard"?await Ae.importKuaishouCookieFromClipboard():await Ae.importKuaishouCookieFromBrowser({});z("cookie",Z.cookie),rn.success("Cookie 已导入")}catch(Z){u(String(Z))}finally{E(null)}},T=async()=>{const H=M.trim();if(H)try{await Ae.deleteKuaishouRecords(H),rn.success("已删除下载记录")}catch(Z){u(String(Z))}},Y=async()=>{try{await Ae.clearKuaishouRecords(),rn.success("已清空下载记录")}catch(H){u(String(H))}};return n?c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"加载中..."})})}):c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsxs(yi,{defaultValue:"general",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"general",children:"通用"}),c.jsx(Mt,{value:"network",children:"Cookie / 代理"}),c.jsx(Mt,{value:"advanced",children:"高级"})]}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(we,{variant:"outline",onClick:()=>void _(),disabled:r,children:"刷新"}),c.jsx(we,{onClick:()=>void D(),disabled:r,children:r?"保存中...":"保存"})]})]}),f?c.jsxs("div",{className:"text-xs text-muted-foreground",children:["下载记录：",y?"启用":"禁用"]}):null,s?c.jsx("div",{className:"text-sm text-destructive",children:s}):null,c.jsxs(Dt,{value:"general",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"命名与输出"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载根目录"}),c.jsx(re,{value:String(m.work_path||""),onChange:H=>z("work_path",H.target.value),placeholder:"留空则使用 Volume/Kuaishou"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载文件夹名"}),c.jsx(re,{value:String(m.folder_name||""),onChange:H=>z("folder_name",H.target.value),placeholder:"Download"})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件命名格式"}),c.jsx(re,{value:String(m.name_format||""),onChange:H=>z("name_format",H.target.value),placeholder:"发布日期 作者昵称 作品描述"})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件名长度限制"}),c.jsx(re,{type:"number",value:Number(m.name_length??128),onChange:H=>z("name_length",Number(H.target.value))})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.folder_mode,onCheckedChange:H=>z("folder_mode",!!H)}),c.jsx(K,{children:"作品单独文件夹"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.author_archive,onCheckedChange:H=>z("author_archive",!!H)}),c.jsx(K,{children:"作者归档（别名+重命名）"})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载内容"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.data_record,onCheckedChange:H=>z("data_record",!!H)}),c.jsx(K,{children:"保存作品数据（DetailData.db）"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:!!m.music,onCheckedChange:H=>z("music",!!H)}),c.jsx(K,{children:"下载音乐"})]})]}),c.jsx("div",{className:"grid gap-4 md:grid-cols-2",children:c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"封面格式"}),c.jsxs(pi,{value:O,onValueChange:H=>z("cover",H===jf?"":H),children:[c.jsx(Jr,{children:c.jsx(gi,{placeholder:"选择格式"})}),c.jsxs(eo,{children:[c.jsx(vn,{value:jf,children:"不下载"}),c.jsx(vn,{value:"JPEG",children:"JPEG"}),c.jsx(vn,{value:"WEBP",children:"WEBP"})]})]})]})})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载策略"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大并发下载数"}),c.jsx(re,{type:"number",value:Number(m.max_workers??4),onChange:H=>z("max_workers",Number(H.target.value))})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分块大小（字节）"}),c.jsx(re,{type:"number",value:Number(m.chunk??2097152),onChange:H=>z("chunk",Number(H.target.value))})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"请求超时（秒）"}),c.jsx(re,{type:"number",value:Number(m.timeout??10),onChange:H=>z("timeout",Number(H.target.value))})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大重试次数"}),c.jsx(re,{type:"number",value:Number(m.max_retry??5),onChange:H=>z("max_retry",Number(H.target.value))})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载记录"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3 rounded-md border p-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"作品下载记录（跳过已下载）"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"对应 Volume/Kuaishou/Kuaishou.db"})]}),c.jsx(pt,{checked:y,onCheckedChange:H=>x(!!H)})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"清空全部下载记录"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"用于重新下载；不会删除本地文件。"})]}),c.jsx(we,{variant:"destructive",size:"sm",onClick:()=>void Y(),disabled:r,children:"清空"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"删除指定作品 ID"}),c.jsx(St,{value:M,onChange:H=>C(H.target.value),rows:2,placeholder:"粘贴作品 ID（可多个，空格/换行分隔）"}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",size:"sm",disabled:r||!M.trim(),onClick:()=>void T(),children:"删除"})})]})]})]})]}),c.jsxs(Dt,{value:"network",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"Cookie"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsx(St,{value:String(m.cookie||""),onChange:H=>z("cookie",H.target.value),rows:4}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{variant:"outline",size:"sm",disabled:!!N||r,onClick:()=>void k("clipboard"),children:N==="clipboard"?"导入中...":"从剪贴板导入"}),c.jsx(we,{variant:"outline",size:"sm",disabled:!!N||r,onClick:()=>void k("browser"),children:N==="browser"?"导入中...":"从浏览器导入"})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"代理"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"代理地址"}),c.jsx(re,{value:String(m.proxy||""),onChange:H=>z("proxy",H.target.value),placeholder:"http://127.0.0.1:7890"})]})]})]}),c.jsxs(Dt,{value:"advanced",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"请求参数"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(re,{value:String(m.user_agent||""),onChange:H=>z("user_agent",H.target.value)})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"作者别名映射"})}),c.jsxs(Oe,{className:"space-y-2",children:[c.jsx(K,{children:"mapping_data（JSON）"}),c.jsx(St,{value:S,onChange:H=>j(H.target.value),rows:8}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"保存时会校验 JSON 格式；仅在开启“作者归档”时生效。"})]})]})]})]})})}const Bh=v.forwardRef(({className:n,...a},r)=>c.jsx("div",{className:"relative w-full overflow-auto",children:c.jsx("table",{ref:r,className:ce("w-full caption-bottom text-sm",n),...a})}));Bh.displayName="Table";const Uh=v.forwardRef(({className:n,...a},r)=>c.jsx("thead",{ref:r,className:ce("[&_tr]:border-b",n),...a}));Uh.displayName="TableHeader";const Hh=v.forwardRef(({className:n,...a},r)=>c.jsx("tbody",{ref:r,className:ce("[&_tr:last-child]:border-0",n),...a}));Hh.displayName="TableBody";const IR=v.forwardRef(({className:n,...a},r)=>c.jsx("tfoot",{ref:r,className:ce("border-t bg-muted/50 font-medium [&>tr]:last:border-b-0",n),...a}));IR.displayName="TableFooter";const Bl=v.forwardRef(({className:n,...a},r)=>c.jsx("tr",{ref:r,className:ce("border-b transition-colors hover:bg-muted/50 data-[state=selected]:bg-muted",n),...a}));Bl.displayName="TableRow";const Dn=v.forwardRef(({className:n,...a},r)=>c.jsx("th",{ref:r,className:ce("h-10 px-2 text-left align-middle font-medium text-muted-foreground [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...a}));Dn.displayName="TableHead";const ln=v.forwardRef(({className:n,...a},r)=>c.jsx("td",{ref:r,className:ce("p-2 align-middle [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...a}));ln.displayName="TableCell";const JR=v.forwardRef(({className:n,...a},r)=>c.jsx("caption",{ref:r,className:ce("mt-4 text-sm text-muted-foreground",n),...a}));JR.displayName="TableCaption";const Nf="__none__";function Zs(n){return typeof n=="string"?n:!n||typeof n!="object"?"":Object.entries(n).map(([a,r])=>`${a}=${r}`).join("; ")}function eA(){return{enable:!0,mark:"",url:"",tab:"post",earliest:"",latest:""}}function tA(){return{enable:!0,mark:"",url:""}}function nA(){return{"User-Agent":"",pc_libra_divert:"",browser_language:"",browser_platform:"",browser_name:"",browser_version:"",engine_name:"",engine_version:"",os_name:"",os_version:"",webid:""}}function aA(){return{"User-Agent":"",app_language:"",browser_language:"",browser_name:"",browser_platform:"",browser_version:"",language:"",os:"",priority_region:"",region:"",tz_name:"",webcast_language:"",device_id:""}}function Zy(n){const a=n.value??[],r=(u,f)=>{n.onChange(a.map((h,m)=>m===u?{...h,...f}:h))},o=u=>n.onChange(a.filter((f,h)=>h!==u)),s=()=>n.onChange([...a,eA()]);return c.jsxs("div",{className:"space-y-3",children:[c.jsxs(Bh,{children:[c.jsx(Uh,{children:c.jsxs(Bl,{children:[c.jsx(Dn,{className:"w-16",children:"启用"}),c.jsx(Dn,{className:"w-28",children:"类型"}),c.jsx(Dn,{className:"w-32",children:"最早"}),c.jsx(Dn,{className:"w-32",children:"最晚"}),c.jsx(Dn,{className:"w-40",children:"标识"}),c.jsx(Dn,{children:"账号链接"}),c.jsx(Dn,{className:"w-20",children:"操作"})]})}),c.jsxs(Hh,{children:[a.map((u,f)=>c.jsxs(Bl,{children:[c.jsx(ln,{children:c.jsx(pt,{checked:u.enable,onCheckedChange:h=>r(f,{enable:!!h})})}),c.jsx(ln,{children:c.jsxs(pi,{value:u.tab,onValueChange:h=>r(f,{tab:h}),children:[c.jsx(Jr,{children:c.jsx(gi,{})}),c.jsxs(eo,{children:[c.jsx(vn,{value:"post",children:"发布"}),c.jsx(vn,{value:"favorite",children:"喜欢"})]})]})}),c.jsx(ln,{children:c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:String(u.earliest??""),onChange:h=>r(f,{earliest:h.target.value}),placeholder:"YYYY/MM/DD 或 天数"}),c.jsx(hc,{onSelect:h=>r(f,{earliest:h})})]})}),c.jsx(ln,{children:c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(re,{value:String(u.latest??""),onChange:h=>r(f,{latest:h.target.value}),placeholder:"YYYY/MM/DD 或 天数"}),c.jsx(hc,{onSelect:h=>r(f,{latest:h})})]})}),c.jsx(ln,{children:c.jsx(re,{value:u.mark,onChange:h=>r(f,{mark:h.target.value})})}),c.jsx(ln,{children:c.jsx(re,{value:u.url,onChange:h=>r(f,{url:h.target.value})})}),c.jsx(ln,{children:c.jsx(we,{variant:"outline",size:"sm",onClick:()=>o(f),children:"删除"})})]},`${f}-${u.url}`)),a.length===0?c.jsx(Bl,{children:c.jsx(ln,{colSpan:7,className:"text-sm text-muted-foreground",children:"暂无数据"})}):null]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",onClick:s,children:"添加账号"})})]})}function Iy(n){const a=n.value??[],r=(u,f)=>{n.onChange(a.map((h,m)=>m===u?{...h,...f}:h))},o=u=>n.onChange(a.filter((f,h)=>h!==u)),s=()=>n.onChange([...a,tA()]);return c.jsxs("div",{className:"space-y-3",children:[c.jsxs(Bh,{children:[c.jsx(Uh,{children:c.jsxs(Bl,{children:[c.jsx(Dn,{className:"w-16",children:"启用"}),c.jsx(Dn,{className:"w-40",children:"标识"}),c.jsx(Dn,{children:"合集链接"}),c.jsx(Dn,{className:"w-20",children:"操作"})]})}),c.jsxs(Hh,{children:[a.map((u,f)=>c.jsxs(Bl,{children:[c.jsx(ln,{children:c.jsx(pt,{checked:u.enable,onCheckedChange:h=>r(f,{enable:!!h})})}),c.jsx(ln,{children:c.jsx(re,{value:u.mark,onChange:h=>r(f,{mark:h.target.value})})}),c.jsx(ln,{children:c.jsx(re,{value:u.url,onChange:h=>r(f,{url:h.target.value})})}),c.jsx(ln,{children:c.jsx(we,{variant:"outline",size:"sm",onClick:()=>o(f),children:"删除"})})]},`${f}-${u.url}`)),a.length===0?c.jsx(Bl,{children:c.jsx(ln,{colSpan:4,className:"text-sm text-muted-foreground",children:"暂无数据"})}):null]})]}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",onClick:s,children:"添加合集"})})]})}function lA(n){const a=n.value,r=(o,s)=>n.onChange({...a,[o]:s});return c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(St,{value:a["User-Agent"],onChange:o=>r("User-Agent",o.target.value),rows:3})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"平台"}),c.jsx(re,{value:a.pc_libra_divert,onChange:o=>r("pc_libra_divert",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"语言"}),c.jsx(re,{value:a.browser_language,onChange:o=>r("browser_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器平台"}),c.jsx(re,{value:a.browser_platform,onChange:o=>r("browser_platform",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器名称"}),c.jsx(re,{value:a.browser_name,onChange:o=>r("browser_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器版本"}),c.jsx(re,{value:a.browser_version,onChange:o=>r("browser_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"引擎名称"}),c.jsx(re,{value:a.engine_name,onChange:o=>r("engine_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"引擎版本"}),c.jsx(re,{value:a.engine_version,onChange:o=>r("engine_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统名称"}),c.jsx(re,{value:a.os_name,onChange:o=>r("os_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统版本"}),c.jsx(re,{value:a.os_version,onChange:o=>r("os_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"WebID（webid，可选）"}),c.jsx(re,{value:a.webid,onChange:o=>r("webid",o.target.value)})]})]})}function rA(n){const a=n.value,r=(o,s)=>n.onChange({...a,[o]:s});return c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"User-Agent（浏览器标识）"}),c.jsx(St,{value:a["User-Agent"],onChange:o=>r("User-Agent",o.target.value),rows:3})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"应用语言（app_language）"}),c.jsx(re,{value:a.app_language,onChange:o=>r("app_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器语言（browser_language）"}),c.jsx(re,{value:a.browser_language,onChange:o=>r("browser_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器名称（browser_name）"}),c.jsx(re,{value:a.browser_name,onChange:o=>r("browser_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器平台（browser_platform）"}),c.jsx(re,{value:a.browser_platform,onChange:o=>r("browser_platform",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"浏览器版本（browser_version）"}),c.jsx(re,{value:a.browser_version,onChange:o=>r("browser_version",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"语言（language）"}),c.jsx(re,{value:a.language,onChange:o=>r("language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"系统（os）"}),c.jsx(re,{value:a.os,onChange:o=>r("os",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"优先地区（priority_region）"}),c.jsx(re,{value:a.priority_region,onChange:o=>r("priority_region",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"地区（region）"}),c.jsx(re,{value:a.region,onChange:o=>r("region",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"时区（tz_name）"}),c.jsx(re,{value:a.tz_name,onChange:o=>r("tz_name",o.target.value)})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播语言（webcast_language）"}),c.jsx(re,{value:a.webcast_language,onChange:o=>r("webcast_language",o.target.value)})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"设备 ID（device_id）"}),c.jsx(re,{value:a.device_id,onChange:o=>r("device_id",o.target.value)})]})]})}function oA(){const{platform:n}=hi(),a=n==="tiktok",r=n==="douyin"||n==="tiktok",[o,s]=v.useState(null),[u,f]=v.useState(null),[h,m]=v.useState(""),[g,y]=v.useState(""),[x,S]=v.useState(null),[j,M]=v.useState(null),[C,N]=v.useState(!1),[E,O]=v.useState(!1),[_,z]=v.useState(null),[D,k]=v.useState(null),[T,Y]=v.useState(""),[H,Z]=v.useState(!1),[ne,fe]=v.useState(null),[ve,$]=v.useState(!1),[se,U]=v.useState(!1),[Q,q]=v.useState(!1),[ie,ue]=v.useState(!1),A=v.useMemo(()=>[{value:Nf,label:"不保存数据"},{value:"csv",label:"CSV"},{value:"xlsx",label:"Excel (XLSX)"},{value:"sql",label:"SQLite (sql)"}],[]);v.useEffect(()=>{if(!r)return;let G=!0;return(async()=>{try{const[qe,ut,Rt]=await Promise.all([Ae.getSettings(),Ae.getUIConfig(),Ae.getClipboardMonitorStatus()]);if(!G)return;s(qe),f(ut),m(Zs(qe.cookie)),y(Zs(qe.cookie_tiktok)),q(!!Rt.running)}catch(qe){if(!G)return;k(String(qe))}})(),()=>{G=!1}},[r]);const P=G=>{o&&s({...o,...G})},te=!!o&&!!u&&!E,le=async()=>{if(!(!o||!u)){O(!0),z(null),k(null);try{await Ae.updateUIConfig({record:u.record,logger:u.logger});const G=ut=>{if(typeof ut=="number")return ut;const Rt=typeof ut=="string"?ut.trim():String(ut??"").trim();if(!Rt)return"";if(/^\d+(?:\.\d+)?$/.test(Rt)){const on=Number(Rt);return Number.isFinite(on)?on:Rt}return Rt},Qe=ut=>({...ut,earliest:G(ut.earliest),latest:G(ut.latest)}),qe=await Ae.saveSettings({...o,accounts_urls:(o.accounts_urls??[]).map(Qe),accounts_urls_tiktok:(o.accounts_urls_tiktok??[]).map(Qe),cookie:h,cookie_tiktok:g});s(qe),m(Zs(qe.cookie)),y(Zs(qe.cookie_tiktok)),z("已保存")}catch(G){k(String(G))}finally{O(!1)}}};if(n==="kuaishou")return c.jsx(ZR,{});if(!r)return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})});if(!o||!u)return D?c.jsx("div",{className:"text-sm text-destructive",children:D}):c.jsx("div",{className:"text-sm text-muted-foreground",children:"加载中..."});const he=async(G,Qe)=>{S(`${G}.${Qe}`),z(null),k(null);try{if(Qe==="clipboard"){const Rt=await Ae.importCookieFromClipboard(G);G==="douyin"?m(Rt.cookie):y(Rt.cookie),z(`已从剪贴板导入并写入${G==="douyin"?"抖音":"TikTok"} Cookie${Rt.logged_in?"（已检测到登录）":"（未检测到登录）"}`);return}const qe=await Ae.importCookieFromBrowser({platform:G});G==="douyin"?m(qe.cookie):y(qe.cookie);const ut=qe.browser?`（${qe.browser}）`:"";z(`已从浏览器${ut}导入并写入${G==="douyin"?"抖音":"TikTok"} Cookie${qe.logged_in?"（已检测到登录）":"（未检测到登录）"}`)}catch{}finally{S(null)}},Se=async()=>{if(j){M(null);return}N(!0),k(null);try{const G=await Ae.listCookieBrowsers();M(G)}catch(G){k(String(G))}finally{N(!1)}},ae=async G=>{const Qe=G.trim();if(Qe&&window.confirm("确认要删除下载记录吗？此操作不可撤销。")){Z(!0),z(null),k(null);try{await Ae.deleteDownloadRecords(Qe),z(Qe.toUpperCase()==="ALL"?"已清空下载记录":"已删除下载记录"),Qe.toUpperCase()!=="ALL"&&Y("")}catch(qe){k(String(qe))}finally{Z(!1)}}},Ne=async()=>{$(!0),k(null);try{const G=await Ae.checkUpdate();fe(G)}catch(G){k(String(G))}finally{$(!1)}},Ee=async()=>{var G;if(ne!=null&&ne.update_available&&window.confirm("确定要自动下载并更新吗？更新过程中程序将自动重启。")){U(!0),z(null),k(null);try{await Ae.applyUpdate(),rn.success("正在更新，请稍候…");const Qe=window.pywebview;(G=Qe==null?void 0:Qe.api)!=null&&G.close?setTimeout(()=>{var qe,ut;return(ut=(qe=Qe.api)==null?void 0:qe.close)==null?void 0:ut.call(qe)},1500):(rn.info("未检测到桌面环境，请前往发布页手动下载更新。"),U(!1))}catch(Qe){k(String(Qe)),U(!1)}}},ke=async G=>{if(ie)return;const Qe=Q;q(G),ue(!0),z(null),k(null);try{const qe=G?await Ae.startClipboardMonitor():await Ae.stopClipboardMonitor();q(!!qe.running),rn.success(G?"已开启剪贴板监听下载":"已关闭剪贴板监听下载")}catch{q(Qe)}finally{ue(!1)}},je=o.owner_url&&typeof o.owner_url=="object"?o.owner_url:{mark:"",url:"",uid:"",sec_uid:"",nickname:""},ze=o.browser_info&&typeof o.browser_info=="object"?o.browser_info:nA(),Ct=o.browser_info_tiktok&&typeof o.browser_info_tiktok=="object"?o.browser_info_tiktok:aA();return c.jsx("div",{className:"mx-auto max-w-6xl space-y-6 pb-10",children:c.jsxs(yi,{defaultValue:"general",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[c.jsxs(to,{children:[c.jsx(Mt,{value:"general",children:"通用"}),c.jsx(Mt,{value:"accounts",children:"账号"}),c.jsx(Mt,{value:"mix",children:"合集"}),c.jsx(Mt,{value:"network",children:"Cookie / 代理"}),c.jsx(Mt,{value:"advanced",children:"高级"})]}),c.jsx(we,{onClick:le,disabled:!te,children:E?"保存中...":"保存"})]}),_?c.jsx("div",{className:"text-sm text-muted-foreground",children:_}):null,D?c.jsx("div",{className:"text-sm text-destructive",children:D}):null,c.jsxs(Dt,{value:"general",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"程序"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:u.record,onCheckedChange:G=>f({...u,record:!!G})}),c.jsx(K,{children:"作品下载记录（跳过已下载）"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:u.logger,onCheckedChange:G=>f({...u,logger:!!G})}),c.jsx(K,{children:"运行日志记录"})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:a?"TikTok 平台目录":"抖音平台目录"}),c.jsx(re,{value:a?o.root_tiktok??"":o.root_douyin??"",onChange:G=>P(a?{root_tiktok:G.target.value}:{root_douyin:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"下载文件夹名"}),c.jsx(re,{value:o.folder_name??"",onChange:G=>P({folder_name:G.target.value})})]})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.folder_mode,onCheckedChange:G=>P({folder_mode:!!G})}),c.jsx(K,{children:"按作品类型分文件夹"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.music,onCheckedChange:G=>P({music:!!G})}),c.jsx(K,{children:"仅下载音乐（如适用）"})]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"存储格式（采集数据）"}),c.jsxs(pi,{value:o.storage_format||Nf,onValueChange:G=>P({storage_format:G===Nf?"":G}),children:[c.jsx(Jr,{children:c.jsx(gi,{placeholder:"选择格式"})}),c.jsx(eo,{children:A.map(G=>c.jsx(vn,{value:G.value,children:G.label},G.value))})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"直播画质偏好"}),c.jsx(re,{value:o.live_qualities??"",onChange:G=>P({live_qualities:G.target.value}),placeholder:"如：origin 或 1"})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"命名与输出"})}),c.jsx(Oe,{className:"space-y-6",children:c.jsxs("div",{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"命名格式"}),c.jsx(re,{value:o.name_format??"",onChange:G=>P({name_format:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"描述长度"}),c.jsx(re,{type:"number",value:o.desc_length,onChange:G=>P({desc_length:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"文件名长度"}),c.jsx(re,{type:"number",value:o.name_length,onChange:G=>P({name_length:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"日期格式"}),c.jsx(re,{value:o.date_format??"",onChange:G=>P({date_format:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分隔符"}),c.jsx(re,{value:o.split??"",onChange:G=>P({split:G.target.value})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"清理长度"}),c.jsx(re,{type:"number",value:o.truncate,onChange:G=>P({truncate:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-6",children:[c.jsx(pt,{checked:o.dynamic_cover,onCheckedChange:G=>P({dynamic_cover:!!G})}),c.jsx(K,{children:"下载动态图封面"})]}),c.jsxs("div",{className:"flex items-center gap-2 pt-6",children:[c.jsx(pt,{checked:o.static_cover,onCheckedChange:G=>P({static_cover:!!G})}),c.jsx(K,{children:"下载静态封面"})]})]})})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载策略"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx(pt,{checked:o.download,onCheckedChange:G=>P({download:!!G})}),c.jsx(K,{children:"允许下载（关闭后仅采集不下载）"})]}),c.jsxs("div",{className:"grid gap-4 md:grid-cols-3",children:[c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"单文件最大大小"}),c.jsx(re,{type:"number",value:o.max_size,onChange:G=>P({max_size:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"分片大小（字节）"}),c.jsx(re,{type:"number",value:o.chunk,onChange:G=>P({chunk:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"超时（秒）"}),c.jsx(re,{type:"number",value:o.timeout,onChange:G=>P({timeout:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大重试次数"}),c.jsx(re,{type:"number",value:o.max_retry,onChange:G=>P({max_retry:Number(G.target.value||0)})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"最大页数"}),c.jsx(re,{type:"number",value:o.max_pages,onChange:G=>P({max_pages:Number(G.target.value||0)})})]})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"下载记录"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"清空全部下载记录"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"用于重新下载；不会删除本地文件。"})]}),c.jsx(we,{variant:"destructive",size:"sm",disabled:H||E,onClick:()=>void ae("ALL"),children:"清空"})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"删除指定作品 ID"}),c.jsx(St,{value:T,onChange:G=>Y(G.target.value),rows:2,placeholder:"粘贴作品 ID（可多个，空格/换行分隔）"}),c.jsx("div",{className:"flex justify-end",children:c.jsx(we,{variant:"outline",size:"sm",disabled:H||E||!T.trim(),onClick:()=>void ae(T),children:"删除"})})]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"检查更新"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsxs("div",{className:"space-y-1",children:[c.jsx("div",{className:"text-sm font-medium",children:"软件版本"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:"从发布页获取最新版本信息。"})]}),c.jsx(we,{variant:"outline",disabled:ve||se||E,onClick:()=>void Ne(),children:ve?"检查中...":"检查更新"})]}),ne?c.jsxs("div",{className:"space-y-2 rounded-md border bg-card/60 p-4 text-sm",children:[c.jsxs("div",{className:"grid gap-2 md:grid-cols-2",children:[c.jsxs("div",{children:["当前版本：",ne.current_version]}),c.jsxs("div",{children:["最新版本：",ne.latest_version]})]}),c.jsx("div",{className:ne.update_available?"text-primary font-medium":"text-muted-foreground",children:ne.update_available?"发现新版本":"已是最新版本"}),c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(we,{size:"sm",variant:"ghost",disabled:!ne.releases_url,onClick:()=>window.open(ne.releases_url,"_blank"),children:"打开发布页"}),ne.update_available?c.jsx(we,{size:"sm",disabled:se||E,onClick:()=>void Ee(),children:se?"更新中...":"下载并更新"}):null]}),ne.release_notes?c.jsxs("details",{className:"pt-2",children:[c.jsx("summary",{className:"cursor-pointer select-none text-xs text-muted-foreground hover:text-foreground",children:"查看更新内容"}),c.jsx("div",{className:"mt-2 max-h-60 overflow-auto rounded-md border bg-muted/50 p-3",children:c.jsx("pre",{className:"whitespace-pre-wrap text-xs leading-relaxed",children:ne.release_notes})})]}):null]}):null]})]})]}),c.jsxs(Dt,{value:"accounts",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"平台开关"})}),c.jsx(Oe,{className:"grid gap-4 md:grid-cols-2",children:a?c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.tiktok_platform,onCheckedChange:G=>P({tiktok_platform:!!G})}),c.jsx(K,{children:"启用 TikTok"})]}):c.jsxs("div",{className:"flex items-center gap-2 pt-1",children:[c.jsx(pt,{checked:o.douyin_platform,onCheckedChange:G=>P({douyin_platform:!!G})}),c.jsx(K,{children:"启用抖音"})]})})]}),a?null:c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"当前账号（用于“收藏”下载）"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"主页链接"}),c.jsx(re,{value:je.url??"",onChange:G=>P({owner_url:{...je,url:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"标识"}),c.jsx(re,{value:je.mark??"",onChange:G=>P({owner_url:{...je,mark:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"uid"}),c.jsx(re,{value:je.uid??"",onChange:G=>P({owner_url:{...je,uid:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"sec_uid"}),c.jsx(re,{value:je.sec_uid??"",onChange:G=>P({owner_url:{...je,sec_uid:G.target.value}})})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"昵称"}),c.jsx(re,{value:je.nickname??"",onChange:G=>P({owner_url:{...je,nickname:G.target.value}})})]})]})]}),a?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"账号列表"})}),c.jsx(Oe,{children:c.jsx(Zy,{value:o.accounts_urls_tiktok,onChange:G=>P({accounts_urls_tiktok:G})})})]}):c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"账号列表"})}),c.jsx(Oe,{children:c.jsx(Zy,{value:o.accounts_urls,onChange:G=>P({accounts_urls:G})})})]})]}),c.jsx(Dt,{value:"mix",className:"mt-6 space-y-6",children:a?c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"合集列表"})}),c.jsx(Oe,{children:c.jsx(Iy,{value:o.mix_urls_tiktok,onChange:G=>P({mix_urls_tiktok:G})})})]}):c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"合集列表"})}),c.jsx(Oe,{children:c.jsx(Iy,{value:o.mix_urls,onChange:G=>P({mix_urls:G})})})]})}),c.jsxs(Dt,{value:"network",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"Cookie"})}),c.jsxs(Oe,{className:"space-y-6",children:[a?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"TikTok Cookie"}),c.jsx(St,{value:g,onChange:G=>y(G.target.value),rows:6,placeholder:"粘贴 Cookie 字符串"}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("tiktok","clipboard"),children:"从剪贴板导入"}),c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("tiktok","browser"),children:"从浏览器导入"})]})]}):c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"抖音 Cookie"}),c.jsx(St,{value:h,onChange:G=>m(G.target.value),rows:6,placeholder:"粘贴 Cookie 字符串"}),c.jsxs("div",{className:"flex flex-wrap gap-2",children:[c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("douyin","clipboard"),children:"从剪贴板导入"}),c.jsx(we,{type:"button",variant:"outline",size:"sm",disabled:!!x||E,onClick:()=>void he("douyin","browser"),children:"从浏览器导入"})]})]}),c.jsxs("div",{className:"space-y-2",children:[c.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-2",children:[c.jsx("div",{className:"text-xs text-muted-foreground",children:"Windows 读取 Chromium/Chrome/Edge Cookie 可能需要以管理员身份运行程序。"}),c.jsx(we,{type:"button",variant:"ghost",size:"sm",disabled:C||E,onClick:()=>void Se(),children:C?"加载中...":j?"收起支持的浏览器":"查看支持的浏览器"})]}),j?c.jsx("div",{className:"text-xs text-muted-foreground",children:j.map(G=>G.name).join(" / ")}):null]})]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"代理"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[a?c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"TikTok 代理"}),c.jsx(re,{value:o.proxy_tiktok??"",onChange:G=>P({proxy_tiktok:G.target.value}),placeholder:"socks5://127.0.0.1:7890"})]}):c.jsxs("div",{className:"space-y-2",children:[c.jsx(K,{children:"抖音代理"}),c.jsx(re,{value:o.proxy??"",onChange:G=>P({proxy:G.target.value}),placeholder:"http://127.0.0.1:7890"})]}),a?c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"TikTok ttwid（twc_tiktok，可选）"}),c.jsx(re,{value:o.twc_tiktok??"",onChange:G=>P({twc_tiktok:G.target.value})})]}):null]})]})]}),c.jsxs(Dt,{value:"advanced",className:"mt-6 space-y-6",children:[c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"运行与工具"})}),c.jsxs(Oe,{className:"grid gap-4 md:grid-cols-2",children:[c.jsxs("div",{className:"flex items-start gap-3 rounded-md border p-4 md:col-span-2",children:[c.jsx(pt,{id:"clipboard-monitor",checked:Q,disabled:ie||E,onCheckedChange:G=>void ke(!!G)}),c.jsxs("div",{className:"space-y-1",children:[c.jsx(K,{htmlFor:"clipboard-monitor",children:"剪贴板监听下载"}),c.jsx("div",{className:"text-xs text-muted-foreground",children:ie?"处理中...":Q?"运行中：自动识别剪贴板链接并下载":"未运行：勾选以开启后台监听"})]})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"自动选择序列（run_command）"}),c.jsx(re,{value:o.run_command??"",onChange:G=>P({run_command:G.target.value})})]}),c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"ffmpeg 路径"}),c.jsx(re,{value:o.ffmpeg??"",onChange:G=>P({ffmpeg:G.target.value})})]}),a?c.jsxs("div",{className:"space-y-2 md:col-span-2",children:[c.jsx(K,{children:"TikTok 主页参数（owner_url_tiktok，保留）"}),c.jsx(re,{value:o.owner_url_tiktok?"已设置":"null",disabled:!0})]}):null]})]}),c.jsxs(_e,{children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"浏览器参数"})}),c.jsxs(Oe,{className:"space-y-6",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"仅在需要时修改，错误参数可能导致请求失败。"}),a?c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"TikTok 浏览器参数"}),c.jsx("div",{className:"pt-4",children:c.jsx(rA,{value:Ct,onChange:G=>P({browser_info_tiktok:G})})})]}):c.jsxs("details",{className:"rounded-lg border p-4",children:[c.jsx("summary",{className:"cursor-pointer select-none text-sm font-medium",children:"抖音浏览器参数"}),c.jsx("div",{className:"pt-4",children:c.jsx(lA,{value:ze,onChange:G=>P({browser_info:G})})})]})]})]})]})]})})}const iA=nh("inline-flex items-center rounded-md border px-2.5 py-0.5 text-xs font-semibold transition-colors focus:outline-none focus:ring-2 focus:ring-ring focus:ring-offset-2",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground shadow hover:bg-primary/80",secondary:"border-transparent bg-secondary text-secondary-foreground hover:bg-secondary/80",destructive:"border-transparent bg-destructive text-destructive-foreground shadow hover:bg-destructive/80",outline:"text-foreground"}},defaultVariants:{variant:"default"}});function Ef({className:n,variant:a,...r}){return c.jsx("div",{className:ce(iA({variant:a}),n),...r})}function Tf(n){if(!Number.isFinite(n)||n<=0)return"0 B";const a=["B","KB","MB","GB","TB"],r=Math.min(Math.floor(Math.log(n)/Math.log(1024)),a.length-1),o=n/1024**r;return`${o.toFixed(o>=10||r===0?0:1)} ${a[r]}`}function _f(n){return n?new Date(n*1e3).toLocaleTimeString():""}function Jy(n){return n==="running"?"default":n==="success"?"secondary":n==="error"?"destructive":"outline"}const sA={queued:"排队中",running:"进行中",success:"已完成",error:"失败",cancelled:"已取消"},cA={"download.detail":"下载作品","download.account":"批量下载账号作品","download.mix":"批量下载合集作品","download.collection":"批量下载收藏作品","download.collects":"批量下载收藏夹作品","download.collection_music":"批量下载收藏音乐","download.mix_collection":"批量下载收藏合集作品","download.tiktok_original":"批量下载视频原画","download.kuaishou.detail":"下载快手作品","collect.live":"获取直播拉流地址","collect.comment":"采集作品评论数据","collect.user":"采集账号详细数据","collect.hot":"采集抖音热榜数据","collect.search":"采集搜索结果数据"};function ex(n){return sA[n]||n}function uA(n){return cA[n]||n}function dA(){const[n]=Yj(),a=n.get("task"),{platform:r}=hi(),o=r==="douyin"||r==="tiktok"||r==="kuaishou",s=r,u=D=>{const k=String(D.meta.platform??"");if(k)return k===s;const T=String(D.title||""),Y=T.toLowerCase();if(s==="kuaishou")return Y.includes("快手")||Y.includes("kuaishou");const H=Y.includes("tiktok")?"tiktok":T.includes("抖音")?"douyin":null;return!H||H===(s==="tiktok"?"tiktok":"douyin")},[f,h]=v.useState([]),[m,g]=v.useState(a),[y,x]=v.useState([]),[S,j]=v.useState({}),[M,C]=v.useState(null),N=v.useRef(null),E=v.useMemo(()=>f.find(D=>D.id===m)??null,[f,m]),O=()=>{if(!E)return;const D={exported_at:new Date().toISOString(),task:E,progress:S,events:y},k=new Blob([JSON.stringify(D,null,2)],{type:"application/json"}),T=URL.createObjectURL(k),Y=document.createElement("a");Y.href=T,Y.download=`task_${E.id}.json`,Y.click(),URL.revokeObjectURL(T)},_=async()=>{if(m)try{await Ae.openTaskFolder(m)}catch(D){C(String(D))}},z=async()=>{const D=await Ae.listTasks();h(D),!m&&D.length>0&&g(D[0].id)};return v.useEffect(()=>{if(!o){N.current&&(N.current.close(),N.current=null),x([]),j({}),C(null),g(null),h([]);return}let D=!0;const k=async()=>{var Y;try{const H=await Ae.listTasks();if(!D)return;const Z=H.filter(u);if(h(Z),!m&&Z.length>0){g(Z[0].id);return}m&&!Z.some(ne=>ne.id===m)&&g(((Y=Z[0])==null?void 0:Y.id)??null)}catch(H){if(!D)return;C(String(H))}};k();const T=setInterval(()=>void k(),2e3);return()=>{D=!1,clearInterval(T)}},[m,s,o]),v.useEffect(()=>{if(!o||(N.current&&(N.current.close(),N.current=null),x([]),j({}),C(null),!m))return;const D=new EventSource(`/ui-api/tasks/${encodeURIComponent(m)}/events`);return N.current=D,D.onmessage=k=>{try{const T=JSON.parse(k.data),Y=String(T.type||"");if(Y==="snapshot"){x([]),j({});return}if(Y==="progress.add"||Y==="progress.update"){const H=String(T.task_id??"");if(!H)return;j(Z=>{var ne;return{...Z,[H]:{description:String(T.description||""),total:T.total===null||T.total===void 0?null:Number(T.total),completed:Number(T.completed||0),finished:(ne=Z[H])==null?void 0:ne.finished}}});return}if(Y==="progress.remove"){const H=String(T.task_id??"");if(!H)return;j(Z=>Z[H]?{...Z,[H]:{...Z[H],finished:!0}}:Z);return}x(H=>[...H.slice(-999),T])}catch(T){C(String(T)),rn.error("Error parsing task event: "+String(T))}},D.onerror=()=>{const k="EventSource disconnected";C(k),rn.error(k)},()=>{D.close()}},[m,o]),c.jsx("div",{className:"mx-auto w-full max-w-6xl",children:o?c.jsxs("div",{className:"grid gap-6 md:grid-cols-3",children:[c.jsxs(_e,{className:"md:col-span-1",children:[c.jsx(Je,{className:"py-4",children:c.jsx(et,{className:"text-base",children:"任务列表"})}),c.jsx(Oe,{className:"p-0",children:c.jsx(Ul,{className:"h-[calc(100vh-12rem)]",children:c.jsxs("div",{className:"flex flex-col",children:[f.map(D=>c.jsxs("button",{type:"button",className:`flex w-full flex-col gap-2 border-b px-4 py-3 text-left transition-colors hover:bg-muted/50 ${m===D.id?"bg-muted/60":""}`,onClick:()=>g(D.id),children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx("div",{className:"truncate text-sm font-medium",children:D.title}),c.jsx(Ef,{variant:Jy(D.status),className:"shrink-0",title:D.status,children:ex(D.status)})]}),c.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs text-muted-foreground",children:[c.jsx("div",{className:"truncate font-mono",children:D.id}),c.jsx("div",{className:"shrink-0",children:_f(D.created_at)})]})]},D.id)),f.length===0&&c.jsx("div",{className:"p-4 text-sm text-muted-foreground",children:"暂无任务"})]})})})]}),c.jsxs(_e,{className:"md:col-span-2",children:[c.jsx(Je,{className:"py-4",children:c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx(et,{className:"text-base",children:"任务详情"}),c.jsxs("div",{className:"flex items-center gap-2",children:[E!=null&&E.type.startsWith("download.")?c.jsx(we,{variant:"outline",size:"sm",onClick:()=>void _(),children:"打开文件夹"}):null,c.jsx(we,{variant:"outline",size:"sm",onClick:O,disabled:!E||y.length===0,children:"导出日志"}),c.jsx(we,{variant:"outline",size:"sm",onClick:()=>{z()},children:"刷新"})]})]})}),c.jsxs(Oe,{className:"space-y-4",children:[E?c.jsxs("div",{className:"space-y-1 text-sm",children:[c.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[c.jsx(Ef,{variant:"outline",title:E.type,children:uA(E.type)}),c.jsx(Ef,{variant:Jy(E.status),title:E.status,children:ex(E.status)})]}),c.jsxs("div",{className:"text-muted-foreground",children:["开始: ",_f(E.started_at)," ",E.finished_at?`结束: ${_f(E.finished_at)}`:""]}),E.error?c.jsx("div",{className:"text-destructive",children:E.error}):null]}):c.jsx("div",{className:"text-sm text-muted-foreground",children:"请选择一个任务"}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsx("div",{className:"text-sm font-medium",children:"下载进度"}),c.jsxs("div",{className:"space-y-2",children:[Object.entries(S).slice(0,200).map(([D,k])=>{const T=k.total&&k.total>0?Math.min(100,Math.floor(k.completed/k.total*100)):0;return c.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs",children:[c.jsx("div",{className:"min-w-0 flex-1 truncate",children:k.description||`#${D}`}),c.jsx("div",{className:"shrink-0 font-mono text-muted-foreground",children:k.total?`${Tf(k.completed)} / ${Tf(k.total)}`:`${Tf(k.completed)}`}),c.jsx("div",{className:"w-12 shrink-0 text-right font-mono",children:k.finished?"已完成":k.total?`${T}%`:""})]},D)}),Object.keys(S).length===0?c.jsx("div",{className:"text-sm text-muted-foreground",children:"暂无下载进度"}):null]})]}),c.jsx(Rn,{}),c.jsxs("div",{className:"space-y-2",children:[c.jsxs("div",{className:"flex items-center justify-between gap-3",children:[c.jsx("div",{className:"text-sm font-medium",children:"事件日志"}),M?c.jsx("div",{className:"text-xs text-destructive",children:M}):null]}),c.jsx(Ul,{className:"h-[22rem] rounded-md border bg-muted/10 p-3",children:c.jsxs("div",{className:"space-y-1 font-mono text-xs",children:[y.map((D,k)=>c.jsx("div",{className:"break-words",children:JSON.stringify(D)},k)),y.length===0?c.jsx("div",{className:"text-muted-foreground",children:"暂无日志"}):null]})})]})]})]})]}):c.jsx(_e,{children:c.jsx(Oe,{className:"py-16 text-center text-sm text-muted-foreground",children:"该平台暂未接入"})})})}function fA(){const[n,a]=v.useState(null),[r,o]=v.useState(null),[s,u]=v.useState(!1),[f,h]=v.useState(null),[m,g]=v.useState(!1),[y,x]=v.useState(!1);v.useEffect(()=>{let C=!0;return(async()=>{try{const O=await Ae.getAppInfo();if(!C)return;a(O)}catch(O){if(!C)return;o(String(O))}})(),window.pywebview&&Ae.checkUpdate().then(O=>{if(!C||!O.update_available)return;const _=O.latest_tag||O.latest_version;localStorage.getItem("dismissed_update")!==_&&(h(O),g(!0))}).catch(()=>{}),()=>{C=!1}},[]);const S=!!n&&!(n!=null&&n.disclaimer_accepted),j=()=>{f&&localStorage.setItem("dismissed_update",f.latest_tag||f.latest_version),g(!1)},M=async()=>{var C;x(!0);try{await Ae.applyUpdate(),rn.success("正在更新，请稍候…");const N=window.pywebview;(C=N==null?void 0:N.api)!=null&&C.close&&setTimeout(()=>{var E,O;return(O=(E=N.api)==null?void 0:E.close)==null?void 0:O.call(E)},1500)}catch(N){rn.error(`更新失败：${String(N)}`),x(!1)}};return c.jsx(UE,{children:c.jsxs("div",{className:"flex h-screen w-full flex-col overflow-hidden bg-background text-foreground",children:[c.jsx(YE,{}),c.jsxs("div",{className:"flex flex-1 overflow-hidden",children:[c.jsx(HE,{}),c.jsxs("div",{className:"flex min-w-0 flex-1 flex-col overflow-hidden bg-muted/10",children:[c.jsx(BE,{}),c.jsx("main",{className:"app-scroll flex-1 overflow-auto px-6 pb-6 pt-4 lg:px-8 lg:pb-8",children:c.jsx(GN,{children:c.jsxs(dj,{children:[c.jsx(Rr,{path:"/",element:c.jsx(cj,{to:"/download",replace:!0})}),c.jsx(Rr,{path:"/download",element:c.jsx(KR,{})}),c.jsx(Rr,{path:"/collect",element:c.jsx(tk,{})}),c.jsx(Rr,{path:"/tasks",element:c.jsx(dA,{})}),c.jsx(Rr,{path:"/settings",element:c.jsx(oA,{})})]})})})]})]}),S&&n?c.jsx("div",{className:"fixed inset-0 z-50 flex items-center justify-center bg-background/80 p-6 backdrop-blur-sm",children:c.jsxs(_e,{className:"w-full max-w-3xl",children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"免责声明"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsx("div",{className:"text-sm text-muted-foreground",children:"首次使用需要确认免责声明。"}),c.jsx(Ul,{className:"h-[60vh] rounded-md border",children:c.jsx("pre",{className:"whitespace-pre-wrap p-4 text-sm leading-relaxed",children:n.disclaimer_text})}),c.jsx(Rn,{}),r?c.jsx("div",{className:"text-sm text-destructive",children:r}):null,c.jsx("div",{className:"flex items-center justify-end gap-2",children:c.jsx(we,{disabled:s,onClick:async()=>{u(!0),o(null);try{await Ae.acceptDisclaimer(),a({...n,disclaimer_accepted:!0})}catch(C){o(String(C))}finally{u(!1)}},children:"我已阅读并同意"})})]})]})}):null,!S&&m&&f?c.jsx("div",{className:"fixed inset-0 z-50 flex items-center justify-center bg-background/80 p-6 backdrop-blur-sm",children:c.jsxs(_e,{className:"w-full max-w-lg shadow-lg",children:[c.jsx(Je,{className:"py-5",children:c.jsx(et,{children:"发现新版本"})}),c.jsxs(Oe,{className:"space-y-4",children:[c.jsxs("div",{className:"grid gap-2 text-sm",children:[c.jsxs("div",{children:["当前版本：",c.jsx("span",{className:"font-mono",children:f.current_version})]}),c.jsxs("div",{children:["最新版本：",c.jsx("span",{className:"font-mono text-primary",children:f.latest_version})]})]}),f.release_notes?c.jsx(Ul,{className:"h-48 rounded-md border bg-muted/50",children:c.jsx("pre",{className:"whitespace-pre-wrap p-3 text-xs leading-relaxed",children:f.release_notes})}):null,c.jsxs("div",{className:"flex justify-end gap-2",children:[c.jsx(we,{variant:"ghost",onClick:j,disabled:y,children:"以后再说"}),c.jsx(we,{onClick:()=>void M(),disabled:y,children:y?"更新中...":"下载并更新"})]})]})]})}):null,c.jsx(PE,{})]})})}hC.createRoot(document.getElementById("root")).render(c.jsx(v.StrictMode,{children:c.jsx(Bj,{basename:"/ui",children:c.jsx(fA,{})})}));
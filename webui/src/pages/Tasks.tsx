@@ -198,6 +198,12 @@ export function TasksPage() {
         const data = JSON.parse(evt.data) as any
         const type = String(data.type || "")
 
+        if (type === "snapshot") {
+          setLogs([])
+          setProgress({})
+          return
+        }
+
         if (type === "progress.add" || type === "progress.update") {
           const taskId = String(data.task_id ?? "")
           if (!taskId) return